@@ -0,0 +1,101 @@
+"""Benchmark the cost of broadcasting a message to rooms of different sizes.
+
+Usage: python benchmarks/bench_broadcast.py
+
+Reports the time per broadcast and per recipient for MessageHandler.broadcast
+compared to the previous implementation, which decoded and encoded the message
+separately for every recipient using the previous dict-based message class.
+"""
+import json
+import timeit
+import uuid
+from collections import defaultdict
+from types import SimpleNamespace
+
+from camus.message_handler import Message
+
+ROOM_SIZES = [2, 10, 50, 100, 500]
+
+
+class DictMessage:
+    """The message class before broadcasts were encoded once, which decodes
+    the whole message into attributes and encodes them with json.dumps.
+    """
+
+    def __init__(self, message=None):
+        if isinstance(message, str):
+            _json = json.loads(message)
+        elif message is None:
+            _json = {}
+        else:
+            _json = message
+
+        self.sender = _json.get('sender')
+        self.receiver = _json.get('receiver')
+        self.type = _json.get('type')
+        self.data = _json.get('data')
+
+    def json(self):
+        return json.dumps(self.__dict__)
+
+
+class NullQueue:
+    def put_nowait(self, item):
+        pass
+
+
+def make_room(size):
+    clients = [SimpleNamespace(uuid=uuid.uuid4().hex, name='Major Tom')
+               for _ in range(size)]
+    return SimpleNamespace(slug='bench-room', clients=clients)
+
+
+def make_room_info(room):
+    message = Message()
+    message.sender = 'ground control'
+    message.type = 'room-info'
+    message.data = {
+        'room_id': room.slug,
+        'clients': [{'id': c.uuid, 'username': c.name} for c in room.clients]
+    }
+    return message
+
+
+def broadcast_per_recipient(outbox, room, message):
+    """The previous implementation, which decodes and re-encodes the whole
+    message for every recipient.
+    """
+    for client in room.clients:
+        msg = DictMessage(message.json())
+        msg.receiver = client.uuid
+        outbox[msg.receiver].put_nowait(msg.json())
+
+
+def broadcast_once(outbox, room, message):
+    for receiver, data in message.json_for(c.uuid for c in room.clients):
+        outbox[receiver].put_nowait(data)
+
+
+def main():
+    outbox = defaultdict(NullQueue)
+    print('{:>6} {:>16} {:>16} {:>16} {:>16}'.format(
+        'size', 'old us/bcast', 'old us/client', 'new us/bcast', 'new us/client'))
+
+    for size in ROOM_SIZES:
+        room = make_room(size)
+        message = make_room_info(room)
+        number = max(1, 2000 // size)
+        old_message = DictMessage({'sender': message.sender,
+                                   'type': message.type,
+                                   'data': message.data})
+        results = []
+        for fn, msg in ((broadcast_per_recipient, old_message),
+                        (broadcast_once, message)):
+            t = min(timeit.repeat(lambda: fn(outbox, room, msg),
+                                  number=number, repeat=5)) / number
+            results += [t * 1e6, t * 1e6 / size]
+        print('{:>6} {:>16.1f} {:>16.2f} {:>16.1f} {:>16.2f}'.format(size, *results))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+"""Benchmark the JSON codecs on typical signaling payloads.
+
+Usage: python benchmarks/bench_codecs.py
+
+Reports the time to decode and encode SDP offers, ICE candidates and
+room-info messages with each of the codecs which are installed, both as str
+and as bytes.
+"""
+import time
+import timeit
+import uuid
+
+from camus.bench import ICE_CANDIDATE, SDP
+from camus.message_handler import CODECS
+
+PAYLOADS = {
+    'offer': {'type': 'offer', 'sdp': SDP, 'sent': time.time()},
+    'icecandidate': dict(ICE_CANDIDATE, sent=time.time()),
+    'room-info': {
+        'room_id': 'bench-room',
+        'clients': [{'id': uuid.uuid4().hex, 'username': 'Major Tom'}
+                    for _ in range(10)],
+    },
+}
+
+
+def installed_codecs():
+    for name, codec in CODECS.items():
+        try:
+            yield codec()
+        except ImportError:
+            print('{} is not installed'.format(name))
+
+
+def measure(fn, number=20000):
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1e6
+
+
+def main():
+    codecs = list(installed_codecs())
+    print('{:>14} {:>8} {:>12} {:>12} {:>12} {:>12}'.format(
+        'payload', 'codec', 'loads str', 'loads bytes', 'dumps', 'dumpb'))
+
+    for payload, obj in PAYLOADS.items():
+        for codec in codecs:
+            text = codec.dumps(obj)
+            data = codec.dumpb(obj)
+            assert codec.loads(text) == codec.loads(data) == obj
+
+            print('{:>14} {:>8} {:>12.2f} {:>12.2f} {:>12.2f} {:>12.2f}'.format(
+                payload, codec.name,
+                measure(lambda: codec.loads(text)),
+                measure(lambda: codec.loads(data)),
+                measure(lambda: codec.dumps(obj)),
+                measure(lambda: codec.dumpb(obj))))
+    print('(times in microseconds)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+"""Compare the JSON and compact websocket protocols.
+
+Usage: python benchmarks/bench_protocol.py
+
+Reports the size of the frames sent and received by clients relaying ICE
+candidates and chat messages, and the server time to relay each message from
+one client to another with each protocol. Also reports the size of large
+frames and the time to send them with the deflate option.
+"""
+import json
+import time
+import timeit
+import uuid
+
+from camus.bench import ICE_CANDIDATE, SDP
+from camus.message_handler import Message
+from camus.protocol import TYPE_CODES, JSONProtocol, MsgpackProtocol
+
+PAYLOADS = {
+    'icecandidate': dict(ICE_CANDIDATE, sent=time.time()),
+    'text': {'from': 'Ted', 'time': 1615918847680,
+             'text': 'All we are is dust in the wind, dude.'},
+}
+
+
+def relay(sender, receiver, frame):
+    """Relay a frame between two connections like the server does."""
+    message = Message(sender.decode(frame))
+    message.sender = sender.client_uuid
+    return receiver.encode(message.json())
+
+
+def connections(protocol):
+    """Get the protocols of two clients which know about each other."""
+    sender = protocol(uuid.uuid4().hex)
+    receiver = protocol(uuid.uuid4().hex)
+    if protocol is MsgpackProtocol:
+        # As if the clients had received a room-info message
+        sender.short_id(receiver.client_uuid)
+        receiver.short_id(sender.client_uuid)
+    return sender, receiver
+
+
+def main():
+    import msgpack
+
+    print('{:>14} {:>14} {:>10} {:>10} {:>10}'.format(
+        'type', 'protocol', 'bytes in', 'bytes out', 'us/relay'))
+
+    for type, data in PAYLOADS.items():
+        for protocol in (JSONProtocol, MsgpackProtocol):
+            sender, receiver = connections(protocol)
+            if protocol is JSONProtocol:
+                frame = json.dumps({'receiver': receiver.client_uuid,
+                                    'type': type, 'data': data},
+                                   separators=(',', ':'))
+            else:
+                frame = msgpack.packb([TYPE_CODES[type],
+                                       sender.short_id(receiver.client_uuid),
+                                       data])
+
+            sent = relay(sender, receiver, frame)
+            number = 20000
+            t = min(timeit.repeat(lambda: relay(sender, receiver, frame),
+                                  number=number, repeat=5)) / number
+            print('{:>14} {:>14} {:>10} {:>10} {:>10.2f}'.format(
+                type, protocol.name, len(frame), len(sent),
+                t * 1e6))
+
+    print()
+    print('{:>14} {:>14} {:>10} {:>10} {:>10}'.format(
+        'type', 'protocol', 'bytes', 'deflated', 'us/frame'))
+
+    large = {
+        'offer': {'type': 'offer', 'sdp': SDP},
+        'room-info': {'room_id': 'bench-room', 'clients': [
+            {'id': uuid.uuid4().hex, 'username': 'Major Tom {}'.format(i)}
+            for i in range(50)]},
+    }
+    for type, data in large.items():
+        message = Message()
+        message.sender = 'ground control'
+        message.type = type
+        message.data = data
+        frame = message.json()
+
+        for protocol in (JSONProtocol, MsgpackProtocol):
+            sender = protocol(uuid.uuid4().hex, options=['deflate'])
+            plain = protocol(uuid.uuid4().hex)
+            deflated = sender.frames([frame])[0]
+            number = 2000
+            t = min(timeit.repeat(lambda: sender.frames([frame]),
+                                  number=number, repeat=5)) / number
+            print('{:>14} {:>14} {:>10} {:>10} {:>10.2f}'.format(
+                type, protocol.name, len(plain.encode(frame)), len(deflated),
+                t * 1e6))
+
+
+if __name__ == '__main__':
+    main()
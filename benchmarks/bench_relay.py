@@ -0,0 +1,58 @@
+"""Benchmark relaying peer-to-peer messages from one client to another.
+
+Usage: python benchmarks/bench_relay.py
+
+Reports the time to relay SDP offers and ICE candidates using the envelope
+fast path of Message, compared to decoding and re-encoding the whole message.
+"""
+import json
+import time
+import timeit
+
+from camus.bench import ICE_CANDIDATE, SDP
+from camus.message_handler import Message
+
+PAYLOADS = {
+    'offer': {'type': 'offer', 'sdp': SDP},
+    'icecandidate': ICE_CANDIDATE,
+}
+
+
+def relay_full_decode(text):
+    """The previous implementation, which decodes and re-encodes the data."""
+    message = json.loads(text)
+    message['sender'] = 'f0c1d2e3a4b5c6d7e8f90a1b2c3d4e5f'
+    return json.dumps({'sender': message.get('sender'),
+                       'receiver': message.get('receiver'),
+                       'type': message.get('type'),
+                       'data': message.get('data')})
+
+
+def relay_envelope(text):
+    message = Message(text)
+    message.sender = 'f0c1d2e3a4b5c6d7e8f90a1b2c3d4e5f'
+    return message.json()
+
+
+def main():
+    print('{:>14} {:>8} {:>12} {:>12} {:>8}'.format(
+        'type', 'bytes', 'old us/msg', 'new us/msg', 'speedup'))
+
+    for type, data in PAYLOADS.items():
+        # Encoded like JSON.stringify in the browser client
+        text = json.dumps({'receiver': '0a1b2c3d4e5f60718293a4b5c6d7e8f9',
+                           'type': type,
+                           'data': dict(data, sent=time.time())},
+                          separators=(',', ':'))
+        assert json.loads(relay_full_decode(text)) == json.loads(relay_envelope(text))
+
+        number = 20000
+        results = [min(timeit.repeat(lambda: fn(text), number=number, repeat=5))
+                   / number * 1e6
+                   for fn in (relay_full_decode, relay_envelope)]
+        print('{:>14} {:>8} {:>12.2f} {:>12.2f} {:>7.1f}x'.format(
+            type, len(text), results[0], results[1], results[0] / results[1]))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,162 @@
+"""Benchmark the reaper, roster and public room queries before and after the
+c27e8d5a90b4 migration, which adds composite indexes and cascading deletes.
+
+Usage: python benchmarks/bench_schema.py [--clients 100000] [--url URL]
+
+A database is migrated to the previous revision and filled with rooms and
+clients, the queries are timed, and then the database is migrated to the
+new revision and the queries are timed again. By default a temporary SQLite
+database is used; a Postgresql database can be given with --url, and will
+be emptied.
+"""
+import argparse
+import datetime
+import os
+import random
+import tempfile
+import time
+import uuid
+
+import sqlalchemy as sa
+from alembic import command
+from alembic.config import Config
+
+BEFORE = '9f3d2b7c41e5'
+AFTER = 'c27e8d5a90b4'
+
+NOW = datetime.datetime(2021, 6, 1)
+CUTOFF = NOW - datetime.timedelta(minutes=5)
+
+QUERIES = {
+    'reap clients': (
+        'SELECT id, uuid, room_id FROM clients WHERE seen < :cutoff', {}),
+    'reap rooms': (
+        'SELECT id FROM rooms WHERE active < :cutoff', {}),
+    'roster': (
+        'SELECT uuid, name FROM clients WHERE room_id = :room_id', {}),
+    'stale in room': (
+        'SELECT uuid FROM clients WHERE room_id = :room_id '
+        'AND seen < :cutoff', {}),
+    'public list': (
+        'SELECT name, slug, client_count, guest_limit, active FROM rooms '
+        'WHERE is_public = :public ORDER BY active DESC LIMIT 1000',
+        {'public': True}),
+}
+
+
+def alembic_config(url):
+    os.environ['DATABASE_URL'] = url
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    config = Config(os.path.join(root, 'alembic.ini'))
+    config.set_main_option('script_location',
+                           os.path.join(root, 'migrations'))
+    return config
+
+
+def populate(engine, n_clients, clients_per_room=10):
+    n_rooms = n_clients // clients_per_room
+    random.seed(1)
+
+    def moment():
+        # About a quarter of the rooms and clients are stale
+        return NOW - datetime.timedelta(seconds=random.randint(0, 400))
+
+    rooms = [{'id': i + 1, 'name': 'room-{}'.format(i),
+              'slug': 'room-{}'.format(i), 'guest_limit': 100,
+              'client_count': clients_per_room, 'is_public': i % 2 == 0,
+              'created': NOW, 'active': moment()}
+             for i in range(n_rooms)]
+    clients = [{'name': 'Major Tom', 'uuid': uuid.uuid4().hex,
+                'seen': moment(), 'room_id': i % n_rooms + 1}
+               for i in range(n_clients)]
+
+    meta = sa.MetaData()
+    meta.reflect(bind=engine, only=['rooms', 'clients'])
+    with engine.begin() as connection:
+        connection.execute(meta.tables['rooms'].insert(), rooms)
+        connection.execute(meta.tables['clients'].insert(), clients)
+    return n_rooms
+
+
+def measure(engine, sql, params, repeat=20):
+    times = []
+    with engine.connect() as connection:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            connection.execute(sa.text(sql), params).fetchall()
+            times.append(time.perf_counter() - start)
+    return min(times) * 1000
+
+
+def measure_delete(engine, room_ids, cascade):
+    """Time deleting a set of rooms, along with their clients."""
+    start = time.perf_counter()
+    with engine.begin() as connection:
+        if not cascade:
+            if engine.dialect.name == 'sqlite':
+                # As before the migration, when foreign keys were not enforced
+                connection.execute(sa.text('PRAGMA foreign_keys=OFF'))
+            connection.execute(sa.text(
+                'DELETE FROM clients WHERE room_id IN :ids').bindparams(
+                    sa.bindparam('ids', expanding=True)), {'ids': list(room_ids)})
+        connection.execute(sa.text(
+            'DELETE FROM rooms WHERE id IN :ids').bindparams(
+                sa.bindparam('ids', expanding=True)), {'ids': list(room_ids)})
+    return (time.perf_counter() - start) * 1000
+
+
+def run(url, n_clients):
+    config = alembic_config(url)
+    engine = sa.create_engine(url)
+    with engine.begin() as connection:
+        connection.execute(sa.text('DROP TABLE IF EXISTS clients'))
+        connection.execute(sa.text('DROP TABLE IF EXISTS rooms'))
+        connection.execute(sa.text('DROP TABLE IF EXISTS alembic_version'))
+
+    command.upgrade(config, BEFORE)
+    n_rooms = populate(engine, n_clients)
+    params = {'cutoff': CUTOFF, 'room_id': n_rooms // 2}
+
+    results = {}
+    with engine.begin() as connection:
+        connection.execute(sa.text('ANALYZE'))
+    for name, (sql, extra) in QUERIES.items():
+        results[name] = [measure(engine, sql, dict(params, **extra))]
+
+    command.upgrade(config, AFTER)
+    with engine.begin() as connection:
+        connection.execute(sa.text('ANALYZE'))
+    for name, (sql, extra) in QUERIES.items():
+        results[name].append(measure(engine, sql, dict(params, **extra)))
+
+    # Delete a different 10% of the rooms with each schema
+    command.downgrade(config, BEFORE)
+    before = measure_delete(engine, range(1, n_rooms + 1, 10), cascade=False)
+    command.upgrade(config, AFTER)
+    after = measure_delete(engine, range(2, n_rooms + 1, 10), cascade=True)
+    results['delete rooms'] = [before, after]
+
+    print('{} clients in {} rooms'.format(n_clients, n_rooms))
+    print('{:>16} {:>10} {:>10}'.format('query', 'before', 'after'))
+    for name, (before, after) in results.items():
+        print('{:>16} {:>10.2f} {:>10.2f}'.format(name, before, after))
+    print('(times in milliseconds)')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--clients', type=int, default=100000)
+    parser.add_argument('--url', help='database URL (default: temporary '
+                        'SQLite database)')
+    args = parser.parse_args()
+
+    if args.url:
+        run(args.url, args.clients)
+    else:
+        with tempfile.TemporaryDirectory() as directory:
+            run('sqlite:///' + os.path.join(directory, 'bench.db'),
+                args.clients)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,21 +1,3 @@
-from logging.config import dictConfig
-
-dictConfig({
-    'version': 1,
-    'formatters': {'default': {
-        #'format': '[%(asctime)s] %(levelname)s in %(module)s: %(message)s',
-        'format': '[%(levelname)s] in %(module)s %(funcName)s %(lineno)d: %(message)s',
-    }},
-    'handlers': {'wsgi': {
-        'class': 'logging.StreamHandler',
-        'formatter': 'default'
-    }},
-    'root': {
-        'level': 'INFO',
-        'handlers': ['wsgi']
-    }
-})
-
 import quart.flask_patch
 
 from quart import Quart
@@ -23,33 +5,71 @@ from flask_bootstrap import Bootstrap
 from flask_sqlalchemy import SQLAlchemy
 
 from .config import Config
+from .logs import configure_logging
 
 bootstrap = Bootstrap()
 db = SQLAlchemy()
 
+from .store import Store
+store = Store()
+
+from .directory import Directory
+directory = Directory()
+
+from .passwords import PasswordHasher
+passwords = PasswordHasher()
+
+from .ratelimit import RateLimits
+rate_limits = RateLimits()
+
+from .metrics import metrics
+
 from .message_handler import MessageHandler
 message_handler = MessageHandler()
 
 def create_app(config_class=Config):
     app = Quart(__name__)
     app.config.from_object(config_class)
+    configure_logging(app.config)
 
     # Initialize extensions
     bootstrap.init_app(app)
     db.init_app(app)
     db.create_all(app=app)
+    store.init_app(app)
+    passwords.init_app(app)
+    directory.init_app(app)
+    rate_limits.init_app(app)
+    metrics.init_app(app)
+    message_handler.init_app(app)
 
     # Apply blueprint for our routes
     from camus import routes
     app.register_blueprint(routes.bp)
 
     # Start background tasks before serving
+    timers = []
+
     @app.before_serving
     async def startup():
-        from camus.util import LoopTimer, ping_clients, reap_clients, reap_rooms
-        message_handler.start()
-        LoopTimer(20, ping_clients, message_handler=message_handler)
-        LoopTimer(30, reap_clients, message_handler=message_handler)
-        LoopTimer(300, reap_rooms)
+        from camus.transport import create_transport
+        from camus.util import (LoopTimer, flush_presence, reap_clients,
+                                reap_rooms)
+        message_handler.start(
+            workers=app.config['INBOX_WORKERS'],
+            transport=create_transport(app.config['SIGNALING_URL']))
+        timers[:] = [
+            LoopTimer(app.config['PRESENCE_FLUSH_INTERVAL'], flush_presence,
+                      message_handler=message_handler),
+            LoopTimer(300, reap_clients, message_handler=message_handler),
+            LoopTimer(300, reap_rooms, message_handler=message_handler),
+        ]
+
+    @app.after_serving
+    async def shutdown():
+        for timer in timers:
+            timer.cancel()
+        message_handler.stop()
+        await message_handler.presence.flush()
 
     return app
@@ -0,0 +1,382 @@
+"""Load generator for the room websocket signaling path.
+
+Creates rooms on a running Camus server and connects synthetic clients to
+them, which exchange ``profile``, ``ping``, ``get-room-info`` and
+peer-to-peer ``offer``/``answer``/``icecandidate`` messages like the browser
+client does. Reports the message throughput, the end-to-end latency of
+messages relayed between clients, and (when the server's PID is given) the
+server's memory use per connection.
+
+Usage: camus-bench --url http://127.0.0.1:5000 --rooms 10 --clients 10
+
+All of the clients connect from the same address, so the server's per-IP
+rate limits should be disabled (RATE_LIMIT_IP_JOINS=0 and
+RATE_LIMIT_IP_MESSAGES=0) for larger runs.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import re
+import time
+import uuid
+from collections import Counter
+from urllib.parse import urlencode, urlparse
+
+from wsproto import ConnectionType, WSConnection
+from wsproto.events import (AcceptConnection, CloseConnection, Ping,
+                            RejectConnection, Request, TextMessage)
+
+SDP = 'v=0\r\n' + ''.join(
+    'a=candidate:{0} 1 udp 2122260223 192.0.2.1 500{0:02d} typ host\r\n'.format(i)
+    for i in range(40))
+ICE_CANDIDATE = {
+    'candidate': 'candidate:842163049 1 udp 1677729535 203.0.113.7 46154 typ srflx',
+    'sdpMid': '0',
+    'sdpMLineIndex': 0,
+}
+
+
+class Stats:
+    """Counters and latency samples collected during a run."""
+
+    def __init__(self):
+        self.sent = Counter()
+        self.received = Counter()
+        self.relay_latency = []
+        self.ping_latency = []
+        self.errors = Counter()
+
+    def summary(self, duration, connections, rss_delta=None):
+        lines = [
+            'connections:   {}'.format(connections),
+            'sent:          {} ({:.0f}/s)'.format(
+                sum(self.sent.values()), sum(self.sent.values()) / duration),
+            'received:      {} ({:.0f}/s)'.format(
+                sum(self.received.values()),
+                sum(self.received.values()) / duration),
+            'relay latency: {}'.format(_latency_summary(self.relay_latency)),
+            'ping latency:  {}'.format(_latency_summary(self.ping_latency)),
+        ]
+        if rss_delta is not None and connections:
+            lines.append('server memory: {:.1f} KiB/connection'.format(
+                rss_delta / connections / 1024))
+        for error, count in self.errors.items():
+            lines.append('errors:        {} x {}'.format(count, error))
+
+        return '\n'.join(lines)
+
+
+def percentile(samples, p):
+    """Get the p-th percentile of a list of samples."""
+    if not samples:
+        return None
+    samples = sorted(samples)
+    index = min(len(samples) - 1, int(round(p / 100 * (len(samples) - 1))))
+    return samples[index]
+
+
+def _latency_summary(samples):
+    if not samples:
+        return 'n/a'
+    return 'p50 {:.1f} ms, p99 {:.1f} ms, max {:.1f} ms (n={})'.format(
+        percentile(samples, 50) * 1000, percentile(samples, 99) * 1000,
+        max(samples) * 1000, len(samples))
+
+
+async def http_request(host, port, method, path, headers=(), body=b''):
+    """Make a minimal HTTP/1.1 request.
+
+    Returns the status code, a list of (name, value) headers and the body.
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    lines = ['{} {} HTTP/1.1'.format(method, path),
+             'Host: {}:{}'.format(host, port),
+             'Connection: close',
+             'Content-Length: {}'.format(len(body))]
+    lines += ['{}: {}'.format(name, value) for name, value in headers]
+    writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode() + body)
+
+    data = await reader.read()
+    writer.close()
+
+    head, _, body = data.partition(b'\r\n\r\n')
+    status_line, *header_lines = head.decode('latin-1').split('\r\n')
+    headers = [tuple(line.split(': ', 1)) for line in header_lines]
+    return int(status_line.split()[1]), headers, body
+
+
+def _session_cookie(headers):
+    for name, value in headers:
+        if name.lower() == 'set-cookie' and value.startswith('session='):
+            return value.split(';', 1)[0]
+    return None
+
+
+class WebsocketClient:
+    """A minimal websocket client using wsproto."""
+
+    async def connect(self, host, port, path, headers=()):
+        self._reader, self._writer = await asyncio.open_connection(host, port)
+        self._ws = WSConnection(ConnectionType.CLIENT)
+        self._messages = []
+        self._partial = []
+        self._writer.write(self._ws.send(Request(
+            host='{}:{}'.format(host, port), target=path,
+            extra_headers=list(headers))))
+
+        while True:
+            for event in await self._read_events():
+                if isinstance(event, AcceptConnection):
+                    return
+                if isinstance(event, RejectConnection):
+                    raise ConnectionError(
+                        'Websocket rejected: {}'.format(event.status_code))
+
+    async def send(self, text):
+        self._writer.write(self._ws.send(TextMessage(data=text)))
+        await self._writer.drain()
+
+    async def receive(self):
+        """Wait for the next text message, or None if the connection closed."""
+        while not self._messages:
+            events = await self._read_events()
+            if events is None:
+                return None
+            for event in events:
+                if isinstance(event, TextMessage):
+                    self._partial.append(event.data)
+                    if event.message_finished:
+                        self._messages.append(''.join(self._partial))
+                        self._partial = []
+                elif isinstance(event, Ping):
+                    self._writer.write(self._ws.send(event.response()))
+                elif isinstance(event, CloseConnection):
+                    return None
+
+        return self._messages.pop(0)
+
+    async def close(self):
+        try:
+            self._writer.write(self._ws.send(CloseConnection(code=1000)))
+            await self._writer.drain()
+        except Exception:
+            pass
+        self._writer.close()
+
+    async def _read_events(self):
+        data = await self._reader.read(65536)
+        if not data:
+            return None
+        self._ws.receive_data(data)
+        return list(self._ws.events())
+
+
+class SyntheticClient:
+    """A client which joins a room and behaves like a browser client."""
+
+    def __init__(self, bench, slug, index):
+        self.bench = bench
+        self.slug = slug
+        self.index = index
+        self.id = None
+        self.peers = []
+        self.ws = WebsocketClient()
+
+    async def join(self):
+        bench = self.bench
+        status, headers, _ = await http_request(
+            bench.host, bench.port, 'GET', '/room/{}'.format(self.slug))
+        cookie = _session_cookie(headers)
+        if status != 200 or cookie is None:
+            raise ConnectionError('Could not join room: {}'.format(status))
+
+        await self.ws.connect(bench.host, bench.port,
+                              '/room/{}/ws'.format(self.slug),
+                              headers=[('Cookie', cookie)])
+
+        # The pong is addressed to us, which tells us our own ID
+        await self.send('ground control', 'ping', time.time())
+        await self.send('ground control', 'profile',
+                        {'username': 'bench-{}'.format(self.index)})
+        await self.send('ground control', 'get-room-info')
+
+    async def send(self, receiver, type, data=None):
+        self.bench.stats.sent[type] += 1
+        await self.ws.send(json.dumps(
+            {'receiver': receiver, 'type': type, 'data': data}))
+
+    async def run_receiver(self):
+        stats = self.bench.stats
+        while True:
+            text = await self.ws.receive()
+            if text is None:
+                return
+
+            message = json.loads(text)
+            type, data = message.get('type'), message.get('data')
+            stats.received[type] += 1
+
+            if type == 'pong':
+                self.id = message['receiver']
+                stats.ping_latency.append(time.time() - data)
+            elif type == 'ping':
+                await self.send('ground control', 'pong', data)
+            elif type == 'room-info':
+                self.peers = [c['id'] for c in data['clients']
+                              if c['id'] != self.id]
+            elif type in ('offer', 'answer', 'icecandidate'):
+                stats.relay_latency.append(time.time() - data['sent'])
+                if type == 'offer':
+                    await self.send(message['sender'], 'answer', {
+                        'type': 'answer', 'sdp': data['sdp'],
+                        'sent': time.time()})
+
+    async def run_sender(self, rate, deadline):
+        while time.time() < deadline:
+            await asyncio.sleep(random.expovariate(rate))
+            if not self.peers:
+                continue
+
+            peer = random.choice(self.peers)
+            roll = random.random()
+            if roll < 0.1:
+                await self.send('ground control', 'ping', time.time())
+            elif roll < 0.15:
+                await self.send('ground control', 'get-room-info')
+            elif roll < 0.3:
+                await self.send(peer, 'offer', {
+                    'type': 'offer', 'sdp': SDP, 'sent': time.time()})
+            else:
+                # ICE candidates tend to arrive in bursts
+                for _ in range(random.randint(1, 5)):
+                    await self.send(peer, 'icecandidate',
+                                    dict(ICE_CANDIDATE, sent=time.time()))
+
+    async def leave(self):
+        try:
+            await self.send('ground control', 'bye', time.time())
+        finally:
+            await self.ws.close()
+
+
+class Bench:
+
+    def __init__(self, url, rooms, clients, duration, rate, concurrency,
+                 pid=None):
+        url = urlparse(url)
+        self.host = url.hostname or '127.0.0.1'
+        self.port = url.port or 80
+        self.rooms = rooms
+        self.clients = clients
+        self.duration = duration
+        self.rate = rate
+        self.concurrency = concurrency
+        self.pid = pid
+        self.stats = Stats()
+
+    async def create_room(self, name):
+        """Create a room using the form on the index page."""
+        status, headers, body = await http_request(
+            self.host, self.port, 'GET', '/')
+        cookie = _session_cookie(headers)
+        match = re.search(rb'name="csrf_token" type="hidden" value="([^"]+)"',
+                          body)
+
+        form = {'room_name': name, 'password': '', 'public': 'No',
+                'guest_limit': 0, 'submit': 'Create'}
+        if match:
+            form['csrf_token'] = match.group(1).decode()
+
+        status, headers, _ = await http_request(
+            self.host, self.port, 'POST', '/',
+            headers=[('Content-Type', 'application/x-www-form-urlencoded'),
+                     ('Cookie', cookie or '')],
+            body=urlencode(form).encode())
+
+        location = dict(headers).get('location', dict(headers).get('Location'))
+        if status not in (302, 307) or not location:
+            raise RuntimeError('Could not create room: {}'.format(status))
+
+        return location.rstrip('/').rsplit('/', 1)[-1]
+
+    async def run(self):
+        run_id = uuid.uuid4().hex[:8]
+        slugs = [await self.create_room('bench-{}-{}'.format(run_id, i))
+                 for i in range(self.rooms)]
+        rss_before = _rss(self.pid)
+
+        # Connect the clients, a limited number at a time
+        semaphore = asyncio.Semaphore(self.concurrency)
+        clients = [SyntheticClient(self, slug, i)
+                   for slug in slugs for i in range(self.clients)]
+
+        async def join(client):
+            async with semaphore:
+                try:
+                    await client.join()
+                    return client
+                except Exception as e:
+                    self.stats.errors[repr(e)] += 1
+
+        start = time.time()
+        connected = [c for c in await asyncio.gather(*map(join, clients)) if c]
+        print('Connected {} clients in {:.1f}s'.format(
+            len(connected), time.time() - start))
+        rss_after = _rss(self.pid)
+
+        receivers = [asyncio.ensure_future(c.run_receiver()) for c in connected]
+        start = time.time()
+        await asyncio.gather(*[c.run_sender(self.rate, start + self.duration)
+                               for c in connected])
+        await asyncio.sleep(1)
+        duration = time.time() - start
+
+        for task in receivers:
+            task.cancel()
+        await asyncio.gather(*[c.leave() for c in connected],
+                             return_exceptions=True)
+
+        rss_delta = None
+        if rss_before is not None and rss_after is not None:
+            rss_delta = rss_after - rss_before
+        print(self.stats.summary(duration, len(connected), rss_delta))
+        return self.stats
+
+
+def _rss(pid):
+    """Get the resident memory of a process in bytes, if available."""
+    if pid is None:
+        return None
+    try:
+        with open('/proc/{}/status'.format(pid)) as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Load test the Camus signaling server.')
+    parser.add_argument('--url', default='http://127.0.0.1:5000',
+                        help='URL of the Camus server')
+    parser.add_argument('--rooms', type=int, default=10,
+                        help='number of rooms to create')
+    parser.add_argument('--clients', type=int, default=10,
+                        help='number of clients per room')
+    parser.add_argument('--duration', type=float, default=30,
+                        help='seconds to send messages for')
+    parser.add_argument('--rate', type=float, default=1,
+                        help='messages per second sent by each client')
+    parser.add_argument('--concurrency', type=int, default=50,
+                        help='number of clients connecting at the same time')
+    parser.add_argument('--pid', type=int,
+                        help='PID of the server, to measure its memory use')
+    args = parser.parse_args(argv)
+
+    bench = Bench(args.url, args.rooms, args.clients, args.duration,
+                  args.rate, args.concurrency, args.pid)
+    asyncio.get_event_loop().run_until_complete(bench.run())
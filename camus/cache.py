@@ -0,0 +1,102 @@
+import asyncio
+import time
+
+
+class Cache:
+    """An in-process cache of values loaded from the database.
+
+    Values are kept for `ttl` seconds, so changes made by other server
+    processes are seen after at most that long; changes made by this process
+    should be applied by invalidating the affected keys. Lookups of a key
+    which is not cached share a single load, so many clients arriving at once
+    result in one query. None is never cached, so a missing value is loaded
+    again by the next lookup.
+
+    The number of lookups answered from the cache, the number which had to be
+    loaded and the number which shared another lookup's load are counted in
+    `hits`, `misses` and `coalesced`.
+    """
+
+    def __init__(self, ttl=10, maxsize=10000):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self._entries = {}
+        self._loading = {}
+
+    async def get(self, key, load):
+        """Get the value for a key, calling the coroutine function `load` to
+        load it if it is not cached.
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry[0] > time.monotonic():
+                self.hits += 1
+                return entry[1]
+            del self._entries[key]
+
+        task = self._loading.get(key)
+        if task is None:
+            self.misses += 1
+            task = self._loading[key] = asyncio.ensure_future(
+                self._load(key, load))
+        else:
+            self.coalesced += 1
+
+        # A cancelled lookup should not cancel the load for the others
+        return await asyncio.shield(task)
+
+    def set(self, key, value):
+        """Cache a value which is already known."""
+        self._loading.pop(key, None)
+        if value is None or not self.ttl:
+            self._entries.pop(key, None)
+            return
+
+        if key not in self._entries and len(self._entries) >= self.maxsize:
+            self._evict()
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+
+    def invalidate(self, key):
+        """Discard the value for a key.
+
+        A load in progress for the key is not cached when it completes.
+        """
+        self._entries.pop(key, None)
+        self._loading.pop(key, None)
+
+    def invalidate_where(self, predicate):
+        """Discard the values for which `predicate(value)` is true."""
+        for key in [key for key, (_, value) in self._entries.items()
+                    if predicate(value)]:
+            del self._entries[key]
+
+    def clear(self):
+        self._entries.clear()
+        self._loading.clear()
+
+    async def _load(self, key, load):
+        task = asyncio.current_task()
+        try:
+            value = await load()
+        except BaseException:
+            if self._loading.get(key) is task:
+                del self._loading[key]
+            raise
+
+        # Only cache the value if the key was not invalidated while loading
+        if self._loading.get(key) is task:
+            self.set(key, value)
+        return value
+
+    def _evict(self):
+        now = time.monotonic()
+        self._entries = {key: entry for key, entry in self._entries.items()
+                         if entry[0] > now}
+        while len(self._entries) >= self.maxsize:
+            del self._entries[next(iter(self._entries))]
+
+    def __len__(self):
+        return len(self._entries)
@@ -12,9 +12,53 @@ class Config(object):
     TWILIO_ACCOUNT_SID = os.environ.get('TWILIO_ACCOUNT_SID')
     TWILIO_AUTH_TOKEN = os.environ.get('TWILIO_AUTH_TOKEN')
     TWILIO_KEY_SID = os.environ.get('TWILIO_KEY_SID')
+    TWILIO_TIMEOUT = float(os.environ.get('TWILIO_TIMEOUT') or 10)
+    SIGNALING_URL = os.environ.get('SIGNALING_URL')
+    INBOX_WORKERS = int(os.environ.get('INBOX_WORKERS') or 4)
+    OUTBOX_SIZE = int(os.environ.get('OUTBOX_SIZE') or 256)
+    OUTBOX_POLICY = os.environ.get('OUTBOX_POLICY') or 'drop-oldest'
+    CLIENT_PING_AFTER = float(os.environ.get('CLIENT_PING_AFTER') or 30)
+    CLIENT_TIMEOUT = float(os.environ.get('CLIENT_TIMEOUT') or 90)
+    PRESENCE_FLUSH_INTERVAL = float(os.environ.get('PRESENCE_FLUSH_INTERVAL') or 5)
+    ROOM_INFO_DEBOUNCE = float(os.environ.get('ROOM_INFO_DEBOUNCE') or 0.1)
+    ROOM_INFO_MAX_DELAY = float(os.environ.get('ROOM_INFO_MAX_DELAY') or 0.5)
+    CACHE_TTL = float(os.environ.get('CACHE_TTL') or 10)
+    CHAT_HISTORY_SIZE = int(os.environ.get('CHAT_HISTORY_SIZE') or 50)
+    CHAT_HISTORY_MAX_BYTES = int(
+        os.environ.get('CHAT_HISTORY_MAX_BYTES') or 16 * 1024 * 1024)
+    JSON_CODEC = os.environ.get('JSON_CODEC') or None
+    WEBSOCKET_BATCH_SIZE = int(os.environ.get('WEBSOCKET_BATCH_SIZE') or 64)
+    WEBSOCKET_COMPRESSION_THRESHOLD = int(
+        os.environ.get('WEBSOCKET_COMPRESSION_THRESHOLD') or 1024)
+    WEBSOCKET_COMPRESSION_LEVEL = int(
+        os.environ.get('WEBSOCKET_COMPRESSION_LEVEL') or 6)
+    PUBLIC_ROOMS_TTL = float(os.environ.get('PUBLIC_ROOMS_TTL') or 5)
+    PUBLIC_ROOMS_PAGE_SIZE = int(os.environ.get('PUBLIC_ROOMS_PAGE_SIZE') or 50)
+    RATE_LIMIT_CLIENT_MESSAGES = os.environ.get(
+        'RATE_LIMIT_CLIENT_MESSAGES') or '50/200'
+    RATE_LIMIT_IP_MESSAGES = os.environ.get('RATE_LIMIT_IP_MESSAGES') or \
+        '200/800'
+    RATE_LIMIT_ROOM_MESSAGES = os.environ.get('RATE_LIMIT_ROOM_MESSAGES') or \
+        '1000/4000'
+    RATE_LIMIT_IP_JOINS = os.environ.get('RATE_LIMIT_IP_JOINS') or '2/60'
+    RATE_LIMIT_ROOM_JOINS = os.environ.get('RATE_LIMIT_ROOM_JOINS') or '5/50'
+    TRUSTED_PROXIES = int(os.environ.get('TRUSTED_PROXIES') or 0)
+    LOG_LEVEL = os.environ.get('LOG_LEVEL') or 'INFO'
+    LOG_LEVELS = os.environ.get('LOG_LEVELS') or ''
+    LOG_FORMAT = os.environ.get('LOG_FORMAT') or 'text'
+    LOG_SAMPLE = os.environ.get('LOG_SAMPLE') or ''
+    LOG_QUEUE_SIZE = int(os.environ.get('LOG_QUEUE_SIZE') or 10000)
+    METRICS_ENABLED = (os.environ.get('METRICS_ENABLED') or '').lower() in \
+        ('1', 'true', 'yes')
+    PASSWORD_HASH_METHOD = os.environ.get('PASSWORD_HASH_METHOD') or \
+        'pbkdf2:sha256'
+    PASSWORD_SALT_LENGTH = int(os.environ.get('PASSWORD_SALT_LENGTH') or 8)
+    PASSWORD_HASH_THREADS = int(os.environ.get('PASSWORD_HASH_THREADS') or 2)
     SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL') or \
         'sqlite:///' + os.path.join(basedir, 'camus.db')
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    DATABASE_THREADS = int(os.environ['DATABASE_THREADS']) \
+        if os.environ.get('DATABASE_THREADS') else None
 
 class TestConfig(Config):
     SQLALCHEMY_DATABASE_URI = 'sqlite://'
@@ -0,0 +1,91 @@
+import asyncio
+import datetime
+import logging
+import math
+import time
+
+from camus import store
+
+logger = logging.getLogger(__name__)
+
+
+class Directory:
+    """A snapshot of the public rooms, for listing them in pages.
+
+    The snapshot is built with a single query, most recently active rooms
+    first, and includes each room's client count. Once it is `ttl` seconds
+    old it is rebuilt in the background, and the old snapshot is served
+    until the new one is ready, so requests only wait for the database when
+    there is no snapshot at all. At most `max_rooms` rooms are listed.
+    """
+
+    def __init__(self, ttl=5, page_size=50, max_rooms=1000):
+        self.ttl = ttl
+        self.page_size = page_size
+        self.max_rooms = max_rooms
+        self._rooms = None
+        self._built = 0
+        self._task = None
+
+    def init_app(self, app):
+        self.ttl = app.config['PUBLIC_ROOMS_TTL']
+        self.page_size = app.config['PUBLIC_ROOMS_PAGE_SIZE']
+        self._rooms = None
+
+    async def page(self, number=1):
+        """Get a page of the directory.
+
+        Returns a dict with the rooms on the page, the page number, the
+        number of pages and the total number of rooms. Page numbers start at
+        1, and out of range page numbers give the nearest page.
+        """
+        rooms = await self.rooms()
+        pages = max(1, math.ceil(len(rooms) / self.page_size))
+        number = min(max(1, number), pages)
+        start = (number - 1) * self.page_size
+
+        return {
+            'rooms': rooms[start:start + self.page_size],
+            'page': number,
+            'pages': pages,
+            'total': len(rooms),
+        }
+
+    async def rooms(self):
+        """Get the list of rooms in the current snapshot."""
+        if self._rooms is None:
+            await asyncio.shield(self._rebuild())
+        elif time.monotonic() - self._built >= self.ttl:
+            self._rebuild()
+
+        return self._rooms or []
+
+    def invalidate(self):
+        """Rebuild the snapshot on the next request."""
+        self._built = 0
+
+    def _rebuild(self):
+        """Start building a new snapshot, unless already in progress."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._build())
+        return self._task
+
+    async def _build(self):
+        try:
+            rooms = await store.public_rooms(limit=self.max_rooms)
+        except Exception:
+            logger.exception('Failed to build the public room directory')
+            if self._rooms is None:
+                raise
+            return
+
+        now = datetime.datetime.utcnow()
+        self._rooms = [{
+            'name': room.name,
+            'slug': room.slug,
+            'clients': room.client_count,
+            'guest_limit': room.guest_limit,
+            'active': room.active.isoformat() + 'Z',
+            'active_ago': int((now - room.active).total_seconds() / 60),
+        } for room in rooms]
+        self._built = time.monotonic()
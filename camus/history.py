@@ -0,0 +1,68 @@
+from collections import OrderedDict, deque
+
+
+class History:
+    """The most recent chat messages in each room.
+
+    Messages are kept as the JSON frames which were broadcast to the room, so
+    they can be sent to a client which joins later without being encoded
+    again. At most `size` messages are kept for each room, and at most
+    `max_bytes` characters of messages across all rooms; when the total is
+    exceeded, the oldest messages of the rooms which have been quiet for
+    longest are evicted first. A `size` of 0 disables the history.
+
+    The history only includes messages processed by this server process.
+    """
+
+    def __init__(self, size=50, max_bytes=16 * 1024 * 1024):
+        self.size = size
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.evicted = 0
+        # Least recently appended to first
+        self._rooms = OrderedDict()
+
+    def append(self, room_id, frame):
+        """Add an encoded message to a room's history."""
+        if not self.size or len(frame) > self.max_bytes:
+            return
+
+        frames = self._rooms.get(room_id)
+        if frames is None:
+            frames = self._rooms[room_id] = deque()
+        else:
+            self._rooms.move_to_end(room_id)
+
+        if len(frames) >= self.size:
+            self.bytes -= len(frames.popleft())
+        frames.append(frame)
+        self.bytes += len(frame)
+
+        while self.bytes > self.max_bytes:
+            self._evict()
+
+    def get(self, room_id):
+        """Get a room's history as a list of frames, oldest first."""
+        return list(self._rooms.get(room_id, ()))
+
+    def forget(self, room_ids):
+        """Discard the history of the given rooms."""
+        for room_id in room_ids:
+            frames = self._rooms.pop(room_id, None)
+            if frames is not None:
+                self.bytes -= sum(len(frame) for frame in frames)
+
+    def clear(self):
+        self._rooms.clear()
+        self.bytes = 0
+
+    def _evict(self):
+        """Discard the oldest message of the least recently active room."""
+        room_id, frames = next(iter(self._rooms.items()))
+        self.bytes -= len(frames.popleft())
+        self.evicted += 1
+        if not frames:
+            del self._rooms[room_id]
+
+    def __len__(self):
+        return sum(len(frames) for frames in self._rooms.values())
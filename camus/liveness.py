@@ -0,0 +1,117 @@
+import asyncio
+import datetime
+import heapq
+import itertools
+import logging
+
+from camus.util import remove_clients
+
+logger = logging.getLogger(__name__)
+
+
+class Liveness:
+    """Pings idle clients and removes clients which stop responding.
+
+    Each client connected to this process has a single deadline in a heap.
+    When a client has been idle for `ping_after` seconds it is sent a ping,
+    and when it has been idle for `reap_after` seconds it is removed. Activity
+    does not touch the heap: when a deadline passes, the client's last seen
+    time is checked and the deadline is moved forward if the client has been
+    active since. The work done is therefore proportional to the number of
+    deadlines that pass, rather than to the number of clients.
+    """
+
+    def __init__(self, message_handler, ping_after=30, reap_after=90):
+        self._message_handler = message_handler
+        self.ping_after = ping_after
+        self.reap_after = reap_after
+        self._heap = []
+        self._tracked = {}
+        self._generation = itertools.count()
+        self._pinged = {}
+        self._wakeup = None
+        self._task = None
+
+    def start(self):
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    def stop(self):
+        if self._task:
+            self._task.cancel()
+            self._task = None
+
+    def track(self, client_uuid):
+        """Start monitoring a client."""
+        if client_uuid in self._tracked:
+            return
+
+        generation = self._tracked[client_uuid] = next(self._generation)
+        deadline = (self._seen(client_uuid)
+                    + datetime.timedelta(seconds=self.ping_after))
+        if not self._heap or deadline < self._heap[0][0]:
+            if self._wakeup is not None:
+                self._wakeup.set()
+        heapq.heappush(self._heap, (deadline, client_uuid, generation))
+
+    def forget(self, client_uuid):
+        """Stop monitoring a client.
+
+        The client's deadline is discarded lazily when it passes.
+        """
+        self._tracked.pop(client_uuid, None)
+        self._pinged.pop(client_uuid, None)
+
+    def _seen(self, client_uuid):
+        return (self._message_handler.presence.client_seen(client_uuid)
+                or datetime.datetime.utcnow())
+
+    async def _run(self):
+        while True:
+            timeout = None
+            if self._heap:
+                timeout = max(0, (self._heap[0][0]
+                                  - datetime.datetime.utcnow()).total_seconds())
+
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+            try:
+                await self.expire(datetime.datetime.utcnow())
+            except Exception:
+                logger.exception('Exception while checking client liveness')
+
+    async def expire(self, now):
+        """Ping or remove the clients whose deadlines have passed."""
+        ping_after = datetime.timedelta(seconds=self.ping_after)
+        reap_after = datetime.timedelta(seconds=self.reap_after)
+        reaped = []
+
+        while self._heap and self._heap[0][0] <= now:
+            _, client_uuid, generation = heapq.heappop(self._heap)
+            if self._tracked.get(client_uuid) != generation:
+                continue
+
+            seen = self._seen(client_uuid)
+            if now - seen >= reap_after:
+                reaped.append(client_uuid)
+                self.forget(client_uuid)
+            elif now - seen >= ping_after:
+                if self._pinged.get(client_uuid) != seen:
+                    self._pinged[client_uuid] = seen
+                    self._message_handler.send_ping(client_uuid)
+                heapq.heappush(self._heap,
+                               (seen + reap_after, client_uuid, generation))
+            else:
+                heapq.heappush(self._heap,
+                               (seen + ping_after, client_uuid, generation))
+
+        if reaped:
+            logger.info('Reaping %d unresponsive clients', len(reaped))
+            logger.debug('Reaping clients: %s', reaped)
+            presence = self._message_handler.presence
+            await remove_clients(self._message_handler,
+                                 [(uuid, presence.room_of(uuid)) for uuid in reaped])
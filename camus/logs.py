@@ -0,0 +1,166 @@
+"""Logging configuration.
+
+Log records are put on a bounded queue by the thread which logs them, and are
+formatted and written by a separate thread, so a slow log sink cannot block
+the event loop. Records which arrive while the queue is full are dropped and
+counted. Records can be written as text or as JSON objects, one per line,
+which include any ``extra`` fields passed when logging.
+
+Each module logs to its own logger (such as ``camus.message_handler``), whose
+level can be set separately. Loggers with frequent messages can also be
+sampled, so that only a fraction of their records below ERROR are kept.
+"""
+
+import atexit
+import copy
+import datetime
+import json
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+TEXT_FORMAT = ('[%(levelname)s] in %(module)s %(funcName)s %(lineno)d: '
+               '%(message)s')
+
+# Attributes of every log record, which are not extra fields
+_RECORD_ATTRIBUTES = set(vars(logging.makeLogRecord({}))) | {'message'}
+
+_handler = None
+_listener = None
+
+
+def parse_settings(spec):
+    """Parse settings such as ``camus.routes=DEBUG,hypercorn=WARNING`` into
+    a dict.
+    """
+    settings = {}
+    for item in spec.split(','):
+        if item.strip():
+            name, _, value = item.partition('=')
+            settings[name.strip()] = value.strip()
+    return settings
+
+
+class JSONFormatter(logging.Formatter):
+    """Formats records as JSON objects."""
+
+    def format(self, record):
+        data = {
+            'time': datetime.datetime.utcfromtimestamp(
+                record.created).isoformat() + 'Z',
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+        data.update((key, value) for key, value in vars(record).items()
+                    if key not in _RECORD_ATTRIBUTES)
+
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            data['exception'] = record.exc_text
+
+        return json.dumps(data, default=str)
+
+
+class SamplingFilter(logging.Filter):
+    """Keeps a fraction of the records below ERROR from some loggers.
+
+    `rates` maps logger names to the fraction of their records (and those of
+    their descendants) to keep. Records are kept at evenly spaced intervals,
+    so a rate of 0.1 keeps every tenth record.
+    """
+
+    def __init__(self, rates):
+        super().__init__()
+        self.rates = rates
+        self._credit = dict.fromkeys(rates, 0.0)
+
+    def filter(self, record):
+        if record.levelno >= logging.ERROR or not self.rates:
+            return True
+
+        name = record.name
+        while name not in self.rates:
+            if '.' not in name:
+                return True
+            name = name.rpartition('.')[0]
+
+        self._credit[name] += self.rates[name]
+        if self._credit[name] >= 1:
+            self._credit[name] -= 1
+            return True
+        return False
+
+
+class DroppingQueueHandler(QueueHandler):
+    """A queue handler which drops records when its queue is full."""
+
+    def __init__(self, queue):
+        super().__init__(queue)
+        self.dropped = 0
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def prepare(self, record):
+        # Merge the arguments into the message and render any traceback, so
+        # that the record can be formatted in another thread, but leave
+        # formatting to the listener's handler.
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(
+                record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def configure_logging(config):
+    """Configure logging using the application's config.
+
+    This can be called again to reconfigure logging.
+    """
+    global _handler, _listener
+
+    stream_handler = logging.StreamHandler()
+    if config['LOG_FORMAT'] == 'json':
+        stream_handler.setFormatter(JSONFormatter())
+    else:
+        stream_handler.setFormatter(logging.Formatter(TEXT_FORMAT))
+
+    handler = DroppingQueueHandler(queue.Queue(config['LOG_QUEUE_SIZE']))
+    sample = parse_settings(config['LOG_SAMPLE'])
+    if sample:
+        handler.addFilter(SamplingFilter(
+            {name: float(rate) for name, rate in sample.items()}))
+
+    root = logging.getLogger()
+    if _handler is not None:
+        root.removeHandler(_handler)
+    if _listener is not None:
+        _listener.stop()
+    root.addHandler(handler)
+    root.setLevel(config['LOG_LEVEL'].upper())
+    for name, level in parse_settings(config['LOG_LEVELS']).items():
+        logging.getLogger(name).setLevel(level.upper())
+
+    if _listener is None:
+        atexit.register(_stop_listener)
+    _handler = handler
+    _listener = QueueListener(handler.queue, stream_handler)
+    _listener.start()
+
+
+def dropped_records():
+    """Get the number of records dropped because the queue was full."""
+    return _handler.dropped if _handler is not None else 0
+
+
+def _stop_listener():
+    if _listener is not None:
+        _listener.stop()
@@ -2,11 +2,21 @@ import asyncio
 import datetime
 import json
 import logging
-from collections import defaultdict
+import re
+from collections import deque
+from json.decoder import scanstring
+from json.encoder import encode_basestring_ascii
 
-from camus import db
-from camus.models import Client
-from camus.util import commit_database, get_ice_servers
+from camus import store
+from camus.history import History
+from camus.liveness import Liveness
+from camus.metrics import SIZE_BUCKETS, Histogram, metrics, timed
+from camus.presence import Presence
+from camus.roster import Rosters
+from camus.transport import LocalTransport
+from camus.util import Debouncer, get_ice_servers
+
+logger = logging.getLogger(__name__)
 
 
 class MessageHandler:
@@ -15,128 +25,275 @@ class MessageHandler:
     Messages are received via the inbox queue and sent via an outbox queue.
     Received messages are handled according to the destination and are either
     forwarded to another client, broadcast to a room, or processed locally.
+    Outgoing messages pass through a transport, which delivers them to the
+    outbox of this process or of another server process.
     """
 
-    def __init__(self):
+    # Types of messages which only the server may send to clients
+    SERVER_TYPES = {'history', 'room-info', 'member-joined', 'member-left',
+                    'member-updated'}
+
+    def __init__(self, transport=None):
         self._address = 'ground control'
         self.inbox = None
-        self.outbox = defaultdict(asyncio.Queue)
-        self._inbox_task = None
-
-    def start(self):
-        self.inbox = asyncio.Queue()
-        self._inbox_task = asyncio.create_task(self._process_inbox())
+        self.outbox = Outbox()
+        self.presence = Presence()
+        self.liveness = Liveness(self)
+        self.rosters = Rosters()
+        self.room_info = Debouncer(self._send_snapshot)
+        self.history = History()
+        self.transport = transport or LocalTransport()
+        self._inbox_tasks = []
+
+    def init_app(self, app):
+        """Configure the message handler for an application."""
+        self.outbox.maxsize = app.config['OUTBOX_SIZE']
+        self.outbox.policy = app.config['OUTBOX_POLICY']
+        self.liveness.ping_after = app.config['CLIENT_PING_AFTER']
+        self.liveness.reap_after = app.config['CLIENT_TIMEOUT']
+        self.room_info.window = app.config['ROOM_INFO_DEBOUNCE']
+        self.room_info.max_delay = app.config['ROOM_INFO_MAX_DELAY']
+        self.history.size = app.config['CHAT_HISTORY_SIZE']
+        self.history.max_bytes = app.config['CHAT_HISTORY_MAX_BYTES']
+        self.history.clear()
+        Message.codec = get_codec(app.config['JSON_CODEC'])
+
+    def start(self, workers=4, transport=None):
+        """Start processing the inbox with the given number of workers."""
+        if transport is not None:
+            self.transport = transport
+        self.transport.start(self._deliver, self._is_local)
+        if not isinstance(self.transport, LocalTransport):
+            # Other processes can change the rooms' membership
+            self.rosters.max_age = 5
+
+        self.inbox = Inbox(key=lambda item: self.presence.room_of(item[0]))
+        self._inbox_tasks = [asyncio.create_task(self._process_inbox())
+                             for _ in range(workers)]
+        self.liveness.start()
 
     def stop(self):
-        if self._inbox_task:
-            self._inbox_task.cancel()
+        for task in self._inbox_tasks:
+            task.cancel()
+        self._inbox_tasks = []
+        self.room_info.cancel()
+        self.liveness.stop()
+        self.transport.stop()
+
+    async def connect(self, client, deltas=False):
+        """Accept a connection from a client.
+
+        The client is first sent the room's recent chat history, if any. If
+        `deltas` is set, the client is sent membership changes as deltas
+        rather than room-info snapshots.
+
+        Returns the outbox queue for the client.
+        """
+        self.presence.register(client.uuid, client.room_id)
+        await self.presence.touch(client.uuid)
+        self.liveness.track(client.uuid)
+        outbox = self.outbox.open(client.uuid)
+        self.send_history(client.uuid, client.room_id)
+
+        roster = await self.rosters.get(client.room_id)
+        if roster is not None:
+            if deltas:
+                roster.subscribers.add(client.uuid)
+            await self._publish(client.room_id, roster,
+                                [roster.join(client.uuid, client.name)])
+
+        return outbox
+
+    def forget_client(self, client_uuid):
+        """Stop tracking the presence and liveness of a client."""
+        self.presence.forget_client(client_uuid)
+        self.liveness.forget(client_uuid)
 
     def send(self, message):
-        """Add a message to the outbox."""
-        receiver = message.receiver
-        data = message.json()
-        self.outbox[receiver].put_nowait(data)
-
-    def broadcast(self, room, message):
-        """Add a message to the outbox for every client in the given room."""
-        for client in room.clients:
-            msg = Message(message.json())
-            msg.receiver = client.uuid
-            self.send(msg)
+        """Send a message to its receiver."""
+        self.transport.send(message.receiver, message.json(), message.type)
+
+    def send_history(self, receiver, room_id):
+        """Send a room's chat history to a client as a single message.
+
+        The data is an array of the messages as they were broadcast, which is
+        spliced together from the stored frames rather than encoded again.
+        """
+        frames = self.history.get(room_id)
+        if frames:
+            data = ('{"sender": ' + encode_basestring_ascii(self._address)
+                    + ', "receiver": ' + encode_basestring_ascii(receiver)
+                    + ', "type": "history", "data": ['
+                    + ', '.join(frames) + ']}')
+            self.transport.send(receiver, data, 'history')
+
+    def broadcast(self, receivers, message):
+        """Send a message to each of the given receivers.
+
+        The message is encoded only once, regardless of the number of
+        receivers.
+        """
+        if metrics.enabled:
+            metrics.fanout.observe(len(receivers))
+        for receiver, data in message.json_for(receivers):
+            self.transport.send(receiver, data, message.type)
+
+    def collect_metrics(self):
+        """Get the current values of metrics for `metrics.render`."""
+        outbox = self.outbox.metrics()
+        outbox_depth = Histogram('camus_outbox_depth',
+                                 'Number of messages queued for each client',
+                                 SIZE_BUCKETS)
+        for depth in self.outbox.depths():
+            outbox_depth.observe(depth)
+
+        return [
+            ('camus_inbox_depth', 'gauge', 'Number of messages waiting to be '
+             'processed', self.inbox.qsize() if self.inbox else 0),
+            outbox_depth,
+            ('camus_outbox_dropped_total', 'counter', 'Number of queued '
+             'messages dropped because a queue was full', outbox['dropped']),
+            ('camus_outbox_undeliverable_total', 'counter', 'Number of '
+             'messages for clients which are not connected',
+             outbox['undeliverable']),
+            ('camus_outbox_evicted_total', 'counter', 'Number of clients '
+             'disconnected because their queue was full', outbox['evicted']),
+            ('camus_websockets', 'gauge', 'Number of connected websockets',
+             outbox['queues']),
+            ('camus_clients', 'gauge', 'Number of clients known to this '
+             'process', self.presence.client_count()),
+            ('camus_rooms', 'gauge', 'Number of active rooms known to this '
+             'process', self.presence.room_count()),
+            ('camus_room_info_saved_total', 'counter', 'Number of room-info '
+             'broadcasts saved by debouncing', self.room_info.saved),
+            ('camus_chat_history_bytes', 'gauge', 'Size of the chat history '
+             'kept for all rooms', self.history.bytes),
+            ('camus_chat_history_evicted_total', 'counter', 'Number of chat '
+             'messages evicted from the history to stay within its size',
+             self.history.evicted),
+        ]
+
+    def _deliver(self, receiver, data, kind=None):
+        """Add an encoded message to the outbox of a local client."""
+        self.outbox.put(receiver, data, kind)
+
+    def _is_local(self, receiver):
+        """Check whether a client is connected to this process."""
+        return receiver in self.outbox
 
     async def _process_inbox(self):
-        """Remove and process messages from the inbox."""
+        """Remove and process messages from the inbox.
+
+        Processing times are labelled with the message type, or with
+        ``other`` for types which are not part of the protocol, so that
+        clients cannot choose the labels.
+        """
+        # The protocol module imports this one
+        from camus.protocol import TYPE_CODES
 
         while True:
+            room_id, (client_uuid, data) = await self.inbox.get()
+            timer = timed(metrics.inbox_latency, 'other')
             try:
-                client_uuid, data = await self.inbox.get()
-                message = Message(data)
-                message.sender = client_uuid
-
-                # Update seen & active timestamps for client and room
-                client = Client.query.filter_by(uuid=client_uuid).first()
-                client.seen = client.room.active = datetime.datetime.utcnow()
-                commit_database()
+                with timer:
+                    type = await self._process_message(client_uuid, data)
+                    if isinstance(type, str) and type in TYPE_CODES:
+                        timer.label_value = type
+            except Exception as e:
+                logger.exception('Error processing inbox')
+            finally:
+                self.inbox.task_done(room_id)
 
-                # Message intended for the server
-                if message.receiver == self._address:
-                    self._handle_local_message(message)
+    async def _process_message(self, client_uuid, data):
+        """Route a message received from a client.
 
-                # Message to be sent to all clients in the room
-                elif message.receiver == 'room':
-                    self.broadcast(client.room, message)
+        Returns the type of the message.
+        """
 
-                # Message to another client
-                else:
-                    # TODO: validate receiver is in same room
-                    self.send(message)
+        message = Message(data)
+        message.sender = client_uuid
+
+        # Update seen & active timestamps for client and room
+        room_id = await self.presence.touch(client_uuid)
+        if room_id is None:
+            logger.warning('Message from unknown client %s', client_uuid)
+            return message.type
+
+        # Clients may not impersonate the server to each other
+        if (message.receiver != self._address
+                and message.type in self.SERVER_TYPES):
+            logger.warning('Dropping %s message from client %s', message.type,
+                           client_uuid)
+            return message.type
+
+        # Message intended for the server
+        if message.receiver == self._address:
+            await self._handle_local_message(message, room_id)
+
+        # Message to be sent to all clients in the room
+        elif message.receiver == 'room':
+            roster = await self.rosters.get(room_id)
+            if roster is not None:
+                self.broadcast(list(roster.members), message)
+            if message.type == 'text':
+                self.history.append(room_id, message.json())
+
+        # Message to another client
+        else:
+            # TODO: validate receiver is in same room
+            self.send(message)
 
-            except Exception as e:
-                logging.exception('Error processing inbox')
+        return message.type
 
-    def _handle_local_message(self, message):
+    async def _handle_local_message(self, message, room_id):
         """Handle a message according to its type."""
 
         reply = Message()
         reply.sender = self._address
         reply.receiver = message.sender
+        logger.debug('Received %s from client %s', message.type,
+                     message.sender)
 
         if message.type == 'ping':
             reply.type = 'pong'
             reply.data = message.data
-            logging.info('got ping')
 
         elif message.type == 'pong':
-            logging.info('Got pong {} from client {}'.format(message.data, message.sender))
             reply = None
 
         elif message.type == 'profile':
-            logging.info('got profile')
-            client = Client.query.filter_by(uuid=message.sender).first()
-
             username = message.data.get('username')
             if username:
-                client.name = username
-                commit_database()
-
-            reply.type = 'room-info'
-            reply.data = self._room_info(client.room)
-            self.broadcast(client.room, reply)
+                await store.rename_client(message.sender, username)
+                await self.update_member(room_id, message.sender, username)
+            else:
+                await self.broadcast_room_info(room_id)
             reply = None
 
         elif message.type == 'get-room-info':
-            logging.info('got get-room-info')
-            client = Client.query.filter_by(uuid=message.sender).first()
+            roster = await self.rosters.get(room_id)
             reply.type = 'room-info'
-            reply.data = self._room_info(client.room)
+            reply.data = roster.snapshot() if roster else None
 
         elif message.type == 'get-ice-servers':
-            logging.info('got get-ice-servers')
             reply.type = 'ice-servers'
-            reply.data = get_ice_servers(message.sender)
-            logging.info('\t-> Done getting ice servers: {}'.format(reply.data))
+            reply.data = await get_ice_servers(message.sender)
 
         elif message.type == 'greeting':
-            logging.info('Greeting received from client {}: {}'.format(message.sender, message.data))
+            logger.debug('Greeting from client %s: %s', message.sender,
+                         message.data)
             reply = None
 
         elif message.type == 'bye':
-            logging.info('got bye')
-
-            client = Client.query.filter_by(uuid=message.sender).first()
-            room = client.room
-
             # Delete client object from db
-            db.session.delete(client)
-            commit_database()
+            await store.delete_client(message.sender)
 
-            # Remove message queues associated with the client
-            self.outbox.pop(client.uuid, None)
+            # Remove message queues and presence associated with the client
+            self.outbox.pop(message.sender, None)
+            self.forget_client(message.sender)
 
-            # Broadcast updated room info to remaining clients
-            reply.type = 'room-info'
-            reply.data = self._room_info(room)
-            self.broadcast(client.room, reply)
+            # Let the remaining clients know
+            await self.remove_members(room_id, [message.sender])
             reply = None
 
         else:
@@ -146,17 +303,6 @@ class MessageHandler:
         if reply:
             self.send(reply)
 
-    def _room_info(self, room):
-        """
-        Get information about the room, consisting of the room ID and a list of
-        connected clients.
-        """
-
-        clients = [{'id': client.uuid, 'username': client.name}
-                   for client in room.clients]
-
-        return {'room_id': room.slug, 'clients': clients}
-
     def send_ping(self, receiver):
         """Send a ping message to the given receiver."""
         ping = Message()
@@ -175,31 +321,535 @@ class MessageHandler:
         bye.data = datetime.datetime.utcnow().timestamp()
         self.send(bye)
 
-    def broadcast_room_info(self, room):
-        """Send a room-info message to clients in the given room."""
+    async def broadcast_room_info(self, room_id):
+        """Send a room-info snapshot to the clients in the given room.
+
+        Clients which receive deltas are not sent the snapshot.
+        """
+        roster = await self.rosters.get(room_id)
+        if roster is not None:
+            await self._publish(room_id, roster, [], snapshot=True)
+
+    async def update_member(self, room_id, client_uuid, username):
+        """Change the username of a client in a room and tell the room."""
+        roster = await self.rosters.get(room_id)
+        if roster is not None:
+            await self._publish(room_id, roster,
+                                [roster.update(client_uuid, username)],
+                                snapshot=True)
+
+    async def remove_members(self, room_id, client_uuids):
+        """Remove clients from a room and tell the remaining clients."""
+        roster = await self.rosters.get(room_id)
+        if roster is not None:
+            await self._publish(room_id, roster,
+                                [roster.leave(client_uuid)
+                                 for client_uuid in client_uuids],
+                                snapshot=True)
+
+    async def _publish(self, room_id, roster, deltas, snapshot=False):
+        """Send changes to a room's membership to its clients.
+
+        Clients which asked for deltas are sent each change. If `snapshot` is
+        set, other clients are sent a room-info snapshot. Snapshots are
+        debounced, so a burst of changes results in a single snapshot.
+        """
+        subscribers = [client_uuid for client_uuid in roster.members
+                       if client_uuid in roster.subscribers]
+
+        for delta in deltas:
+            if delta is None or not subscribers:
+                continue
+            message = Message()
+            message.sender = self._address
+            message.type, message.data = delta
+            self.broadcast(subscribers, message)
+
+        if snapshot and len(subscribers) < len(roster.members):
+            await self.room_info.call(room_id)
+
+    async def _send_snapshot(self, room_id):
+        """Send a room-info snapshot to the clients which do not get deltas."""
+        roster = await self.rosters.get(room_id)
+        if roster is None:
+            return
+
         info = Message()
         info.type = 'room-info'
         info.sender = self._address
-        info.data = self._room_info(room)
-        self.broadcast(room, info)
+        info.data = roster.snapshot()
+        self.broadcast([client_uuid for client_uuid in roster.members
+                        if client_uuid not in roster.subscribers], info)
+
+
+class Inbox:
+    """A queue of received messages, partitioned by room.
+
+    Messages are kept in a separate queue for each room. A room is handed to
+    at most one consumer at a time, so messages within a room (and therefore
+    from each sender) are processed in order, while messages for different
+    rooms can be processed concurrently by several consumers. Rooms with
+    pending messages are served in round-robin order.
+    """
+
+    def __init__(self, key):
+        self._key = key
+        self._queues = {}
+        self._ready = asyncio.Queue()
+
+    def put_nowait(self, item):
+        """Add an item to the queue for its room."""
+        key = self._key(item)
+        queue = self._queues.get(key)
+        if queue is None:
+            queue = self._queues[key] = deque()
+            self._ready.put_nowait(key)
+        queue.append(item)
+
+    async def put(self, item):
+        self.put_nowait(item)
+
+    async def get(self):
+        """Remove and return a (key, item) pair from the next ready room.
+
+        The room is not handed to another consumer until `task_done()` is
+        called for it.
+        """
+        key = await self._ready.get()
+        return key, self._queues[key].popleft()
+
+    def task_done(self, key):
+        """Indicate that processing of an item from the given room is done."""
+        if self._queues[key]:
+            self._ready.put_nowait(key)
+        else:
+            del self._queues[key]
+
+    def qsize(self):
+        """The total number of items waiting in all rooms."""
+        return sum(len(queue) for queue in self._queues.values())
+
+
+class OutboxClosed(Exception):
+    """Raised when reading from a client queue which has been closed."""
+
+
+class ClientQueue:
+    """A bounded queue of encoded messages for a single client.
+
+    When the queue is full, the policy determines what happens to a new
+    message:
+
+    - ``drop-oldest``: the oldest queued message is dropped
+    - ``coalesce``: like ``drop-oldest``, but queued messages which are
+      superseded by the new message (such as an older ``room-info``) are
+      always dropped first, even if the queue is not full
+    - ``disconnect``: the queue is closed and the client should be
+      disconnected. `overflowed` is set to tell this apart from a queue
+      which was closed because the client left.
+    """
+
+    COALESCE_KINDS = {'room-info'}
+
+    def __init__(self, maxsize=0, policy='drop-oldest'):
+        self.maxsize = maxsize
+        self.policy = policy
+        self.closed = False
+        self.overflowed = False
+        self.dropped = 0
+        self._items = deque()
+        self._not_empty = asyncio.Event()
+
+    def put_nowait(self, data, kind=None):
+        """Add a message to the queue.
+
+        Returns True if the message was queued, False if it was dropped.
+        """
+        if self.closed:
+            self.dropped += 1
+            return False
+
+        if self.policy == 'coalesce' and kind in self.COALESCE_KINDS:
+            items = [item for item in self._items if item[0] != kind]
+            self.dropped += len(self._items) - len(items)
+            self._items = deque(items)
+
+        if self.maxsize and len(self._items) >= self.maxsize:
+            if self.policy == 'disconnect':
+                self.overflowed = True
+                self.close()
+                self.dropped += 1
+                return False
+
+            self._items.popleft()
+            self.dropped += 1
+
+        self._items.append((kind, data))
+        self._not_empty.set()
+        return True
+
+    async def get(self):
+        """Remove and return a message, waiting until one is available.
+
+        Raises OutboxClosed if the queue has been closed.
+        """
+        while not self._items:
+            if self.closed:
+                raise OutboxClosed()
+            self._not_empty.clear()
+            await self._not_empty.wait()
+
+        return self._items.popleft()[1]
+
+    def get_nowait(self):
+        if not self._items:
+            raise asyncio.QueueEmpty()
+        return self._items.popleft()[1]
+
+    def qsize(self):
+        return len(self._items)
+
+    def empty(self):
+        return not self._items
+
+    def close(self, discard=True):
+        """Close the queue.
+
+        Queued messages are discarded, unless `discard` is false, in which
+        case they can still be read before OutboxClosed is raised.
+        """
+        self.closed = True
+        if discard:
+            self.dropped += len(self._items)
+            self._items.clear()
+        self._not_empty.set()
+
+
+class Outbox:
+    """Bounded message queues for the clients connected to this process.
+
+    A queue is opened when a client connects. Messages for clients without an
+    open queue are counted as undeliverable and discarded, so arbitrary
+    receivers cannot create queues. Clients whose queue is closed by the
+    ``disconnect`` policy are evicted.
+    """
+
+    def __init__(self, maxsize=256, policy='drop-oldest'):
+        self.maxsize = maxsize
+        self.policy = policy
+        self.undeliverable = 0
+        self.evicted = 0
+        self._dropped = 0
+        self._queues = {}
+
+    def open(self, receiver):
+        """Get the queue for a client, creating it if necessary."""
+        queue = self._queues.get(receiver)
+        if queue is None or queue.closed:
+            queue = self._queues[receiver] = ClientQueue(
+                self.maxsize, self.policy)
+        return queue
+
+    def pop(self, receiver, default=None, discard=True):
+        """Close and remove the queue for a client.
+
+        If `discard` is false, the messages already queued are still sent.
+        """
+        queue = self._queues.pop(receiver, None)
+        if queue is None:
+            return default
+
+        queue.close(discard)
+        self._dropped += queue.dropped
+        return queue
+
+    def discard(self, receiver, queue):
+        """Close and remove a client's queue, unless it has been replaced."""
+        if self._queues.get(receiver) is queue:
+            self.pop(receiver)
+        else:
+            queue.close()
+
+    def put(self, receiver, data, kind=None):
+        """Add a message to a client's queue.
+
+        Returns True if the message was queued, False otherwise.
+        """
+        queue = self._queues.get(receiver)
+        if queue is None:
+            self.undeliverable += 1
+            return False
+
+        queued = queue.put_nowait(data, kind)
+        if queue.closed:
+            logger.warning('Evicting slow client %s', receiver)
+            self.evicted += 1
+            self.pop(receiver)
+
+        return queued
+
+    def depths(self):
+        """Get the number of messages in each client's queue."""
+        return [queue.qsize() for queue in self._queues.values()]
+
+    def metrics(self):
+        """Get queue depth and drop counts."""
+        depths = self.depths()
+        return {
+            'queues': len(depths),
+            'depth_total': sum(depths),
+            'depth_max': max(depths, default=0),
+            'dropped': self._dropped + sum(
+                queue.dropped for queue in self._queues.values()),
+            'undeliverable': self.undeliverable,
+            'evicted': self.evicted,
+        }
+
+    def __getitem__(self, receiver):
+        return self._queues[receiver]
+
+    def __contains__(self, receiver):
+        return receiver in self._queues
+
+
+class JSONCodec:
+    """Encodes and decodes JSON using the standard library.
+
+    Subclasses use an accelerated JSON library instead. All codecs decode
+    both str and bytes, and can encode to either.
+    """
+
+    name = 'json'
+
+    def loads(self, data):
+        return json.loads(data)
+
+    def dumps(self, obj):
+        """Encode an object as a JSON str."""
+        return json.dumps(obj)
+
+    def dumpb(self, obj):
+        """Encode an object as UTF-8 encoded JSON bytes."""
+        return json.dumps(obj).encode('utf-8')
+
+
+class OrjsonCodec(JSONCodec):
+    """Encodes and decodes JSON using orjson."""
+
+    name = 'orjson'
+
+    def __init__(self):
+        import orjson
+        self._orjson = orjson
+
+    def loads(self, data):
+        return self._orjson.loads(data)
+
+    def dumps(self, obj):
+        return self.dumpb(obj).decode('utf-8')
+
+    def dumpb(self, obj):
+        try:
+            return self._orjson.dumps(obj)
+        except TypeError:
+            # orjson does not support some types, such as integers larger
+            # than 64 bits or dicts with non-str keys
+            return super().dumpb(obj)
+
+
+class UjsonCodec(JSONCodec):
+    """Encodes and decodes JSON using ujson."""
+
+    name = 'ujson'
+
+    def __init__(self):
+        import ujson
+        self._ujson = ujson
+
+    def loads(self, data):
+        return self._ujson.loads(data)
+
+    def dumps(self, obj):
+        return self._ujson.dumps(obj, escape_forward_slashes=False)
+
+    def dumpb(self, obj):
+        return self.dumps(obj).encode('utf-8')
+
+
+# In order of preference
+CODECS = {codec.name: codec for codec in (OrjsonCodec, UjsonCodec, JSONCodec)}
+
+
+def get_codec(name=None):
+    """Get a JSON codec by name.
+
+    If no name is given, the first of orjson, ujson or the standard library
+    which is installed is used.
+    """
+    if name is None:
+        for codec in CODECS.values():
+            try:
+                return codec()
+            except ImportError:
+                pass
+
+    try:
+        return CODECS[name]()
+    except KeyError:
+        raise ValueError('Unknown JSON codec: {}'.format(name))
 
 
 class Message:
-    """A structured message that can be sent to a client."""
+    """A structured message that can be sent to a client.
+
+    When a message is decoded from JSON only its envelope (sender, receiver
+    and type) is kept in decoded form. The data is kept as it was encoded
+    until it is first accessed, so a message relayed from one client to
+    another is forwarded with its data as it was received, without building
+    and re-encoding Python objects for it.
+
+    Data which is accessed or set is decoded and encoded by `codec`.
+    """
+
+    __slots__ = ('sender', 'receiver', 'type', '_data', '_raw_data')
+
+    codec = get_codec()
 
     def __init__(self, message=None):
+        self._data = None
+        self._raw_data = None
+
+        if isinstance(message, bytes):
+            message = message.decode('utf-8')
         if isinstance(message, str):
-            _json = json.loads(message)
+            _json, self._raw_data = split_envelope(message, self.codec.loads)
         elif message is None:
             _json = {}
         else:
             _json = message
+            self._data = _json.get('data')
 
         self.sender = _json.get('sender')
         self.receiver = _json.get('receiver')
         self.type = _json.get('type')
-        self.data = _json.get('data')
+
+    @property
+    def data(self):
+        if self._raw_data is not None:
+            self._data = self.codec.loads(self._raw_data)
+            self._raw_data = None
+        return self._data
+
+    @data.setter
+    def data(self, value):
+        self._data = value
+        self._raw_data = None
+
+    def _encoded_data(self):
+        if self._raw_data is not None:
+            return self._raw_data
+        return self.codec.dumps(self._data)
 
     def json(self):
         """Get the JSON-encoded representation of the message."""
-        return json.dumps(self.__dict__)
+        return ('{"sender": ' + self._encode(self.sender)
+                + ', "receiver": ' + self._encode(self.receiver)
+                + ', "type": ' + self._encode(self.type)
+                + ', "data": ' + self._encoded_data() + '}')
+
+    def json_for(self, receivers):
+        """Get the JSON-encoded message for each of the given receivers.
+
+        Yields (receiver, json) pairs. The sender, type and data are encoded
+        once and the receiver is spliced into the encoded message for each
+        receiver.
+        """
+        body = ('"sender": ' + self._encode(self.sender)
+                + ', "type": ' + self._encode(self.type)
+                + ', "data": ' + self._encoded_data() + '}')
+
+        for receiver in receivers:
+            yield receiver, '{"receiver": ' + self._encode(receiver) + ', ' + body
+
+    def _encode(self, value):
+        if type(value) is str:
+            return encode_basestring_ascii(value)
+        return self.codec.dumps(value)
+
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+# The layout of messages sent by the browser client, with strings that do not
+# need unescaping
+_ENVELOPE = re.compile(
+    r'{0}\{{{0}"receiver"{0}:{0}"([^"\\]*)"{0},{0}"type"{0}:{0}"([^"\\]*)"'
+    r'{0},{0}"data"{0}:{0}'.format(r'[ \t\n\r]*'))
+_scan_value = json.JSONDecoder().scan_once
+
+
+def split_envelope(text, loads=json.loads):
+    """Split a JSON-encoded message into its envelope and its data.
+
+    Returns a dict of the top-level fields other than "data", and the data
+    exactly as it was encoded (or None if there is no data). The data is
+    checked to be valid JSON, but is not kept in decoded form. Messages laid
+    out like those of the browser client are checked using `loads`.
+
+    Raises ValueError if the text is not a JSON object.
+    """
+    match = _ENVELOPE.match(text)
+    if match is not None:
+        end = len(text.rstrip(' \t\n\r')) - 1
+        if text[end] == '}':
+            raw_data = text[match.end():end]
+            try:
+                loads(raw_data)
+            except ValueError:
+                # The data may be followed by other fields
+                pass
+            else:
+                return ({'receiver': match.group(1), 'type': match.group(2)},
+                        raw_data)
+
+    fields = {}
+    raw_data = None
+
+    pos = _WHITESPACE.match(text).end()
+    if text[pos:pos + 1] != '{':
+        raise ValueError('Message is not a JSON object')
+    pos = _WHITESPACE.match(text, pos + 1).end()
+
+    if text[pos:pos + 1] == '}':
+        pos += 1
+    else:
+        while True:
+            if text[pos:pos + 1] != '"':
+                raise ValueError('Expected a key at position {}'.format(pos))
+            key, pos = scanstring(text, pos + 1)
+
+            pos = _WHITESPACE.match(text, pos).end()
+            if text[pos:pos + 1] != ':':
+                raise ValueError('Expected ":" at position {}'.format(pos))
+            start = _WHITESPACE.match(text, pos + 1).end()
+            try:
+                value, pos = _scan_value(text, start)
+            except StopIteration:
+                raise ValueError('Expected a value at position {}'.format(start))
+
+            if key == 'data':
+                raw_data = text[start:pos]
+            else:
+                fields[key] = value
+
+            pos = _WHITESPACE.match(text, pos).end()
+            char = text[pos:pos + 1]
+            pos = _WHITESPACE.match(text, pos + 1).end()
+            if char == '}':
+                break
+            if char != ',':
+                raise ValueError('Expected "," or "}}" at position {}'.format(pos))
+
+    if pos != len(text):
+        raise ValueError('Extra data at position {}'.format(pos))
+
+    return fields, raw_data
+
@@ -0,0 +1,153 @@
+"""Metrics describing the server's internals, in the Prometheus text format.
+
+Metrics are disabled by default. When they are disabled, instrumented code
+checks `metrics.enabled` and does nothing else, so there is no measurable
+overhead. Counts and sizes which the server already keeps (such as queue
+depths) are read when the metrics are scraped, rather than recorded as they
+change.
+"""
+
+import time
+from bisect import bisect_left
+
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1,
+                   0.25, 0.5, 1, 2.5, 5, 10)
+SIZE_BUCKETS = (0, 1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024)
+
+
+class Histogram:
+    """Counts observations in buckets, optionally for each value of a label.
+
+    To bound memory use, no more than `max_series` label values are kept;
+    further values are counted as ``other``.
+    """
+
+    def __init__(self, name, help, buckets, label=None, max_series=64):
+        self.name = name
+        self.help = help
+        self.buckets = tuple(buckets)
+        self.label = label
+        self.max_series = max_series
+        self._series = {}
+
+    def observe(self, value, label_value=None):
+        series = self._series.get(label_value)
+        if series is None:
+            if len(self._series) >= self.max_series:
+                label_value = 'other'
+                series = self._series.get(label_value)
+            if series is None:
+                series = self._series[label_value] = [
+                    [0] * (len(self.buckets) + 1), 0]
+
+        series[0][bisect_left(self.buckets, value)] += 1
+        series[1] += value
+
+    def render(self):
+        lines = ['# HELP {} {}'.format(self.name, self.help),
+                 '# TYPE {} histogram'.format(self.name)]
+        for label_value, (counts, total) in sorted(
+                self._series.items(), key=lambda item: str(item[0])):
+            labels = ('{}="{}",'.format(self.label, _escape(label_value))
+                      if self.label else '')
+            cumulative = 0
+            for bound, count in zip(self.buckets + ('+Inf',), counts):
+                cumulative += count
+                lines.append('{}_bucket{{{}le="{}"}} {}'.format(
+                    self.name, labels, bound, cumulative))
+            labels = '{' + labels.rstrip(',') + '}' if labels else ''
+            lines.append('{}_sum{} {}'.format(self.name, labels, total))
+            lines.append('{}_count{} {}'.format(self.name, labels, cumulative))
+        return lines
+
+
+class Metrics:
+    """The metrics recorded by the server.
+
+    Histograms are recorded by the instrumented code. Other values are
+    collected when the metrics are rendered, and are passed to `render` as
+    histograms or as (name, type, help, value) tuples, where the value is a
+    number or a (label, {label value: number}) pair.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.inbox_latency = Histogram(
+            'camus_inbox_latency_seconds',
+            'Time taken to process a received message', LATENCY_BUCKETS,
+            label='type')
+        self.fanout = Histogram(
+            'camus_broadcast_fanout', 'Number of receivers of a broadcast',
+            SIZE_BUCKETS)
+        self.store_latency = Histogram(
+            'camus_store_latency_seconds',
+            'Time taken to run and commit a database transaction',
+            LATENCY_BUCKETS)
+        self.ice_fetch_latency = Histogram(
+            'camus_ice_fetch_latency_seconds',
+            'Time taken to fetch ICE servers from Twilio', LATENCY_BUCKETS)
+        self.task_duration = Histogram(
+            'camus_task_duration_seconds',
+            'Time taken by periodic tasks, such as the reapers',
+            LATENCY_BUCKETS, label='task')
+
+    def init_app(self, app):
+        self.enabled = app.config['METRICS_ENABLED']
+
+    def render(self, collected=()):
+        """Get the recorded and collected metrics in the Prometheus text
+        format.
+        """
+        lines = []
+        for histogram in (self.inbox_latency, self.fanout, self.store_latency,
+                          self.ice_fetch_latency, self.task_duration):
+            lines += histogram.render()
+
+        for item in collected:
+            if isinstance(item, Histogram):
+                lines += item.render()
+            else:
+                lines += _render_value(*item)
+
+        return '\n'.join(lines) + '\n'
+
+
+def _render_value(name, type, help, value):
+    lines = ['# HELP {} {}'.format(name, help),
+             '# TYPE {} {}'.format(name, type)]
+    if isinstance(value, tuple):
+        label, values = value
+        lines += ['{}{{{}="{}"}} {}'.format(name, label, _escape(key), v)
+                  for key, v in sorted(values.items())]
+    else:
+        lines.append('{} {}'.format(name, value))
+    return lines
+
+
+def _escape(value):
+    return (str(value).replace('\\', r'\\').replace('"', r'\"')
+            .replace('\n', r'\n'))
+
+
+class timed:
+    """Context manager which records its duration in a histogram, if metrics
+    are enabled.
+    """
+
+    __slots__ = ('histogram', 'label_value', 'start')
+
+    def __init__(self, histogram, label_value=None):
+        self.histogram = histogram
+        self.label_value = label_value
+
+    def __enter__(self):
+        self.start = time.perf_counter() if metrics.enabled else None
+        return self
+
+    def __exit__(self, *exc_info):
+        if self.start is not None:
+            self.histogram.observe(time.perf_counter() - self.start,
+                                   self.label_value)
+
+
+metrics = Metrics()
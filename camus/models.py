@@ -1,7 +1,10 @@
+import sqlite3
 import uuid
 from datetime import datetime
 
 from slugify import slugify
+from sqlalchemy import false
+from sqlalchemy.engine import Engine
 
 from werkzeug.security import generate_password_hash, check_password_hash
 
@@ -11,15 +14,25 @@ from camus import db
 class Room(db.Model):
     __tablename__ = 'rooms'
     id = db.Column(db.Integer, primary_key=True)
-    name = db.Column(db.String(64), index=True, unique=True)
-    slug = db.Column(db.String(64), index=True, unique=True)
+    name = db.Column(db.String(64), index=True, unique=True, nullable=False)
+    slug = db.Column(db.String(64), index=True, unique=True, nullable=False)
     password_hash = db.Column(db.String(128))
     guest_limit = db.Column(db.Integer, default=100)
-    is_public = db.Column(db.Boolean, default=False)
+    client_count = db.Column(db.Integer, nullable=False, default=0,
+                             server_default='0')
+    is_public = db.Column(db.Boolean, nullable=False, default=False,
+                          server_default=false())
     created = db.Column(db.DateTime, default=datetime.utcnow)
-    active = db.Column(db.DateTime, default=datetime.utcnow, index=True)
+    active = db.Column(db.DateTime, nullable=False, default=datetime.utcnow,
+                       index=True)
 
-    clients = db.relationship('Client', backref='room')
+    # Clients are deleted by the database when their room is deleted
+    clients = db.relationship('Client', backref='room', passive_deletes=True)
+
+    __table_args__ = (
+        # Listing the public rooms by activity
+        db.Index('ix_rooms_is_public_active', 'is_public', 'active'),
+    )
 
     def __repr__(self):
         return '<Room {}>'.format(self.name)
@@ -32,21 +45,29 @@ class Room(db.Model):
         self.password_hash = generate_password_hash(password)
 
     def authenticate(self, password=None):
-        """Attempt to authenticate access to the room."""
+        """Attempt to authenticate access to the room.
+
+        This hashes the password in the calling thread; the routes use
+        `camus.passwords` instead, which does not block the event loop.
+        """
 
         if ((password is None and self.password_hash is None)
                 or (password and check_password_hash(self.password_hash, password))):
-            return Client(uuid=uuid.uuid4().hex, room=self)
+            return self.new_client()
 
         return None
 
+    def new_client(self):
+        """Create a client which has been granted access to the room."""
+        return Client(uuid=uuid.uuid4().hex, room_id=self.id)
+
 
     def is_full(self):
         """Check whether the room's guest limit has been reached.
 
         Returns True if the guest limit has been reached, False otherwise.
         """
-        return self.guest_limit and len(self.clients) >= self.guest_limit
+        return bool(self.guest_limit) and self.client_count >= self.guest_limit
 
     def active_ago(self):
         """The number of minutes ago that the room was last active."""
@@ -57,11 +78,49 @@ class Room(db.Model):
 class Client(db.Model):
     __tablename__ = 'clients'
     id = db.Column(db.Integer, primary_key=True)
-    name = db.Column(db.String(64), default='Major Tom')
-    uuid = db.Column(db.String(32), unique=True, default=uuid.uuid4().hex)
-    seen = db.Column(db.DateTime, default=datetime.utcnow, index=True)
+    name = db.Column(db.String(64), nullable=False, default='Major Tom')
+    uuid = db.Column(db.String(32), unique=True, nullable=False,
+                     default=lambda: uuid.uuid4().hex)
+    seen = db.Column(db.DateTime, nullable=False, default=datetime.utcnow,
+                     index=True)
 
-    room_id = db.Column(db.Integer, db.ForeignKey('rooms.id'))
+    room_id = db.Column(db.Integer, db.ForeignKey(
+        'rooms.id', name='fk_clients_room_id_rooms', ondelete='CASCADE'))
+
+    __table_args__ = (
+        # Loading and reaping the clients of a room
+        db.Index('ix_clients_room_id_seen', 'room_id', 'seen'),
+    )
 
     def __repr__(self):
         return '<Client {}>'.format(self.uuid)
+
+
+@db.event.listens_for(Engine, 'connect')
+def _enable_sqlite_foreign_keys(dbapi_connection, connection_record):
+    # SQLite only enforces foreign keys, and cascades deletes, when asked to
+    if isinstance(dbapi_connection, sqlite3.Connection):
+        cursor = dbapi_connection.cursor()
+        cursor.execute('PRAGMA foreign_keys=ON')
+        cursor.close()
+
+
+def _change_client_count(connection, room_id, change):
+    rooms = Room.__table__
+    connection.execute(rooms.update()
+                       .where(rooms.c.id == room_id)
+                       .values(client_count=rooms.c.client_count + change))
+
+
+# Keep Room.client_count up to date as clients are added and removed. Bulk
+# deletes bypass these events, and must update the count themselves.
+@db.event.listens_for(Client, 'after_insert')
+def _client_inserted(mapper, connection, client):
+    if client.room_id is not None:
+        _change_client_count(connection, client.room_id, 1)
+
+
+@db.event.listens_for(Client, 'after_delete')
+def _client_deleted(mapper, connection, client):
+    if client.room_id is not None:
+        _change_client_count(connection, client.room_id, -1)
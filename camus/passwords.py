@@ -0,0 +1,59 @@
+import asyncio
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+
+from werkzeug.security import check_password_hash, generate_password_hash
+
+
+class PasswordHasher:
+    """Hashes and checks room passwords without blocking the event loop.
+
+    Password hashing is deliberately slow, so it is run in a small dedicated
+    pool of threads. hashlib releases the GIL while it computes PBKDF2, so the
+    threads run in parallel with the event loop. The size of the pool bounds
+    the CPU time which can be spent on hashing at once; further requests wait
+    for a free thread.
+    """
+
+    def __init__(self, method='pbkdf2:sha256', salt_length=8, threads=2):
+        self.method = method
+        self.salt_length = salt_length
+        self._threads = threads
+        self._executor = None
+
+    def init_app(self, app):
+        self.method = app.config['PASSWORD_HASH_METHOD']
+        self.salt_length = app.config['PASSWORD_SALT_LENGTH']
+        self._threads = app.config['PASSWORD_HASH_THREADS']
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+        self._executor = None
+
+    async def generate(self, password):
+        """Get a salted hash of a password."""
+        return await self._run(generate_password_hash, password, self.method,
+                               self.salt_length)
+
+    async def check(self, password_hash, password):
+        """Check a password against a hash from `generate`."""
+        if not password_hash or not password:
+            return False
+        return await self._run(check_password_hash, password_hash, password)
+
+    async def _run(self, func, *args):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._threads, thread_name_prefix='camus-hash')
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
+
+def fingerprint(password_hash):
+    """Get a short digest identifying a password hash.
+
+    The fingerprint is stored in a client's session once it has entered a
+    room's password, so that it is not asked for (and the password is not
+    hashed) again. Changing the password invalidates the fingerprint.
+    """
+    return hashlib.sha256(password_hash.encode()).hexdigest()[:16]
@@ -0,0 +1,133 @@
+import datetime
+import logging
+
+from camus import store
+
+logger = logging.getLogger(__name__)
+
+
+class Presence:
+    """Tracks when clients and rooms were last active.
+
+    Activity is recorded in memory as messages arrive, so handling a message
+    does not require a database write. Timestamps which have changed since the
+    last flush are written to the database in batches by calling `flush()`.
+    """
+
+    def __init__(self):
+        self._client_seen = {}
+        self._client_room = {}
+        self._room_active = {}
+        self._dirty_clients = set()
+        self._dirty_rooms = set()
+
+    async def touch(self, client_uuid, now=None):
+        """Record activity for a client and its room.
+
+        Returns the ID of the client's room, or None if the client does not
+        exist.
+        """
+        room_id = self.room_of(client_uuid)
+        if room_id is None:
+            client = await store.get_client(client_uuid, cached=True)
+            if client is None or client.room_id is None:
+                return None
+            room_id = self.register(client_uuid, client.room_id)
+
+        now = now or datetime.datetime.utcnow()
+        self._client_seen[client_uuid] = now
+        self._room_active[room_id] = now
+        self._dirty_clients.add(client_uuid)
+        self._dirty_rooms.add(room_id)
+
+        return room_id
+
+    def register(self, client_uuid, room_id):
+        """Record the room that a client belongs to."""
+        self._client_room[client_uuid] = room_id
+        return room_id
+
+    def room_of(self, client_uuid):
+        """Get the ID of the room that a client belongs to, if known."""
+        return self._client_room.get(client_uuid)
+
+    def client_seen(self, client_uuid):
+        """Get the time that a client was last seen, if known in memory."""
+        return self._client_seen.get(client_uuid)
+
+    def room_active(self, room_id):
+        """Get the time that a room was last active, if known in memory."""
+        return self._room_active.get(room_id)
+
+    def client_count(self):
+        """Get the number of clients being tracked."""
+        return len(self._client_room)
+
+    def room_count(self):
+        """Get the number of rooms being tracked."""
+        return len(self._room_active)
+
+    def forget_client(self, client_uuid):
+        """Stop tracking a client which has been removed."""
+        self._client_seen.pop(client_uuid, None)
+        self._client_room.pop(client_uuid, None)
+        self._dirty_clients.discard(client_uuid)
+
+    def forget_room(self, room_id):
+        """Stop tracking a room which has been removed."""
+        self.forget_rooms([room_id])
+
+    def forget_rooms(self, room_ids):
+        """Stop tracking a set of rooms which have been removed."""
+        room_ids = set(room_ids)
+        for room_id in room_ids:
+            self._room_active.pop(room_id, None)
+            self._dirty_rooms.discard(room_id)
+
+        for client_uuid, client_room in list(self._client_room.items()):
+            if client_room in room_ids:
+                self.forget_client(client_uuid)
+
+    async def stale_clients(self, cutoff):
+        """Get all clients which have not been seen since the cutoff time."""
+        clients = await store.clients_seen_before(cutoff)
+        return [client for client in clients
+                if self._client_seen.get(client.uuid, client.seen) < cutoff]
+
+    async def stale_rooms(self, cutoff):
+        """Get all rooms which have not been active since the cutoff time."""
+        rooms = await store.rooms_active_before(cutoff)
+        return [room for room in rooms
+                if self._room_active.get(room.id, room.active) < cutoff]
+
+    async def flush(self):
+        """Write pending activity timestamps to the database.
+
+        Returns True if the write succeeded (or there was nothing to write),
+        False otherwise. Pending timestamps are kept on failure so that they
+        are retried on the next flush.
+        """
+        if not (self._dirty_clients or self._dirty_rooms):
+            return True
+
+        clients = {uuid: self._client_seen[uuid]
+                   for uuid in self._dirty_clients}
+        rooms = {room_id: self._room_active[room_id]
+                 for room_id in self._dirty_rooms}
+        self._dirty_clients = set()
+        self._dirty_rooms = set()
+
+        try:
+            await store.update_activity(clients, rooms)
+        except Exception:
+            logger.exception('Exception during database commit.')
+            # Retry on the next flush
+            self._dirty_clients.update(
+                uuid for uuid in clients if uuid in self._client_seen)
+            self._dirty_rooms.update(
+                room_id for room_id in rooms if room_id in self._room_active)
+            return False
+
+        logger.debug('Flushed presence for %d clients and %d rooms',
+                     len(clients), len(rooms))
+        return True
@@ -0,0 +1,272 @@
+"""Wire protocols for the room websocket.
+
+Messages are passed between the server's components as JSON frames, which are
+sent to clients as they are using the default protocol. Clients can instead
+request the compact ``camus.msgpack`` protocol as a websocket subprotocol, in
+which case frames are translated to and from MessagePack as they pass through
+the websocket. Either protocol can be requested with options for batching and
+compressing frames.
+"""
+
+import logging
+import zlib
+
+from camus.message_handler import Message
+
+logger = logging.getLogger(__name__)
+
+# Short client IDs with a fixed meaning in the compact protocol
+SERVER_ID = 0
+ROOM_ID = 1
+SELF_ID = 2
+
+TYPE_CODES = {
+    'ping': 1,
+    'pong': 2,
+    'bye': 3,
+    'error': 4,
+    'profile': 5,
+    'get-room-info': 6,
+    'room-info': 7,
+    'get-ice-servers': 8,
+    'ice-servers': 9,
+    'greeting': 10,
+    'offer': 11,
+    'answer': 12,
+    'icecandidate': 13,
+    'rollback': 14,
+    'text': 15,
+    'member-joined': 16,
+    'member-left': 17,
+    'member-updated': 18,
+    'history': 19,
+}
+TYPE_NAMES = {code: name for name, code in TYPE_CODES.items()}
+MEMBER_TYPES = {'member-joined', 'member-left', 'member-updated'}
+
+
+class JSONProtocol:
+    """The default protocol, which sends and receives JSON text frames.
+
+    Options can be requested by appending them to the subprotocol, such as
+    ``camus.json+batch+deflate``:
+
+    - ``batch``: messages which are waiting to be sent (up to `batch_size`)
+      are combined into a single frame containing an array of messages
+    - ``deflate``: frames which are at least `compression_threshold` bytes
+      long are compressed. A compressed frame is a binary frame containing a
+      zero byte followed by the raw DEFLATE compressed frame. Clients can
+      also send compressed frames.
+    - ``deltas``: changes to the room's membership are sent as
+      ``member-joined``, ``member-left`` and ``member-updated`` messages
+      instead of ``room-info`` snapshots
+    """
+
+    name = 'camus.json'
+    OPTIONS = {'batch', 'deflate', 'deltas'}
+    MAX_INFLATED_SIZE = 16 * 1024 * 1024
+
+    def __init__(self, client_uuid, options=(), batch_size=64,
+                 compression_threshold=1024, compression_level=6):
+        self.client_uuid = client_uuid
+        self.subprotocol = None
+        self.batch = 'batch' in options
+        self.deltas = 'deltas' in options
+        self.batch_size = batch_size
+        self.compression_threshold = (compression_threshold
+                                      if 'deflate' in options else 0)
+        self.compression_level = compression_level
+
+    def decode(self, frame):
+        """Convert a received frame into an item for the inbox."""
+        if (self.compression_threshold and isinstance(frame, bytes)
+                and frame[:1] == b'\x00'):
+            frame = self._inflate(frame)
+        return self._decode(frame)
+
+    def encode(self, data):
+        """Convert a JSON frame from the outbox into a frame to send."""
+        return self.frames([data])[0]
+
+    def frames(self, messages):
+        """Get the frames to send for a list of JSON frames from the outbox.
+
+        Messages which cannot be encoded are logged and skipped.
+        """
+        encoded = []
+        for data in messages:
+            try:
+                encoded.append(self._encode(data))
+            except Exception as e:
+                logger.warning('Cannot encode message for client %s: %s',
+                               self.client_uuid, e)
+        if self.batch and encoded:
+            encoded = [self._join(encoded)]
+
+        threshold = self.compression_threshold
+        if threshold:
+            encoded = [self._deflate(frame) if len(frame) >= threshold else frame
+                       for frame in encoded]
+        return encoded
+
+    def _decode(self, frame):
+        return frame
+
+    def _encode(self, data):
+        return data
+
+    def _join(self, frames):
+        return '[' + ','.join(frames) + ']'
+
+    def _deflate(self, frame):
+        if isinstance(frame, str):
+            frame = frame.encode('utf-8')
+        compressor = zlib.compressobj(self.compression_level, zlib.DEFLATED, -15)
+        return b'\x00' + compressor.compress(frame) + compressor.flush()
+
+    def _inflate(self, frame):
+        decompressor = zlib.decompressobj(-15)
+        try:
+            data = decompressor.decompress(frame[1:], self.MAX_INFLATED_SIZE)
+        except zlib.error as e:
+            raise ValueError('Invalid compressed frame: {}'.format(e))
+        if decompressor.unconsumed_tail:
+            raise ValueError('Compressed frame is too large')
+        return data
+
+
+class MsgpackProtocol(JSONProtocol):
+    """A compact protocol using MessagePack binary frames.
+
+    Each frame is an array of ``[type, peer, data]``. The type is an integer
+    code from `TYPE_CODES`, or a string for other types. The peer is the
+    receiver of frames sent by the client and the sender of frames sent by
+    the server. It is a short ID which is only valid for the connection:
+    `SERVER_ID` is the server, `ROOM_ID` is every client in the room and
+    `SELF_ID` is the client itself. Other clients are given IDs as they
+    appear, and the IDs in ``room-info`` and ``member-*`` messages are
+    replaced with them. The messages in a ``history`` message are frames
+    themselves.
+
+    The same options as the JSON protocol are supported; a batch is an array
+    of frames.
+    """
+
+    name = 'camus.msgpack'
+
+    def __init__(self, client_uuid, *args, **kwargs):
+        import msgpack
+
+        super().__init__(client_uuid, *args, **kwargs)
+        self._msgpack = msgpack
+        self._uuids = ['ground control', 'room', client_uuid]
+        self._ids = {uuid: i for i, uuid in enumerate(self._uuids)}
+
+    def short_id(self, uuid):
+        """Get the short ID of a client, assigning one if necessary."""
+        short_id = self._ids.get(uuid)
+        if short_id is None:
+            short_id = self._ids[uuid] = len(self._uuids)
+            self._uuids.append(uuid)
+        return short_id
+
+    def _decode(self, frame):
+        if isinstance(frame, str):
+            raise ValueError('Expected a binary frame')
+
+        message = self._msgpack.unpackb(frame)
+        if not isinstance(message, list) or len(message) != 3:
+            raise ValueError('Expected an array of [type, peer, data]')
+
+        type, peer, data = message
+        if isinstance(type, int):
+            try:
+                type = TYPE_NAMES[type]
+            except KeyError:
+                raise ValueError('Unknown type code: {}'.format(type))
+        if (not isinstance(peer, int) or isinstance(peer, bool)
+                or not 0 <= peer < len(self._uuids)):
+            raise ValueError('Unknown peer: {}'.format(peer))
+        receiver = self._uuids[peer]
+
+        return {'receiver': receiver, 'type': type, 'data': data}
+
+    def _encode(self, data):
+        return self._msgpack.packb(self._frame(Message.codec.loads(data)))
+
+    def _frame(self, message):
+        """Convert a decoded JSON message into a ``[type, peer, data]``
+        array.
+
+        Client IDs are only replaced in messages from the server, and only
+        if they have the expected shape.
+        """
+        type = message.get('type')
+        sender = message.get('sender')
+        data = message.get('data')
+
+        if sender == 'ground control':
+            if type == 'room-info' and _is_client_list(data):
+                data['clients'] = [dict(client, id=self.short_id(client['id']))
+                                   for client in data['clients']]
+            elif type in MEMBER_TYPES and _is_client(data):
+                data['id'] = self.short_id(data['id'])
+            elif type == 'history' and isinstance(data, list):
+                data = [self._frame(item) for item in data
+                        if isinstance(item, dict)]
+
+        if isinstance(type, str):
+            type = TYPE_CODES.get(type, type)
+        return [type, self.short_id(sender), data]
+
+    def _join(self, frames):
+        # Frames are already encoded, so only the array header is needed
+        n = len(frames)
+        if n < 16:
+            header = bytes([0x90 | n])
+        elif n <= 0xffff:
+            header = b'\xdc' + n.to_bytes(2, 'big')
+        else:
+            header = b'\xdd' + n.to_bytes(4, 'big')
+        return header + b''.join(frames)
+
+
+def _is_client(data):
+    return isinstance(data, dict) and isinstance(data.get('id'), str)
+
+
+def _is_client_list(data):
+    return (isinstance(data, dict) and isinstance(data.get('clients'), list)
+            and all(_is_client(client) for client in data['clients']))
+
+
+PROTOCOLS = {protocol.name: protocol
+             for protocol in (JSONProtocol, MsgpackProtocol)}
+
+
+def negotiate(subprotocols, client_uuid, **kwargs):
+    """Choose a protocol for a client from its requested subprotocols.
+
+    The first requested subprotocol which is supported is used. Returns the
+    JSON protocol without options if none are supported, or if their
+    dependencies are not installed. Other keyword arguments are passed to the
+    protocol.
+    """
+    for subprotocol in subprotocols:
+        name, *options = subprotocol.split('+')
+        protocol = PROTOCOLS.get(name)
+        if protocol is None or not protocol.OPTIONS.issuperset(options):
+            continue
+        if 'deflate' in options and not kwargs.get('compression_threshold', 1):
+            continue
+
+        try:
+            protocol = protocol(client_uuid, options, **kwargs)
+        except ImportError as e:
+            logger.warning('Cannot use the %s protocol: %s', name, e)
+            continue
+
+        protocol.subprotocol = subprotocol
+        return protocol
+
+    return JSONProtocol(client_uuid, **kwargs)
@@ -0,0 +1,127 @@
+"""Token bucket rate limits for room joins and websocket messages.
+
+Limits are given as ``rate/burst``: a key may make `burst` requests at once,
+after which it may make `rate` requests per second. A limit of ``0``
+disables it.
+"""
+
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+
+def parse_limit(spec):
+    """Parse a ``rate/burst`` limit into a (rate, burst) pair.
+
+    The burst defaults to the rate if it is not given. Returns None if the
+    limit is disabled.
+    """
+    rate, _, burst = str(spec).partition('/')
+    rate = float(rate)
+    burst = float(burst) if burst else rate
+    if rate <= 0 or burst <= 0:
+        return None
+    if burst < 1:
+        raise ValueError('Invalid rate limit {!r}: burst must be at least 1'
+                         .format(spec))
+    return rate, burst
+
+
+class RateLimiter:
+    """A token bucket for each of a set of keys.
+
+    Buckets which have refilled completely are equivalent to new buckets, so
+    they are discarded once there are more than `max_keys` buckets.
+    """
+
+    def __init__(self, rate, burst, max_keys=10000):
+        self.rate = rate
+        self.burst = burst
+        self.max_keys = max_keys
+        self.allowed = 0
+        self.limited = 0
+        self._buckets = {}
+
+    def allow(self, key, now=None):
+        """Take a token from a key's bucket.
+
+        Returns False, without taking a token, if the bucket is empty.
+        """
+        if now is None:
+            now = time.monotonic()
+
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            if len(self._buckets) >= self.max_keys:
+                self._prune(now)
+            tokens = self.burst
+        else:
+            tokens, updated = bucket
+            tokens = min(self.burst, tokens + (now - updated) * self.rate)
+
+        if tokens < 1:
+            self._buckets[key] = (tokens, now)
+            self.limited += 1
+            return False
+
+        self._buckets[key] = (tokens - 1, now)
+        self.allowed += 1
+        return True
+
+    def _prune(self, now):
+        self._buckets = {
+            key: (tokens, updated)
+            for key, (tokens, updated) in self._buckets.items()
+            if tokens + (now - updated) * self.rate < self.burst}
+
+    def __len__(self):
+        return len(self._buckets)
+
+
+class RateLimits:
+    """The rate limits enforced by the server.
+
+    Each limit is a `RateLimiter`, or None if it is disabled:
+
+    - ``client_messages``: websocket messages from each client
+    - ``ip_messages``: websocket messages from each IP address
+    - ``room_messages``: websocket messages sent in each room
+    - ``ip_joins``: rooms joined or created from each IP address
+    - ``room_joins``: joins of each room
+    """
+
+    LIMITS = ('client_messages', 'ip_messages', 'room_messages', 'ip_joins',
+              'room_joins')
+
+    def __init__(self):
+        self.limiters = dict.fromkeys(self.LIMITS)
+
+    def init_app(self, app):
+        for name in self.LIMITS:
+            limit = parse_limit(app.config['RATE_LIMIT_' + name.upper()])
+            self.limiters[name] = RateLimiter(*limit) if limit else None
+
+    def allow(self, **keys):
+        """Check the given keys against their limits, such as
+        ``allow(ip_joins=addr, room_joins=slug)``.
+
+        The limits are checked in order, stopping at the first which is
+        exceeded, so a request shed by a narrow limit (such as a single
+        client) does not use up a wider one (such as the room).
+        """
+        now = time.monotonic()
+        for name, key in keys.items():
+            limiter = self.limiters[name]
+            if limiter is not None and not limiter.allow(key, now):
+                logger.debug('Rate limit %s exceeded by %s', name, key)
+                return False
+        return True
+
+    def stats(self):
+        """Get the number of allowed and limited requests for each limit."""
+        return {name: {'allowed': limiter.allowed,
+                       'limited': limiter.limited,
+                       'keys': len(limiter)}
+                for name, limiter in self.limiters.items()
+                if limiter is not None}
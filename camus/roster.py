@@ -0,0 +1,119 @@
+import time
+
+from camus import store
+
+
+class Roster:
+    """The members of a room and their usernames.
+
+    Every change to the membership increments the sequence number, which is
+    included in the changes sent to clients as deltas. A client which sees a
+    gap in the sequence has missed a change, and can request a snapshot with
+    ``get-room-info``.
+    """
+
+    def __init__(self, slug, members=()):
+        self.slug = slug
+        self.seq = 0
+        self.members = dict(members)
+        self.subscribers = set()
+
+    def snapshot(self):
+        """Get the room-info data for the room."""
+        clients = [{'id': client_uuid, 'username': username}
+                   for client_uuid, username in self.members.items()]
+
+        return {'room_id': self.slug, 'seq': self.seq, 'clients': clients}
+
+    def join(self, client_uuid, username):
+        """Add a member.
+
+        Returns a (type, data) pair describing the change, or None if the
+        membership did not change.
+        """
+        if client_uuid in self.members:
+            return self.update(client_uuid, username)
+
+        self.members[client_uuid] = username
+        return self._delta('member-joined', client_uuid, username=username)
+
+    def update(self, client_uuid, username):
+        """Change the username of a member."""
+        if client_uuid not in self.members:
+            return self.join(client_uuid, username)
+        if self.members[client_uuid] == username:
+            return None
+
+        self.members[client_uuid] = username
+        return self._delta('member-updated', client_uuid, username=username)
+
+    def leave(self, client_uuid):
+        """Remove a member."""
+        self.subscribers.discard(client_uuid)
+        if client_uuid not in self.members:
+            return None
+
+        del self.members[client_uuid]
+        return self._delta('member-left', client_uuid)
+
+    def reload(self, members):
+        """Replace the members with those loaded from the database.
+
+        If they differ, the sequence number is incremented without sending a
+        delta, so that clients request a snapshot after the next delta.
+        """
+        members = dict(members)
+        if members != self.members:
+            self.members = members
+            self.seq += 1
+
+    def _delta(self, type, client_uuid, **data):
+        self.seq += 1
+        return type, dict(seq=self.seq, id=client_uuid, **data)
+
+
+class Rosters:
+    """The rosters of rooms which are in use by this process.
+
+    A room's roster is loaded from the database when it is first needed, and
+    is then kept up to date in memory as clients join, update their profile
+    and leave. When other server processes can change the membership, rosters
+    are reloaded once they are `max_age` seconds old.
+    """
+
+    def __init__(self, max_age=None):
+        self.max_age = max_age
+        self._rosters = {}
+        self._loaded = {}
+
+    async def get(self, room_id):
+        """Get the roster of a room, or None if the room does not exist."""
+        roster = self._rosters.get(room_id)
+        if roster is not None and (
+                self.max_age is None
+                or time.monotonic() - self._loaded[room_id] < self.max_age):
+            return roster
+
+        room = await store.get_room(room_id=room_id, with_clients=True)
+        if room is None:
+            self.forget([room_id])
+            return None
+
+        members = [(client.uuid, client.name) for client in room.clients]
+        roster = self._rosters.get(room_id)
+        if roster is None:
+            roster = self._rosters[room_id] = Roster(room.slug, members)
+        else:
+            roster.reload(members)
+        self._loaded[room_id] = time.monotonic()
+
+        return roster
+
+    def forget(self, room_ids):
+        """Discard the rosters of rooms which have been removed."""
+        for room_id in room_ids:
+            self._rosters.pop(room_id, None)
+            self._loaded.pop(room_id, None)
+
+    def __len__(self):
+        return len(self._rosters)
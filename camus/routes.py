@@ -2,16 +2,28 @@ import asyncio
 import logging
 
 import sqlalchemy
-from quart import (Blueprint, copy_current_websocket_context, flash, redirect,
-                   render_template, session, websocket)
+from quart import (Blueprint, Response, abort,
+                   copy_current_websocket_context, current_app, flash,
+                   redirect, render_template, request, session, websocket)
 
-from camus import db, message_handler
+from camus import (directory, message_handler, passwords, rate_limits,
+                   store)
 from camus.forms import CreateRoomForm, JoinRoomForm
-from camus.models import Client, Room
-from camus.util import commit_database
+from camus.logs import dropped_records
+from camus.message_handler import OutboxClosed
+from camus.metrics import metrics
+from camus.models import Room
+from camus.passwords import fingerprint
+from camus.protocol import negotiate
+from camus.store import GuestLimitReached
+
+logger = logging.getLogger(__name__)
 
 bp = Blueprint('main', __name__)
 
+# The number of password-protected rooms remembered in each session
+MAX_REMEMBERED_ROOMS = 16
+
 
 @bp.route('/about')
 async def about():
@@ -22,6 +34,9 @@ async def about():
 async def index():
     create_room_form = CreateRoomForm()
     if create_room_form.validate_on_submit():
+        if not rate_limits.allow(ip_joins=_remote_addr(request)):
+            return 'Too many requests', 429
+
         form = create_room_form
         name = form.room_name.data
         password = form.password.data
@@ -32,9 +47,11 @@ async def index():
             room = Room(guest_limit=guest_limit, is_public=is_public)
             room.set_name(name)
             if password:
-                room.set_password(password)
-            db.session.add(room)
-            commit_database(reraise=True)
+                room.password_hash = await passwords.generate(password)
+            await store.create_room(room)
+            _remember_room(room)
+            if is_public:
+                directory.invalidate()
 
             return redirect('/room/{}'.format(room.slug), code=307)
         except sqlalchemy.exc.IntegrityError:
@@ -44,6 +61,34 @@ async def index():
         'chat.html', create_room_form=create_room_form)
 
 
+@bp.route('/metrics')
+async def metrics_index():
+    if not metrics.enabled:
+        abort(404)
+
+    collected = message_handler.collect_metrics()
+    rate_limit_stats = rate_limits.stats()
+    for result in ('allowed', 'limited'):
+        collected.append((
+            'camus_rate_limit_{}_total'.format(result), 'counter',
+            'Number of requests {} by each rate limit'.format(result),
+            ('limit', {name: stats[result]
+                       for name, stats in rate_limit_stats.items()})))
+
+    for result in ('hits', 'misses', 'coalesced'):
+        collected.append((
+            'camus_cache_{}_total'.format(result), 'counter',
+            'Number of cache lookups which were {}'.format(result),
+            ('cache', {'rooms': getattr(store.rooms, result),
+                       'clients': getattr(store.clients, result)})))
+    collected.append(('camus_log_records_dropped_total', 'counter',
+                      'Number of log records dropped because the log queue '
+                      'was full', dropped_records()))
+
+    return Response(metrics.render(collected),
+                    content_type='text/plain; version=0.0.4')
+
+
 # The `/chat` route is deprecated.
 @bp.route('/chat')
 async def chat_index():
@@ -54,16 +99,27 @@ async def chat_index():
 @bp.route('/chat/<room_id>', methods=['GET', 'POST'])
 @bp.route('/room/<room_id>', methods=['GET', 'POST'])
 async def room(room_id):
-    room = Room.query.filter_by(slug=room_id).first_or_404()
+    if not rate_limits.allow(ip_joins=_remote_addr(request),
+                             room_joins=room_id):
+        return 'Too many requests', 429
+
+    room = await store.get_room(slug=room_id, cached=True)
+    if room is None:
+        abort(404)
 
+    # Turn clients away from a full room before asking for a password. The
+    # cached count may be stale, so the limit is enforced by add_client.
     if room.is_full():
         return 'Guest limit already reached', 418
 
-    # No password is required to join the room
-    client = room.authenticate()
-    if client:
-        db.session.add(client)
-        commit_database(reraise=True)
+    # No password is required to join the room, or this session has already
+    # entered it
+    if room.password_hash is None or _room_remembered(room):
+        client = room.new_client()
+        try:
+            await store.add_client(client)
+        except GuestLimitReached:
+            return 'Guest limit already reached', 418
         session['id'] = client.uuid
 
         return await render_template(
@@ -75,10 +131,13 @@ async def room(room_id):
     if form.validate_on_submit():
         password = form.password.data
 
-        client = room.authenticate(password)
-        if client:
-            db.session.add(client)
-            commit_database(reraise=True)
+        if await passwords.check(room.password_hash, password):
+            _remember_room(room)
+            client = room.new_client()
+            try:
+                await store.add_client(client)
+            except GuestLimitReached:
+                return 'Guest limit already reached', 418
             session['id'] = client.uuid
 
             return await render_template(
@@ -94,53 +153,131 @@ async def room(room_id):
         status_code)
 
 
+def _remote_addr(request):
+    """Get the address of the client which made a request or websocket.
+
+    Behind `TRUSTED_PROXIES` reverse proxies, each of which adds the address
+    it was connected from to the X-Forwarded-For header, this is the address
+    added by the furthest trusted proxy. Addresses added by the client itself
+    are not trusted.
+    """
+    proxies = current_app.config['TRUSTED_PROXIES']
+    if proxies:
+        forwarded = [address.strip()
+                     for header in request.headers.getlist('X-Forwarded-For')
+                     for address in header.split(',') if address.strip()]
+        if len(forwarded) >= proxies:
+            return forwarded[-proxies]
+
+    return request.remote_addr
+
+
+def _remember_room(room):
+    """Remember that this session has entered a room's password."""
+    if room.password_hash is None:
+        return
+
+    rooms = session.get('rooms', {})
+    rooms.pop(room.slug, None)
+    rooms[room.slug] = fingerprint(room.password_hash)
+    # Keep the session cookie small
+    while len(rooms) > MAX_REMEMBERED_ROOMS:
+        del rooms[next(iter(rooms))]
+    session['rooms'] = rooms
+
+
+def _room_remembered(room):
+    return (session.get('rooms', {}).get(room.slug)
+            == fingerprint(room.password_hash))
+
+
 # The `/chat/` route is deprecated. Prefer`/room/` instead.
 @bp.websocket('/chat/<room_id>/ws')
 @bp.websocket('/room/<room_id>/ws')
 async def room_ws(room_id):
     # Verify that the room exists
-    Room.query.filter_by(slug=room_id).first_or_404()
+    room = await store.get_room(slug=room_id, cached=True)
+    if room is None:
+        abort(404)
 
     # Verify the client using a secure cookie
-    client = Client.query.filter_by(uuid=session.get('id', None)).first()
+    client = await store.get_client(session.get('id', None), cached=True)
     if client:
-        logging.info(f'Accepted websocket connection for client {client.uuid}')
-        await websocket.accept()
+        logger.info('Accepted websocket connection for client %s',
+                    client.uuid, extra={'client': client.uuid})
+        config = current_app.config
+        protocol = negotiate(
+            websocket.requested_subprotocols, client.uuid,
+            batch_size=config['WEBSOCKET_BATCH_SIZE'],
+            compression_threshold=config['WEBSOCKET_COMPRESSION_THRESHOLD'],
+            compression_level=config['WEBSOCKET_COMPRESSION_LEVEL'])
+        await websocket.accept(subprotocol=protocol.subprotocol)
     else:
         return 'Forbidden', 403
 
-    inbox, outbox = message_handler.inbox, message_handler.outbox
+    outbox = await message_handler.connect(client, deltas=protocol.deltas)
+    inbox = message_handler.inbox
 
     send_task = asyncio.create_task(
-        copy_current_websocket_context(ws_send)(outbox[client.uuid]),
+        copy_current_websocket_context(ws_send)(outbox, protocol),
     )
     receive_task = asyncio.create_task(
-        copy_current_websocket_context(ws_receive)(client.uuid, inbox),
+        copy_current_websocket_context(ws_receive)(client, inbox, protocol),
     )
     try:
         await asyncio.gather(send_task, receive_task)
+    except OutboxClosed:
+        if outbox.overflowed:
+            logger.warning('Disconnecting slow client %s', client.uuid,
+                           extra={'client': client.uuid})
     finally:
-        logging.info(f'Terminating websocket connection for client {client.uuid}')
+        logger.info('Terminating websocket connection for client %s',
+                    client.uuid, extra={'client': client.uuid})
         send_task.cancel()
         receive_task.cancel()
+        message_handler.outbox.discard(client.uuid, outbox)
 
 
 @bp.route('/public')
 async def public():
-    public_rooms = Room.query.filter_by(is_public=True).all()
+    page = await directory.page(request.args.get('page', 1, type=int))
 
     return await render_template(
         'public.html', title='Camus Video Chat | Public Rooms',
-        public_rooms=public_rooms)
+        public_rooms=page['rooms'], page=page)
 
 
-async def ws_send(queue):
+@bp.route('/public.json')
+async def public_json():
+    return await directory.page(request.args.get('page', 1, type=int))
+
+
+async def ws_send(queue, protocol):
     while True:
-        message = await queue.get()
-        await websocket.send(message)
+        # Send everything that is already queued together
+        messages = [await queue.get()]
+        while len(messages) < protocol.batch_size and not queue.empty():
+            messages.append(queue.get_nowait())
+
+        for frame in protocol.frames(messages):
+            await websocket.send(frame)
 
 
-async def ws_receive(client_id, queue):
+async def ws_receive(client, queue, protocol):
+    remote_addr = _remote_addr(websocket)
     while True:
         message = await websocket.receive()
-        await queue.put((client_id, message))
+
+        # Shed messages over the rate limits before decoding them
+        if not rate_limits.allow(client_messages=client.uuid,
+                                 ip_messages=remote_addr,
+                                 room_messages=client.room_id):
+            continue
+
+        try:
+            message = protocol.decode(message)
+        except ValueError as e:
+            logger.warning('Invalid message from client %s: %s', client.uuid,
+                           e, extra={'client': client.uuid})
+            continue
+        await queue.put((client.uuid, message))
@@ -1,2 +1,2 @@
 /*! For license information please see index.js.LICENSE.txt */
-(()=>{var e={679:(e,t,n)=>{"use strict";var r=n(864),i={childContextTypes:!0,contextType:!0,contextTypes:!0,defaultProps:!0,displayName:!0,getDefaultProps:!0,getDerivedStateFromError:!0,getDerivedStateFromProps:!0,mixins:!0,propTypes:!0,type:!0},o={name:!0,length:!0,prototype:!0,caller:!0,callee:!0,arguments:!0,arity:!0},a={$$typeof:!0,compare:!0,defaultProps:!0,displayName:!0,propTypes:!0,type:!0},l={};function s(e){return r.isMemo(e)?a:l[e.$$typeof]||i}l[r.ForwardRef]={$$typeof:!0,render:!0,defaultProps:!0,displayName:!0,propTypes:!0},l[r.Memo]=a;var u=Object.defineProperty,c=Object.getOwnPropertyNames,d=Object.getOwnPropertySymbols,f=Object.getOwnPropertyDescriptor,p=Object.getPrototypeOf,h=Object.prototype;e.exports=function e(t,n,r){if("string"!=typeof n){if(h){var i=p(n);i&&i!==h&&e(t,i,r)}var a=c(n);d&&(a=a.concat(d(n)));for(var l=s(t),v=s(n),m=0;m<a.length;++m){var g=a[m];if(!(o[g]||r&&r[g]||v&&v[g]||l&&l[g])){var y=f(n,g);try{u(t,g,y)}catch(e){}}}}return t}},418:e=>{"use strict";var t=Object.getOwnPropertySymbols,n=Object.prototype.hasOwnProperty,r=Object.prototype.propertyIsEnumerable;function i(e){if(null==e)throw new TypeError("Object.assign cannot be called with null or undefined");return Object(e)}e.exports=function(){try{if(!Object.assign)return!1;var e=new String("abc");if(e[5]="de","5"===Object.getOwnPropertyNames(e)[0])return!1;for(var t={},n=0;n<10;n++)t["_"+String.fromCharCode(n)]=n;if("0123456789"!==Object.getOwnPropertyNames(t).map((function(e){return t[e]})).join(""))return!1;var r={};return"abcdefghijklmnopqrst".split("").forEach((function(e){r[e]=e})),"abcdefghijklmnopqrst"===Object.keys(Object.assign({},r)).join("")}catch(e){return!1}}()?Object.assign:function(e,o){for(var a,l,s=i(e),u=1;u<arguments.length;u++){for(var c in a=Object(arguments[u]))n.call(a,c)&&(s[c]=a[c]);if(t){l=t(a);for(var d=0;d<l.length;d++)r.call(a,l[d])&&(s[l[d]]=a[l[d]])}}return s}},703:(e,t,n)=>{"use strict";var r=n(414);function i(){}function o(){}o.resetWarningCache=i,e.exports=function(){function e(e,t,n,i,o,a){if(a!==r){var l=new Error("Calling PropTypes validators directly is not supported by the `prop-types` package. Use PropTypes.checkPropTypes() to call them. Read more at http://fb.me/use-check-prop-types");throw l.name="Invariant Violation",l}}function t(){return e}e.isRequired=e;var n={array:e,bool:e,func:e,number:e,object:e,string:e,symbol:e,any:e,arrayOf:t,element:e,elementType:e,instanceOf:t,node:e,objectOf:t,oneOf:t,oneOfType:t,shape:t,exact:t,checkPropTypes:o,resetWarningCache:i};return n.PropTypes=n,n}},697:(e,t,n)=>{e.exports=n(703)()},414:e=>{"use strict";e.exports="SECRET_DO_NOT_PASS_THIS_OR_YOU_WILL_BE_FIRED"},448:(e,t,n)=>{"use strict";var r=n(294),i=n(418),o=n(840);function a(e){for(var t="https://reactjs.org/docs/error-decoder.html?invariant="+e,n=1;n<arguments.length;n++)t+="&args[]="+encodeURIComponent(arguments[n]);return"Minified React error #"+e+"; visit "+t+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}if(!r)throw Error(a(227));var l=new Set,s={};function u(e,t){c(e,t),c(e+"Capture",t)}function c(e,t){for(s[e]=t,e=0;e<t.length;e++)l.add(t[e])}var d=!("undefined"==typeof window||void 0===window.document||void 0===window.document.createElement),f=/^[:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$/,p=Object.prototype.hasOwnProperty,h={},v={};function m(e,t,n,r,i,o,a){this.acceptsBooleans=2===t||3===t||4===t,this.attributeName=r,this.attributeNamespace=i,this.mustUseProperty=n,this.propertyName=e,this.type=t,this.sanitizeURL=o,this.removeEmptyString=a}var g={};"children dangerouslySetInnerHTML defaultValue defaultChecked innerHTML suppressContentEditableWarning suppressHydrationWarning style".split(" ").forEach((function(e){g[e]=new m(e,0,!1,e,null,!1,!1)})),[["acceptCharset","accept-charset"],["className","class"],["htmlFor","for"],["httpEquiv","http-equiv"]].forEach((function(e){var t=e[0];g[t]=new m(t,1,!1,e[1],null,!1,!1)})),["contentEditable","draggable","spellCheck","value"].forEach((function(e){g[e]=new m(e,2,!1,e.toLowerCase(),null,!1,!1)})),["autoReverse","externalResourcesRequired","focusable","preserveAlpha"].forEach((function(e){g[e]=new m(e,2,!1,e,null,!1,!1)})),"allowFullScreen async autoFocus autoPlay controls default defer disabled disablePictureInPicture disableRemotePlayback formNoValidate hidden loop noModule noValidate open playsInline readOnly required reversed scoped seamless itemScope".split(" ").forEach((function(e){g[e]=new m(e,3,!1,e.toLowerCase(),null,!1,!1)})),["checked","multiple","muted","selected"].forEach((function(e){g[e]=new m(e,3,!0,e,null,!1,!1)})),["capture","download"].forEach((function(e){g[e]=new m(e,4,!1,e,null,!1,!1)})),["cols","rows","size","span"].forEach((function(e){g[e]=new m(e,6,!1,e,null,!1,!1)})),["rowSpan","start"].forEach((function(e){g[e]=new m(e,5,!1,e.toLowerCase(),null,!1,!1)}));var y=/[\-:]([a-z])/g;function b(e){return e[1].toUpperCase()}function w(e,t,n,r){var i=g.hasOwnProperty(t)?g[t]:null;(null!==i?0===i.type:!r&&2<t.length&&("o"===t[0]||"O"===t[0])&&("n"===t[1]||"N"===t[1]))||(function(e,t,n,r){if(null==t||function(e,t,n,r){if(null!==n&&0===n.type)return!1;switch(typeof t){case"function":case"symbol":return!0;case"boolean":return!r&&(null!==n?!n.acceptsBooleans:"data-"!==(e=e.toLowerCase().slice(0,5))&&"aria-"!==e);default:return!1}}(e,t,n,r))return!0;if(r)return!1;if(null!==n)switch(n.type){case 3:return!t;case 4:return!1===t;case 5:return isNaN(t);case 6:return isNaN(t)||1>t}return!1}(t,n,i,r)&&(n=null),r||null===i?function(e){return!!p.call(v,e)||!p.call(h,e)&&(f.test(e)?v[e]=!0:(h[e]=!0,!1))}(t)&&(null===n?e.removeAttribute(t):e.setAttribute(t,""+n)):i.mustUseProperty?e[i.propertyName]=null===n?3!==i.type&&"":n:(t=i.attributeName,r=i.attributeNamespace,null===n?e.removeAttribute(t):(n=3===(i=i.type)||4===i&&!0===n?"":""+n,r?e.setAttributeNS(r,t,n):e.setAttribute(t,n))))}"accent-height alignment-baseline arabic-form baseline-shift cap-height clip-path clip-rule color-interpolation color-interpolation-filters color-profile color-rendering dominant-baseline enable-background fill-opacity fill-rule flood-color flood-opacity font-family font-size font-size-adjust font-stretch font-style font-variant font-weight glyph-name glyph-orientation-horizontal glyph-orientation-vertical horiz-adv-x horiz-origin-x image-rendering letter-spacing lighting-color marker-end marker-mid marker-start overline-position overline-thickness paint-order panose-1 pointer-events rendering-intent shape-rendering stop-color stop-opacity strikethrough-position strikethrough-thickness stroke-dasharray stroke-dashoffset stroke-linecap stroke-linejoin stroke-miterlimit stroke-opacity stroke-width text-anchor text-decoration text-rendering underline-position underline-thickness unicode-bidi unicode-range units-per-em v-alphabetic v-hanging v-ideographic v-mathematical vector-effect vert-adv-y vert-origin-x vert-origin-y word-spacing writing-mode xmlns:xlink x-height".split(" ").forEach((function(e){var t=e.replace(y,b);g[t]=new m(t,1,!1,e,null,!1,!1)})),"xlink:actuate xlink:arcrole xlink:role xlink:show xlink:title xlink:type".split(" ").forEach((function(e){var t=e.replace(y,b);g[t]=new m(t,1,!1,e,"http://www.w3.org/1999/xlink",!1,!1)})),["xml:base","xml:lang","xml:space"].forEach((function(e){var t=e.replace(y,b);g[t]=new m(t,1,!1,e,"http://www.w3.org/XML/1998/namespace",!1,!1)})),["tabIndex","crossOrigin"].forEach((function(e){g[e]=new m(e,1,!1,e.toLowerCase(),null,!1,!1)})),g.xlinkHref=new m("xlinkHref",1,!1,"xlink:href","http://www.w3.org/1999/xlink",!0,!1),["src","href","action","formAction"].forEach((function(e){g[e]=new m(e,1,!1,e.toLowerCase(),null,!0,!0)}));var S=r.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED,k=60103,x=60106,E=60107,C=60108,O=60114,P=60109,j=60110,T=60112,_=60113,N=60120,R=60115,M=60116,D=60121,L=60128,I=60129,A=60130,F=60131;if("function"==typeof Symbol&&Symbol.for){var z=Symbol.for;k=z("react.element"),x=z("react.portal"),E=z("react.fragment"),C=z("react.strict_mode"),O=z("react.profiler"),P=z("react.provider"),j=z("react.context"),T=z("react.forward_ref"),_=z("react.suspense"),N=z("react.suspense_list"),R=z("react.memo"),M=z("react.lazy"),D=z("react.block"),z("react.scope"),L=z("react.opaque.id"),I=z("react.debug_trace_mode"),A=z("react.offscreen"),F=z("react.legacy_hidden")}var U,$="function"==typeof Symbol&&Symbol.iterator;function V(e){return null===e||"object"!=typeof e?null:"function"==typeof(e=$&&e[$]||e["@@iterator"])?e:null}function B(e){if(void 0===U)try{throw Error()}catch(e){var t=e.stack.trim().match(/\n( *(at )?)/);U=t&&t[1]||""}return"\n"+U+e}var W=!1;function q(e,t){if(!e||W)return"";W=!0;var n=Error.prepareStackTrace;Error.prepareStackTrace=void 0;try{if(t)if(t=function(){throw Error()},Object.defineProperty(t.prototype,"props",{set:function(){throw Error()}}),"object"==typeof Reflect&&Reflect.construct){try{Reflect.construct(t,[])}catch(e){var r=e}Reflect.construct(e,[],t)}else{try{t.call()}catch(e){r=e}e.call(t.prototype)}else{try{throw Error()}catch(e){r=e}e()}}catch(e){if(e&&r&&"string"==typeof e.stack){for(var i=e.stack.split("\n"),o=r.stack.split("\n"),a=i.length-1,l=o.length-1;1<=a&&0<=l&&i[a]!==o[l];)l--;for(;1<=a&&0<=l;a--,l--)if(i[a]!==o[l]){if(1!==a||1!==l)do{if(a--,0>--l||i[a]!==o[l])return"\n"+i[a].replace(" at new "," at ")}while(1<=a&&0<=l);break}}}finally{W=!1,Error.prepareStackTrace=n}return(e=e?e.displayName||e.name:"")?B(e):""}function H(e){switch(e.tag){case 5:return B(e.type);case 16:return B("Lazy");case 13:return B("Suspense");case 19:return B("SuspenseList");case 0:case 2:case 15:return q(e.type,!1);case 11:return q(e.type.render,!1);case 22:return q(e.type._render,!1);case 1:return q(e.type,!0);default:return""}}function Q(e){if(null==e)return null;if("function"==typeof e)return e.displayName||e.name||null;if("string"==typeof e)return e;switch(e){case E:return"Fragment";case x:return"Portal";case O:return"Profiler";case C:return"StrictMode";case _:return"Suspense";case N:return"SuspenseList"}if("object"==typeof e)switch(e.$$typeof){case j:return(e.displayName||"Context")+".Consumer";case P:return(e._context.displayName||"Context")+".Provider";case T:var t=e.render;return t=t.displayName||t.name||"",e.displayName||(""!==t?"ForwardRef("+t+")":"ForwardRef");case R:return Q(e.type);case D:return Q(e._render);case M:t=e._payload,e=e._init;try{return Q(e(t))}catch(e){}}return null}function K(e){switch(typeof e){case"boolean":case"number":case"object":case"string":case"undefined":return e;default:return""}}function G(e){var t=e.type;return(e=e.nodeName)&&"input"===e.toLowerCase()&&("checkbox"===t||"radio"===t)}function Y(e){e._valueTracker||(e._valueTracker=function(e){var t=G(e)?"checked":"value",n=Object.getOwnPropertyDescriptor(e.constructor.prototype,t),r=""+e[t];if(!e.hasOwnProperty(t)&&void 0!==n&&"function"==typeof n.get&&"function"==typeof n.set){var i=n.get,o=n.set;return Object.defineProperty(e,t,{configurable:!0,get:function(){return i.call(this)},set:function(e){r=""+e,o.call(this,e)}}),Object.defineProperty(e,t,{enumerable:n.enumerable}),{getValue:function(){return r},setValue:function(e){r=""+e},stopTracking:function(){e._valueTracker=null,delete e[t]}}}}(e))}function X(e){if(!e)return!1;var t=e._valueTracker;if(!t)return!0;var n=t.getValue(),r="";return e&&(r=G(e)?e.checked?"true":"false":e.value),(e=r)!==n&&(t.setValue(e),!0)}function J(e){if(void 0===(e=e||("undefined"!=typeof document?document:void 0)))return null;try{return e.activeElement||e.body}catch(t){return e.body}}function Z(e,t){var n=t.checked;return i({},t,{defaultChecked:void 0,defaultValue:void 0,value:void 0,checked:null!=n?n:e._wrapperState.initialChecked})}function ee(e,t){var n=null==t.defaultValue?"":t.defaultValue,r=null!=t.checked?t.checked:t.defaultChecked;n=K(null!=t.value?t.value:n),e._wrapperState={initialChecked:r,initialValue:n,controlled:"checkbox"===t.type||"radio"===t.type?null!=t.checked:null!=t.value}}function te(e,t){null!=(t=t.checked)&&w(e,"checked",t,!1)}function ne(e,t){te(e,t);var n=K(t.value),r=t.type;if(null!=n)"number"===r?(0===n&&""===e.value||e.value!=n)&&(e.value=""+n):e.value!==""+n&&(e.value=""+n);else if("submit"===r||"reset"===r)return void e.removeAttribute("value");t.hasOwnProperty("value")?ie(e,t.type,n):t.hasOwnProperty("defaultValue")&&ie(e,t.type,K(t.defaultValue)),null==t.checked&&null!=t.defaultChecked&&(e.defaultChecked=!!t.defaultChecked)}function re(e,t,n){if(t.hasOwnProperty("value")||t.hasOwnProperty("defaultValue")){var r=t.type;if(!("submit"!==r&&"reset"!==r||void 0!==t.value&&null!==t.value))return;t=""+e._wrapperState.initialValue,n||t===e.value||(e.value=t),e.defaultValue=t}""!==(n=e.name)&&(e.name=""),e.defaultChecked=!!e._wrapperState.initialChecked,""!==n&&(e.name=n)}function ie(e,t,n){"number"===t&&J(e.ownerDocument)===e||(null==n?e.defaultValue=""+e._wrapperState.initialValue:e.defaultValue!==""+n&&(e.defaultValue=""+n))}function oe(e,t){return e=i({children:void 0},t),(t=function(e){var t="";return r.Children.forEach(e,(function(e){null!=e&&(t+=e)})),t}(t.children))&&(e.children=t),e}function ae(e,t,n,r){if(e=e.options,t){t={};for(var i=0;i<n.length;i++)t["$"+n[i]]=!0;for(n=0;n<e.length;n++)i=t.hasOwnProperty("$"+e[n].value),e[n].selected!==i&&(e[n].selected=i),i&&r&&(e[n].defaultSelected=!0)}else{for(n=""+K(n),t=null,i=0;i<e.length;i++){if(e[i].value===n)return e[i].selected=!0,void(r&&(e[i].defaultSelected=!0));null!==t||e[i].disabled||(t=e[i])}null!==t&&(t.selected=!0)}}function le(e,t){if(null!=t.dangerouslySetInnerHTML)throw Error(a(91));return i({},t,{value:void 0,defaultValue:void 0,children:""+e._wrapperState.initialValue})}function se(e,t){var n=t.value;if(null==n){if(n=t.children,t=t.defaultValue,null!=n){if(null!=t)throw Error(a(92));if(Array.isArray(n)){if(!(1>=n.length))throw Error(a(93));n=n[0]}t=n}null==t&&(t=""),n=t}e._wrapperState={initialValue:K(n)}}function ue(e,t){var n=K(t.value),r=K(t.defaultValue);null!=n&&((n=""+n)!==e.value&&(e.value=n),null==t.defaultValue&&e.defaultValue!==n&&(e.defaultValue=n)),null!=r&&(e.defaultValue=""+r)}function ce(e){var t=e.textContent;t===e._wrapperState.initialValue&&""!==t&&null!==t&&(e.value=t)}var de="http://www.w3.org/1999/xhtml";function fe(e){switch(e){case"svg":return"http://www.w3.org/2000/svg";case"math":return"http://www.w3.org/1998/Math/MathML";default:return"http://www.w3.org/1999/xhtml"}}function pe(e,t){return null==e||"http://www.w3.org/1999/xhtml"===e?fe(t):"http://www.w3.org/2000/svg"===e&&"foreignObject"===t?"http://www.w3.org/1999/xhtml":e}var he,ve,me=(ve=function(e,t){if("http://www.w3.org/2000/svg"!==e.namespaceURI||"innerHTML"in e)e.innerHTML=t;else{for((he=he||document.createElement("div")).innerHTML="<svg>"+t.valueOf().toString()+"</svg>",t=he.firstChild;e.firstChild;)e.removeChild(e.firstChild);for(;t.firstChild;)e.appendChild(t.firstChild)}},"undefined"!=typeof MSApp&&MSApp.execUnsafeLocalFunction?function(e,t,n,r){MSApp.execUnsafeLocalFunction((function(){return ve(e,t)}))}:ve);function ge(e,t){if(t){var n=e.firstChild;if(n&&n===e.lastChild&&3===n.nodeType)return void(n.nodeValue=t)}e.textContent=t}var ye={animationIterationCount:!0,borderImageOutset:!0,borderImageSlice:!0,borderImageWidth:!0,boxFlex:!0,boxFlexGroup:!0,boxOrdinalGroup:!0,columnCount:!0,columns:!0,flex:!0,flexGrow:!0,flexPositive:!0,flexShrink:!0,flexNegative:!0,flexOrder:!0,gridArea:!0,gridRow:!0,gridRowEnd:!0,gridRowSpan:!0,gridRowStart:!0,gridColumn:!0,gridColumnEnd:!0,gridColumnSpan:!0,gridColumnStart:!0,fontWeight:!0,lineClamp:!0,lineHeight:!0,opacity:!0,order:!0,orphans:!0,tabSize:!0,widows:!0,zIndex:!0,zoom:!0,fillOpacity:!0,floodOpacity:!0,stopOpacity:!0,strokeDasharray:!0,strokeDashoffset:!0,strokeMiterlimit:!0,strokeOpacity:!0,strokeWidth:!0},be=["Webkit","ms","Moz","O"];function we(e,t,n){return null==t||"boolean"==typeof t||""===t?"":n||"number"!=typeof t||0===t||ye.hasOwnProperty(e)&&ye[e]?(""+t).trim():t+"px"}function Se(e,t){for(var n in e=e.style,t)if(t.hasOwnProperty(n)){var r=0===n.indexOf("--"),i=we(n,t[n],r);"float"===n&&(n="cssFloat"),r?e.setProperty(n,i):e[n]=i}}Object.keys(ye).forEach((function(e){be.forEach((function(t){t=t+e.charAt(0).toUpperCase()+e.substring(1),ye[t]=ye[e]}))}));var ke=i({menuitem:!0},{area:!0,base:!0,br:!0,col:!0,embed:!0,hr:!0,img:!0,input:!0,keygen:!0,link:!0,meta:!0,param:!0,source:!0,track:!0,wbr:!0});function xe(e,t){if(t){if(ke[e]&&(null!=t.children||null!=t.dangerouslySetInnerHTML))throw Error(a(137,e));if(null!=t.dangerouslySetInnerHTML){if(null!=t.children)throw Error(a(60));if("object"!=typeof t.dangerouslySetInnerHTML||!("__html"in t.dangerouslySetInnerHTML))throw Error(a(61))}if(null!=t.style&&"object"!=typeof t.style)throw Error(a(62))}}function Ee(e,t){if(-1===e.indexOf("-"))return"string"==typeof t.is;switch(e){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}function Ce(e){return(e=e.target||e.srcElement||window).correspondingUseElement&&(e=e.correspondingUseElement),3===e.nodeType?e.parentNode:e}var Oe=null,Pe=null,je=null;function Te(e){if(e=Zr(e)){if("function"!=typeof Oe)throw Error(a(280));var t=e.stateNode;t&&(t=ti(t),Oe(e.stateNode,e.type,t))}}function _e(e){Pe?je?je.push(e):je=[e]:Pe=e}function Ne(){if(Pe){var e=Pe,t=je;if(je=Pe=null,Te(e),t)for(e=0;e<t.length;e++)Te(t[e])}}function Re(e,t){return e(t)}function Me(e,t,n,r,i){return e(t,n,r,i)}function De(){}var Le=Re,Ie=!1,Ae=!1;function Fe(){null===Pe&&null===je||(De(),Ne())}function ze(e,t){var n=e.stateNode;if(null===n)return null;var r=ti(n);if(null===r)return null;n=r[t];e:switch(t){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(r=!r.disabled)||(r=!("button"===(e=e.type)||"input"===e||"select"===e||"textarea"===e)),e=!r;break e;default:e=!1}if(e)return null;if(n&&"function"!=typeof n)throw Error(a(231,t,typeof n));return n}var Ue=!1;if(d)try{var $e={};Object.defineProperty($e,"passive",{get:function(){Ue=!0}}),window.addEventListener("test",$e,$e),window.removeEventListener("test",$e,$e)}catch(ve){Ue=!1}function Ve(e,t,n,r,i,o,a,l,s){var u=Array.prototype.slice.call(arguments,3);try{t.apply(n,u)}catch(e){this.onError(e)}}var Be=!1,We=null,qe=!1,He=null,Qe={onError:function(e){Be=!0,We=e}};function Ke(e,t,n,r,i,o,a,l,s){Be=!1,We=null,Ve.apply(Qe,arguments)}function Ge(e){var t=e,n=e;if(e.alternate)for(;t.return;)t=t.return;else{e=t;do{0!=(1026&(t=e).flags)&&(n=t.return),e=t.return}while(e)}return 3===t.tag?n:null}function Ye(e){if(13===e.tag){var t=e.memoizedState;if(null===t&&null!==(e=e.alternate)&&(t=e.memoizedState),null!==t)return t.dehydrated}return null}function Xe(e){if(Ge(e)!==e)throw Error(a(188))}function Je(e){if(!(e=function(e){var t=e.alternate;if(!t){if(null===(t=Ge(e)))throw Error(a(188));return t!==e?null:e}for(var n=e,r=t;;){var i=n.return;if(null===i)break;var o=i.alternate;if(null===o){if(null!==(r=i.return)){n=r;continue}break}if(i.child===o.child){for(o=i.child;o;){if(o===n)return Xe(i),e;if(o===r)return Xe(i),t;o=o.sibling}throw Error(a(188))}if(n.return!==r.return)n=i,r=o;else{for(var l=!1,s=i.child;s;){if(s===n){l=!0,n=i,r=o;break}if(s===r){l=!0,r=i,n=o;break}s=s.sibling}if(!l){for(s=o.child;s;){if(s===n){l=!0,n=o,r=i;break}if(s===r){l=!0,r=o,n=i;break}s=s.sibling}if(!l)throw Error(a(189))}}if(n.alternate!==r)throw Error(a(190))}if(3!==n.tag)throw Error(a(188));return n.stateNode.current===n?e:t}(e)))return null;for(var t=e;;){if(5===t.tag||6===t.tag)return t;if(t.child)t.child.return=t,t=t.child;else{if(t===e)break;for(;!t.sibling;){if(!t.return||t.return===e)return null;t=t.return}t.sibling.return=t.return,t=t.sibling}}return null}function Ze(e,t){for(var n=e.alternate;null!==t;){if(t===e||t===n)return!0;t=t.return}return!1}var et,tt,nt,rt,it=!1,ot=[],at=null,lt=null,st=null,ut=new Map,ct=new Map,dt=[],ft="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset submit".split(" ");function pt(e,t,n,r,i){return{blockedOn:e,domEventName:t,eventSystemFlags:16|n,nativeEvent:i,targetContainers:[r]}}function ht(e,t){switch(e){case"focusin":case"focusout":at=null;break;case"dragenter":case"dragleave":lt=null;break;case"mouseover":case"mouseout":st=null;break;case"pointerover":case"pointerout":ut.delete(t.pointerId);break;case"gotpointercapture":case"lostpointercapture":ct.delete(t.pointerId)}}function vt(e,t,n,r,i,o){return null===e||e.nativeEvent!==o?(e=pt(t,n,r,i,o),null!==t&&null!==(t=Zr(t))&&tt(t),e):(e.eventSystemFlags|=r,t=e.targetContainers,null!==i&&-1===t.indexOf(i)&&t.push(i),e)}function mt(e){var t=Jr(e.target);if(null!==t){var n=Ge(t);if(null!==n)if(13===(t=n.tag)){if(null!==(t=Ye(n)))return e.blockedOn=t,void rt(e.lanePriority,(function(){o.unstable_runWithPriority(e.priority,(function(){nt(n)}))}))}else if(3===t&&n.stateNode.hydrate)return void(e.blockedOn=3===n.tag?n.stateNode.containerInfo:null)}e.blockedOn=null}function gt(e){if(null!==e.blockedOn)return!1;for(var t=e.targetContainers;0<t.length;){var n=Jt(e.domEventName,e.eventSystemFlags,t[0],e.nativeEvent);if(null!==n)return null!==(t=Zr(n))&&tt(t),e.blockedOn=n,!1;t.shift()}return!0}function yt(e,t,n){gt(e)&&n.delete(t)}function bt(){for(it=!1;0<ot.length;){var e=ot[0];if(null!==e.blockedOn){null!==(e=Zr(e.blockedOn))&&et(e);break}for(var t=e.targetContainers;0<t.length;){var n=Jt(e.domEventName,e.eventSystemFlags,t[0],e.nativeEvent);if(null!==n){e.blockedOn=n;break}t.shift()}null===e.blockedOn&&ot.shift()}null!==at&&gt(at)&&(at=null),null!==lt&&gt(lt)&&(lt=null),null!==st&&gt(st)&&(st=null),ut.forEach(yt),ct.forEach(yt)}function wt(e,t){e.blockedOn===t&&(e.blockedOn=null,it||(it=!0,o.unstable_scheduleCallback(o.unstable_NormalPriority,bt)))}function St(e){function t(t){return wt(t,e)}if(0<ot.length){wt(ot[0],e);for(var n=1;n<ot.length;n++){var r=ot[n];r.blockedOn===e&&(r.blockedOn=null)}}for(null!==at&&wt(at,e),null!==lt&&wt(lt,e),null!==st&&wt(st,e),ut.forEach(t),ct.forEach(t),n=0;n<dt.length;n++)(r=dt[n]).blockedOn===e&&(r.blockedOn=null);for(;0<dt.length&&null===(n=dt[0]).blockedOn;)mt(n),null===n.blockedOn&&dt.shift()}function kt(e,t){var n={};return n[e.toLowerCase()]=t.toLowerCase(),n["Webkit"+e]="webkit"+t,n["Moz"+e]="moz"+t,n}var xt={animationend:kt("Animation","AnimationEnd"),animationiteration:kt("Animation","AnimationIteration"),animationstart:kt("Animation","AnimationStart"),transitionend:kt("Transition","TransitionEnd")},Et={},Ct={};function Ot(e){if(Et[e])return Et[e];if(!xt[e])return e;var t,n=xt[e];for(t in n)if(n.hasOwnProperty(t)&&t in Ct)return Et[e]=n[t];return e}d&&(Ct=document.createElement("div").style,"AnimationEvent"in window||(delete xt.animationend.animation,delete xt.animationiteration.animation,delete xt.animationstart.animation),"TransitionEvent"in window||delete xt.transitionend.transition);var Pt=Ot("animationend"),jt=Ot("animationiteration"),Tt=Ot("animationstart"),_t=Ot("transitionend"),Nt=new Map,Rt=new Map,Mt=["abort","abort",Pt,"animationEnd",jt,"animationIteration",Tt,"animationStart","canplay","canPlay","canplaythrough","canPlayThrough","durationchange","durationChange","emptied","emptied","encrypted","encrypted","ended","ended","error","error","gotpointercapture","gotPointerCapture","load","load","loadeddata","loadedData","loadedmetadata","loadedMetadata","loadstart","loadStart","lostpointercapture","lostPointerCapture","playing","playing","progress","progress","seeking","seeking","stalled","stalled","suspend","suspend","timeupdate","timeUpdate",_t,"transitionEnd","waiting","waiting"];function Dt(e,t){for(var n=0;n<e.length;n+=2){var r=e[n],i=e[n+1];i="on"+(i[0].toUpperCase()+i.slice(1)),Rt.set(r,t),Nt.set(r,i),u(i,[r])}}(0,o.unstable_now)();var Lt=8;function It(e){if(0!=(1&e))return Lt=15,1;if(0!=(2&e))return Lt=14,2;if(0!=(4&e))return Lt=13,4;var t=24&e;return 0!==t?(Lt=12,t):0!=(32&e)?(Lt=11,32):0!=(t=192&e)?(Lt=10,t):0!=(256&e)?(Lt=9,256):0!=(t=3584&e)?(Lt=8,t):0!=(4096&e)?(Lt=7,4096):0!=(t=4186112&e)?(Lt=6,t):0!=(t=62914560&e)?(Lt=5,t):67108864&e?(Lt=4,67108864):0!=(134217728&e)?(Lt=3,134217728):0!=(t=805306368&e)?(Lt=2,t):0!=(1073741824&e)?(Lt=1,1073741824):(Lt=8,e)}function At(e,t){var n=e.pendingLanes;if(0===n)return Lt=0;var r=0,i=0,o=e.expiredLanes,a=e.suspendedLanes,l=e.pingedLanes;if(0!==o)r=o,i=Lt=15;else if(0!=(o=134217727&n)){var s=o&~a;0!==s?(r=It(s),i=Lt):0!=(l&=o)&&(r=It(l),i=Lt)}else 0!=(o=n&~a)?(r=It(o),i=Lt):0!==l&&(r=It(l),i=Lt);if(0===r)return 0;if(r=n&((0>(r=31-Bt(r))?0:1<<r)<<1)-1,0!==t&&t!==r&&0==(t&a)){if(It(t),i<=Lt)return t;Lt=i}if(0!==(t=e.entangledLanes))for(e=e.entanglements,t&=r;0<t;)i=1<<(n=31-Bt(t)),r|=e[n],t&=~i;return r}function Ft(e){return 0!=(e=-1073741825&e.pendingLanes)?e:1073741824&e?1073741824:0}function zt(e,t){switch(e){case 15:return 1;case 14:return 2;case 12:return 0===(e=Ut(24&~t))?zt(10,t):e;case 10:return 0===(e=Ut(192&~t))?zt(8,t):e;case 8:return 0===(e=Ut(3584&~t))&&0===(e=Ut(4186112&~t))&&(e=512),e;case 2:return 0===(t=Ut(805306368&~t))&&(t=268435456),t}throw Error(a(358,e))}function Ut(e){return e&-e}function $t(e){for(var t=[],n=0;31>n;n++)t.push(e);return t}function Vt(e,t,n){e.pendingLanes|=t;var r=t-1;e.suspendedLanes&=r,e.pingedLanes&=r,(e=e.eventTimes)[t=31-Bt(t)]=n}var Bt=Math.clz32?Math.clz32:function(e){return 0===e?32:31-(Wt(e)/qt|0)|0},Wt=Math.log,qt=Math.LN2,Ht=o.unstable_UserBlockingPriority,Qt=o.unstable_runWithPriority,Kt=!0;function Gt(e,t,n,r){Ie||De();var i=Xt,o=Ie;Ie=!0;try{Me(i,e,t,n,r)}finally{(Ie=o)||Fe()}}function Yt(e,t,n,r){Qt(Ht,Xt.bind(null,e,t,n,r))}function Xt(e,t,n,r){var i;if(Kt)if((i=0==(4&t))&&0<ot.length&&-1<ft.indexOf(e))e=pt(null,e,t,n,r),ot.push(e);else{var o=Jt(e,t,n,r);if(null===o)i&&ht(e,r);else{if(i){if(-1<ft.indexOf(e))return e=pt(o,e,t,n,r),void ot.push(e);if(function(e,t,n,r,i){switch(t){case"focusin":return at=vt(at,e,t,n,r,i),!0;case"dragenter":return lt=vt(lt,e,t,n,r,i),!0;case"mouseover":return st=vt(st,e,t,n,r,i),!0;case"pointerover":var o=i.pointerId;return ut.set(o,vt(ut.get(o)||null,e,t,n,r,i)),!0;case"gotpointercapture":return o=i.pointerId,ct.set(o,vt(ct.get(o)||null,e,t,n,r,i)),!0}return!1}(o,e,t,n,r))return;ht(e,r)}Nr(e,t,r,null,n)}}}function Jt(e,t,n,r){var i=Ce(r);if(null!==(i=Jr(i))){var o=Ge(i);if(null===o)i=null;else{var a=o.tag;if(13===a){if(null!==(i=Ye(o)))return i;i=null}else if(3===a){if(o.stateNode.hydrate)return 3===o.tag?o.stateNode.containerInfo:null;i=null}else o!==i&&(i=null)}}return Nr(e,t,r,i,n),null}var Zt=null,en=null,tn=null;function nn(){if(tn)return tn;var e,t,n=en,r=n.length,i="value"in Zt?Zt.value:Zt.textContent,o=i.length;for(e=0;e<r&&n[e]===i[e];e++);var a=r-e;for(t=1;t<=a&&n[r-t]===i[o-t];t++);return tn=i.slice(e,1<t?1-t:void 0)}function rn(e){var t=e.keyCode;return"charCode"in e?0===(e=e.charCode)&&13===t&&(e=13):e=t,10===e&&(e=13),32<=e||13===e?e:0}function on(){return!0}function an(){return!1}function ln(e){function t(t,n,r,i,o){for(var a in this._reactName=t,this._targetInst=r,this.type=n,this.nativeEvent=i,this.target=o,this.currentTarget=null,e)e.hasOwnProperty(a)&&(t=e[a],this[a]=t?t(i):i[a]);return this.isDefaultPrevented=(null!=i.defaultPrevented?i.defaultPrevented:!1===i.returnValue)?on:an,this.isPropagationStopped=an,this}return i(t.prototype,{preventDefault:function(){this.defaultPrevented=!0;var e=this.nativeEvent;e&&(e.preventDefault?e.preventDefault():"unknown"!=typeof e.returnValue&&(e.returnValue=!1),this.isDefaultPrevented=on)},stopPropagation:function(){var e=this.nativeEvent;e&&(e.stopPropagation?e.stopPropagation():"unknown"!=typeof e.cancelBubble&&(e.cancelBubble=!0),this.isPropagationStopped=on)},persist:function(){},isPersistent:on}),t}var sn,un,cn,dn={eventPhase:0,bubbles:0,cancelable:0,timeStamp:function(e){return e.timeStamp||Date.now()},defaultPrevented:0,isTrusted:0},fn=ln(dn),pn=i({},dn,{view:0,detail:0}),hn=ln(pn),vn=i({},pn,{screenX:0,screenY:0,clientX:0,clientY:0,pageX:0,pageY:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,getModifierState:On,button:0,buttons:0,relatedTarget:function(e){return void 0===e.relatedTarget?e.fromElement===e.srcElement?e.toElement:e.fromElement:e.relatedTarget},movementX:function(e){return"movementX"in e?e.movementX:(e!==cn&&(cn&&"mousemove"===e.type?(sn=e.screenX-cn.screenX,un=e.screenY-cn.screenY):un=sn=0,cn=e),sn)},movementY:function(e){return"movementY"in e?e.movementY:un}}),mn=ln(vn),gn=ln(i({},vn,{dataTransfer:0})),yn=ln(i({},pn,{relatedTarget:0})),bn=ln(i({},dn,{animationName:0,elapsedTime:0,pseudoElement:0})),wn=ln(i({},dn,{clipboardData:function(e){return"clipboardData"in e?e.clipboardData:window.clipboardData}})),Sn=ln(i({},dn,{data:0})),kn={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},xn={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},En={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function Cn(e){var t=this.nativeEvent;return t.getModifierState?t.getModifierState(e):!!(e=En[e])&&!!t[e]}function On(){return Cn}var Pn=ln(i({},pn,{key:function(e){if(e.key){var t=kn[e.key]||e.key;if("Unidentified"!==t)return t}return"keypress"===e.type?13===(e=rn(e))?"Enter":String.fromCharCode(e):"keydown"===e.type||"keyup"===e.type?xn[e.keyCode]||"Unidentified":""},code:0,location:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,repeat:0,locale:0,getModifierState:On,charCode:function(e){return"keypress"===e.type?rn(e):0},keyCode:function(e){return"keydown"===e.type||"keyup"===e.type?e.keyCode:0},which:function(e){return"keypress"===e.type?rn(e):"keydown"===e.type||"keyup"===e.type?e.keyCode:0}})),jn=ln(i({},vn,{pointerId:0,width:0,height:0,pressure:0,tangentialPressure:0,tiltX:0,tiltY:0,twist:0,pointerType:0,isPrimary:0})),Tn=ln(i({},pn,{touches:0,targetTouches:0,changedTouches:0,altKey:0,metaKey:0,ctrlKey:0,shiftKey:0,getModifierState:On})),_n=ln(i({},dn,{propertyName:0,elapsedTime:0,pseudoElement:0})),Nn=ln(i({},vn,{deltaX:function(e){return"deltaX"in e?e.deltaX:"wheelDeltaX"in e?-e.wheelDeltaX:0},deltaY:function(e){return"deltaY"in e?e.deltaY:"wheelDeltaY"in e?-e.wheelDeltaY:"wheelDelta"in e?-e.wheelDelta:0},deltaZ:0,deltaMode:0})),Rn=[9,13,27,32],Mn=d&&"CompositionEvent"in window,Dn=null;d&&"documentMode"in document&&(Dn=document.documentMode);var Ln=d&&"TextEvent"in window&&!Dn,In=d&&(!Mn||Dn&&8<Dn&&11>=Dn),An=String.fromCharCode(32),Fn=!1;function zn(e,t){switch(e){case"keyup":return-1!==Rn.indexOf(t.keyCode);case"keydown":return 229!==t.keyCode;case"keypress":case"mousedown":case"focusout":return!0;default:return!1}}function Un(e){return"object"==typeof(e=e.detail)&&"data"in e?e.data:null}var $n=!1,Vn={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function Bn(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return"input"===t?!!Vn[e.type]:"textarea"===t}function Wn(e,t,n,r){_e(r),0<(t=Mr(t,"onChange")).length&&(n=new fn("onChange","change",null,n,r),e.push({event:n,listeners:t}))}var qn=null,Hn=null;function Qn(e){Cr(e,0)}function Kn(e){if(X(ei(e)))return e}function Gn(e,t){if("change"===e)return t}var Yn=!1;if(d){var Xn;if(d){var Jn="oninput"in document;if(!Jn){var Zn=document.createElement("div");Zn.setAttribute("oninput","return;"),Jn="function"==typeof Zn.oninput}Xn=Jn}else Xn=!1;Yn=Xn&&(!document.documentMode||9<document.documentMode)}function er(){qn&&(qn.detachEvent("onpropertychange",tr),Hn=qn=null)}function tr(e){if("value"===e.propertyName&&Kn(Hn)){var t=[];if(Wn(t,Hn,e,Ce(e)),e=Qn,Ie)e(t);else{Ie=!0;try{Re(e,t)}finally{Ie=!1,Fe()}}}}function nr(e,t,n){"focusin"===e?(er(),Hn=n,(qn=t).attachEvent("onpropertychange",tr)):"focusout"===e&&er()}function rr(e){if("selectionchange"===e||"keyup"===e||"keydown"===e)return Kn(Hn)}function ir(e,t){if("click"===e)return Kn(t)}function or(e,t){if("input"===e||"change"===e)return Kn(t)}var ar="function"==typeof Object.is?Object.is:function(e,t){return e===t&&(0!==e||1/e==1/t)||e!=e&&t!=t},lr=Object.prototype.hasOwnProperty;function sr(e,t){if(ar(e,t))return!0;if("object"!=typeof e||null===e||"object"!=typeof t||null===t)return!1;var n=Object.keys(e),r=Object.keys(t);if(n.length!==r.length)return!1;for(r=0;r<n.length;r++)if(!lr.call(t,n[r])||!ar(e[n[r]],t[n[r]]))return!1;return!0}function ur(e){for(;e&&e.firstChild;)e=e.firstChild;return e}function cr(e,t){var n,r=ur(e);for(e=0;r;){if(3===r.nodeType){if(n=e+r.textContent.length,e<=t&&n>=t)return{node:r,offset:t-e};e=n}e:{for(;r;){if(r.nextSibling){r=r.nextSibling;break e}r=r.parentNode}r=void 0}r=ur(r)}}function dr(e,t){return!(!e||!t)&&(e===t||(!e||3!==e.nodeType)&&(t&&3===t.nodeType?dr(e,t.parentNode):"contains"in e?e.contains(t):!!e.compareDocumentPosition&&!!(16&e.compareDocumentPosition(t))))}function fr(){for(var e=window,t=J();t instanceof e.HTMLIFrameElement;){try{var n="string"==typeof t.contentWindow.location.href}catch(e){n=!1}if(!n)break;t=J((e=t.contentWindow).document)}return t}function pr(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t&&("input"===t&&("text"===e.type||"search"===e.type||"tel"===e.type||"url"===e.type||"password"===e.type)||"textarea"===t||"true"===e.contentEditable)}var hr=d&&"documentMode"in document&&11>=document.documentMode,vr=null,mr=null,gr=null,yr=!1;function br(e,t,n){var r=n.window===n?n.document:9===n.nodeType?n:n.ownerDocument;yr||null==vr||vr!==J(r)||(r="selectionStart"in(r=vr)&&pr(r)?{start:r.selectionStart,end:r.selectionEnd}:{anchorNode:(r=(r.ownerDocument&&r.ownerDocument.defaultView||window).getSelection()).anchorNode,anchorOffset:r.anchorOffset,focusNode:r.focusNode,focusOffset:r.focusOffset},gr&&sr(gr,r)||(gr=r,0<(r=Mr(mr,"onSelect")).length&&(t=new fn("onSelect","select",null,t,n),e.push({event:t,listeners:r}),t.target=vr)))}Dt("cancel cancel click click close close contextmenu contextMenu copy copy cut cut auxclick auxClick dblclick doubleClick dragend dragEnd dragstart dragStart drop drop focusin focus focusout blur input input invalid invalid keydown keyDown keypress keyPress keyup keyUp mousedown mouseDown mouseup mouseUp paste paste pause pause play play pointercancel pointerCancel pointerdown pointerDown pointerup pointerUp ratechange rateChange reset reset seeked seeked submit submit touchcancel touchCancel touchend touchEnd touchstart touchStart volumechange volumeChange".split(" "),0),Dt("drag drag dragenter dragEnter dragexit dragExit dragleave dragLeave dragover dragOver mousemove mouseMove mouseout mouseOut mouseover mouseOver pointermove pointerMove pointerout pointerOut pointerover pointerOver scroll scroll toggle toggle touchmove touchMove wheel wheel".split(" "),1),Dt(Mt,2);for(var wr="change selectionchange textInput compositionstart compositionend compositionupdate".split(" "),Sr=0;Sr<wr.length;Sr++)Rt.set(wr[Sr],0);c("onMouseEnter",["mouseout","mouseover"]),c("onMouseLeave",["mouseout","mouseover"]),c("onPointerEnter",["pointerout","pointerover"]),c("onPointerLeave",["pointerout","pointerover"]),u("onChange","change click focusin focusout input keydown keyup selectionchange".split(" ")),u("onSelect","focusout contextmenu dragend focusin keydown keyup mousedown mouseup selectionchange".split(" ")),u("onBeforeInput",["compositionend","keypress","textInput","paste"]),u("onCompositionEnd","compositionend focusout keydown keypress keyup mousedown".split(" ")),u("onCompositionStart","compositionstart focusout keydown keypress keyup mousedown".split(" ")),u("onCompositionUpdate","compositionupdate focusout keydown keypress keyup mousedown".split(" "));var kr="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),xr=new Set("cancel close invalid load scroll toggle".split(" ").concat(kr));function Er(e,t,n){var r=e.type||"unknown-event";e.currentTarget=n,function(e,t,n,r,i,o,l,s,u){if(Ke.apply(this,arguments),Be){if(!Be)throw Error(a(198));var c=We;Be=!1,We=null,qe||(qe=!0,He=c)}}(r,t,void 0,e),e.currentTarget=null}function Cr(e,t){t=0!=(4&t);for(var n=0;n<e.length;n++){var r=e[n],i=r.event;r=r.listeners;e:{var o=void 0;if(t)for(var a=r.length-1;0<=a;a--){var l=r[a],s=l.instance,u=l.currentTarget;if(l=l.listener,s!==o&&i.isPropagationStopped())break e;Er(i,l,u),o=s}else for(a=0;a<r.length;a++){if(s=(l=r[a]).instance,u=l.currentTarget,l=l.listener,s!==o&&i.isPropagationStopped())break e;Er(i,l,u),o=s}}}if(qe)throw e=He,qe=!1,He=null,e}function Or(e,t){var n=ni(t),r=e+"__bubble";n.has(r)||(_r(t,e,2,!1),n.add(r))}var Pr="_reactListening"+Math.random().toString(36).slice(2);function jr(e){e[Pr]||(e[Pr]=!0,l.forEach((function(t){xr.has(t)||Tr(t,!1,e,null),Tr(t,!0,e,null)})))}function Tr(e,t,n,r){var i=4<arguments.length&&void 0!==arguments[4]?arguments[4]:0,o=n;if("selectionchange"===e&&9!==n.nodeType&&(o=n.ownerDocument),null!==r&&!t&&xr.has(e)){if("scroll"!==e)return;i|=2,o=r}var a=ni(o),l=e+"__"+(t?"capture":"bubble");a.has(l)||(t&&(i|=4),_r(o,e,i,t),a.add(l))}function _r(e,t,n,r){var i=Rt.get(t);switch(void 0===i?2:i){case 0:i=Gt;break;case 1:i=Yt;break;default:i=Xt}n=i.bind(null,t,n,e),i=void 0,!Ue||"touchstart"!==t&&"touchmove"!==t&&"wheel"!==t||(i=!0),r?void 0!==i?e.addEventListener(t,n,{capture:!0,passive:i}):e.addEventListener(t,n,!0):void 0!==i?e.addEventListener(t,n,{passive:i}):e.addEventListener(t,n,!1)}function Nr(e,t,n,r,i){var o=r;if(0==(1&t)&&0==(2&t)&&null!==r)e:for(;;){if(null===r)return;var a=r.tag;if(3===a||4===a){var l=r.stateNode.containerInfo;if(l===i||8===l.nodeType&&l.parentNode===i)break;if(4===a)for(a=r.return;null!==a;){var s=a.tag;if((3===s||4===s)&&((s=a.stateNode.containerInfo)===i||8===s.nodeType&&s.parentNode===i))return;a=a.return}for(;null!==l;){if(null===(a=Jr(l)))return;if(5===(s=a.tag)||6===s){r=o=a;continue e}l=l.parentNode}}r=r.return}!function(e,t,n){if(Ae)return e();Ae=!0;try{Le(e,t,n)}finally{Ae=!1,Fe()}}((function(){var r=o,i=Ce(n),a=[];e:{var l=Nt.get(e);if(void 0!==l){var s=fn,u=e;switch(e){case"keypress":if(0===rn(n))break e;case"keydown":case"keyup":s=Pn;break;case"focusin":u="focus",s=yn;break;case"focusout":u="blur",s=yn;break;case"beforeblur":case"afterblur":s=yn;break;case"click":if(2===n.button)break e;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":s=mn;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":s=gn;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":s=Tn;break;case Pt:case jt:case Tt:s=bn;break;case _t:s=_n;break;case"scroll":s=hn;break;case"wheel":s=Nn;break;case"copy":case"cut":case"paste":s=wn;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":s=jn}var c=0!=(4&t),d=!c&&"scroll"===e,f=c?null!==l?l+"Capture":null:l;c=[];for(var p,h=r;null!==h;){var v=(p=h).stateNode;if(5===p.tag&&null!==v&&(p=v,null!==f&&null!=(v=ze(h,f))&&c.push(Rr(h,v,p))),d)break;h=h.return}0<c.length&&(l=new s(l,u,null,n,i),a.push({event:l,listeners:c}))}}if(0==(7&t)){if(s="mouseout"===e||"pointerout"===e,(!(l="mouseover"===e||"pointerover"===e)||0!=(16&t)||!(u=n.relatedTarget||n.fromElement)||!Jr(u)&&!u[Yr])&&(s||l)&&(l=i.window===i?i:(l=i.ownerDocument)?l.defaultView||l.parentWindow:window,s?(s=r,null!==(u=(u=n.relatedTarget||n.toElement)?Jr(u):null)&&(u!==(d=Ge(u))||5!==u.tag&&6!==u.tag)&&(u=null)):(s=null,u=r),s!==u)){if(c=mn,v="onMouseLeave",f="onMouseEnter",h="mouse","pointerout"!==e&&"pointerover"!==e||(c=jn,v="onPointerLeave",f="onPointerEnter",h="pointer"),d=null==s?l:ei(s),p=null==u?l:ei(u),(l=new c(v,h+"leave",s,n,i)).target=d,l.relatedTarget=p,v=null,Jr(i)===r&&((c=new c(f,h+"enter",u,n,i)).target=p,c.relatedTarget=d,v=c),d=v,s&&u)e:{for(f=u,h=0,p=c=s;p;p=Dr(p))h++;for(p=0,v=f;v;v=Dr(v))p++;for(;0<h-p;)c=Dr(c),h--;for(;0<p-h;)f=Dr(f),p--;for(;h--;){if(c===f||null!==f&&c===f.alternate)break e;c=Dr(c),f=Dr(f)}c=null}else c=null;null!==s&&Lr(a,l,s,c,!1),null!==u&&null!==d&&Lr(a,d,u,c,!0)}if("select"===(s=(l=r?ei(r):window).nodeName&&l.nodeName.toLowerCase())||"input"===s&&"file"===l.type)var m=Gn;else if(Bn(l))if(Yn)m=or;else{m=rr;var g=nr}else(s=l.nodeName)&&"input"===s.toLowerCase()&&("checkbox"===l.type||"radio"===l.type)&&(m=ir);switch(m&&(m=m(e,r))?Wn(a,m,n,i):(g&&g(e,l,r),"focusout"===e&&(g=l._wrapperState)&&g.controlled&&"number"===l.type&&ie(l,"number",l.value)),g=r?ei(r):window,e){case"focusin":(Bn(g)||"true"===g.contentEditable)&&(vr=g,mr=r,gr=null);break;case"focusout":gr=mr=vr=null;break;case"mousedown":yr=!0;break;case"contextmenu":case"mouseup":case"dragend":yr=!1,br(a,n,i);break;case"selectionchange":if(hr)break;case"keydown":case"keyup":br(a,n,i)}var y;if(Mn)e:{switch(e){case"compositionstart":var b="onCompositionStart";break e;case"compositionend":b="onCompositionEnd";break e;case"compositionupdate":b="onCompositionUpdate";break e}b=void 0}else $n?zn(e,n)&&(b="onCompositionEnd"):"keydown"===e&&229===n.keyCode&&(b="onCompositionStart");b&&(In&&"ko"!==n.locale&&($n||"onCompositionStart"!==b?"onCompositionEnd"===b&&$n&&(y=nn()):(en="value"in(Zt=i)?Zt.value:Zt.textContent,$n=!0)),0<(g=Mr(r,b)).length&&(b=new Sn(b,e,null,n,i),a.push({event:b,listeners:g}),(y||null!==(y=Un(n)))&&(b.data=y))),(y=Ln?function(e,t){switch(e){case"compositionend":return Un(t);case"keypress":return 32!==t.which?null:(Fn=!0,An);case"textInput":return(e=t.data)===An&&Fn?null:e;default:return null}}(e,n):function(e,t){if($n)return"compositionend"===e||!Mn&&zn(e,t)?(e=nn(),tn=en=Zt=null,$n=!1,e):null;switch(e){case"paste":return null;case"keypress":if(!(t.ctrlKey||t.altKey||t.metaKey)||t.ctrlKey&&t.altKey){if(t.char&&1<t.char.length)return t.char;if(t.which)return String.fromCharCode(t.which)}return null;case"compositionend":return In&&"ko"!==t.locale?null:t.data;default:return null}}(e,n))&&0<(r=Mr(r,"onBeforeInput")).length&&(i=new Sn("onBeforeInput","beforeinput",null,n,i),a.push({event:i,listeners:r}),i.data=y)}Cr(a,t)}))}function Rr(e,t,n){return{instance:e,listener:t,currentTarget:n}}function Mr(e,t){for(var n=t+"Capture",r=[];null!==e;){var i=e,o=i.stateNode;5===i.tag&&null!==o&&(i=o,null!=(o=ze(e,n))&&r.unshift(Rr(e,o,i)),null!=(o=ze(e,t))&&r.push(Rr(e,o,i))),e=e.return}return r}function Dr(e){if(null===e)return null;do{e=e.return}while(e&&5!==e.tag);return e||null}function Lr(e,t,n,r,i){for(var o=t._reactName,a=[];null!==n&&n!==r;){var l=n,s=l.alternate,u=l.stateNode;if(null!==s&&s===r)break;5===l.tag&&null!==u&&(l=u,i?null!=(s=ze(n,o))&&a.unshift(Rr(n,s,l)):i||null!=(s=ze(n,o))&&a.push(Rr(n,s,l))),n=n.return}0!==a.length&&e.push({event:t,listeners:a})}function Ir(){}var Ar=null,Fr=null;function zr(e,t){switch(e){case"button":case"input":case"select":case"textarea":return!!t.autoFocus}return!1}function Ur(e,t){return"textarea"===e||"option"===e||"noscript"===e||"string"==typeof t.children||"number"==typeof t.children||"object"==typeof t.dangerouslySetInnerHTML&&null!==t.dangerouslySetInnerHTML&&null!=t.dangerouslySetInnerHTML.__html}var $r="function"==typeof setTimeout?setTimeout:void 0,Vr="function"==typeof clearTimeout?clearTimeout:void 0;function Br(e){(1===e.nodeType||9===e.nodeType&&null!=(e=e.body))&&(e.textContent="")}function Wr(e){for(;null!=e;e=e.nextSibling){var t=e.nodeType;if(1===t||3===t)break}return e}function qr(e){e=e.previousSibling;for(var t=0;e;){if(8===e.nodeType){var n=e.data;if("$"===n||"$!"===n||"$?"===n){if(0===t)return e;t--}else"/$"===n&&t++}e=e.previousSibling}return null}var Hr=0,Qr=Math.random().toString(36).slice(2),Kr="__reactFiber$"+Qr,Gr="__reactProps$"+Qr,Yr="__reactContainer$"+Qr,Xr="__reactEvents$"+Qr;function Jr(e){var t=e[Kr];if(t)return t;for(var n=e.parentNode;n;){if(t=n[Yr]||n[Kr]){if(n=t.alternate,null!==t.child||null!==n&&null!==n.child)for(e=qr(e);null!==e;){if(n=e[Kr])return n;e=qr(e)}return t}n=(e=n).parentNode}return null}function Zr(e){return!(e=e[Kr]||e[Yr])||5!==e.tag&&6!==e.tag&&13!==e.tag&&3!==e.tag?null:e}function ei(e){if(5===e.tag||6===e.tag)return e.stateNode;throw Error(a(33))}function ti(e){return e[Gr]||null}function ni(e){var t=e[Xr];return void 0===t&&(t=e[Xr]=new Set),t}var ri=[],ii=-1;function oi(e){return{current:e}}function ai(e){0>ii||(e.current=ri[ii],ri[ii]=null,ii--)}function li(e,t){ii++,ri[ii]=e.current,e.current=t}var si={},ui=oi(si),ci=oi(!1),di=si;function fi(e,t){var n=e.type.contextTypes;if(!n)return si;var r=e.stateNode;if(r&&r.__reactInternalMemoizedUnmaskedChildContext===t)return r.__reactInternalMemoizedMaskedChildContext;var i,o={};for(i in n)o[i]=t[i];return r&&((e=e.stateNode).__reactInternalMemoizedUnmaskedChildContext=t,e.__reactInternalMemoizedMaskedChildContext=o),o}function pi(e){return null!=e.childContextTypes}function hi(){ai(ci),ai(ui)}function vi(e,t,n){if(ui.current!==si)throw Error(a(168));li(ui,t),li(ci,n)}function mi(e,t,n){var r=e.stateNode;if(e=t.childContextTypes,"function"!=typeof r.getChildContext)return n;for(var o in r=r.getChildContext())if(!(o in e))throw Error(a(108,Q(t)||"Unknown",o));return i({},n,r)}function gi(e){return e=(e=e.stateNode)&&e.__reactInternalMemoizedMergedChildContext||si,di=ui.current,li(ui,e),li(ci,ci.current),!0}function yi(e,t,n){var r=e.stateNode;if(!r)throw Error(a(169));n?(e=mi(e,t,di),r.__reactInternalMemoizedMergedChildContext=e,ai(ci),ai(ui),li(ui,e)):ai(ci),li(ci,n)}var bi=null,wi=null,Si=o.unstable_runWithPriority,ki=o.unstable_scheduleCallback,xi=o.unstable_cancelCallback,Ei=o.unstable_shouldYield,Ci=o.unstable_requestPaint,Oi=o.unstable_now,Pi=o.unstable_getCurrentPriorityLevel,ji=o.unstable_ImmediatePriority,Ti=o.unstable_UserBlockingPriority,_i=o.unstable_NormalPriority,Ni=o.unstable_LowPriority,Ri=o.unstable_IdlePriority,Mi={},Di=void 0!==Ci?Ci:function(){},Li=null,Ii=null,Ai=!1,Fi=Oi(),zi=1e4>Fi?Oi:function(){return Oi()-Fi};function Ui(){switch(Pi()){case ji:return 99;case Ti:return 98;case _i:return 97;case Ni:return 96;case Ri:return 95;default:throw Error(a(332))}}function $i(e){switch(e){case 99:return ji;case 98:return Ti;case 97:return _i;case 96:return Ni;case 95:return Ri;default:throw Error(a(332))}}function Vi(e,t){return e=$i(e),Si(e,t)}function Bi(e,t,n){return e=$i(e),ki(e,t,n)}function Wi(){if(null!==Ii){var e=Ii;Ii=null,xi(e)}qi()}function qi(){if(!Ai&&null!==Li){Ai=!0;var e=0;try{var t=Li;Vi(99,(function(){for(;e<t.length;e++){var n=t[e];do{n=n(!0)}while(null!==n)}})),Li=null}catch(t){throw null!==Li&&(Li=Li.slice(e+1)),ki(ji,Wi),t}finally{Ai=!1}}}var Hi=S.ReactCurrentBatchConfig;function Qi(e,t){if(e&&e.defaultProps){for(var n in t=i({},t),e=e.defaultProps)void 0===t[n]&&(t[n]=e[n]);return t}return t}var Ki=oi(null),Gi=null,Yi=null,Xi=null;function Ji(){Xi=Yi=Gi=null}function Zi(e){var t=Ki.current;ai(Ki),e.type._context._currentValue=t}function eo(e,t){for(;null!==e;){var n=e.alternate;if((e.childLanes&t)===t){if(null===n||(n.childLanes&t)===t)break;n.childLanes|=t}else e.childLanes|=t,null!==n&&(n.childLanes|=t);e=e.return}}function to(e,t){Gi=e,Xi=Yi=null,null!==(e=e.dependencies)&&null!==e.firstContext&&(0!=(e.lanes&t)&&(Ma=!0),e.firstContext=null)}function no(e,t){if(Xi!==e&&!1!==t&&0!==t)if("number"==typeof t&&1073741823!==t||(Xi=e,t=1073741823),t={context:e,observedBits:t,next:null},null===Yi){if(null===Gi)throw Error(a(308));Yi=t,Gi.dependencies={lanes:0,firstContext:t,responders:null}}else Yi=Yi.next=t;return e._currentValue}var ro=!1;function io(e){e.updateQueue={baseState:e.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null},effects:null}}function oo(e,t){e=e.updateQueue,t.updateQueue===e&&(t.updateQueue={baseState:e.baseState,firstBaseUpdate:e.firstBaseUpdate,lastBaseUpdate:e.lastBaseUpdate,shared:e.shared,effects:e.effects})}function ao(e,t){return{eventTime:e,lane:t,tag:0,payload:null,callback:null,next:null}}function lo(e,t){if(null!==(e=e.updateQueue)){var n=(e=e.shared).pending;null===n?t.next=t:(t.next=n.next,n.next=t),e.pending=t}}function so(e,t){var n=e.updateQueue,r=e.alternate;if(null!==r&&n===(r=r.updateQueue)){var i=null,o=null;if(null!==(n=n.firstBaseUpdate)){do{var a={eventTime:n.eventTime,lane:n.lane,tag:n.tag,payload:n.payload,callback:n.callback,next:null};null===o?i=o=a:o=o.next=a,n=n.next}while(null!==n);null===o?i=o=t:o=o.next=t}else i=o=t;return n={baseState:r.baseState,firstBaseUpdate:i,lastBaseUpdate:o,shared:r.shared,effects:r.effects},void(e.updateQueue=n)}null===(e=n.lastBaseUpdate)?n.firstBaseUpdate=t:e.next=t,n.lastBaseUpdate=t}function uo(e,t,n,r){var o=e.updateQueue;ro=!1;var a=o.firstBaseUpdate,l=o.lastBaseUpdate,s=o.shared.pending;if(null!==s){o.shared.pending=null;var u=s,c=u.next;u.next=null,null===l?a=c:l.next=c,l=u;var d=e.alternate;if(null!==d){var f=(d=d.updateQueue).lastBaseUpdate;f!==l&&(null===f?d.firstBaseUpdate=c:f.next=c,d.lastBaseUpdate=u)}}if(null!==a){for(f=o.baseState,l=0,d=c=u=null;;){s=a.lane;var p=a.eventTime;if((r&s)===s){null!==d&&(d=d.next={eventTime:p,lane:0,tag:a.tag,payload:a.payload,callback:a.callback,next:null});e:{var h=e,v=a;switch(s=t,p=n,v.tag){case 1:if("function"==typeof(h=v.payload)){f=h.call(p,f,s);break e}f=h;break e;case 3:h.flags=-4097&h.flags|64;case 0:if(null==(s="function"==typeof(h=v.payload)?h.call(p,f,s):h))break e;f=i({},f,s);break e;case 2:ro=!0}}null!==a.callback&&(e.flags|=32,null===(s=o.effects)?o.effects=[a]:s.push(a))}else p={eventTime:p,lane:s,tag:a.tag,payload:a.payload,callback:a.callback,next:null},null===d?(c=d=p,u=f):d=d.next=p,l|=s;if(null===(a=a.next)){if(null===(s=o.shared.pending))break;a=s.next,s.next=null,o.lastBaseUpdate=s,o.shared.pending=null}}null===d&&(u=f),o.baseState=u,o.firstBaseUpdate=c,o.lastBaseUpdate=d,Ll|=l,e.lanes=l,e.memoizedState=f}}function co(e,t,n){if(e=t.effects,t.effects=null,null!==e)for(t=0;t<e.length;t++){var r=e[t],i=r.callback;if(null!==i){if(r.callback=null,r=n,"function"!=typeof i)throw Error(a(191,i));i.call(r)}}}var fo=(new r.Component).refs;function po(e,t,n,r){n=null==(n=n(r,t=e.memoizedState))?t:i({},t,n),e.memoizedState=n,0===e.lanes&&(e.updateQueue.baseState=n)}var ho={isMounted:function(e){return!!(e=e._reactInternals)&&Ge(e)===e},enqueueSetState:function(e,t,n){e=e._reactInternals;var r=as(),i=ls(e),o=ao(r,i);o.payload=t,null!=n&&(o.callback=n),lo(e,o),ss(e,i,r)},enqueueReplaceState:function(e,t,n){e=e._reactInternals;var r=as(),i=ls(e),o=ao(r,i);o.tag=1,o.payload=t,null!=n&&(o.callback=n),lo(e,o),ss(e,i,r)},enqueueForceUpdate:function(e,t){e=e._reactInternals;var n=as(),r=ls(e),i=ao(n,r);i.tag=2,null!=t&&(i.callback=t),lo(e,i),ss(e,r,n)}};function vo(e,t,n,r,i,o,a){return"function"==typeof(e=e.stateNode).shouldComponentUpdate?e.shouldComponentUpdate(r,o,a):!(t.prototype&&t.prototype.isPureReactComponent&&sr(n,r)&&sr(i,o))}function mo(e,t,n){var r=!1,i=si,o=t.contextType;return"object"==typeof o&&null!==o?o=no(o):(i=pi(t)?di:ui.current,o=(r=null!=(r=t.contextTypes))?fi(e,i):si),t=new t(n,o),e.memoizedState=null!==t.state&&void 0!==t.state?t.state:null,t.updater=ho,e.stateNode=t,t._reactInternals=e,r&&((e=e.stateNode).__reactInternalMemoizedUnmaskedChildContext=i,e.__reactInternalMemoizedMaskedChildContext=o),t}function go(e,t,n,r){e=t.state,"function"==typeof t.componentWillReceiveProps&&t.componentWillReceiveProps(n,r),"function"==typeof t.UNSAFE_componentWillReceiveProps&&t.UNSAFE_componentWillReceiveProps(n,r),t.state!==e&&ho.enqueueReplaceState(t,t.state,null)}function yo(e,t,n,r){var i=e.stateNode;i.props=n,i.state=e.memoizedState,i.refs=fo,io(e);var o=t.contextType;"object"==typeof o&&null!==o?i.context=no(o):(o=pi(t)?di:ui.current,i.context=fi(e,o)),uo(e,n,i,r),i.state=e.memoizedState,"function"==typeof(o=t.getDerivedStateFromProps)&&(po(e,t,o,n),i.state=e.memoizedState),"function"==typeof t.getDerivedStateFromProps||"function"==typeof i.getSnapshotBeforeUpdate||"function"!=typeof i.UNSAFE_componentWillMount&&"function"!=typeof i.componentWillMount||(t=i.state,"function"==typeof i.componentWillMount&&i.componentWillMount(),"function"==typeof i.UNSAFE_componentWillMount&&i.UNSAFE_componentWillMount(),t!==i.state&&ho.enqueueReplaceState(i,i.state,null),uo(e,n,i,r),i.state=e.memoizedState),"function"==typeof i.componentDidMount&&(e.flags|=4)}var bo=Array.isArray;function wo(e,t,n){if(null!==(e=n.ref)&&"function"!=typeof e&&"object"!=typeof e){if(n._owner){if(n=n._owner){if(1!==n.tag)throw Error(a(309));var r=n.stateNode}if(!r)throw Error(a(147,e));var i=""+e;return null!==t&&null!==t.ref&&"function"==typeof t.ref&&t.ref._stringRef===i?t.ref:((t=function(e){var t=r.refs;t===fo&&(t=r.refs={}),null===e?delete t[i]:t[i]=e})._stringRef=i,t)}if("string"!=typeof e)throw Error(a(284));if(!n._owner)throw Error(a(290,e))}return e}function So(e,t){if("textarea"!==e.type)throw Error(a(31,"[object Object]"===Object.prototype.toString.call(t)?"object with keys {"+Object.keys(t).join(", ")+"}":t))}function ko(e){function t(t,n){if(e){var r=t.lastEffect;null!==r?(r.nextEffect=n,t.lastEffect=n):t.firstEffect=t.lastEffect=n,n.nextEffect=null,n.flags=8}}function n(n,r){if(!e)return null;for(;null!==r;)t(n,r),r=r.sibling;return null}function r(e,t){for(e=new Map;null!==t;)null!==t.key?e.set(t.key,t):e.set(t.index,t),t=t.sibling;return e}function i(e,t){return(e=Us(e,t)).index=0,e.sibling=null,e}function o(t,n,r){return t.index=r,e?null!==(r=t.alternate)?(r=r.index)<n?(t.flags=2,n):r:(t.flags=2,n):n}function l(t){return e&&null===t.alternate&&(t.flags=2),t}function s(e,t,n,r){return null===t||6!==t.tag?((t=Ws(n,e.mode,r)).return=e,t):((t=i(t,n)).return=e,t)}function u(e,t,n,r){return null!==t&&t.elementType===n.type?((r=i(t,n.props)).ref=wo(e,t,n),r.return=e,r):((r=$s(n.type,n.key,n.props,null,e.mode,r)).ref=wo(e,t,n),r.return=e,r)}function c(e,t,n,r){return null===t||4!==t.tag||t.stateNode.containerInfo!==n.containerInfo||t.stateNode.implementation!==n.implementation?((t=qs(n,e.mode,r)).return=e,t):((t=i(t,n.children||[])).return=e,t)}function d(e,t,n,r,o){return null===t||7!==t.tag?((t=Vs(n,e.mode,r,o)).return=e,t):((t=i(t,n)).return=e,t)}function f(e,t,n){if("string"==typeof t||"number"==typeof t)return(t=Ws(""+t,e.mode,n)).return=e,t;if("object"==typeof t&&null!==t){switch(t.$$typeof){case k:return(n=$s(t.type,t.key,t.props,null,e.mode,n)).ref=wo(e,null,t),n.return=e,n;case x:return(t=qs(t,e.mode,n)).return=e,t}if(bo(t)||V(t))return(t=Vs(t,e.mode,n,null)).return=e,t;So(e,t)}return null}function p(e,t,n,r){var i=null!==t?t.key:null;if("string"==typeof n||"number"==typeof n)return null!==i?null:s(e,t,""+n,r);if("object"==typeof n&&null!==n){switch(n.$$typeof){case k:return n.key===i?n.type===E?d(e,t,n.props.children,r,i):u(e,t,n,r):null;case x:return n.key===i?c(e,t,n,r):null}if(bo(n)||V(n))return null!==i?null:d(e,t,n,r,null);So(e,n)}return null}function h(e,t,n,r,i){if("string"==typeof r||"number"==typeof r)return s(t,e=e.get(n)||null,""+r,i);if("object"==typeof r&&null!==r){switch(r.$$typeof){case k:return e=e.get(null===r.key?n:r.key)||null,r.type===E?d(t,e,r.props.children,i,r.key):u(t,e,r,i);case x:return c(t,e=e.get(null===r.key?n:r.key)||null,r,i)}if(bo(r)||V(r))return d(t,e=e.get(n)||null,r,i,null);So(t,r)}return null}function v(i,a,l,s){for(var u=null,c=null,d=a,v=a=0,m=null;null!==d&&v<l.length;v++){d.index>v?(m=d,d=null):m=d.sibling;var g=p(i,d,l[v],s);if(null===g){null===d&&(d=m);break}e&&d&&null===g.alternate&&t(i,d),a=o(g,a,v),null===c?u=g:c.sibling=g,c=g,d=m}if(v===l.length)return n(i,d),u;if(null===d){for(;v<l.length;v++)null!==(d=f(i,l[v],s))&&(a=o(d,a,v),null===c?u=d:c.sibling=d,c=d);return u}for(d=r(i,d);v<l.length;v++)null!==(m=h(d,i,v,l[v],s))&&(e&&null!==m.alternate&&d.delete(null===m.key?v:m.key),a=o(m,a,v),null===c?u=m:c.sibling=m,c=m);return e&&d.forEach((function(e){return t(i,e)})),u}function m(i,l,s,u){var c=V(s);if("function"!=typeof c)throw Error(a(150));if(null==(s=c.call(s)))throw Error(a(151));for(var d=c=null,v=l,m=l=0,g=null,y=s.next();null!==v&&!y.done;m++,y=s.next()){v.index>m?(g=v,v=null):g=v.sibling;var b=p(i,v,y.value,u);if(null===b){null===v&&(v=g);break}e&&v&&null===b.alternate&&t(i,v),l=o(b,l,m),null===d?c=b:d.sibling=b,d=b,v=g}if(y.done)return n(i,v),c;if(null===v){for(;!y.done;m++,y=s.next())null!==(y=f(i,y.value,u))&&(l=o(y,l,m),null===d?c=y:d.sibling=y,d=y);return c}for(v=r(i,v);!y.done;m++,y=s.next())null!==(y=h(v,i,m,y.value,u))&&(e&&null!==y.alternate&&v.delete(null===y.key?m:y.key),l=o(y,l,m),null===d?c=y:d.sibling=y,d=y);return e&&v.forEach((function(e){return t(i,e)})),c}return function(e,r,o,s){var u="object"==typeof o&&null!==o&&o.type===E&&null===o.key;u&&(o=o.props.children);var c="object"==typeof o&&null!==o;if(c)switch(o.$$typeof){case k:e:{for(c=o.key,u=r;null!==u;){if(u.key===c){switch(u.tag){case 7:if(o.type===E){n(e,u.sibling),(r=i(u,o.props.children)).return=e,e=r;break e}break;default:if(u.elementType===o.type){n(e,u.sibling),(r=i(u,o.props)).ref=wo(e,u,o),r.return=e,e=r;break e}}n(e,u);break}t(e,u),u=u.sibling}o.type===E?((r=Vs(o.props.children,e.mode,s,o.key)).return=e,e=r):((s=$s(o.type,o.key,o.props,null,e.mode,s)).ref=wo(e,r,o),s.return=e,e=s)}return l(e);case x:e:{for(u=o.key;null!==r;){if(r.key===u){if(4===r.tag&&r.stateNode.containerInfo===o.containerInfo&&r.stateNode.implementation===o.implementation){n(e,r.sibling),(r=i(r,o.children||[])).return=e,e=r;break e}n(e,r);break}t(e,r),r=r.sibling}(r=qs(o,e.mode,s)).return=e,e=r}return l(e)}if("string"==typeof o||"number"==typeof o)return o=""+o,null!==r&&6===r.tag?(n(e,r.sibling),(r=i(r,o)).return=e,e=r):(n(e,r),(r=Ws(o,e.mode,s)).return=e,e=r),l(e);if(bo(o))return v(e,r,o,s);if(V(o))return m(e,r,o,s);if(c&&So(e,o),void 0===o&&!u)switch(e.tag){case 1:case 22:case 0:case 11:case 15:throw Error(a(152,Q(e.type)||"Component"))}return n(e,r)}}var xo=ko(!0),Eo=ko(!1),Co={},Oo=oi(Co),Po=oi(Co),jo=oi(Co);function To(e){if(e===Co)throw Error(a(174));return e}function _o(e,t){switch(li(jo,t),li(Po,e),li(Oo,Co),e=t.nodeType){case 9:case 11:t=(t=t.documentElement)?t.namespaceURI:pe(null,"");break;default:t=pe(t=(e=8===e?t.parentNode:t).namespaceURI||null,e=e.tagName)}ai(Oo),li(Oo,t)}function No(){ai(Oo),ai(Po),ai(jo)}function Ro(e){To(jo.current);var t=To(Oo.current),n=pe(t,e.type);t!==n&&(li(Po,e),li(Oo,n))}function Mo(e){Po.current===e&&(ai(Oo),ai(Po))}var Do=oi(0);function Lo(e){for(var t=e;null!==t;){if(13===t.tag){var n=t.memoizedState;if(null!==n&&(null===(n=n.dehydrated)||"$?"===n.data||"$!"===n.data))return t}else if(19===t.tag&&void 0!==t.memoizedProps.revealOrder){if(0!=(64&t.flags))return t}else if(null!==t.child){t.child.return=t,t=t.child;continue}if(t===e)break;for(;null===t.sibling;){if(null===t.return||t.return===e)return null;t=t.return}t.sibling.return=t.return,t=t.sibling}return null}var Io=null,Ao=null,Fo=!1;function zo(e,t){var n=Fs(5,null,null,0);n.elementType="DELETED",n.type="DELETED",n.stateNode=t,n.return=e,n.flags=8,null!==e.lastEffect?(e.lastEffect.nextEffect=n,e.lastEffect=n):e.firstEffect=e.lastEffect=n}function Uo(e,t){switch(e.tag){case 5:var n=e.type;return null!==(t=1!==t.nodeType||n.toLowerCase()!==t.nodeName.toLowerCase()?null:t)&&(e.stateNode=t,!0);case 6:return null!==(t=""===e.pendingProps||3!==t.nodeType?null:t)&&(e.stateNode=t,!0);case 13:default:return!1}}function $o(e){if(Fo){var t=Ao;if(t){var n=t;if(!Uo(e,t)){if(!(t=Wr(n.nextSibling))||!Uo(e,t))return e.flags=-1025&e.flags|2,Fo=!1,void(Io=e);zo(Io,n)}Io=e,Ao=Wr(t.firstChild)}else e.flags=-1025&e.flags|2,Fo=!1,Io=e}}function Vo(e){for(e=e.return;null!==e&&5!==e.tag&&3!==e.tag&&13!==e.tag;)e=e.return;Io=e}function Bo(e){if(e!==Io)return!1;if(!Fo)return Vo(e),Fo=!0,!1;var t=e.type;if(5!==e.tag||"head"!==t&&"body"!==t&&!Ur(t,e.memoizedProps))for(t=Ao;t;)zo(e,t),t=Wr(t.nextSibling);if(Vo(e),13===e.tag){if(!(e=null!==(e=e.memoizedState)?e.dehydrated:null))throw Error(a(317));e:{for(e=e.nextSibling,t=0;e;){if(8===e.nodeType){var n=e.data;if("/$"===n){if(0===t){Ao=Wr(e.nextSibling);break e}t--}else"$"!==n&&"$!"!==n&&"$?"!==n||t++}e=e.nextSibling}Ao=null}}else Ao=Io?Wr(e.stateNode.nextSibling):null;return!0}function Wo(){Ao=Io=null,Fo=!1}var qo=[];function Ho(){for(var e=0;e<qo.length;e++)qo[e]._workInProgressVersionPrimary=null;qo.length=0}var Qo=S.ReactCurrentDispatcher,Ko=S.ReactCurrentBatchConfig,Go=0,Yo=null,Xo=null,Jo=null,Zo=!1,ea=!1;function ta(){throw Error(a(321))}function na(e,t){if(null===t)return!1;for(var n=0;n<t.length&&n<e.length;n++)if(!ar(e[n],t[n]))return!1;return!0}function ra(e,t,n,r,i,o){if(Go=o,Yo=t,t.memoizedState=null,t.updateQueue=null,t.lanes=0,Qo.current=null===e||null===e.memoizedState?Ta:_a,e=n(r,i),ea){o=0;do{if(ea=!1,!(25>o))throw Error(a(301));o+=1,Jo=Xo=null,t.updateQueue=null,Qo.current=Na,e=n(r,i)}while(ea)}if(Qo.current=ja,t=null!==Xo&&null!==Xo.next,Go=0,Jo=Xo=Yo=null,Zo=!1,t)throw Error(a(300));return e}function ia(){var e={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return null===Jo?Yo.memoizedState=Jo=e:Jo=Jo.next=e,Jo}function oa(){if(null===Xo){var e=Yo.alternate;e=null!==e?e.memoizedState:null}else e=Xo.next;var t=null===Jo?Yo.memoizedState:Jo.next;if(null!==t)Jo=t,Xo=e;else{if(null===e)throw Error(a(310));e={memoizedState:(Xo=e).memoizedState,baseState:Xo.baseState,baseQueue:Xo.baseQueue,queue:Xo.queue,next:null},null===Jo?Yo.memoizedState=Jo=e:Jo=Jo.next=e}return Jo}function aa(e,t){return"function"==typeof t?t(e):t}function la(e){var t=oa(),n=t.queue;if(null===n)throw Error(a(311));n.lastRenderedReducer=e;var r=Xo,i=r.baseQueue,o=n.pending;if(null!==o){if(null!==i){var l=i.next;i.next=o.next,o.next=l}r.baseQueue=i=o,n.pending=null}if(null!==i){i=i.next,r=r.baseState;var s=l=o=null,u=i;do{var c=u.lane;if((Go&c)===c)null!==s&&(s=s.next={lane:0,action:u.action,eagerReducer:u.eagerReducer,eagerState:u.eagerState,next:null}),r=u.eagerReducer===e?u.eagerState:e(r,u.action);else{var d={lane:c,action:u.action,eagerReducer:u.eagerReducer,eagerState:u.eagerState,next:null};null===s?(l=s=d,o=r):s=s.next=d,Yo.lanes|=c,Ll|=c}u=u.next}while(null!==u&&u!==i);null===s?o=r:s.next=l,ar(r,t.memoizedState)||(Ma=!0),t.memoizedState=r,t.baseState=o,t.baseQueue=s,n.lastRenderedState=r}return[t.memoizedState,n.dispatch]}function sa(e){var t=oa(),n=t.queue;if(null===n)throw Error(a(311));n.lastRenderedReducer=e;var r=n.dispatch,i=n.pending,o=t.memoizedState;if(null!==i){n.pending=null;var l=i=i.next;do{o=e(o,l.action),l=l.next}while(l!==i);ar(o,t.memoizedState)||(Ma=!0),t.memoizedState=o,null===t.baseQueue&&(t.baseState=o),n.lastRenderedState=o}return[o,r]}function ua(e,t,n){var r=t._getVersion;r=r(t._source);var i=t._workInProgressVersionPrimary;if(null!==i?e=i===r:(e=e.mutableReadLanes,(e=(Go&e)===e)&&(t._workInProgressVersionPrimary=r,qo.push(t))),e)return n(t._source);throw qo.push(t),Error(a(350))}function ca(e,t,n,r){var i=Pl;if(null===i)throw Error(a(349));var o=t._getVersion,l=o(t._source),s=Qo.current,u=s.useState((function(){return ua(i,t,n)})),c=u[1],d=u[0];u=Jo;var f=e.memoizedState,p=f.refs,h=p.getSnapshot,v=f.source;f=f.subscribe;var m=Yo;return e.memoizedState={refs:p,source:t,subscribe:r},s.useEffect((function(){p.getSnapshot=n,p.setSnapshot=c;var e=o(t._source);if(!ar(l,e)){e=n(t._source),ar(d,e)||(c(e),e=ls(m),i.mutableReadLanes|=e&i.pendingLanes),e=i.mutableReadLanes,i.entangledLanes|=e;for(var r=i.entanglements,a=e;0<a;){var s=31-Bt(a),u=1<<s;r[s]|=e,a&=~u}}}),[n,t,r]),s.useEffect((function(){return r(t._source,(function(){var e=p.getSnapshot,n=p.setSnapshot;try{n(e(t._source));var r=ls(m);i.mutableReadLanes|=r&i.pendingLanes}catch(e){n((function(){throw e}))}}))}),[t,r]),ar(h,n)&&ar(v,t)&&ar(f,r)||((e={pending:null,dispatch:null,lastRenderedReducer:aa,lastRenderedState:d}).dispatch=c=Pa.bind(null,Yo,e),u.queue=e,u.baseQueue=null,d=ua(i,t,n),u.memoizedState=u.baseState=d),d}function da(e,t,n){return ca(oa(),e,t,n)}function fa(e){var t=ia();return"function"==typeof e&&(e=e()),t.memoizedState=t.baseState=e,e=(e=t.queue={pending:null,dispatch:null,lastRenderedReducer:aa,lastRenderedState:e}).dispatch=Pa.bind(null,Yo,e),[t.memoizedState,e]}function pa(e,t,n,r){return e={tag:e,create:t,destroy:n,deps:r,next:null},null===(t=Yo.updateQueue)?(t={lastEffect:null},Yo.updateQueue=t,t.lastEffect=e.next=e):null===(n=t.lastEffect)?t.lastEffect=e.next=e:(r=n.next,n.next=e,e.next=r,t.lastEffect=e),e}function ha(e){return e={current:e},ia().memoizedState=e}function va(){return oa().memoizedState}function ma(e,t,n,r){var i=ia();Yo.flags|=e,i.memoizedState=pa(1|t,n,void 0,void 0===r?null:r)}function ga(e,t,n,r){var i=oa();r=void 0===r?null:r;var o=void 0;if(null!==Xo){var a=Xo.memoizedState;if(o=a.destroy,null!==r&&na(r,a.deps))return void pa(t,n,o,r)}Yo.flags|=e,i.memoizedState=pa(1|t,n,o,r)}function ya(e,t){return ma(516,4,e,t)}function ba(e,t){return ga(516,4,e,t)}function wa(e,t){return ga(4,2,e,t)}function Sa(e,t){return"function"==typeof t?(e=e(),t(e),function(){t(null)}):null!=t?(e=e(),t.current=e,function(){t.current=null}):void 0}function ka(e,t,n){return n=null!=n?n.concat([e]):null,ga(4,2,Sa.bind(null,t,e),n)}function xa(){}function Ea(e,t){var n=oa();t=void 0===t?null:t;var r=n.memoizedState;return null!==r&&null!==t&&na(t,r[1])?r[0]:(n.memoizedState=[e,t],e)}function Ca(e,t){var n=oa();t=void 0===t?null:t;var r=n.memoizedState;return null!==r&&null!==t&&na(t,r[1])?r[0]:(e=e(),n.memoizedState=[e,t],e)}function Oa(e,t){var n=Ui();Vi(98>n?98:n,(function(){e(!0)})),Vi(97<n?97:n,(function(){var n=Ko.transition;Ko.transition=1;try{e(!1),t()}finally{Ko.transition=n}}))}function Pa(e,t,n){var r=as(),i=ls(e),o={lane:i,action:n,eagerReducer:null,eagerState:null,next:null},a=t.pending;if(null===a?o.next=o:(o.next=a.next,a.next=o),t.pending=o,a=e.alternate,e===Yo||null!==a&&a===Yo)ea=Zo=!0;else{if(0===e.lanes&&(null===a||0===a.lanes)&&null!==(a=t.lastRenderedReducer))try{var l=t.lastRenderedState,s=a(l,n);if(o.eagerReducer=a,o.eagerState=s,ar(s,l))return}catch(e){}ss(e,i,r)}}var ja={readContext:no,useCallback:ta,useContext:ta,useEffect:ta,useImperativeHandle:ta,useLayoutEffect:ta,useMemo:ta,useReducer:ta,useRef:ta,useState:ta,useDebugValue:ta,useDeferredValue:ta,useTransition:ta,useMutableSource:ta,useOpaqueIdentifier:ta,unstable_isNewReconciler:!1},Ta={readContext:no,useCallback:function(e,t){return ia().memoizedState=[e,void 0===t?null:t],e},useContext:no,useEffect:ya,useImperativeHandle:function(e,t,n){return n=null!=n?n.concat([e]):null,ma(4,2,Sa.bind(null,t,e),n)},useLayoutEffect:function(e,t){return ma(4,2,e,t)},useMemo:function(e,t){var n=ia();return t=void 0===t?null:t,e=e(),n.memoizedState=[e,t],e},useReducer:function(e,t,n){var r=ia();return t=void 0!==n?n(t):t,r.memoizedState=r.baseState=t,e=(e=r.queue={pending:null,dispatch:null,lastRenderedReducer:e,lastRenderedState:t}).dispatch=Pa.bind(null,Yo,e),[r.memoizedState,e]},useRef:ha,useState:fa,useDebugValue:xa,useDeferredValue:function(e){var t=fa(e),n=t[0],r=t[1];return ya((function(){var t=Ko.transition;Ko.transition=1;try{r(e)}finally{Ko.transition=t}}),[e]),n},useTransition:function(){var e=fa(!1),t=e[0];return ha(e=Oa.bind(null,e[1])),[e,t]},useMutableSource:function(e,t,n){var r=ia();return r.memoizedState={refs:{getSnapshot:t,setSnapshot:null},source:e,subscribe:n},ca(r,e,t,n)},useOpaqueIdentifier:function(){if(Fo){var e=!1,t=function(e){return{$$typeof:L,toString:e,valueOf:e}}((function(){throw e||(e=!0,n("r:"+(Hr++).toString(36))),Error(a(355))})),n=fa(t)[1];return 0==(2&Yo.mode)&&(Yo.flags|=516,pa(5,(function(){n("r:"+(Hr++).toString(36))}),void 0,null)),t}return fa(t="r:"+(Hr++).toString(36)),t},unstable_isNewReconciler:!1},_a={readContext:no,useCallback:Ea,useContext:no,useEffect:ba,useImperativeHandle:ka,useLayoutEffect:wa,useMemo:Ca,useReducer:la,useRef:va,useState:function(){return la(aa)},useDebugValue:xa,useDeferredValue:function(e){var t=la(aa),n=t[0],r=t[1];return ba((function(){var t=Ko.transition;Ko.transition=1;try{r(e)}finally{Ko.transition=t}}),[e]),n},useTransition:function(){var e=la(aa)[0];return[va().current,e]},useMutableSource:da,useOpaqueIdentifier:function(){return la(aa)[0]},unstable_isNewReconciler:!1},Na={readContext:no,useCallback:Ea,useContext:no,useEffect:ba,useImperativeHandle:ka,useLayoutEffect:wa,useMemo:Ca,useReducer:sa,useRef:va,useState:function(){return sa(aa)},useDebugValue:xa,useDeferredValue:function(e){var t=sa(aa),n=t[0],r=t[1];return ba((function(){var t=Ko.transition;Ko.transition=1;try{r(e)}finally{Ko.transition=t}}),[e]),n},useTransition:function(){var e=sa(aa)[0];return[va().current,e]},useMutableSource:da,useOpaqueIdentifier:function(){return sa(aa)[0]},unstable_isNewReconciler:!1},Ra=S.ReactCurrentOwner,Ma=!1;function Da(e,t,n,r){t.child=null===e?Eo(t,null,n,r):xo(t,e.child,n,r)}function La(e,t,n,r,i){n=n.render;var o=t.ref;return to(t,i),r=ra(e,t,n,r,o,i),null===e||Ma?(t.flags|=1,Da(e,t,r,i),t.child):(t.updateQueue=e.updateQueue,t.flags&=-517,e.lanes&=~i,Za(e,t,i))}function Ia(e,t,n,r,i,o){if(null===e){var a=n.type;return"function"!=typeof a||zs(a)||void 0!==a.defaultProps||null!==n.compare||void 0!==n.defaultProps?((e=$s(n.type,null,r,t,t.mode,o)).ref=t.ref,e.return=t,t.child=e):(t.tag=15,t.type=a,Aa(e,t,a,r,i,o))}return a=e.child,0==(i&o)&&(i=a.memoizedProps,(n=null!==(n=n.compare)?n:sr)(i,r)&&e.ref===t.ref)?Za(e,t,o):(t.flags|=1,(e=Us(a,r)).ref=t.ref,e.return=t,t.child=e)}function Aa(e,t,n,r,i,o){if(null!==e&&sr(e.memoizedProps,r)&&e.ref===t.ref){if(Ma=!1,0==(o&i))return t.lanes=e.lanes,Za(e,t,o);0!=(16384&e.flags)&&(Ma=!0)}return Ua(e,t,n,r,o)}function Fa(e,t,n){var r=t.pendingProps,i=r.children,o=null!==e?e.memoizedState:null;if("hidden"===r.mode||"unstable-defer-without-hiding"===r.mode)if(0==(4&t.mode))t.memoizedState={baseLanes:0},ms(0,n);else{if(0==(1073741824&n))return e=null!==o?o.baseLanes|n:n,t.lanes=t.childLanes=1073741824,t.memoizedState={baseLanes:e},ms(0,e),null;t.memoizedState={baseLanes:0},ms(0,null!==o?o.baseLanes:n)}else null!==o?(r=o.baseLanes|n,t.memoizedState=null):r=n,ms(0,r);return Da(e,t,i,n),t.child}function za(e,t){var n=t.ref;(null===e&&null!==n||null!==e&&e.ref!==n)&&(t.flags|=128)}function Ua(e,t,n,r,i){var o=pi(n)?di:ui.current;return o=fi(t,o),to(t,i),n=ra(e,t,n,r,o,i),null===e||Ma?(t.flags|=1,Da(e,t,n,i),t.child):(t.updateQueue=e.updateQueue,t.flags&=-517,e.lanes&=~i,Za(e,t,i))}function $a(e,t,n,r,i){if(pi(n)){var o=!0;gi(t)}else o=!1;if(to(t,i),null===t.stateNode)null!==e&&(e.alternate=null,t.alternate=null,t.flags|=2),mo(t,n,r),yo(t,n,r,i),r=!0;else if(null===e){var a=t.stateNode,l=t.memoizedProps;a.props=l;var s=a.context,u=n.contextType;u="object"==typeof u&&null!==u?no(u):fi(t,u=pi(n)?di:ui.current);var c=n.getDerivedStateFromProps,d="function"==typeof c||"function"==typeof a.getSnapshotBeforeUpdate;d||"function"!=typeof a.UNSAFE_componentWillReceiveProps&&"function"!=typeof a.componentWillReceiveProps||(l!==r||s!==u)&&go(t,a,r,u),ro=!1;var f=t.memoizedState;a.state=f,uo(t,r,a,i),s=t.memoizedState,l!==r||f!==s||ci.current||ro?("function"==typeof c&&(po(t,n,c,r),s=t.memoizedState),(l=ro||vo(t,n,l,r,f,s,u))?(d||"function"!=typeof a.UNSAFE_componentWillMount&&"function"!=typeof a.componentWillMount||("function"==typeof a.componentWillMount&&a.componentWillMount(),"function"==typeof a.UNSAFE_componentWillMount&&a.UNSAFE_componentWillMount()),"function"==typeof a.componentDidMount&&(t.flags|=4)):("function"==typeof a.componentDidMount&&(t.flags|=4),t.memoizedProps=r,t.memoizedState=s),a.props=r,a.state=s,a.context=u,r=l):("function"==typeof a.componentDidMount&&(t.flags|=4),r=!1)}else{a=t.stateNode,oo(e,t),l=t.memoizedProps,u=t.type===t.elementType?l:Qi(t.type,l),a.props=u,d=t.pendingProps,f=a.context,s="object"==typeof(s=n.contextType)&&null!==s?no(s):fi(t,s=pi(n)?di:ui.current);var p=n.getDerivedStateFromProps;(c="function"==typeof p||"function"==typeof a.getSnapshotBeforeUpdate)||"function"!=typeof a.UNSAFE_componentWillReceiveProps&&"function"!=typeof a.componentWillReceiveProps||(l!==d||f!==s)&&go(t,a,r,s),ro=!1,f=t.memoizedState,a.state=f,uo(t,r,a,i);var h=t.memoizedState;l!==d||f!==h||ci.current||ro?("function"==typeof p&&(po(t,n,p,r),h=t.memoizedState),(u=ro||vo(t,n,u,r,f,h,s))?(c||"function"!=typeof a.UNSAFE_componentWillUpdate&&"function"!=typeof a.componentWillUpdate||("function"==typeof a.componentWillUpdate&&a.componentWillUpdate(r,h,s),"function"==typeof a.UNSAFE_componentWillUpdate&&a.UNSAFE_componentWillUpdate(r,h,s)),"function"==typeof a.componentDidUpdate&&(t.flags|=4),"function"==typeof a.getSnapshotBeforeUpdate&&(t.flags|=256)):("function"!=typeof a.componentDidUpdate||l===e.memoizedProps&&f===e.memoizedState||(t.flags|=4),"function"!=typeof a.getSnapshotBeforeUpdate||l===e.memoizedProps&&f===e.memoizedState||(t.flags|=256),t.memoizedProps=r,t.memoizedState=h),a.props=r,a.state=h,a.context=s,r=u):("function"!=typeof a.componentDidUpdate||l===e.memoizedProps&&f===e.memoizedState||(t.flags|=4),"function"!=typeof a.getSnapshotBeforeUpdate||l===e.memoizedProps&&f===e.memoizedState||(t.flags|=256),r=!1)}return Va(e,t,n,r,o,i)}function Va(e,t,n,r,i,o){za(e,t);var a=0!=(64&t.flags);if(!r&&!a)return i&&yi(t,n,!1),Za(e,t,o);r=t.stateNode,Ra.current=t;var l=a&&"function"!=typeof n.getDerivedStateFromError?null:r.render();return t.flags|=1,null!==e&&a?(t.child=xo(t,e.child,null,o),t.child=xo(t,null,l,o)):Da(e,t,l,o),t.memoizedState=r.state,i&&yi(t,n,!0),t.child}function Ba(e){var t=e.stateNode;t.pendingContext?vi(0,t.pendingContext,t.pendingContext!==t.context):t.context&&vi(0,t.context,!1),_o(e,t.containerInfo)}var Wa,qa,Ha,Qa={dehydrated:null,retryLane:0};function Ka(e,t,n){var r,i=t.pendingProps,o=Do.current,a=!1;return(r=0!=(64&t.flags))||(r=(null===e||null!==e.memoizedState)&&0!=(2&o)),r?(a=!0,t.flags&=-65):null!==e&&null===e.memoizedState||void 0===i.fallback||!0===i.unstable_avoidThisFallback||(o|=1),li(Do,1&o),null===e?(void 0!==i.fallback&&$o(t),e=i.children,o=i.fallback,a?(e=Ga(t,e,o,n),t.child.memoizedState={baseLanes:n},t.memoizedState=Qa,e):"number"==typeof i.unstable_expectedLoadTime?(e=Ga(t,e,o,n),t.child.memoizedState={baseLanes:n},t.memoizedState=Qa,t.lanes=33554432,e):((n=Bs({mode:"visible",children:e},t.mode,n,null)).return=t,t.child=n)):(e.memoizedState,a?(i=function(e,t,n,r,i){var o=t.mode,a=e.child;e=a.sibling;var l={mode:"hidden",children:n};return 0==(2&o)&&t.child!==a?((n=t.child).childLanes=0,n.pendingProps=l,null!==(a=n.lastEffect)?(t.firstEffect=n.firstEffect,t.lastEffect=a,a.nextEffect=null):t.firstEffect=t.lastEffect=null):n=Us(a,l),null!==e?r=Us(e,r):(r=Vs(r,o,i,null)).flags|=2,r.return=t,n.return=t,n.sibling=r,t.child=n,r}(e,t,i.children,i.fallback,n),a=t.child,o=e.child.memoizedState,a.memoizedState=null===o?{baseLanes:n}:{baseLanes:o.baseLanes|n},a.childLanes=e.childLanes&~n,t.memoizedState=Qa,i):(n=function(e,t,n,r){var i=e.child;return e=i.sibling,n=Us(i,{mode:"visible",children:n}),0==(2&t.mode)&&(n.lanes=r),n.return=t,n.sibling=null,null!==e&&(e.nextEffect=null,e.flags=8,t.firstEffect=t.lastEffect=e),t.child=n}(e,t,i.children,n),t.memoizedState=null,n))}function Ga(e,t,n,r){var i=e.mode,o=e.child;return t={mode:"hidden",children:t},0==(2&i)&&null!==o?(o.childLanes=0,o.pendingProps=t):o=Bs(t,i,0,null),n=Vs(n,i,r,null),o.return=e,n.return=e,o.sibling=n,e.child=o,n}function Ya(e,t){e.lanes|=t;var n=e.alternate;null!==n&&(n.lanes|=t),eo(e.return,t)}function Xa(e,t,n,r,i,o){var a=e.memoizedState;null===a?e.memoizedState={isBackwards:t,rendering:null,renderingStartTime:0,last:r,tail:n,tailMode:i,lastEffect:o}:(a.isBackwards=t,a.rendering=null,a.renderingStartTime=0,a.last=r,a.tail=n,a.tailMode=i,a.lastEffect=o)}function Ja(e,t,n){var r=t.pendingProps,i=r.revealOrder,o=r.tail;if(Da(e,t,r.children,n),0!=(2&(r=Do.current)))r=1&r|2,t.flags|=64;else{if(null!==e&&0!=(64&e.flags))e:for(e=t.child;null!==e;){if(13===e.tag)null!==e.memoizedState&&Ya(e,n);else if(19===e.tag)Ya(e,n);else if(null!==e.child){e.child.return=e,e=e.child;continue}if(e===t)break e;for(;null===e.sibling;){if(null===e.return||e.return===t)break e;e=e.return}e.sibling.return=e.return,e=e.sibling}r&=1}if(li(Do,r),0==(2&t.mode))t.memoizedState=null;else switch(i){case"forwards":for(n=t.child,i=null;null!==n;)null!==(e=n.alternate)&&null===Lo(e)&&(i=n),n=n.sibling;null===(n=i)?(i=t.child,t.child=null):(i=n.sibling,n.sibling=null),Xa(t,!1,i,n,o,t.lastEffect);break;case"backwards":for(n=null,i=t.child,t.child=null;null!==i;){if(null!==(e=i.alternate)&&null===Lo(e)){t.child=i;break}e=i.sibling,i.sibling=n,n=i,i=e}Xa(t,!0,n,null,o,t.lastEffect);break;case"together":Xa(t,!1,null,null,void 0,t.lastEffect);break;default:t.memoizedState=null}return t.child}function Za(e,t,n){if(null!==e&&(t.dependencies=e.dependencies),Ll|=t.lanes,0!=(n&t.childLanes)){if(null!==e&&t.child!==e.child)throw Error(a(153));if(null!==t.child){for(n=Us(e=t.child,e.pendingProps),t.child=n,n.return=t;null!==e.sibling;)e=e.sibling,(n=n.sibling=Us(e,e.pendingProps)).return=t;n.sibling=null}return t.child}return null}function el(e,t){if(!Fo)switch(e.tailMode){case"hidden":t=e.tail;for(var n=null;null!==t;)null!==t.alternate&&(n=t),t=t.sibling;null===n?e.tail=null:n.sibling=null;break;case"collapsed":n=e.tail;for(var r=null;null!==n;)null!==n.alternate&&(r=n),n=n.sibling;null===r?t||null===e.tail?e.tail=null:e.tail.sibling=null:r.sibling=null}}function tl(e,t,n){var r=t.pendingProps;switch(t.tag){case 2:case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:return null;case 1:return pi(t.type)&&hi(),null;case 3:return No(),ai(ci),ai(ui),Ho(),(r=t.stateNode).pendingContext&&(r.context=r.pendingContext,r.pendingContext=null),null!==e&&null!==e.child||(Bo(t)?t.flags|=4:r.hydrate||(t.flags|=256)),null;case 5:Mo(t);var o=To(jo.current);if(n=t.type,null!==e&&null!=t.stateNode)qa(e,t,n,r),e.ref!==t.ref&&(t.flags|=128);else{if(!r){if(null===t.stateNode)throw Error(a(166));return null}if(e=To(Oo.current),Bo(t)){r=t.stateNode,n=t.type;var l=t.memoizedProps;switch(r[Kr]=t,r[Gr]=l,n){case"dialog":Or("cancel",r),Or("close",r);break;case"iframe":case"object":case"embed":Or("load",r);break;case"video":case"audio":for(e=0;e<kr.length;e++)Or(kr[e],r);break;case"source":Or("error",r);break;case"img":case"image":case"link":Or("error",r),Or("load",r);break;case"details":Or("toggle",r);break;case"input":ee(r,l),Or("invalid",r);break;case"select":r._wrapperState={wasMultiple:!!l.multiple},Or("invalid",r);break;case"textarea":se(r,l),Or("invalid",r)}for(var u in xe(n,l),e=null,l)l.hasOwnProperty(u)&&(o=l[u],"children"===u?"string"==typeof o?r.textContent!==o&&(e=["children",o]):"number"==typeof o&&r.textContent!==""+o&&(e=["children",""+o]):s.hasOwnProperty(u)&&null!=o&&"onScroll"===u&&Or("scroll",r));switch(n){case"input":Y(r),re(r,l,!0);break;case"textarea":Y(r),ce(r);break;case"select":case"option":break;default:"function"==typeof l.onClick&&(r.onclick=Ir)}r=e,t.updateQueue=r,null!==r&&(t.flags|=4)}else{switch(u=9===o.nodeType?o:o.ownerDocument,e===de&&(e=fe(n)),e===de?"script"===n?((e=u.createElement("div")).innerHTML="<script><\/script>",e=e.removeChild(e.firstChild)):"string"==typeof r.is?e=u.createElement(n,{is:r.is}):(e=u.createElement(n),"select"===n&&(u=e,r.multiple?u.multiple=!0:r.size&&(u.size=r.size))):e=u.createElementNS(e,n),e[Kr]=t,e[Gr]=r,Wa(e,t),t.stateNode=e,u=Ee(n,r),n){case"dialog":Or("cancel",e),Or("close",e),o=r;break;case"iframe":case"object":case"embed":Or("load",e),o=r;break;case"video":case"audio":for(o=0;o<kr.length;o++)Or(kr[o],e);o=r;break;case"source":Or("error",e),o=r;break;case"img":case"image":case"link":Or("error",e),Or("load",e),o=r;break;case"details":Or("toggle",e),o=r;break;case"input":ee(e,r),o=Z(e,r),Or("invalid",e);break;case"option":o=oe(e,r);break;case"select":e._wrapperState={wasMultiple:!!r.multiple},o=i({},r,{value:void 0}),Or("invalid",e);break;case"textarea":se(e,r),o=le(e,r),Or("invalid",e);break;default:o=r}xe(n,o);var c=o;for(l in c)if(c.hasOwnProperty(l)){var d=c[l];"style"===l?Se(e,d):"dangerouslySetInnerHTML"===l?null!=(d=d?d.__html:void 0)&&me(e,d):"children"===l?"string"==typeof d?("textarea"!==n||""!==d)&&ge(e,d):"number"==typeof d&&ge(e,""+d):"suppressContentEditableWarning"!==l&&"suppressHydrationWarning"!==l&&"autoFocus"!==l&&(s.hasOwnProperty(l)?null!=d&&"onScroll"===l&&Or("scroll",e):null!=d&&w(e,l,d,u))}switch(n){case"input":Y(e),re(e,r,!1);break;case"textarea":Y(e),ce(e);break;case"option":null!=r.value&&e.setAttribute("value",""+K(r.value));break;case"select":e.multiple=!!r.multiple,null!=(l=r.value)?ae(e,!!r.multiple,l,!1):null!=r.defaultValue&&ae(e,!!r.multiple,r.defaultValue,!0);break;default:"function"==typeof o.onClick&&(e.onclick=Ir)}zr(n,r)&&(t.flags|=4)}null!==t.ref&&(t.flags|=128)}return null;case 6:if(e&&null!=t.stateNode)Ha(0,t,e.memoizedProps,r);else{if("string"!=typeof r&&null===t.stateNode)throw Error(a(166));n=To(jo.current),To(Oo.current),Bo(t)?(r=t.stateNode,n=t.memoizedProps,r[Kr]=t,r.nodeValue!==n&&(t.flags|=4)):((r=(9===n.nodeType?n:n.ownerDocument).createTextNode(r))[Kr]=t,t.stateNode=r)}return null;case 13:return ai(Do),r=t.memoizedState,0!=(64&t.flags)?(t.lanes=n,t):(r=null!==r,n=!1,null===e?void 0!==t.memoizedProps.fallback&&Bo(t):n=null!==e.memoizedState,r&&!n&&0!=(2&t.mode)&&(null===e&&!0!==t.memoizedProps.unstable_avoidThisFallback||0!=(1&Do.current)?0===Rl&&(Rl=3):(0!==Rl&&3!==Rl||(Rl=4),null===Pl||0==(134217727&Ll)&&0==(134217727&Il)||fs(Pl,Tl))),(r||n)&&(t.flags|=4),null);case 4:return No(),null===e&&jr(t.stateNode.containerInfo),null;case 10:return Zi(t),null;case 17:return pi(t.type)&&hi(),null;case 19:if(ai(Do),null===(r=t.memoizedState))return null;if(l=0!=(64&t.flags),null===(u=r.rendering))if(l)el(r,!1);else{if(0!==Rl||null!==e&&0!=(64&e.flags))for(e=t.child;null!==e;){if(null!==(u=Lo(e))){for(t.flags|=64,el(r,!1),null!==(l=u.updateQueue)&&(t.updateQueue=l,t.flags|=4),null===r.lastEffect&&(t.firstEffect=null),t.lastEffect=r.lastEffect,r=n,n=t.child;null!==n;)e=r,(l=n).flags&=2,l.nextEffect=null,l.firstEffect=null,l.lastEffect=null,null===(u=l.alternate)?(l.childLanes=0,l.lanes=e,l.child=null,l.memoizedProps=null,l.memoizedState=null,l.updateQueue=null,l.dependencies=null,l.stateNode=null):(l.childLanes=u.childLanes,l.lanes=u.lanes,l.child=u.child,l.memoizedProps=u.memoizedProps,l.memoizedState=u.memoizedState,l.updateQueue=u.updateQueue,l.type=u.type,e=u.dependencies,l.dependencies=null===e?null:{lanes:e.lanes,firstContext:e.firstContext}),n=n.sibling;return li(Do,1&Do.current|2),t.child}e=e.sibling}null!==r.tail&&zi()>Ul&&(t.flags|=64,l=!0,el(r,!1),t.lanes=33554432)}else{if(!l)if(null!==(e=Lo(u))){if(t.flags|=64,l=!0,null!==(n=e.updateQueue)&&(t.updateQueue=n,t.flags|=4),el(r,!0),null===r.tail&&"hidden"===r.tailMode&&!u.alternate&&!Fo)return null!==(t=t.lastEffect=r.lastEffect)&&(t.nextEffect=null),null}else 2*zi()-r.renderingStartTime>Ul&&1073741824!==n&&(t.flags|=64,l=!0,el(r,!1),t.lanes=33554432);r.isBackwards?(u.sibling=t.child,t.child=u):(null!==(n=r.last)?n.sibling=u:t.child=u,r.last=u)}return null!==r.tail?(n=r.tail,r.rendering=n,r.tail=n.sibling,r.lastEffect=t.lastEffect,r.renderingStartTime=zi(),n.sibling=null,t=Do.current,li(Do,l?1&t|2:1&t),n):null;case 23:case 24:return gs(),null!==e&&null!==e.memoizedState!=(null!==t.memoizedState)&&"unstable-defer-without-hiding"!==r.mode&&(t.flags|=4),null}throw Error(a(156,t.tag))}function nl(e){switch(e.tag){case 1:pi(e.type)&&hi();var t=e.flags;return 4096&t?(e.flags=-4097&t|64,e):null;case 3:if(No(),ai(ci),ai(ui),Ho(),0!=(64&(t=e.flags)))throw Error(a(285));return e.flags=-4097&t|64,e;case 5:return Mo(e),null;case 13:return ai(Do),4096&(t=e.flags)?(e.flags=-4097&t|64,e):null;case 19:return ai(Do),null;case 4:return No(),null;case 10:return Zi(e),null;case 23:case 24:return gs(),null;default:return null}}function rl(e,t){try{var n="",r=t;do{n+=H(r),r=r.return}while(r);var i=n}catch(e){i="\nError generating stack: "+e.message+"\n"+e.stack}return{value:e,source:t,stack:i}}function il(e,t){try{console.error(t.value)}catch(e){setTimeout((function(){throw e}))}}Wa=function(e,t){for(var n=t.child;null!==n;){if(5===n.tag||6===n.tag)e.appendChild(n.stateNode);else if(4!==n.tag&&null!==n.child){n.child.return=n,n=n.child;continue}if(n===t)break;for(;null===n.sibling;){if(null===n.return||n.return===t)return;n=n.return}n.sibling.return=n.return,n=n.sibling}},qa=function(e,t,n,r){var o=e.memoizedProps;if(o!==r){e=t.stateNode,To(Oo.current);var a,l=null;switch(n){case"input":o=Z(e,o),r=Z(e,r),l=[];break;case"option":o=oe(e,o),r=oe(e,r),l=[];break;case"select":o=i({},o,{value:void 0}),r=i({},r,{value:void 0}),l=[];break;case"textarea":o=le(e,o),r=le(e,r),l=[];break;default:"function"!=typeof o.onClick&&"function"==typeof r.onClick&&(e.onclick=Ir)}for(d in xe(n,r),n=null,o)if(!r.hasOwnProperty(d)&&o.hasOwnProperty(d)&&null!=o[d])if("style"===d){var u=o[d];for(a in u)u.hasOwnProperty(a)&&(n||(n={}),n[a]="")}else"dangerouslySetInnerHTML"!==d&&"children"!==d&&"suppressContentEditableWarning"!==d&&"suppressHydrationWarning"!==d&&"autoFocus"!==d&&(s.hasOwnProperty(d)?l||(l=[]):(l=l||[]).push(d,null));for(d in r){var c=r[d];if(u=null!=o?o[d]:void 0,r.hasOwnProperty(d)&&c!==u&&(null!=c||null!=u))if("style"===d)if(u){for(a in u)!u.hasOwnProperty(a)||c&&c.hasOwnProperty(a)||(n||(n={}),n[a]="");for(a in c)c.hasOwnProperty(a)&&u[a]!==c[a]&&(n||(n={}),n[a]=c[a])}else n||(l||(l=[]),l.push(d,n)),n=c;else"dangerouslySetInnerHTML"===d?(c=c?c.__html:void 0,u=u?u.__html:void 0,null!=c&&u!==c&&(l=l||[]).push(d,c)):"children"===d?"string"!=typeof c&&"number"!=typeof c||(l=l||[]).push(d,""+c):"suppressContentEditableWarning"!==d&&"suppressHydrationWarning"!==d&&(s.hasOwnProperty(d)?(null!=c&&"onScroll"===d&&Or("scroll",e),l||u===c||(l=[])):"object"==typeof c&&null!==c&&c.$$typeof===L?c.toString():(l=l||[]).push(d,c))}n&&(l=l||[]).push("style",n);var d=l;(t.updateQueue=d)&&(t.flags|=4)}},Ha=function(e,t,n,r){n!==r&&(t.flags|=4)};var ol="function"==typeof WeakMap?WeakMap:Map;function al(e,t,n){(n=ao(-1,n)).tag=3,n.payload={element:null};var r=t.value;return n.callback=function(){Wl||(Wl=!0,ql=r),il(0,t)},n}function ll(e,t,n){(n=ao(-1,n)).tag=3;var r=e.type.getDerivedStateFromError;if("function"==typeof r){var i=t.value;n.payload=function(){return il(0,t),r(i)}}var o=e.stateNode;return null!==o&&"function"==typeof o.componentDidCatch&&(n.callback=function(){"function"!=typeof r&&(null===Hl?Hl=new Set([this]):Hl.add(this),il(0,t));var e=t.stack;this.componentDidCatch(t.value,{componentStack:null!==e?e:""})}),n}var sl="function"==typeof WeakSet?WeakSet:Set;function ul(e){var t=e.ref;if(null!==t)if("function"==typeof t)try{t(null)}catch(t){Ds(e,t)}else t.current=null}function cl(e,t){switch(t.tag){case 0:case 11:case 15:case 22:return;case 1:if(256&t.flags&&null!==e){var n=e.memoizedProps,r=e.memoizedState;t=(e=t.stateNode).getSnapshotBeforeUpdate(t.elementType===t.type?n:Qi(t.type,n),r),e.__reactInternalSnapshotBeforeUpdate=t}return;case 3:return void(256&t.flags&&Br(t.stateNode.containerInfo));case 5:case 6:case 4:case 17:return}throw Error(a(163))}function dl(e,t,n){switch(n.tag){case 0:case 11:case 15:case 22:if(null!==(t=null!==(t=n.updateQueue)?t.lastEffect:null)){e=t=t.next;do{if(3==(3&e.tag)){var r=e.create;e.destroy=r()}e=e.next}while(e!==t)}if(null!==(t=null!==(t=n.updateQueue)?t.lastEffect:null)){e=t=t.next;do{var i=e;r=i.next,0!=(4&(i=i.tag))&&0!=(1&i)&&(Ns(n,e),_s(n,e)),e=r}while(e!==t)}return;case 1:return e=n.stateNode,4&n.flags&&(null===t?e.componentDidMount():(r=n.elementType===n.type?t.memoizedProps:Qi(n.type,t.memoizedProps),e.componentDidUpdate(r,t.memoizedState,e.__reactInternalSnapshotBeforeUpdate))),void(null!==(t=n.updateQueue)&&co(n,t,e));case 3:if(null!==(t=n.updateQueue)){if(e=null,null!==n.child)switch(n.child.tag){case 5:e=n.child.stateNode;break;case 1:e=n.child.stateNode}co(n,t,e)}return;case 5:return e=n.stateNode,void(null===t&&4&n.flags&&zr(n.type,n.memoizedProps)&&e.focus());case 6:case 4:case 12:return;case 13:return void(null===n.memoizedState&&(n=n.alternate,null!==n&&(n=n.memoizedState,null!==n&&(n=n.dehydrated,null!==n&&St(n)))));case 19:case 17:case 20:case 21:case 23:case 24:return}throw Error(a(163))}function fl(e,t){for(var n=e;;){if(5===n.tag){var r=n.stateNode;if(t)"function"==typeof(r=r.style).setProperty?r.setProperty("display","none","important"):r.display="none";else{r=n.stateNode;var i=n.memoizedProps.style;i=null!=i&&i.hasOwnProperty("display")?i.display:null,r.style.display=we("display",i)}}else if(6===n.tag)n.stateNode.nodeValue=t?"":n.memoizedProps;else if((23!==n.tag&&24!==n.tag||null===n.memoizedState||n===e)&&null!==n.child){n.child.return=n,n=n.child;continue}if(n===e)break;for(;null===n.sibling;){if(null===n.return||n.return===e)return;n=n.return}n.sibling.return=n.return,n=n.sibling}}function pl(e,t){if(wi&&"function"==typeof wi.onCommitFiberUnmount)try{wi.onCommitFiberUnmount(bi,t)}catch(e){}switch(t.tag){case 0:case 11:case 14:case 15:case 22:if(null!==(e=t.updateQueue)&&null!==(e=e.lastEffect)){var n=e=e.next;do{var r=n,i=r.destroy;if(r=r.tag,void 0!==i)if(0!=(4&r))Ns(t,n);else{r=t;try{i()}catch(e){Ds(r,e)}}n=n.next}while(n!==e)}break;case 1:if(ul(t),"function"==typeof(e=t.stateNode).componentWillUnmount)try{e.props=t.memoizedProps,e.state=t.memoizedState,e.componentWillUnmount()}catch(e){Ds(t,e)}break;case 5:ul(t);break;case 4:bl(e,t)}}function hl(e){e.alternate=null,e.child=null,e.dependencies=null,e.firstEffect=null,e.lastEffect=null,e.memoizedProps=null,e.memoizedState=null,e.pendingProps=null,e.return=null,e.updateQueue=null}function vl(e){return 5===e.tag||3===e.tag||4===e.tag}function ml(e){e:{for(var t=e.return;null!==t;){if(vl(t))break e;t=t.return}throw Error(a(160))}var n=t;switch(t=n.stateNode,n.tag){case 5:var r=!1;break;case 3:case 4:t=t.containerInfo,r=!0;break;default:throw Error(a(161))}16&n.flags&&(ge(t,""),n.flags&=-17);e:t:for(n=e;;){for(;null===n.sibling;){if(null===n.return||vl(n.return)){n=null;break e}n=n.return}for(n.sibling.return=n.return,n=n.sibling;5!==n.tag&&6!==n.tag&&18!==n.tag;){if(2&n.flags)continue t;if(null===n.child||4===n.tag)continue t;n.child.return=n,n=n.child}if(!(2&n.flags)){n=n.stateNode;break e}}r?gl(e,n,t):yl(e,n,t)}function gl(e,t,n){var r=e.tag,i=5===r||6===r;if(i)e=i?e.stateNode:e.stateNode.instance,t?8===n.nodeType?n.parentNode.insertBefore(e,t):n.insertBefore(e,t):(8===n.nodeType?(t=n.parentNode).insertBefore(e,n):(t=n).appendChild(e),null!=(n=n._reactRootContainer)||null!==t.onclick||(t.onclick=Ir));else if(4!==r&&null!==(e=e.child))for(gl(e,t,n),e=e.sibling;null!==e;)gl(e,t,n),e=e.sibling}function yl(e,t,n){var r=e.tag,i=5===r||6===r;if(i)e=i?e.stateNode:e.stateNode.instance,t?n.insertBefore(e,t):n.appendChild(e);else if(4!==r&&null!==(e=e.child))for(yl(e,t,n),e=e.sibling;null!==e;)yl(e,t,n),e=e.sibling}function bl(e,t){for(var n,r,i=t,o=!1;;){if(!o){o=i.return;e:for(;;){if(null===o)throw Error(a(160));switch(n=o.stateNode,o.tag){case 5:r=!1;break e;case 3:case 4:n=n.containerInfo,r=!0;break e}o=o.return}o=!0}if(5===i.tag||6===i.tag){e:for(var l=e,s=i,u=s;;)if(pl(l,u),null!==u.child&&4!==u.tag)u.child.return=u,u=u.child;else{if(u===s)break e;for(;null===u.sibling;){if(null===u.return||u.return===s)break e;u=u.return}u.sibling.return=u.return,u=u.sibling}r?(l=n,s=i.stateNode,8===l.nodeType?l.parentNode.removeChild(s):l.removeChild(s)):n.removeChild(i.stateNode)}else if(4===i.tag){if(null!==i.child){n=i.stateNode.containerInfo,r=!0,i.child.return=i,i=i.child;continue}}else if(pl(e,i),null!==i.child){i.child.return=i,i=i.child;continue}if(i===t)break;for(;null===i.sibling;){if(null===i.return||i.return===t)return;4===(i=i.return).tag&&(o=!1)}i.sibling.return=i.return,i=i.sibling}}function wl(e,t){switch(t.tag){case 0:case 11:case 14:case 15:case 22:var n=t.updateQueue;if(null!==(n=null!==n?n.lastEffect:null)){var r=n=n.next;do{3==(3&r.tag)&&(e=r.destroy,r.destroy=void 0,void 0!==e&&e()),r=r.next}while(r!==n)}return;case 1:return;case 5:if(null!=(n=t.stateNode)){r=t.memoizedProps;var i=null!==e?e.memoizedProps:r;e=t.type;var o=t.updateQueue;if(t.updateQueue=null,null!==o){for(n[Gr]=r,"input"===e&&"radio"===r.type&&null!=r.name&&te(n,r),Ee(e,i),t=Ee(e,r),i=0;i<o.length;i+=2){var l=o[i],s=o[i+1];"style"===l?Se(n,s):"dangerouslySetInnerHTML"===l?me(n,s):"children"===l?ge(n,s):w(n,l,s,t)}switch(e){case"input":ne(n,r);break;case"textarea":ue(n,r);break;case"select":e=n._wrapperState.wasMultiple,n._wrapperState.wasMultiple=!!r.multiple,null!=(o=r.value)?ae(n,!!r.multiple,o,!1):e!==!!r.multiple&&(null!=r.defaultValue?ae(n,!!r.multiple,r.defaultValue,!0):ae(n,!!r.multiple,r.multiple?[]:"",!1))}}}return;case 6:if(null===t.stateNode)throw Error(a(162));return void(t.stateNode.nodeValue=t.memoizedProps);case 3:return void((n=t.stateNode).hydrate&&(n.hydrate=!1,St(n.containerInfo)));case 12:return;case 13:return null!==t.memoizedState&&(zl=zi(),fl(t.child,!0)),void Sl(t);case 19:return void Sl(t);case 17:return;case 23:case 24:return void fl(t,null!==t.memoizedState)}throw Error(a(163))}function Sl(e){var t=e.updateQueue;if(null!==t){e.updateQueue=null;var n=e.stateNode;null===n&&(n=e.stateNode=new sl),t.forEach((function(t){var r=Is.bind(null,e,t);n.has(t)||(n.add(t),t.then(r,r))}))}}function kl(e,t){return null!==e&&(null===(e=e.memoizedState)||null!==e.dehydrated)&&null!==(t=t.memoizedState)&&null===t.dehydrated}var xl=Math.ceil,El=S.ReactCurrentDispatcher,Cl=S.ReactCurrentOwner,Ol=0,Pl=null,jl=null,Tl=0,_l=0,Nl=oi(0),Rl=0,Ml=null,Dl=0,Ll=0,Il=0,Al=0,Fl=null,zl=0,Ul=1/0;function $l(){Ul=zi()+500}var Vl,Bl=null,Wl=!1,ql=null,Hl=null,Ql=!1,Kl=null,Gl=90,Yl=[],Xl=[],Jl=null,Zl=0,es=null,ts=-1,ns=0,rs=0,is=null,os=!1;function as(){return 0!=(48&Ol)?zi():-1!==ts?ts:ts=zi()}function ls(e){if(0==(2&(e=e.mode)))return 1;if(0==(4&e))return 99===Ui()?1:2;if(0===ns&&(ns=Dl),0!==Hi.transition){0!==rs&&(rs=null!==Fl?Fl.pendingLanes:0),e=ns;var t=4186112&~rs;return 0==(t&=-t)&&0==(t=(e=4186112&~e)&-e)&&(t=8192),t}return e=Ui(),e=zt(0!=(4&Ol)&&98===e?12:e=function(e){switch(e){case 99:return 15;case 98:return 10;case 97:case 96:return 8;case 95:return 2;default:return 0}}(e),ns)}function ss(e,t,n){if(50<Zl)throw Zl=0,es=null,Error(a(185));if(null===(e=us(e,t)))return null;Vt(e,t,n),e===Pl&&(Il|=t,4===Rl&&fs(e,Tl));var r=Ui();1===t?0!=(8&Ol)&&0==(48&Ol)?ps(e):(cs(e,n),0===Ol&&($l(),Wi())):(0==(4&Ol)||98!==r&&99!==r||(null===Jl?Jl=new Set([e]):Jl.add(e)),cs(e,n)),Fl=e}function us(e,t){e.lanes|=t;var n=e.alternate;for(null!==n&&(n.lanes|=t),n=e,e=e.return;null!==e;)e.childLanes|=t,null!==(n=e.alternate)&&(n.childLanes|=t),n=e,e=e.return;return 3===n.tag?n.stateNode:null}function cs(e,t){for(var n=e.callbackNode,r=e.suspendedLanes,i=e.pingedLanes,o=e.expirationTimes,l=e.pendingLanes;0<l;){var s=31-Bt(l),u=1<<s,c=o[s];if(-1===c){if(0==(u&r)||0!=(u&i)){c=t,It(u);var d=Lt;o[s]=10<=d?c+250:6<=d?c+5e3:-1}}else c<=t&&(e.expiredLanes|=u);l&=~u}if(r=At(e,e===Pl?Tl:0),t=Lt,0===r)null!==n&&(n!==Mi&&xi(n),e.callbackNode=null,e.callbackPriority=0);else{if(null!==n){if(e.callbackPriority===t)return;n!==Mi&&xi(n)}15===t?(n=ps.bind(null,e),null===Li?(Li=[n],Ii=ki(ji,qi)):Li.push(n),n=Mi):n=14===t?Bi(99,ps.bind(null,e)):Bi(n=function(e){switch(e){case 15:case 14:return 99;case 13:case 12:case 11:case 10:return 98;case 9:case 8:case 7:case 6:case 4:case 5:return 97;case 3:case 2:case 1:return 95;case 0:return 90;default:throw Error(a(358,e))}}(t),ds.bind(null,e)),e.callbackPriority=t,e.callbackNode=n}}function ds(e){if(ts=-1,rs=ns=0,0!=(48&Ol))throw Error(a(327));var t=e.callbackNode;if(Ts()&&e.callbackNode!==t)return null;var n=At(e,e===Pl?Tl:0);if(0===n)return null;var r=n,i=Ol;Ol|=16;var o=ws();for(Pl===e&&Tl===r||($l(),ys(e,r));;)try{xs();break}catch(t){bs(e,t)}if(Ji(),El.current=o,Ol=i,null!==jl?r=0:(Pl=null,Tl=0,r=Rl),0!=(Dl&Il))ys(e,0);else if(0!==r){if(2===r&&(Ol|=64,e.hydrate&&(e.hydrate=!1,Br(e.containerInfo)),0!==(n=Ft(e))&&(r=Ss(e,n))),1===r)throw t=Ml,ys(e,0),fs(e,n),cs(e,zi()),t;switch(e.finishedWork=e.current.alternate,e.finishedLanes=n,r){case 0:case 1:throw Error(a(345));case 2:Os(e);break;case 3:if(fs(e,n),(62914560&n)===n&&10<(r=zl+500-zi())){if(0!==At(e,0))break;if(((i=e.suspendedLanes)&n)!==n){as(),e.pingedLanes|=e.suspendedLanes&i;break}e.timeoutHandle=$r(Os.bind(null,e),r);break}Os(e);break;case 4:if(fs(e,n),(4186112&n)===n)break;for(r=e.eventTimes,i=-1;0<n;){var l=31-Bt(n);o=1<<l,(l=r[l])>i&&(i=l),n&=~o}if(n=i,10<(n=(120>(n=zi()-n)?120:480>n?480:1080>n?1080:1920>n?1920:3e3>n?3e3:4320>n?4320:1960*xl(n/1960))-n)){e.timeoutHandle=$r(Os.bind(null,e),n);break}Os(e);break;case 5:Os(e);break;default:throw Error(a(329))}}return cs(e,zi()),e.callbackNode===t?ds.bind(null,e):null}function fs(e,t){for(t&=~Al,t&=~Il,e.suspendedLanes|=t,e.pingedLanes&=~t,e=e.expirationTimes;0<t;){var n=31-Bt(t),r=1<<n;e[n]=-1,t&=~r}}function ps(e){if(0!=(48&Ol))throw Error(a(327));if(Ts(),e===Pl&&0!=(e.expiredLanes&Tl)){var t=Tl,n=Ss(e,t);0!=(Dl&Il)&&(n=Ss(e,t=At(e,t)))}else n=Ss(e,t=At(e,0));if(0!==e.tag&&2===n&&(Ol|=64,e.hydrate&&(e.hydrate=!1,Br(e.containerInfo)),0!==(t=Ft(e))&&(n=Ss(e,t))),1===n)throw n=Ml,ys(e,0),fs(e,t),cs(e,zi()),n;return e.finishedWork=e.current.alternate,e.finishedLanes=t,Os(e),cs(e,zi()),null}function hs(e,t){var n=Ol;Ol|=1;try{return e(t)}finally{0===(Ol=n)&&($l(),Wi())}}function vs(e,t){var n=Ol;Ol&=-2,Ol|=8;try{return e(t)}finally{0===(Ol=n)&&($l(),Wi())}}function ms(e,t){li(Nl,_l),_l|=t,Dl|=t}function gs(){_l=Nl.current,ai(Nl)}function ys(e,t){e.finishedWork=null,e.finishedLanes=0;var n=e.timeoutHandle;if(-1!==n&&(e.timeoutHandle=-1,Vr(n)),null!==jl)for(n=jl.return;null!==n;){var r=n;switch(r.tag){case 1:null!=(r=r.type.childContextTypes)&&hi();break;case 3:No(),ai(ci),ai(ui),Ho();break;case 5:Mo(r);break;case 4:No();break;case 13:case 19:ai(Do);break;case 10:Zi(r);break;case 23:case 24:gs()}n=n.return}Pl=e,jl=Us(e.current,null),Tl=_l=Dl=t,Rl=0,Ml=null,Al=Il=Ll=0}function bs(e,t){for(;;){var n=jl;try{if(Ji(),Qo.current=ja,Zo){for(var r=Yo.memoizedState;null!==r;){var i=r.queue;null!==i&&(i.pending=null),r=r.next}Zo=!1}if(Go=0,Jo=Xo=Yo=null,ea=!1,Cl.current=null,null===n||null===n.return){Rl=1,Ml=t,jl=null;break}e:{var o=e,a=n.return,l=n,s=t;if(t=Tl,l.flags|=2048,l.firstEffect=l.lastEffect=null,null!==s&&"object"==typeof s&&"function"==typeof s.then){var u=s;if(0==(2&l.mode)){var c=l.alternate;c?(l.updateQueue=c.updateQueue,l.memoizedState=c.memoizedState,l.lanes=c.lanes):(l.updateQueue=null,l.memoizedState=null)}var d=0!=(1&Do.current),f=a;do{var p;if(p=13===f.tag){var h=f.memoizedState;if(null!==h)p=null!==h.dehydrated;else{var v=f.memoizedProps;p=void 0!==v.fallback&&(!0!==v.unstable_avoidThisFallback||!d)}}if(p){var m=f.updateQueue;if(null===m){var g=new Set;g.add(u),f.updateQueue=g}else m.add(u);if(0==(2&f.mode)){if(f.flags|=64,l.flags|=16384,l.flags&=-2981,1===l.tag)if(null===l.alternate)l.tag=17;else{var y=ao(-1,1);y.tag=2,lo(l,y)}l.lanes|=1;break e}s=void 0,l=t;var b=o.pingCache;if(null===b?(b=o.pingCache=new ol,s=new Set,b.set(u,s)):void 0===(s=b.get(u))&&(s=new Set,b.set(u,s)),!s.has(l)){s.add(l);var w=Ls.bind(null,o,u,l);u.then(w,w)}f.flags|=4096,f.lanes=t;break e}f=f.return}while(null!==f);s=Error((Q(l.type)||"A React component")+" suspended while rendering, but no fallback UI was specified.\n\nAdd a <Suspense fallback=...> component higher in the tree to provide a loading indicator or placeholder to display.")}5!==Rl&&(Rl=2),s=rl(s,l),f=a;do{switch(f.tag){case 3:o=s,f.flags|=4096,t&=-t,f.lanes|=t,so(f,al(0,o,t));break e;case 1:o=s;var S=f.type,k=f.stateNode;if(0==(64&f.flags)&&("function"==typeof S.getDerivedStateFromError||null!==k&&"function"==typeof k.componentDidCatch&&(null===Hl||!Hl.has(k)))){f.flags|=4096,t&=-t,f.lanes|=t,so(f,ll(f,o,t));break e}}f=f.return}while(null!==f)}Cs(n)}catch(e){t=e,jl===n&&null!==n&&(jl=n=n.return);continue}break}}function ws(){var e=El.current;return El.current=ja,null===e?ja:e}function Ss(e,t){var n=Ol;Ol|=16;var r=ws();for(Pl===e&&Tl===t||ys(e,t);;)try{ks();break}catch(t){bs(e,t)}if(Ji(),Ol=n,El.current=r,null!==jl)throw Error(a(261));return Pl=null,Tl=0,Rl}function ks(){for(;null!==jl;)Es(jl)}function xs(){for(;null!==jl&&!Ei();)Es(jl)}function Es(e){var t=Vl(e.alternate,e,_l);e.memoizedProps=e.pendingProps,null===t?Cs(e):jl=t,Cl.current=null}function Cs(e){var t=e;do{var n=t.alternate;if(e=t.return,0==(2048&t.flags)){if(null!==(n=tl(n,t,_l)))return void(jl=n);if(24!==(n=t).tag&&23!==n.tag||null===n.memoizedState||0!=(1073741824&_l)||0==(4&n.mode)){for(var r=0,i=n.child;null!==i;)r|=i.lanes|i.childLanes,i=i.sibling;n.childLanes=r}null!==e&&0==(2048&e.flags)&&(null===e.firstEffect&&(e.firstEffect=t.firstEffect),null!==t.lastEffect&&(null!==e.lastEffect&&(e.lastEffect.nextEffect=t.firstEffect),e.lastEffect=t.lastEffect),1<t.flags&&(null!==e.lastEffect?e.lastEffect.nextEffect=t:e.firstEffect=t,e.lastEffect=t))}else{if(null!==(n=nl(t)))return n.flags&=2047,void(jl=n);null!==e&&(e.firstEffect=e.lastEffect=null,e.flags|=2048)}if(null!==(t=t.sibling))return void(jl=t);jl=t=e}while(null!==t);0===Rl&&(Rl=5)}function Os(e){var t=Ui();return Vi(99,Ps.bind(null,e,t)),null}function Ps(e,t){do{Ts()}while(null!==Kl);if(0!=(48&Ol))throw Error(a(327));var n=e.finishedWork;if(null===n)return null;if(e.finishedWork=null,e.finishedLanes=0,n===e.current)throw Error(a(177));e.callbackNode=null;var r=n.lanes|n.childLanes,i=r,o=e.pendingLanes&~i;e.pendingLanes=i,e.suspendedLanes=0,e.pingedLanes=0,e.expiredLanes&=i,e.mutableReadLanes&=i,e.entangledLanes&=i,i=e.entanglements;for(var l=e.eventTimes,s=e.expirationTimes;0<o;){var u=31-Bt(o),c=1<<u;i[u]=0,l[u]=-1,s[u]=-1,o&=~c}if(null!==Jl&&0==(24&r)&&Jl.has(e)&&Jl.delete(e),e===Pl&&(jl=Pl=null,Tl=0),1<n.flags?null!==n.lastEffect?(n.lastEffect.nextEffect=n,r=n.firstEffect):r=n:r=n.firstEffect,null!==r){if(i=Ol,Ol|=32,Cl.current=null,Ar=Kt,pr(l=fr())){if("selectionStart"in l)s={start:l.selectionStart,end:l.selectionEnd};else e:if(s=(s=l.ownerDocument)&&s.defaultView||window,(c=s.getSelection&&s.getSelection())&&0!==c.rangeCount){s=c.anchorNode,o=c.anchorOffset,u=c.focusNode,c=c.focusOffset;try{s.nodeType,u.nodeType}catch(e){s=null;break e}var d=0,f=-1,p=-1,h=0,v=0,m=l,g=null;t:for(;;){for(var y;m!==s||0!==o&&3!==m.nodeType||(f=d+o),m!==u||0!==c&&3!==m.nodeType||(p=d+c),3===m.nodeType&&(d+=m.nodeValue.length),null!==(y=m.firstChild);)g=m,m=y;for(;;){if(m===l)break t;if(g===s&&++h===o&&(f=d),g===u&&++v===c&&(p=d),null!==(y=m.nextSibling))break;g=(m=g).parentNode}m=y}s=-1===f||-1===p?null:{start:f,end:p}}else s=null;s=s||{start:0,end:0}}else s=null;Fr={focusedElem:l,selectionRange:s},Kt=!1,is=null,os=!1,Bl=r;do{try{js()}catch(e){if(null===Bl)throw Error(a(330));Ds(Bl,e),Bl=Bl.nextEffect}}while(null!==Bl);is=null,Bl=r;do{try{for(l=e;null!==Bl;){var b=Bl.flags;if(16&b&&ge(Bl.stateNode,""),128&b){var w=Bl.alternate;if(null!==w){var S=w.ref;null!==S&&("function"==typeof S?S(null):S.current=null)}}switch(1038&b){case 2:ml(Bl),Bl.flags&=-3;break;case 6:ml(Bl),Bl.flags&=-3,wl(Bl.alternate,Bl);break;case 1024:Bl.flags&=-1025;break;case 1028:Bl.flags&=-1025,wl(Bl.alternate,Bl);break;case 4:wl(Bl.alternate,Bl);break;case 8:bl(l,s=Bl);var k=s.alternate;hl(s),null!==k&&hl(k)}Bl=Bl.nextEffect}}catch(e){if(null===Bl)throw Error(a(330));Ds(Bl,e),Bl=Bl.nextEffect}}while(null!==Bl);if(S=Fr,w=fr(),b=S.focusedElem,l=S.selectionRange,w!==b&&b&&b.ownerDocument&&dr(b.ownerDocument.documentElement,b)){null!==l&&pr(b)&&(w=l.start,void 0===(S=l.end)&&(S=w),"selectionStart"in b?(b.selectionStart=w,b.selectionEnd=Math.min(S,b.value.length)):(S=(w=b.ownerDocument||document)&&w.defaultView||window).getSelection&&(S=S.getSelection(),s=b.textContent.length,k=Math.min(l.start,s),l=void 0===l.end?k:Math.min(l.end,s),!S.extend&&k>l&&(s=l,l=k,k=s),s=cr(b,k),o=cr(b,l),s&&o&&(1!==S.rangeCount||S.anchorNode!==s.node||S.anchorOffset!==s.offset||S.focusNode!==o.node||S.focusOffset!==o.offset)&&((w=w.createRange()).setStart(s.node,s.offset),S.removeAllRanges(),k>l?(S.addRange(w),S.extend(o.node,o.offset)):(w.setEnd(o.node,o.offset),S.addRange(w))))),w=[];for(S=b;S=S.parentNode;)1===S.nodeType&&w.push({element:S,left:S.scrollLeft,top:S.scrollTop});for("function"==typeof b.focus&&b.focus(),b=0;b<w.length;b++)(S=w[b]).element.scrollLeft=S.left,S.element.scrollTop=S.top}Kt=!!Ar,Fr=Ar=null,e.current=n,Bl=r;do{try{for(b=e;null!==Bl;){var x=Bl.flags;if(36&x&&dl(b,Bl.alternate,Bl),128&x){w=void 0;var E=Bl.ref;if(null!==E){var C=Bl.stateNode;switch(Bl.tag){case 5:w=C;break;default:w=C}"function"==typeof E?E(w):E.current=w}}Bl=Bl.nextEffect}}catch(e){if(null===Bl)throw Error(a(330));Ds(Bl,e),Bl=Bl.nextEffect}}while(null!==Bl);Bl=null,Di(),Ol=i}else e.current=n;if(Ql)Ql=!1,Kl=e,Gl=t;else for(Bl=r;null!==Bl;)t=Bl.nextEffect,Bl.nextEffect=null,8&Bl.flags&&((x=Bl).sibling=null,x.stateNode=null),Bl=t;if(0===(r=e.pendingLanes)&&(Hl=null),1===r?e===es?Zl++:(Zl=0,es=e):Zl=0,n=n.stateNode,wi&&"function"==typeof wi.onCommitFiberRoot)try{wi.onCommitFiberRoot(bi,n,void 0,64==(64&n.current.flags))}catch(e){}if(cs(e,zi()),Wl)throw Wl=!1,e=ql,ql=null,e;return 0!=(8&Ol)||Wi(),null}function js(){for(;null!==Bl;){var e=Bl.alternate;os||null===is||(0!=(8&Bl.flags)?Ze(Bl,is)&&(os=!0):13===Bl.tag&&kl(e,Bl)&&Ze(Bl,is)&&(os=!0));var t=Bl.flags;0!=(256&t)&&cl(e,Bl),0==(512&t)||Ql||(Ql=!0,Bi(97,(function(){return Ts(),null}))),Bl=Bl.nextEffect}}function Ts(){if(90!==Gl){var e=97<Gl?97:Gl;return Gl=90,Vi(e,Rs)}return!1}function _s(e,t){Yl.push(t,e),Ql||(Ql=!0,Bi(97,(function(){return Ts(),null})))}function Ns(e,t){Xl.push(t,e),Ql||(Ql=!0,Bi(97,(function(){return Ts(),null})))}function Rs(){if(null===Kl)return!1;var e=Kl;if(Kl=null,0!=(48&Ol))throw Error(a(331));var t=Ol;Ol|=32;var n=Xl;Xl=[];for(var r=0;r<n.length;r+=2){var i=n[r],o=n[r+1],l=i.destroy;if(i.destroy=void 0,"function"==typeof l)try{l()}catch(e){if(null===o)throw Error(a(330));Ds(o,e)}}for(n=Yl,Yl=[],r=0;r<n.length;r+=2){i=n[r],o=n[r+1];try{var s=i.create;i.destroy=s()}catch(e){if(null===o)throw Error(a(330));Ds(o,e)}}for(s=e.current.firstEffect;null!==s;)e=s.nextEffect,s.nextEffect=null,8&s.flags&&(s.sibling=null,s.stateNode=null),s=e;return Ol=t,Wi(),!0}function Ms(e,t,n){lo(e,t=al(0,t=rl(n,t),1)),t=as(),null!==(e=us(e,1))&&(Vt(e,1,t),cs(e,t))}function Ds(e,t){if(3===e.tag)Ms(e,e,t);else for(var n=e.return;null!==n;){if(3===n.tag){Ms(n,e,t);break}if(1===n.tag){var r=n.stateNode;if("function"==typeof n.type.getDerivedStateFromError||"function"==typeof r.componentDidCatch&&(null===Hl||!Hl.has(r))){var i=ll(n,e=rl(t,e),1);if(lo(n,i),i=as(),null!==(n=us(n,1)))Vt(n,1,i),cs(n,i);else if("function"==typeof r.componentDidCatch&&(null===Hl||!Hl.has(r)))try{r.componentDidCatch(t,e)}catch(e){}break}}n=n.return}}function Ls(e,t,n){var r=e.pingCache;null!==r&&r.delete(t),t=as(),e.pingedLanes|=e.suspendedLanes&n,Pl===e&&(Tl&n)===n&&(4===Rl||3===Rl&&(62914560&Tl)===Tl&&500>zi()-zl?ys(e,0):Al|=n),cs(e,t)}function Is(e,t){var n=e.stateNode;null!==n&&n.delete(t),0==(t=0)&&(0==(2&(t=e.mode))?t=1:0==(4&t)?t=99===Ui()?1:2:(0===ns&&(ns=Dl),0===(t=Ut(62914560&~ns))&&(t=4194304))),n=as(),null!==(e=us(e,t))&&(Vt(e,t,n),cs(e,n))}function As(e,t,n,r){this.tag=e,this.key=n,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.ref=null,this.pendingProps=t,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=r,this.flags=0,this.lastEffect=this.firstEffect=this.nextEffect=null,this.childLanes=this.lanes=0,this.alternate=null}function Fs(e,t,n,r){return new As(e,t,n,r)}function zs(e){return!(!(e=e.prototype)||!e.isReactComponent)}function Us(e,t){var n=e.alternate;return null===n?((n=Fs(e.tag,t,e.key,e.mode)).elementType=e.elementType,n.type=e.type,n.stateNode=e.stateNode,n.alternate=e,e.alternate=n):(n.pendingProps=t,n.type=e.type,n.flags=0,n.nextEffect=null,n.firstEffect=null,n.lastEffect=null),n.childLanes=e.childLanes,n.lanes=e.lanes,n.child=e.child,n.memoizedProps=e.memoizedProps,n.memoizedState=e.memoizedState,n.updateQueue=e.updateQueue,t=e.dependencies,n.dependencies=null===t?null:{lanes:t.lanes,firstContext:t.firstContext},n.sibling=e.sibling,n.index=e.index,n.ref=e.ref,n}function $s(e,t,n,r,i,o){var l=2;if(r=e,"function"==typeof e)zs(e)&&(l=1);else if("string"==typeof e)l=5;else e:switch(e){case E:return Vs(n.children,i,o,t);case I:l=8,i|=16;break;case C:l=8,i|=1;break;case O:return(e=Fs(12,n,t,8|i)).elementType=O,e.type=O,e.lanes=o,e;case _:return(e=Fs(13,n,t,i)).type=_,e.elementType=_,e.lanes=o,e;case N:return(e=Fs(19,n,t,i)).elementType=N,e.lanes=o,e;case A:return Bs(n,i,o,t);case F:return(e=Fs(24,n,t,i)).elementType=F,e.lanes=o,e;default:if("object"==typeof e&&null!==e)switch(e.$$typeof){case P:l=10;break e;case j:l=9;break e;case T:l=11;break e;case R:l=14;break e;case M:l=16,r=null;break e;case D:l=22;break e}throw Error(a(130,null==e?e:typeof e,""))}return(t=Fs(l,n,t,i)).elementType=e,t.type=r,t.lanes=o,t}function Vs(e,t,n,r){return(e=Fs(7,e,r,t)).lanes=n,e}function Bs(e,t,n,r){return(e=Fs(23,e,r,t)).elementType=A,e.lanes=n,e}function Ws(e,t,n){return(e=Fs(6,e,null,t)).lanes=n,e}function qs(e,t,n){return(t=Fs(4,null!==e.children?e.children:[],e.key,t)).lanes=n,t.stateNode={containerInfo:e.containerInfo,pendingChildren:null,implementation:e.implementation},t}function Hs(e,t,n){this.tag=t,this.containerInfo=e,this.finishedWork=this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.pendingContext=this.context=null,this.hydrate=n,this.callbackNode=null,this.callbackPriority=0,this.eventTimes=$t(0),this.expirationTimes=$t(-1),this.entangledLanes=this.finishedLanes=this.mutableReadLanes=this.expiredLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=$t(0),this.mutableSourceEagerHydrationData=null}function Qs(e,t,n){var r=3<arguments.length&&void 0!==arguments[3]?arguments[3]:null;return{$$typeof:x,key:null==r?null:""+r,children:e,containerInfo:t,implementation:n}}function Ks(e,t,n,r){var i=t.current,o=as(),l=ls(i);e:if(n){t:{if(Ge(n=n._reactInternals)!==n||1!==n.tag)throw Error(a(170));var s=n;do{switch(s.tag){case 3:s=s.stateNode.context;break t;case 1:if(pi(s.type)){s=s.stateNode.__reactInternalMemoizedMergedChildContext;break t}}s=s.return}while(null!==s);throw Error(a(171))}if(1===n.tag){var u=n.type;if(pi(u)){n=mi(n,u,s);break e}}n=s}else n=si;return null===t.context?t.context=n:t.pendingContext=n,(t=ao(o,l)).payload={element:e},null!==(r=void 0===r?null:r)&&(t.callback=r),lo(i,t),ss(i,l,o),l}function Gs(e){if(!(e=e.current).child)return null;switch(e.child.tag){case 5:default:return e.child.stateNode}}function Ys(e,t){if(null!==(e=e.memoizedState)&&null!==e.dehydrated){var n=e.retryLane;e.retryLane=0!==n&&n<t?n:t}}function Xs(e,t){Ys(e,t),(e=e.alternate)&&Ys(e,t)}function Js(e,t,n){var r=null!=n&&null!=n.hydrationOptions&&n.hydrationOptions.mutableSources||null;if(n=new Hs(e,t,null!=n&&!0===n.hydrate),t=Fs(3,null,null,2===t?7:1===t?3:0),n.current=t,t.stateNode=n,io(t),e[Yr]=n.current,jr(8===e.nodeType?e.parentNode:e),r)for(e=0;e<r.length;e++){var i=(t=r[e])._getVersion;i=i(t._source),null==n.mutableSourceEagerHydrationData?n.mutableSourceEagerHydrationData=[t,i]:n.mutableSourceEagerHydrationData.push(t,i)}this._internalRoot=n}function Zs(e){return!(!e||1!==e.nodeType&&9!==e.nodeType&&11!==e.nodeType&&(8!==e.nodeType||" react-mount-point-unstable "!==e.nodeValue))}function eu(e,t,n,r,i){var o=n._reactRootContainer;if(o){var a=o._internalRoot;if("function"==typeof i){var l=i;i=function(){var e=Gs(a);l.call(e)}}Ks(t,a,e,i)}else{if(o=n._reactRootContainer=function(e,t){if(t||(t=!(!(t=e?9===e.nodeType?e.documentElement:e.firstChild:null)||1!==t.nodeType||!t.hasAttribute("data-reactroot"))),!t)for(var n;n=e.lastChild;)e.removeChild(n);return new Js(e,0,t?{hydrate:!0}:void 0)}(n,r),a=o._internalRoot,"function"==typeof i){var s=i;i=function(){var e=Gs(a);s.call(e)}}vs((function(){Ks(t,a,e,i)}))}return Gs(a)}function tu(e,t){var n=2<arguments.length&&void 0!==arguments[2]?arguments[2]:null;if(!Zs(t))throw Error(a(200));return Qs(e,t,null,n)}Vl=function(e,t,n){var r=t.lanes;if(null!==e)if(e.memoizedProps!==t.pendingProps||ci.current)Ma=!0;else{if(0==(n&r)){switch(Ma=!1,t.tag){case 3:Ba(t),Wo();break;case 5:Ro(t);break;case 1:pi(t.type)&&gi(t);break;case 4:_o(t,t.stateNode.containerInfo);break;case 10:r=t.memoizedProps.value;var i=t.type._context;li(Ki,i._currentValue),i._currentValue=r;break;case 13:if(null!==t.memoizedState)return 0!=(n&t.child.childLanes)?Ka(e,t,n):(li(Do,1&Do.current),null!==(t=Za(e,t,n))?t.sibling:null);li(Do,1&Do.current);break;case 19:if(r=0!=(n&t.childLanes),0!=(64&e.flags)){if(r)return Ja(e,t,n);t.flags|=64}if(null!==(i=t.memoizedState)&&(i.rendering=null,i.tail=null,i.lastEffect=null),li(Do,Do.current),r)break;return null;case 23:case 24:return t.lanes=0,Fa(e,t,n)}return Za(e,t,n)}Ma=0!=(16384&e.flags)}else Ma=!1;switch(t.lanes=0,t.tag){case 2:if(r=t.type,null!==e&&(e.alternate=null,t.alternate=null,t.flags|=2),e=t.pendingProps,i=fi(t,ui.current),to(t,n),i=ra(null,t,r,e,i,n),t.flags|=1,"object"==typeof i&&null!==i&&"function"==typeof i.render&&void 0===i.$$typeof){if(t.tag=1,t.memoizedState=null,t.updateQueue=null,pi(r)){var o=!0;gi(t)}else o=!1;t.memoizedState=null!==i.state&&void 0!==i.state?i.state:null,io(t);var l=r.getDerivedStateFromProps;"function"==typeof l&&po(t,r,l,e),i.updater=ho,t.stateNode=i,i._reactInternals=t,yo(t,r,e,n),t=Va(null,t,r,!0,o,n)}else t.tag=0,Da(null,t,i,n),t=t.child;return t;case 16:i=t.elementType;e:{switch(null!==e&&(e.alternate=null,t.alternate=null,t.flags|=2),e=t.pendingProps,i=(o=i._init)(i._payload),t.type=i,o=t.tag=function(e){if("function"==typeof e)return zs(e)?1:0;if(null!=e){if((e=e.$$typeof)===T)return 11;if(e===R)return 14}return 2}(i),e=Qi(i,e),o){case 0:t=Ua(null,t,i,e,n);break e;case 1:t=$a(null,t,i,e,n);break e;case 11:t=La(null,t,i,e,n);break e;case 14:t=Ia(null,t,i,Qi(i.type,e),r,n);break e}throw Error(a(306,i,""))}return t;case 0:return r=t.type,i=t.pendingProps,Ua(e,t,r,i=t.elementType===r?i:Qi(r,i),n);case 1:return r=t.type,i=t.pendingProps,$a(e,t,r,i=t.elementType===r?i:Qi(r,i),n);case 3:if(Ba(t),r=t.updateQueue,null===e||null===r)throw Error(a(282));if(r=t.pendingProps,i=null!==(i=t.memoizedState)?i.element:null,oo(e,t),uo(t,r,null,n),(r=t.memoizedState.element)===i)Wo(),t=Za(e,t,n);else{if((o=(i=t.stateNode).hydrate)&&(Ao=Wr(t.stateNode.containerInfo.firstChild),Io=t,o=Fo=!0),o){if(null!=(e=i.mutableSourceEagerHydrationData))for(i=0;i<e.length;i+=2)(o=e[i])._workInProgressVersionPrimary=e[i+1],qo.push(o);for(n=Eo(t,null,r,n),t.child=n;n;)n.flags=-3&n.flags|1024,n=n.sibling}else Da(e,t,r,n),Wo();t=t.child}return t;case 5:return Ro(t),null===e&&$o(t),r=t.type,i=t.pendingProps,o=null!==e?e.memoizedProps:null,l=i.children,Ur(r,i)?l=null:null!==o&&Ur(r,o)&&(t.flags|=16),za(e,t),Da(e,t,l,n),t.child;case 6:return null===e&&$o(t),null;case 13:return Ka(e,t,n);case 4:return _o(t,t.stateNode.containerInfo),r=t.pendingProps,null===e?t.child=xo(t,null,r,n):Da(e,t,r,n),t.child;case 11:return r=t.type,i=t.pendingProps,La(e,t,r,i=t.elementType===r?i:Qi(r,i),n);case 7:return Da(e,t,t.pendingProps,n),t.child;case 8:case 12:return Da(e,t,t.pendingProps.children,n),t.child;case 10:e:{r=t.type._context,i=t.pendingProps,l=t.memoizedProps,o=i.value;var s=t.type._context;if(li(Ki,s._currentValue),s._currentValue=o,null!==l)if(s=l.value,0==(o=ar(s,o)?0:0|("function"==typeof r._calculateChangedBits?r._calculateChangedBits(s,o):1073741823))){if(l.children===i.children&&!ci.current){t=Za(e,t,n);break e}}else for(null!==(s=t.child)&&(s.return=t);null!==s;){var u=s.dependencies;if(null!==u){l=s.child;for(var c=u.firstContext;null!==c;){if(c.context===r&&0!=(c.observedBits&o)){1===s.tag&&((c=ao(-1,n&-n)).tag=2,lo(s,c)),s.lanes|=n,null!==(c=s.alternate)&&(c.lanes|=n),eo(s.return,n),u.lanes|=n;break}c=c.next}}else l=10===s.tag&&s.type===t.type?null:s.child;if(null!==l)l.return=s;else for(l=s;null!==l;){if(l===t){l=null;break}if(null!==(s=l.sibling)){s.return=l.return,l=s;break}l=l.return}s=l}Da(e,t,i.children,n),t=t.child}return t;case 9:return i=t.type,r=(o=t.pendingProps).children,to(t,n),r=r(i=no(i,o.unstable_observedBits)),t.flags|=1,Da(e,t,r,n),t.child;case 14:return o=Qi(i=t.type,t.pendingProps),Ia(e,t,i,o=Qi(i.type,o),r,n);case 15:return Aa(e,t,t.type,t.pendingProps,r,n);case 17:return r=t.type,i=t.pendingProps,i=t.elementType===r?i:Qi(r,i),null!==e&&(e.alternate=null,t.alternate=null,t.flags|=2),t.tag=1,pi(r)?(e=!0,gi(t)):e=!1,to(t,n),mo(t,r,i),yo(t,r,i,n),Va(null,t,r,!0,e,n);case 19:return Ja(e,t,n);case 23:case 24:return Fa(e,t,n)}throw Error(a(156,t.tag))},Js.prototype.render=function(e){Ks(e,this._internalRoot,null,null)},Js.prototype.unmount=function(){var e=this._internalRoot,t=e.containerInfo;Ks(null,e,null,(function(){t[Yr]=null}))},et=function(e){13===e.tag&&(ss(e,4,as()),Xs(e,4))},tt=function(e){13===e.tag&&(ss(e,67108864,as()),Xs(e,67108864))},nt=function(e){if(13===e.tag){var t=as(),n=ls(e);ss(e,n,t),Xs(e,n)}},rt=function(e,t){return t()},Oe=function(e,t,n){switch(t){case"input":if(ne(e,n),t=n.name,"radio"===n.type&&null!=t){for(n=e;n.parentNode;)n=n.parentNode;for(n=n.querySelectorAll("input[name="+JSON.stringify(""+t)+'][type="radio"]'),t=0;t<n.length;t++){var r=n[t];if(r!==e&&r.form===e.form){var i=ti(r);if(!i)throw Error(a(90));X(r),ne(r,i)}}}break;case"textarea":ue(e,n);break;case"select":null!=(t=n.value)&&ae(e,!!n.multiple,t,!1)}},Re=hs,Me=function(e,t,n,r,i){var o=Ol;Ol|=4;try{return Vi(98,e.bind(null,t,n,r,i))}finally{0===(Ol=o)&&($l(),Wi())}},De=function(){0==(49&Ol)&&(function(){if(null!==Jl){var e=Jl;Jl=null,e.forEach((function(e){e.expiredLanes|=24&e.pendingLanes,cs(e,zi())}))}Wi()}(),Ts())},Le=function(e,t){var n=Ol;Ol|=2;try{return e(t)}finally{0===(Ol=n)&&($l(),Wi())}};var nu={Events:[Zr,ei,ti,_e,Ne,Ts,{current:!1}]},ru={findFiberByHostInstance:Jr,bundleType:0,version:"17.0.1",rendererPackageName:"react-dom"},iu={bundleType:ru.bundleType,version:ru.version,rendererPackageName:ru.rendererPackageName,rendererConfig:ru.rendererConfig,overrideHookState:null,overrideHookStateDeletePath:null,overrideHookStateRenamePath:null,overrideProps:null,overridePropsDeletePath:null,overridePropsRenamePath:null,setSuspenseHandler:null,scheduleUpdate:null,currentDispatcherRef:S.ReactCurrentDispatcher,findHostInstanceByFiber:function(e){return null===(e=Je(e))?null:e.stateNode},findFiberByHostInstance:ru.findFiberByHostInstance||function(){return null},findHostInstancesForRefresh:null,scheduleRefresh:null,scheduleRoot:null,setRefreshHandler:null,getCurrentFiber:null};if("undefined"!=typeof __REACT_DEVTOOLS_GLOBAL_HOOK__){var ou=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!ou.isDisabled&&ou.supportsFiber)try{bi=ou.inject(iu),wi=ou}catch(ve){}}t.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=nu,t.createPortal=tu,t.findDOMNode=function(e){if(null==e)return null;if(1===e.nodeType)return e;var t=e._reactInternals;if(void 0===t){if("function"==typeof e.render)throw Error(a(188));throw Error(a(268,Object.keys(e)))}return null===(e=Je(t))?null:e.stateNode},t.flushSync=function(e,t){var n=Ol;if(0!=(48&n))return e(t);Ol|=1;try{if(e)return Vi(99,e.bind(null,t))}finally{Ol=n,Wi()}},t.hydrate=function(e,t,n){if(!Zs(t))throw Error(a(200));return eu(null,e,t,!0,n)},t.render=function(e,t,n){if(!Zs(t))throw Error(a(200));return eu(null,e,t,!1,n)},t.unmountComponentAtNode=function(e){if(!Zs(e))throw Error(a(40));return!!e._reactRootContainer&&(vs((function(){eu(null,null,e,!1,(function(){e._reactRootContainer=null,e[Yr]=null}))})),!0)},t.unstable_batchedUpdates=hs,t.unstable_createPortal=function(e,t){return tu(e,t,2<arguments.length&&void 0!==arguments[2]?arguments[2]:null)},t.unstable_renderSubtreeIntoContainer=function(e,t,n,r){if(!Zs(n))throw Error(a(200));if(null==e||void 0===e._reactInternals)throw Error(a(38));return eu(e,t,n,!1,r)},t.version="17.0.1"},935:(e,t,n)=>{"use strict";!function e(){if("undefined"!=typeof __REACT_DEVTOOLS_GLOBAL_HOOK__&&"function"==typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE)try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(e)}catch(e){console.error(e)}}(),e.exports=n(448)},921:(e,t)=>{"use strict";var n="function"==typeof Symbol&&Symbol.for,r=n?Symbol.for("react.element"):60103,i=n?Symbol.for("react.portal"):60106,o=n?Symbol.for("react.fragment"):60107,a=n?Symbol.for("react.strict_mode"):60108,l=n?Symbol.for("react.profiler"):60114,s=n?Symbol.for("react.provider"):60109,u=n?Symbol.for("react.context"):60110,c=n?Symbol.for("react.async_mode"):60111,d=n?Symbol.for("react.concurrent_mode"):60111,f=n?Symbol.for("react.forward_ref"):60112,p=n?Symbol.for("react.suspense"):60113,h=n?Symbol.for("react.suspense_list"):60120,v=n?Symbol.for("react.memo"):60115,m=n?Symbol.for("react.lazy"):60116,g=n?Symbol.for("react.block"):60121,y=n?Symbol.for("react.fundamental"):60117,b=n?Symbol.for("react.responder"):60118,w=n?Symbol.for("react.scope"):60119;function S(e){if("object"==typeof e&&null!==e){var t=e.$$typeof;switch(t){case r:switch(e=e.type){case c:case d:case o:case l:case a:case p:return e;default:switch(e=e&&e.$$typeof){case u:case f:case m:case v:case s:return e;default:return t}}case i:return t}}}function k(e){return S(e)===d}t.AsyncMode=c,t.ConcurrentMode=d,t.ContextConsumer=u,t.ContextProvider=s,t.Element=r,t.ForwardRef=f,t.Fragment=o,t.Lazy=m,t.Memo=v,t.Portal=i,t.Profiler=l,t.StrictMode=a,t.Suspense=p,t.isAsyncMode=function(e){return k(e)||S(e)===c},t.isConcurrentMode=k,t.isContextConsumer=function(e){return S(e)===u},t.isContextProvider=function(e){return S(e)===s},t.isElement=function(e){return"object"==typeof e&&null!==e&&e.$$typeof===r},t.isForwardRef=function(e){return S(e)===f},t.isFragment=function(e){return S(e)===o},t.isLazy=function(e){return S(e)===m},t.isMemo=function(e){return S(e)===v},t.isPortal=function(e){return S(e)===i},t.isProfiler=function(e){return S(e)===l},t.isStrictMode=function(e){return S(e)===a},t.isSuspense=function(e){return S(e)===p},t.isValidElementType=function(e){return"string"==typeof e||"function"==typeof e||e===o||e===d||e===l||e===a||e===p||e===h||"object"==typeof e&&null!==e&&(e.$$typeof===m||e.$$typeof===v||e.$$typeof===s||e.$$typeof===u||e.$$typeof===f||e.$$typeof===y||e.$$typeof===b||e.$$typeof===w||e.$$typeof===g)},t.typeOf=S},864:(e,t,n)=>{"use strict";e.exports=n(921)},251:(e,t,n)=>{"use strict";n(418);var r=n(294),i=60103;if(t.Fragment=60107,"function"==typeof Symbol&&Symbol.for){var o=Symbol.for;i=o("react.element"),t.Fragment=o("react.fragment")}var a=r.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED.ReactCurrentOwner,l=Object.prototype.hasOwnProperty,s={key:!0,ref:!0,__self:!0,__source:!0};function u(e,t,n){var r,o={},u=null,c=null;for(r in void 0!==n&&(u=""+n),void 0!==t.key&&(u=""+t.key),void 0!==t.ref&&(c=t.ref),t)l.call(t,r)&&!s.hasOwnProperty(r)&&(o[r]=t[r]);if(e&&e.defaultProps)for(r in t=e.defaultProps)void 0===o[r]&&(o[r]=t[r]);return{$$typeof:i,type:e,key:u,ref:c,props:o,_owner:a.current}}t.jsx=u,t.jsxs=u},408:(e,t,n)=>{"use strict";var r=n(418),i=60103,o=60106;t.Fragment=60107,t.StrictMode=60108,t.Profiler=60114;var a=60109,l=60110,s=60112;t.Suspense=60113;var u=60115,c=60116;if("function"==typeof Symbol&&Symbol.for){var d=Symbol.for;i=d("react.element"),o=d("react.portal"),t.Fragment=d("react.fragment"),t.StrictMode=d("react.strict_mode"),t.Profiler=d("react.profiler"),a=d("react.provider"),l=d("react.context"),s=d("react.forward_ref"),t.Suspense=d("react.suspense"),u=d("react.memo"),c=d("react.lazy")}var f="function"==typeof Symbol&&Symbol.iterator;function p(e){for(var t="https://reactjs.org/docs/error-decoder.html?invariant="+e,n=1;n<arguments.length;n++)t+="&args[]="+encodeURIComponent(arguments[n]);return"Minified React error #"+e+"; visit "+t+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}var h={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},v={};function m(e,t,n){this.props=e,this.context=t,this.refs=v,this.updater=n||h}function g(){}function y(e,t,n){this.props=e,this.context=t,this.refs=v,this.updater=n||h}m.prototype.isReactComponent={},m.prototype.setState=function(e,t){if("object"!=typeof e&&"function"!=typeof e&&null!=e)throw Error(p(85));this.updater.enqueueSetState(this,e,t,"setState")},m.prototype.forceUpdate=function(e){this.updater.enqueueForceUpdate(this,e,"forceUpdate")},g.prototype=m.prototype;var b=y.prototype=new g;b.constructor=y,r(b,m.prototype),b.isPureReactComponent=!0;var w={current:null},S=Object.prototype.hasOwnProperty,k={key:!0,ref:!0,__self:!0,__source:!0};function x(e,t,n){var r,o={},a=null,l=null;if(null!=t)for(r in void 0!==t.ref&&(l=t.ref),void 0!==t.key&&(a=""+t.key),t)S.call(t,r)&&!k.hasOwnProperty(r)&&(o[r]=t[r]);var s=arguments.length-2;if(1===s)o.children=n;else if(1<s){for(var u=Array(s),c=0;c<s;c++)u[c]=arguments[c+2];o.children=u}if(e&&e.defaultProps)for(r in s=e.defaultProps)void 0===o[r]&&(o[r]=s[r]);return{$$typeof:i,type:e,key:a,ref:l,props:o,_owner:w.current}}function E(e){return"object"==typeof e&&null!==e&&e.$$typeof===i}var C=/\/+/g;function O(e,t){return"object"==typeof e&&null!==e&&null!=e.key?function(e){var t={"=":"=0",":":"=2"};return"$"+e.replace(/[=:]/g,(function(e){return t[e]}))}(""+e.key):t.toString(36)}function P(e,t,n,r,a){var l=typeof e;"undefined"!==l&&"boolean"!==l||(e=null);var s=!1;if(null===e)s=!0;else switch(l){case"string":case"number":s=!0;break;case"object":switch(e.$$typeof){case i:case o:s=!0}}if(s)return a=a(s=e),e=""===r?"."+O(s,0):r,Array.isArray(a)?(n="",null!=e&&(n=e.replace(C,"$&/")+"/"),P(a,t,n,"",(function(e){return e}))):null!=a&&(E(a)&&(a=function(e,t){return{$$typeof:i,type:e.type,key:t,ref:e.ref,props:e.props,_owner:e._owner}}(a,n+(!a.key||s&&s.key===a.key?"":(""+a.key).replace(C,"$&/")+"/")+e)),t.push(a)),1;if(s=0,r=""===r?".":r+":",Array.isArray(e))for(var u=0;u<e.length;u++){var c=r+O(l=e[u],u);s+=P(l,t,n,c,a)}else if("function"==typeof(c=function(e){return null===e||"object"!=typeof e?null:"function"==typeof(e=f&&e[f]||e["@@iterator"])?e:null}(e)))for(e=c.call(e),u=0;!(l=e.next()).done;)s+=P(l=l.value,t,n,c=r+O(l,u++),a);else if("object"===l)throw t=""+e,Error(p(31,"[object Object]"===t?"object with keys {"+Object.keys(e).join(", ")+"}":t));return s}function j(e,t,n){if(null==e)return e;var r=[],i=0;return P(e,r,"","",(function(e){return t.call(n,e,i++)})),r}function T(e){if(-1===e._status){var t=e._result;t=t(),e._status=0,e._result=t,t.then((function(t){0===e._status&&(t=t.default,e._status=1,e._result=t)}),(function(t){0===e._status&&(e._status=2,e._result=t)}))}if(1===e._status)return e._result;throw e._result}var _={current:null};function N(){var e=_.current;if(null===e)throw Error(p(321));return e}var R={ReactCurrentDispatcher:_,ReactCurrentBatchConfig:{transition:0},ReactCurrentOwner:w,IsSomeRendererActing:{current:!1},assign:r};t.Children={map:j,forEach:function(e,t,n){j(e,(function(){t.apply(this,arguments)}),n)},count:function(e){var t=0;return j(e,(function(){t++})),t},toArray:function(e){return j(e,(function(e){return e}))||[]},only:function(e){if(!E(e))throw Error(p(143));return e}},t.Component=m,t.PureComponent=y,t.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=R,t.cloneElement=function(e,t,n){if(null==e)throw Error(p(267,e));var o=r({},e.props),a=e.key,l=e.ref,s=e._owner;if(null!=t){if(void 0!==t.ref&&(l=t.ref,s=w.current),void 0!==t.key&&(a=""+t.key),e.type&&e.type.defaultProps)var u=e.type.defaultProps;for(c in t)S.call(t,c)&&!k.hasOwnProperty(c)&&(o[c]=void 0===t[c]&&void 0!==u?u[c]:t[c])}var c=arguments.length-2;if(1===c)o.children=n;else if(1<c){u=Array(c);for(var d=0;d<c;d++)u[d]=arguments[d+2];o.children=u}return{$$typeof:i,type:e.type,key:a,ref:l,props:o,_owner:s}},t.createContext=function(e,t){return void 0===t&&(t=null),(e={$$typeof:l,_calculateChangedBits:t,_currentValue:e,_currentValue2:e,_threadCount:0,Provider:null,Consumer:null}).Provider={$$typeof:a,_context:e},e.Consumer=e},t.createElement=x,t.createFactory=function(e){var t=x.bind(null,e);return t.type=e,t},t.createRef=function(){return{current:null}},t.forwardRef=function(e){return{$$typeof:s,render:e}},t.isValidElement=E,t.lazy=function(e){return{$$typeof:c,_payload:{_status:-1,_result:e},_init:T}},t.memo=function(e,t){return{$$typeof:u,type:e,compare:void 0===t?null:t}},t.useCallback=function(e,t){return N().useCallback(e,t)},t.useContext=function(e,t){return N().useContext(e,t)},t.useDebugValue=function(){},t.useEffect=function(e,t){return N().useEffect(e,t)},t.useImperativeHandle=function(e,t,n){return N().useImperativeHandle(e,t,n)},t.useLayoutEffect=function(e,t){return N().useLayoutEffect(e,t)},t.useMemo=function(e,t){return N().useMemo(e,t)},t.useReducer=function(e,t,n){return N().useReducer(e,t,n)},t.useRef=function(e){return N().useRef(e)},t.useState=function(e){return N().useState(e)},t.version="17.0.1"},294:(e,t,n)=>{"use strict";e.exports=n(408)},893:(e,t,n)=>{"use strict";e.exports=n(251)},53:(e,t)=>{"use strict";var n,r,i,o;if("object"==typeof performance&&"function"==typeof performance.now){var a=performance;t.unstable_now=function(){return a.now()}}else{var l=Date,s=l.now();t.unstable_now=function(){return l.now()-s}}if("undefined"==typeof window||"function"!=typeof MessageChannel){var u=null,c=null,d=function(){if(null!==u)try{var e=t.unstable_now();u(!0,e),u=null}catch(e){throw setTimeout(d,0),e}};n=function(e){null!==u?setTimeout(n,0,e):(u=e,setTimeout(d,0))},r=function(e,t){c=setTimeout(e,t)},i=function(){clearTimeout(c)},t.unstable_shouldYield=function(){return!1},o=t.unstable_forceFrameRate=function(){}}else{var f=window.setTimeout,p=window.clearTimeout;if("undefined"!=typeof console){var h=window.cancelAnimationFrame;"function"!=typeof window.requestAnimationFrame&&console.error("This browser doesn't support requestAnimationFrame. Make sure that you load a polyfill in older browsers. https://reactjs.org/link/react-polyfills"),"function"!=typeof h&&console.error("This browser doesn't support cancelAnimationFrame. Make sure that you load a polyfill in older browsers. https://reactjs.org/link/react-polyfills")}var v=!1,m=null,g=-1,y=5,b=0;t.unstable_shouldYield=function(){return t.unstable_now()>=b},o=function(){},t.unstable_forceFrameRate=function(e){0>e||125<e?console.error("forceFrameRate takes a positive int between 0 and 125, forcing frame rates higher than 125 fps is not supported"):y=0<e?Math.floor(1e3/e):5};var w=new MessageChannel,S=w.port2;w.port1.onmessage=function(){if(null!==m){var e=t.unstable_now();b=e+y;try{m(!0,e)?S.postMessage(null):(v=!1,m=null)}catch(e){throw S.postMessage(null),e}}else v=!1},n=function(e){m=e,v||(v=!0,S.postMessage(null))},r=function(e,n){g=f((function(){e(t.unstable_now())}),n)},i=function(){p(g),g=-1}}function k(e,t){var n=e.length;e.push(t);e:for(;;){var r=n-1>>>1,i=e[r];if(!(void 0!==i&&0<C(i,t)))break e;e[r]=t,e[n]=i,n=r}}function x(e){return void 0===(e=e[0])?null:e}function E(e){var t=e[0];if(void 0!==t){var n=e.pop();if(n!==t){e[0]=n;e:for(var r=0,i=e.length;r<i;){var o=2*(r+1)-1,a=e[o],l=o+1,s=e[l];if(void 0!==a&&0>C(a,n))void 0!==s&&0>C(s,a)?(e[r]=s,e[l]=n,r=l):(e[r]=a,e[o]=n,r=o);else{if(!(void 0!==s&&0>C(s,n)))break e;e[r]=s,e[l]=n,r=l}}}return t}return null}function C(e,t){var n=e.sortIndex-t.sortIndex;return 0!==n?n:e.id-t.id}var O=[],P=[],j=1,T=null,_=3,N=!1,R=!1,M=!1;function D(e){for(var t=x(P);null!==t;){if(null===t.callback)E(P);else{if(!(t.startTime<=e))break;E(P),t.sortIndex=t.expirationTime,k(O,t)}t=x(P)}}function L(e){if(M=!1,D(e),!R)if(null!==x(O))R=!0,n(I);else{var t=x(P);null!==t&&r(L,t.startTime-e)}}function I(e,n){R=!1,M&&(M=!1,i()),N=!0;var o=_;try{for(D(n),T=x(O);null!==T&&(!(T.expirationTime>n)||e&&!t.unstable_shouldYield());){var a=T.callback;if("function"==typeof a){T.callback=null,_=T.priorityLevel;var l=a(T.expirationTime<=n);n=t.unstable_now(),"function"==typeof l?T.callback=l:T===x(O)&&E(O),D(n)}else E(O);T=x(O)}if(null!==T)var s=!0;else{var u=x(P);null!==u&&r(L,u.startTime-n),s=!1}return s}finally{T=null,_=o,N=!1}}var A=o;t.unstable_IdlePriority=5,t.unstable_ImmediatePriority=1,t.unstable_LowPriority=4,t.unstable_NormalPriority=3,t.unstable_Profiling=null,t.unstable_UserBlockingPriority=2,t.unstable_cancelCallback=function(e){e.callback=null},t.unstable_continueExecution=function(){R||N||(R=!0,n(I))},t.unstable_getCurrentPriorityLevel=function(){return _},t.unstable_getFirstCallbackNode=function(){return x(O)},t.unstable_next=function(e){switch(_){case 1:case 2:case 3:var t=3;break;default:t=_}var n=_;_=t;try{return e()}finally{_=n}},t.unstable_pauseExecution=function(){},t.unstable_requestPaint=A,t.unstable_runWithPriority=function(e,t){switch(e){case 1:case 2:case 3:case 4:case 5:break;default:e=3}var n=_;_=e;try{return t()}finally{_=n}},t.unstable_scheduleCallback=function(e,o,a){var l=t.unstable_now();switch(a="object"==typeof a&&null!==a&&"number"==typeof(a=a.delay)&&0<a?l+a:l,e){case 1:var s=-1;break;case 2:s=250;break;case 5:s=1073741823;break;case 4:s=1e4;break;default:s=5e3}return e={id:j++,callback:o,priorityLevel:e,startTime:a,expirationTime:s=a+s,sortIndex:-1},a>l?(e.sortIndex=a,k(P,e),null===x(O)&&e===x(P)&&(M?i():M=!0,r(L,a-l))):(e.sortIndex=s,k(O,e),R||N||(R=!0,n(I))),e},t.unstable_wrapCallback=function(e){var t=_;return function(){var n=_;_=t;try{return e.apply(this,arguments)}finally{_=n}}}},840:(e,t,n)=>{"use strict";e.exports=n(53)},121:(e,t,n)=>{"use strict";n.d(t,{Z:()=>r}),e=n.hmd(e);const r=function(e){var t,n=e.Symbol;return"function"==typeof n?n.observable?t=n.observable:(t=n("observable"),n.observable=t):t="@@observable",t}("undefined"!=typeof self?self:"undefined"!=typeof window?window:void 0!==n.g?n.g:e)}},t={};function n(r){var i=t[r];if(void 0!==i)return i.exports;var o=t[r]={id:r,loaded:!1,exports:{}};return e[r](o,o.exports,n),o.loaded=!0,o.exports}n.n=e=>{var t=e&&e.__esModule?()=>e.default:()=>e;return n.d(t,{a:t}),t},n.d=(e,t)=>{for(var r in t)n.o(t,r)&&!n.o(e,r)&&Object.defineProperty(e,r,{enumerable:!0,get:t[r]})},n.g=function(){if("object"==typeof globalThis)return globalThis;try{return this||new Function("return this")()}catch(e){if("object"==typeof window)return window}}(),n.hmd=e=>((e=Object.create(e)).children||(e.children=[]),Object.defineProperty(e,"exports",{enumerable:!0,set:()=>{throw new Error("ES Modules may not assign module.exports or exports.*, Use ESM export syntax, instead: "+e.id)}}),e),n.o=(e,t)=>Object.prototype.hasOwnProperty.call(e,t),(()=>{"use strict";var e=n(893),t=n(294),r=n(935),i=(n(697),t.createContext(null)),o=function(e){e()},a=function(){return o},l={notify:function(){}},s=function(){function e(e,t){this.store=e,this.parentSub=t,this.unsubscribe=null,this.listeners=l,this.handleChangeWrapper=this.handleChangeWrapper.bind(this)}var t=e.prototype;return t.addNestedSub=function(e){return this.trySubscribe(),this.listeners.subscribe(e)},t.notifyNestedSubs=function(){this.listeners.notify()},t.handleChangeWrapper=function(){this.onStateChange&&this.onStateChange()},t.isSubscribed=function(){return Boolean(this.unsubscribe)},t.trySubscribe=function(){this.unsubscribe||(this.unsubscribe=this.parentSub?this.parentSub.addNestedSub(this.handleChangeWrapper):this.store.subscribe(this.handleChangeWrapper),this.listeners=function(){var e=a(),t=null,n=null;return{clear:function(){t=null,n=null},notify:function(){e((function(){for(var e=t;e;)e.callback(),e=e.next}))},get:function(){for(var e=[],n=t;n;)e.push(n),n=n.next;return e},subscribe:function(e){var r=!0,i=n={callback:e,next:null,prev:n};return i.prev?i.prev.next=i:t=i,function(){r&&null!==t&&(r=!1,i.next?i.next.prev=i.prev:n=i.prev,i.prev?i.prev.next=i.next:t=i.next)}}}}())},t.tryUnsubscribe=function(){this.unsubscribe&&(this.unsubscribe(),this.unsubscribe=null,this.listeners.clear(),this.listeners=l)},e}();function u(){return(u=Object.assign||function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e}).apply(this,arguments)}function c(e,t){if(null==e)return{};var n,r,i={},o=Object.keys(e);for(r=0;r<o.length;r++)n=o[r],t.indexOf(n)>=0||(i[n]=e[n]);return i}var d=n(679),f=n.n(d),p=n(864),h="undefined"!=typeof window&&void 0!==window.document&&void 0!==window.document.createElement?t.useLayoutEffect:t.useEffect,v=[],m=[null,null];function g(e,t){var n=e[1];return[t.payload,n+1]}function y(e,t,n){h((function(){return e.apply(void 0,t)}),n)}function b(e,t,n,r,i,o,a){e.current=r,t.current=i,n.current=!1,o.current&&(o.current=null,a())}function w(e,t,n,r,i,o,a,l,s,u){if(e){var c=!1,d=null,f=function(){if(!c){var e,n,f=t.getState();try{e=r(f,i.current)}catch(e){n=e,d=e}n||(d=null),e===o.current?a.current||s():(o.current=e,l.current=e,a.current=!0,u({type:"STORE_UPDATED",payload:{error:n}}))}};return n.onStateChange=f,n.trySubscribe(),f(),function(){if(c=!0,n.tryUnsubscribe(),n.onStateChange=null,d)throw d}}}var S=function(){return[null,0]};function k(e,n){void 0===n&&(n={});var r=n,o=r.getDisplayName,a=void 0===o?function(e){return"ConnectAdvanced("+e+")"}:o,l=r.methodName,d=void 0===l?"connectAdvanced":l,h=r.renderCountProp,k=void 0===h?void 0:h,x=r.shouldHandleStateChanges,E=void 0===x||x,C=r.storeKey,O=void 0===C?"store":C,P=(r.withRef,r.forwardRef),j=void 0!==P&&P,T=r.context,_=void 0===T?i:T,N=c(r,["getDisplayName","methodName","renderCountProp","shouldHandleStateChanges","storeKey","withRef","forwardRef","context"]),R=_;return function(n){var r=n.displayName||n.name||"Component",i=a(r),o=u({},N,{getDisplayName:a,methodName:d,renderCountProp:k,shouldHandleStateChanges:E,storeKey:O,displayName:i,wrappedComponentName:r,WrappedComponent:n}),l=N.pure,h=l?t.useMemo:function(e){return e()};function x(r){var i=(0,t.useMemo)((function(){var e=r.reactReduxForwardedRef,t=c(r,["reactReduxForwardedRef"]);return[r.context,e,t]}),[r]),a=i[0],l=i[1],d=i[2],f=(0,t.useMemo)((function(){return a&&a.Consumer&&(0,p.isContextConsumer)(t.createElement(a.Consumer,null))?a:R}),[a,R]),k=(0,t.useContext)(f),x=Boolean(r.store)&&Boolean(r.store.getState)&&Boolean(r.store.dispatch);Boolean(k)&&Boolean(k.store);var C=x?r.store:k.store,O=(0,t.useMemo)((function(){return function(t){return e(t.dispatch,o)}(C)}),[C]),P=(0,t.useMemo)((function(){if(!E)return m;var e=new s(C,x?null:k.subscription),t=e.notifyNestedSubs.bind(e);return[e,t]}),[C,x,k]),j=P[0],T=P[1],_=(0,t.useMemo)((function(){return x?k:u({},k,{subscription:j})}),[x,k,j]),N=(0,t.useReducer)(g,v,S),M=N[0][0],D=N[1];if(M&&M.error)throw M.error;var L=(0,t.useRef)(),I=(0,t.useRef)(d),A=(0,t.useRef)(),F=(0,t.useRef)(!1),z=h((function(){return A.current&&d===I.current?A.current:O(C.getState(),d)}),[C,M,d]);y(b,[I,L,F,d,z,A,T]),y(w,[E,C,j,O,I,L,F,A,T,D],[C,j,O]);var U=(0,t.useMemo)((function(){return t.createElement(n,u({},z,{ref:l}))}),[l,n,z]);return(0,t.useMemo)((function(){return E?t.createElement(f.Provider,{value:_},U):U}),[f,U,_])}var C=l?t.memo(x):x;if(C.WrappedComponent=n,C.displayName=i,j){var P=t.forwardRef((function(e,n){return t.createElement(C,u({},e,{reactReduxForwardedRef:n}))}));return P.displayName=i,P.WrappedComponent=n,f()(P,n)}return f()(C,n)}}function x(e,t){return e===t?0!==e||0!==t||1/e==1/t:e!=e&&t!=t}function E(e,t){if(x(e,t))return!0;if("object"!=typeof e||null===e||"object"!=typeof t||null===t)return!1;var n=Object.keys(e),r=Object.keys(t);if(n.length!==r.length)return!1;for(var i=0;i<n.length;i++)if(!Object.prototype.hasOwnProperty.call(t,n[i])||!x(e[n[i]],t[n[i]]))return!1;return!0}var C=n(121),O=function(){return Math.random().toString(36).substring(7).split("").join(".")},P={INIT:"@@redux/INIT"+O(),REPLACE:"@@redux/REPLACE"+O(),PROBE_UNKNOWN_ACTION:function(){return"@@redux/PROBE_UNKNOWN_ACTION"+O()}};function j(e){if("object"!=typeof e||null===e)return!1;for(var t=e;null!==Object.getPrototypeOf(t);)t=Object.getPrototypeOf(t);return Object.getPrototypeOf(e)===t}function T(e,t,n){var r;if("function"==typeof t&&"function"==typeof n||"function"==typeof n&&"function"==typeof arguments[3])throw new Error("It looks like you are passing several store enhancers to createStore(). This is not supported. Instead, compose them together to a single function.");if("function"==typeof t&&void 0===n&&(n=t,t=void 0),void 0!==n){if("function"!=typeof n)throw new Error("Expected the enhancer to be a function.");return n(T)(e,t)}if("function"!=typeof e)throw new Error("Expected the reducer to be a function.");var i=e,o=t,a=[],l=a,s=!1;function u(){l===a&&(l=a.slice())}function c(){if(s)throw new Error("You may not call store.getState() while the reducer is executing. The reducer has already received the state as an argument. Pass it down from the top reducer instead of reading it from the store.");return o}function d(e){if("function"!=typeof e)throw new Error("Expected the listener to be a function.");if(s)throw new Error("You may not call store.subscribe() while the reducer is executing. If you would like to be notified after the store has been updated, subscribe from a component and invoke store.getState() in the callback to access the latest state. See https://redux.js.org/api-reference/store#subscribelistener for more details.");var t=!0;return u(),l.push(e),function(){if(t){if(s)throw new Error("You may not unsubscribe from a store listener while the reducer is executing. See https://redux.js.org/api-reference/store#subscribelistener for more details.");t=!1,u();var n=l.indexOf(e);l.splice(n,1),a=null}}}function f(e){if(!j(e))throw new Error("Actions must be plain objects. Use custom middleware for async actions.");if(void 0===e.type)throw new Error('Actions may not have an undefined "type" property. Have you misspelled a constant?');if(s)throw new Error("Reducers may not dispatch actions.");try{s=!0,o=i(o,e)}finally{s=!1}for(var t=a=l,n=0;n<t.length;n++)(0,t[n])();return e}function p(e){if("function"!=typeof e)throw new Error("Expected the nextReducer to be a function.");i=e,f({type:P.REPLACE})}function h(){var e,t=d;return(e={subscribe:function(e){if("object"!=typeof e||null===e)throw new TypeError("Expected the observer to be an object.");function n(){e.next&&e.next(c())}return n(),{unsubscribe:t(n)}}})[C.Z]=function(){return this},e}return f({type:P.INIT}),(r={dispatch:f,subscribe:d,getState:c,replaceReducer:p})[C.Z]=h,r}function _(e,t){var n=t&&t.type;return"Given "+(n&&'action "'+String(n)+'"'||"an action")+', reducer "'+e+'" returned undefined. To ignore an action, you must explicitly return the previous state. If you want this reducer to hold no value, you can return null instead of undefined.'}function N(e,t){return function(){return t(e.apply(this,arguments))}}function R(e,t,n){return t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function M(e,t){var n=Object.keys(e);return Object.getOwnPropertySymbols&&n.push.apply(n,Object.getOwnPropertySymbols(e)),t&&(n=n.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n}function D(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?M(n,!0).forEach((function(t){R(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):M(n).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}function L(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];return 0===t.length?function(e){return e}:1===t.length?t[0]:t.reduce((function(e,t){return function(){return e(t.apply(void 0,arguments))}}))}function I(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];return function(e){return function(){var n=e.apply(void 0,arguments),r=function(){throw new Error("Dispatching while constructing your middleware is not allowed. Other middleware would not be applied to this dispatch.")},i={getState:n.getState,dispatch:function(){return r.apply(void 0,arguments)}},o=t.map((function(e){return e(i)}));return D({},n,{dispatch:r=L.apply(void 0,o)(n.dispatch)})}}}function A(e){return function(t,n){var r=e(t,n);function i(){return r}return i.dependsOnOwnProps=!1,i}}function F(e){return null!==e.dependsOnOwnProps&&void 0!==e.dependsOnOwnProps?Boolean(e.dependsOnOwnProps):1!==e.length}function z(e,t){return function(t,n){n.displayName;var r=function(e,t){return r.dependsOnOwnProps?r.mapToProps(e,t):r.mapToProps(e)};return r.dependsOnOwnProps=!0,r.mapToProps=function(t,n){r.mapToProps=e,r.dependsOnOwnProps=F(e);var i=r(t,n);return"function"==typeof i&&(r.mapToProps=i,r.dependsOnOwnProps=F(i),i=r(t,n)),i},r}}const U=[function(e){return"function"==typeof e?z(e):void 0},function(e){return e?void 0:A((function(e){return{dispatch:e}}))},function(e){return e&&"object"==typeof e?A((function(t){return function(e,t){if("function"==typeof e)return N(e,t);if("object"!=typeof e||null===e)throw new Error("bindActionCreators expected an object or a function, instead received "+(null===e?"null":typeof e)+'. Did you write "import ActionCreators from" instead of "import * as ActionCreators from"?');var n={};for(var r in e){var i=e[r];"function"==typeof i&&(n[r]=N(i,t))}return n}(e,t)})):void 0}],$=[function(e){return"function"==typeof e?z(e):void 0},function(e){return e?void 0:A((function(){return{}}))}];function V(e,t,n){return u({},n,e,t)}const B=[function(e){return"function"==typeof e?function(e){return function(t,n){n.displayName;var r,i=n.pure,o=n.areMergedPropsEqual,a=!1;return function(t,n,l){var s=e(t,n,l);return a?i&&o(s,r)||(r=s):(a=!0,r=s),r}}}(e):void 0},function(e){return e?void 0:function(){return V}}];function W(e,t,n,r){return function(i,o){return n(e(i,o),t(r,o),o)}}function q(e,t,n,r,i){var o,a,l,s,u,c=i.areStatesEqual,d=i.areOwnPropsEqual,f=i.areStatePropsEqual,p=!1;return function(i,h){return p?function(i,p){var h,v,m=!d(p,a),g=!c(i,o);return o=i,a=p,m&&g?(l=e(o,a),t.dependsOnOwnProps&&(s=t(r,a)),u=n(l,s,a)):m?(e.dependsOnOwnProps&&(l=e(o,a)),t.dependsOnOwnProps&&(s=t(r,a)),u=n(l,s,a)):g?(h=e(o,a),v=!f(h,l),l=h,v&&(u=n(l,s,a)),u):u}(i,h):(l=e(o=i,a=h),s=t(r,a),u=n(l,s,a),p=!0,u)}}function H(e,t){var n=t.initMapStateToProps,r=t.initMapDispatchToProps,i=t.initMergeProps,o=c(t,["initMapStateToProps","initMapDispatchToProps","initMergeProps"]),a=n(e,o),l=r(e,o),s=i(e,o);return(o.pure?q:W)(a,l,s,e,o)}function Q(e,t,n){for(var r=t.length-1;r>=0;r--){var i=t[r](e);if(i)return i}return function(t,r){throw new Error("Invalid value of type "+typeof e+" for "+n+" argument when connecting component "+r.wrappedComponentName+".")}}function K(e,t){return e===t}function G(e){var t=void 0===e?{}:e,n=t.connectHOC,r=void 0===n?k:n,i=t.mapStateToPropsFactories,o=void 0===i?$:i,a=t.mapDispatchToPropsFactories,l=void 0===a?U:a,s=t.mergePropsFactories,d=void 0===s?B:s,f=t.selectorFactory,p=void 0===f?H:f;return function(e,t,n,i){void 0===i&&(i={});var a=i,s=a.pure,f=void 0===s||s,h=a.areStatesEqual,v=void 0===h?K:h,m=a.areOwnPropsEqual,g=void 0===m?E:m,y=a.areStatePropsEqual,b=void 0===y?E:y,w=a.areMergedPropsEqual,S=void 0===w?E:w,k=c(a,["pure","areStatesEqual","areOwnPropsEqual","areStatePropsEqual","areMergedPropsEqual"]),x=Q(e,o,"mapStateToProps"),C=Q(t,l,"mapDispatchToProps"),O=Q(n,d,"mergeProps");return r(p,u({methodName:"connect",getDisplayName:function(e){return"Connect("+e+")"},shouldHandleStateChanges:Boolean(e),initMapStateToProps:x,initMapDispatchToProps:C,initMergeProps:O,pure:f,areStatesEqual:v,areOwnPropsEqual:g,areStatePropsEqual:b,areMergedPropsEqual:S},k))}}const Y=G();var X;function J(e){for(var t=arguments.length,n=Array(t>1?t-1:0),r=1;r<t;r++)n[r-1]=arguments[r];throw Error("[Immer] minified error nr: "+e+(n.length?" "+n.map((function(e){return"'"+e+"'"})).join(","):"")+". Find the full error at: https://bit.ly/3cXEKWf")}function Z(e){return!!e&&!!e[ze]}function ee(e){return!!e&&(function(e){if(!e||"object"!=typeof e)return!1;var t=Object.getPrototypeOf(e);return!t||t===Object.prototype}(e)||Array.isArray(e)||!!e[Fe]||!!e.constructor[Fe]||ae(e)||le(e))}function te(e,t,n){void 0===n&&(n=!1),0===ne(e)?(n?Object.keys:Ue)(e).forEach((function(r){n&&"symbol"==typeof r||t(r,e[r],e)})):e.forEach((function(n,r){return t(r,n,e)}))}function ne(e){var t=e[ze];return t?t.i>3?t.i-4:t.i:Array.isArray(e)?1:ae(e)?2:le(e)?3:0}function re(e,t){return 2===ne(e)?e.has(t):Object.prototype.hasOwnProperty.call(e,t)}function ie(e,t,n){var r=ne(e);2===r?e.set(t,n):3===r?(e.delete(t),e.add(n)):e[t]=n}function oe(e,t){return e===t?0!==e||1/e==1/t:e!=e&&t!=t}function ae(e){return De&&e instanceof Map}function le(e){return Le&&e instanceof Set}function se(e){return e.o||e.t}function ue(e){if(Array.isArray(e))return Array.prototype.slice.call(e);var t=$e(e);delete t[ze];for(var n=Ue(t),r=0;r<n.length;r++){var i=n[r],o=t[i];!1===o.writable&&(o.writable=!0,o.configurable=!0),(o.get||o.set)&&(t[i]={configurable:!0,writable:!0,enumerable:o.enumerable,value:e[i]})}return Object.create(Object.getPrototypeOf(e),t)}function ce(e,t){return void 0===t&&(t=!1),fe(e)||Z(e)||!ee(e)||(ne(e)>1&&(e.set=e.add=e.clear=e.delete=de),Object.freeze(e),t&&te(e,(function(e,t){return ce(t,!0)}),!0)),e}function de(){J(2)}function fe(e){return null==e||"object"!=typeof e||Object.isFrozen(e)}function pe(e){var t=Ve[e];return t||J(18,e),t}function he(){return Re}function ve(e,t){t&&(pe("Patches"),e.u=[],e.s=[],e.v=t)}function me(e){ge(e),e.p.forEach(be),e.p=null}function ge(e){e===Re&&(Re=e.l)}function ye(e){return Re={p:[],l:Re,h:e,m:!0,_:0}}function be(e){var t=e[ze];0===t.i||1===t.i?t.j():t.g=!0}function we(e,t){t._=t.p.length;var n=t.p[0],r=void 0!==e&&e!==n;return t.h.O||pe("ES5").S(t,e,r),r?(n[ze].P&&(me(t),J(4)),ee(e)&&(e=Se(t,e),t.l||xe(t,e)),t.u&&pe("Patches").M(n[ze],e,t.u,t.s)):e=Se(t,n,[]),me(t),t.u&&t.v(t.u,t.s),e!==Ae?e:void 0}function Se(e,t,n){if(fe(t))return t;var r=t[ze];if(!r)return te(t,(function(i,o){return ke(e,r,t,i,o,n)}),!0),t;if(r.A!==e)return t;if(!r.P)return xe(e,r.t,!0),r.t;if(!r.I){r.I=!0,r.A._--;var i=4===r.i||5===r.i?r.o=ue(r.k):r.o;te(3===r.i?new Set(i):i,(function(t,o){return ke(e,r,i,t,o,n)})),xe(e,i,!1),n&&e.u&&pe("Patches").R(r,n,e.u,e.s)}return r.o}function ke(e,t,n,r,i,o){if(Z(i)){var a=Se(e,i,o&&t&&3!==t.i&&!re(t.D,r)?o.concat(r):void 0);if(ie(n,r,a),!Z(a))return;e.m=!1}if(ee(i)&&!fe(i)){if(!e.h.N&&e._<1)return;Se(e,i),t&&t.A.l||xe(e,i)}}function xe(e,t,n){void 0===n&&(n=!1),e.h.N&&e.m&&ce(t,n)}function Ee(e,t){var n=e[ze];return(n?se(n):e)[t]}function Ce(e,t){if(t in e)for(var n=Object.getPrototypeOf(e);n;){var r=Object.getOwnPropertyDescriptor(n,t);if(r)return r;n=Object.getPrototypeOf(n)}}function Oe(e){e.P||(e.P=!0,e.l&&Oe(e.l))}function Pe(e){e.o||(e.o=ue(e.t))}function je(e,t,n){var r=ae(t)?pe("MapSet").T(t,n):le(t)?pe("MapSet").F(t,n):e.O?function(e,t){var n=Array.isArray(e),r={i:n?1:0,A:t?t.A:he(),P:!1,I:!1,D:{},l:t,t:e,k:null,o:null,j:null,C:!1},i=r,o=Be;n&&(i=[r],o=We);var a=Proxy.revocable(i,o),l=a.revoke,s=a.proxy;return r.k=s,r.j=l,s}(t,n):pe("ES5").J(t,n);return(n?n.A:he()).p.push(r),r}function Te(e){return Z(e)||J(22,e),function e(t){if(!ee(t))return t;var n,r=t[ze],i=ne(t);if(r){if(!r.P&&(r.i<4||!pe("ES5").K(r)))return r.t;r.I=!0,n=_e(t,i),r.I=!1}else n=_e(t,i);return te(n,(function(t,i){r&&function(e,t){return 2===ne(e)?e.get(t):e[t]}(r.t,t)===i||ie(n,t,e(i))})),3===i?new Set(n):n}(e)}function _e(e,t){switch(t){case 2:return new Map(e);case 3:return Array.from(e)}return ue(e)}X=r.unstable_batchedUpdates,o=X;var Ne,Re,Me="undefined"!=typeof Symbol&&"symbol"==typeof Symbol("x"),De="undefined"!=typeof Map,Le="undefined"!=typeof Set,Ie="undefined"!=typeof Proxy&&void 0!==Proxy.revocable&&"undefined"!=typeof Reflect,Ae=Me?Symbol.for("immer-nothing"):((Ne={})["immer-nothing"]=!0,Ne),Fe=Me?Symbol.for("immer-draftable"):"__$immer_draftable",ze=Me?Symbol.for("immer-state"):"__$immer_state",Ue=("undefined"!=typeof Symbol&&Symbol.iterator,"undefined"!=typeof Reflect&&Reflect.ownKeys?Reflect.ownKeys:void 0!==Object.getOwnPropertySymbols?function(e){return Object.getOwnPropertyNames(e).concat(Object.getOwnPropertySymbols(e))}:Object.getOwnPropertyNames),$e=Object.getOwnPropertyDescriptors||function(e){var t={};return Ue(e).forEach((function(n){t[n]=Object.getOwnPropertyDescriptor(e,n)})),t},Ve={},Be={get:function(e,t){if(t===ze)return e;var n=se(e);if(!re(n,t))return function(e,t,n){var r,i=Ce(t,n);return i?"value"in i?i.value:null===(r=i.get)||void 0===r?void 0:r.call(e.k):void 0}(e,n,t);var r=n[t];return e.I||!ee(r)?r:r===Ee(e.t,t)?(Pe(e),e.o[t]=je(e.A.h,r,e)):r},has:function(e,t){return t in se(e)},ownKeys:function(e){return Reflect.ownKeys(se(e))},set:function(e,t,n){var r=Ce(se(e),t);if(null==r?void 0:r.set)return r.set.call(e.k,n),!0;if(!e.P){var i=Ee(se(e),t),o=null==i?void 0:i[ze];if(o&&o.t===n)return e.o[t]=n,e.D[t]=!1,!0;if(oe(n,i)&&(void 0!==n||re(e.t,t)))return!0;Pe(e),Oe(e)}return e.o[t]=n,e.D[t]=!0,!0},deleteProperty:function(e,t){return void 0!==Ee(e.t,t)||t in e.t?(e.D[t]=!1,Pe(e),Oe(e)):delete e.D[t],e.o&&delete e.o[t],!0},getOwnPropertyDescriptor:function(e,t){var n=se(e),r=Reflect.getOwnPropertyDescriptor(n,t);return r?{writable:!0,configurable:1!==e.i||"length"!==t,enumerable:r.enumerable,value:n[t]}:r},defineProperty:function(){J(11)},getPrototypeOf:function(e){return Object.getPrototypeOf(e.t)},setPrototypeOf:function(){J(12)}},We={};te(Be,(function(e,t){We[e]=function(){return arguments[0]=arguments[0][0],t.apply(this,arguments)}})),We.deleteProperty=function(e,t){return Be.deleteProperty.call(this,e[0],t)},We.set=function(e,t,n){return Be.set.call(this,e[0],t,n,e[0])};var qe=new(function(){function e(e){this.O=Ie,this.N=!0,"boolean"==typeof(null==e?void 0:e.useProxies)&&this.setUseProxies(e.useProxies),"boolean"==typeof(null==e?void 0:e.autoFreeze)&&this.setAutoFreeze(e.autoFreeze),this.produce=this.produce.bind(this),this.produceWithPatches=this.produceWithPatches.bind(this)}var t=e.prototype;return t.produce=function(e,t,n){if("function"==typeof e&&"function"!=typeof t){var r=t;t=e;var i=this;return function(e){var n=this;void 0===e&&(e=r);for(var o=arguments.length,a=Array(o>1?o-1:0),l=1;l<o;l++)a[l-1]=arguments[l];return i.produce(e,(function(e){var r;return(r=t).call.apply(r,[n,e].concat(a))}))}}var o;if("function"!=typeof t&&J(6),void 0!==n&&"function"!=typeof n&&J(7),ee(e)){var a=ye(this),l=je(this,e,void 0),s=!0;try{o=t(l),s=!1}finally{s?me(a):ge(a)}return"undefined"!=typeof Promise&&o instanceof Promise?o.then((function(e){return ve(a,n),we(e,a)}),(function(e){throw me(a),e})):(ve(a,n),we(o,a))}if(!e||"object"!=typeof e){if((o=t(e))===Ae)return;return void 0===o&&(o=e),this.N&&ce(o,!0),o}J(21,e)},t.produceWithPatches=function(e,t){var n,r,i=this;return"function"==typeof e?function(t){for(var n=arguments.length,r=Array(n>1?n-1:0),o=1;o<n;o++)r[o-1]=arguments[o];return i.produceWithPatches(t,(function(t){return e.apply(void 0,[t].concat(r))}))}:[this.produce(e,t,(function(e,t){n=e,r=t})),n,r]},t.createDraft=function(e){ee(e)||J(8),Z(e)&&(e=Te(e));var t=ye(this),n=je(this,e,void 0);return n[ze].C=!0,ge(t),n},t.finishDraft=function(e,t){var n=(e&&e[ze]).A;return ve(n,t),we(void 0,n)},t.setAutoFreeze=function(e){this.N=e},t.setUseProxies=function(e){e&&!Ie&&J(20),this.O=e},t.applyPatches=function(e,t){var n;for(n=t.length-1;n>=0;n--){var r=t[n];if(0===r.path.length&&"replace"===r.op){e=r.value;break}}var i=pe("Patches").$;return Z(e)?i(e,t):this.produce(e,(function(e){return i(e,t.slice(n+1))}))},e}()),He=qe.produce;qe.produceWithPatches.bind(qe),qe.setAutoFreeze.bind(qe),qe.setUseProxies.bind(qe),qe.applyPatches.bind(qe),qe.createDraft.bind(qe),qe.finishDraft.bind(qe);const Qe=He;function Ke(e,t){return e===t}function Ge(e,t,n){if(null===t||null===n||t.length!==n.length)return!1;for(var r=t.length,i=0;i<r;i++)if(!e(t[i],n[i]))return!1;return!0}function Ye(e){return function(t){var n=t.dispatch,r=t.getState;return function(t){return function(i){return"function"==typeof i?i(n,r,e):t(i)}}}}!function(e){for(var t=arguments.length,n=Array(t>1?t-1:0),r=1;r<t;r++)n[r-1]=arguments[r]}((function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:Ke,n=null,r=null;return function(){return Ge(t,n,arguments)||(r=e.apply(null,arguments)),n=arguments,r}}));var Xe=Ye();Xe.withExtraArgument=Ye;const Je=Xe;function Ze(){return(Ze=Object.assign||function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e}).apply(this,arguments)}function et(e){return(et=Object.setPrototypeOf?Object.getPrototypeOf:function(e){return e.__proto__||Object.getPrototypeOf(e)})(e)}function tt(e,t){return(tt=Object.setPrototypeOf||function(e,t){return e.__proto__=t,e})(e,t)}function nt(){if("undefined"==typeof Reflect||!Reflect.construct)return!1;if(Reflect.construct.sham)return!1;if("function"==typeof Proxy)return!0;try{return Date.prototype.toString.call(Reflect.construct(Date,[],(function(){}))),!0}catch(e){return!1}}function rt(e,t,n){return(rt=nt()?Reflect.construct:function(e,t,n){var r=[null];r.push.apply(r,t);var i=new(Function.bind.apply(e,r));return n&&tt(i,n.prototype),i}).apply(null,arguments)}function it(e){var t="function"==typeof Map?new Map:void 0;return(it=function(e){if(null===e||(n=e,-1===Function.toString.call(n).indexOf("[native code]")))return e;var n;if("function"!=typeof e)throw new TypeError("Super expression must either be null or a function");if(void 0!==t){if(t.has(e))return t.get(e);t.set(e,r)}function r(){return rt(e,arguments,et(this).constructor)}return r.prototype=Object.create(e.prototype,{constructor:{value:r,enumerable:!1,writable:!0,configurable:!0}}),tt(r,e)})(e)}var ot="undefined"!=typeof window&&window.__REDUX_DEVTOOLS_EXTENSION_COMPOSE__?window.__REDUX_DEVTOOLS_EXTENSION_COMPOSE__:function(){if(0!==arguments.length)return"object"==typeof arguments[0]?L:L.apply(null,arguments)};var at=function(e){var t,n;function r(){return e.apply(this,arguments)||this}n=e,(t=r).prototype=Object.create(n.prototype),t.prototype.constructor=t,t.__proto__=n;var i=r.prototype;return i.concat=function(){for(var t,n=arguments.length,i=new Array(n),o=0;o<n;o++)i[o]=arguments[o];return rt(r,(t=e.prototype.concat).call.apply(t,[this].concat(i)))},i.prepend=function(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];return 1===t.length&&Array.isArray(t[0])?rt(r,t[0].concat(this)):rt(r,t.concat(this))},r}(it(Array));function lt(e,t){function n(){if(t){var n=t.apply(void 0,arguments);if(!n)throw new Error("prepareAction did not return an object");return Ze({type:e,payload:n.payload},"meta"in n&&{meta:n.meta},{},"error"in n&&{error:n.error})}return{type:e,payload:arguments.length<=0?void 0:arguments[0]}}return n.toString=function(){return""+e},n.type=e,n.match=function(t){return t.type===e},n}function st(e){var t,n={},r=[],i={addCase:function(e,t){var r="string"==typeof e?e:e.type;if(r in n)throw new Error("addCase cannot be called with two reducers for the same action type");return n[r]=t,i},addMatcher:function(e,t){return r.push({matcher:e,reducer:t}),i},addDefaultCase:function(e){return t=e,i}};return e(i),[n,r,t]}function ut(e){var t=e.name,n=e.initialState;if(!t)throw new Error("`name` is a required option for createSlice");var r=e.reducers||{},i=void 0===e.extraReducers?[]:"function"==typeof e.extraReducers?st(e.extraReducers):[e.extraReducers],o=i[0],a=void 0===o?{}:o,l=i[1],s=void 0===l?[]:l,u=i[2],c=void 0===u?void 0:u,d=Object.keys(r),f={},p={},h={};d.forEach((function(e){var n,i,o=r[e],a=t+"/"+e;"reducer"in o?(n=o.reducer,i=o.prepare):n=o,f[e]=n,p[a]=n,h[e]=i?lt(a,i):lt(a)}));var v=function(e,t,n,r){void 0===n&&(n=[]);var i="function"==typeof t?st(t):[t,n,r],o=i[0],a=i[1],l=i[2];return function(t,n){void 0===t&&(t=e);var r=[o[n.type]].concat(a.filter((function(e){return(0,e.matcher)(n)})).map((function(e){return e.reducer})));return 0===r.filter((function(e){return!!e})).length&&(r=[l]),r.reduce((function(e,t){if(t){if(Z(e)){var r=t(e,n);return void 0===r?e:r}if(ee(e))return Qe(e,(function(e){return t(e,n)}));var i=t(e,n);if(void 0===i){if(null===e)return e;throw Error("A case reducer on a non-draftable value must not return undefined")}return i}return e}),t)}}(n,Ze({},a,{},p),s,c);return{name:t,reducer:v,actions:h,caseReducers:f}}"undefined"!=typeof Symbol&&(Symbol.iterator||(Symbol.iterator=Symbol("Symbol.iterator"))),"undefined"!=typeof Symbol&&(Symbol.asyncIterator||(Symbol.asyncIterator=Symbol("Symbol.asyncIterator"))),function(){function e(e,t){var n=i[e];return n?n.enumerable=t:i[e]=n={configurable:!0,enumerable:t,get:function(){var t=this[ze];return Be.get(t,e)},set:function(t){var n=this[ze];Be.set(n,e,t)}},n}function t(e){for(var t=e.length-1;t>=0;t--){var i=e[t][ze];if(!i.P)switch(i.i){case 5:r(i)&&Oe(i);break;case 4:n(i)&&Oe(i)}}}function n(e){for(var t=e.t,n=e.k,r=Ue(n),i=r.length-1;i>=0;i--){var o=r[i];if(o!==ze){var a=t[o];if(void 0===a&&!re(t,o))return!0;var l=n[o],s=l&&l[ze];if(s?s.t!==a:!oe(l,a))return!0}}var u=!!t[ze];return r.length!==Ue(t).length+(u?0:1)}function r(e){var t=e.k;if(t.length!==e.t.length)return!0;var n=Object.getOwnPropertyDescriptor(t,t.length-1);return!(!n||n.get)}var i={};!function(e,t){Ve[e]||(Ve[e]=t)}("ES5",{J:function(t,n){var r=Array.isArray(t),i=function(t,n){if(t){for(var r=Array(n.length),i=0;i<n.length;i++)Object.defineProperty(r,""+i,e(i,!0));return r}var o=$e(n);delete o[ze];for(var a=Ue(o),l=0;l<a.length;l++){var s=a[l];o[s]=e(s,t||!!o[s].enumerable)}return Object.create(Object.getPrototypeOf(n),o)}(r,t),o={i:r?5:4,A:n?n.A:he(),P:!1,I:!1,D:{},l:n,t,k:i,o:null,g:!1,C:!1};return Object.defineProperty(i,ze,{value:o,writable:!0}),i},S:function(e,n,i){i?Z(n)&&n[ze].A===e&&t(e.p):(e.u&&function e(t){if(t&&"object"==typeof t){var n=t[ze];if(n){var i=n.t,o=n.k,a=n.D,l=n.i;if(4===l)te(o,(function(t){t!==ze&&(void 0!==i[t]||re(i,t)?a[t]||e(o[t]):(a[t]=!0,Oe(n)))})),te(i,(function(e){void 0!==o[e]||re(o,e)||(a[e]=!1,Oe(n))}));else if(5===l){if(r(n)&&(Oe(n),a.length=!0),o.length<i.length)for(var s=o.length;s<i.length;s++)a[s]=!1;else for(var u=i.length;u<o.length;u++)a[u]=!0;for(var c=Math.min(o.length,i.length),d=0;d<c;d++)void 0===a[d]&&e(o[d])}}}}(e.p[0]),t(e.p))},K:function(e){return 4===e.i?n(e):r(e)}})}();const ct=ut({name:"users",initialState:[{id:"local",username:"Me"}],reducers:{addUser(e,{payload:t}){e.push(t)},updateUser(e,{payload:t}){const{id:n}=t,r=e.find((e=>e.id===n));Object.assign(r,t)},setUsername(e,{payload:t}){const n=t;e.find((e=>"local"===e.id)).username=n}}}),{actions:dt,reducer:ft}=ct,{addUser:pt,updateUser:ht,setUsername:vt}=dt,mt=ft,gt=ut({name:"messages",initialState:[],reducers:{addChatMessage(e,{payload:t}){e.push(t)},sendChatMessage(e,{payload:t}){}}}),{actions:yt,reducer:bt}=gt,{addChatMessage:wt,sendChatMessage:St}=yt,kt=bt,xt=ut({name:"connections",initialState:[],reducers:{addConnection(e,{payload:t}){e.push(t)},removeConnection(e,{payload:t}){const n=t;return e.filter((e=>e.id!==n))},updateConnection(e,{payload:t}){const{id:n}=t,r=e.find((e=>e.id===n));Object.assign(r,t)}}}),{actions:Et,reducer:Ct}=xt,{addConnection:Ot,removeConnection:Pt,updateConnection:jt}=Et,Tt=Ct,_t=ut({name:"feeds",initialState:[{id:"local",audioStream:null,videoStream:null,audioMuted:!0,videoEnabled:!0}],reducers:{addFeed(e,{payload:t}){e.push(t)},removeFeed(e,{payload:t}){const n=t;return e.filter((e=>e.id!==n))},updateFeed(e,{payload:t}){const{id:n}=t,r=e.find((e=>e.id===n));Object.assign(r,t)},swapFeeds(e,{payload:t}){const{id1:n,id2:r}=t,i=e.findIndex((e=>e.id===n)),o=e.findIndex((e=>e.id===r));[e[i],e[o]]=[e[o],e[i]]},setLocalAudio(e,{payload:t}){const n=t?new MediaStream([t]):null,r=e.find((e=>"local"===e.id));r&&(r.audioStream&&r.audioStream.getTracks().forEach((e=>e.stop())),r.audioStream=n)},setLocalVideo(e,{payload:t}){const n=t?new MediaStream([t]):null,r=e.find((e=>"local"===e.id));r&&(r.videoStream&&r.videoStream.getTracks().forEach((e=>e.stop())),r.videoStream=n)},disableRemoteVideo(e,{payload:t}){const n=t,r=e.find((e=>e.id===n));r&&(r.videoEnabled=!1)},enableRemoteVideo(e,{payload:t}){const n=t,r=e.find((e=>e.id===n));r&&(r.videoEnabled=!0)}}}),{actions:Nt,reducer:Rt}=_t,{addFeed:Mt,removeFeed:Dt,updateFeed:Lt,swapFeeds:It,setLocalAudio:At,setLocalVideo:Ft,disableRemoteVideo:zt,enableRemoteVideo:Ut}=Nt,$t=Rt;let Vt=0;const Bt=ut({name:"iceServers",initialState:[],reducers:{addIceServer(e,{payload:t}){const n=Object.assign({id:Vt++,enabled:!0},t);e.push(n)},removeIceServer(e,{payload:t}){const n=t;return e.filter((e=>e.id!==n))},updateIceServer(e,{payload:t}){const{id:n}=t,r=e.find((e=>e.id===n));Object.assign(r,t)}}}),{actions:Wt,reducer:qt}=Bt,{addIceServer:Ht,removeIceServer:Qt,updateIceServer:Kt}=Wt,Gt=qt;class Yt extends t.Component{constructor(e){super(e),this.state={value:""},this.handleChange=this.handleChange.bind(this),this.handleSubmit=this.handleSubmit.bind(this)}handleChange(e){const t=e.target.value;this.setState({value:t})}handleSubmit(e){e.preventDefault();const t=this.state.value.trim();t&&(this.props.sendChatMessage(t),this.setState({value:""}))}render(){return(0,e.jsxs)("div",Object.assign({className:"chat-message-bar"},{children:[(0,e.jsx)(Jt,{messages:this.props.messages},void 0),(0,e.jsxs)("form",{children:[(0,e.jsx)("input",{type:"text",placeholder:"Send a group chat message",value:this.state.value,onChange:this.handleChange},void 0),(0,e.jsx)("button",Object.assign({onClick:this.handleSubmit,"aria-label":"Send chat message"},{children:(0,e.jsx)("i",Object.assign({className:"material-icons"},{children:"send"}),void 0)}),void 0)]},void 0)]}),void 0)}}const Xt=Y((e=>({users:e.users,messages:e.messages})),{sendChatMessage:St})(Yt);class Jt extends t.Component{render(){return(0,e.jsx)("ul",Object.assign({className:"chat-message-log"},{children:this.props.messages.map((t=>(0,e.jsx)("li",{children:(0,e.jsx)(Zt,{from:t.from,timestamp:t.timestamp,text:t.text},void 0)},t.timestamp)))}),void 0)}}class Zt extends t.Component{render(){return(0,e.jsxs)("div",Object.assign({className:"chat-message"},{children:[(0,e.jsx)("p",Object.assign({className:"chat-message-from"},{children:this.props.from}),void 0),(0,e.jsx)("p",Object.assign({className:"chat-message-time"},{children:new Date(this.props.timestamp).toLocaleTimeString("en-US")}),void 0),(0,e.jsx)("p",Object.assign({className:"chat-message-text"},{children:this.props.text}),void 0)]}),void 0)}}class en extends t.Component{render(){const t=this.props.users,n=this.props.connections.map((e=>{const n=t.find((t=>t.id===e.id)),r=n?n.username:"Major Tom";return Object.assign({},e,{username:r})}));return 0===n.length?(0,e.jsx)("p",Object.assign({className:"connection-info-node"},{children:(0,e.jsx)("i",{children:"There are currently no other users in the room."},void 0)}),void 0):(0,e.jsx)("ul",Object.assign({className:"connection-info-bar"},{children:n.map((t=>(0,e.jsx)(nn,{connection:t},t.id)))}),void 0)}}const tn=Y((e=>({users:e.users,connections:e.connections})))(en);class nn extends t.Component{render(){const t=this.props.connection;return(0,e.jsx)("li",Object.assign({className:"connection-info-node"},{children:(0,e.jsxs)("details",{children:[(0,e.jsx)("summary",{children:t.username},void 0),(0,e.jsxs)("ul",{children:[(0,e.jsxs)("li",{children:["Username: ",(0,e.jsx)("span",{children:t.username},void 0)]},"username"),(0,e.jsxs)("li",{children:["Client ID: ",(0,e.jsx)("span",{children:t.id},void 0)]},"id"),(0,e.jsxs)("li",{children:["Connection state:"," ",(0,e.jsx)("span",{children:t.connectionState},void 0)]},"connection-state"),(0,e.jsxs)("li",{children:["Ice connection state:"," ",(0,e.jsx)("span",{children:t.iceConnectionState},void 0)]},"ice-connection-state"),(0,e.jsxs)("li",{children:["Ice gathering state:"," ",(0,e.jsx)("span",{children:t.iceGatheringState},void 0)]},"ice-gathering-state"),(0,e.jsxs)("li",{children:["Signaling state:"," ",(0,e.jsx)("span",{children:t.signalingState},void 0)]},"signaling-state")]},void 0)]},void 0)}),void 0)}}class rn extends t.Component{constructor(e){super(e),this.newServer=this.newServer.bind(this)}render(){return(0,e.jsxs)("div",Object.assign({className:"ice-servers-bar"},{children:[this.renderServers("stun"),this.renderServers("turn")]}),void 0)}renderServers(t){const{iceServers:n,updateIceServer:r,removeIceServer:i,allowEditing:o}=this.props,a=t[0].toUpperCase()+t.slice(1)+" Servers",l=n.filter((e=>e.kind===t));return(0,e.jsxs)("section",Object.assign({className:"ice-servers","aria-label":`${t} servers`},{children:[(0,e.jsx)("h6",{children:a},void 0),(0,e.jsx)("ul",{children:l.filter((e=>e.urls&&e.urls.length)).map((t=>(0,e.jsx)(an,{server:t,onSave:r,onDelete:i,allowEditing:o},t.id)))},void 0),o&&(0,e.jsx)("button",Object.assign({onClick:()=>this.newServer(t),"aria-label":`Add a ${t} server`},{children:(0,e.jsx)("i",Object.assign({className:"material-icons"},{children:"add"}),void 0)}),void 0)]}),void 0)}newServer(e){const t={urls:[`${e}:`],enabled:!1,kind:e};this.props.addIceServer(t)}}const on=Y((e=>({iceServers:e.iceServers})),{addIceServer:Ht,updateIceServer:Kt,removeIceServer:Qt})(rn);class an extends t.Component{constructor(e){super(e);const{urls:t,username:n,credential:r}=this.props.server;this.state={urls:t.join(","),username:n||"",credential:r||""},this.handleInputChange=this.handleInputChange.bind(this),this.handleSubmit=this.handleSubmit.bind(this),this.handleDelete=this.handleDelete.bind(this)}render(){const{server:t,allowEditing:n}=this.props,r=`${t.kind}:[\\w\\d_./:?=&%-]+`,i=`^${r}(,${r})*$`,o=t.urls[0].match(/(?:stun|turn):(?<host>[\w\d_.-]+)/),a=o&&o.groups?o.groups.host:"New server";return(0,e.jsx)("li",Object.assign({className:"ice-server"},{children:(0,e.jsxs)("details",{children:[(0,e.jsx)("summary",{children:a},void 0),(0,e.jsxs)("form",Object.assign({onSubmit:this.handleSubmit},{children:[(0,e.jsxs)("label",{children:["URLs",(0,e.jsx)("input",{name:"urls",type:"text",value:this.state.urls,onChange:this.handleInputChange,required:!0,pattern:i,readOnly:!n},void 0)]},void 0),(0,e.jsxs)("label",{children:["Username",(0,e.jsx)("input",{name:"username",type:"text",value:this.state.username,onChange:this.handleInputChange,required:"turn"===t.kind,readOnly:!n},void 0)]},void 0),(0,e.jsxs)("label",{children:["Password",(0,e.jsx)("input",{name:"credential",type:"password",value:this.state.credential,onChange:this.handleInputChange,required:"turn"===t.kind,readOnly:!n},void 0)]},void 0),n&&(0,e.jsxs)(e.Fragment,{children:[(0,e.jsx)("button",Object.assign({type:"button",onClick:this.handleDelete,"aria-label":`Delete this ${t.kind} server`},{children:(0,e.jsx)("i",Object.assign({className:"material-icons"},{children:"delete"}),void 0)}),void 0),(0,e.jsx)("button",Object.assign({type:"submit","aria-label":`Save this ${t.kind} server`},{children:(0,e.jsx)("i",Object.assign({className:"material-icons"},{children:"save"}),void 0)}),void 0)]},void 0)]}),void 0)]},void 0)}),void 0)}handleInputChange(e){const t=e.target.name,n=e.target.value;this.setState({[t]:n})}handleSubmit(e){e.preventDefault();const{urls:t,username:n,credential:r}=this.state,i={id:this.props.server.id,enabled:!0,urls:t.split(","),username:n||void 0,credential:r||void 0};this.props.onSave(i)}handleDelete(){this.props.onDelete(this.props.server.id)}}class ln extends t.Component{constructor(e){super(e),this.state={visible:!0,toggled:!1},this.toggleExpandButton=t.createRef(),this.handleToggle=this.handleToggle.bind(this),this.handleClose=this.handleClose.bind(this),this.handleCopyLink=this.handleCopyLink.bind(this)}render(){return this.state.visible?(0,e.jsxs)("div",Object.assign({className:"dialog slide-down invite-box",role:"dialog","aria-labelledby":"share-link-title"},{children:[(0,e.jsx)("h1",Object.assign({id:"share-link-title",className:"sr-only"},{children:"Share the link to invite others"}),void 0),(0,e.jsxs)("div",Object.assign({className:"input-line"},{children:[(0,e.jsx)("button",Object.assign({className:"icon-button",onClick:this.handleClose,"aria-label":"Close dialog"},{children:(0,e.jsx)("i",Object.assign({className:"material-icons"},{children:"close"}),void 0)}),void 0),(0,e.jsx)("input",{onClick:this.handleToggle,type:"button",value:"Share the link to invite others",readOnly:!0,ref:this.toggleExpandButton},void 0)]}),void 0),this.state.toggled&&(0,e.jsxs)("div",Object.assign({className:"input-line"},{children:[(0,e.jsx)("button",Object.assign({type:"button",onClick:this.handleCopyLink,"aria-label":"Copy the room link"},{children:(0,e.jsx)("i",Object.assign({className:"material-icons"},{children:"content_copy"}),void 0)}),void 0),(0,e.jsx)("input",{className:"invitation-link",name:"invitation-link",type:"text",value:window.location.href,readOnly:!0},void 0)]}),void 0)]}),void 0):null}handleToggle(){this.setState((e=>({toggled:!e.toggled})))}handleClose(){this.setState((e=>({visible:!e.visible})))}handleCopyLink(){const e=document.querySelector(".invitation-link");e.focus(),e.select(),document.execCommand("copy")}}const sn=ut({name:"devices",initialState:{audio:{active:!1,id:""},video:{active:!1,id:"",resolution:480,maxResolution:0},display:{active:!1}},reducers:{updateAudioDevice(e,{payload:t}){Object.assign(e.audio,t)},updateVideoDevice(e,{payload:t}){Object.assign(e.video,t)},updateDisplayDevice(e,{payload:t}){Object.assign(e.display,t)},setResolution(e,{payload:t}){e.video.resolution=t}}}),{actions:un,reducer:cn}=sn,{updateAudioDevice:dn,updateVideoDevice:fn,updateDisplayDevice:pn,setResolution:hn}=un,vn=cn;var mn=function(e,t,n,r){return new(n||(n=Promise))((function(i,o){function a(e){try{s(r.next(e))}catch(e){o(e)}}function l(e){try{s(r.throw(e))}catch(e){o(e)}}function s(e){var t;e.done?i(e.value):(t=e.value,t instanceof n?t:new n((function(e){e(t)}))).then(a,l)}s((r=r.apply(e,t||[])).next())}))};const gn=[2160,1080,720,480,360,240];function yn(){return mn(this,void 0,void 0,(function*(){try{return(yield navigator.mediaDevices.enumerateDevices()).filter((e=>"videoinput"===e.kind))}catch(e){return console.error(e),[]}}))}function bn(){return mn(this,void 0,void 0,(function*(){try{return(yield navigator.mediaDevices.enumerateDevices()).filter((e=>"audioinput"===e.kind))}catch(e){return console.error(e),[]}}))}function wn(){return mn(this,void 0,void 0,(function*(){return(yield bn()).length>0}))}function Sn(e){return mn(this,void 0,void 0,(function*(){const t=!!(e=e||{audio:!0,video:!0}).audio&&(yield wn())&&e.audio,n=!!e.video&&(yield wn())&&e.video;let r;e={audio:t,video:n};try{r=yield navigator.mediaDevices.getUserMedia(e)}catch(e){return console.error(e),{audio:null,video:null}}const i=r.getTracks().find((e=>"video"===e.kind));return{audio:r.getTracks().find((e=>"audio"===e.kind))||null,video:i||null}}))}function kn(e){return mn(this,void 0,void 0,(function*(){const t=e||!0,{video:n}=yield Sn({audio:!1,video:t});return n}))}function xn(e){return mn(this,void 0,void 0,(function*(){const t=e||!0,{audio:n}=yield Sn({audio:t,video:!1});return n}))}function En(){return mn(this,void 0,void 0,(function*(){const e={video:{cursor:"always"},audio:!1};let t;try{t=yield navigator.mediaDevices.getDisplayMedia(e)}catch(e){return console.error(e),null}return t.getTracks().find((e=>"video"===e.kind))||null}))}class Cn extends t.Component{constructor(e){super(e),this.state={nickname:"",audioDeviceId:"",videoDeviceId:"",mics:[],cameras:[]},this.videoPreview=t.createRef(),this.onSelectDevice=this.onSelectDevice.bind(this),this.handleChange=this.handleChange.bind(this),this.handleSubmit=this.handleSubmit.bind(this)}render(){return this.props.isVisible?(0,e.jsxs)(e.Fragment,{children:[(0,e.jsx)("div",{className:"modal-overlay"},void 0),(0,e.jsxs)("div",Object.assign({className:"enter-room-modal dialog fade-in"},{children:[(0,e.jsxs)("form",Object.assign({onSubmit:this.handleSubmit},{children:[(0,e.jsxs)("label",{children:["Nickname",(0,e.jsx)("input",{type:"text",name:"nickname",value:this.state.nickname,onChange:this.handleChange,required:!0},void 0)]},void 0),(0,e.jsx)(Pn,{label:"Microphone",devices:this.state.mics,onSelectDevice:this.onSelectDevice},void 0),(0,e.jsx)(Pn,{label:"Camera",devices:this.state.cameras,onSelectDevice:this.onSelectDevice},void 0),(0,e.jsx)("input",{type:"submit",value:"Enter room"},void 0)]}),void 0),(0,e.jsx)("div",Object.assign({className:"video-container"},{children:(0,e.jsx)("video",{ref:this.videoPreview,autoPlay:!0,playsInline:!0},void 0)}),void 0)]}),void 0)]},void 0):null}componentDidMount(){Sn().then((({audio:e,video:t})=>{e&&e.stop(),t&&t.stop()})).then((()=>Promise.all([bn(),yn()]))).then((([e,t])=>{this.setState({mics:e,cameras:t})}))}componentWillUnmount(){this.stopPreviewStream()}onSelectDevice(e,t){"Camera"===e?(this.stopPreviewStream(),t&&this.getMaxCameraResolution(t).then((e=>{this.props.updateVideoDevice({maxResolution:e})})).then((()=>kn({deviceId:t}))).then((e=>{if(e&&this.videoPreview.current){const t=new MediaStream([e]);this.videoPreview.current.srcObject=t}})),this.props.updateVideoDevice({id:t}),this.setState({videoDeviceId:t})):"Microphone"===e&&this.setState({audioDeviceId:t})}handleChange(e){const t=e.target.value;this.setState({nickname:t})}handleSubmit(e){e.preventDefault();const{nickname:t,audioDeviceId:n,videoDeviceId:r}=this.state;r||this.getMaxCameraResolution(r).then((e=>{this.props.updateVideoDevice({maxResolution:e})})),this.props.setUsername(t),this.props.updateVideoDevice({id:r,active:!!r}),this.props.updateAudioDevice({id:n,active:!!n}),this.props.onSubmit()}getMaxCameraResolution(e){return this.stopPreviewStream(),kn({deviceId:e,height:{ideal:2160}}).then((e=>{let t=0;return e&&(t=e.getSettings().height,e.stop()),t}))}stopPreviewStream(){if(this.videoPreview.current){const e=this.videoPreview.current.srcObject;e&&e.getTracks().forEach((e=>e.stop())),this.videoPreview.current.srcObject=null}}}const On=Y(null,{setUsername:vt,updateAudioDevice:dn,updateVideoDevice:fn})(Cn);class Pn extends t.Component{constructor(e){super(e),this.handleChange=this.handleChange.bind(this)}render(){return(0,e.jsxs)("label",{children:[this.props.label,(0,e.jsxs)("select",Object.assign({name:this.props.label,onChange:this.handleChange},{children:[(0,e.jsx)("option",Object.assign({value:""},{children:"None"}),void 0),this.props.devices.map((t=>(0,e.jsx)("option",Object.assign({value:t.deviceId},{children:t.label}),t.deviceId)))]}),void 0)]},void 0)}handleChange(e){const t=e.target.value;this.props.onSelectDevice(this.props.label,t)}}class jn extends t.Component{constructor(e){super(e),this.cancelButton=t.createRef(),this.leaveButton=t.createRef(),this.keyListener=this.keyListener.bind(this),this.handleCancel=this.handleCancel.bind(this),this.handleSubmit=this.handleSubmit.bind(this)}render(){return(0,e.jsxs)(e.Fragment,{children:[(0,e.jsx)("div",{className:"modal-overlay"},void 0),(0,e.jsxs)("div",Object.assign({className:"dialog fade-in exit-dialog",onKeyPress:this.keyListener,role:"dialog","aria-labelledby":"exit-dialog-title","aria-modal":"true"},{children:[(0,e.jsx)("p",Object.assign({id:"exit-dialog-title"},{children:"Do you want to leave the room?"}),void 0),(0,e.jsx)("input",{onClick:this.handleCancel,className:"btn btn-secondary btn-cancel",type:"button",value:"Cancel",ref:this.cancelButton},void 0),(0,e.jsx)("input",{onClick:this.handleSubmit,className:"btn btn-secondary",type:"submit",value:"Leave",ref:this.leaveButton},void 0)]}),void 0)]},void 0)}componentDidMount(){this.cancelButton.current&&this.cancelButton.current.focus()}keyListener(e){"Escape"===e.key&&(e.preventDefault(),this.props.onClose()),"Tab"===e.key&&(e.preventDefault(),document.activeElement===this.cancelButton.current&&this.leaveButton.current?this.leaveButton.current.focus():this.cancelButton.current&&this.cancelButton.current.focus())}handleCancel(){this.props.onClose()}handleSubmit(){window.location.href=window.location.origin}}class Tn extends t.Component{constructor(e){super(e),this.onTrack=this.onTrack.bind(this)}render(){const{videoDevice:t,audioDevice:n,displayDevice:r}=this.props,i=t.resolution,o={deviceId:t.id,height:{ideal:i},width:{ideal:4*i/3}},a={deviceId:n.id};return(0,e.jsxs)("section",Object.assign({className:"media-control-bar","aria-labelledby":"media-controls-title"},{children:[(0,e.jsx)("h1",Object.assign({id:"media-controls-title",className:"sr-only"},{children:"Media controls"}),void 0),(0,e.jsx)(Nn,{kind:"camera",deviceConstraints:o,isOn:t.active,onTrack:this.onTrack,getMedia:kn,icons:{on:"videocam",off:"videocam_off"},ariaLabel:"Toggle enable camera"},void 0),(0,e.jsx)(Nn,{kind:"mic",deviceConstraints:a,isOn:n.active,onTrack:this.onTrack,getMedia:xn,icons:{on:"mic",off:"mic_off"},ariaLabel:"Toggle enable microphone"},void 0),(0,e.jsx)(Nn,{kind:"display",deviceConstraints:null,isOn:r.active,onTrack:this.onTrack,getMedia:En,icons:{on:"screen_share",off:"stop_screen_share"},ariaLabel:"Toggle enable desktop sharing"},void 0),(0,e.jsx)(Rn,{},void 0)]}),void 0)}onTrack(e,t){"camera"===e?(this.props.setLocalVideo(t),t?(this.props.updateVideoDevice({active:!0}),this.props.updateDisplayDevice({active:!1})):this.props.updateVideoDevice({active:!1})):"display"===e?(this.props.setLocalVideo(t),t?(this.props.updateDisplayDevice({active:!0}),this.props.updateVideoDevice({active:!1})):this.props.updateDisplayDevice({active:!1})):"mic"===e&&(this.props.setLocalAudio(t),t?this.props.updateAudioDevice({active:!0}):this.props.updateAudioDevice({active:!1}))}}const _n=Y((e=>({audioDevice:e.devices.audio,videoDevice:e.devices.video,displayDevice:e.devices.display})),{setLocalAudio:At,setLocalVideo:Ft,updateAudioDevice:dn,updateVideoDevice:fn,updateDisplayDevice:pn})(Tn);class Nn extends t.Component{constructor(e){super(e),this.mediaTrack=null,this.onClick=this.onClick.bind(this)}mediaIsOn(){return Boolean(this.mediaTrack&&"live"===this.mediaTrack.readyState)}render(){return(0,e.jsx)("button",Object.assign({onClick:this.onClick,"aria-label":this.props.ariaLabel,"aria-pressed":this.props.isOn},{children:(0,e.jsx)("i",Object.assign({className:"material-icons"},{children:this.props.isOn?this.props.icons.on:this.props.icons.off}),void 0)}),void 0)}componentDidMount(){this.setMedia()}setMedia(){this.props.isOn&&!this.mediaIsOn()?this.mediaOn():!this.props.isOn&&this.mediaIsOn()&&this.mediaOff()}onClick(){this.props.isOn?this.mediaOff():this.mediaOn()}mediaOn(){this.props.getMedia(this.props.deviceConstraints).then((e=>{this.mediaTrack=e,this.props.onTrack(this.props.kind,e)}))}mediaOff(){this.mediaTrack&&this.mediaIsOn()&&(this.mediaTrack.enabled=!1,this.mediaTrack.stop()),this.props.onTrack(this.props.kind,null)}}class Rn extends t.Component{constructor(e){super(e),this.state={showExitDialog:!1},this.onClick=this.onClick.bind(this),this.onCloseExitDialog=this.onCloseExitDialog.bind(this)}render(){return(0,e.jsxs)(e.Fragment,{children:[this.state.showExitDialog&&(0,e.jsx)(jn,{onClose:this.onCloseExitDialog},void 0),(0,e.jsx)("button",Object.assign({onClick:this.onClick,"aria-label":"Hang up"},{children:(0,e.jsx)("i",Object.assign({className:"material-icons",style:{color:"#a00"}},{children:"call_end"}),void 0)}),void 0)]},void 0)}onClick(){this.setState({showExitDialog:!0})}onCloseExitDialog(){this.setState({showExitDialog:!1})}}class Mn extends t.Component{constructor(e){super(e),this.state={currentChild:0,isCollapsed:!0},this.onToggleButtonClick=this.onToggleButtonClick.bind(this),this.hide=this.hide.bind(this)}render(){const{currentChild:t,isCollapsed:n}=this.state,r=this.props.buttonAriaLabels[t];return(0,e.jsxs)("section",Object.assign({className:"sidebar "+(n?"collapsed":""),"aria-labelledby":"sidebar-title"},{children:[(0,e.jsx)("h1",Object.assign({id:"sidebar-title",className:"sr-only"},{children:"Sidebar"}),void 0),n&&this.renderToggleButtons(),!n&&(0,e.jsxs)(e.Fragment,{children:[(0,e.jsx)("button",Object.assign({className:"icon-button",onClick:this.hide,"aria-label":`Close ${r}`},{children:(0,e.jsx)("i",Object.assign({className:"material-icons"},{children:"close"}),void 0)}),void 0),this.props.children[t]]},void 0)]}),void 0)}renderToggleButtons(){const t=this.props.buttonIcons,n=this.props.buttonAriaLabels;return(0,e.jsx)("ul",Object.assign({className:"sidebar-toggle-buttons"},{children:t.map(((t,r)=>(0,e.jsx)("li",{children:(0,e.jsx)(Dn,{icon:t,onClick:this.onToggleButtonClick,ariaLabel:`Open ${n[r]}`},void 0)},t)))}),void 0)}onToggleButtonClick(e){const t=this.props.buttonIcons.indexOf(e);this.setState({currentChild:t,isCollapsed:!1}),this.props.onToggle("open")}hide(){this.setState({isCollapsed:!0}),this.props.onToggle("close")}}class Dn extends t.Component{constructor(e){super(e),this.onClick=this.onClick.bind(this)}render(){return(0,e.jsx)("button",Object.assign({className:"icon-button",onClick:this.onClick,"aria-label":this.props.ariaLabel},{children:(0,e.jsx)("i",Object.assign({className:"material-icons"},{children:this.props.icon}),void 0)}),void 0)}onClick(){this.props.onClick(this.props.icon)}}var Ln={fullscreenEnabled:0,fullscreenElement:1,requestFullscreen:2,exitFullscreen:3,fullscreenchange:4,fullscreenerror:5,fullscreen:6},In=["webkitFullscreenEnabled","webkitFullscreenElement","webkitRequestFullscreen","webkitExitFullscreen","webkitfullscreenchange","webkitfullscreenerror","-webkit-full-screen"],An=["mozFullScreenEnabled","mozFullScreenElement","mozRequestFullScreen","mozCancelFullScreen","mozfullscreenchange","mozfullscreenerror","-moz-full-screen"],Fn=["msFullscreenEnabled","msFullscreenElement","msRequestFullscreen","msExitFullscreen","MSFullscreenChange","MSFullscreenError","-ms-fullscreen"],zn="undefined"!=typeof window&&void 0!==window.document?window.document:{},Un="fullscreenEnabled"in zn&&Object.keys(Ln)||In[0]in zn&&In||An[0]in zn&&An||Fn[0]in zn&&Fn||[];const $n={requestFullscreen:function(e){return e[Un[Ln.requestFullscreen]]()},requestFullscreenFunction:function(e){return e[Un[Ln.requestFullscreen]]},get exitFullscreen(){return zn[Un[Ln.exitFullscreen]].bind(zn)},get fullscreenPseudoClass(){return":"+Un[Ln.fullscreen]},addEventListener:function(e,t,n){return zn.addEventListener(Un[Ln[e]],t,n)},removeEventListener:function(e,t,n){return zn.removeEventListener(Un[Ln[e]],t,n)},get fullscreenEnabled(){return Boolean(zn[Un[Ln.fullscreenEnabled]])},set fullscreenEnabled(e){},get fullscreenElement(){return zn[Un[Ln.fullscreenElement]]},set fullscreenElement(e){},get onfullscreenchange(){return zn[("on"+Un[Ln.fullscreenchange]).toLowerCase()]},set onfullscreenchange(e){return zn[("on"+Un[Ln.fullscreenchange]).toLowerCase()]=e},get onfullscreenerror(){return zn[("on"+Un[Ln.fullscreenerror]).toLowerCase()]},set onfullscreenerror(e){return zn[("on"+Un[Ln.fullscreenerror]).toLowerCase()]=e}};class Vn extends t.Component{constructor(e){super(e),this.state={volume:1,volumeMuted:!1,showSettings:!1},this.toggleAudioMute=this.toggleAudioMute.bind(this),this.handleVolumeChange=this.handleVolumeChange.bind(this),this.toggleSettings=this.toggleSettings.bind(this),this.togglePictureInPicture=this.togglePictureInPicture.bind(this),this.toggleFullscreen=this.toggleFullscreen.bind(this),this.toggleVisibility=this.toggleVisibility.bind(this)}render(){const{volume:t,volumeMuted:n,showSettings:r}=this.state,{videoRef:i,feed:o,showVisibilityControls:a,showAudioControls:l,showResolutionControls:s,videoDevice:u}=this.props,c=n||0==t?"volume_off":t<.6?"volume_down":"volume_up",d=i.current,f="pictureInPictureEnabled"in document||d&&"webkitSetPresentationMode"in d;return(0,e.jsxs)("div",Object.assign({className:"video-control-bar"},{children:[a&&(0,e.jsx)("button",Object.assign({className:"toggle-visibility",onClick:this.toggleVisibility,"aria-label":`Toggle mute video for feed ${o.username}`,"aria-pressed":!o.videoEnabled},{children:(0,e.jsx)("i",Object.assign({className:"material-icons"},{children:o.videoEnabled?"visibility":"visibility_off"}),void 0)}),void 0),l&&(0,e.jsxs)(e.Fragment,{children:[(0,e.jsx)("button",Object.assign({className:"toggle-audio",onClick:this.toggleAudioMute,"aria-label":`Toggle mute audio for feed ${o.username}`,"aria-pressed":this.state.volumeMuted},{children:(0,e.jsx)("i",Object.assign({className:"material-icons"},{children:c}),void 0)}),void 0),(0,e.jsx)("input",{className:"volume-slider",type:"range",min:"0",max:"1",step:"0.1",value:n?0:t,onChange:this.handleVolumeChange,"aria-label":`Audio volume slider for feed ${o.username}`},void 0)]},void 0),s&&u.active&&(0,e.jsx)("button",Object.assign({className:"toggle-settings",onClick:this.toggleSettings,"aria-label":"Toggle video settings menu for your camera"},{children:(0,e.jsx)("i",Object.assign({className:"material-icons"},{children:"settings"}),void 0)}),void 0),s&&u.active&&r&&this.renderSettings(),f&&(0,e.jsx)("button",Object.assign({className:"toggle-pip",onClick:this.togglePictureInPicture,"aria-label":`Toggle picture-in-picture video for feed ${o.username}`},{children:(0,e.jsx)("i",Object.assign({className:"material-icons"},{children:"picture_in_picture"}),void 0)}),void 0),$n.fullscreenEnabled&&(0,e.jsx)("button",Object.assign({className:"toggle-fullscreen",onClick:this.toggleFullscreen,"aria-label":`Toggle fullscreen video for feed ${o.username}`},{children:(0,e.jsx)("i",Object.assign({className:"material-icons"},{children:"fullscreen"}),void 0)}),void 0)]}),void 0)}renderSettings(){const t=this.props.videoDevice,n=`${t.resolution}p`,r=gn.filter((e=>e<=t.maxResolution)).map((e=>`${e}p`));return(0,e.jsxs)("div",Object.assign({className:"video-settings"},{children:[(0,e.jsx)("p",{children:"Video quality"},void 0),r.map((t=>(0,e.jsx)("button",Object.assign({onClick:()=>this.setQuality(t)},{children:(0,e.jsx)("span",Object.assign({className:t===n?"selected":""},{children:t}),void 0)}),t)))]}),void 0)}componentDidUpdate(){const e=this.props.audioRef.current;e&&(e.muted=this.state.volumeMuted,e.volume=this.state.volume)}toggleAudioMute(){this.setState((e=>({volumeMuted:!e.volumeMuted})))}handleVolumeChange(e){const t=Number(e.target.value);this.setState({volume:t,volumeMuted:!1})}toggleSettings(){this.setState((e=>({showSettings:!e.showSettings})))}setQuality(e){const t=Number(e.replace(/p/,""));this.props.setResolution(t),this.setState({showSettings:!1})}togglePictureInPicture(){const e=this.props.videoRef.current;e&&"webkitSetPresentationMode"in e?e.webkitSetPresentationMode("picture-in-picture"===e.webkitPresentationMode?"inline":"picture-in-picture"):document.pictureInPictureElement?document.exitPictureInPicture().catch((e=>{console.error(e)})):e&&e.requestPictureInPicture().catch((e=>{console.error(e)}))}toggleFullscreen(){const e=this.props.videoContainerRef.current;$n.fullscreenElement?$n.exitFullscreen():e&&$n.requestFullscreen(e)}toggleVisibility(){const e=this.props.feed;e.videoEnabled?this.props.disableRemoteVideo(e.id):this.props.enableRemoteVideo(e.id)}}const Bn=Y((e=>({videoDevice:e.devices.video})),{setResolution:hn,disableRemoteVideo:zt,enableRemoteVideo:Ut})(Vn);class Wn extends t.Component{constructor(e){super(e),this.state={videoHeightAspect:3,videoWidthAspect:4,videoScaleFactor:1},this.updateScaleFactor=this.updateScaleFactor.bind(this)}render(){const t=this.props.users,n=this.props.feeds.map((e=>{const n=t.find((t=>t.id===e.id)),r=n?n.username:"Major Tom";return Object.assign({},e,{username:r})})),r={height:`${Math.floor(this.state.videoScaleFactor*this.state.videoHeightAspect)}px`,width:`${Math.floor(this.state.videoScaleFactor*this.state.videoWidthAspect)}px`};return(0,e.jsxs)("ul",Object.assign({id:"video-stage",className:"video-stage","aria-labelledby":"video-stage-title"},{children:[(0,e.jsx)("h1",Object.assign({id:"video-stage-title",className:"sr-only"},{children:"Video feeds"}),void 0),n.map((t=>(0,e.jsx)(Hn,{feed:t,style:r,onDragAndDrop:this.props.swapFeeds},t.id)))]}),void 0)}componentDidMount(){window.addEventListener("resize",(()=>this.updateScaleFactor())),this.updateScaleFactor()}componentDidUpdate(){const e=this.calculateScaleFactor(this.props.feeds.length,this.state.videoHeightAspect,this.state.videoWidthAspect);e!==this.state.videoScaleFactor&&this.updateScaleFactor(e)}updateScaleFactor(e){this.setState(((t,n)=>({videoScaleFactor:e||this.calculateScaleFactor(n.feeds.length,t.videoHeightAspect,t.videoWidthAspect)})))}calculateScaleFactor(e,t,n,r=0){const i=document.querySelector("#video-stage"),o=i.clientHeight/t,a=i.clientWidth/n,l=Math.sqrt(e*(o/a)),s=Math.sqrt(e*(a/o)),u=Math.floor(l),c=Math.ceil(l),d=Math.floor(s),f=Math.ceil(s),p=[[u,d],[c,d],[u,f],[c,f]].filter((([t,n])=>t*n>=e)).map((([e,r])=>{const o=(i.clientWidth-4)/(r*n),a=(i.clientHeight-4)/(e*t);return Math.min(o,a)}));let h=Math.max(...p);return h*n<r&&(h=r/n),h}}const qn=Y((e=>({users:e.users,feeds:e.feeds})),{swapFeeds:It},null,{forwardRef:!0})(Wn);class Hn extends t.Component{constructor(e){super(e),this.video=t.createRef(),this.audio=t.createRef(),this.videoContainer=t.createRef(),this.onDragStart=this.onDragStart.bind(this),this.onDragOver=this.onDragOver.bind(this),this.onDrop=this.onDrop.bind(this),this.setAudio=this.setAudio.bind(this),this.setVideo=this.setVideo.bind(this)}render(){const t=this.props.feed;return(0,e.jsxs)("li",Object.assign({className:"video-feed",style:this.props.style,draggable:"true",onDragStart:this.onDragStart,onDragOver:this.onDragOver,onDrop:this.onDrop,tabIndex:0,"aria-labelledby":`video-feed-${t.id}`},{children:[(0,e.jsx)("h2",Object.assign({id:`video-feed-${t.id}`,className:"sr-only"},{children:`Video feed for user ${t.username}`}),void 0),(0,e.jsx)("p",Object.assign({className:"video-tag"},{children:t.username}),void 0),(0,e.jsx)("div",Object.assign({ref:this.videoContainer,style:{height:"100%"}},{children:(0,e.jsx)("video",{ref:this.video,id:t.id,autoPlay:!0,playsInline:!0,muted:!0},void 0)}),void 0),(0,e.jsx)("audio",{ref:this.audio,autoPlay:!0},void 0),(0,e.jsx)(Bn,{audioRef:this.audio,videoRef:this.video,videoContainerRef:this.videoContainer,feed:t,showVisibilityControls:"local"!==t.id,showAudioControls:!t.audioMuted,showResolutionControls:"local"===t.id},void 0)]}),void 0)}componentDidMount(){const{videoStream:e,audioStream:t,audioMuted:n,videoEnabled:r}=this.props.feed;this.setVideo(r?e:null),this.setAudio(n?null:t)}componentDidUpdate(){const{videoStream:e,audioStream:t,audioMuted:n,videoEnabled:r}=this.props.feed;this.setVideo(r?e:null),this.setAudio(n?null:t)}onDragStart(e){e.dataTransfer.setData("id",this.props.feed.id)}onDragOver(e){e.preventDefault()}onDrop(e){e.preventDefault();const t=e.dataTransfer.getData("id"),n=this.props.feed.id;this.props.onDragAndDrop({id1:t,id2:n})}setAudio(e){this.audio.current&&this.audio.current.srcObject!==e&&(this.audio.current.srcObject=e)}setVideo(e){this.video.current&&this.video.current.srcObject!==e&&(this.video.current.srcObject=e)}}class Qn extends t.Component{constructor(e){super(e),this.manager=this.props.manager,this.state={displayEnterRoomModal:!0},this.videoStage=t.createRef(),this.canUpdateIceServers=void 0!==(new RTCPeerConnection).setConfiguration,this.onSubmitModal=this.onSubmitModal.bind(this),this.onReceiveChatMessage=this.onReceiveChatMessage.bind(this),this.onReceiveIceServers=this.onReceiveIceServers.bind(this),this.onMediaPeer=this.onMediaPeer.bind(this),this.onMediaPeerRemoved=this.onMediaPeerRemoved.bind(this),this.onPeerTrack=this.onPeerTrack.bind(this),this.onPeerConnectionChange=this.onPeerConnectionChange.bind(this),this.onPeerUsernameChange=this.onPeerUsernameChange.bind(this),this.onSidebarToggle=this.onSidebarToggle.bind(this)}componentDidMount(){this.manager.addMessageListener({type:"text"},this.onReceiveChatMessage),this.manager.addMessageListener({type:"ice-servers"},this.onReceiveIceServers),this.manager.on("mediapeer",this.onMediaPeer),this.manager.on("mediapeerremoved",this.onMediaPeerRemoved),window.addEventListener("beforeunload",(()=>{this.manager.shutdown()})),window.addEventListener("load",(()=>function(e,t,n,r){return new(n||(n=Promise))((function(i,o){function a(e){try{s(r.next(e))}catch(e){o(e)}}function l(e){try{s(r.throw(e))}catch(e){o(e)}}function s(e){var t;e.done?i(e.value):(t=e.value,t instanceof n?t:new n((function(e){e(t)}))).then(a,l)}s((r=r.apply(e,t||[])).next())}))}(this,void 0,void 0,(function*(){yield this.manager.start()}))))}componentWillUnmount(){this.manager.shutdown()}render(){return this.state.displayEnterRoomModal?(0,e.jsx)(On,{isVisible:this.state.displayEnterRoomModal,onSubmit:this.onSubmitModal},void 0):(0,e.jsxs)(e.Fragment,{children:[(0,e.jsxs)("main",{children:[(0,e.jsx)(qn,{ref:this.videoStage},void 0),(0,e.jsx)(_n,{},void 0),(0,e.jsx)(ln,{},void 0)]},void 0),(0,e.jsxs)(Mn,Object.assign({buttonIcons:["message","people","settings"],buttonAriaLabels:["chat window","users window","settings window"],onToggle:this.onSidebarToggle},{children:[(0,e.jsx)(Xt,{},void 0),(0,e.jsx)(tn,{},void 0),(0,e.jsx)(on,{allowEditing:this.canUpdateIceServers},void 0)]}),void 0)]},void 0)}onSubmitModal(){this.setState({displayEnterRoomModal:!1})}onReceiveChatMessage(e){const t={from:e.data.from,timestamp:e.data.time,text:e.data.text};this.props.addChatMessage(t)}onReceiveIceServers(e){e.data.forEach((e=>{"string"==typeof e.urls&&(e.urls=[e.urls]);const t=e.urls[0].match(/^(?<kind>stun|turn):/);e.kind=t&&t.groups?t.groups.kind:"",this.props.addIceServer(e)}))}onMediaPeer(e){e.on("track",(t=>{this.onPeerTrack(e,t)})),e.on("connectionstatechange",(t=>{this.onPeerConnectionChange(e,"connectionState",t)})),e.on("iceconnectionstatechange",(t=>{this.onPeerConnectionChange(e,"iceConnectionState",t)})),e.on("icegatheringstatechange",(t=>{this.onPeerConnectionChange(e,"iceGatheringState",t)})),e.on("signalingstatechange",(t=>{this.onPeerConnectionChange(e,"signalingState",t)})),e.on("usernamechange",(t=>{this.onPeerUsernameChange(e,t)}));const t={id:e.id,username:e.username},n={id:e.id,videoStream:null,audioStream:null,videoEnabled:!0,audioMuted:!1},r={id:e.id,connectionState:e.connectionState,iceConnectionState:e.iceConnectionState,iceGatheringState:e.iceGatheringState,signalingState:e.signalingState};this.props.addUser(t),this.props.addFeed(n),this.props.addConnection(r)}onMediaPeerRemoved(e){this.props.removeFeed(e.id),this.props.removeConnection(e.id)}onPeerTrack(e,t){const n=new MediaStream([t]);t.addEventListener("unmute",(()=>{console.log("Track unmuted",t,n);const r="video"==t.kind?"videoStream":"audioStream",i={id:e.id,[r]:n};this.props.updateFeed(i)})),t.addEventListener("mute",(()=>{console.log("Track muted",t);const n="video"==t.kind?"videoStream":"audioStream",r={id:e.id,[n]:null};this.props.updateFeed(r)}))}onPeerConnectionChange(e,t,n){const r={id:e.id,[t]:n};this.props.updateConnection(r)}onPeerUsernameChange(e,t){const n={id:e.id,username:t};this.props.updateUser(n)}onSidebarToggle(){this.videoStage.current&&this.videoStage.current.forceUpdate()}}const Kn=Y(null,{addUser:pt,updateUser:ht,addChatMessage:wt,addConnection:Ot,removeConnection:Pt,updateConnection:jt,addFeed:Mt,removeFeed:Dt,updateFeed:Lt,addIceServer:Ht})(Qn);var Gn=function(e){return"@@redux-saga/"+e},Yn=Gn("CANCEL_PROMISE"),Xn=Gn("CHANNEL_END"),Jn=Gn("IO"),Zn=Gn("MATCH"),er=Gn("MULTICAST"),tr=Gn("SAGA_ACTION"),nr=Gn("SELF_CANCELLATION"),rr=Gn("TASK"),ir=Gn("TASK_CANCEL"),or=Gn("TERMINATE"),ar=Gn("LOCATION");function lr(){return(lr=Object.assign||function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e}).apply(this,arguments)}var sr=function(e){return null==e},ur=function(e){return null!=e},cr=function(e){return"function"==typeof e},dr=function(e){return"string"==typeof e},fr=Array.isArray,pr=function(e){return e&&cr(e.then)},hr=function(e){return e&&cr(e.next)&&cr(e.throw)},vr=function e(t){return t&&(dr(t)||yr(t)||cr(t)||fr(t)&&t.every(e))},mr=function(e){return e&&cr(e.take)&&cr(e.close)},gr=function(e){return cr(e)&&e.hasOwnProperty("toString")},yr=function(e){return Boolean(e)&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype},br=function(e){return function(){return true}}(),wr=function(){},Sr=function(e){return e};"function"==typeof Symbol&&Symbol.asyncIterator&&Symbol.asyncIterator;var kr=function(e,t){lr(e,t),Object.getOwnPropertySymbols&&Object.getOwnPropertySymbols(t).forEach((function(n){e[n]=t[n]}))};function xr(e,t){var n=e.indexOf(t);n>=0&&e.splice(n,1)}var Er=function(e){throw e},Cr=function(e){return{value:e,done:!0}};function Or(e,t,n){void 0===t&&(t=Er),void 0===n&&(n="iterator");var r={meta:{name:n},next:e,throw:t,return:Cr,isSagaIterator:!0};return"undefined"!=typeof Symbol&&(r[Symbol.iterator]=function(){return r}),r}function Pr(e,t){var n=t.sagaStack;console.error(e),console.error(n)}var jr=function(e){return Array.apply(null,new Array(e))},Tr=function(e){return function(t){return e(Object.defineProperty(t,tr,{value:!0}))}},_r=function(e){return e===or},Nr=function(e){return e===ir},Rr=function(e){return _r(e)||Nr(e)};function Mr(e,t){var n,r=Object.keys(e),i=r.length,o=0,a=fr(e)?jr(i):{},l={};return r.forEach((function(e){var r=function(r,l){n||(l||Rr(r)?(t.cancel(),t(r,l)):(a[e]=r,++o===i&&(n=!0,t(a))))};r.cancel=wr,l[e]=r})),t.cancel=function(){n||(n=!0,r.forEach((function(e){return l[e].cancel()})))},l}function Dr(e){return{name:e.name||"anonymous",location:Lr(e)}}function Lr(e){return e[ar]}var Ir=function(e){return function(e,t){void 0===e&&(e=10);var n=new Array(e),r=0,i=0,o=0,a=function(t){n[i]=t,i=(i+1)%e,r++},l=function(){if(0!=r){var t=n[o];return n[o]=null,r--,o=(o+1)%e,t}},s=function(){for(var e=[];r;)e.push(l());return e};return{isEmpty:function(){return 0==r},put:function(l){var u;if(r<e)a(l);else switch(t){case 1:throw new Error("Channel's Buffer overflow!");case 3:n[i]=l,o=i=(i+1)%e;break;case 4:u=2*e,n=s(),r=n.length,i=n.length,o=0,n.length=u,e=u,a(l)}},take:l,flush:s}}(e,4)},Ar="TAKE",Fr="FORK",zr="SELECT",Ur=function(e,t){var n;return(n={})[Jn]=!0,n.combinator=!1,n.type=e,n.payload=t,n};function $r(e,t){return void 0===e&&(e="*"),vr(e)?Ur(Ar,{pattern:e}):mr(n=e)&&n[er]&&ur(t)&&vr(t)?Ur(Ar,{channel:e,pattern:t}):mr(e)?Ur(Ar,{channel:e}):void 0;var n}function Vr(e,t){return sr(t)&&(t=e,e=void 0),Ur("PUT",{channel:e,action:t})}function Br(e,t){var n,r=null;return cr(e)?n=e:(fr(e)?(r=e[0],n=e[1]):(r=e.context,n=e.fn),r&&dr(n)&&cr(r[n])&&(n=r[n])),{context:r,fn:n,args:t}}function Wr(e,t,n){return void 0===n&&(n=[]),Ur("CALL",Br([e,t],n))}function qr(e){for(var t=arguments.length,n=new Array(t>1?t-1:0),r=1;r<t;r++)n[r-1]=arguments[r];return Ur(Fr,Br(e,n))}function Hr(e){return void 0===e&&(e=nr),Ur("CANCEL",e)}function Qr(e){void 0===e&&(e=Sr);for(var t=arguments.length,n=new Array(t>1?t-1:0),r=1;r<t;r++)n[r-1]=arguments[r];return Ur(zr,{selector:e,args:n})}function Kr(e){return Ur("GET_CONTEXT",e)}const Gr=function(){var e={};return e.promise=new Promise((function(t,n){e.resolve=t,e.reject=n})),e};var Yr=[],Xr=0;function Jr(e){try{ti(),e()}finally{ni()}}function Zr(e){Yr.push(e),Xr||(ti(),ri())}function ei(e){try{return ti(),e()}finally{ri()}}function ti(){Xr++}function ni(){Xr--}function ri(){var e;for(ni();!Xr&&void 0!==(e=Yr.shift());)Jr(e)}var ii=function(e){return function(t){return e.some((function(e){return ui(e)(t)}))}},oi=function(e){return function(t){return e(t)}},ai=function(e){return function(t){return t.type===String(e)}},li=function(e){return function(t){return t.type===e}},si=function(){return br};function ui(e){var t="*"===e?si:dr(e)?ai:fr(e)?ii:gr(e)?ai:cr(e)?oi:yr(e)?li:null;if(null===t)throw new Error("invalid pattern: "+e);return t(e)}var ci={type:Xn},di=function(e){return e&&e.type===Xn};function fi(){var e,t,n,r,i,o,a=(t=!1,r=n=[],i=function(){r===n&&(r=n.slice())},o=function(){t=!0;var e=n=r;r=[],e.forEach((function(e){e(ci)}))},(e={})[er]=!0,e.put=function(e){if(!t)if(di(e))o();else for(var i=n=r,a=0,l=i.length;a<l;a++){var s=i[a];s[Zn](e)&&(s.cancel(),s(e))}},e.take=function(e,n){var o,a;void 0===n&&(n=si),t?e(ci):(e[Zn]=n,i(),r.push(e),e.cancel=(o=function(){i(),xr(r,e)},a=!1,function(){a||(a=!0,o())}))},e.close=o,e),l=a.put;return a.put=function(e){e[tr]?l(e):Zr((function(){l(e)}))},a}function pi(e,t){var n=e[Yn];cr(n)&&(t.cancel=n),e.then(t,(function(e){t(e,!0)}))}var hi,vi=0,mi=function(){return++vi};function gi(e){e.isRunning()&&e.cancel()}var yi=((hi={}).TAKE=function(e,t,n){var r=t.channel,i=void 0===r?e.channel:r,o=t.pattern,a=t.maybe,l=function(e){e instanceof Error?n(e,!0):!di(e)||a?n(e):n(or)};try{i.take(l,ur(o)?ui(o):null)}catch(e){return void n(e,!0)}n.cancel=l.cancel},hi.PUT=function(e,t,n){var r=t.channel,i=t.action,o=t.resolve;Zr((function(){var t;try{t=(r?r.put:e.dispatch)(i)}catch(e){return void n(e,!0)}o&&pr(t)?pi(t,n):n(t)}))},hi.ALL=function(e,t,n,r){var i=r.digestEffect,o=vi,a=Object.keys(t);if(0!==a.length){var l=Mr(t,n);a.forEach((function(e){i(t[e],o,l[e],e)}))}else n(fr(t)?[]:{})},hi.RACE=function(e,t,n,r){var i=r.digestEffect,o=vi,a=Object.keys(t),l=fr(t)?jr(a.length):{},s={},u=!1;a.forEach((function(e){var t=function(t,r){u||(r||Rr(t)?(n.cancel(),n(t,r)):(n.cancel(),u=!0,l[e]=t,n(l)))};t.cancel=wr,s[e]=t})),n.cancel=function(){u||(u=!0,a.forEach((function(e){return s[e].cancel()})))},a.forEach((function(e){u||i(t[e],o,s[e],e)}))},hi.CALL=function(e,t,n,r){var i=t.context,o=t.fn,a=t.args,l=r.task;try{var s=o.apply(i,a);if(pr(s))return void pi(s,n);if(hr(s))return void ji(e,s,l.context,vi,Dr(o),!1,n);n(s)}catch(e){n(e,!0)}},hi.CPS=function(e,t,n){var r=t.context,i=t.fn,o=t.args;try{var a=function(e,t){sr(e)?n(t):n(e,!0)};i.apply(r,o.concat(a)),a.cancel&&(n.cancel=a.cancel)}catch(e){n(e,!0)}},hi.FORK=function(e,t,n,r){var i=t.context,o=t.fn,a=t.args,l=t.detached,s=r.task,u=function(e){var t=e.context,n=e.fn,r=e.args;try{var i=n.apply(t,r);if(hr(i))return i;var o=!1;return Or((function(e){return o?{value:e,done:!0}:(o=!0,{value:i,done:!pr(i)})}))}catch(e){return Or((function(){throw e}))}}({context:i,fn:o,args:a}),c=function(e,t){return e.isSagaIterator?{name:e.meta.name}:Dr(t)}(u,o);ei((function(){var t=ji(e,u,s.context,vi,c,l,void 0);l?n(t):t.isRunning()?(s.queue.addTask(t),n(t)):t.isAborted()?s.queue.abort(t.error()):n(t)}))},hi.JOIN=function(e,t,n,r){var i=r.task,o=function(e,t){if(e.isRunning()){var n={task:i,cb:t};t.cancel=function(){e.isRunning()&&xr(e.joiners,n)},e.joiners.push(n)}else e.isAborted()?t(e.error(),!0):t(e.result())};if(fr(t)){if(0===t.length)return void n([]);var a=Mr(t,n);t.forEach((function(e,t){o(e,a[t])}))}else o(t,n)},hi.CANCEL=function(e,t,n,r){var i=r.task;t===nr?gi(i):fr(t)?t.forEach(gi):gi(t),n()},hi.SELECT=function(e,t,n){var r=t.selector,i=t.args;try{n(r.apply(void 0,[e.getState()].concat(i)))}catch(e){n(e,!0)}},hi.ACTION_CHANNEL=function(e,t,n){var r=t.pattern,i=function(e){void 0===e&&(e=Ir());var t=!1,n=[];return{take:function(r){t&&e.isEmpty()?r(ci):e.isEmpty()?(n.push(r),r.cancel=function(){xr(n,r)}):r(e.take())},put:function(r){if(!t){if(0===n.length)return e.put(r);n.shift()(r)}},flush:function(n){t&&e.isEmpty()?n(ci):n(e.flush())},close:function(){if(!t){t=!0;var e=n;n=[];for(var r=0,i=e.length;r<i;r++)(0,e[r])(ci)}}}}(t.buffer),o=ui(r),a=function t(n){di(n)||e.channel.take(t,o),i.put(n)},l=i.close;i.close=function(){a.cancel(),l()},e.channel.take(a,o),n(i)},hi.CANCELLED=function(e,t,n,r){n(r.task.isCancelled())},hi.FLUSH=function(e,t,n){t.flush(n)},hi.GET_CONTEXT=function(e,t,n,r){n(r.task.context[t])},hi.SET_CONTEXT=function(e,t,n,r){var i=r.task;kr(i.context,t),n()},hi);function bi(e,t){return e+"?"+t}function wi(e){var t=e.name,n=e.location;return n?t+"  "+bi(n.fileName,n.lineNumber):t}function Si(e){var t,n,r,i=(t=function(e){return e.cancelledTasks},n=e,(r=[]).concat.apply(r,n.map(t)));return i.length?["Tasks cancelled due to error:"].concat(i).join("\n"):""}var ki=null,xi=[],Ei=function(e){e.crashedEffect=ki,xi.push(e)},Ci=function(){ki=null,xi.length=0},Oi=function(){var e=xi[0],t=xi.slice(1),n=e.crashedEffect?function(e){var t=Lr(e);return t?t.code+"  "+bi(t.fileName,t.lineNumber):""}(e.crashedEffect):null;return["The above error occurred in task "+wi(e.meta)+(n?" \n when executing effect "+n:"")].concat(t.map((function(e){return"    created by "+wi(e.meta)})),[Si(xi)]).join("\n")};function Pi(e,t,n,r,i,o,a){var l;void 0===a&&(a=wr);var s,u,c=0,d=null,f=[],p=Object.create(n),h=function(e,t,n){var r,i=[],o=!1;function a(e){f.push.apply(f,h.getTasks().map((function(e){return e.meta.name}))),s(),n(e,!0)}function l(t){i.push(t),t.cont=function(l,s){o||(xr(i,t),t.cont=wr,s?a(l):(t===e&&(r=l),i.length||(o=!0,n(r))))}}function s(){o||(o=!0,i.forEach((function(e){e.cont=wr,e.cancel()})),i=[])}return l(e),{addTask:l,cancelAll:s,abort:a,getTasks:function(){return i}}}(t,0,v);function v(t,n){if(n){if(c=2,Ei({meta:i,cancelledTasks:f}),m.isRoot){var r=Oi();Ci(),e.onError(t,{sagaStack:r})}u=t,d&&d.reject(t)}else t===ir?c=1:1!==c&&(c=3),s=t,d&&d.resolve(t);m.cont(t,n),m.joiners.forEach((function(e){e.cb(t,n)})),m.joiners=null}var m=((l={})[rr]=!0,l.id=r,l.meta=i,l.isRoot=o,l.context=p,l.joiners=[],l.queue=h,l.cancel=function(){0===c&&(c=1,h.cancelAll(),v(ir,!1))},l.cont=a,l.end=v,l.setContext=function(e){kr(p,e)},l.toPromise=function(){return d||(d=Gr(),2===c?d.reject(u):0!==c&&d.resolve(s)),d.promise},l.isRunning=function(){return 0===c},l.isCancelled=function(){return 1===c||0===c&&1===t.status},l.isAborted=function(){return 2===c},l.result=function(){return s},l.error=function(){return u},l);return m}function ji(e,t,n,r,i,o,a){var l=e.finalizeRunEffect((function(t,n,r){pr(t)?pi(t,r):hr(t)?ji(e,t,u.context,n,i,!1,r):t&&t[Jn]?(0,yi[t.type])(e,t.payload,r,c):r(t)}));d.cancel=wr;var s={meta:i,cancel:function(){0===s.status&&(s.status=1,d(ir))},status:0},u=Pi(e,s,n,r,i,o,a),c={task:u,digestEffect:f};return a&&(a.cancel=u.cancel),d(),u;function d(e,n){try{var i;n?(i=t.throw(e),Ci()):Nr(e)?(s.status=1,d.cancel(),i=cr(t.return)?t.return(ir):{done:!0,value:ir}):i=_r(e)?cr(t.return)?t.return():{done:!0}:t.next(e),i.done?(1!==s.status&&(s.status=3),s.cont(i.value)):f(i.value,r,d)}catch(e){if(1===s.status)throw e;s.status=2,s.cont(e,!0)}}function f(t,n,r,i){void 0===i&&(i="");var o,a=mi();function s(n,i){o||(o=!0,r.cancel=wr,e.sagaMonitor&&(i?e.sagaMonitor.effectRejected(a,n):e.sagaMonitor.effectResolved(a,n)),i&&function(e){ki=e}(t),r(n,i))}e.sagaMonitor&&e.sagaMonitor.effectTriggered({effectId:a,parentEffectId:n,label:i,effect:t}),s.cancel=wr,r.cancel=function(){o||(o=!0,s.cancel(),s.cancel=wr,e.sagaMonitor&&e.sagaMonitor.effectCancelled(a))},l(t,a,s)}}function Ti(e,t){for(var n=e.channel,r=void 0===n?fi():n,i=e.dispatch,o=e.getState,a=e.context,l=void 0===a?{}:a,s=e.sagaMonitor,u=e.effectMiddlewares,c=e.onError,d=void 0===c?Pr:c,f=arguments.length,p=new Array(f>2?f-2:0),h=2;h<f;h++)p[h-2]=arguments[h];var v,m=t.apply(void 0,p),g=mi();if(s&&(s.rootSagaStarted=s.rootSagaStarted||wr,s.effectTriggered=s.effectTriggered||wr,s.effectResolved=s.effectResolved||wr,s.effectRejected=s.effectRejected||wr,s.effectCancelled=s.effectCancelled||wr,s.actionDispatched=s.actionDispatched||wr,s.rootSagaStarted({effectId:g,saga:t,args:p})),u){var y=L.apply(void 0,u);v=function(e){return function(t,n,r){return y((function(t){return e(t,n,r)}))(t)}}}else v=Sr;var b={channel:r,dispatch:Tr(i),getState:o,sagaMonitor:s,onError:d,finalizeRunEffect:v};return ei((function(){var e=ji(b,m,l,g,Dr(t),!0,void 0);return s&&s.effectResolved(g,e),e}))}class _i{constructor(){this.events=new Map}listeners(e){return this.events.get(e)||[]}on(e,t){this.events.has(e)||this.events.set(e,[]),this.events.get(e).push(t)}removeListener(e,t){const n=this.events.get(e);if(n&&n.includes(t)){const e=n.indexOf(t);n.splice(e,1)}}emit(e,...t){if(this.events.has(e)){const n=this.events.get(e);n&&n.forEach((e=>{e(...t)}))}}}var Ni=function(e,t,n,r){return new(n||(n=Promise))((function(i,o){function a(e){try{s(r.next(e))}catch(e){o(e)}}function l(e){try{s(r.throw(e))}catch(e){o(e)}}function s(e){var t;e.done?i(e.value):(t=e.value,t instanceof n?t:new n((function(e){e(t)}))).then(a,l)}s((r=r.apply(e,t||[])).next())}))};class Ri extends _i{constructor(e,t,n,r=[],i=[]){super(),this.id=e.id,this._username=e.username,this.signaler=t,this.polite=n,this.makingOffer=!1,this._iceServers=r,this.connection=this.createPeerConnection(r);for(const e of i)this.addTrack(e)}set username(e){this._username=e,this.emit("usernamechange",e)}get username(){return this._username}set iceServers(e){this._iceServers=e;try{this.connection.setConfiguration({iceServers:e}),console.log(`[${this.id}] Updated connection configuration: `,this.connection.getConfiguration()),this.restartIce()}catch(e){console.error("Updating ICE servers failed: ",e)}}get iceServers(){return this._iceServers}createPeerConnection(e){const t=new RTCPeerConnection({sdpSemantics:"unified-plan",iceServers:e});return t.ontrack=({track:e,streams:t})=>{console.log(`[${this.id}] ${e.kind} track ${e.id} received`),this.emit("track",e,t)},t.onconnectionstatechange=()=>{console.log(`[${this.id}] Connection state: ${t.connectionState}`),this.emit("connectionstatechange",t.connectionState)},t.oniceconnectionstatechange=()=>{console.log(`[${this.id}] Ice connection state: ${t.iceConnectionState}`),"failed"===t.iceConnectionState&&this.restartIce(),this.emit("iceconnectionstatechange",t.iceConnectionState)},t.onsignalingstatechange=()=>{console.log(`[${this.id}] Signaling state: ${t.signalingState}`),this.emit("signalingstatechange",t.signalingState)},t.onicegatheringstatechange=()=>{console.log(`[${this.id}] Ice gathering state: ${t.iceGatheringState}`),this.emit("icegatheringstatechange",t.iceGatheringState)},t.onnegotiationneeded=()=>Ni(this,void 0,void 0,(function*(){console.log(`[${this.id}] onnegotiationneeded`);try{this.makingOffer=!0;const e=yield t.createOffer();if("stable"!==t.signalingState)return;yield t.setLocalDescription(e);const n=t.localDescription.toJSON();"offer"===n.type?(console.log(`[${this.id}] onnegotiationneeded: send offer`),this.signaler.offer(this.id,n)):"answer"===n.type?(console.log(`[${this.id}] onnegotiationneeded: send answer`),this.signaler.answer(this.id,n)):console.error("onnegotiationneeded: unknown description type")}catch(e){console.error(e)}finally{this.makingOffer=!1}})),t.onicecandidate=({candidate:e})=>{e&&this.signaler.icecandidate(this.id,e.toJSON())},t}connect(){this.connection.addTransceiver("video"),this.connection.addTransceiver("audio")}get connectionState(){return this.connection.connectionState}get iceConnectionState(){return this.connection.iceConnectionState}get iceGatheringState(){return this.connection.iceGatheringState}get signalingState(){return this.connection.signalingState}onOffer(e){return Ni(this,void 0,void 0,(function*(){if("offer"!==e.type)throw new Error("type mismatch");try{if(this.makingOffer||"stable"!==this.connection.signalingState){if(!this.polite)return;yield Promise.all([this.connection.setLocalDescription({type:"rollback"}),this.connection.setRemoteDescription(e)])}else yield this.connection.setRemoteDescription(e);const t=yield this.connection.createAnswer();yield this.connection.setLocalDescription(t);const n=this.connection.localDescription.toJSON();this.signaler.answer(this.id,n)}catch(e){console.error(e)}}))}onAnswer(e){return Ni(this,void 0,void 0,(function*(){try{yield this.connection.setRemoteDescription(e)}catch(e){console.error(e)}}))}onIceCandidate(e){return Ni(this,void 0,void 0,(function*(){try{yield this.connection.addIceCandidate(e)}catch(e){console.error(e)}}))}addTrack(e){this.connection.addTrack(e)}getTracks(){return this.connection.getSenders().map((e=>e.track)).filter((e=>null!==e))}replaceTrack(e,t){return Ni(this,void 0,void 0,(function*(){const n=this.connection.getSenders().find((t=>t.track&&t.track.id===e));if(!n)throw new Error(`Track with id "${e}" does not exist.`);console.log("Replacing track on sender ",n),yield n.replaceTrack(t)}))}removeTrack(e){const t=this.connection.getSenders().find((t=>t.track&&t.track.id===e));if(!t)throw new Error(`Track with id "${e}" does not exist.`);console.log("Removing track"),this.connection.removeTrack(t)}disableRemoteTrack(e){const t=this.connection.getTransceivers().find((t=>t.receiver&&t.receiver.track&&t.receiver.track.id===e));if(!t)throw new Error(`Track with id "${e}" does not exist.`);console.log("Disable remote track"),t.direction="sendonly"}enableRemoteTrack(e){const t=this.connection.getTransceivers().find((t=>t.receiver&&t.receiver.track&&t.receiver.track.id===e));if(!t)throw new Error(`Track with id "${e}" does not exist.`);console.log("Enable remote track"),t.direction="sendrecv"}disableRemoteVideo(){this.connection.getTransceivers().filter((e=>e.receiver&&e.receiver.track&&"video"===e.receiver.track.kind)).forEach((e=>e.direction="sendonly"))}enableRemoteVideo(){this.connection.getTransceivers().filter((e=>e.receiver&&e.receiver.track&&"video"===e.receiver.track.kind)).forEach((e=>e.direction="sendrecv"))}restartIce(){"restartIce"in this.connection&&(this.connection.restartIce(),console.log(`[${this.id}] Restarted ICE`))}shutdown(){null!==this.connection&&(this.connection.getReceivers().forEach((e=>{e.track&&e.track.stop()})),this.connection.close()),this.signaler.bye(this.id),this.emit("shutdown"),console.log("Shutdown connection with peer "+this.id)}}var Mi=function(e,t,n,r){return new(n||(n=Promise))((function(i,o){function a(e){try{s(r.next(e))}catch(e){o(e)}}function l(e){try{s(r.throw(e))}catch(e){o(e)}}function s(e){var t;e.done?i(e.value):(t=e.value,t instanceof n?t:new n((function(e){e(t)}))).then(a,l)}s((r=r.apply(e,t||[])).next())}))};class Di{constructor(e,t){this.manager=e,this.signaler=t,this.messageListeners=[],this.handlers={ping:this.ping,pong:this.pong,text:this.text,"get-room-info":this.getRoomInfo,"room-info":this.roomInfo,"get-ice-servers":this.getIceServers,"ice-servers":this.iceServers,profile:this.profile,offer:this.offer,answer:this.answer,icecandidate:this.iceCandidate,greeting:this.greeting,bye:this.bye}}addMessageListener(e,t){this.messageListeners.push([e,t])}handleMessage(e){return Mi(this,void 0,void 0,(function*(){const t=this.handlers[e.type];t&&t.call(this,e),yield this.handlers[e.type].call(this,e),this.messageListeners.forEach((([t,n])=>{this.match(e,t)&&n(e)}))}))}ping(e){return Mi(this,void 0,void 0,(function*(){if(console.log("<< Received ping: ",e),e.sender){const t=this.emptyMessage();t.receiver=e.sender,t.type="pong",t.data=e.data,this.signaler.send(t)}}))}pong(e){return Mi(this,void 0,void 0,(function*(){console.log("<< Received pong: ",e)}))}text(e){return Mi(this,void 0,void 0,(function*(){console.log("<< Received text: ",e),this.manager.textMessages.push(e.data)}))}getRoomInfo(e){return Mi(this,void 0,void 0,(function*(){console.log("<< Received get-room-info: ",e)}))}roomInfo(e){return Mi(this,void 0,void 0,(function*(){console.log("<< Received room-info: ",e),this.manager.updatePeers(e.data)}))}getIceServers(e){return Mi(this,void 0,void 0,(function*(){console.log("<< Received get-ice-servers: ",e)}))}iceServers(e){return Mi(this,void 0,void 0,(function*(){console.log("<< Received ice-servers: ",e)}))}profile(e){return Mi(this,void 0,void 0,(function*(){console.log("<< Received profile: ",e)}))}offer(e){return Mi(this,void 0,void 0,(function*(){if(e.sender){const t=this.manager.getOrCreateMediaPeer({id:e.sender,username:"Major Tom"});yield t.onOffer(e.data)}}))}answer(e){return Mi(this,void 0,void 0,(function*(){if(e.sender){const t=this.manager.getOrCreateMediaPeer({id:e.sender,username:"Major Tom"});yield t.onAnswer(e.data)}}))}iceCandidate(e){return Mi(this,void 0,void 0,(function*(){if(e.sender){const t=this.manager.getOrCreateMediaPeer({id:e.sender,username:"Major Tom"}),n=new RTCIceCandidate(e.data);yield t.onIceCandidate(n)}}))}greeting(e){return Mi(this,void 0,void 0,(function*(){console.log("<< Received greeting: ",e)}))}bye(e){return Mi(this,void 0,void 0,(function*(){console.log("<< Received bye: ",e),e.sender&&this.manager.removeMediaPeer(e.sender)}))}emptyMessage(){return{sender:"",receiver:"",type:"",data:""}}match(e,t){for(const n in t)if(!(n in e)||e[n]!==t[n])return!1;return!0}}var Li=function(e,t,n,r){return new(n||(n=Promise))((function(i,o){function a(e){try{s(r.next(e))}catch(e){o(e)}}function l(e){try{s(r.throw(e))}catch(e){o(e)}}function s(e){var t;e.done?i(e.value):(t=e.value,t instanceof n?t:new n((function(e){e(t)}))).then(a,l)}s((r=r.apply(e,t||[])).next())}))};class Ii extends _i{constructor(){super(),this.connect=this.connect.bind(this),this.socket=this.connect()}connect(){const e=`${location.protocol.startsWith("https")?"wss":"ws"}://${location.host}${location.pathname}/ws`,t=new WebSocket(e);return t.onopen=()=>{this.emit("open")},t.onclose=()=>{this.emit("close"),setTimeout(this.connect,5e3)},t.onerror=e=>{this.emit("error",e),t.close()},t.onmessage=e=>{this.emit("message",JSON.parse(e.data))},t}get connectionState(){switch(this.socket.readyState){case WebSocket.CONNECTING:return"connecting";case WebSocket.OPEN:return"open";case WebSocket.CLOSING:return"closing";case WebSocket.CLOSED:return"closed";default:return"unknown"}}send(e){this.socket.send(JSON.stringify(e))}sendReceive(e,t){return new Promise((n=>{const r=this;r.on("message",(function e(i){(function(e){for(const n in t)if(!(n in e)||e[n]!==t[n])return!1;return!0})(i)&&(r.removeListener("message",e),n(i))})),this.send(e)}))}ping(){return Li(this,void 0,void 0,(function*(){const e=(new Date).getTime(),t={receiver:"ground control",type:"ping",data:e},n={sender:"ground control",type:"pong",data:e};return yield this.sendReceive(t,n)}))}getRoomInfo(){return Li(this,void 0,void 0,(function*(){return(yield this.sendReceive({receiver:"ground control",type:"get-room-info"},{sender:"ground control",type:"room-info"})).data}))}fetchIceServers(){return Li(this,void 0,void 0,(function*(){return(yield this.sendReceive({receiver:"ground control",type:"get-ice-servers"},{sender:"ground control",type:"ice-servers"})).data}))}text(e,t,n,r){n=n||"room",r=r||(new Date).getTime(),this.send({receiver:n,type:"text",data:{from:t,time:r,text:e}})}profile(e){this.send({receiver:"ground control",type:"profile",data:{username:e}})}offer(e,t){this.send({receiver:e,type:"offer",data:t})}answer(e,t){this.send({receiver:e,type:"answer",data:t})}bye(e){this.send({receiver:e,type:"bye",data:(new Date).getTime()})}icecandidate(e,t){this.send({receiver:e,type:"icecandidate",data:t})}greeting(e,t){e=e||"ground control",t=t||"This is Major Tom to Ground Control: I'm stepping through the door. And the stars look very different today.",this.send({receiver:e,type:"greeting",data:t})}shutdown(){this.socket.readyState===WebSocket.OPEN&&this.bye("ground control"),this.socket.close(1e3,"goodbye"),this.emit("shutdown")}}var Ai=function(e,t,n,r){return new(n||(n=Promise))((function(i,o){function a(e){try{s(r.next(e))}catch(e){o(e)}}function l(e){try{s(r.throw(e))}catch(e){o(e)}}function s(e){var t;e.done?i(e.value):(t=e.value,t instanceof n?t:new n((function(e){e(t)}))).then(a,l)}s((r=r.apply(e,t||[])).next())}))};const Fi=new class extends _i{constructor(){super(),this.username="Major Tom",this.signaler=new Ii,this.mediaPeers=new Map,this.mediaTracks=new Map,this.localVideoStream=new MediaStream,this.textMessages=[],this.messageHandler=new Di(this,this.signaler),this.id="",this._iceServers=[]}setUsername(e){this.username=e,this.signaler.profile(e)}setIceServers(e){this.iceServers=e}set iceServers(e){this._iceServers=e,this.mediaPeers.forEach((t=>{t.iceServers=e}))}get iceServers(){return this._iceServers}addTrack(e,t){if(this.mediaTracks.has(e))throw new Error(`Track with name "${e}" already exists.`);for(const e of this.mediaPeers.values())e.addTrack(t);this.mediaTracks.set(e,t),this.localVideoStream.addTrack(t)}replaceTrack(e,t){return Ai(this,void 0,void 0,(function*(){if(!this.mediaTracks.has(e))throw new Error(`Track with name "${e}" does not exist.`);const n=this.mediaTracks.get(e);for(const e of this.mediaPeers.values())yield e.replaceTrack(n.id,t);this.mediaTracks.set(e,t),this.localVideoStream.removeTrack(n),this.localVideoStream.addTrack(t)}))}setTrack(e,t){return Ai(this,void 0,void 0,(function*(){this.mediaTracks.has(e)?yield this.replaceTrack(e,t):this.addTrack(e,t)}))}removeTrack(e){if(!this.mediaTracks.has(e))throw new Error(`Track with name "${e}" does not exist.`);const t=this.mediaTracks.get(e);for(const e of this.mediaPeers.values())e.removeTrack(t.id);this.mediaTracks.delete(e),this.localVideoStream.removeTrack(t)}stopTrack(e){if(!this.mediaTracks.has(e))throw new Error(`Track with name "${e}" does not exist.`);const t=this.mediaTracks.get(e);t.enabled=!1,t.stop()}createMediaPeer(e){const t=new Ri(e,this.signaler,this.id<e.id,this.iceServers,[...this.mediaTracks.values()]);return this.mediaPeers.set(e.id,t),console.log("Created video peer ",t.id),this.emit("mediapeer",t),t}getOrCreateMediaPeer(e){return this.mediaPeers.get(e.id)||this.createMediaPeer(e)}removeMediaPeer(e){const t=this.mediaPeers.get(e);t&&(t.shutdown(),this.mediaPeers.delete(e),this.emit("mediapeerremoved",t))}findPeers(){return Ai(this,void 0,void 0,(function*(){const e=yield this.signaler.getRoomInfo();this.updatePeers(e)}))}updatePeers(e){const t=e.clients.map((({id:e})=>e));Array.from(this.mediaPeers.keys()).filter((e=>!t.includes(e))).forEach((e=>{this.removeMediaPeer(e)}));for(const t of e.clients)t.id!==this.id&&this.getOrCreateMediaPeer(t);this.mediaPeers.forEach(((t,n)=>{const r=e.clients.find((e=>e.id===n));r&&(t.username=r.username)}))}addMessageListener(e,t){this.messageHandler.addMessageListener(e,t)}shutdownMediaPeers(){this.mediaPeers.forEach((e=>{e.shutdown()})),this.mediaPeers.clear()}getSelfId(){return Ai(this,void 0,void 0,(function*(){return(yield this.signaler.ping()).receiver}))}shutdown(){this.shutdownMediaPeers(),this.signaler.shutdown()}start(){return Ai(this,void 0,void 0,(function*(){for(this.signaler.on("message",(e=>{this.messageHandler.handleMessage(e)}));"open"!=this.signaler.connectionState;)yield new Promise((e=>{setTimeout(e,100)}));this.id=yield this.getSelfId(),this.iceServers=yield this.signaler.fetchIceServers(),yield this.findPeers()}))}},zi=function(e){var t,n=void 0===e?{}:e,r=n.context,i=void 0===r?{}:r,o=n.channel,a=void 0===o?fi():o,l=n.sagaMonitor,s=function(e,t){if(null==e)return{};var n,r,i={},o=Object.keys(e);for(r=0;r<o.length;r++)n=o[r],t.indexOf(n)>=0||(i[n]=e[n]);return i}(n,["context","channel","sagaMonitor"]);function u(e){var n=e.getState,r=e.dispatch;return t=Ti.bind(null,lr({},s,{context:i,channel:a,dispatch:r,getState:n,sagaMonitor:l})),function(e){return function(t){l&&l.actionDispatched&&l.actionDispatched(t);var n=e(t);return a.put(t),n}}}return u.run=function(){return t.apply(void 0,arguments)},u.setContext=function(e){kr(i,e)},u}({context:{manager:Fi}}),Ui=function(e){var t,n=function(e){return function(e){void 0===e&&(e={});var t=e,n=t.thunk,r=void 0===n||n,i=(t.immutableCheck,t.serializableCheck,new at);return r&&(function(e){return"boolean"==typeof e}(r)?i.push(Je):i.push(Je.withExtraArgument(r.extraArgument))),i}(e)},r=e||{},i=r.reducer,o=void 0===i?void 0:i,a=r.middleware,l=void 0===a?n():a,s=r.devTools,u=void 0===s||s,c=r.preloadedState,d=void 0===c?void 0:c,f=r.enhancers,p=void 0===f?void 0:f;if("function"==typeof o)t=o;else{if(!function(e){if("object"!=typeof e||null===e)return!1;for(var t=e;null!==Object.getPrototypeOf(t);)t=Object.getPrototypeOf(t);return Object.getPrototypeOf(e)===t}(o))throw new Error('"reducer" is a required argument, and must be a function or an object of functions that can be passed to combineReducers');t=function(e){for(var t=Object.keys(e),n={},r=0;r<t.length;r++){var i=t[r];"function"==typeof e[i]&&(n[i]=e[i])}var o,a=Object.keys(n);try{!function(e){Object.keys(e).forEach((function(t){var n=e[t];if(void 0===n(void 0,{type:P.INIT}))throw new Error('Reducer "'+t+"\" returned undefined during initialization. If the state passed to the reducer is undefined, you must explicitly return the initial state. The initial state may not be undefined. If you don't want to set a value for this reducer, you can use null instead of undefined.");if(void 0===n(void 0,{type:P.PROBE_UNKNOWN_ACTION()}))throw new Error('Reducer "'+t+"\" returned undefined when probed with a random type. Don't try to handle "+P.INIT+' or other actions in "redux/*" namespace. They are considered private. Instead, you must return the current state for any unknown actions, unless it is undefined, in which case you must return the initial state, regardless of the action type. The initial state may not be undefined, but can be null.')}))}(n)}catch(e){o=e}return function(e,t){if(void 0===e&&(e={}),o)throw o;for(var r=!1,i={},l=0;l<a.length;l++){var s=a[l],u=n[s],c=e[s],d=u(c,t);if(void 0===d){var f=_(s,t);throw new Error(f)}i[s]=d,r=r||d!==c}return(r=r||a.length!==Object.keys(e).length)?i:e}}(o)}var h=I.apply(void 0,"function"==typeof l?l(n):l),v=L;u&&(v=ot(Ze({trace:!1},"object"==typeof u&&u)));var m=[h];return Array.isArray(p)?m=[h].concat(p):"function"==typeof p&&(m=p(m)),T(t,d,v.apply(void 0,m))}({reducer:{devices:vn,users:mt,messages:kt,feeds:$t,iceServers:Gt,connections:Tt},middleware:[zi]});var $i=function(e){return{done:!0,value:e}},Vi={};function Bi(e){return mr(e)?"channel":gr(e)?String(e):cr(e)?e.name:String(e)}function Wi(e,t,n){var r,i,o,a=t;function l(t,n){if(a===Vi)return $i(t);if(n&&!i)throw a=Vi,n;r&&r(t);var l=n?e[i](n):e[a]();return a=l.nextState,o=l.effect,r=l.stateUpdater,i=l.errorState,a===Vi?$i(t):o}return Or(l,(function(e){return l(null,e)}),n)}function qi(e,t){for(var n=arguments.length,r=new Array(n>2?n-2:0),i=2;i<n;i++)r[i-2]=arguments[i];var o,a={done:!1,value:$r(e)},l=function(e){return{done:!1,value:qr.apply(void 0,[t].concat(r,[e]))}},s=function(e){return o=e};return Wi({q1:function(){return{nextState:"q2",effect:a,stateUpdater:s}},q2:function(){return{nextState:"q1",effect:l(o)}}},"q1","takeEvery("+Bi(e)+", "+t.name+")")}function Hi(e,t){for(var n=arguments.length,r=new Array(n>2?n-2:0),i=2;i<n;i++)r[i-2]=arguments[i];var o,a,l={done:!1,value:$r(e)},s=function(e){return{done:!1,value:qr.apply(void 0,[t].concat(r,[e]))}},u=function(e){return{done:!1,value:Hr(e)}},c=function(e){return o=e},d=function(e){return a=e};return Wi({q1:function(){return{nextState:"q2",effect:l,stateUpdater:d}},q2:function(){return o?{nextState:"q3",effect:u(o)}:{nextState:"q1",effect:s(a),stateUpdater:c}},q3:function(){return{nextState:"q1",effect:s(a),stateUpdater:c}}},"q1","takeLatest("+Bi(e)+", "+t.name+")")}function Qi(e,t){for(var n=arguments.length,r=new Array(n>2?n-2:0),i=2;i<n;i++)r[i-2]=arguments[i];return qr.apply(void 0,[qi,e,t].concat(r))}function Ki(e,t){for(var n=arguments.length,r=new Array(n>2?n-2:0),i=2;i<n;i++)r[i-2]=arguments[i];return qr.apply(void 0,[Hi,e,t].concat(r))}function*Gi({payload:e}){const t=yield Kr("manager"),n=e;try{yield Wr(t,t.setUsername,[n]),yield Vr({type:"MANAGER_UPDATED"})}catch(e){yield Vr({type:"MANAGER_ERROR",payload:e})}}function*Yi({payload:e}){const t=yield Kr("manager"),n=e,r=t.username;try{yield Wr(t.signaler,t.signaler.text,[n,r]),yield Vr({type:"MANAGER_UPDATED"})}catch(e){yield Vr({type:"MANAGER_ERROR",payload:e})}}function*Xi({payload:e}){const t=yield Kr("manager"),n=e;try{n?yield Wr(t,t.setTrack,["audio",n]):yield Wr(t,t.stopTrack,["audio"]),yield Vr({type:"MANAGER_UPDATED"})}catch(e){yield Vr({type:"MANAGER_ERROR",payload:e})}}function*Ji({payload:e}){const t=yield Kr("manager"),n=e;try{n?yield Wr(t,t.setTrack,["video",n]):yield Wr(t,t.stopTrack,["video"]),yield Vr({type:"MANAGER_UPDATED"})}catch(e){yield Vr({type:"MANAGER_ERROR",payload:e})}}function*Zi({payload:e}){const t=e;try{const e=yield Qr((e=>e.feeds.find((e=>"local"===e.id))));if(e.videoStream){const n=e.videoStream.getVideoTracks()[0],r={height:{ideal:t},width:{ideal:4*t/3}};yield Wr(n,n.applyConstraints,[r])}yield Vr({type:"RESOLUTION_UPDATED"})}catch(e){console.error(e),yield Vr({type:"ERROR",payload:e})}}function*eo({payload:e}){const t=yield Kr("manager"),n=e;try{const e=t.mediaPeers.get(n);yield Wr(e,e.disableRemoteVideo,[]),yield Vr({type:"PEER_UPDATED"})}catch(e){yield Vr({type:"PEER_ERROR",payload:e})}}function*to({payload:e}){const t=yield Kr("manager"),n=e;try{const e=t.mediaPeers.get(n);yield Wr(e,e.enableRemoteVideo,[]),yield Vr({type:"PEER_UPDATED"})}catch(e){yield Vr({type:"PEER_ERROR",payload:e})}}function*no(){const e=yield Kr("manager"),t=(yield Qr((e=>e.iceServers))).filter((e=>e.enabled)).map((e=>({urls:e.urls,username:e.username,credential:e.credential})));try{yield Wr(e,e.setIceServers,[t]),yield Vr({type:"MANAGER_UPDATED"})}catch(e){console.log(e),yield Vr({type:"MANAGER_ERROR",payload:e})}}window.addEventListener("unhandledrejection",(e=>{console.log("An unhandled error occurred"),console.log(e.promise),console.log(e.reason)})),zi.run((function*(){yield Ki(vt.type,Gi),yield Qi(St.type,Yi),yield Ki(At.type,Xi),yield Ki(Ft.type,Ji),yield Ki(hn.type,Zi),yield Ki(zt.type,eo),yield Ki(Ut.type,to),yield Qi(Ht.type,no),yield Qi(Qt.type,no),yield Qi(Kt.type,no)})),r.render((0,e.jsx)(t.StrictMode,{children:(0,e.jsx)((function(e){var n=e.store,r=e.context,o=e.children,a=(0,t.useMemo)((function(){var e=new s(n);return e.onStateChange=e.notifyNestedSubs,{store:n,subscription:e}}),[n]),l=(0,t.useMemo)((function(){return n.getState()}),[n]);(0,t.useEffect)((function(){var e=a.subscription;return e.trySubscribe(),l!==n.getState()&&e.notifyNestedSubs(),function(){e.tryUnsubscribe(),e.onStateChange=null}}),[a,l]);var u=r||i;return t.createElement(u.Provider,{value:a},o)}),Object.assign({store:Ui},{children:(0,e.jsx)(Kn,{manager:Fi},void 0)}),void 0)},void 0),document.getElementById("react-root"))})()})();
\ No newline at end of file
+(()=>{var e={679:(e,t,n)=>{"use strict";var r=n(864),i={childContextTypes:!0,contextType:!0,contextTypes:!0,defaultProps:!0,displayName:!0,getDefaultProps:!0,getDerivedStateFromError:!0,getDerivedStateFromProps:!0,mixins:!0,propTypes:!0,type:!0},o={name:!0,length:!0,prototype:!0,caller:!0,callee:!0,arguments:!0,arity:!0},a={$$typeof:!0,compare:!0,defaultProps:!0,displayName:!0,propTypes:!0,type:!0},l={};function s(e){return r.isMemo(e)?a:l[e.$$typeof]||i}l[r.ForwardRef]={$$typeof:!0,render:!0,defaultProps:!0,displayName:!0,propTypes:!0},l[r.Memo]=a;var u=Object.defineProperty,c=Object.getOwnPropertyNames,d=Object.getOwnPropertySymbols,f=Object.getOwnPropertyDescriptor,p=Object.getPrototypeOf,h=Object.prototype;e.exports=function e(t,n,r){if("string"!=typeof n){if(h){var i=p(n);i&&i!==h&&e(t,i,r)}var a=c(n);d&&(a=a.concat(d(n)));for(var l=s(t),v=s(n),m=0;m<a.length;++m){var g=a[m];if(!(o[g]||r&&r[g]||v&&v[g]||l&&l[g])){var y=f(n,g);try{u(t,g,y)}catch(e){}}}}return t}},418:e=>{"use strict";var t=Object.getOwnPropertySymbols,n=Object.prototype.hasOwnProperty,r=Object.prototype.propertyIsEnumerable;function i(e){if(null==e)throw new TypeError("Object.assign cannot be called with null or undefined");return Object(e)}e.exports=function(){try{if(!Object.assign)return!1;var e=new String("abc");if(e[5]="de","5"===Object.getOwnPropertyNames(e)[0])return!1;for(var t={},n=0;n<10;n++)t["_"+String.fromCharCode(n)]=n;if("0123456789"!==Object.getOwnPropertyNames(t).map((function(e){return t[e]})).join(""))return!1;var r={};return"abcdefghijklmnopqrst".split("").forEach((function(e){r[e]=e})),"abcdefghijklmnopqrst"===Object.keys(Object.assign({},r)).join("")}catch(e){return!1}}()?Object.assign:function(e,o){for(var a,l,s=i(e),u=1;u<arguments.length;u++){for(var c in a=Object(arguments[u]))n.call(a,c)&&(s[c]=a[c]);if(t){l=t(a);for(var d=0;d<l.length;d++)r.call(a,l[d])&&(s[l[d]]=a[l[d]])}}return s}},703:(e,t,n)=>{"use strict";var r=n(414);function i(){}function o(){}o.resetWarningCache=i,e.exports=function(){function e(e,t,n,i,o,a){if(a!==r){var l=new Error("Calling PropTypes validators directly is not supported by the `prop-types` package. Use PropTypes.checkPropTypes() to call them. Read more at http://fb.me/use-check-prop-types");throw l.name="Invariant Violation",l}}function t(){return e}e.isRequired=e;var n={array:e,bool:e,func:e,number:e,object:e,string:e,symbol:e,any:e,arrayOf:t,element:e,elementType:e,instanceOf:t,node:e,objectOf:t,oneOf:t,oneOfType:t,shape:t,exact:t,checkPropTypes:o,resetWarningCache:i};return n.PropTypes=n,n}},697:(e,t,n)=>{e.exports=n(703)()},414:e=>{"use strict";e.exports="SECRET_DO_NOT_PASS_THIS_OR_YOU_WILL_BE_FIRED"},448:(e,t,n)=>{"use strict";var r=n(294),i=n(418),o=n(840);function a(e){for(var t="https://reactjs.org/docs/error-decoder.html?invariant="+e,n=1;n<arguments.length;n++)t+="&args[]="+encodeURIComponent(arguments[n]);return"Minified React error #"+e+"; visit "+t+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}if(!r)throw Error(a(227));var l=new Set,s={};function u(e,t){c(e,t),c(e+"Capture",t)}function c(e,t){for(s[e]=t,e=0;e<t.length;e++)l.add(t[e])}var d=!("undefined"==typeof window||void 0===window.document||void 0===window.document.createElement),f=/^[:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$/,p=Object.prototype.hasOwnProperty,h={},v={};function m(e,t,n,r,i,o,a){this.acceptsBooleans=2===t||3===t||4===t,this.attributeName=r,this.attributeNamespace=i,this.mustUseProperty=n,this.propertyName=e,this.type=t,this.sanitizeURL=o,this.removeEmptyString=a}var g={};"children dangerouslySetInnerHTML defaultValue defaultChecked innerHTML suppressContentEditableWarning suppressHydrationWarning style".split(" ").forEach((function(e){g[e]=new m(e,0,!1,e,null,!1,!1)})),[["acceptCharset","accept-charset"],["className","class"],["htmlFor","for"],["httpEquiv","http-equiv"]].forEach((function(e){var t=e[0];g[t]=new m(t,1,!1,e[1],null,!1,!1)})),["contentEditable","draggable","spellCheck","value"].forEach((function(e){g[e]=new m(e,2,!1,e.toLowerCase(),null,!1,!1)})),["autoReverse","externalResourcesRequired","focusable","preserveAlpha"].forEach((function(e){g[e]=new m(e,2,!1,e,null,!1,!1)})),"allowFullScreen async autoFocus autoPlay controls default defer disabled disablePictureInPicture disableRemotePlayback formNoValidate hidden loop noModule noValidate open playsInline readOnly required reversed scoped seamless itemScope".split(" ").forEach((function(e){g[e]=new m(e,3,!1,e.toLowerCase(),null,!1,!1)})),["checked","multiple","muted","selected"].forEach((function(e){g[e]=new m(e,3,!0,e,null,!1,!1)})),["capture","download"].forEach((function(e){g[e]=new m(e,4,!1,e,null,!1,!1)})),["cols","rows","size","span"].forEach((function(e){g[e]=new m(e,6,!1,e,null,!1,!1)})),["rowSpan","start"].forEach((function(e){g[e]=new m(e,5,!1,e.toLowerCase(),null,!1,!1)}));var y=/[\-:]([a-z])/g;function b(e){return e[1].toUpperCase()}function w(e,t,n,r){var i=g.hasOwnProperty(t)?g[t]:null;(null!==i?0===i.type:!r&&2<t.length&&("o"===t[0]||"O"===t[0])&&("n"===t[1]||"N"===t[1]))||(function(e,t,n,r){if(null==t||function(e,t,n,r){if(null!==n&&0===n.type)return!1;switch(typeof t){case"function":case"symbol":return!0;case"boolean":return!r&&(null!==n?!n.acceptsBooleans:"data-"!==(e=e.toLowerCase().slice(0,5))&&"aria-"!==e);default:return!1}}(e,t,n,r))return!0;if(r)return!1;if(null!==n)switch(n.type){case 3:return!t;case 4:return!1===t;case 5:return isNaN(t);case 6:return isNaN(t)||1>t}return!1}(t,n,i,r)&&(n=null),r||null===i?function(e){return!!p.call(v,e)||!p.call(h,e)&&(f.test(e)?v[e]=!0:(h[e]=!0,!1))}(t)&&(null===n?e.removeAttribute(t):e.setAttribute(t,""+n)):i.mustUseProperty?e[i.propertyName]=null===n?3!==i.type&&"":n:(t=i.attributeName,r=i.attributeNamespace,null===n?e.removeAttribute(t):(n=3===(i=i.type)||4===i&&!0===n?"":""+n,r?e.setAttributeNS(r,t,n):e.setAttribute(t,n))))}"accent-height alignment-baseline arabic-form baseline-shift cap-height clip-path clip-rule color-interpolation color-interpolation-filters color-profile color-rendering dominant-baseline enable-background fill-opacity fill-rule flood-color flood-opacity font-family font-size font-size-adjust font-stretch font-style font-variant font-weight glyph-name glyph-orientation-horizontal glyph-orientation-vertical horiz-adv-x horiz-origin-x image-rendering letter-spacing lighting-color marker-end marker-mid marker-start overline-position overline-thickness paint-order panose-1 pointer-events rendering-intent shape-rendering stop-color stop-opacity strikethrough-position strikethrough-thickness stroke-dasharray stroke-dashoffset stroke-linecap stroke-linejoin stroke-miterlimit stroke-opacity stroke-width text-anchor text-decoration text-rendering underline-position underline-thickness unicode-bidi unicode-range units-per-em v-alphabetic v-hanging v-ideographic v-mathematical vector-effect vert-adv-y vert-origin-x vert-origin-y word-spacing writing-mode xmlns:xlink x-height".split(" ").forEach((function(e){var t=e.replace(y,b);g[t]=new m(t,1,!1,e,null,!1,!1)})),"xlink:actuate xlink:arcrole xlink:role xlink:show xlink:title xlink:type".split(" ").forEach((function(e){var t=e.replace(y,b);g[t]=new m(t,1,!1,e,"http://www.w3.org/1999/xlink",!1,!1)})),["xml:base","xml:lang","xml:space"].forEach((function(e){var t=e.replace(y,b);g[t]=new m(t,1,!1,e,"http://www.w3.org/XML/1998/namespace",!1,!1)})),["tabIndex","crossOrigin"].forEach((function(e){g[e]=new m(e,1,!1,e.toLowerCase(),null,!1,!1)})),g.xlinkHref=new m("xlinkHref",1,!1,"xlink:href","http://www.w3.org/1999/xlink",!0,!1),["src","href","action","formAction"].forEach((function(e){g[e]=new m(e,1,!1,e.toLowerCase(),null,!0,!0)}));var S=r.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED,k=60103,x=60106,E=60107,C=60108,O=60114,P=60109,j=60110,T=60112,_=60113,N=60120,R=60115,M=60116,D=60121,L=60128,I=60129,A=60130,F=60131;if("function"==typeof Symbol&&Symbol.for){var z=Symbol.for;k=z("react.element"),x=z("react.portal"),E=z("react.fragment"),C=z("react.strict_mode"),O=z("react.profiler"),P=z("react.provider"),j=z("react.context"),T=z("react.forward_ref"),_=z("react.suspense"),N=z("react.suspense_list"),R=z("react.memo"),M=z("react.lazy"),D=z("react.block"),z("react.scope"),L=z("react.opaque.id"),I=z("react.debug_trace_mode"),A=z("react.offscreen"),F=z("react.legacy_hidden")}var U,$="function"==typeof Symbol&&Symbol.iterator;function V(e){return null===e||"object"!=typeof e?null:"function"==typeof(e=$&&e[$]||e["@@iterator"])?e:null}function B(e){if(void 0===U)try{throw Error()}catch(e){var t=e.stack.trim().match(/\n( *(at )?)/);U=t&&t[1]||""}return"\n"+U+e}var W=!1;function q(e,t){if(!e||W)return"";W=!0;var n=Error.prepareStackTrace;Error.prepareStackTrace=void 0;try{if(t)if(t=function(){throw Error()},Object.defineProperty(t.prototype,"props",{set:function(){throw Error()}}),"object"==typeof Reflect&&Reflect.construct){try{Reflect.construct(t,[])}catch(e){var r=e}Reflect.construct(e,[],t)}else{try{t.call()}catch(e){r=e}e.call(t.prototype)}else{try{throw Error()}catch(e){r=e}e()}}catch(e){if(e&&r&&"string"==typeof e.stack){for(var i=e.stack.split("\n"),o=r.stack.split("\n"),a=i.length-1,l=o.length-1;1<=a&&0<=l&&i[a]!==o[l];)l--;for(;1<=a&&0<=l;a--,l--)if(i[a]!==o[l]){if(1!==a||1!==l)do{if(a--,0>--l||i[a]!==o[l])return"\n"+i[a].replace(" at new "," at ")}while(1<=a&&0<=l);break}}}finally{W=!1,Error.prepareStackTrace=n}return(e=e?e.displayName||e.name:"")?B(e):""}function H(e){switch(e.tag){case 5:return B(e.type);case 16:return B("Lazy");case 13:return B("Suspense");case 19:return B("SuspenseList");case 0:case 2:case 15:return q(e.type,!1);case 11:return q(e.type.render,!1);case 22:return q(e.type._render,!1);case 1:return q(e.type,!0);default:return""}}function Q(e){if(null==e)return null;if("function"==typeof e)return e.displayName||e.name||null;if("string"==typeof e)return e;switch(e){case E:return"Fragment";case x:return"Portal";case O:return"Profiler";case C:return"StrictMode";case _:return"Suspense";case N:return"SuspenseList"}if("object"==typeof e)switch(e.$$typeof){case j:return(e.displayName||"Context")+".Consumer";case P:return(e._context.displayName||"Context")+".Provider";case T:var t=e.render;return t=t.displayName||t.name||"",e.displayName||(""!==t?"ForwardRef("+t+")":"ForwardRef");case R:return Q(e.type);case D:return Q(e._render);case M:t=e._payload,e=e._init;try{return Q(e(t))}catch(e){}}return null}function K(e){switch(typeof e){case"boolean":case"number":case"object":case"string":case"undefined":return e;default:return""}}function G(e){var t=e.type;return(e=e.nodeName)&&"input"===e.toLowerCase()&&("checkbox"===t||"radio"===t)}function Y(e){e._valueTracker||(e._valueTracker=function(e){var t=G(e)?"checked":"value",n=Object.getOwnPropertyDescriptor(e.constructor.prototype,t),r=""+e[t];if(!e.hasOwnProperty(t)&&void 0!==n&&"function"==typeof n.get&&"function"==typeof n.set){var i=n.get,o=n.set;return Object.defineProperty(e,t,{configurable:!0,get:function(){return i.call(this)},set:function(e){r=""+e,o.call(this,e)}}),Object.defineProperty(e,t,{enumerable:n.enumerable}),{getValue:function(){return r},setValue:function(e){r=""+e},stopTracking:function(){e._valueTracker=null,delete e[t]}}}}(e))}function X(e){if(!e)return!1;var t=e._valueTracker;if(!t)return!0;var n=t.getValue(),r="";return e&&(r=G(e)?e.checked?"true":"false":e.value),(e=r)!==n&&(t.setValue(e),!0)}function J(e){if(void 0===(e=e||("undefined"!=typeof document?document:void 0)))return null;try{return e.activeElement||e.body}catch(t){return e.body}}function Z(e,t){var n=t.checked;return i({},t,{defaultChecked:void 0,defaultValue:void 0,value:void 0,checked:null!=n?n:e._wrapperState.initialChecked})}function ee(e,t){var n=null==t.defaultValue?"":t.defaultValue,r=null!=t.checked?t.checked:t.defaultChecked;n=K(null!=t.value?t.value:n),e._wrapperState={initialChecked:r,initialValue:n,controlled:"checkbox"===t.type||"radio"===t.type?null!=t.checked:null!=t.value}}function te(e,t){null!=(t=t.checked)&&w(e,"checked",t,!1)}function ne(e,t){te(e,t);var n=K(t.value),r=t.type;if(null!=n)"number"===r?(0===n&&""===e.value||e.value!=n)&&(e.value=""+n):e.value!==""+n&&(e.value=""+n);else if("submit"===r||"reset"===r)return void e.removeAttribute("value");t.hasOwnProperty("value")?ie(e,t.type,n):t.hasOwnProperty("defaultValue")&&ie(e,t.type,K(t.defaultValue)),null==t.checked&&null!=t.defaultChecked&&(e.defaultChecked=!!t.defaultChecked)}function re(e,t,n){if(t.hasOwnProperty("value")||t.hasOwnProperty("defaultValue")){var r=t.type;if(!("submit"!==r&&"reset"!==r||void 0!==t.value&&null!==t.value))return;t=""+e._wrapperState.initialValue,n||t===e.value||(e.value=t),e.defaultValue=t}""!==(n=e.name)&&(e.name=""),e.defaultChecked=!!e._wrapperState.initialChecked,""!==n&&(e.name=n)}function ie(e,t,n){"number"===t&&J(e.ownerDocument)===e||(null==n?e.defaultValue=""+e._wrapperState.initialValue:e.defaultValue!==""+n&&(e.defaultValue=""+n))}function oe(e,t){return e=i({children:void 0},t),(t=function(e){var t="";return r.Children.forEach(e,(function(e){null!=e&&(t+=e)})),t}(t.children))&&(e.children=t),e}function ae(e,t,n,r){if(e=e.options,t){t={};for(var i=0;i<n.length;i++)t["$"+n[i]]=!0;for(n=0;n<e.length;n++)i=t.hasOwnProperty("$"+e[n].value),e[n].selected!==i&&(e[n].selected=i),i&&r&&(e[n].defaultSelected=!0)}else{for(n=""+K(n),t=null,i=0;i<e.length;i++){if(e[i].value===n)return e[i].selected=!0,void(r&&(e[i].defaultSelected=!0));null!==t||e[i].disabled||(t=e[i])}null!==t&&(t.selected=!0)}}function le(e,t){if(null!=t.dangerouslySetInnerHTML)throw Error(a(91));return i({},t,{value:void 0,defaultValue:void 0,children:""+e._wrapperState.initialValue})}function se(e,t){var n=t.value;if(null==n){if(n=t.children,t=t.defaultValue,null!=n){if(null!=t)throw Error(a(92));if(Array.isArray(n)){if(!(1>=n.length))throw Error(a(93));n=n[0]}t=n}null==t&&(t=""),n=t}e._wrapperState={initialValue:K(n)}}function ue(e,t){var n=K(t.value),r=K(t.defaultValue);null!=n&&((n=""+n)!==e.value&&(e.value=n),null==t.defaultValue&&e.defaultValue!==n&&(e.defaultValue=n)),null!=r&&(e.defaultValue=""+r)}function ce(e){var t=e.textContent;t===e._wrapperState.initialValue&&""!==t&&null!==t&&(e.value=t)}var de="http://www.w3.org/1999/xhtml";function fe(e){switch(e){case"svg":return"http://www.w3.org/2000/svg";case"math":return"http://www.w3.org/1998/Math/MathML";default:return"http://www.w3.org/1999/xhtml"}}function pe(e,t){return null==e||"http://www.w3.org/1999/xhtml"===e?fe(t):"http://www.w3.org/2000/svg"===e&&"foreignObject"===t?"http://www.w3.org/1999/xhtml":e}var he,ve,me=(ve=function(e,t){if("http://www.w3.org/2000/svg"!==e.namespaceURI||"innerHTML"in e)e.innerHTML=t;else{for((he=he||document.createElement("div")).innerHTML="<svg>"+t.valueOf().toString()+"</svg>",t=he.firstChild;e.firstChild;)e.removeChild(e.firstChild);for(;t.firstChild;)e.appendChild(t.firstChild)}},"undefined"!=typeof MSApp&&MSApp.execUnsafeLocalFunction?function(e,t,n,r){MSApp.execUnsafeLocalFunction((function(){return ve(e,t)}))}:ve);function ge(e,t){if(t){var n=e.firstChild;if(n&&n===e.lastChild&&3===n.nodeType)return void(n.nodeValue=t)}e.textContent=t}var ye={animationIterationCount:!0,borderImageOutset:!0,borderImageSlice:!0,borderImageWidth:!0,boxFlex:!0,boxFlexGroup:!0,boxOrdinalGroup:!0,columnCount:!0,columns:!0,flex:!0,flexGrow:!0,flexPositive:!0,flexShrink:!0,flexNegative:!0,flexOrder:!0,gridArea:!0,gridRow:!0,gridRowEnd:!0,gridRowSpan:!0,gridRowStart:!0,gridColumn:!0,gridColumnEnd:!0,gridColumnSpan:!0,gridColumnStart:!0,fontWeight:!0,lineClamp:!0,lineHeight:!0,opacity:!0,order:!0,orphans:!0,tabSize:!0,widows:!0,zIndex:!0,zoom:!0,fillOpacity:!0,floodOpacity:!0,stopOpacity:!0,strokeDasharray:!0,strokeDashoffset:!0,strokeMiterlimit:!0,strokeOpacity:!0,strokeWidth:!0},be=["Webkit","ms","Moz","O"];function we(e,t,n){return null==t||"boolean"==typeof t||""===t?"":n||"number"!=typeof t||0===t||ye.hasOwnProperty(e)&&ye[e]?(""+t).trim():t+"px"}function Se(e,t){for(var n in e=e.style,t)if(t.hasOwnProperty(n)){var r=0===n.indexOf("--"),i=we(n,t[n],r);"float"===n&&(n="cssFloat"),r?e.setProperty(n,i):e[n]=i}}Object.keys(ye).forEach((function(e){be.forEach((function(t){t=t+e.charAt(0).toUpperCase()+e.substring(1),ye[t]=ye[e]}))}));var ke=i({menuitem:!0},{area:!0,base:!0,br:!0,col:!0,embed:!0,hr:!0,img:!0,input:!0,keygen:!0,link:!0,meta:!0,param:!0,source:!0,track:!0,wbr:!0});function xe(e,t){if(t){if(ke[e]&&(null!=t.children||null!=t.dangerouslySetInnerHTML))throw Error(a(137,e));if(null!=t.dangerouslySetInnerHTML){if(null!=t.children)throw Error(a(60));if("object"!=typeof t.dangerouslySetInnerHTML||!("__html"in t.dangerouslySetInnerHTML))throw Error(a(61))}if(null!=t.style&&"object"!=typeof t.style)throw Error(a(62))}}function Ee(e,t){if(-1===e.indexOf("-"))return"string"==typeof t.is;switch(e){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}function Ce(e){return(e=e.target||e.srcElement||window).correspondingUseElement&&(e=e.correspondingUseElement),3===e.nodeType?e.parentNode:e}var Oe=null,Pe=null,je=null;function Te(e){if(e=Zr(e)){if("function"!=typeof Oe)throw Error(a(280));var t=e.stateNode;t&&(t=ti(t),Oe(e.stateNode,e.type,t))}}function _e(e){Pe?je?je.push(e):je=[e]:Pe=e}function Ne(){if(Pe){var e=Pe,t=je;if(je=Pe=null,Te(e),t)for(e=0;e<t.length;e++)Te(t[e])}}function Re(e,t){return e(t)}function Me(e,t,n,r,i){return e(t,n,r,i)}function De(){}var Le=Re,Ie=!1,Ae=!1;function Fe(){null===Pe&&null===je||(De(),Ne())}function ze(e,t){var n=e.stateNode;if(null===n)return null;var r=ti(n);if(null===r)return null;n=r[t];e:switch(t){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(r=!r.disabled)||(r=!("button"===(e=e.type)||"input"===e||"select"===e||"textarea"===e)),e=!r;break e;default:e=!1}if(e)return null;if(n&&"function"!=typeof n)throw Error(a(231,t,typeof n));return n}var Ue=!1;if(d)try{var $e={};Object.defineProperty($e,"passive",{get:function(){Ue=!0}}),window.addEventListener("test",$e,$e),window.removeEventListener("test",$e,$e)}catch(ve){Ue=!1}function Ve(e,t,n,r,i,o,a,l,s){var u=Array.prototype.slice.call(arguments,3);try{t.apply(n,u)}catch(e){this.onError(e)}}var Be=!1,We=null,qe=!1,He=null,Qe={onError:function(e){Be=!0,We=e}};function Ke(e,t,n,r,i,o,a,l,s){Be=!1,We=null,Ve.apply(Qe,arguments)}function Ge(e){var t=e,n=e;if(e.alternate)for(;t.return;)t=t.return;else{e=t;do{0!=(1026&(t=e).flags)&&(n=t.return),e=t.return}while(e)}return 3===t.tag?n:null}function Ye(e){if(13===e.tag){var t=e.memoizedState;if(null===t&&null!==(e=e.alternate)&&(t=e.memoizedState),null!==t)return t.dehydrated}return null}function Xe(e){if(Ge(e)!==e)throw Error(a(188))}function Je(e){if(!(e=function(e){var t=e.alternate;if(!t){if(null===(t=Ge(e)))throw Error(a(188));return t!==e?null:e}for(var n=e,r=t;;){var i=n.return;if(null===i)break;var o=i.alternate;if(null===o){if(null!==(r=i.return)){n=r;continue}break}if(i.child===o.child){for(o=i.child;o;){if(o===n)return Xe(i),e;if(o===r)return Xe(i),t;o=o.sibling}throw Error(a(188))}if(n.return!==r.return)n=i,r=o;else{for(var l=!1,s=i.child;s;){if(s===n){l=!0,n=i,r=o;break}if(s===r){l=!0,r=i,n=o;break}s=s.sibling}if(!l){for(s=o.child;s;){if(s===n){l=!0,n=o,r=i;break}if(s===r){l=!0,r=o,n=i;break}s=s.sibling}if(!l)throw Error(a(189))}}if(n.alternate!==r)throw Error(a(190))}if(3!==n.tag)throw Error(a(188));return n.stateNode.current===n?e:t}(e)))return null;for(var t=e;;){if(5===t.tag||6===t.tag)return t;if(t.child)t.child.return=t,t=t.child;else{if(t===e)break;for(;!t.sibling;){if(!t.return||t.return===e)return null;t=t.return}t.sibling.return=t.return,t=t.sibling}}return null}function Ze(e,t){for(var n=e.alternate;null!==t;){if(t===e||t===n)return!0;t=t.return}return!1}var et,tt,nt,rt,it=!1,ot=[],at=null,lt=null,st=null,ut=new Map,ct=new Map,dt=[],ft="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset submit".split(" ");function pt(e,t,n,r,i){return{blockedOn:e,domEventName:t,eventSystemFlags:16|n,nativeEvent:i,targetContainers:[r]}}function ht(e,t){switch(e){case"focusin":case"focusout":at=null;break;case"dragenter":case"dragleave":lt=null;break;case"mouseover":case"mouseout":st=null;break;case"pointerover":case"pointerout":ut.delete(t.pointerId);break;case"gotpointercapture":case"lostpointercapture":ct.delete(t.pointerId)}}function vt(e,t,n,r,i,o){return null===e||e.nativeEvent!==o?(e=pt(t,n,r,i,o),null!==t&&null!==(t=Zr(t))&&tt(t),e):(e.eventSystemFlags|=r,t=e.targetContainers,null!==i&&-1===t.indexOf(i)&&t.push(i),e)}function mt(e){var t=Jr(e.target);if(null!==t){var n=Ge(t);if(null!==n)if(13===(t=n.tag)){if(null!==(t=Ye(n)))return e.blockedOn=t,void rt(e.lanePriority,(function(){o.unstable_runWithPriority(e.priority,(function(){nt(n)}))}))}else if(3===t&&n.stateNode.hydrate)return void(e.blockedOn=3===n.tag?n.stateNode.containerInfo:null)}e.blockedOn=null}function gt(e){if(null!==e.blockedOn)return!1;for(var t=e.targetContainers;0<t.length;){var n=Jt(e.domEventName,e.eventSystemFlags,t[0],e.nativeEvent);if(null!==n)return null!==(t=Zr(n))&&tt(t),e.blockedOn=n,!1;t.shift()}return!0}function yt(e,t,n){gt(e)&&n.delete(t)}function bt(){for(it=!1;0<ot.length;){var e=ot[0];if(null!==e.blockedOn){null!==(e=Zr(e.blockedOn))&&et(e);break}for(var t=e.targetContainers;0<t.length;){var n=Jt(e.domEventName,e.eventSystemFlags,t[0],e.nativeEvent);if(null!==n){e.blockedOn=n;break}t.shift()}null===e.blockedOn&&ot.shift()}null!==at&&gt(at)&&(at=null),null!==lt&&gt(lt)&&(lt=null),null!==st&&gt(st)&&(st=null),ut.forEach(yt),ct.forEach(yt)}function wt(e,t){e.blockedOn===t&&(e.blockedOn=null,it||(it=!0,o.unstable_scheduleCallback(o.unstable_NormalPriority,bt)))}function St(e){function t(t){return wt(t,e)}if(0<ot.length){wt(ot[0],e);for(var n=1;n<ot.length;n++){var r=ot[n];r.blockedOn===e&&(r.blockedOn=null)}}for(null!==at&&wt(at,e),null!==lt&&wt(lt,e),null!==st&&wt(st,e),ut.forEach(t),ct.forEach(t),n=0;n<dt.length;n++)(r=dt[n]).blockedOn===e&&(r.blockedOn=null);for(;0<dt.length&&null===(n=dt[0]).blockedOn;)mt(n),null===n.blockedOn&&dt.shift()}function kt(e,t){var n={};return n[e.toLowerCase()]=t.toLowerCase(),n["Webkit"+e]="webkit"+t,n["Moz"+e]="moz"+t,n}var xt={animationend:kt("Animation","AnimationEnd"),animationiteration:kt("Animation","AnimationIteration"),animationstart:kt("Animation","AnimationStart"),transitionend:kt("Transition","TransitionEnd")},Et={},Ct={};function Ot(e){if(Et[e])return Et[e];if(!xt[e])return e;var t,n=xt[e];for(t in n)if(n.hasOwnProperty(t)&&t in Ct)return Et[e]=n[t];return e}d&&(Ct=document.createElement("div").style,"AnimationEvent"in window||(delete xt.animationend.animation,delete xt.animationiteration.animation,delete xt.animationstart.animation),"TransitionEvent"in window||delete xt.transitionend.transition);var Pt=Ot("animationend"),jt=Ot("animationiteration"),Tt=Ot("animationstart"),_t=Ot("transitionend"),Nt=new Map,Rt=new Map,Mt=["abort","abort",Pt,"animationEnd",jt,"animationIteration",Tt,"animationStart","canplay","canPlay","canplaythrough","canPlayThrough","durationchange","durationChange","emptied","emptied","encrypted","encrypted","ended","ended","error","error","gotpointercapture","gotPointerCapture","load","load","loadeddata","loadedData","loadedmetadata","loadedMetadata","loadstart","loadStart","lostpointercapture","lostPointerCapture","playing","playing","progress","progress","seeking","seeking","stalled","stalled","suspend","suspend","timeupdate","timeUpdate",_t,"transitionEnd","waiting","waiting"];function Dt(e,t){for(var n=0;n<e.length;n+=2){var r=e[n],i=e[n+1];i="on"+(i[0].toUpperCase()+i.slice(1)),Rt.set(r,t),Nt.set(r,i),u(i,[r])}}(0,o.unstable_now)();var Lt=8;function It(e){if(0!=(1&e))return Lt=15,1;if(0!=(2&e))return Lt=14,2;if(0!=(4&e))return Lt=13,4;var t=24&e;return 0!==t?(Lt=12,t):0!=(32&e)?(Lt=11,32):0!=(t=192&e)?(Lt=10,t):0!=(256&e)?(Lt=9,256):0!=(t=3584&e)?(Lt=8,t):0!=(4096&e)?(Lt=7,4096):0!=(t=4186112&e)?(Lt=6,t):0!=(t=62914560&e)?(Lt=5,t):67108864&e?(Lt=4,67108864):0!=(134217728&e)?(Lt=3,134217728):0!=(t=805306368&e)?(Lt=2,t):0!=(1073741824&e)?(Lt=1,1073741824):(Lt=8,e)}function At(e,t){var n=e.pendingLanes;if(0===n)return Lt=0;var r=0,i=0,o=e.expiredLanes,a=e.suspendedLanes,l=e.pingedLanes;if(0!==o)r=o,i=Lt=15;else if(0!=(o=134217727&n)){var s=o&~a;0!==s?(r=It(s),i=Lt):0!=(l&=o)&&(r=It(l),i=Lt)}else 0!=(o=n&~a)?(r=It(o),i=Lt):0!==l&&(r=It(l),i=Lt);if(0===r)return 0;if(r=n&((0>(r=31-Bt(r))?0:1<<r)<<1)-1,0!==t&&t!==r&&0==(t&a)){if(It(t),i<=Lt)return t;Lt=i}if(0!==(t=e.entangledLanes))for(e=e.entanglements,t&=r;0<t;)i=1<<(n=31-Bt(t)),r|=e[n],t&=~i;return r}function Ft(e){return 0!=(e=-1073741825&e.pendingLanes)?e:1073741824&e?1073741824:0}function zt(e,t){switch(e){case 15:return 1;case 14:return 2;case 12:return 0===(e=Ut(24&~t))?zt(10,t):e;case 10:return 0===(e=Ut(192&~t))?zt(8,t):e;case 8:return 0===(e=Ut(3584&~t))&&0===(e=Ut(4186112&~t))&&(e=512),e;case 2:return 0===(t=Ut(805306368&~t))&&(t=268435456),t}throw Error(a(358,e))}function Ut(e){return e&-e}function $t(e){for(var t=[],n=0;31>n;n++)t.push(e);return t}function Vt(e,t,n){e.pendingLanes|=t;var r=t-1;e.suspendedLanes&=r,e.pingedLanes&=r,(e=e.eventTimes)[t=31-Bt(t)]=n}var Bt=Math.clz32?Math.clz32:function(e){return 0===e?32:31-(Wt(e)/qt|0)|0},Wt=Math.log,qt=Math.LN2,Ht=o.unstable_UserBlockingPriority,Qt=o.unstable_runWithPriority,Kt=!0;function Gt(e,t,n,r){Ie||De();var i=Xt,o=Ie;Ie=!0;try{Me(i,e,t,n,r)}finally{(Ie=o)||Fe()}}function Yt(e,t,n,r){Qt(Ht,Xt.bind(null,e,t,n,r))}function Xt(e,t,n,r){var i;if(Kt)if((i=0==(4&t))&&0<ot.length&&-1<ft.indexOf(e))e=pt(null,e,t,n,r),ot.push(e);else{var o=Jt(e,t,n,r);if(null===o)i&&ht(e,r);else{if(i){if(-1<ft.indexOf(e))return e=pt(o,e,t,n,r),void ot.push(e);if(function(e,t,n,r,i){switch(t){case"focusin":return at=vt(at,e,t,n,r,i),!0;case"dragenter":return lt=vt(lt,e,t,n,r,i),!0;case"mouseover":return st=vt(st,e,t,n,r,i),!0;case"pointerover":var o=i.pointerId;return ut.set(o,vt(ut.get(o)||null,e,t,n,r,i)),!0;case"gotpointercapture":return o=i.pointerId,ct.set(o,vt(ct.get(o)||null,e,t,n,r,i)),!0}return!1}(o,e,t,n,r))return;ht(e,r)}Nr(e,t,r,null,n)}}}function Jt(e,t,n,r){var i=Ce(r);if(null!==(i=Jr(i))){var o=Ge(i);if(null===o)i=null;else{var a=o.tag;if(13===a){if(null!==(i=Ye(o)))return i;i=null}else if(3===a){if(o.stateNode.hydrate)return 3===o.tag?o.stateNode.containerInfo:null;i=null}else o!==i&&(i=null)}}return Nr(e,t,r,i,n),null}var Zt=null,en=null,tn=null;function nn(){if(tn)return tn;var e,t,n=en,r=n.length,i="value"in Zt?Zt.value:Zt.textContent,o=i.length;for(e=0;e<r&&n[e]===i[e];e++);var a=r-e;for(t=1;t<=a&&n[r-t]===i[o-t];t++);return tn=i.slice(e,1<t?1-t:void 0)}function rn(e){var t=e.keyCode;return"charCode"in e?0===(e=e.charCode)&&13===t&&(e=13):e=t,10===e&&(e=13),32<=e||13===e?e:0}function on(){return!0}function an(){return!1}function ln(e){function t(t,n,r,i,o){for(var a in this._reactName=t,this._targetInst=r,this.type=n,this.nativeEvent=i,this.target=o,this.currentTarget=null,e)e.hasOwnProperty(a)&&(t=e[a],this[a]=t?t(i):i[a]);return this.isDefaultPrevented=(null!=i.defaultPrevented?i.defaultPrevented:!1===i.returnValue)?on:an,this.isPropagationStopped=an,this}return i(t.prototype,{preventDefault:function(){this.defaultPrevented=!0;var e=this.nativeEvent;e&&(e.preventDefault?e.preventDefault():"unknown"!=typeof e.returnValue&&(e.returnValue=!1),this.isDefaultPrevented=on)},stopPropagation:function(){var e=this.nativeEvent;e&&(e.stopPropagation?e.stopPropagation():"unknown"!=typeof e.cancelBubble&&(e.cancelBubble=!0),this.isPropagationStopped=on)},persist:function(){},isPersistent:on}),t}var sn,un,cn,dn={eventPhase:0,bubbles:0,cancelable:0,timeStamp:function(e){return e.timeStamp||Date.now()},defaultPrevented:0,isTrusted:0},fn=ln(dn),pn=i({},dn,{view:0,detail:0}),hn=ln(pn),vn=i({},pn,{screenX:0,screenY:0,clientX:0,clientY:0,pageX:0,pageY:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,getModifierState:On,button:0,buttons:0,relatedTarget:function(e){return void 0===e.relatedTarget?e.fromElement===e.srcElement?e.toElement:e.fromElement:e.relatedTarget},movementX:function(e){return"movementX"in e?e.movementX:(e!==cn&&(cn&&"mousemove"===e.type?(sn=e.screenX-cn.screenX,un=e.screenY-cn.screenY):un=sn=0,cn=e),sn)},movementY:function(e){return"movementY"in e?e.movementY:un}}),mn=ln(vn),gn=ln(i({},vn,{dataTransfer:0})),yn=ln(i({},pn,{relatedTarget:0})),bn=ln(i({},dn,{animationName:0,elapsedTime:0,pseudoElement:0})),wn=ln(i({},dn,{clipboardData:function(e){return"clipboardData"in e?e.clipboardData:window.clipboardData}})),Sn=ln(i({},dn,{data:0})),kn={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},xn={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},En={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function Cn(e){var t=this.nativeEvent;return t.getModifierState?t.getModifierState(e):!!(e=En[e])&&!!t[e]}function On(){return Cn}var Pn=ln(i({},pn,{key:function(e){if(e.key){var t=kn[e.key]||e.key;if("Unidentified"!==t)return t}return"keypress"===e.type?13===(e=rn(e))?"Enter":String.fromCharCode(e):"keydown"===e.type||"keyup"===e.type?xn[e.keyCode]||"Unidentified":""},code:0,location:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,repeat:0,locale:0,getModifierState:On,charCode:function(e){return"keypress"===e.type?rn(e):0},keyCode:function(e){return"keydown"===e.type||"keyup"===e.type?e.keyCode:0},which:function(e){return"keypress"===e.type?rn(e):"keydown"===e.type||"keyup"===e.type?e.keyCode:0}})),jn=ln(i({},vn,{pointerId:0,width:0,height:0,pressure:0,tangentialPressure:0,tiltX:0,tiltY:0,twist:0,pointerType:0,isPrimary:0})),Tn=ln(i({},pn,{touches:0,targetTouches:0,changedTouches:0,altKey:0,metaKey:0,ctrlKey:0,shiftKey:0,getModifierState:On})),_n=ln(i({},dn,{propertyName:0,elapsedTime:0,pseudoElement:0})),Nn=ln(i({},vn,{deltaX:function(e){return"deltaX"in e?e.deltaX:"wheelDeltaX"in e?-e.wheelDeltaX:0},deltaY:function(e){return"deltaY"in e?e.deltaY:"wheelDeltaY"in e?-e.wheelDeltaY:"wheelDelta"in e?-e.wheelDelta:0},deltaZ:0,deltaMode:0})),Rn=[9,13,27,32],Mn=d&&"CompositionEvent"in window,Dn=null;d&&"documentMode"in document&&(Dn=document.documentMode);var Ln=d&&"TextEvent"in window&&!Dn,In=d&&(!Mn||Dn&&8<Dn&&11>=Dn),An=String.fromCharCode(32),Fn=!1;function zn(e,t){switch(e){case"keyup":return-1!==Rn.indexOf(t.keyCode);case"keydown":return 229!==t.keyCode;case"keypress":case"mousedown":case"focusout":return!0;default:return!1}}function Un(e){return"object"==typeof(e=e.detail)&&"data"in e?e.data:null}var $n=!1,Vn={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function Bn(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return"input"===t?!!Vn[e.type]:"textarea"===t}function Wn(e,t,n,r){_e(r),0<(t=Mr(t,"onChange")).length&&(n=new fn("onChange","change",null,n,r),e.push({event:n,listeners:t}))}var qn=null,Hn=null;function Qn(e){Cr(e,0)}function Kn(e){if(X(ei(e)))return e}function Gn(e,t){if("change"===e)return t}var Yn=!1;if(d){var Xn;if(d){var Jn="oninput"in document;if(!Jn){var Zn=document.createElement("div");Zn.setAttribute("oninput","return;"),Jn="function"==typeof Zn.oninput}Xn=Jn}else Xn=!1;Yn=Xn&&(!document.documentMode||9<document.documentMode)}function er(){qn&&(qn.detachEvent("onpropertychange",tr),Hn=qn=null)}function tr(e){if("value"===e.propertyName&&Kn(Hn)){var t=[];if(Wn(t,Hn,e,Ce(e)),e=Qn,Ie)e(t);else{Ie=!0;try{Re(e,t)}finally{Ie=!1,Fe()}}}}function nr(e,t,n){"focusin"===e?(er(),Hn=n,(qn=t).attachEvent("onpropertychange",tr)):"focusout"===e&&er()}function rr(e){if("selectionchange"===e||"keyup"===e||"keydown"===e)return Kn(Hn)}function ir(e,t){if("click"===e)return Kn(t)}function or(e,t){if("input"===e||"change"===e)return Kn(t)}var ar="function"==typeof Object.is?Object.is:function(e,t){return e===t&&(0!==e||1/e==1/t)||e!=e&&t!=t},lr=Object.prototype.hasOwnProperty;function sr(e,t){if(ar(e,t))return!0;if("object"!=typeof e||null===e||"object"!=typeof t||null===t)return!1;var n=Object.keys(e),r=Object.keys(t);if(n.length!==r.length)return!1;for(r=0;r<n.length;r++)if(!lr.call(t,n[r])||!ar(e[n[r]],t[n[r]]))return!1;return!0}function ur(e){for(;e&&e.firstChild;)e=e.firstChild;return e}function cr(e,t){var n,r=ur(e);for(e=0;r;){if(3===r.nodeType){if(n=e+r.textContent.length,e<=t&&n>=t)return{node:r,offset:t-e};e=n}e:{for(;r;){if(r.nextSibling){r=r.nextSibling;break e}r=r.parentNode}r=void 0}r=ur(r)}}function dr(e,t){return!(!e||!t)&&(e===t||(!e||3!==e.nodeType)&&(t&&3===t.nodeType?dr(e,t.parentNode):"contains"in e?e.contains(t):!!e.compareDocumentPosition&&!!(16&e.compareDocumentPosition(t))))}function fr(){for(var e=window,t=J();t instanceof e.HTMLIFrameElement;){try{var n="string"==typeof t.contentWindow.location.href}catch(e){n=!1}if(!n)break;t=J((e=t.contentWindow).document)}return t}function pr(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t&&("input"===t&&("text"===e.type||"search"===e.type||"tel"===e.type||"url"===e.type||"password"===e.type)||"textarea"===t||"true"===e.contentEditable)}var hr=d&&"documentMode"in document&&11>=document.documentMode,vr=null,mr=null,gr=null,yr=!1;function br(e,t,n){var r=n.window===n?n.document:9===n.nodeType?n:n.ownerDocument;yr||null==vr||vr!==J(r)||(r="selectionStart"in(r=vr)&&pr(r)?{start:r.selectionStart,end:r.selectionEnd}:{anchorNode:(r=(r.ownerDocument&&r.ownerDocument.defaultView||window).getSelection()).anchorNode,anchorOffset:r.anchorOffset,focusNode:r.focusNode,focusOffset:r.focusOffset},gr&&sr(gr,r)||(gr=r,0<(r=Mr(mr,"onSelect")).length&&(t=new fn("onSelect","select",null,t,n),e.push({event:t,listeners:r}),t.target=vr)))}Dt("cancel cancel click click close close contextmenu contextMenu copy copy cut cut auxclick auxClick dblclick doubleClick dragend dragEnd dragstart dragStart drop drop focusin focus focusout blur input input invalid invalid keydown keyDown keypress keyPress keyup keyUp mousedown mouseDown mouseup mouseUp paste paste pause pause play play pointercancel pointerCancel pointerdown pointerDown pointerup pointerUp ratechange rateChange reset reset seeked seeked submit submit touchcancel touchCancel touchend touchEnd touchstart touchStart volumechange volumeChange".split(" "),0),Dt("drag drag dragenter dragEnter dragexit dragExit dragleave dragLeave dragover dragOver mousemove mouseMove mouseout mouseOut mouseover mouseOver pointermove pointerMove pointerout pointerOut pointerover pointerOver scroll scroll toggle toggle touchmove touchMove wheel wheel".split(" "),1),Dt(Mt,2);for(var wr="change selectionchange textInput compositionstart compositionend compositionupdate".split(" "),Sr=0;Sr<wr.length;Sr++)Rt.set(wr[Sr],0);c("onMouseEnter",["mouseout","mouseover"]),c("onMouseLeave",["mouseout","mouseover"]),c("onPointerEnter",["pointerout","pointerover"]),c("onPointerLeave",["pointerout","pointerover"]),u("onChange","change click focusin focusout input keydown keyup selectionchange".split(" ")),u("onSelect","focusout contextmenu dragend focusin keydown keyup mousedown mouseup selectionchange".split(" ")),u("onBeforeInput",["compositionend","keypress","textInput","paste"]),u("onCompositionEnd","compositionend focusout keydown keypress keyup mousedown".split(" ")),u("onCompositionStart","compositionstart focusout keydown keypress keyup mousedown".split(" ")),u("onCompositionUpdate","compositionupdate focusout keydown keypress keyup mousedown".split(" "));var kr="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),xr=new Set("cancel close invalid load scroll toggle".split(" ").concat(kr));function Er(e,t,n){var r=e.type||"unknown-event";e.currentTarget=n,function(e,t,n,r,i,o,l,s,u){if(Ke.apply(this,arguments),Be){if(!Be)throw Error(a(198));var c=We;Be=!1,We=null,qe||(qe=!0,He=c)}}(r,t,void 0,e),e.currentTarget=null}function Cr(e,t){t=0!=(4&t);for(var n=0;n<e.length;n++){var r=e[n],i=r.event;r=r.listeners;e:{var o=void 0;if(t)for(var a=r.length-1;0<=a;a--){var l=r[a],s=l.instance,u=l.currentTarget;if(l=l.listener,s!==o&&i.isPropagationStopped())break e;Er(i,l,u),o=s}else for(a=0;a<r.length;a++){if(s=(l=r[a]).instance,u=l.currentTarget,l=l.listener,s!==o&&i.isPropagationStopped())break e;Er(i,l,u),o=s}}}if(qe)throw e=He,qe=!1,He=null,e}function Or(e,t){var n=ni(t),r=e+"__bubble";n.has(r)||(_r(t,e,2,!1),n.add(r))}var Pr="_reactListening"+Math.random().toString(36).slice(2);function jr(e){e[Pr]||(e[Pr]=!0,l.forEach((function(t){xr.has(t)||Tr(t,!1,e,null),Tr(t,!0,e,null)})))}function Tr(e,t,n,r){var i=4<arguments.length&&void 0!==arguments[4]?arguments[4]:0,o=n;if("selectionchange"===e&&9!==n.nodeType&&(o=n.ownerDocument),null!==r&&!t&&xr.has(e)){if("scroll"!==e)return;i|=2,o=r}var a=ni(o),l=e+"__"+(t?"capture":"bubble");a.has(l)||(t&&(i|=4),_r(o,e,i,t),a.add(l))}function _r(e,t,n,r){var i=Rt.get(t);switch(void 0===i?2:i){case 0:i=Gt;break;case 1:i=Yt;break;default:i=Xt}n=i.bind(null,t,n,e),i=void 0,!Ue||"touchstart"!==t&&"touchmove"!==t&&"wheel"!==t||(i=!0),r?void 0!==i?e.addEventListener(t,n,{capture:!0,passive:i}):e.addEventListener(t,n,!0):void 0!==i?e.addEventListener(t,n,{passive:i}):e.addEventListener(t,n,!1)}function Nr(e,t,n,r,i){var o=r;if(0==(1&t)&&0==(2&t)&&null!==r)e:for(;;){if(null===r)return;var a=r.tag;if(3===a||4===a){var l=r.stateNode.containerInfo;if(l===i||8===l.nodeType&&l.parentNode===i)break;if(4===a)for(a=r.return;null!==a;){var s=a.tag;if((3===s||4===s)&&((s=a.stateNode.containerInfo)===i||8===s.nodeType&&s.parentNode===i))return;a=a.return}for(;null!==l;){if(null===(a=Jr(l)))return;if(5===(s=a.tag)||6===s){r=o=a;continue e}l=l.parentNode}}r=r.return}!function(e,t,n){if(Ae)return e();Ae=!0;try{Le(e,t,n)}finally{Ae=!1,Fe()}}((function(){var r=o,i=Ce(n),a=[];e:{var l=Nt.get(e);if(void 0!==l){var s=fn,u=e;switch(e){case"keypress":if(0===rn(n))break e;case"keydown":case"keyup":s=Pn;break;case"focusin":u="focus",s=yn;break;case"focusout":u="blur",s=yn;break;case"beforeblur":case"afterblur":s=yn;break;case"click":if(2===n.button)break e;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":s=mn;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":s=gn;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":s=Tn;break;case Pt:case jt:case Tt:s=bn;break;case _t:s=_n;break;case"scroll":s=hn;break;case"wheel":s=Nn;break;case"copy":case"cut":case"paste":s=wn;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":s=jn}var c=0!=(4&t),d=!c&&"scroll"===e,f=c?null!==l?l+"Capture":null:l;c=[];for(var p,h=r;null!==h;){var v=(p=h).stateNode;if(5===p.tag&&null!==v&&(p=v,null!==f&&null!=(v=ze(h,f))&&c.push(Rr(h,v,p))),d)break;h=h.return}0<c.length&&(l=new s(l,u,null,n,i),a.push({event:l,listeners:c}))}}if(0==(7&t)){if(s="mouseout"===e||"pointerout"===e,(!(l="mouseover"===e||"pointerover"===e)||0!=(16&t)||!(u=n.relatedTarget||n.fromElement)||!Jr(u)&&!u[Yr])&&(s||l)&&(l=i.window===i?i:(l=i.ownerDocument)?l.defaultView||l.parentWindow:window,s?(s=r,null!==(u=(u=n.relatedTarget||n.toElement)?Jr(u):null)&&(u!==(d=Ge(u))||5!==u.tag&&6!==u.tag)&&(u=null)):(s=null,u=r),s!==u)){if(c=mn,v="onMouseLeave",f="onMouseEnter",h="mouse","pointerout"!==e&&"pointerover"!==e||(c=jn,v="onPointerLeave",f="onPointerEnter",h="pointer"),d=null==s?l:ei(s),p=null==u?l:ei(u),(l=new c(v,h+"leave",s,n,i)).target=d,l.relatedTarget=p,v=null,Jr(i)===r&&((c=new c(f,h+"enter",u,n,i)).target=p,c.relatedTarget=d,v=c),d=v,s&&u)e:{for(f=u,h=0,p=c=s;p;p=Dr(p))h++;for(p=0,v=f;v;v=Dr(v))p++;for(;0<h-p;)c=Dr(c),h--;for(;0<p-h;)f=Dr(f),p--;for(;h--;){if(c===f||null!==f&&c===f.alternate)break e;c=Dr(c),f=Dr(f)}c=null}else c=null;null!==s&&Lr(a,l,s,c,!1),null!==u&&null!==d&&Lr(a,d,u,c,!0)}if("select"===(s=(l=r?ei(r):window).nodeName&&l.nodeName.toLowerCase())||"input"===s&&"file"===l.type)var m=Gn;else if(Bn(l))if(Yn)m=or;else{m=rr;var g=nr}else(s=l.nodeName)&&"input"===s.toLowerCase()&&("checkbox"===l.type||"radio"===l.type)&&(m=ir);switch(m&&(m=m(e,r))?Wn(a,m,n,i):(g&&g(e,l,r),"focusout"===e&&(g=l._wrapperState)&&g.controlled&&"number"===l.type&&ie(l,"number",l.value)),g=r?ei(r):window,e){case"focusin":(Bn(g)||"true"===g.contentEditable)&&(vr=g,mr=r,gr=null);break;case"focusout":gr=mr=vr=null;break;case"mousedown":yr=!0;break;case"contextmenu":case"mouseup":case"dragend":yr=!1,br(a,n,i);break;case"selectionchange":if(hr)break;case"keydown":case"keyup":br(a,n,i)}var y;if(Mn)e:{switch(e){case"compositionstart":var b="onCompositionStart";break e;case"compositionend":b="onCompositionEnd";break e;case"compositionupdate":b="onCompositionUpdate";break e}b=void 0}else $n?zn(e,n)&&(b="onCompositionEnd"):"keydown"===e&&229===n.keyCode&&(b="onCompositionStart");b&&(In&&"ko"!==n.locale&&($n||"onCompositionStart"!==b?"onCompositionEnd"===b&&$n&&(y=nn()):(en="value"in(Zt=i)?Zt.value:Zt.textContent,$n=!0)),0<(g=Mr(r,b)).length&&(b=new Sn(b,e,null,n,i),a.push({event:b,listeners:g}),(y||null!==(y=Un(n)))&&(b.data=y))),(y=Ln?function(e,t){switch(e){case"compositionend":return Un(t);case"keypress":return 32!==t.which?null:(Fn=!0,An);case"textInput":return(e=t.data)===An&&Fn?null:e;default:return null}}(e,n):function(e,t){if($n)return"compositionend"===e||!Mn&&zn(e,t)?(e=nn(),tn=en=Zt=null,$n=!1,e):null;switch(e){case"paste":return null;case"keypress":if(!(t.ctrlKey||t.altKey||t.metaKey)||t.ctrlKey&&t.altKey){if(t.char&&1<t.char.length)return t.char;if(t.which)return String.fromCharCode(t.which)}return null;case"compositionend":return In&&"ko"!==t.locale?null:t.data;default:return null}}(e,n))&&0<(r=Mr(r,"onBeforeInput")).length&&(i=new Sn("onBeforeInput","beforeinput",null,n,i),a.push({event:i,listeners:r}),i.data=y)}Cr(a,t)}))}function Rr(e,t,n){return{instance:e,listener:t,currentTarget:n}}function Mr(e,t){for(var n=t+"Capture",r=[];null!==e;){var i=e,o=i.stateNode;5===i.tag&&null!==o&&(i=o,null!=(o=ze(e,n))&&r.unshift(Rr(e,o,i)),null!=(o=ze(e,t))&&r.push(Rr(e,o,i))),e=e.return}return r}function Dr(e){if(null===e)return null;do{e=e.return}while(e&&5!==e.tag);return e||null}function Lr(e,t,n,r,i){for(var o=t._reactName,a=[];null!==n&&n!==r;){var l=n,s=l.alternate,u=l.stateNode;if(null!==s&&s===r)break;5===l.tag&&null!==u&&(l=u,i?null!=(s=ze(n,o))&&a.unshift(Rr(n,s,l)):i||null!=(s=ze(n,o))&&a.push(Rr(n,s,l))),n=n.return}0!==a.length&&e.push({event:t,listeners:a})}function Ir(){}var Ar=null,Fr=null;function zr(e,t){switch(e){case"button":case"input":case"select":case"textarea":return!!t.autoFocus}return!1}function Ur(e,t){return"textarea"===e||"option"===e||"noscript"===e||"string"==typeof t.children||"number"==typeof t.children||"object"==typeof t.dangerouslySetInnerHTML&&null!==t.dangerouslySetInnerHTML&&null!=t.dangerouslySetInnerHTML.__html}var $r="function"==typeof setTimeout?setTimeout:void 0,Vr="function"==typeof clearTimeout?clearTimeout:void 0;function Br(e){(1===e.nodeType||9===e.nodeType&&null!=(e=e.body))&&(e.textContent="")}function Wr(e){for(;null!=e;e=e.nextSibling){var t=e.nodeType;if(1===t||3===t)break}return e}function qr(e){e=e.previousSibling;for(var t=0;e;){if(8===e.nodeType){var n=e.data;if("$"===n||"$!"===n||"$?"===n){if(0===t)return e;t--}else"/$"===n&&t++}e=e.previousSibling}return null}var Hr=0,Qr=Math.random().toString(36).slice(2),Kr="__reactFiber$"+Qr,Gr="__reactProps$"+Qr,Yr="__reactContainer$"+Qr,Xr="__reactEvents$"+Qr;function Jr(e){var t=e[Kr];if(t)return t;for(var n=e.parentNode;n;){if(t=n[Yr]||n[Kr]){if(n=t.alternate,null!==t.child||null!==n&&null!==n.child)for(e=qr(e);null!==e;){if(n=e[Kr])return n;e=qr(e)}return t}n=(e=n).parentNode}return null}function Zr(e){return!(e=e[Kr]||e[Yr])||5!==e.tag&&6!==e.tag&&13!==e.tag&&3!==e.tag?null:e}function ei(e){if(5===e.tag||6===e.tag)return e.stateNode;throw Error(a(33))}function ti(e){return e[Gr]||null}function ni(e){var t=e[Xr];return void 0===t&&(t=e[Xr]=new Set),t}var ri=[],ii=-1;function oi(e){return{current:e}}function ai(e){0>ii||(e.current=ri[ii],ri[ii]=null,ii--)}function li(e,t){ii++,ri[ii]=e.current,e.current=t}var si={},ui=oi(si),ci=oi(!1),di=si;function fi(e,t){var n=e.type.contextTypes;if(!n)return si;var r=e.stateNode;if(r&&r.__reactInternalMemoizedUnmaskedChildContext===t)return r.__reactInternalMemoizedMaskedChildContext;var i,o={};for(i in n)o[i]=t[i];return r&&((e=e.stateNode).__reactInternalMemoizedUnmaskedChildContext=t,e.__reactInternalMemoizedMaskedChildContext=o),o}function pi(e){return null!=e.childContextTypes}function hi(){ai(ci),ai(ui)}function vi(e,t,n){if(ui.current!==si)throw Error(a(168));li(ui,t),li(ci,n)}function mi(e,t,n){var r=e.stateNode;if(e=t.childContextTypes,"function"!=typeof r.getChildContext)return n;for(var o in r=r.getChildContext())if(!(o in e))throw Error(a(108,Q(t)||"Unknown",o));return i({},n,r)}function gi(e){return e=(e=e.stateNode)&&e.__reactInternalMemoizedMergedChildContext||si,di=ui.current,li(ui,e),li(ci,ci.current),!0}function yi(e,t,n){var r=e.stateNode;if(!r)throw Error(a(169));n?(e=mi(e,t,di),r.__reactInternalMemoizedMergedChildContext=e,ai(ci),ai(ui),li(ui,e)):ai(ci),li(ci,n)}var bi=null,wi=null,Si=o.unstable_runWithPriority,ki=o.unstable_scheduleCallback,xi=o.unstable_cancelCallback,Ei=o.unstable_shouldYield,Ci=o.unstable_requestPaint,Oi=o.unstable_now,Pi=o.unstable_getCurrentPriorityLevel,ji=o.unstable_ImmediatePriority,Ti=o.unstable_UserBlockingPriority,_i=o.unstable_NormalPriority,Ni=o.unstable_LowPriority,Ri=o.unstable_IdlePriority,Mi={},Di=void 0!==Ci?Ci:function(){},Li=null,Ii=null,Ai=!1,Fi=Oi(),zi=1e4>Fi?Oi:function(){return Oi()-Fi};function Ui(){switch(Pi()){case ji:return 99;case Ti:return 98;case _i:return 97;case Ni:return 96;case Ri:return 95;default:throw Error(a(332))}}function $i(e){switch(e){case 99:return ji;case 98:return Ti;case 97:return _i;case 96:return Ni;case 95:return Ri;default:throw Error(a(332))}}function Vi(e,t){return e=$i(e),Si(e,t)}function Bi(e,t,n){return e=$i(e),ki(e,t,n)}function Wi(){if(null!==Ii){var e=Ii;Ii=null,xi(e)}qi()}function qi(){if(!Ai&&null!==Li){Ai=!0;var e=0;try{var t=Li;Vi(99,(function(){for(;e<t.length;e++){var n=t[e];do{n=n(!0)}while(null!==n)}})),Li=null}catch(t){throw null!==Li&&(Li=Li.slice(e+1)),ki(ji,Wi),t}finally{Ai=!1}}}var Hi=S.ReactCurrentBatchConfig;function Qi(e,t){if(e&&e.defaultProps){for(var n in t=i({},t),e=e.defaultProps)void 0===t[n]&&(t[n]=e[n]);return t}return t}var Ki=oi(null),Gi=null,Yi=null,Xi=null;function Ji(){Xi=Yi=Gi=null}function Zi(e){var t=Ki.current;ai(Ki),e.type._context._currentValue=t}function eo(e,t){for(;null!==e;){var n=e.alternate;if((e.childLanes&t)===t){if(null===n||(n.childLanes&t)===t)break;n.childLanes|=t}else e.childLanes|=t,null!==n&&(n.childLanes|=t);e=e.return}}function to(e,t){Gi=e,Xi=Yi=null,null!==(e=e.dependencies)&&null!==e.firstContext&&(0!=(e.lanes&t)&&(Ma=!0),e.firstContext=null)}function no(e,t){if(Xi!==e&&!1!==t&&0!==t)if("number"==typeof t&&1073741823!==t||(Xi=e,t=1073741823),t={context:e,observedBits:t,next:null},null===Yi){if(null===Gi)throw Error(a(308));Yi=t,Gi.dependencies={lanes:0,firstContext:t,responders:null}}else Yi=Yi.next=t;return e._currentValue}var ro=!1;function io(e){e.updateQueue={baseState:e.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null},effects:null}}function oo(e,t){e=e.updateQueue,t.updateQueue===e&&(t.updateQueue={baseState:e.baseState,firstBaseUpdate:e.firstBaseUpdate,lastBaseUpdate:e.lastBaseUpdate,shared:e.shared,effects:e.effects})}function ao(e,t){return{eventTime:e,lane:t,tag:0,payload:null,callback:null,next:null}}function lo(e,t){if(null!==(e=e.updateQueue)){var n=(e=e.shared).pending;null===n?t.next=t:(t.next=n.next,n.next=t),e.pending=t}}function so(e,t){var n=e.updateQueue,r=e.alternate;if(null!==r&&n===(r=r.updateQueue)){var i=null,o=null;if(null!==(n=n.firstBaseUpdate)){do{var a={eventTime:n.eventTime,lane:n.lane,tag:n.tag,payload:n.payload,callback:n.callback,next:null};null===o?i=o=a:o=o.next=a,n=n.next}while(null!==n);null===o?i=o=t:o=o.next=t}else i=o=t;return n={baseState:r.baseState,firstBaseUpdate:i,lastBaseUpdate:o,shared:r.shared,effects:r.effects},void(e.updateQueue=n)}null===(e=n.lastBaseUpdate)?n.firstBaseUpdate=t:e.next=t,n.lastBaseUpdate=t}function uo(e,t,n,r){var o=e.updateQueue;ro=!1;var a=o.firstBaseUpdate,l=o.lastBaseUpdate,s=o.shared.pending;if(null!==s){o.shared.pending=null;var u=s,c=u.next;u.next=null,null===l?a=c:l.next=c,l=u;var d=e.alternate;if(null!==d){var f=(d=d.updateQueue).lastBaseUpdate;f!==l&&(null===f?d.firstBaseUpdate=c:f.next=c,d.lastBaseUpdate=u)}}if(null!==a){for(f=o.baseState,l=0,d=c=u=null;;){s=a.lane;var p=a.eventTime;if((r&s)===s){null!==d&&(d=d.next={eventTime:p,lane:0,tag:a.tag,payload:a.payload,callback:a.callback,next:null});e:{var h=e,v=a;switch(s=t,p=n,v.tag){case 1:if("function"==typeof(h=v.payload)){f=h.call(p,f,s);break e}f=h;break e;case 3:h.flags=-4097&h.flags|64;case 0:if(null==(s="function"==typeof(h=v.payload)?h.call(p,f,s):h))break e;f=i({},f,s);break e;case 2:ro=!0}}null!==a.callback&&(e.flags|=32,null===(s=o.effects)?o.effects=[a]:s.push(a))}else p={eventTime:p,lane:s,tag:a.tag,payload:a.payload,callback:a.callback,next:null},null===d?(c=d=p,u=f):d=d.next=p,l|=s;if(null===(a=a.next)){if(null===(s=o.shared.pending))break;a=s.next,s.next=null,o.lastBaseUpdate=s,o.shared.pending=null}}null===d&&(u=f),o.baseState=u,o.firstBaseUpdate=c,o.lastBaseUpdate=d,Ll|=l,e.lanes=l,e.memoizedState=f}}function co(e,t,n){if(e=t.effects,t.effects=null,null!==e)for(t=0;t<e.length;t++){var r=e[t],i=r.callback;if(null!==i){if(r.callback=null,r=n,"function"!=typeof i)throw Error(a(191,i));i.call(r)}}}var fo=(new r.Component).refs;function po(e,t,n,r){n=null==(n=n(r,t=e.memoizedState))?t:i({},t,n),e.memoizedState=n,0===e.lanes&&(e.updateQueue.baseState=n)}var ho={isMounted:function(e){return!!(e=e._reactInternals)&&Ge(e)===e},enqueueSetState:function(e,t,n){e=e._reactInternals;var r=as(),i=ls(e),o=ao(r,i);o.payload=t,null!=n&&(o.callback=n),lo(e,o),ss(e,i,r)},enqueueReplaceState:function(e,t,n){e=e._reactInternals;var r=as(),i=ls(e),o=ao(r,i);o.tag=1,o.payload=t,null!=n&&(o.callback=n),lo(e,o),ss(e,i,r)},enqueueForceUpdate:function(e,t){e=e._reactInternals;var n=as(),r=ls(e),i=ao(n,r);i.tag=2,null!=t&&(i.callback=t),lo(e,i),ss(e,r,n)}};function vo(e,t,n,r,i,o,a){return"function"==typeof(e=e.stateNode).shouldComponentUpdate?e.shouldComponentUpdate(r,o,a):!(t.prototype&&t.prototype.isPureReactComponent&&sr(n,r)&&sr(i,o))}function mo(e,t,n){var r=!1,i=si,o=t.contextType;return"object"==typeof o&&null!==o?o=no(o):(i=pi(t)?di:ui.current,o=(r=null!=(r=t.contextTypes))?fi(e,i):si),t=new t(n,o),e.memoizedState=null!==t.state&&void 0!==t.state?t.state:null,t.updater=ho,e.stateNode=t,t._reactInternals=e,r&&((e=e.stateNode).__reactInternalMemoizedUnmaskedChildContext=i,e.__reactInternalMemoizedMaskedChildContext=o),t}function go(e,t,n,r){e=t.state,"function"==typeof t.componentWillReceiveProps&&t.componentWillReceiveProps(n,r),"function"==typeof t.UNSAFE_componentWillReceiveProps&&t.UNSAFE_componentWillReceiveProps(n,r),t.state!==e&&ho.enqueueReplaceState(t,t.state,null)}function yo(e,t,n,r){var i=e.stateNode;i.props=n,i.state=e.memoizedState,i.refs=fo,io(e);var o=t.contextType;"object"==typeof o&&null!==o?i.context=no(o):(o=pi(t)?di:ui.current,i.context=fi(e,o)),uo(e,n,i,r),i.state=e.memoizedState,"function"==typeof(o=t.getDerivedStateFromProps)&&(po(e,t,o,n),i.state=e.memoizedState),"function"==typeof t.getDerivedStateFromProps||"function"==typeof i.getSnapshotBeforeUpdate||"function"!=typeof i.UNSAFE_componentWillMount&&"function"!=typeof i.componentWillMount||(t=i.state,"function"==typeof i.componentWillMount&&i.componentWillMount(),"function"==typeof i.UNSAFE_componentWillMount&&i.UNSAFE_componentWillMount(),t!==i.state&&ho.enqueueReplaceState(i,i.state,null),uo(e,n,i,r),i.state=e.memoizedState),"function"==typeof i.componentDidMount&&(e.flags|=4)}var bo=Array.isArray;function wo(e,t,n){if(null!==(e=n.ref)&&"function"!=typeof e&&"object"!=typeof e){if(n._owner){if(n=n._owner){if(1!==n.tag)throw Error(a(309));var r=n.stateNode}if(!r)throw Error(a(147,e));var i=""+e;return null!==t&&null!==t.ref&&"function"==typeof t.ref&&t.ref._stringRef===i?t.ref:((t=function(e){var t=r.refs;t===fo&&(t=r.refs={}),null===e?delete t[i]:t[i]=e})._stringRef=i,t)}if("string"!=typeof e)throw Error(a(284));if(!n._owner)throw Error(a(290,e))}return e}function So(e,t){if("textarea"!==e.type)throw Error(a(31,"[object Object]"===Object.prototype.toString.call(t)?"object with keys {"+Object.keys(t).join(", ")+"}":t))}function ko(e){function t(t,n){if(e){var r=t.lastEffect;null!==r?(r.nextEffect=n,t.lastEffect=n):t.firstEffect=t.lastEffect=n,n.nextEffect=null,n.flags=8}}function n(n,r){if(!e)return null;for(;null!==r;)t(n,r),r=r.sibling;return null}function r(e,t){for(e=new Map;null!==t;)null!==t.key?e.set(t.key,t):e.set(t.index,t),t=t.sibling;return e}function i(e,t){return(e=Us(e,t)).index=0,e.sibling=null,e}function o(t,n,r){return t.index=r,e?null!==(r=t.alternate)?(r=r.index)<n?(t.flags=2,n):r:(t.flags=2,n):n}function l(t){return e&&null===t.alternate&&(t.flags=2),t}function s(e,t,n,r){return null===t||6!==t.tag?((t=Ws(n,e.mode,r)).return=e,t):((t=i(t,n)).return=e,t)}function u(e,t,n,r){return null!==t&&t.elementType===n.type?((r=i(t,n.props)).ref=wo(e,t,n),r.return=e,r):((r=$s(n.type,n.key,n.props,null,e.mode,r)).ref=wo(e,t,n),r.return=e,r)}function c(e,t,n,r){return null===t||4!==t.tag||t.stateNode.containerInfo!==n.containerInfo||t.stateNode.implementation!==n.implementation?((t=qs(n,e.mode,r)).return=e,t):((t=i(t,n.children||[])).return=e,t)}function d(e,t,n,r,o){return null===t||7!==t.tag?((t=Vs(n,e.mode,r,o)).return=e,t):((t=i(t,n)).return=e,t)}function f(e,t,n){if("string"==typeof t||"number"==typeof t)return(t=Ws(""+t,e.mode,n)).return=e,t;if("object"==typeof t&&null!==t){switch(t.$$typeof){case k:return(n=$s(t.type,t.key,t.props,null,e.mode,n)).ref=wo(e,null,t),n.return=e,n;case x:return(t=qs(t,e.mode,n)).return=e,t}if(bo(t)||V(t))return(t=Vs(t,e.mode,n,null)).return=e,t;So(e,t)}return null}function p(e,t,n,r){var i=null!==t?t.key:null;if("string"==typeof n||"number"==typeof n)return null!==i?null:s(e,t,""+n,r);if("object"==typeof n&&null!==n){switch(n.$$typeof){case k:return n.key===i?n.type===E?d(e,t,n.props.children,r,i):u(e,t,n,r):null;case x:return n.key===i?c(e,t,n,r):null}if(bo(n)||V(n))return null!==i?null:d(e,t,n,r,null);So(e,n)}return null}function h(e,t,n,r,i){if("string"==typeof r||"number"==typeof r)return s(t,e=e.get(n)||null,""+r,i);if("object"==typeof r&&null!==r){switch(r.$$typeof){case k:return e=e.get(null===r.key?n:r.key)||null,r.type===E?d(t,e,r.props.children,i,r.key):u(t,e,r,i);case x:return c(t,e=e.get(null===r.key?n:r.key)||null,r,i)}if(bo(r)||V(r))return d(t,e=e.get(n)||null,r,i,null);So(t,r)}return null}function v(i,a,l,s){for(var u=null,c=null,d=a,v=a=0,m=null;null!==d&&v<l.length;v++){d.index>v?(m=d,d=null):m=d.sibling;var g=p(i,d,l[v],s);if(null===g){null===d&&(d=m);break}e&&d&&null===g.alternate&&t(i,d),a=o(g,a,v),null===c?u=g:c.sibling=g,c=g,d=m}if(v===l.length)return n(i,d),u;if(null===d){for(;v<l.length;v++)null!==(d=f(i,l[v],s))&&(a=o(d,a,v),null===c?u=d:c.sibling=d,c=d);return u}for(d=r(i,d);v<l.length;v++)null!==(m=h(d,i,v,l[v],s))&&(e&&null!==m.alternate&&d.delete(null===m.key?v:m.key),a=o(m,a,v),null===c?u=m:c.sibling=m,c=m);return e&&d.forEach((function(e){return t(i,e)})),u}function m(i,l,s,u){var c=V(s);if("function"!=typeof c)throw Error(a(150));if(null==(s=c.call(s)))throw Error(a(151));for(var d=c=null,v=l,m=l=0,g=null,y=s.next();null!==v&&!y.done;m++,y=s.next()){v.index>m?(g=v,v=null):g=v.sibling;var b=p(i,v,y.value,u);if(null===b){null===v&&(v=g);break}e&&v&&null===b.alternate&&t(i,v),l=o(b,l,m),null===d?c=b:d.sibling=b,d=b,v=g}if(y.done)return n(i,v),c;if(null===v){for(;!y.done;m++,y=s.next())null!==(y=f(i,y.value,u))&&(l=o(y,l,m),null===d?c=y:d.sibling=y,d=y);return c}for(v=r(i,v);!y.done;m++,y=s.next())null!==(y=h(v,i,m,y.value,u))&&(e&&null!==y.alternate&&v.delete(null===y.key?m:y.key),l=o(y,l,m),null===d?c=y:d.sibling=y,d=y);return e&&v.forEach((function(e){return t(i,e)})),c}return function(e,r,o,s){var u="object"==typeof o&&null!==o&&o.type===E&&null===o.key;u&&(o=o.props.children);var c="object"==typeof o&&null!==o;if(c)switch(o.$$typeof){case k:e:{for(c=o.key,u=r;null!==u;){if(u.key===c){switch(u.tag){case 7:if(o.type===E){n(e,u.sibling),(r=i(u,o.props.children)).return=e,e=r;break e}break;default:if(u.elementType===o.type){n(e,u.sibling),(r=i(u,o.props)).ref=wo(e,u,o),r.return=e,e=r;break e}}n(e,u);break}t(e,u),u=u.sibling}o.type===E?((r=Vs(o.props.children,e.mode,s,o.key)).return=e,e=r):((s=$s(o.type,o.key,o.props,null,e.mode,s)).ref=wo(e,r,o),s.return=e,e=s)}return l(e);case x:e:{for(u=o.key;null!==r;){if(r.key===u){if(4===r.tag&&r.stateNode.containerInfo===o.containerInfo&&r.stateNode.implementation===o.implementation){n(e,r.sibling),(r=i(r,o.children||[])).return=e,e=r;break e}n(e,r);break}t(e,r),r=r.sibling}(r=qs(o,e.mode,s)).return=e,e=r}return l(e)}if("string"==typeof o||"number"==typeof o)return o=""+o,null!==r&&6===r.tag?(n(e,r.sibling),(r=i(r,o)).return=e,e=r):(n(e,r),(r=Ws(o,e.mode,s)).return=e,e=r),l(e);if(bo(o))return v(e,r,o,s);if(V(o))return m(e,r,o,s);if(c&&So(e,o),void 0===o&&!u)switch(e.tag){case 1:case 22:case 0:case 11:case 15:throw Error(a(152,Q(e.type)||"Component"))}return n(e,r)}}var xo=ko(!0),Eo=ko(!1),Co={},Oo=oi(Co),Po=oi(Co),jo=oi(Co);function To(e){if(e===Co)throw Error(a(174));return e}function _o(e,t){switch(li(jo,t),li(Po,e),li(Oo,Co),e=t.nodeType){case 9:case 11:t=(t=t.documentElement)?t.namespaceURI:pe(null,"");break;default:t=pe(t=(e=8===e?t.parentNode:t).namespaceURI||null,e=e.tagName)}ai(Oo),li(Oo,t)}function No(){ai(Oo),ai(Po),ai(jo)}function Ro(e){To(jo.current);var t=To(Oo.current),n=pe(t,e.type);t!==n&&(li(Po,e),li(Oo,n))}function Mo(e){Po.current===e&&(ai(Oo),ai(Po))}var Do=oi(0);function Lo(e){for(var t=e;null!==t;){if(13===t.tag){var n=t.memoizedState;if(null!==n&&(null===(n=n.dehydrated)||"$?"===n.data||"$!"===n.data))return t}else if(19===t.tag&&void 0!==t.memoizedProps.revealOrder){if(0!=(64&t.flags))return t}else if(null!==t.child){t.child.return=t,t=t.child;continue}if(t===e)break;for(;null===t.sibling;){if(null===t.return||t.return===e)return null;t=t.return}t.sibling.return=t.return,t=t.sibling}return null}var Io=null,Ao=null,Fo=!1;function zo(e,t){var n=Fs(5,null,null,0);n.elementType="DELETED",n.type="DELETED",n.stateNode=t,n.return=e,n.flags=8,null!==e.lastEffect?(e.lastEffect.nextEffect=n,e.lastEffect=n):e.firstEffect=e.lastEffect=n}function Uo(e,t){switch(e.tag){case 5:var n=e.type;return null!==(t=1!==t.nodeType||n.toLowerCase()!==t.nodeName.toLowerCase()?null:t)&&(e.stateNode=t,!0);case 6:return null!==(t=""===e.pendingProps||3!==t.nodeType?null:t)&&(e.stateNode=t,!0);case 13:default:return!1}}function $o(e){if(Fo){var t=Ao;if(t){var n=t;if(!Uo(e,t)){if(!(t=Wr(n.nextSibling))||!Uo(e,t))return e.flags=-1025&e.flags|2,Fo=!1,void(Io=e);zo(Io,n)}Io=e,Ao=Wr(t.firstChild)}else e.flags=-1025&e.flags|2,Fo=!1,Io=e}}function Vo(e){for(e=e.return;null!==e&&5!==e.tag&&3!==e.tag&&13!==e.tag;)e=e.return;Io=e}function Bo(e){if(e!==Io)return!1;if(!Fo)return Vo(e),Fo=!0,!1;var t=e.type;if(5!==e.tag||"head"!==t&&"body"!==t&&!Ur(t,e.memoizedProps))for(t=Ao;t;)zo(e,t),t=Wr(t.nextSibling);if(Vo(e),13===e.tag){if(!(e=null!==(e=e.memoizedState)?e.dehydrated:null))throw Error(a(317));e:{for(e=e.nextSibling,t=0;e;){if(8===e.nodeType){var n=e.data;if("/$"===n){if(0===t){Ao=Wr(e.nextSibling);break e}t--}else"$"!==n&&"$!"!==n&&"$?"!==n||t++}e=e.nextSibling}Ao=null}}else Ao=Io?Wr(e.stateNode.nextSibling):null;return!0}function Wo(){Ao=Io=null,Fo=!1}var qo=[];function Ho(){for(var e=0;e<qo.length;e++)qo[e]._workInProgressVersionPrimary=null;qo.length=0}var Qo=S.ReactCurrentDispatcher,Ko=S.ReactCurrentBatchConfig,Go=0,Yo=null,Xo=null,Jo=null,Zo=!1,ea=!1;function ta(){throw Error(a(321))}function na(e,t){if(null===t)return!1;for(var n=0;n<t.length&&n<e.length;n++)if(!ar(e[n],t[n]))return!1;return!0}function ra(e,t,n,r,i,o){if(Go=o,Yo=t,t.memoizedState=null,t.updateQueue=null,t.lanes=0,Qo.current=null===e||null===e.memoizedState?Ta:_a,e=n(r,i),ea){o=0;do{if(ea=!1,!(25>o))throw Error(a(301));o+=1,Jo=Xo=null,t.updateQueue=null,Qo.current=Na,e=n(r,i)}while(ea)}if(Qo.current=ja,t=null!==Xo&&null!==Xo.next,Go=0,Jo=Xo=Yo=null,Zo=!1,t)throw Error(a(300));return e}function ia(){var e={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return null===Jo?Yo.memoizedState=Jo=e:Jo=Jo.next=e,Jo}function oa(){if(null===Xo){var e=Yo.alternate;e=null!==e?e.memoizedState:null}else e=Xo.next;var t=null===Jo?Yo.memoizedState:Jo.next;if(null!==t)Jo=t,Xo=e;else{if(null===e)throw Error(a(310));e={memoizedState:(Xo=e).memoizedState,baseState:Xo.baseState,baseQueue:Xo.baseQueue,queue:Xo.queue,next:null},null===Jo?Yo.memoizedState=Jo=e:Jo=Jo.next=e}return Jo}function aa(e,t){return"function"==typeof t?t(e):t}function la(e){var t=oa(),n=t.queue;if(null===n)throw Error(a(311));n.lastRenderedReducer=e;var r=Xo,i=r.baseQueue,o=n.pending;if(null!==o){if(null!==i){var l=i.next;i.next=o.next,o.next=l}r.baseQueue=i=o,n.pending=null}if(null!==i){i=i.next,r=r.baseState;var s=l=o=null,u=i;do{var c=u.lane;if((Go&c)===c)null!==s&&(s=s.next={lane:0,action:u.action,eagerReducer:u.eagerReducer,eagerState:u.eagerState,next:null}),r=u.eagerReducer===e?u.eagerState:e(r,u.action);else{var d={lane:c,action:u.action,eagerReducer:u.eagerReducer,eagerState:u.eagerState,next:null};null===s?(l=s=d,o=r):s=s.next=d,Yo.lanes|=c,Ll|=c}u=u.next}while(null!==u&&u!==i);null===s?o=r:s.next=l,ar(r,t.memoizedState)||(Ma=!0),t.memoizedState=r,t.baseState=o,t.baseQueue=s,n.lastRenderedState=r}return[t.memoizedState,n.dispatch]}function sa(e){var t=oa(),n=t.queue;if(null===n)throw Error(a(311));n.lastRenderedReducer=e;var r=n.dispatch,i=n.pending,o=t.memoizedState;if(null!==i){n.pending=null;var l=i=i.next;do{o=e(o,l.action),l=l.next}while(l!==i);ar(o,t.memoizedState)||(Ma=!0),t.memoizedState=o,null===t.baseQueue&&(t.baseState=o),n.lastRenderedState=o}return[o,r]}function ua(e,t,n){var r=t._getVersion;r=r(t._source);var i=t._workInProgressVersionPrimary;if(null!==i?e=i===r:(e=e.mutableReadLanes,(e=(Go&e)===e)&&(t._workInProgressVersionPrimary=r,qo.push(t))),e)return n(t._source);throw qo.push(t),Error(a(350))}function ca(e,t,n,r){var i=Pl;if(null===i)throw Error(a(349));var o=t._getVersion,l=o(t._source),s=Qo.current,u=s.useState((function(){return ua(i,t,n)})),c=u[1],d=u[0];u=Jo;var f=e.memoizedState,p=f.refs,h=p.getSnapshot,v=f.source;f=f.subscribe;var m=Yo;return e.memoizedState={refs:p,source:t,subscribe:r},s.useEffect((function(){p.getSnapshot=n,p.setSnapshot=c;var e=o(t._source);if(!ar(l,e)){e=n(t._source),ar(d,e)||(c(e),e=ls(m),i.mutableReadLanes|=e&i.pendingLanes),e=i.mutableReadLanes,i.entangledLanes|=e;for(var r=i.entanglements,a=e;0<a;){var s=31-Bt(a),u=1<<s;r[s]|=e,a&=~u}}}),[n,t,r]),s.useEffect((function(){return r(t._source,(function(){var e=p.getSnapshot,n=p.setSnapshot;try{n(e(t._source));var r=ls(m);i.mutableReadLanes|=r&i.pendingLanes}catch(e){n((function(){throw e}))}}))}),[t,r]),ar(h,n)&&ar(v,t)&&ar(f,r)||((e={pending:null,dispatch:null,lastRenderedReducer:aa,lastRenderedState:d}).dispatch=c=Pa.bind(null,Yo,e),u.queue=e,u.baseQueue=null,d=ua(i,t,n),u.memoizedState=u.baseState=d),d}function da(e,t,n){return ca(oa(),e,t,n)}function fa(e){var t=ia();return"function"==typeof e&&(e=e()),t.memoizedState=t.baseState=e,e=(e=t.queue={pending:null,dispatch:null,lastRenderedReducer:aa,lastRenderedState:e}).dispatch=Pa.bind(null,Yo,e),[t.memoizedState,e]}function pa(e,t,n,r){return e={tag:e,create:t,destroy:n,deps:r,next:null},null===(t=Yo.updateQueue)?(t={lastEffect:null},Yo.updateQueue=t,t.lastEffect=e.next=e):null===(n=t.lastEffect)?t.lastEffect=e.next=e:(r=n.next,n.next=e,e.next=r,t.lastEffect=e),e}function ha(e){return e={current:e},ia().memoizedState=e}function va(){return oa().memoizedState}function ma(e,t,n,r){var i=ia();Yo.flags|=e,i.memoizedState=pa(1|t,n,void 0,void 0===r?null:r)}function ga(e,t,n,r){var i=oa();r=void 0===r?null:r;var o=void 0;if(null!==Xo){var a=Xo.memoizedState;if(o=a.destroy,null!==r&&na(r,a.deps))return void pa(t,n,o,r)}Yo.flags|=e,i.memoizedState=pa(1|t,n,o,r)}function ya(e,t){return ma(516,4,e,t)}function ba(e,t){return ga(516,4,e,t)}function wa(e,t){return ga(4,2,e,t)}function Sa(e,t){return"function"==typeof t?(e=e(),t(e),function(){t(null)}):null!=t?(e=e(),t.current=e,function(){t.current=null}):void 0}function ka(e,t,n){return n=null!=n?n.concat([e]):null,ga(4,2,Sa.bind(null,t,e),n)}function xa(){}function Ea(e,t){var n=oa();t=void 0===t?null:t;var r=n.memoizedState;return null!==r&&null!==t&&na(t,r[1])?r[0]:(n.memoizedState=[e,t],e)}function Ca(e,t){var n=oa();t=void 0===t?null:t;var r=n.memoizedState;return null!==r&&null!==t&&na(t,r[1])?r[0]:(e=e(),n.memoizedState=[e,t],e)}function Oa(e,t){var n=Ui();Vi(98>n?98:n,(function(){e(!0)})),Vi(97<n?97:n,(function(){var n=Ko.transition;Ko.transition=1;try{e(!1),t()}finally{Ko.transition=n}}))}function Pa(e,t,n){var r=as(),i=ls(e),o={lane:i,action:n,eagerReducer:null,eagerState:null,next:null},a=t.pending;if(null===a?o.next=o:(o.next=a.next,a.next=o),t.pending=o,a=e.alternate,e===Yo||null!==a&&a===Yo)ea=Zo=!0;else{if(0===e.lanes&&(null===a||0===a.lanes)&&null!==(a=t.lastRenderedReducer))try{var l=t.lastRenderedState,s=a(l,n);if(o.eagerReducer=a,o.eagerState=s,ar(s,l))return}catch(e){}ss(e,i,r)}}var ja={readContext:no,useCallback:ta,useContext:ta,useEffect:ta,useImperativeHandle:ta,useLayoutEffect:ta,useMemo:ta,useReducer:ta,useRef:ta,useState:ta,useDebugValue:ta,useDeferredValue:ta,useTransition:ta,useMutableSource:ta,useOpaqueIdentifier:ta,unstable_isNewReconciler:!1},Ta={readContext:no,useCallback:function(e,t){return ia().memoizedState=[e,void 0===t?null:t],e},useContext:no,useEffect:ya,useImperativeHandle:function(e,t,n){return n=null!=n?n.concat([e]):null,ma(4,2,Sa.bind(null,t,e),n)},useLayoutEffect:function(e,t){return ma(4,2,e,t)},useMemo:function(e,t){var n=ia();return t=void 0===t?null:t,e=e(),n.memoizedState=[e,t],e},useReducer:function(e,t,n){var r=ia();return t=void 0!==n?n(t):t,r.memoizedState=r.baseState=t,e=(e=r.queue={pending:null,dispatch:null,lastRenderedReducer:e,lastRenderedState:t}).dispatch=Pa.bind(null,Yo,e),[r.memoizedState,e]},useRef:ha,useState:fa,useDebugValue:xa,useDeferredValue:function(e){var t=fa(e),n=t[0],r=t[1];return ya((function(){var t=Ko.transition;Ko.transition=1;try{r(e)}finally{Ko.transition=t}}),[e]),n},useTransition:function(){var e=fa(!1),t=e[0];return ha(e=Oa.bind(null,e[1])),[e,t]},useMutableSource:function(e,t,n){var r=ia();return r.memoizedState={refs:{getSnapshot:t,setSnapshot:null},source:e,subscribe:n},ca(r,e,t,n)},useOpaqueIdentifier:function(){if(Fo){var e=!1,t=function(e){return{$$typeof:L,toString:e,valueOf:e}}((function(){throw e||(e=!0,n("r:"+(Hr++).toString(36))),Error(a(355))})),n=fa(t)[1];return 0==(2&Yo.mode)&&(Yo.flags|=516,pa(5,(function(){n("r:"+(Hr++).toString(36))}),void 0,null)),t}return fa(t="r:"+(Hr++).toString(36)),t},unstable_isNewReconciler:!1},_a={readContext:no,useCallback:Ea,useContext:no,useEffect:ba,useImperativeHandle:ka,useLayoutEffect:wa,useMemo:Ca,useReducer:la,useRef:va,useState:function(){return la(aa)},useDebugValue:xa,useDeferredValue:function(e){var t=la(aa),n=t[0],r=t[1];return ba((function(){var t=Ko.transition;Ko.transition=1;try{r(e)}finally{Ko.transition=t}}),[e]),n},useTransition:function(){var e=la(aa)[0];return[va().current,e]},useMutableSource:da,useOpaqueIdentifier:function(){return la(aa)[0]},unstable_isNewReconciler:!1},Na={readContext:no,useCallback:Ea,useContext:no,useEffect:ba,useImperativeHandle:ka,useLayoutEffect:wa,useMemo:Ca,useReducer:sa,useRef:va,useState:function(){return sa(aa)},useDebugValue:xa,useDeferredValue:function(e){var t=sa(aa),n=t[0],r=t[1];return ba((function(){var t=Ko.transition;Ko.transition=1;try{r(e)}finally{Ko.transition=t}}),[e]),n},useTransition:function(){var e=sa(aa)[0];return[va().current,e]},useMutableSource:da,useOpaqueIdentifier:function(){return sa(aa)[0]},unstable_isNewReconciler:!1},Ra=S.ReactCurrentOwner,Ma=!1;function Da(e,t,n,r){t.child=null===e?Eo(t,null,n,r):xo(t,e.child,n,r)}function La(e,t,n,r,i){n=n.render;var o=t.ref;return to(t,i),r=ra(e,t,n,r,o,i),null===e||Ma?(t.flags|=1,Da(e,t,r,i),t.child):(t.updateQueue=e.updateQueue,t.flags&=-517,e.lanes&=~i,Za(e,t,i))}function Ia(e,t,n,r,i,o){if(null===e){var a=n.type;return"function"!=typeof a||zs(a)||void 0!==a.defaultProps||null!==n.compare||void 0!==n.defaultProps?((e=$s(n.type,null,r,t,t.mode,o)).ref=t.ref,e.return=t,t.child=e):(t.tag=15,t.type=a,Aa(e,t,a,r,i,o))}return a=e.child,0==(i&o)&&(i=a.memoizedProps,(n=null!==(n=n.compare)?n:sr)(i,r)&&e.ref===t.ref)?Za(e,t,o):(t.flags|=1,(e=Us(a,r)).ref=t.ref,e.return=t,t.child=e)}function Aa(e,t,n,r,i,o){if(null!==e&&sr(e.memoizedProps,r)&&e.ref===t.ref){if(Ma=!1,0==(o&i))return t.lanes=e.lanes,Za(e,t,o);0!=(16384&e.flags)&&(Ma=!0)}return Ua(e,t,n,r,o)}function Fa(e,t,n){var r=t.pendingProps,i=r.children,o=null!==e?e.memoizedState:null;if("hidden"===r.mode||"unstable-defer-without-hiding"===r.mode)if(0==(4&t.mode))t.memoizedState={baseLanes:0},ms(0,n);else{if(0==(1073741824&n))return e=null!==o?o.baseLanes|n:n,t.lanes=t.childLanes=1073741824,t.memoizedState={baseLanes:e},ms(0,e),null;t.memoizedState={baseLanes:0},ms(0,null!==o?o.baseLanes:n)}else null!==o?(r=o.baseLanes|n,t.memoizedState=null):r=n,ms(0,r);return Da(e,t,i,n),t.child}function za(e,t){var n=t.ref;(null===e&&null!==n||null!==e&&e.ref!==n)&&(t.flags|=128)}function Ua(e,t,n,r,i){var o=pi(n)?di:ui.current;return o=fi(t,o),to(t,i),n=ra(e,t,n,r,o,i),null===e||Ma?(t.flags|=1,Da(e,t,n,i),t.child):(t.updateQueue=e.updateQueue,t.flags&=-517,e.lanes&=~i,Za(e,t,i))}function $a(e,t,n,r,i){if(pi(n)){var o=!0;gi(t)}else o=!1;if(to(t,i),null===t.stateNode)null!==e&&(e.alternate=null,t.alternate=null,t.flags|=2),mo(t,n,r),yo(t,n,r,i),r=!0;else if(null===e){var a=t.stateNode,l=t.memoizedProps;a.props=l;var s=a.context,u=n.contextType;u="object"==typeof u&&null!==u?no(u):fi(t,u=pi(n)?di:ui.current);var c=n.getDerivedStateFromProps,d="function"==typeof c||"function"==typeof a.getSnapshotBeforeUpdate;d||"function"!=typeof a.UNSAFE_componentWillReceiveProps&&"function"!=typeof a.componentWillReceiveProps||(l!==r||s!==u)&&go(t,a,r,u),ro=!1;var f=t.memoizedState;a.state=f,uo(t,r,a,i),s=t.memoizedState,l!==r||f!==s||ci.current||ro?("function"==typeof c&&(po(t,n,c,r),s=t.memoizedState),(l=ro||vo(t,n,l,r,f,s,u))?(d||"function"!=typeof a.UNSAFE_componentWillMount&&"function"!=typeof a.componentWillMount||("function"==typeof a.componentWillMount&&a.componentWillMount(),"function"==typeof a.UNSAFE_componentWillMount&&a.UNSAFE_componentWillMount()),"function"==typeof a.componentDidMount&&(t.flags|=4)):("function"==typeof a.componentDidMount&&(t.flags|=4),t.memoizedProps=r,t.memoizedState=s),a.props=r,a.state=s,a.context=u,r=l):("function"==typeof a.componentDidMount&&(t.flags|=4),r=!1)}else{a=t.stateNode,oo(e,t),l=t.memoizedProps,u=t.type===t.elementType?l:Qi(t.type,l),a.props=u,d=t.pendingProps,f=a.context,s="object"==typeof(s=n.contextType)&&null!==s?no(s):fi(t,s=pi(n)?di:ui.current);var p=n.getDerivedStateFromProps;(c="function"==typeof p||"function"==typeof a.getSnapshotBeforeUpdate)||"function"!=typeof a.UNSAFE_componentWillReceiveProps&&"function"!=typeof a.componentWillReceiveProps||(l!==d||f!==s)&&go(t,a,r,s),ro=!1,f=t.memoizedState,a.state=f,uo(t,r,a,i);var h=t.memoizedState;l!==d||f!==h||ci.current||ro?("function"==typeof p&&(po(t,n,p,r),h=t.memoizedState),(u=ro||vo(t,n,u,r,f,h,s))?(c||"function"!=typeof a.UNSAFE_componentWillUpdate&&"function"!=typeof a.componentWillUpdate||("function"==typeof a.componentWillUpdate&&a.componentWillUpdate(r,h,s),"function"==typeof a.UNSAFE_componentWillUpdate&&a.UNSAFE_componentWillUpdate(r,h,s)),"function"==typeof a.componentDidUpdate&&(t.flags|=4),"function"==typeof a.getSnapshotBeforeUpdate&&(t.flags|=256)):("function"!=typeof a.componentDidUpdate||l===e.memoizedProps&&f===e.memoizedState||(t.flags|=4),"function"!=typeof a.getSnapshotBeforeUpdate||l===e.memoizedProps&&f===e.memoizedState||(t.flags|=256),t.memoizedProps=r,t.memoizedState=h),a.props=r,a.state=h,a.context=s,r=u):("function"!=typeof a.componentDidUpdate||l===e.memoizedProps&&f===e.memoizedState||(t.flags|=4),"function"!=typeof a.getSnapshotBeforeUpdate||l===e.memoizedProps&&f===e.memoizedState||(t.flags|=256),r=!1)}return Va(e,t,n,r,o,i)}function Va(e,t,n,r,i,o){za(e,t);var a=0!=(64&t.flags);if(!r&&!a)return i&&yi(t,n,!1),Za(e,t,o);r=t.stateNode,Ra.current=t;var l=a&&"function"!=typeof n.getDerivedStateFromError?null:r.render();return t.flags|=1,null!==e&&a?(t.child=xo(t,e.child,null,o),t.child=xo(t,null,l,o)):Da(e,t,l,o),t.memoizedState=r.state,i&&yi(t,n,!0),t.child}function Ba(e){var t=e.stateNode;t.pendingContext?vi(0,t.pendingContext,t.pendingContext!==t.context):t.context&&vi(0,t.context,!1),_o(e,t.containerInfo)}var Wa,qa,Ha,Qa={dehydrated:null,retryLane:0};function Ka(e,t,n){var r,i=t.pendingProps,o=Do.current,a=!1;return(r=0!=(64&t.flags))||(r=(null===e||null!==e.memoizedState)&&0!=(2&o)),r?(a=!0,t.flags&=-65):null!==e&&null===e.memoizedState||void 0===i.fallback||!0===i.unstable_avoidThisFallback||(o|=1),li(Do,1&o),null===e?(void 0!==i.fallback&&$o(t),e=i.children,o=i.fallback,a?(e=Ga(t,e,o,n),t.child.memoizedState={baseLanes:n},t.memoizedState=Qa,e):"number"==typeof i.unstable_expectedLoadTime?(e=Ga(t,e,o,n),t.child.memoizedState={baseLanes:n},t.memoizedState=Qa,t.lanes=33554432,e):((n=Bs({mode:"visible",children:e},t.mode,n,null)).return=t,t.child=n)):(e.memoizedState,a?(i=function(e,t,n,r,i){var o=t.mode,a=e.child;e=a.sibling;var l={mode:"hidden",children:n};return 0==(2&o)&&t.child!==a?((n=t.child).childLanes=0,n.pendingProps=l,null!==(a=n.lastEffect)?(t.firstEffect=n.firstEffect,t.lastEffect=a,a.nextEffect=null):t.firstEffect=t.lastEffect=null):n=Us(a,l),null!==e?r=Us(e,r):(r=Vs(r,o,i,null)).flags|=2,r.return=t,n.return=t,n.sibling=r,t.child=n,r}(e,t,i.children,i.fallback,n),a=t.child,o=e.child.memoizedState,a.memoizedState=null===o?{baseLanes:n}:{baseLanes:o.baseLanes|n},a.childLanes=e.childLanes&~n,t.memoizedState=Qa,i):(n=function(e,t,n,r){var i=e.child;return e=i.sibling,n=Us(i,{mode:"visible",children:n}),0==(2&t.mode)&&(n.lanes=r),n.return=t,n.sibling=null,null!==e&&(e.nextEffect=null,e.flags=8,t.firstEffect=t.lastEffect=e),t.child=n}(e,t,i.children,n),t.memoizedState=null,n))}function Ga(e,t,n,r){var i=e.mode,o=e.child;return t={mode:"hidden",children:t},0==(2&i)&&null!==o?(o.childLanes=0,o.pendingProps=t):o=Bs(t,i,0,null),n=Vs(n,i,r,null),o.return=e,n.return=e,o.sibling=n,e.child=o,n}function Ya(e,t){e.lanes|=t;var n=e.alternate;null!==n&&(n.lanes|=t),eo(e.return,t)}function Xa(e,t,n,r,i,o){var a=e.memoizedState;null===a?e.memoizedState={isBackwards:t,rendering:null,renderingStartTime:0,last:r,tail:n,tailMode:i,lastEffect:o}:(a.isBackwards=t,a.rendering=null,a.renderingStartTime=0,a.last=r,a.tail=n,a.tailMode=i,a.lastEffect=o)}function Ja(e,t,n){var r=t.pendingProps,i=r.revealOrder,o=r.tail;if(Da(e,t,r.children,n),0!=(2&(r=Do.current)))r=1&r|2,t.flags|=64;else{if(null!==e&&0!=(64&e.flags))e:for(e=t.child;null!==e;){if(13===e.tag)null!==e.memoizedState&&Ya(e,n);else if(19===e.tag)Ya(e,n);else if(null!==e.child){e.child.return=e,e=e.child;continue}if(e===t)break e;for(;null===e.sibling;){if(null===e.return||e.return===t)break e;e=e.return}e.sibling.return=e.return,e=e.sibling}r&=1}if(li(Do,r),0==(2&t.mode))t.memoizedState=null;else switch(i){case"forwards":for(n=t.child,i=null;null!==n;)null!==(e=n.alternate)&&null===Lo(e)&&(i=n),n=n.sibling;null===(n=i)?(i=t.child,t.child=null):(i=n.sibling,n.sibling=null),Xa(t,!1,i,n,o,t.lastEffect);break;case"backwards":for(n=null,i=t.child,t.child=null;null!==i;){if(null!==(e=i.alternate)&&null===Lo(e)){t.child=i;break}e=i.sibling,i.sibling=n,n=i,i=e}Xa(t,!0,n,null,o,t.lastEffect);break;case"together":Xa(t,!1,null,null,void 0,t.lastEffect);break;default:t.memoizedState=null}return t.child}function Za(e,t,n){if(null!==e&&(t.dependencies=e.dependencies),Ll|=t.lanes,0!=(n&t.childLanes)){if(null!==e&&t.child!==e.child)throw Error(a(153));if(null!==t.child){for(n=Us(e=t.child,e.pendingProps),t.child=n,n.return=t;null!==e.sibling;)e=e.sibling,(n=n.sibling=Us(e,e.pendingProps)).return=t;n.sibling=null}return t.child}return null}function el(e,t){if(!Fo)switch(e.tailMode){case"hidden":t=e.tail;for(var n=null;null!==t;)null!==t.alternate&&(n=t),t=t.sibling;null===n?e.tail=null:n.sibling=null;break;case"collapsed":n=e.tail;for(var r=null;null!==n;)null!==n.alternate&&(r=n),n=n.sibling;null===r?t||null===e.tail?e.tail=null:e.tail.sibling=null:r.sibling=null}}function tl(e,t,n){var r=t.pendingProps;switch(t.tag){case 2:case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:return null;case 1:return pi(t.type)&&hi(),null;case 3:return No(),ai(ci),ai(ui),Ho(),(r=t.stateNode).pendingContext&&(r.context=r.pendingContext,r.pendingContext=null),null!==e&&null!==e.child||(Bo(t)?t.flags|=4:r.hydrate||(t.flags|=256)),null;case 5:Mo(t);var o=To(jo.current);if(n=t.type,null!==e&&null!=t.stateNode)qa(e,t,n,r),e.ref!==t.ref&&(t.flags|=128);else{if(!r){if(null===t.stateNode)throw Error(a(166));return null}if(e=To(Oo.current),Bo(t)){r=t.stateNode,n=t.type;var l=t.memoizedProps;switch(r[Kr]=t,r[Gr]=l,n){case"dialog":Or("cancel",r),Or("close",r);break;case"iframe":case"object":case"embed":Or("load",r);break;case"video":case"audio":for(e=0;e<kr.length;e++)Or(kr[e],r);break;case"source":Or("error",r);break;case"img":case"image":case"link":Or("error",r),Or("load",r);break;case"details":Or("toggle",r);break;case"input":ee(r,l),Or("invalid",r);break;case"select":r._wrapperState={wasMultiple:!!l.multiple},Or("invalid",r);break;case"textarea":se(r,l),Or("invalid",r)}for(var u in xe(n,l),e=null,l)l.hasOwnProperty(u)&&(o=l[u],"children"===u?"string"==typeof o?r.textContent!==o&&(e=["children",o]):"number"==typeof o&&r.textContent!==""+o&&(e=["children",""+o]):s.hasOwnProperty(u)&&null!=o&&"onScroll"===u&&Or("scroll",r));switch(n){case"input":Y(r),re(r,l,!0);break;case"textarea":Y(r),ce(r);break;case"select":case"option":break;default:"function"==typeof l.onClick&&(r.onclick=Ir)}r=e,t.updateQueue=r,null!==r&&(t.flags|=4)}else{switch(u=9===o.nodeType?o:o.ownerDocument,e===de&&(e=fe(n)),e===de?"script"===n?((e=u.createElement("div")).innerHTML="<script><\/script>",e=e.removeChild(e.firstChild)):"string"==typeof r.is?e=u.createElement(n,{is:r.is}):(e=u.createElement(n),"select"===n&&(u=e,r.multiple?u.multiple=!0:r.size&&(u.size=r.size))):e=u.createElementNS(e,n),e[Kr]=t,e[Gr]=r,Wa(e,t),t.stateNode=e,u=Ee(n,r),n){case"dialog":Or("cancel",e),Or("close",e),o=r;break;case"iframe":case"object":case"embed":Or("load",e),o=r;break;case"video":case"audio":for(o=0;o<kr.length;o++)Or(kr[o],e);o=r;break;case"source":Or("error",e),o=r;break;case"img":case"image":case"link":Or("error",e),Or("load",e),o=r;break;case"details":Or("toggle",e),o=r;break;case"input":ee(e,r),o=Z(e,r),Or("invalid",e);break;case"option":o=oe(e,r);break;case"select":e._wrapperState={wasMultiple:!!r.multiple},o=i({},r,{value:void 0}),Or("invalid",e);break;case"textarea":se(e,r),o=le(e,r),Or("invalid",e);break;default:o=r}xe(n,o);var c=o;for(l in c)if(c.hasOwnProperty(l)){var d=c[l];"style"===l?Se(e,d):"dangerouslySetInnerHTML"===l?null!=(d=d?d.__html:void 0)&&me(e,d):"children"===l?"string"==typeof d?("textarea"!==n||""!==d)&&ge(e,d):"number"==typeof d&&ge(e,""+d):"suppressContentEditableWarning"!==l&&"suppressHydrationWarning"!==l&&"autoFocus"!==l&&(s.hasOwnProperty(l)?null!=d&&"onScroll"===l&&Or("scroll",e):null!=d&&w(e,l,d,u))}switch(n){case"input":Y(e),re(e,r,!1);break;case"textarea":Y(e),ce(e);break;case"option":null!=r.value&&e.setAttribute("value",""+K(r.value));break;case"select":e.multiple=!!r.multiple,null!=(l=r.value)?ae(e,!!r.multiple,l,!1):null!=r.defaultValue&&ae(e,!!r.multiple,r.defaultValue,!0);break;default:"function"==typeof o.onClick&&(e.onclick=Ir)}zr(n,r)&&(t.flags|=4)}null!==t.ref&&(t.flags|=128)}return null;case 6:if(e&&null!=t.stateNode)Ha(0,t,e.memoizedProps,r);else{if("string"!=typeof r&&null===t.stateNode)throw Error(a(166));n=To(jo.current),To(Oo.current),Bo(t)?(r=t.stateNode,n=t.memoizedProps,r[Kr]=t,r.nodeValue!==n&&(t.flags|=4)):((r=(9===n.nodeType?n:n.ownerDocument).createTextNode(r))[Kr]=t,t.stateNode=r)}return null;case 13:return ai(Do),r=t.memoizedState,0!=(64&t.flags)?(t.lanes=n,t):(r=null!==r,n=!1,null===e?void 0!==t.memoizedProps.fallback&&Bo(t):n=null!==e.memoizedState,r&&!n&&0!=(2&t.mode)&&(null===e&&!0!==t.memoizedProps.unstable_avoidThisFallback||0!=(1&Do.current)?0===Rl&&(Rl=3):(0!==Rl&&3!==Rl||(Rl=4),null===Pl||0==(134217727&Ll)&&0==(134217727&Il)||fs(Pl,Tl))),(r||n)&&(t.flags|=4),null);case 4:return No(),null===e&&jr(t.stateNode.containerInfo),null;case 10:return Zi(t),null;case 17:return pi(t.type)&&hi(),null;case 19:if(ai(Do),null===(r=t.memoizedState))return null;if(l=0!=(64&t.flags),null===(u=r.rendering))if(l)el(r,!1);else{if(0!==Rl||null!==e&&0!=(64&e.flags))for(e=t.child;null!==e;){if(null!==(u=Lo(e))){for(t.flags|=64,el(r,!1),null!==(l=u.updateQueue)&&(t.updateQueue=l,t.flags|=4),null===r.lastEffect&&(t.firstEffect=null),t.lastEffect=r.lastEffect,r=n,n=t.child;null!==n;)e=r,(l=n).flags&=2,l.nextEffect=null,l.firstEffect=null,l.lastEffect=null,null===(u=l.alternate)?(l.childLanes=0,l.lanes=e,l.child=null,l.memoizedProps=null,l.memoizedState=null,l.updateQueue=null,l.dependencies=null,l.stateNode=null):(l.childLanes=u.childLanes,l.lanes=u.lanes,l.child=u.child,l.memoizedProps=u.memoizedProps,l.memoizedState=u.memoizedState,l.updateQueue=u.updateQueue,l.type=u.type,e=u.dependencies,l.dependencies=null===e?null:{lanes:e.lanes,firstContext:e.firstContext}),n=n.sibling;return li(Do,1&Do.current|2),t.child}e=e.sibling}null!==r.tail&&zi()>Ul&&(t.flags|=64,l=!0,el(r,!1),t.lanes=33554432)}else{if(!l)if(null!==(e=Lo(u))){if(t.flags|=64,l=!0,null!==(n=e.updateQueue)&&(t.updateQueue=n,t.flags|=4),el(r,!0),null===r.tail&&"hidden"===r.tailMode&&!u.alternate&&!Fo)return null!==(t=t.lastEffect=r.lastEffect)&&(t.nextEffect=null),null}else 2*zi()-r.renderingStartTime>Ul&&1073741824!==n&&(t.flags|=64,l=!0,el(r,!1),t.lanes=33554432);r.isBackwards?(u.sibling=t.child,t.child=u):(null!==(n=r.last)?n.sibling=u:t.child=u,r.last=u)}return null!==r.tail?(n=r.tail,r.rendering=n,r.tail=n.sibling,r.lastEffect=t.lastEffect,r.renderingStartTime=zi(),n.sibling=null,t=Do.current,li(Do,l?1&t|2:1&t),n):null;case 23:case 24:return gs(),null!==e&&null!==e.memoizedState!=(null!==t.memoizedState)&&"unstable-defer-without-hiding"!==r.mode&&(t.flags|=4),null}throw Error(a(156,t.tag))}function nl(e){switch(e.tag){case 1:pi(e.type)&&hi();var t=e.flags;return 4096&t?(e.flags=-4097&t|64,e):null;case 3:if(No(),ai(ci),ai(ui),Ho(),0!=(64&(t=e.flags)))throw Error(a(285));return e.flags=-4097&t|64,e;case 5:return Mo(e),null;case 13:return ai(Do),4096&(t=e.flags)?(e.flags=-4097&t|64,e):null;case 19:return ai(Do),null;case 4:return No(),null;case 10:return Zi(e),null;case 23:case 24:return gs(),null;default:return null}}function rl(e,t){try{var n="",r=t;do{n+=H(r),r=r.return}while(r);var i=n}catch(e){i="\nError generating stack: "+e.message+"\n"+e.stack}return{value:e,source:t,stack:i}}function il(e,t){try{console.error(t.value)}catch(e){setTimeout((function(){throw e}))}}Wa=function(e,t){for(var n=t.child;null!==n;){if(5===n.tag||6===n.tag)e.appendChild(n.stateNode);else if(4!==n.tag&&null!==n.child){n.child.return=n,n=n.child;continue}if(n===t)break;for(;null===n.sibling;){if(null===n.return||n.return===t)return;n=n.return}n.sibling.return=n.return,n=n.sibling}},qa=function(e,t,n,r){var o=e.memoizedProps;if(o!==r){e=t.stateNode,To(Oo.current);var a,l=null;switch(n){case"input":o=Z(e,o),r=Z(e,r),l=[];break;case"option":o=oe(e,o),r=oe(e,r),l=[];break;case"select":o=i({},o,{value:void 0}),r=i({},r,{value:void 0}),l=[];break;case"textarea":o=le(e,o),r=le(e,r),l=[];break;default:"function"!=typeof o.onClick&&"function"==typeof r.onClick&&(e.onclick=Ir)}for(d in xe(n,r),n=null,o)if(!r.hasOwnProperty(d)&&o.hasOwnProperty(d)&&null!=o[d])if("style"===d){var u=o[d];for(a in u)u.hasOwnProperty(a)&&(n||(n={}),n[a]="")}else"dangerouslySetInnerHTML"!==d&&"children"!==d&&"suppressContentEditableWarning"!==d&&"suppressHydrationWarning"!==d&&"autoFocus"!==d&&(s.hasOwnProperty(d)?l||(l=[]):(l=l||[]).push(d,null));for(d in r){var c=r[d];if(u=null!=o?o[d]:void 0,r.hasOwnProperty(d)&&c!==u&&(null!=c||null!=u))if("style"===d)if(u){for(a in u)!u.hasOwnProperty(a)||c&&c.hasOwnProperty(a)||(n||(n={}),n[a]="");for(a in c)c.hasOwnProperty(a)&&u[a]!==c[a]&&(n||(n={}),n[a]=c[a])}else n||(l||(l=[]),l.push(d,n)),n=c;else"dangerouslySetInnerHTML"===d?(c=c?c.__html:void 0,u=u?u.__html:void 0,null!=c&&u!==c&&(l=l||[]).push(d,c)):"children"===d?"string"!=typeof c&&"number"!=typeof c||(l=l||[]).push(d,""+c):"suppressContentEditableWarning"!==d&&"suppressHydrationWarning"!==d&&(s.hasOwnProperty(d)?(null!=c&&"onScroll"===d&&Or("scroll",e),l||u===c||(l=[])):"object"==typeof c&&null!==c&&c.$$typeof===L?c.toString():(l=l||[]).push(d,c))}n&&(l=l||[]).push("style",n);var d=l;(t.updateQueue=d)&&(t.flags|=4)}},Ha=function(e,t,n,r){n!==r&&(t.flags|=4)};var ol="function"==typeof WeakMap?WeakMap:Map;function al(e,t,n){(n=ao(-1,n)).tag=3,n.payload={element:null};var r=t.value;return n.callback=function(){Wl||(Wl=!0,ql=r),il(0,t)},n}function ll(e,t,n){(n=ao(-1,n)).tag=3;var r=e.type.getDerivedStateFromError;if("function"==typeof r){var i=t.value;n.payload=function(){return il(0,t),r(i)}}var o=e.stateNode;return null!==o&&"function"==typeof o.componentDidCatch&&(n.callback=function(){"function"!=typeof r&&(null===Hl?Hl=new Set([this]):Hl.add(this),il(0,t));var e=t.stack;this.componentDidCatch(t.value,{componentStack:null!==e?e:""})}),n}var sl="function"==typeof WeakSet?WeakSet:Set;function ul(e){var t=e.ref;if(null!==t)if("function"==typeof t)try{t(null)}catch(t){Ds(e,t)}else t.current=null}function cl(e,t){switch(t.tag){case 0:case 11:case 15:case 22:return;case 1:if(256&t.flags&&null!==e){var n=e.memoizedProps,r=e.memoizedState;t=(e=t.stateNode).getSnapshotBeforeUpdate(t.elementType===t.type?n:Qi(t.type,n),r),e.__reactInternalSnapshotBeforeUpdate=t}return;case 3:return void(256&t.flags&&Br(t.stateNode.containerInfo));case 5:case 6:case 4:case 17:return}throw Error(a(163))}function dl(e,t,n){switch(n.tag){case 0:case 11:case 15:case 22:if(null!==(t=null!==(t=n.updateQueue)?t.lastEffect:null)){e=t=t.next;do{if(3==(3&e.tag)){var r=e.create;e.destroy=r()}e=e.next}while(e!==t)}if(null!==(t=null!==(t=n.updateQueue)?t.lastEffect:null)){e=t=t.next;do{var i=e;r=i.next,0!=(4&(i=i.tag))&&0!=(1&i)&&(Ns(n,e),_s(n,e)),e=r}while(e!==t)}return;case 1:return e=n.stateNode,4&n.flags&&(null===t?e.componentDidMount():(r=n.elementType===n.type?t.memoizedProps:Qi(n.type,t.memoizedProps),e.componentDidUpdate(r,t.memoizedState,e.__reactInternalSnapshotBeforeUpdate))),void(null!==(t=n.updateQueue)&&co(n,t,e));case 3:if(null!==(t=n.updateQueue)){if(e=null,null!==n.child)switch(n.child.tag){case 5:e=n.child.stateNode;break;case 1:e=n.child.stateNode}co(n,t,e)}return;case 5:return e=n.stateNode,void(null===t&&4&n.flags&&zr(n.type,n.memoizedProps)&&e.focus());case 6:case 4:case 12:return;case 13:return void(null===n.memoizedState&&(n=n.alternate,null!==n&&(n=n.memoizedState,null!==n&&(n=n.dehydrated,null!==n&&St(n)))));case 19:case 17:case 20:case 21:case 23:case 24:return}throw Error(a(163))}function fl(e,t){for(var n=e;;){if(5===n.tag){var r=n.stateNode;if(t)"function"==typeof(r=r.style).setProperty?r.setProperty("display","none","important"):r.display="none";else{r=n.stateNode;var i=n.memoizedProps.style;i=null!=i&&i.hasOwnProperty("display")?i.display:null,r.style.display=we("display",i)}}else if(6===n.tag)n.stateNode.nodeValue=t?"":n.memoizedProps;else if((23!==n.tag&&24!==n.tag||null===n.memoizedState||n===e)&&null!==n.child){n.child.return=n,n=n.child;continue}if(n===e)break;for(;null===n.sibling;){if(null===n.return||n.return===e)return;n=n.return}n.sibling.return=n.return,n=n.sibling}}function pl(e,t){if(wi&&"function"==typeof wi.onCommitFiberUnmount)try{wi.onCommitFiberUnmount(bi,t)}catch(e){}switch(t.tag){case 0:case 11:case 14:case 15:case 22:if(null!==(e=t.updateQueue)&&null!==(e=e.lastEffect)){var n=e=e.next;do{var r=n,i=r.destroy;if(r=r.tag,void 0!==i)if(0!=(4&r))Ns(t,n);else{r=t;try{i()}catch(e){Ds(r,e)}}n=n.next}while(n!==e)}break;case 1:if(ul(t),"function"==typeof(e=t.stateNode).componentWillUnmount)try{e.props=t.memoizedProps,e.state=t.memoizedState,e.componentWillUnmount()}catch(e){Ds(t,e)}break;case 5:ul(t);break;case 4:bl(e,t)}}function hl(e){e.alternate=null,e.child=null,e.dependencies=null,e.firstEffect=null,e.lastEffect=null,e.memoizedProps=null,e.memoizedState=null,e.pendingProps=null,e.return=null,e.updateQueue=null}function vl(e){return 5===e.tag||3===e.tag||4===e.tag}function ml(e){e:{for(var t=e.return;null!==t;){if(vl(t))break e;t=t.return}throw Error(a(160))}var n=t;switch(t=n.stateNode,n.tag){case 5:var r=!1;break;case 3:case 4:t=t.containerInfo,r=!0;break;default:throw Error(a(161))}16&n.flags&&(ge(t,""),n.flags&=-17);e:t:for(n=e;;){for(;null===n.sibling;){if(null===n.return||vl(n.return)){n=null;break e}n=n.return}for(n.sibling.return=n.return,n=n.sibling;5!==n.tag&&6!==n.tag&&18!==n.tag;){if(2&n.flags)continue t;if(null===n.child||4===n.tag)continue t;n.child.return=n,n=n.child}if(!(2&n.flags)){n=n.stateNode;break e}}r?gl(e,n,t):yl(e,n,t)}function gl(e,t,n){var r=e.tag,i=5===r||6===r;if(i)e=i?e.stateNode:e.stateNode.instance,t?8===n.nodeType?n.parentNode.insertBefore(e,t):n.insertBefore(e,t):(8===n.nodeType?(t=n.parentNode).insertBefore(e,n):(t=n).appendChild(e),null!=(n=n._reactRootContainer)||null!==t.onclick||(t.onclick=Ir));else if(4!==r&&null!==(e=e.child))for(gl(e,t,n),e=e.sibling;null!==e;)gl(e,t,n),e=e.sibling}function yl(e,t,n){var r=e.tag,i=5===r||6===r;if(i)e=i?e.stateNode:e.stateNode.instance,t?n.insertBefore(e,t):n.appendChild(e);else if(4!==r&&null!==(e=e.child))for(yl(e,t,n),e=e.sibling;null!==e;)yl(e,t,n),e=e.sibling}function bl(e,t){for(var n,r,i=t,o=!1;;){if(!o){o=i.return;e:for(;;){if(null===o)throw Error(a(160));switch(n=o.stateNode,o.tag){case 5:r=!1;break e;case 3:case 4:n=n.containerInfo,r=!0;break e}o=o.return}o=!0}if(5===i.tag||6===i.tag){e:for(var l=e,s=i,u=s;;)if(pl(l,u),null!==u.child&&4!==u.tag)u.child.return=u,u=u.child;else{if(u===s)break e;for(;null===u.sibling;){if(null===u.return||u.return===s)break e;u=u.return}u.sibling.return=u.return,u=u.sibling}r?(l=n,s=i.stateNode,8===l.nodeType?l.parentNode.removeChild(s):l.removeChild(s)):n.removeChild(i.stateNode)}else if(4===i.tag){if(null!==i.child){n=i.stateNode.containerInfo,r=!0,i.child.return=i,i=i.child;continue}}else if(pl(e,i),null!==i.child){i.child.return=i,i=i.child;continue}if(i===t)break;for(;null===i.sibling;){if(null===i.return||i.return===t)return;4===(i=i.return).tag&&(o=!1)}i.sibling.return=i.return,i=i.sibling}}function wl(e,t){switch(t.tag){case 0:case 11:case 14:case 15:case 22:var n=t.updateQueue;if(null!==(n=null!==n?n.lastEffect:null)){var r=n=n.next;do{3==(3&r.tag)&&(e=r.destroy,r.destroy=void 0,void 0!==e&&e()),r=r.next}while(r!==n)}return;case 1:return;case 5:if(null!=(n=t.stateNode)){r=t.memoizedProps;var i=null!==e?e.memoizedProps:r;e=t.type;var o=t.updateQueue;if(t.updateQueue=null,null!==o){for(n[Gr]=r,"input"===e&&"radio"===r.type&&null!=r.name&&te(n,r),Ee(e,i),t=Ee(e,r),i=0;i<o.length;i+=2){var l=o[i],s=o[i+1];"style"===l?Se(n,s):"dangerouslySetInnerHTML"===l?me(n,s):"children"===l?ge(n,s):w(n,l,s,t)}switch(e){case"input":ne(n,r);break;case"textarea":ue(n,r);break;case"select":e=n._wrapperState.wasMultiple,n._wrapperState.wasMultiple=!!r.multiple,null!=(o=r.value)?ae(n,!!r.multiple,o,!1):e!==!!r.multiple&&(null!=r.defaultValue?ae(n,!!r.multiple,r.defaultValue,!0):ae(n,!!r.multiple,r.multiple?[]:"",!1))}}}return;case 6:if(null===t.stateNode)throw Error(a(162));return void(t.stateNode.nodeValue=t.memoizedProps);case 3:return void((n=t.stateNode).hydrate&&(n.hydrate=!1,St(n.containerInfo)));case 12:return;case 13:return null!==t.memoizedState&&(zl=zi(),fl(t.child,!0)),void Sl(t);case 19:return void Sl(t);case 17:return;case 23:case 24:return void fl(t,null!==t.memoizedState)}throw Error(a(163))}function Sl(e){var t=e.updateQueue;if(null!==t){e.updateQueue=null;var n=e.stateNode;null===n&&(n=e.stateNode=new sl),t.forEach((function(t){var r=Is.bind(null,e,t);n.has(t)||(n.add(t),t.then(r,r))}))}}function kl(e,t){return null!==e&&(null===(e=e.memoizedState)||null!==e.dehydrated)&&null!==(t=t.memoizedState)&&null===t.dehydrated}var xl=Math.ceil,El=S.ReactCurrentDispatcher,Cl=S.ReactCurrentOwner,Ol=0,Pl=null,jl=null,Tl=0,_l=0,Nl=oi(0),Rl=0,Ml=null,Dl=0,Ll=0,Il=0,Al=0,Fl=null,zl=0,Ul=1/0;function $l(){Ul=zi()+500}var Vl,Bl=null,Wl=!1,ql=null,Hl=null,Ql=!1,Kl=null,Gl=90,Yl=[],Xl=[],Jl=null,Zl=0,es=null,ts=-1,ns=0,rs=0,is=null,os=!1;function as(){return 0!=(48&Ol)?zi():-1!==ts?ts:ts=zi()}function ls(e){if(0==(2&(e=e.mode)))return 1;if(0==(4&e))return 99===Ui()?1:2;if(0===ns&&(ns=Dl),0!==Hi.transition){0!==rs&&(rs=null!==Fl?Fl.pendingLanes:0),e=ns;var t=4186112&~rs;return 0==(t&=-t)&&0==(t=(e=4186112&~e)&-e)&&(t=8192),t}return e=Ui(),e=zt(0!=(4&Ol)&&98===e?12:e=function(e){switch(e){case 99:return 15;case 98:return 10;case 97:case 96:return 8;case 95:return 2;default:return 0}}(e),ns)}function ss(e,t,n){if(50<Zl)throw Zl=0,es=null,Error(a(185));if(null===(e=us(e,t)))return null;Vt(e,t,n),e===Pl&&(Il|=t,4===Rl&&fs(e,Tl));var r=Ui();1===t?0!=(8&Ol)&&0==(48&Ol)?ps(e):(cs(e,n),0===Ol&&($l(),Wi())):(0==(4&Ol)||98!==r&&99!==r||(null===Jl?Jl=new Set([e]):Jl.add(e)),cs(e,n)),Fl=e}function us(e,t){e.lanes|=t;var n=e.alternate;for(null!==n&&(n.lanes|=t),n=e,e=e.return;null!==e;)e.childLanes|=t,null!==(n=e.alternate)&&(n.childLanes|=t),n=e,e=e.return;return 3===n.tag?n.stateNode:null}function cs(e,t){for(var n=e.callbackNode,r=e.suspendedLanes,i=e.pingedLanes,o=e.expirationTimes,l=e.pendingLanes;0<l;){var s=31-Bt(l),u=1<<s,c=o[s];if(-1===c){if(0==(u&r)||0!=(u&i)){c=t,It(u);var d=Lt;o[s]=10<=d?c+250:6<=d?c+5e3:-1}}else c<=t&&(e.expiredLanes|=u);l&=~u}if(r=At(e,e===Pl?Tl:0),t=Lt,0===r)null!==n&&(n!==Mi&&xi(n),e.callbackNode=null,e.callbackPriority=0);else{if(null!==n){if(e.callbackPriority===t)return;n!==Mi&&xi(n)}15===t?(n=ps.bind(null,e),null===Li?(Li=[n],Ii=ki(ji,qi)):Li.push(n),n=Mi):n=14===t?Bi(99,ps.bind(null,e)):Bi(n=function(e){switch(e){case 15:case 14:return 99;case 13:case 12:case 11:case 10:return 98;case 9:case 8:case 7:case 6:case 4:case 5:return 97;case 3:case 2:case 1:return 95;case 0:return 90;default:throw Error(a(358,e))}}(t),ds.bind(null,e)),e.callbackPriority=t,e.callbackNode=n}}function ds(e){if(ts=-1,rs=ns=0,0!=(48&Ol))throw Error(a(327));var t=e.callbackNode;if(Ts()&&e.callbackNode!==t)return null;var n=At(e,e===Pl?Tl:0);if(0===n)return null;var r=n,i=Ol;Ol|=16;var o=ws();for(Pl===e&&Tl===r||($l(),ys(e,r));;)try{xs();break}catch(t){bs(e,t)}if(Ji(),El.current=o,Ol=i,null!==jl?r=0:(Pl=null,Tl=0,r=Rl),0!=(Dl&Il))ys(e,0);else if(0!==r){if(2===r&&(Ol|=64,e.hydrate&&(e.hydrate=!1,Br(e.containerInfo)),0!==(n=Ft(e))&&(r=Ss(e,n))),1===r)throw t=Ml,ys(e,0),fs(e,n),cs(e,zi()),t;switch(e.finishedWork=e.current.alternate,e.finishedLanes=n,r){case 0:case 1:throw Error(a(345));case 2:Os(e);break;case 3:if(fs(e,n),(62914560&n)===n&&10<(r=zl+500-zi())){if(0!==At(e,0))break;if(((i=e.suspendedLanes)&n)!==n){as(),e.pingedLanes|=e.suspendedLanes&i;break}e.timeoutHandle=$r(Os.bind(null,e),r);break}Os(e);break;case 4:if(fs(e,n),(4186112&n)===n)break;for(r=e.eventTimes,i=-1;0<n;){var l=31-Bt(n);o=1<<l,(l=r[l])>i&&(i=l),n&=~o}if(n=i,10<(n=(120>(n=zi()-n)?120:480>n?480:1080>n?1080:1920>n?1920:3e3>n?3e3:4320>n?4320:1960*xl(n/1960))-n)){e.timeoutHandle=$r(Os.bind(null,e),n);break}Os(e);break;case 5:Os(e);break;default:throw Error(a(329))}}return cs(e,zi()),e.callbackNode===t?ds.bind(null,e):null}function fs(e,t){for(t&=~Al,t&=~Il,e.suspendedLanes|=t,e.pingedLanes&=~t,e=e.expirationTimes;0<t;){var n=31-Bt(t),r=1<<n;e[n]=-1,t&=~r}}function ps(e){if(0!=(48&Ol))throw Error(a(327));if(Ts(),e===Pl&&0!=(e.expiredLanes&Tl)){var t=Tl,n=Ss(e,t);0!=(Dl&Il)&&(n=Ss(e,t=At(e,t)))}else n=Ss(e,t=At(e,0));if(0!==e.tag&&2===n&&(Ol|=64,e.hydrate&&(e.hydrate=!1,Br(e.containerInfo)),0!==(t=Ft(e))&&(n=Ss(e,t))),1===n)throw n=Ml,ys(e,0),fs(e,t),cs(e,zi()),n;return e.finishedWork=e.current.alternate,e.finishedLanes=t,Os(e),cs(e,zi()),null}function hs(e,t){var n=Ol;Ol|=1;try{return e(t)}finally{0===(Ol=n)&&($l(),Wi())}}function vs(e,t){var n=Ol;Ol&=-2,Ol|=8;try{return e(t)}finally{0===(Ol=n)&&($l(),Wi())}}function ms(e,t){li(Nl,_l),_l|=t,Dl|=t}function gs(){_l=Nl.current,ai(Nl)}function ys(e,t){e.finishedWork=null,e.finishedLanes=0;var n=e.timeoutHandle;if(-1!==n&&(e.timeoutHandle=-1,Vr(n)),null!==jl)for(n=jl.return;null!==n;){var r=n;switch(r.tag){case 1:null!=(r=r.type.childContextTypes)&&hi();break;case 3:No(),ai(ci),ai(ui),Ho();break;case 5:Mo(r);break;case 4:No();break;case 13:case 19:ai(Do);break;case 10:Zi(r);break;case 23:case 24:gs()}n=n.return}Pl=e,jl=Us(e.current,null),Tl=_l=Dl=t,Rl=0,Ml=null,Al=Il=Ll=0}function bs(e,t){for(;;){var n=jl;try{if(Ji(),Qo.current=ja,Zo){for(var r=Yo.memoizedState;null!==r;){var i=r.queue;null!==i&&(i.pending=null),r=r.next}Zo=!1}if(Go=0,Jo=Xo=Yo=null,ea=!1,Cl.current=null,null===n||null===n.return){Rl=1,Ml=t,jl=null;break}e:{var o=e,a=n.return,l=n,s=t;if(t=Tl,l.flags|=2048,l.firstEffect=l.lastEffect=null,null!==s&&"object"==typeof s&&"function"==typeof s.then){var u=s;if(0==(2&l.mode)){var c=l.alternate;c?(l.updateQueue=c.updateQueue,l.memoizedState=c.memoizedState,l.lanes=c.lanes):(l.updateQueue=null,l.memoizedState=null)}var d=0!=(1&Do.current),f=a;do{var p;if(p=13===f.tag){var h=f.memoizedState;if(null!==h)p=null!==h.dehydrated;else{var v=f.memoizedProps;p=void 0!==v.fallback&&(!0!==v.unstable_avoidThisFallback||!d)}}if(p){var m=f.updateQueue;if(null===m){var g=new Set;g.add(u),f.updateQueue=g}else m.add(u);if(0==(2&f.mode)){if(f.flags|=64,l.flags|=16384,l.flags&=-2981,1===l.tag)if(null===l.alternate)l.tag=17;else{var y=ao(-1,1);y.tag=2,lo(l,y)}l.lanes|=1;break e}s=void 0,l=t;var b=o.pingCache;if(null===b?(b=o.pingCache=new ol,s=new Set,b.set(u,s)):void 0===(s=b.get(u))&&(s=new Set,b.set(u,s)),!s.has(l)){s.add(l);var w=Ls.bind(null,o,u,l);u.then(w,w)}f.flags|=4096,f.lanes=t;break e}f=f.return}while(null!==f);s=Error((Q(l.type)||"A React component")+" suspended while rendering, but no fallback UI was specified.\n\nAdd a <Suspense fallback=...> component higher in the tree to provide a loading indicator or placeholder to display.")}5!==Rl&&(Rl=2),s=rl(s,l),f=a;do{switch(f.tag){case 3:o=s,f.flags|=4096,t&=-t,f.lanes|=t,so(f,al(0,o,t));break e;case 1:o=s;var S=f.type,k=f.stateNode;if(0==(64&f.flags)&&("function"==typeof S.getDerivedStateFromError||null!==k&&"function"==typeof k.componentDidCatch&&(null===Hl||!Hl.has(k)))){f.flags|=4096,t&=-t,f.lanes|=t,so(f,ll(f,o,t));break e}}f=f.return}while(null!==f)}Cs(n)}catch(e){t=e,jl===n&&null!==n&&(jl=n=n.return);continue}break}}function ws(){var e=El.current;return El.current=ja,null===e?ja:e}function Ss(e,t){var n=Ol;Ol|=16;var r=ws();for(Pl===e&&Tl===t||ys(e,t);;)try{ks();break}catch(t){bs(e,t)}if(Ji(),Ol=n,El.current=r,null!==jl)throw Error(a(261));return Pl=null,Tl=0,Rl}function ks(){for(;null!==jl;)Es(jl)}function xs(){for(;null!==jl&&!Ei();)Es(jl)}function Es(e){var t=Vl(e.alternate,e,_l);e.memoizedProps=e.pendingProps,null===t?Cs(e):jl=t,Cl.current=null}function Cs(e){var t=e;do{var n=t.alternate;if(e=t.return,0==(2048&t.flags)){if(null!==(n=tl(n,t,_l)))return void(jl=n);if(24!==(n=t).tag&&23!==n.tag||null===n.memoizedState||0!=(1073741824&_l)||0==(4&n.mode)){for(var r=0,i=n.child;null!==i;)r|=i.lanes|i.childLanes,i=i.sibling;n.childLanes=r}null!==e&&0==(2048&e.flags)&&(null===e.firstEffect&&(e.firstEffect=t.firstEffect),null!==t.lastEffect&&(null!==e.lastEffect&&(e.lastEffect.nextEffect=t.firstEffect),e.lastEffect=t.lastEffect),1<t.flags&&(null!==e.lastEffect?e.lastEffect.nextEffect=t:e.firstEffect=t,e.lastEffect=t))}else{if(null!==(n=nl(t)))return n.flags&=2047,void(jl=n);null!==e&&(e.firstEffect=e.lastEffect=null,e.flags|=2048)}if(null!==(t=t.sibling))return void(jl=t);jl=t=e}while(null!==t);0===Rl&&(Rl=5)}function Os(e){var t=Ui();return Vi(99,Ps.bind(null,e,t)),null}function Ps(e,t){do{Ts()}while(null!==Kl);if(0!=(48&Ol))throw Error(a(327));var n=e.finishedWork;if(null===n)return null;if(e.finishedWork=null,e.finishedLanes=0,n===e.current)throw Error(a(177));e.callbackNode=null;var r=n.lanes|n.childLanes,i=r,o=e.pendingLanes&~i;e.pendingLanes=i,e.suspendedLanes=0,e.pingedLanes=0,e.expiredLanes&=i,e.mutableReadLanes&=i,e.entangledLanes&=i,i=e.entanglements;for(var l=e.eventTimes,s=e.expirationTimes;0<o;){var u=31-Bt(o),c=1<<u;i[u]=0,l[u]=-1,s[u]=-1,o&=~c}if(null!==Jl&&0==(24&r)&&Jl.has(e)&&Jl.delete(e),e===Pl&&(jl=Pl=null,Tl=0),1<n.flags?null!==n.lastEffect?(n.lastEffect.nextEffect=n,r=n.firstEffect):r=n:r=n.firstEffect,null!==r){if(i=Ol,Ol|=32,Cl.current=null,Ar=Kt,pr(l=fr())){if("selectionStart"in l)s={start:l.selectionStart,end:l.selectionEnd};else e:if(s=(s=l.ownerDocument)&&s.defaultView||window,(c=s.getSelection&&s.getSelection())&&0!==c.rangeCount){s=c.anchorNode,o=c.anchorOffset,u=c.focusNode,c=c.focusOffset;try{s.nodeType,u.nodeType}catch(e){s=null;break e}var d=0,f=-1,p=-1,h=0,v=0,m=l,g=null;t:for(;;){for(var y;m!==s||0!==o&&3!==m.nodeType||(f=d+o),m!==u||0!==c&&3!==m.nodeType||(p=d+c),3===m.nodeType&&(d+=m.nodeValue.length),null!==(y=m.firstChild);)g=m,m=y;for(;;){if(m===l)break t;if(g===s&&++h===o&&(f=d),g===u&&++v===c&&(p=d),null!==(y=m.nextSibling))break;g=(m=g).parentNode}m=y}s=-1===f||-1===p?null:{start:f,end:p}}else s=null;s=s||{start:0,end:0}}else s=null;Fr={focusedElem:l,selectionRange:s},Kt=!1,is=null,os=!1,Bl=r;do{try{js()}catch(e){if(null===Bl)throw Error(a(330));Ds(Bl,e),Bl=Bl.nextEffect}}while(null!==Bl);is=null,Bl=r;do{try{for(l=e;null!==Bl;){var b=Bl.flags;if(16&b&&ge(Bl.stateNode,""),128&b){var w=Bl.alternate;if(null!==w){var S=w.ref;null!==S&&("function"==typeof S?S(null):S.current=null)}}switch(1038&b){case 2:ml(Bl),Bl.flags&=-3;break;case 6:ml(Bl),Bl.flags&=-3,wl(Bl.alternate,Bl);break;case 1024:Bl.flags&=-1025;break;case 1028:Bl.flags&=-1025,wl(Bl.alternate,Bl);break;case 4:wl(Bl.alternate,Bl);break;case 8:bl(l,s=Bl);var k=s.alternate;hl(s),null!==k&&hl(k)}Bl=Bl.nextEffect}}catch(e){if(null===Bl)throw Error(a(330));Ds(Bl,e),Bl=Bl.nextEffect}}while(null!==Bl);if(S=Fr,w=fr(),b=S.focusedElem,l=S.selectionRange,w!==b&&b&&b.ownerDocument&&dr(b.ownerDocument.documentElement,b)){null!==l&&pr(b)&&(w=l.start,void 0===(S=l.end)&&(S=w),"selectionStart"in b?(b.selectionStart=w,b.selectionEnd=Math.min(S,b.value.length)):(S=(w=b.ownerDocument||document)&&w.defaultView||window).getSelection&&(S=S.getSelection(),s=b.textContent.length,k=Math.min(l.start,s),l=void 0===l.end?k:Math.min(l.end,s),!S.extend&&k>l&&(s=l,l=k,k=s),s=cr(b,k),o=cr(b,l),s&&o&&(1!==S.rangeCount||S.anchorNode!==s.node||S.anchorOffset!==s.offset||S.focusNode!==o.node||S.focusOffset!==o.offset)&&((w=w.createRange()).setStart(s.node,s.offset),S.removeAllRanges(),k>l?(S.addRange(w),S.extend(o.node,o.offset)):(w.setEnd(o.node,o.offset),S.addRange(w))))),w=[];for(S=b;S=S.parentNode;)1===S.nodeType&&w.push({element:S,left:S.scrollLeft,top:S.scrollTop});for("function"==typeof b.focus&&b.focus(),b=0;b<w.length;b++)(S=w[b]).element.scrollLeft=S.left,S.element.scrollTop=S.top}Kt=!!Ar,Fr=Ar=null,e.current=n,Bl=r;do{try{for(b=e;null!==Bl;){var x=Bl.flags;if(36&x&&dl(b,Bl.alternate,Bl),128&x){w=void 0;var E=Bl.ref;if(null!==E){var C=Bl.stateNode;switch(Bl.tag){case 5:w=C;break;default:w=C}"function"==typeof E?E(w):E.current=w}}Bl=Bl.nextEffect}}catch(e){if(null===Bl)throw Error(a(330));Ds(Bl,e),Bl=Bl.nextEffect}}while(null!==Bl);Bl=null,Di(),Ol=i}else e.current=n;if(Ql)Ql=!1,Kl=e,Gl=t;else for(Bl=r;null!==Bl;)t=Bl.nextEffect,Bl.nextEffect=null,8&Bl.flags&&((x=Bl).sibling=null,x.stateNode=null),Bl=t;if(0===(r=e.pendingLanes)&&(Hl=null),1===r?e===es?Zl++:(Zl=0,es=e):Zl=0,n=n.stateNode,wi&&"function"==typeof wi.onCommitFiberRoot)try{wi.onCommitFiberRoot(bi,n,void 0,64==(64&n.current.flags))}catch(e){}if(cs(e,zi()),Wl)throw Wl=!1,e=ql,ql=null,e;return 0!=(8&Ol)||Wi(),null}function js(){for(;null!==Bl;){var e=Bl.alternate;os||null===is||(0!=(8&Bl.flags)?Ze(Bl,is)&&(os=!0):13===Bl.tag&&kl(e,Bl)&&Ze(Bl,is)&&(os=!0));var t=Bl.flags;0!=(256&t)&&cl(e,Bl),0==(512&t)||Ql||(Ql=!0,Bi(97,(function(){return Ts(),null}))),Bl=Bl.nextEffect}}function Ts(){if(90!==Gl){var e=97<Gl?97:Gl;return Gl=90,Vi(e,Rs)}return!1}function _s(e,t){Yl.push(t,e),Ql||(Ql=!0,Bi(97,(function(){return Ts(),null})))}function Ns(e,t){Xl.push(t,e),Ql||(Ql=!0,Bi(97,(function(){return Ts(),null})))}function Rs(){if(null===Kl)return!1;var e=Kl;if(Kl=null,0!=(48&Ol))throw Error(a(331));var t=Ol;Ol|=32;var n=Xl;Xl=[];for(var r=0;r<n.length;r+=2){var i=n[r],o=n[r+1],l=i.destroy;if(i.destroy=void 0,"function"==typeof l)try{l()}catch(e){if(null===o)throw Error(a(330));Ds(o,e)}}for(n=Yl,Yl=[],r=0;r<n.length;r+=2){i=n[r],o=n[r+1];try{var s=i.create;i.destroy=s()}catch(e){if(null===o)throw Error(a(330));Ds(o,e)}}for(s=e.current.firstEffect;null!==s;)e=s.nextEffect,s.nextEffect=null,8&s.flags&&(s.sibling=null,s.stateNode=null),s=e;return Ol=t,Wi(),!0}function Ms(e,t,n){lo(e,t=al(0,t=rl(n,t),1)),t=as(),null!==(e=us(e,1))&&(Vt(e,1,t),cs(e,t))}function Ds(e,t){if(3===e.tag)Ms(e,e,t);else for(var n=e.return;null!==n;){if(3===n.tag){Ms(n,e,t);break}if(1===n.tag){var r=n.stateNode;if("function"==typeof n.type.getDerivedStateFromError||"function"==typeof r.componentDidCatch&&(null===Hl||!Hl.has(r))){var i=ll(n,e=rl(t,e),1);if(lo(n,i),i=as(),null!==(n=us(n,1)))Vt(n,1,i),cs(n,i);else if("function"==typeof r.componentDidCatch&&(null===Hl||!Hl.has(r)))try{r.componentDidCatch(t,e)}catch(e){}break}}n=n.return}}function Ls(e,t,n){var r=e.pingCache;null!==r&&r.delete(t),t=as(),e.pingedLanes|=e.suspendedLanes&n,Pl===e&&(Tl&n)===n&&(4===Rl||3===Rl&&(62914560&Tl)===Tl&&500>zi()-zl?ys(e,0):Al|=n),cs(e,t)}function Is(e,t){var n=e.stateNode;null!==n&&n.delete(t),0==(t=0)&&(0==(2&(t=e.mode))?t=1:0==(4&t)?t=99===Ui()?1:2:(0===ns&&(ns=Dl),0===(t=Ut(62914560&~ns))&&(t=4194304))),n=as(),null!==(e=us(e,t))&&(Vt(e,t,n),cs(e,n))}function As(e,t,n,r){this.tag=e,this.key=n,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.ref=null,this.pendingProps=t,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=r,this.flags=0,this.lastEffect=this.firstEffect=this.nextEffect=null,this.childLanes=this.lanes=0,this.alternate=null}function Fs(e,t,n,r){return new As(e,t,n,r)}function zs(e){return!(!(e=e.prototype)||!e.isReactComponent)}function Us(e,t){var n=e.alternate;return null===n?((n=Fs(e.tag,t,e.key,e.mode)).elementType=e.elementType,n.type=e.type,n.stateNode=e.stateNode,n.alternate=e,e.alternate=n):(n.pendingProps=t,n.type=e.type,n.flags=0,n.nextEffect=null,n.firstEffect=null,n.lastEffect=null),n.childLanes=e.childLanes,n.lanes=e.lanes,n.child=e.child,n.memoizedProps=e.memoizedProps,n.memoizedState=e.memoizedState,n.updateQueue=e.updateQueue,t=e.dependencies,n.dependencies=null===t?null:{lanes:t.lanes,firstContext:t.firstContext},n.sibling=e.sibling,n.index=e.index,n.ref=e.ref,n}function $s(e,t,n,r,i,o){var l=2;if(r=e,"function"==typeof e)zs(e)&&(l=1);else if("string"==typeof e)l=5;else e:switch(e){case E:return Vs(n.children,i,o,t);case I:l=8,i|=16;break;case C:l=8,i|=1;break;case O:return(e=Fs(12,n,t,8|i)).elementType=O,e.type=O,e.lanes=o,e;case _:return(e=Fs(13,n,t,i)).type=_,e.elementType=_,e.lanes=o,e;case N:return(e=Fs(19,n,t,i)).elementType=N,e.lanes=o,e;case A:return Bs(n,i,o,t);case F:return(e=Fs(24,n,t,i)).elementType=F,e.lanes=o,e;default:if("object"==typeof e&&null!==e)switch(e.$$typeof){case P:l=10;break e;case j:l=9;break e;case T:l=11;break e;case R:l=14;break e;case M:l=16,r=null;break e;case D:l=22;break e}throw Error(a(130,null==e?e:typeof e,""))}return(t=Fs(l,n,t,i)).elementType=e,t.type=r,t.lanes=o,t}function Vs(e,t,n,r){return(e=Fs(7,e,r,t)).lanes=n,e}function Bs(e,t,n,r){return(e=Fs(23,e,r,t)).elementType=A,e.lanes=n,e}function Ws(e,t,n){return(e=Fs(6,e,null,t)).lanes=n,e}function qs(e,t,n){return(t=Fs(4,null!==e.children?e.children:[],e.key,t)).lanes=n,t.stateNode={containerInfo:e.containerInfo,pendingChildren:null,implementation:e.implementation},t}function Hs(e,t,n){this.tag=t,this.containerInfo=e,this.finishedWork=this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.pendingContext=this.context=null,this.hydrate=n,this.callbackNode=null,this.callbackPriority=0,this.eventTimes=$t(0),this.expirationTimes=$t(-1),this.entangledLanes=this.finishedLanes=this.mutableReadLanes=this.expiredLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=$t(0),this.mutableSourceEagerHydrationData=null}function Qs(e,t,n){var r=3<arguments.length&&void 0!==arguments[3]?arguments[3]:null;return{$$typeof:x,key:null==r?null:""+r,children:e,containerInfo:t,implementation:n}}function Ks(e,t,n,r){var i=t.current,o=as(),l=ls(i);e:if(n){t:{if(Ge(n=n._reactInternals)!==n||1!==n.tag)throw Error(a(170));var s=n;do{switch(s.tag){case 3:s=s.stateNode.context;break t;case 1:if(pi(s.type)){s=s.stateNode.__reactInternalMemoizedMergedChildContext;break t}}s=s.return}while(null!==s);throw Error(a(171))}if(1===n.tag){var u=n.type;if(pi(u)){n=mi(n,u,s);break e}}n=s}else n=si;return null===t.context?t.context=n:t.pendingContext=n,(t=ao(o,l)).payload={element:e},null!==(r=void 0===r?null:r)&&(t.callback=r),lo(i,t),ss(i,l,o),l}function Gs(e){if(!(e=e.current).child)return null;switch(e.child.tag){case 5:default:return e.child.stateNode}}function Ys(e,t){if(null!==(e=e.memoizedState)&&null!==e.dehydrated){var n=e.retryLane;e.retryLane=0!==n&&n<t?n:t}}function Xs(e,t){Ys(e,t),(e=e.alternate)&&Ys(e,t)}function Js(e,t,n){var r=null!=n&&null!=n.hydrationOptions&&n.hydrationOptions.mutableSources||null;if(n=new Hs(e,t,null!=n&&!0===n.hydrate),t=Fs(3,null,null,2===t?7:1===t?3:0),n.current=t,t.stateNode=n,io(t),e[Yr]=n.current,jr(8===e.nodeType?e.parentNode:e),r)for(e=0;e<r.length;e++){var i=(t=r[e])._getVersion;i=i(t._source),null==n.mutableSourceEagerHydrationData?n.mutableSourceEagerHydrationData=[t,i]:n.mutableSourceEagerHydrationData.push(t,i)}this._internalRoot=n}function Zs(e){return!(!e||1!==e.nodeType&&9!==e.nodeType&&11!==e.nodeType&&(8!==e.nodeType||" react-mount-point-unstable "!==e.nodeValue))}function eu(e,t,n,r,i){var o=n._reactRootContainer;if(o){var a=o._internalRoot;if("function"==typeof i){var l=i;i=function(){var e=Gs(a);l.call(e)}}Ks(t,a,e,i)}else{if(o=n._reactRootContainer=function(e,t){if(t||(t=!(!(t=e?9===e.nodeType?e.documentElement:e.firstChild:null)||1!==t.nodeType||!t.hasAttribute("data-reactroot"))),!t)for(var n;n=e.lastChild;)e.removeChild(n);return new Js(e,0,t?{hydrate:!0}:void 0)}(n,r),a=o._internalRoot,"function"==typeof i){var s=i;i=function(){var e=Gs(a);s.call(e)}}vs((function(){Ks(t,a,e,i)}))}return Gs(a)}function tu(e,t){var n=2<arguments.length&&void 0!==arguments[2]?arguments[2]:null;if(!Zs(t))throw Error(a(200));return Qs(e,t,null,n)}Vl=function(e,t,n){var r=t.lanes;if(null!==e)if(e.memoizedProps!==t.pendingProps||ci.current)Ma=!0;else{if(0==(n&r)){switch(Ma=!1,t.tag){case 3:Ba(t),Wo();break;case 5:Ro(t);break;case 1:pi(t.type)&&gi(t);break;case 4:_o(t,t.stateNode.containerInfo);break;case 10:r=t.memoizedProps.value;var i=t.type._context;li(Ki,i._currentValue),i._currentValue=r;break;case 13:if(null!==t.memoizedState)return 0!=(n&t.child.childLanes)?Ka(e,t,n):(li(Do,1&Do.current),null!==(t=Za(e,t,n))?t.sibling:null);li(Do,1&Do.current);break;case 19:if(r=0!=(n&t.childLanes),0!=(64&e.flags)){if(r)return Ja(e,t,n);t.flags|=64}if(null!==(i=t.memoizedState)&&(i.rendering=null,i.tail=null,i.lastEffect=null),li(Do,Do.current),r)break;return null;case 23:case 24:return t.lanes=0,Fa(e,t,n)}return Za(e,t,n)}Ma=0!=(16384&e.flags)}else Ma=!1;switch(t.lanes=0,t.tag){case 2:if(r=t.type,null!==e&&(e.alternate=null,t.alternate=null,t.flags|=2),e=t.pendingProps,i=fi(t,ui.current),to(t,n),i=ra(null,t,r,e,i,n),t.flags|=1,"object"==typeof i&&null!==i&&"function"==typeof i.render&&void 0===i.$$typeof){if(t.tag=1,t.memoizedState=null,t.updateQueue=null,pi(r)){var o=!0;gi(t)}else o=!1;t.memoizedState=null!==i.state&&void 0!==i.state?i.state:null,io(t);var l=r.getDerivedStateFromProps;"function"==typeof l&&po(t,r,l,e),i.updater=ho,t.stateNode=i,i._reactInternals=t,yo(t,r,e,n),t=Va(null,t,r,!0,o,n)}else t.tag=0,Da(null,t,i,n),t=t.child;return t;case 16:i=t.elementType;e:{switch(null!==e&&(e.alternate=null,t.alternate=null,t.flags|=2),e=t.pendingProps,i=(o=i._init)(i._payload),t.type=i,o=t.tag=function(e){if("function"==typeof e)return zs(e)?1:0;if(null!=e){if((e=e.$$typeof)===T)return 11;if(e===R)return 14}return 2}(i),e=Qi(i,e),o){case 0:t=Ua(null,t,i,e,n);break e;case 1:t=$a(null,t,i,e,n);break e;case 11:t=La(null,t,i,e,n);break e;case 14:t=Ia(null,t,i,Qi(i.type,e),r,n);break e}throw Error(a(306,i,""))}return t;case 0:return r=t.type,i=t.pendingProps,Ua(e,t,r,i=t.elementType===r?i:Qi(r,i),n);case 1:return r=t.type,i=t.pendingProps,$a(e,t,r,i=t.elementType===r?i:Qi(r,i),n);case 3:if(Ba(t),r=t.updateQueue,null===e||null===r)throw Error(a(282));if(r=t.pendingProps,i=null!==(i=t.memoizedState)?i.element:null,oo(e,t),uo(t,r,null,n),(r=t.memoizedState.element)===i)Wo(),t=Za(e,t,n);else{if((o=(i=t.stateNode).hydrate)&&(Ao=Wr(t.stateNode.containerInfo.firstChild),Io=t,o=Fo=!0),o){if(null!=(e=i.mutableSourceEagerHydrationData))for(i=0;i<e.length;i+=2)(o=e[i])._workInProgressVersionPrimary=e[i+1],qo.push(o);for(n=Eo(t,null,r,n),t.child=n;n;)n.flags=-3&n.flags|1024,n=n.sibling}else Da(e,t,r,n),Wo();t=t.child}return t;case 5:return Ro(t),null===e&&$o(t),r=t.type,i=t.pendingProps,o=null!==e?e.memoizedProps:null,l=i.children,Ur(r,i)?l=null:null!==o&&Ur(r,o)&&(t.flags|=16),za(e,t),Da(e,t,l,n),t.child;case 6:return null===e&&$o(t),null;case 13:return Ka(e,t,n);case 4:return _o(t,t.stateNode.containerInfo),r=t.pendingProps,null===e?t.child=xo(t,null,r,n):Da(e,t,r,n),t.child;case 11:return r=t.type,i=t.pendingProps,La(e,t,r,i=t.elementType===r?i:Qi(r,i),n);case 7:return Da(e,t,t.pendingProps,n),t.child;case 8:case 12:return Da(e,t,t.pendingProps.children,n),t.child;case 10:e:{r=t.type._context,i=t.pendingProps,l=t.memoizedProps,o=i.value;var s=t.type._context;if(li(Ki,s._currentValue),s._currentValue=o,null!==l)if(s=l.value,0==(o=ar(s,o)?0:0|("function"==typeof r._calculateChangedBits?r._calculateChangedBits(s,o):1073741823))){if(l.children===i.children&&!ci.current){t=Za(e,t,n);break e}}else for(null!==(s=t.child)&&(s.return=t);null!==s;){var u=s.dependencies;if(null!==u){l=s.child;for(var c=u.firstContext;null!==c;){if(c.context===r&&0!=(c.observedBits&o)){1===s.tag&&((c=ao(-1,n&-n)).tag=2,lo(s,c)),s.lanes|=n,null!==(c=s.alternate)&&(c.lanes|=n),eo(s.return,n),u.lanes|=n;break}c=c.next}}else l=10===s.tag&&s.type===t.type?null:s.child;if(null!==l)l.return=s;else for(l=s;null!==l;){if(l===t){l=null;break}if(null!==(s=l.sibling)){s.return=l.return,l=s;break}l=l.return}s=l}Da(e,t,i.children,n),t=t.child}return t;case 9:return i=t.type,r=(o=t.pendingProps).children,to(t,n),r=r(i=no(i,o.unstable_observedBits)),t.flags|=1,Da(e,t,r,n),t.child;case 14:return o=Qi(i=t.type,t.pendingProps),Ia(e,t,i,o=Qi(i.type,o),r,n);case 15:return Aa(e,t,t.type,t.pendingProps,r,n);case 17:return r=t.type,i=t.pendingProps,i=t.elementType===r?i:Qi(r,i),null!==e&&(e.alternate=null,t.alternate=null,t.flags|=2),t.tag=1,pi(r)?(e=!0,gi(t)):e=!1,to(t,n),mo(t,r,i),yo(t,r,i,n),Va(null,t,r,!0,e,n);case 19:return Ja(e,t,n);case 23:case 24:return Fa(e,t,n)}throw Error(a(156,t.tag))},Js.prototype.render=function(e){Ks(e,this._internalRoot,null,null)},Js.prototype.unmount=function(){var e=this._internalRoot,t=e.containerInfo;Ks(null,e,null,(function(){t[Yr]=null}))},et=function(e){13===e.tag&&(ss(e,4,as()),Xs(e,4))},tt=function(e){13===e.tag&&(ss(e,67108864,as()),Xs(e,67108864))},nt=function(e){if(13===e.tag){var t=as(),n=ls(e);ss(e,n,t),Xs(e,n)}},rt=function(e,t){return t()},Oe=function(e,t,n){switch(t){case"input":if(ne(e,n),t=n.name,"radio"===n.type&&null!=t){for(n=e;n.parentNode;)n=n.parentNode;for(n=n.querySelectorAll("input[name="+JSON.stringify(""+t)+'][type="radio"]'),t=0;t<n.length;t++){var r=n[t];if(r!==e&&r.form===e.form){var i=ti(r);if(!i)throw Error(a(90));X(r),ne(r,i)}}}break;case"textarea":ue(e,n);break;case"select":null!=(t=n.value)&&ae(e,!!n.multiple,t,!1)}},Re=hs,Me=function(e,t,n,r,i){var o=Ol;Ol|=4;try{return Vi(98,e.bind(null,t,n,r,i))}finally{0===(Ol=o)&&($l(),Wi())}},De=function(){0==(49&Ol)&&(function(){if(null!==Jl){var e=Jl;Jl=null,e.forEach((function(e){e.expiredLanes|=24&e.pendingLanes,cs(e,zi())}))}Wi()}(),Ts())},Le=function(e,t){var n=Ol;Ol|=2;try{return e(t)}finally{0===(Ol=n)&&($l(),Wi())}};var nu={Events:[Zr,ei,ti,_e,Ne,Ts,{current:!1}]},ru={findFiberByHostInstance:Jr,bundleType:0,version:"17.0.1",rendererPackageName:"react-dom"},iu={bundleType:ru.bundleType,version:ru.version,rendererPackageName:ru.rendererPackageName,rendererConfig:ru.rendererConfig,overrideHookState:null,overrideHookStateDeletePath:null,overrideHookStateRenamePath:null,overrideProps:null,overridePropsDeletePath:null,overridePropsRenamePath:null,setSuspenseHandler:null,scheduleUpdate:null,currentDispatcherRef:S.ReactCurrentDispatcher,findHostInstanceByFiber:function(e){return null===(e=Je(e))?null:e.stateNode},findFiberByHostInstance:ru.findFiberByHostInstance||function(){return null},findHostInstancesForRefresh:null,scheduleRefresh:null,scheduleRoot:null,setRefreshHandler:null,getCurrentFiber:null};if("undefined"!=typeof __REACT_DEVTOOLS_GLOBAL_HOOK__){var ou=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!ou.isDisabled&&ou.supportsFiber)try{bi=ou.inject(iu),wi=ou}catch(ve){}}t.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=nu,t.createPortal=tu,t.findDOMNode=function(e){if(null==e)return null;if(1===e.nodeType)return e;var t=e._reactInternals;if(void 0===t){if("function"==typeof e.render)throw Error(a(188));throw Error(a(268,Object.keys(e)))}return null===(e=Je(t))?null:e.stateNode},t.flushSync=function(e,t){var n=Ol;if(0!=(48&n))return e(t);Ol|=1;try{if(e)return Vi(99,e.bind(null,t))}finally{Ol=n,Wi()}},t.hydrate=function(e,t,n){if(!Zs(t))throw Error(a(200));return eu(null,e,t,!0,n)},t.render=function(e,t,n){if(!Zs(t))throw Error(a(200));return eu(null,e,t,!1,n)},t.unmountComponentAtNode=function(e){if(!Zs(e))throw Error(a(40));return!!e._reactRootContainer&&(vs((function(){eu(null,null,e,!1,(function(){e._reactRootContainer=null,e[Yr]=null}))})),!0)},t.unstable_batchedUpdates=hs,t.unstable_createPortal=function(e,t){return tu(e,t,2<arguments.length&&void 0!==arguments[2]?arguments[2]:null)},t.unstable_renderSubtreeIntoContainer=function(e,t,n,r){if(!Zs(n))throw Error(a(200));if(null==e||void 0===e._reactInternals)throw Error(a(38));return eu(e,t,n,!1,r)},t.version="17.0.1"},935:(e,t,n)=>{"use strict";!function e(){if("undefined"!=typeof __REACT_DEVTOOLS_GLOBAL_HOOK__&&"function"==typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE)try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(e)}catch(e){console.error(e)}}(),e.exports=n(448)},921:(e,t)=>{"use strict";var n="function"==typeof Symbol&&Symbol.for,r=n?Symbol.for("react.element"):60103,i=n?Symbol.for("react.portal"):60106,o=n?Symbol.for("react.fragment"):60107,a=n?Symbol.for("react.strict_mode"):60108,l=n?Symbol.for("react.profiler"):60114,s=n?Symbol.for("react.provider"):60109,u=n?Symbol.for("react.context"):60110,c=n?Symbol.for("react.async_mode"):60111,d=n?Symbol.for("react.concurrent_mode"):60111,f=n?Symbol.for("react.forward_ref"):60112,p=n?Symbol.for("react.suspense"):60113,h=n?Symbol.for("react.suspense_list"):60120,v=n?Symbol.for("react.memo"):60115,m=n?Symbol.for("react.lazy"):60116,g=n?Symbol.for("react.block"):60121,y=n?Symbol.for("react.fundamental"):60117,b=n?Symbol.for("react.responder"):60118,w=n?Symbol.for("react.scope"):60119;function S(e){if("object"==typeof e&&null!==e){var t=e.$$typeof;switch(t){case r:switch(e=e.type){case c:case d:case o:case l:case a:case p:return e;default:switch(e=e&&e.$$typeof){case u:case f:case m:case v:case s:return e;default:return t}}case i:return t}}}function k(e){return S(e)===d}t.AsyncMode=c,t.ConcurrentMode=d,t.ContextConsumer=u,t.ContextProvider=s,t.Element=r,t.ForwardRef=f,t.Fragment=o,t.Lazy=m,t.Memo=v,t.Portal=i,t.Profiler=l,t.StrictMode=a,t.Suspense=p,t.isAsyncMode=function(e){return k(e)||S(e)===c},t.isConcurrentMode=k,t.isContextConsumer=function(e){return S(e)===u},t.isContextProvider=function(e){return S(e)===s},t.isElement=function(e){return"object"==typeof e&&null!==e&&e.$$typeof===r},t.isForwardRef=function(e){return S(e)===f},t.isFragment=function(e){return S(e)===o},t.isLazy=function(e){return S(e)===m},t.isMemo=function(e){return S(e)===v},t.isPortal=function(e){return S(e)===i},t.isProfiler=function(e){return S(e)===l},t.isStrictMode=function(e){return S(e)===a},t.isSuspense=function(e){return S(e)===p},t.isValidElementType=function(e){return"string"==typeof e||"function"==typeof e||e===o||e===d||e===l||e===a||e===p||e===h||"object"==typeof e&&null!==e&&(e.$$typeof===m||e.$$typeof===v||e.$$typeof===s||e.$$typeof===u||e.$$typeof===f||e.$$typeof===y||e.$$typeof===b||e.$$typeof===w||e.$$typeof===g)},t.typeOf=S},864:(e,t,n)=>{"use strict";e.exports=n(921)},251:(e,t,n)=>{"use strict";n(418);var r=n(294),i=60103;if(t.Fragment=60107,"function"==typeof Symbol&&Symbol.for){var o=Symbol.for;i=o("react.element"),t.Fragment=o("react.fragment")}var a=r.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED.ReactCurrentOwner,l=Object.prototype.hasOwnProperty,s={key:!0,ref:!0,__self:!0,__source:!0};function u(e,t,n){var r,o={},u=null,c=null;for(r in void 0!==n&&(u=""+n),void 0!==t.key&&(u=""+t.key),void 0!==t.ref&&(c=t.ref),t)l.call(t,r)&&!s.hasOwnProperty(r)&&(o[r]=t[r]);if(e&&e.defaultProps)for(r in t=e.defaultProps)void 0===o[r]&&(o[r]=t[r]);return{$$typeof:i,type:e,key:u,ref:c,props:o,_owner:a.current}}t.jsx=u,t.jsxs=u},408:(e,t,n)=>{"use strict";var r=n(418),i=60103,o=60106;t.Fragment=60107,t.StrictMode=60108,t.Profiler=60114;var a=60109,l=60110,s=60112;t.Suspense=60113;var u=60115,c=60116;if("function"==typeof Symbol&&Symbol.for){var d=Symbol.for;i=d("react.element"),o=d("react.portal"),t.Fragment=d("react.fragment"),t.StrictMode=d("react.strict_mode"),t.Profiler=d("react.profiler"),a=d("react.provider"),l=d("react.context"),s=d("react.forward_ref"),t.Suspense=d("react.suspense"),u=d("react.memo"),c=d("react.lazy")}var f="function"==typeof Symbol&&Symbol.iterator;function p(e){for(var t="https://reactjs.org/docs/error-decoder.html?invariant="+e,n=1;n<arguments.length;n++)t+="&args[]="+encodeURIComponent(arguments[n]);return"Minified React error #"+e+"; visit "+t+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}var h={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},v={};function m(e,t,n){this.props=e,this.context=t,this.refs=v,this.updater=n||h}function g(){}function y(e,t,n){this.props=e,this.context=t,this.refs=v,this.updater=n||h}m.prototype.isReactComponent={},m.prototype.setState=function(e,t){if("object"!=typeof e&&"function"!=typeof e&&null!=e)throw Error(p(85));this.updater.enqueueSetState(this,e,t,"setState")},m.prototype.forceUpdate=function(e){this.updater.enqueueForceUpdate(this,e,"forceUpdate")},g.prototype=m.prototype;var b=y.prototype=new g;b.constructor=y,r(b,m.prototype),b.isPureReactComponent=!0;var w={current:null},S=Object.prototype.hasOwnProperty,k={key:!0,ref:!0,__self:!0,__source:!0};function x(e,t,n){var r,o={},a=null,l=null;if(null!=t)for(r in void 0!==t.ref&&(l=t.ref),void 0!==t.key&&(a=""+t.key),t)S.call(t,r)&&!k.hasOwnProperty(r)&&(o[r]=t[r]);var s=arguments.length-2;if(1===s)o.children=n;else if(1<s){for(var u=Array(s),c=0;c<s;c++)u[c]=arguments[c+2];o.children=u}if(e&&e.defaultProps)for(r in s=e.defaultProps)void 0===o[r]&&(o[r]=s[r]);return{$$typeof:i,type:e,key:a,ref:l,props:o,_owner:w.current}}function E(e){return"object"==typeof e&&null!==e&&e.$$typeof===i}var C=/\/+/g;function O(e,t){return"object"==typeof e&&null!==e&&null!=e.key?function(e){var t={"=":"=0",":":"=2"};return"$"+e.replace(/[=:]/g,(function(e){return t[e]}))}(""+e.key):t.toString(36)}function P(e,t,n,r,a){var l=typeof e;"undefined"!==l&&"boolean"!==l||(e=null);var s=!1;if(null===e)s=!0;else switch(l){case"string":case"number":s=!0;break;case"object":switch(e.$$typeof){case i:case o:s=!0}}if(s)return a=a(s=e),e=""===r?"."+O(s,0):r,Array.isArray(a)?(n="",null!=e&&(n=e.replace(C,"$&/")+"/"),P(a,t,n,"",(function(e){return e}))):null!=a&&(E(a)&&(a=function(e,t){return{$$typeof:i,type:e.type,key:t,ref:e.ref,props:e.props,_owner:e._owner}}(a,n+(!a.key||s&&s.key===a.key?"":(""+a.key).replace(C,"$&/")+"/")+e)),t.push(a)),1;if(s=0,r=""===r?".":r+":",Array.isArray(e))for(var u=0;u<e.length;u++){var c=r+O(l=e[u],u);s+=P(l,t,n,c,a)}else if("function"==typeof(c=function(e){return null===e||"object"!=typeof e?null:"function"==typeof(e=f&&e[f]||e["@@iterator"])?e:null}(e)))for(e=c.call(e),u=0;!(l=e.next()).done;)s+=P(l=l.value,t,n,c=r+O(l,u++),a);else if("object"===l)throw t=""+e,Error(p(31,"[object Object]"===t?"object with keys {"+Object.keys(e).join(", ")+"}":t));return s}function j(e,t,n){if(null==e)return e;var r=[],i=0;return P(e,r,"","",(function(e){return t.call(n,e,i++)})),r}function T(e){if(-1===e._status){var t=e._result;t=t(),e._status=0,e._result=t,t.then((function(t){0===e._status&&(t=t.default,e._status=1,e._result=t)}),(function(t){0===e._status&&(e._status=2,e._result=t)}))}if(1===e._status)return e._result;throw e._result}var _={current:null};function N(){var e=_.current;if(null===e)throw Error(p(321));return e}var R={ReactCurrentDispatcher:_,ReactCurrentBatchConfig:{transition:0},ReactCurrentOwner:w,IsSomeRendererActing:{current:!1},assign:r};t.Children={map:j,forEach:function(e,t,n){j(e,(function(){t.apply(this,arguments)}),n)},count:function(e){var t=0;return j(e,(function(){t++})),t},toArray:function(e){return j(e,(function(e){return e}))||[]},only:function(e){if(!E(e))throw Error(p(143));return e}},t.Component=m,t.PureComponent=y,t.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=R,t.cloneElement=function(e,t,n){if(null==e)throw Error(p(267,e));var o=r({},e.props),a=e.key,l=e.ref,s=e._owner;if(null!=t){if(void 0!==t.ref&&(l=t.ref,s=w.current),void 0!==t.key&&(a=""+t.key),e.type&&e.type.defaultProps)var u=e.type.defaultProps;for(c in t)S.call(t,c)&&!k.hasOwnProperty(c)&&(o[c]=void 0===t[c]&&void 0!==u?u[c]:t[c])}var c=arguments.length-2;if(1===c)o.children=n;else if(1<c){u=Array(c);for(var d=0;d<c;d++)u[d]=arguments[d+2];o.children=u}return{$$typeof:i,type:e.type,key:a,ref:l,props:o,_owner:s}},t.createContext=function(e,t){return void 0===t&&(t=null),(e={$$typeof:l,_calculateChangedBits:t,_currentValue:e,_currentValue2:e,_threadCount:0,Provider:null,Consumer:null}).Provider={$$typeof:a,_context:e},e.Consumer=e},t.createElement=x,t.createFactory=function(e){var t=x.bind(null,e);return t.type=e,t},t.createRef=function(){return{current:null}},t.forwardRef=function(e){return{$$typeof:s,render:e}},t.isValidElement=E,t.lazy=function(e){return{$$typeof:c,_payload:{_status:-1,_result:e},_init:T}},t.memo=function(e,t){return{$$typeof:u,type:e,compare:void 0===t?null:t}},t.useCallback=function(e,t){return N().useCallback(e,t)},t.useContext=function(e,t){return N().useContext(e,t)},t.useDebugValue=function(){},t.useEffect=function(e,t){return N().useEffect(e,t)},t.useImperativeHandle=function(e,t,n){return N().useImperativeHandle(e,t,n)},t.useLayoutEffect=function(e,t){return N().useLayoutEffect(e,t)},t.useMemo=function(e,t){return N().useMemo(e,t)},t.useReducer=function(e,t,n){return N().useReducer(e,t,n)},t.useRef=function(e){return N().useRef(e)},t.useState=function(e){return N().useState(e)},t.version="17.0.1"},294:(e,t,n)=>{"use strict";e.exports=n(408)},893:(e,t,n)=>{"use strict";e.exports=n(251)},53:(e,t)=>{"use strict";var n,r,i,o;if("object"==typeof performance&&"function"==typeof performance.now){var a=performance;t.unstable_now=function(){return a.now()}}else{var l=Date,s=l.now();t.unstable_now=function(){return l.now()-s}}if("undefined"==typeof window||"function"!=typeof MessageChannel){var u=null,c=null,d=function(){if(null!==u)try{var e=t.unstable_now();u(!0,e),u=null}catch(e){throw setTimeout(d,0),e}};n=function(e){null!==u?setTimeout(n,0,e):(u=e,setTimeout(d,0))},r=function(e,t){c=setTimeout(e,t)},i=function(){clearTimeout(c)},t.unstable_shouldYield=function(){return!1},o=t.unstable_forceFrameRate=function(){}}else{var f=window.setTimeout,p=window.clearTimeout;if("undefined"!=typeof console){var h=window.cancelAnimationFrame;"function"!=typeof window.requestAnimationFrame&&console.error("This browser doesn't support requestAnimationFrame. Make sure that you load a polyfill in older browsers. https://reactjs.org/link/react-polyfills"),"function"!=typeof h&&console.error("This browser doesn't support cancelAnimationFrame. Make sure that you load a polyfill in older browsers. https://reactjs.org/link/react-polyfills")}var v=!1,m=null,g=-1,y=5,b=0;t.unstable_shouldYield=function(){return t.unstable_now()>=b},o=function(){},t.unstable_forceFrameRate=function(e){0>e||125<e?console.error("forceFrameRate takes a positive int between 0 and 125, forcing frame rates higher than 125 fps is not supported"):y=0<e?Math.floor(1e3/e):5};var w=new MessageChannel,S=w.port2;w.port1.onmessage=function(){if(null!==m){var e=t.unstable_now();b=e+y;try{m(!0,e)?S.postMessage(null):(v=!1,m=null)}catch(e){throw S.postMessage(null),e}}else v=!1},n=function(e){m=e,v||(v=!0,S.postMessage(null))},r=function(e,n){g=f((function(){e(t.unstable_now())}),n)},i=function(){p(g),g=-1}}function k(e,t){var n=e.length;e.push(t);e:for(;;){var r=n-1>>>1,i=e[r];if(!(void 0!==i&&0<C(i,t)))break e;e[r]=t,e[n]=i,n=r}}function x(e){return void 0===(e=e[0])?null:e}function E(e){var t=e[0];if(void 0!==t){var n=e.pop();if(n!==t){e[0]=n;e:for(var r=0,i=e.length;r<i;){var o=2*(r+1)-1,a=e[o],l=o+1,s=e[l];if(void 0!==a&&0>C(a,n))void 0!==s&&0>C(s,a)?(e[r]=s,e[l]=n,r=l):(e[r]=a,e[o]=n,r=o);else{if(!(void 0!==s&&0>C(s,n)))break e;e[r]=s,e[l]=n,r=l}}}return t}return null}function C(e,t){var n=e.sortIndex-t.sortIndex;return 0!==n?n:e.id-t.id}var O=[],P=[],j=1,T=null,_=3,N=!1,R=!1,M=!1;function D(e){for(var t=x(P);null!==t;){if(null===t.callback)E(P);else{if(!(t.startTime<=e))break;E(P),t.sortIndex=t.expirationTime,k(O,t)}t=x(P)}}function L(e){if(M=!1,D(e),!R)if(null!==x(O))R=!0,n(I);else{var t=x(P);null!==t&&r(L,t.startTime-e)}}function I(e,n){R=!1,M&&(M=!1,i()),N=!0;var o=_;try{for(D(n),T=x(O);null!==T&&(!(T.expirationTime>n)||e&&!t.unstable_shouldYield());){var a=T.callback;if("function"==typeof a){T.callback=null,_=T.priorityLevel;var l=a(T.expirationTime<=n);n=t.unstable_now(),"function"==typeof l?T.callback=l:T===x(O)&&E(O),D(n)}else E(O);T=x(O)}if(null!==T)var s=!0;else{var u=x(P);null!==u&&r(L,u.startTime-n),s=!1}return s}finally{T=null,_=o,N=!1}}var A=o;t.unstable_IdlePriority=5,t.unstable_ImmediatePriority=1,t.unstable_LowPriority=4,t.unstable_NormalPriority=3,t.unstable_Profiling=null,t.unstable_UserBlockingPriority=2,t.unstable_cancelCallback=function(e){e.callback=null},t.unstable_continueExecution=function(){R||N||(R=!0,n(I))},t.unstable_getCurrentPriorityLevel=function(){return _},t.unstable_getFirstCallbackNode=function(){return x(O)},t.unstable_next=function(e){switch(_){case 1:case 2:case 3:var t=3;break;default:t=_}var n=_;_=t;try{return e()}finally{_=n}},t.unstable_pauseExecution=function(){},t.unstable_requestPaint=A,t.unstable_runWithPriority=function(e,t){switch(e){case 1:case 2:case 3:case 4:case 5:break;default:e=3}var n=_;_=e;try{return t()}finally{_=n}},t.unstable_scheduleCallback=function(e,o,a){var l=t.unstable_now();switch(a="object"==typeof a&&null!==a&&"number"==typeof(a=a.delay)&&0<a?l+a:l,e){case 1:var s=-1;break;case 2:s=250;break;case 5:s=1073741823;break;case 4:s=1e4;break;default:s=5e3}return e={id:j++,callback:o,priorityLevel:e,startTime:a,expirationTime:s=a+s,sortIndex:-1},a>l?(e.sortIndex=a,k(P,e),null===x(O)&&e===x(P)&&(M?i():M=!0,r(L,a-l))):(e.sortIndex=s,k(O,e),R||N||(R=!0,n(I))),e},t.unstable_wrapCallback=function(e){var t=_;return function(){var n=_;_=t;try{return e.apply(this,arguments)}finally{_=n}}}},840:(e,t,n)=>{"use strict";e.exports=n(53)},121:(e,t,n)=>{"use strict";n.d(t,{Z:()=>r}),e=n.hmd(e);const r=function(e){var t,n=e.Symbol;return"function"==typeof n?n.observable?t=n.observable:(t=n("observable"),n.observable=t):t="@@observable",t}("undefined"!=typeof self?self:"undefined"!=typeof window?window:void 0!==n.g?n.g:e)}},t={};function n(r){var i=t[r];if(void 0!==i)return i.exports;var o=t[r]={id:r,loaded:!1,exports:{}};return e[r](o,o.exports,n),o.loaded=!0,o.exports}n.n=e=>{var t=e&&e.__esModule?()=>e.default:()=>e;return n.d(t,{a:t}),t},n.d=(e,t)=>{for(var r in t)n.o(t,r)&&!n.o(e,r)&&Object.defineProperty(e,r,{enumerable:!0,get:t[r]})},n.g=function(){if("object"==typeof globalThis)return globalThis;try{return this||new Function("return this")()}catch(e){if("object"==typeof window)return window}}(),n.hmd=e=>((e=Object.create(e)).children||(e.children=[]),Object.defineProperty(e,"exports",{enumerable:!0,set:()=>{throw new Error("ES Modules may not assign module.exports or exports.*, Use ESM export syntax, instead: "+e.id)}}),e),n.o=(e,t)=>Object.prototype.hasOwnProperty.call(e,t),(()=>{"use strict";var e=n(893),t=n(294),r=n(935),i=(n(697),t.createContext(null)),o=function(e){e()},a=function(){return o},l={notify:function(){}},s=function(){function e(e,t){this.store=e,this.parentSub=t,this.unsubscribe=null,this.listeners=l,this.handleChangeWrapper=this.handleChangeWrapper.bind(this)}var t=e.prototype;return t.addNestedSub=function(e){return this.trySubscribe(),this.listeners.subscribe(e)},t.notifyNestedSubs=function(){this.listeners.notify()},t.handleChangeWrapper=function(){this.onStateChange&&this.onStateChange()},t.isSubscribed=function(){return Boolean(this.unsubscribe)},t.trySubscribe=function(){this.unsubscribe||(this.unsubscribe=this.parentSub?this.parentSub.addNestedSub(this.handleChangeWrapper):this.store.subscribe(this.handleChangeWrapper),this.listeners=function(){var e=a(),t=null,n=null;return{clear:function(){t=null,n=null},notify:function(){e((function(){for(var e=t;e;)e.callback(),e=e.next}))},get:function(){for(var e=[],n=t;n;)e.push(n),n=n.next;return e},subscribe:function(e){var r=!0,i=n={callback:e,next:null,prev:n};return i.prev?i.prev.next=i:t=i,function(){r&&null!==t&&(r=!1,i.next?i.next.prev=i.prev:n=i.prev,i.prev?i.prev.next=i.next:t=i.next)}}}}())},t.tryUnsubscribe=function(){this.unsubscribe&&(this.unsubscribe(),this.unsubscribe=null,this.listeners.clear(),this.listeners=l)},e}();function u(){return(u=Object.assign||function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e}).apply(this,arguments)}function c(e,t){if(null==e)return{};var n,r,i={},o=Object.keys(e);for(r=0;r<o.length;r++)n=o[r],t.indexOf(n)>=0||(i[n]=e[n]);return i}var d=n(679),f=n.n(d),p=n(864),h="undefined"!=typeof window&&void 0!==window.document&&void 0!==window.document.createElement?t.useLayoutEffect:t.useEffect,v=[],m=[null,null];function g(e,t){var n=e[1];return[t.payload,n+1]}function y(e,t,n){h((function(){return e.apply(void 0,t)}),n)}function b(e,t,n,r,i,o,a){e.current=r,t.current=i,n.current=!1,o.current&&(o.current=null,a())}function w(e,t,n,r,i,o,a,l,s,u){if(e){var c=!1,d=null,f=function(){if(!c){var e,n,f=t.getState();try{e=r(f,i.current)}catch(e){n=e,d=e}n||(d=null),e===o.current?a.current||s():(o.current=e,l.current=e,a.current=!0,u({type:"STORE_UPDATED",payload:{error:n}}))}};return n.onStateChange=f,n.trySubscribe(),f(),function(){if(c=!0,n.tryUnsubscribe(),n.onStateChange=null,d)throw d}}}var S=function(){return[null,0]};function k(e,n){void 0===n&&(n={});var r=n,o=r.getDisplayName,a=void 0===o?function(e){return"ConnectAdvanced("+e+")"}:o,l=r.methodName,d=void 0===l?"connectAdvanced":l,h=r.renderCountProp,k=void 0===h?void 0:h,x=r.shouldHandleStateChanges,E=void 0===x||x,C=r.storeKey,O=void 0===C?"store":C,P=(r.withRef,r.forwardRef),j=void 0!==P&&P,T=r.context,_=void 0===T?i:T,N=c(r,["getDisplayName","methodName","renderCountProp","shouldHandleStateChanges","storeKey","withRef","forwardRef","context"]),R=_;return function(n){var r=n.displayName||n.name||"Component",i=a(r),o=u({},N,{getDisplayName:a,methodName:d,renderCountProp:k,shouldHandleStateChanges:E,storeKey:O,displayName:i,wrappedComponentName:r,WrappedComponent:n}),l=N.pure,h=l?t.useMemo:function(e){return e()};function x(r){var i=(0,t.useMemo)((function(){var e=r.reactReduxForwardedRef,t=c(r,["reactReduxForwardedRef"]);return[r.context,e,t]}),[r]),a=i[0],l=i[1],d=i[2],f=(0,t.useMemo)((function(){return a&&a.Consumer&&(0,p.isContextConsumer)(t.createElement(a.Consumer,null))?a:R}),[a,R]),k=(0,t.useContext)(f),x=Boolean(r.store)&&Boolean(r.store.getState)&&Boolean(r.store.dispatch);Boolean(k)&&Boolean(k.store);var C=x?r.store:k.store,O=(0,t.useMemo)((function(){return function(t){return e(t.dispatch,o)}(C)}),[C]),P=(0,t.useMemo)((function(){if(!E)return m;var e=new s(C,x?null:k.subscription),t=e.notifyNestedSubs.bind(e);return[e,t]}),[C,x,k]),j=P[0],T=P[1],_=(0,t.useMemo)((function(){return x?k:u({},k,{subscription:j})}),[x,k,j]),N=(0,t.useReducer)(g,v,S),M=N[0][0],D=N[1];if(M&&M.error)throw M.error;var L=(0,t.useRef)(),I=(0,t.useRef)(d),A=(0,t.useRef)(),F=(0,t.useRef)(!1),z=h((function(){return A.current&&d===I.current?A.current:O(C.getState(),d)}),[C,M,d]);y(b,[I,L,F,d,z,A,T]),y(w,[E,C,j,O,I,L,F,A,T,D],[C,j,O]);var U=(0,t.useMemo)((function(){return t.createElement(n,u({},z,{ref:l}))}),[l,n,z]);return(0,t.useMemo)((function(){return E?t.createElement(f.Provider,{value:_},U):U}),[f,U,_])}var C=l?t.memo(x):x;if(C.WrappedComponent=n,C.displayName=i,j){var P=t.forwardRef((function(e,n){return t.createElement(C,u({},e,{reactReduxForwardedRef:n}))}));return P.displayName=i,P.WrappedComponent=n,f()(P,n)}return f()(C,n)}}function x(e,t){return e===t?0!==e||0!==t||1/e==1/t:e!=e&&t!=t}function E(e,t){if(x(e,t))return!0;if("object"!=typeof e||null===e||"object"!=typeof t||null===t)return!1;var n=Object.keys(e),r=Object.keys(t);if(n.length!==r.length)return!1;for(var i=0;i<n.length;i++)if(!Object.prototype.hasOwnProperty.call(t,n[i])||!x(e[n[i]],t[n[i]]))return!1;return!0}var C=n(121),O=function(){return Math.random().toString(36).substring(7).split("").join(".")},P={INIT:"@@redux/INIT"+O(),REPLACE:"@@redux/REPLACE"+O(),PROBE_UNKNOWN_ACTION:function(){return"@@redux/PROBE_UNKNOWN_ACTION"+O()}};function j(e){if("object"!=typeof e||null===e)return!1;for(var t=e;null!==Object.getPrototypeOf(t);)t=Object.getPrototypeOf(t);return Object.getPrototypeOf(e)===t}function T(e,t,n){var r;if("function"==typeof t&&"function"==typeof n||"function"==typeof n&&"function"==typeof arguments[3])throw new Error("It looks like you are passing several store enhancers to createStore(). This is not supported. Instead, compose them together to a single function.");if("function"==typeof t&&void 0===n&&(n=t,t=void 0),void 0!==n){if("function"!=typeof n)throw new Error("Expected the enhancer to be a function.");return n(T)(e,t)}if("function"!=typeof e)throw new Error("Expected the reducer to be a function.");var i=e,o=t,a=[],l=a,s=!1;function u(){l===a&&(l=a.slice())}function c(){if(s)throw new Error("You may not call store.getState() while the reducer is executing. The reducer has already received the state as an argument. Pass it down from the top reducer instead of reading it from the store.");return o}function d(e){if("function"!=typeof e)throw new Error("Expected the listener to be a function.");if(s)throw new Error("You may not call store.subscribe() while the reducer is executing. If you would like to be notified after the store has been updated, subscribe from a component and invoke store.getState() in the callback to access the latest state. See https://redux.js.org/api-reference/store#subscribelistener for more details.");var t=!0;return u(),l.push(e),function(){if(t){if(s)throw new Error("You may not unsubscribe from a store listener while the reducer is executing. See https://redux.js.org/api-reference/store#subscribelistener for more details.");t=!1,u();var n=l.indexOf(e);l.splice(n,1),a=null}}}function f(e){if(!j(e))throw new Error("Actions must be plain objects. Use custom middleware for async actions.");if(void 0===e.type)throw new Error('Actions may not have an undefined "type" property. Have you misspelled a constant?');if(s)throw new Error("Reducers may not dispatch actions.");try{s=!0,o=i(o,e)}finally{s=!1}for(var t=a=l,n=0;n<t.length;n++)(0,t[n])();return e}function p(e){if("function"!=typeof e)throw new Error("Expected the nextReducer to be a function.");i=e,f({type:P.REPLACE})}function h(){var e,t=d;return(e={subscribe:function(e){if("object"!=typeof e||null===e)throw new TypeError("Expected the observer to be an object.");function n(){e.next&&e.next(c())}return n(),{unsubscribe:t(n)}}})[C.Z]=function(){return this},e}return f({type:P.INIT}),(r={dispatch:f,subscribe:d,getState:c,replaceReducer:p})[C.Z]=h,r}function _(e,t){var n=t&&t.type;return"Given "+(n&&'action "'+String(n)+'"'||"an action")+', reducer "'+e+'" returned undefined. To ignore an action, you must explicitly return the previous state. If you want this reducer to hold no value, you can return null instead of undefined.'}function N(e,t){return function(){return t(e.apply(this,arguments))}}function R(e,t,n){return t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function M(e,t){var n=Object.keys(e);return Object.getOwnPropertySymbols&&n.push.apply(n,Object.getOwnPropertySymbols(e)),t&&(n=n.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n}function D(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?M(n,!0).forEach((function(t){R(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):M(n).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}function L(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];return 0===t.length?function(e){return e}:1===t.length?t[0]:t.reduce((function(e,t){return function(){return e(t.apply(void 0,arguments))}}))}function I(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];return function(e){return function(){var n=e.apply(void 0,arguments),r=function(){throw new Error("Dispatching while constructing your middleware is not allowed. Other middleware would not be applied to this dispatch.")},i={getState:n.getState,dispatch:function(){return r.apply(void 0,arguments)}},o=t.map((function(e){return e(i)}));return D({},n,{dispatch:r=L.apply(void 0,o)(n.dispatch)})}}}function A(e){return function(t,n){var r=e(t,n);function i(){return r}return i.dependsOnOwnProps=!1,i}}function F(e){return null!==e.dependsOnOwnProps&&void 0!==e.dependsOnOwnProps?Boolean(e.dependsOnOwnProps):1!==e.length}function z(e,t){return function(t,n){n.displayName;var r=function(e,t){return r.dependsOnOwnProps?r.mapToProps(e,t):r.mapToProps(e)};return r.dependsOnOwnProps=!0,r.mapToProps=function(t,n){r.mapToProps=e,r.dependsOnOwnProps=F(e);var i=r(t,n);return"function"==typeof i&&(r.mapToProps=i,r.dependsOnOwnProps=F(i),i=r(t,n)),i},r}}const U=[function(e){return"function"==typeof e?z(e):void 0},function(e){return e?void 0:A((function(e){return{dispatch:e}}))},function(e){return e&&"object"==typeof e?A((function(t){return function(e,t){if("function"==typeof e)return N(e,t);if("object"!=typeof e||null===e)throw new Error("bindActionCreators expected an object or a function, instead received "+(null===e?"null":typeof e)+'. Did you write "import ActionCreators from" instead of "import * as ActionCreators from"?');var n={};for(var r in e){var i=e[r];"function"==typeof i&&(n[r]=N(i,t))}return n}(e,t)})):void 0}],$=[function(e){return"function"==typeof e?z(e):void 0},function(e){return e?void 0:A((function(){return{}}))}];function V(e,t,n){return u({},n,e,t)}const B=[function(e){return"function"==typeof e?function(e){return function(t,n){n.displayName;var r,i=n.pure,o=n.areMergedPropsEqual,a=!1;return function(t,n,l){var s=e(t,n,l);return a?i&&o(s,r)||(r=s):(a=!0,r=s),r}}}(e):void 0},function(e){return e?void 0:function(){return V}}];function W(e,t,n,r){return function(i,o){return n(e(i,o),t(r,o),o)}}function q(e,t,n,r,i){var o,a,l,s,u,c=i.areStatesEqual,d=i.areOwnPropsEqual,f=i.areStatePropsEqual,p=!1;return function(i,h){return p?function(i,p){var h,v,m=!d(p,a),g=!c(i,o);return o=i,a=p,m&&g?(l=e(o,a),t.dependsOnOwnProps&&(s=t(r,a)),u=n(l,s,a)):m?(e.dependsOnOwnProps&&(l=e(o,a)),t.dependsOnOwnProps&&(s=t(r,a)),u=n(l,s,a)):g?(h=e(o,a),v=!f(h,l),l=h,v&&(u=n(l,s,a)),u):u}(i,h):(l=e(o=i,a=h),s=t(r,a),u=n(l,s,a),p=!0,u)}}function H(e,t){var n=t.initMapStateToProps,r=t.initMapDispatchToProps,i=t.initMergeProps,o=c(t,["initMapStateToProps","initMapDispatchToProps","initMergeProps"]),a=n(e,o),l=r(e,o),s=i(e,o);return(o.pure?q:W)(a,l,s,e,o)}function Q(e,t,n){for(var r=t.length-1;r>=0;r--){var i=t[r](e);if(i)return i}return function(t,r){throw new Error("Invalid value of type "+typeof e+" for "+n+" argument when connecting component "+r.wrappedComponentName+".")}}function K(e,t){return e===t}function G(e){var t=void 0===e?{}:e,n=t.connectHOC,r=void 0===n?k:n,i=t.mapStateToPropsFactories,o=void 0===i?$:i,a=t.mapDispatchToPropsFactories,l=void 0===a?U:a,s=t.mergePropsFactories,d=void 0===s?B:s,f=t.selectorFactory,p=void 0===f?H:f;return function(e,t,n,i){void 0===i&&(i={});var a=i,s=a.pure,f=void 0===s||s,h=a.areStatesEqual,v=void 0===h?K:h,m=a.areOwnPropsEqual,g=void 0===m?E:m,y=a.areStatePropsEqual,b=void 0===y?E:y,w=a.areMergedPropsEqual,S=void 0===w?E:w,k=c(a,["pure","areStatesEqual","areOwnPropsEqual","areStatePropsEqual","areMergedPropsEqual"]),x=Q(e,o,"mapStateToProps"),C=Q(t,l,"mapDispatchToProps"),O=Q(n,d,"mergeProps");return r(p,u({methodName:"connect",getDisplayName:function(e){return"Connect("+e+")"},shouldHandleStateChanges:Boolean(e),initMapStateToProps:x,initMapDispatchToProps:C,initMergeProps:O,pure:f,areStatesEqual:v,areOwnPropsEqual:g,areStatePropsEqual:b,areMergedPropsEqual:S},k))}}const Y=G();var X;function J(e){for(var t=arguments.length,n=Array(t>1?t-1:0),r=1;r<t;r++)n[r-1]=arguments[r];throw Error("[Immer] minified error nr: "+e+(n.length?" "+n.map((function(e){return"'"+e+"'"})).join(","):"")+". Find the full error at: https://bit.ly/3cXEKWf")}function Z(e){return!!e&&!!e[ze]}function ee(e){return!!e&&(function(e){if(!e||"object"!=typeof e)return!1;var t=Object.getPrototypeOf(e);return!t||t===Object.prototype}(e)||Array.isArray(e)||!!e[Fe]||!!e.constructor[Fe]||ae(e)||le(e))}function te(e,t,n){void 0===n&&(n=!1),0===ne(e)?(n?Object.keys:Ue)(e).forEach((function(r){n&&"symbol"==typeof r||t(r,e[r],e)})):e.forEach((function(n,r){return t(r,n,e)}))}function ne(e){var t=e[ze];return t?t.i>3?t.i-4:t.i:Array.isArray(e)?1:ae(e)?2:le(e)?3:0}function re(e,t){return 2===ne(e)?e.has(t):Object.prototype.hasOwnProperty.call(e,t)}function ie(e,t,n){var r=ne(e);2===r?e.set(t,n):3===r?(e.delete(t),e.add(n)):e[t]=n}function oe(e,t){return e===t?0!==e||1/e==1/t:e!=e&&t!=t}function ae(e){return De&&e instanceof Map}function le(e){return Le&&e instanceof Set}function se(e){return e.o||e.t}function ue(e){if(Array.isArray(e))return Array.prototype.slice.call(e);var t=$e(e);delete t[ze];for(var n=Ue(t),r=0;r<n.length;r++){var i=n[r],o=t[i];!1===o.writable&&(o.writable=!0,o.configurable=!0),(o.get||o.set)&&(t[i]={configurable:!0,writable:!0,enumerable:o.enumerable,value:e[i]})}return Object.create(Object.getPrototypeOf(e),t)}function ce(e,t){return void 0===t&&(t=!1),fe(e)||Z(e)||!ee(e)||(ne(e)>1&&(e.set=e.add=e.clear=e.delete=de),Object.freeze(e),t&&te(e,(function(e,t){return ce(t,!0)}),!0)),e}function de(){J(2)}function fe(e){return null==e||"object"!=typeof e||Object.isFrozen(e)}function pe(e){var t=Ve[e];return t||J(18,e),t}function he(){return Re}function ve(e,t){t&&(pe("Patches"),e.u=[],e.s=[],e.v=t)}function me(e){ge(e),e.p.forEach(be),e.p=null}function ge(e){e===Re&&(Re=e.l)}function ye(e){return Re={p:[],l:Re,h:e,m:!0,_:0}}function be(e){var t=e[ze];0===t.i||1===t.i?t.j():t.g=!0}function we(e,t){t._=t.p.length;var n=t.p[0],r=void 0!==e&&e!==n;return t.h.O||pe("ES5").S(t,e,r),r?(n[ze].P&&(me(t),J(4)),ee(e)&&(e=Se(t,e),t.l||xe(t,e)),t.u&&pe("Patches").M(n[ze],e,t.u,t.s)):e=Se(t,n,[]),me(t),t.u&&t.v(t.u,t.s),e!==Ae?e:void 0}function Se(e,t,n){if(fe(t))return t;var r=t[ze];if(!r)return te(t,(function(i,o){return ke(e,r,t,i,o,n)}),!0),t;if(r.A!==e)return t;if(!r.P)return xe(e,r.t,!0),r.t;if(!r.I){r.I=!0,r.A._--;var i=4===r.i||5===r.i?r.o=ue(r.k):r.o;te(3===r.i?new Set(i):i,(function(t,o){return ke(e,r,i,t,o,n)})),xe(e,i,!1),n&&e.u&&pe("Patches").R(r,n,e.u,e.s)}return r.o}function ke(e,t,n,r,i,o){if(Z(i)){var a=Se(e,i,o&&t&&3!==t.i&&!re(t.D,r)?o.concat(r):void 0);if(ie(n,r,a),!Z(a))return;e.m=!1}if(ee(i)&&!fe(i)){if(!e.h.N&&e._<1)return;Se(e,i),t&&t.A.l||xe(e,i)}}function xe(e,t,n){void 0===n&&(n=!1),e.h.N&&e.m&&ce(t,n)}function Ee(e,t){var n=e[ze];return(n?se(n):e)[t]}function Ce(e,t){if(t in e)for(var n=Object.getPrototypeOf(e);n;){var r=Object.getOwnPropertyDescriptor(n,t);if(r)return r;n=Object.getPrototypeOf(n)}}function Oe(e){e.P||(e.P=!0,e.l&&Oe(e.l))}function Pe(e){e.o||(e.o=ue(e.t))}function je(e,t,n){var r=ae(t)?pe("MapSet").T(t,n):le(t)?pe("MapSet").F(t,n):e.O?function(e,t){var n=Array.isArray(e),r={i:n?1:0,A:t?t.A:he(),P:!1,I:!1,D:{},l:t,t:e,k:null,o:null,j:null,C:!1},i=r,o=Be;n&&(i=[r],o=We);var a=Proxy.revocable(i,o),l=a.revoke,s=a.proxy;return r.k=s,r.j=l,s}(t,n):pe("ES5").J(t,n);return(n?n.A:he()).p.push(r),r}function Te(e){return Z(e)||J(22,e),function e(t){if(!ee(t))return t;var n,r=t[ze],i=ne(t);if(r){if(!r.P&&(r.i<4||!pe("ES5").K(r)))return r.t;r.I=!0,n=_e(t,i),r.I=!1}else n=_e(t,i);return te(n,(function(t,i){r&&function(e,t){return 2===ne(e)?e.get(t):e[t]}(r.t,t)===i||ie(n,t,e(i))})),3===i?new Set(n):n}(e)}function _e(e,t){switch(t){case 2:return new Map(e);case 3:return Array.from(e)}return ue(e)}X=r.unstable_batchedUpdates,o=X;var Ne,Re,Me="undefined"!=typeof Symbol&&"symbol"==typeof Symbol("x"),De="undefined"!=typeof Map,Le="undefined"!=typeof Set,Ie="undefined"!=typeof Proxy&&void 0!==Proxy.revocable&&"undefined"!=typeof Reflect,Ae=Me?Symbol.for("immer-nothing"):((Ne={})["immer-nothing"]=!0,Ne),Fe=Me?Symbol.for("immer-draftable"):"__$immer_draftable",ze=Me?Symbol.for("immer-state"):"__$immer_state",Ue=("undefined"!=typeof Symbol&&Symbol.iterator,"undefined"!=typeof Reflect&&Reflect.ownKeys?Reflect.ownKeys:void 0!==Object.getOwnPropertySymbols?function(e){return Object.getOwnPropertyNames(e).concat(Object.getOwnPropertySymbols(e))}:Object.getOwnPropertyNames),$e=Object.getOwnPropertyDescriptors||function(e){var t={};return Ue(e).forEach((function(n){t[n]=Object.getOwnPropertyDescriptor(e,n)})),t},Ve={},Be={get:function(e,t){if(t===ze)return e;var n=se(e);if(!re(n,t))return function(e,t,n){var r,i=Ce(t,n);return i?"value"in i?i.value:null===(r=i.get)||void 0===r?void 0:r.call(e.k):void 0}(e,n,t);var r=n[t];return e.I||!ee(r)?r:r===Ee(e.t,t)?(Pe(e),e.o[t]=je(e.A.h,r,e)):r},has:function(e,t){return t in se(e)},ownKeys:function(e){return Reflect.ownKeys(se(e))},set:function(e,t,n){var r=Ce(se(e),t);if(null==r?void 0:r.set)return r.set.call(e.k,n),!0;if(!e.P){var i=Ee(se(e),t),o=null==i?void 0:i[ze];if(o&&o.t===n)return e.o[t]=n,e.D[t]=!1,!0;if(oe(n,i)&&(void 0!==n||re(e.t,t)))return!0;Pe(e),Oe(e)}return e.o[t]=n,e.D[t]=!0,!0},deleteProperty:function(e,t){return void 0!==Ee(e.t,t)||t in e.t?(e.D[t]=!1,Pe(e),Oe(e)):delete e.D[t],e.o&&delete e.o[t],!0},getOwnPropertyDescriptor:function(e,t){var n=se(e),r=Reflect.getOwnPropertyDescriptor(n,t);return r?{writable:!0,configurable:1!==e.i||"length"!==t,enumerable:r.enumerable,value:n[t]}:r},defineProperty:function(){J(11)},getPrototypeOf:function(e){return Object.getPrototypeOf(e.t)},setPrototypeOf:function(){J(12)}},We={};te(Be,(function(e,t){We[e]=function(){return arguments[0]=arguments[0][0],t.apply(this,arguments)}})),We.deleteProperty=function(e,t){return Be.deleteProperty.call(this,e[0],t)},We.set=function(e,t,n){return Be.set.call(this,e[0],t,n,e[0])};var qe=new(function(){function e(e){this.O=Ie,this.N=!0,"boolean"==typeof(null==e?void 0:e.useProxies)&&this.setUseProxies(e.useProxies),"boolean"==typeof(null==e?void 0:e.autoFreeze)&&this.setAutoFreeze(e.autoFreeze),this.produce=this.produce.bind(this),this.produceWithPatches=this.produceWithPatches.bind(this)}var t=e.prototype;return t.produce=function(e,t,n){if("function"==typeof e&&"function"!=typeof t){var r=t;t=e;var i=this;return function(e){var n=this;void 0===e&&(e=r);for(var o=arguments.length,a=Array(o>1?o-1:0),l=1;l<o;l++)a[l-1]=arguments[l];return i.produce(e,(function(e){var r;return(r=t).call.apply(r,[n,e].concat(a))}))}}var o;if("function"!=typeof t&&J(6),void 0!==n&&"function"!=typeof n&&J(7),ee(e)){var a=ye(this),l=je(this,e,void 0),s=!0;try{o=t(l),s=!1}finally{s?me(a):ge(a)}return"undefined"!=typeof Promise&&o instanceof Promise?o.then((function(e){return ve(a,n),we(e,a)}),(function(e){throw me(a),e})):(ve(a,n),we(o,a))}if(!e||"object"!=typeof e){if((o=t(e))===Ae)return;return void 0===o&&(o=e),this.N&&ce(o,!0),o}J(21,e)},t.produceWithPatches=function(e,t){var n,r,i=this;return"function"==typeof e?function(t){for(var n=arguments.length,r=Array(n>1?n-1:0),o=1;o<n;o++)r[o-1]=arguments[o];return i.produceWithPatches(t,(function(t){return e.apply(void 0,[t].concat(r))}))}:[this.produce(e,t,(function(e,t){n=e,r=t})),n,r]},t.createDraft=function(e){ee(e)||J(8),Z(e)&&(e=Te(e));var t=ye(this),n=je(this,e,void 0);return n[ze].C=!0,ge(t),n},t.finishDraft=function(e,t){var n=(e&&e[ze]).A;return ve(n,t),we(void 0,n)},t.setAutoFreeze=function(e){this.N=e},t.setUseProxies=function(e){e&&!Ie&&J(20),this.O=e},t.applyPatches=function(e,t){var n;for(n=t.length-1;n>=0;n--){var r=t[n];if(0===r.path.length&&"replace"===r.op){e=r.value;break}}var i=pe("Patches").$;return Z(e)?i(e,t):this.produce(e,(function(e){return i(e,t.slice(n+1))}))},e}()),He=qe.produce;qe.produceWithPatches.bind(qe),qe.setAutoFreeze.bind(qe),qe.setUseProxies.bind(qe),qe.applyPatches.bind(qe),qe.createDraft.bind(qe),qe.finishDraft.bind(qe);const Qe=He;function Ke(e,t){return e===t}function Ge(e,t,n){if(null===t||null===n||t.length!==n.length)return!1;for(var r=t.length,i=0;i<r;i++)if(!e(t[i],n[i]))return!1;return!0}function Ye(e){return function(t){var n=t.dispatch,r=t.getState;return function(t){return function(i){return"function"==typeof i?i(n,r,e):t(i)}}}}!function(e){for(var t=arguments.length,n=Array(t>1?t-1:0),r=1;r<t;r++)n[r-1]=arguments[r]}((function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:Ke,n=null,r=null;return function(){return Ge(t,n,arguments)||(r=e.apply(null,arguments)),n=arguments,r}}));var Xe=Ye();Xe.withExtraArgument=Ye;const Je=Xe;function Ze(){return(Ze=Object.assign||function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e}).apply(this,arguments)}function et(e){return(et=Object.setPrototypeOf?Object.getPrototypeOf:function(e){return e.__proto__||Object.getPrototypeOf(e)})(e)}function tt(e,t){return(tt=Object.setPrototypeOf||function(e,t){return e.__proto__=t,e})(e,t)}function nt(){if("undefined"==typeof Reflect||!Reflect.construct)return!1;if(Reflect.construct.sham)return!1;if("function"==typeof Proxy)return!0;try{return Date.prototype.toString.call(Reflect.construct(Date,[],(function(){}))),!0}catch(e){return!1}}function rt(e,t,n){return(rt=nt()?Reflect.construct:function(e,t,n){var r=[null];r.push.apply(r,t);var i=new(Function.bind.apply(e,r));return n&&tt(i,n.prototype),i}).apply(null,arguments)}function it(e){var t="function"==typeof Map?new Map:void 0;return(it=function(e){if(null===e||(n=e,-1===Function.toString.call(n).indexOf("[native code]")))return e;var n;if("function"!=typeof e)throw new TypeError("Super expression must either be null or a function");if(void 0!==t){if(t.has(e))return t.get(e);t.set(e,r)}function r(){return rt(e,arguments,et(this).constructor)}return r.prototype=Object.create(e.prototype,{constructor:{value:r,enumerable:!1,writable:!0,configurable:!0}}),tt(r,e)})(e)}var ot="undefined"!=typeof window&&window.__REDUX_DEVTOOLS_EXTENSION_COMPOSE__?window.__REDUX_DEVTOOLS_EXTENSION_COMPOSE__:function(){if(0!==arguments.length)return"object"==typeof arguments[0]?L:L.apply(null,arguments)};var at=function(e){var t,n;function r(){return e.apply(this,arguments)||this}n=e,(t=r).prototype=Object.create(n.prototype),t.prototype.constructor=t,t.__proto__=n;var i=r.prototype;return i.concat=function(){for(var t,n=arguments.length,i=new Array(n),o=0;o<n;o++)i[o]=arguments[o];return rt(r,(t=e.prototype.concat).call.apply(t,[this].concat(i)))},i.prepend=function(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];return 1===t.length&&Array.isArray(t[0])?rt(r,t[0].concat(this)):rt(r,t.concat(this))},r}(it(Array));function lt(e,t){function n(){if(t){var n=t.apply(void 0,arguments);if(!n)throw new Error("prepareAction did not return an object");return Ze({type:e,payload:n.payload},"meta"in n&&{meta:n.meta},{},"error"in n&&{error:n.error})}return{type:e,payload:arguments.length<=0?void 0:arguments[0]}}return n.toString=function(){return""+e},n.type=e,n.match=function(t){return t.type===e},n}function st(e){var t,n={},r=[],i={addCase:function(e,t){var r="string"==typeof e?e:e.type;if(r in n)throw new Error("addCase cannot be called with two reducers for the same action type");return n[r]=t,i},addMatcher:function(e,t){return r.push({matcher:e,reducer:t}),i},addDefaultCase:function(e){return t=e,i}};return e(i),[n,r,t]}function ut(e){var t=e.name,n=e.initialState;if(!t)throw new Error("`name` is a required option for createSlice");var r=e.reducers||{},i=void 0===e.extraReducers?[]:"function"==typeof e.extraReducers?st(e.extraReducers):[e.extraReducers],o=i[0],a=void 0===o?{}:o,l=i[1],s=void 0===l?[]:l,u=i[2],c=void 0===u?void 0:u,d=Object.keys(r),f={},p={},h={};d.forEach((function(e){var n,i,o=r[e],a=t+"/"+e;"reducer"in o?(n=o.reducer,i=o.prepare):n=o,f[e]=n,p[a]=n,h[e]=i?lt(a,i):lt(a)}));var v=function(e,t,n,r){void 0===n&&(n=[]);var i="function"==typeof t?st(t):[t,n,r],o=i[0],a=i[1],l=i[2];return function(t,n){void 0===t&&(t=e);var r=[o[n.type]].concat(a.filter((function(e){return(0,e.matcher)(n)})).map((function(e){return e.reducer})));return 0===r.filter((function(e){return!!e})).length&&(r=[l]),r.reduce((function(e,t){if(t){if(Z(e)){var r=t(e,n);return void 0===r?e:r}if(ee(e))return Qe(e,(function(e){return t(e,n)}));var i=t(e,n);if(void 0===i){if(null===e)return e;throw Error("A case reducer on a non-draftable value must not return undefined")}return i}return e}),t)}}(n,Ze({},a,{},p),s,c);return{name:t,reducer:v,actions:h,caseReducers:f}}"undefined"!=typeof Symbol&&(Symbol.iterator||(Symbol.iterator=Symbol("Symbol.iterator"))),"undefined"!=typeof Symbol&&(Symbol.asyncIterator||(Symbol.asyncIterator=Symbol("Symbol.asyncIterator"))),function(){function e(e,t){var n=i[e];return n?n.enumerable=t:i[e]=n={configurable:!0,enumerable:t,get:function(){var t=this[ze];return Be.get(t,e)},set:function(t){var n=this[ze];Be.set(n,e,t)}},n}function t(e){for(var t=e.length-1;t>=0;t--){var i=e[t][ze];if(!i.P)switch(i.i){case 5:r(i)&&Oe(i);break;case 4:n(i)&&Oe(i)}}}function n(e){for(var t=e.t,n=e.k,r=Ue(n),i=r.length-1;i>=0;i--){var o=r[i];if(o!==ze){var a=t[o];if(void 0===a&&!re(t,o))return!0;var l=n[o],s=l&&l[ze];if(s?s.t!==a:!oe(l,a))return!0}}var u=!!t[ze];return r.length!==Ue(t).length+(u?0:1)}function r(e){var t=e.k;if(t.length!==e.t.length)return!0;var n=Object.getOwnPropertyDescriptor(t,t.length-1);return!(!n||n.get)}var i={};!function(e,t){Ve[e]||(Ve[e]=t)}("ES5",{J:function(t,n){var r=Array.isArray(t),i=function(t,n){if(t){for(var r=Array(n.length),i=0;i<n.length;i++)Object.defineProperty(r,""+i,e(i,!0));return r}var o=$e(n);delete o[ze];for(var a=Ue(o),l=0;l<a.length;l++){var s=a[l];o[s]=e(s,t||!!o[s].enumerable)}return Object.create(Object.getPrototypeOf(n),o)}(r,t),o={i:r?5:4,A:n?n.A:he(),P:!1,I:!1,D:{},l:n,t,k:i,o:null,g:!1,C:!1};return Object.defineProperty(i,ze,{value:o,writable:!0}),i},S:function(e,n,i){i?Z(n)&&n[ze].A===e&&t(e.p):(e.u&&function e(t){if(t&&"object"==typeof t){var n=t[ze];if(n){var i=n.t,o=n.k,a=n.D,l=n.i;if(4===l)te(o,(function(t){t!==ze&&(void 0!==i[t]||re(i,t)?a[t]||e(o[t]):(a[t]=!0,Oe(n)))})),te(i,(function(e){void 0!==o[e]||re(o,e)||(a[e]=!1,Oe(n))}));else if(5===l){if(r(n)&&(Oe(n),a.length=!0),o.length<i.length)for(var s=o.length;s<i.length;s++)a[s]=!1;else for(var u=i.length;u<o.length;u++)a[u]=!0;for(var c=Math.min(o.length,i.length),d=0;d<c;d++)void 0===a[d]&&e(o[d])}}}}(e.p[0]),t(e.p))},K:function(e){return 4===e.i?n(e):r(e)}})}();const ct=ut({name:"users",initialState:[{id:"local",username:"Me"}],reducers:{addUser(e,{payload:t}){e.push(t)},updateUser(e,{payload:t}){const{id:n}=t,r=e.find((e=>e.id===n));Object.assign(r,t)},setUsername(e,{payload:t}){const n=t;e.find((e=>"local"===e.id)).username=n}}}),{actions:dt,reducer:ft}=ct,{addUser:pt,updateUser:ht,setUsername:vt}=dt,mt=ft,gt=ut({name:"messages",initialState:[],reducers:{addChatMessage(e,{payload:t}){e.push(t)},sendChatMessage(e,{payload:t}){}}}),{actions:yt,reducer:bt}=gt,{addChatMessage:wt,sendChatMessage:St}=yt,kt=bt,xt=ut({name:"connections",initialState:[],reducers:{addConnection(e,{payload:t}){e.push(t)},removeConnection(e,{payload:t}){const n=t;return e.filter((e=>e.id!==n))},updateConnection(e,{payload:t}){const{id:n}=t,r=e.find((e=>e.id===n));Object.assign(r,t)}}}),{actions:Et,reducer:Ct}=xt,{addConnection:Ot,removeConnection:Pt,updateConnection:jt}=Et,Tt=Ct,_t=ut({name:"feeds",initialState:[{id:"local",audioStream:null,videoStream:null,audioMuted:!0,videoEnabled:!0}],reducers:{addFeed(e,{payload:t}){e.push(t)},removeFeed(e,{payload:t}){const n=t;return e.filter((e=>e.id!==n))},updateFeed(e,{payload:t}){const{id:n}=t,r=e.find((e=>e.id===n));Object.assign(r,t)},swapFeeds(e,{payload:t}){const{id1:n,id2:r}=t,i=e.findIndex((e=>e.id===n)),o=e.findIndex((e=>e.id===r));[e[i],e[o]]=[e[o],e[i]]},setLocalAudio(e,{payload:t}){const n=t?new MediaStream([t]):null,r=e.find((e=>"local"===e.id));r&&(r.audioStream&&r.audioStream.getTracks().forEach((e=>e.stop())),r.audioStream=n)},setLocalVideo(e,{payload:t}){const n=t?new MediaStream([t]):null,r=e.find((e=>"local"===e.id));r&&(r.videoStream&&r.videoStream.getTracks().forEach((e=>e.stop())),r.videoStream=n)},disableRemoteVideo(e,{payload:t}){const n=t,r=e.find((e=>e.id===n));r&&(r.videoEnabled=!1)},enableRemoteVideo(e,{payload:t}){const n=t,r=e.find((e=>e.id===n));r&&(r.videoEnabled=!0)}}}),{actions:Nt,reducer:Rt}=_t,{addFeed:Mt,removeFeed:Dt,updateFeed:Lt,swapFeeds:It,setLocalAudio:At,setLocalVideo:Ft,disableRemoteVideo:zt,enableRemoteVideo:Ut}=Nt,$t=Rt;let Vt=0;const Bt=ut({name:"iceServers",initialState:[],reducers:{addIceServer(e,{payload:t}){const n=Object.assign({id:Vt++,enabled:!0},t);e.push(n)},removeIceServer(e,{payload:t}){const n=t;return e.filter((e=>e.id!==n))},updateIceServer(e,{payload:t}){const{id:n}=t,r=e.find((e=>e.id===n));Object.assign(r,t)}}}),{actions:Wt,reducer:qt}=Bt,{addIceServer:Ht,removeIceServer:Qt,updateIceServer:Kt}=Wt,Gt=qt;class Yt extends t.Component{constructor(e){super(e),this.state={value:""},this.handleChange=this.handleChange.bind(this),this.handleSubmit=this.handleSubmit.bind(this)}handleChange(e){const t=e.target.value;this.setState({value:t})}handleSubmit(e){e.preventDefault();const t=this.state.value.trim();t&&(this.props.sendChatMessage(t),this.setState({value:""}))}render(){return(0,e.jsxs)("div",Object.assign({className:"chat-message-bar"},{children:[(0,e.jsx)(Jt,{messages:this.props.messages},void 0),(0,e.jsxs)("form",{children:[(0,e.jsx)("input",{type:"text",placeholder:"Send a group chat message",value:this.state.value,onChange:this.handleChange},void 0),(0,e.jsx)("button",Object.assign({onClick:this.handleSubmit,"aria-label":"Send chat message"},{children:(0,e.jsx)("i",Object.assign({className:"material-icons"},{children:"send"}),void 0)}),void 0)]},void 0)]}),void 0)}}const Xt=Y((e=>({users:e.users,messages:e.messages})),{sendChatMessage:St})(Yt);class Jt extends t.Component{render(){return(0,e.jsx)("ul",Object.assign({className:"chat-message-log"},{children:this.props.messages.map((t=>(0,e.jsx)("li",{children:(0,e.jsx)(Zt,{from:t.from,timestamp:t.timestamp,text:t.text},void 0)},t.timestamp)))}),void 0)}}class Zt extends t.Component{render(){return(0,e.jsxs)("div",Object.assign({className:"chat-message"},{children:[(0,e.jsx)("p",Object.assign({className:"chat-message-from"},{children:this.props.from}),void 0),(0,e.jsx)("p",Object.assign({className:"chat-message-time"},{children:new Date(this.props.timestamp).toLocaleTimeString("en-US")}),void 0),(0,e.jsx)("p",Object.assign({className:"chat-message-text"},{children:this.props.text}),void 0)]}),void 0)}}class en extends t.Component{render(){const t=this.props.users,n=this.props.connections.map((e=>{const n=t.find((t=>t.id===e.id)),r=n?n.username:"Major Tom";return Object.assign({},e,{username:r})}));return 0===n.length?(0,e.jsx)("p",Object.assign({className:"connection-info-node"},{children:(0,e.jsx)("i",{children:"There are currently no other users in the room."},void 0)}),void 0):(0,e.jsx)("ul",Object.assign({className:"connection-info-bar"},{children:n.map((t=>(0,e.jsx)(nn,{connection:t},t.id)))}),void 0)}}const tn=Y((e=>({users:e.users,connections:e.connections})))(en);class nn extends t.Component{render(){const t=this.props.connection;return(0,e.jsx)("li",Object.assign({className:"connection-info-node"},{children:(0,e.jsxs)("details",{children:[(0,e.jsx)("summary",{children:t.username},void 0),(0,e.jsxs)("ul",{children:[(0,e.jsxs)("li",{children:["Username: ",(0,e.jsx)("span",{children:t.username},void 0)]},"username"),(0,e.jsxs)("li",{children:["Client ID: ",(0,e.jsx)("span",{children:t.id},void 0)]},"id"),(0,e.jsxs)("li",{children:["Connection state:"," ",(0,e.jsx)("span",{children:t.connectionState},void 0)]},"connection-state"),(0,e.jsxs)("li",{children:["Ice connection state:"," ",(0,e.jsx)("span",{children:t.iceConnectionState},void 0)]},"ice-connection-state"),(0,e.jsxs)("li",{children:["Ice gathering state:"," ",(0,e.jsx)("span",{children:t.iceGatheringState},void 0)]},"ice-gathering-state"),(0,e.jsxs)("li",{children:["Signaling state:"," ",(0,e.jsx)("span",{children:t.signalingState},void 0)]},"signaling-state")]},void 0)]},void 0)}),void 0)}}class rn extends t.Component{constructor(e){super(e),this.newServer=this.newServer.bind(this)}render(){return(0,e.jsxs)("div",Object.assign({className:"ice-servers-bar"},{children:[this.renderServers("stun"),this.renderServers("turn")]}),void 0)}renderServers(t){const{iceServers:n,updateIceServer:r,removeIceServer:i,allowEditing:o}=this.props,a=t[0].toUpperCase()+t.slice(1)+" Servers",l=n.filter((e=>e.kind===t));return(0,e.jsxs)("section",Object.assign({className:"ice-servers","aria-label":`${t} servers`},{children:[(0,e.jsx)("h6",{children:a},void 0),(0,e.jsx)("ul",{children:l.filter((e=>e.urls&&e.urls.length)).map((t=>(0,e.jsx)(an,{server:t,onSave:r,onDelete:i,allowEditing:o},t.id)))},void 0),o&&(0,e.jsx)("button",Object.assign({onClick:()=>this.newServer(t),"aria-label":`Add a ${t} server`},{children:(0,e.jsx)("i",Object.assign({className:"material-icons"},{children:"add"}),void 0)}),void 0)]}),void 0)}newServer(e){const t={urls:[`${e}:`],enabled:!1,kind:e};this.props.addIceServer(t)}}const on=Y((e=>({iceServers:e.iceServers})),{addIceServer:Ht,updateIceServer:Kt,removeIceServer:Qt})(rn);class an extends t.Component{constructor(e){super(e);const{urls:t,username:n,credential:r}=this.props.server;this.state={urls:t.join(","),username:n||"",credential:r||""},this.handleInputChange=this.handleInputChange.bind(this),this.handleSubmit=this.handleSubmit.bind(this),this.handleDelete=this.handleDelete.bind(this)}render(){const{server:t,allowEditing:n}=this.props,r=`${t.kind}:[\\w\\d_./:?=&%-]+`,i=`^${r}(,${r})*$`,o=t.urls[0].match(/(?:stun|turn):(?<host>[\w\d_.-]+)/),a=o&&o.groups?o.groups.host:"New server";return(0,e.jsx)("li",Object.assign({className:"ice-server"},{children:(0,e.jsxs)("details",{children:[(0,e.jsx)("summary",{children:a},void 0),(0,e.jsxs)("form",Object.assign({onSubmit:this.handleSubmit},{children:[(0,e.jsxs)("label",{children:["URLs",(0,e.jsx)("input",{name:"urls",type:"text",value:this.state.urls,onChange:this.handleInputChange,required:!0,pattern:i,readOnly:!n},void 0)]},void 0),(0,e.jsxs)("label",{children:["Username",(0,e.jsx)("input",{name:"username",type:"text",value:this.state.username,onChange:this.handleInputChange,required:"turn"===t.kind,readOnly:!n},void 0)]},void 0),(0,e.jsxs)("label",{children:["Password",(0,e.jsx)("input",{name:"credential",type:"password",value:this.state.credential,onChange:this.handleInputChange,required:"turn"===t.kind,readOnly:!n},void 0)]},void 0),n&&(0,e.jsxs)(e.Fragment,{children:[(0,e.jsx)("button",Object.assign({type:"button",onClick:this.handleDelete,"aria-label":`Delete this ${t.kind} server`},{children:(0,e.jsx)("i",Object.assign({className:"material-icons"},{children:"delete"}),void 0)}),void 0),(0,e.jsx)("button",Object.assign({type:"submit","aria-label":`Save this ${t.kind} server`},{children:(0,e.jsx)("i",Object.assign({className:"material-icons"},{children:"save"}),void 0)}),void 0)]},void 0)]}),void 0)]},void 0)}),void 0)}handleInputChange(e){const t=e.target.name,n=e.target.value;this.setState({[t]:n})}handleSubmit(e){e.preventDefault();const{urls:t,username:n,credential:r}=this.state,i={id:this.props.server.id,enabled:!0,urls:t.split(","),username:n||void 0,credential:r||void 0};this.props.onSave(i)}handleDelete(){this.props.onDelete(this.props.server.id)}}class ln extends t.Component{constructor(e){super(e),this.state={visible:!0,toggled:!1},this.toggleExpandButton=t.createRef(),this.handleToggle=this.handleToggle.bind(this),this.handleClose=this.handleClose.bind(this),this.handleCopyLink=this.handleCopyLink.bind(this)}render(){return this.state.visible?(0,e.jsxs)("div",Object.assign({className:"dialog slide-down invite-box",role:"dialog","aria-labelledby":"share-link-title"},{children:[(0,e.jsx)("h1",Object.assign({id:"share-link-title",className:"sr-only"},{children:"Share the link to invite others"}),void 0),(0,e.jsxs)("div",Object.assign({className:"input-line"},{children:[(0,e.jsx)("button",Object.assign({className:"icon-button",onClick:this.handleClose,"aria-label":"Close dialog"},{children:(0,e.jsx)("i",Object.assign({className:"material-icons"},{children:"close"}),void 0)}),void 0),(0,e.jsx)("input",{onClick:this.handleToggle,type:"button",value:"Share the link to invite others",readOnly:!0,ref:this.toggleExpandButton},void 0)]}),void 0),this.state.toggled&&(0,e.jsxs)("div",Object.assign({className:"input-line"},{children:[(0,e.jsx)("button",Object.assign({type:"button",onClick:this.handleCopyLink,"aria-label":"Copy the room link"},{children:(0,e.jsx)("i",Object.assign({className:"material-icons"},{children:"content_copy"}),void 0)}),void 0),(0,e.jsx)("input",{className:"invitation-link",name:"invitation-link",type:"text",value:window.location.href,readOnly:!0},void 0)]}),void 0)]}),void 0):null}handleToggle(){this.setState((e=>({toggled:!e.toggled})))}handleClose(){this.setState((e=>({visible:!e.visible})))}handleCopyLink(){const e=document.querySelector(".invitation-link");e.focus(),e.select(),document.execCommand("copy")}}const sn=ut({name:"devices",initialState:{audio:{active:!1,id:""},video:{active:!1,id:"",resolution:480,maxResolution:0},display:{active:!1}},reducers:{updateAudioDevice(e,{payload:t}){Object.assign(e.audio,t)},updateVideoDevice(e,{payload:t}){Object.assign(e.video,t)},updateDisplayDevice(e,{payload:t}){Object.assign(e.display,t)},setResolution(e,{payload:t}){e.video.resolution=t}}}),{actions:un,reducer:cn}=sn,{updateAudioDevice:dn,updateVideoDevice:fn,updateDisplayDevice:pn,setResolution:hn}=un,vn=cn;var mn=function(e,t,n,r){return new(n||(n=Promise))((function(i,o){function a(e){try{s(r.next(e))}catch(e){o(e)}}function l(e){try{s(r.throw(e))}catch(e){o(e)}}function s(e){var t;e.done?i(e.value):(t=e.value,t instanceof n?t:new n((function(e){e(t)}))).then(a,l)}s((r=r.apply(e,t||[])).next())}))};const gn=[2160,1080,720,480,360,240];function yn(){return mn(this,void 0,void 0,(function*(){try{return(yield navigator.mediaDevices.enumerateDevices()).filter((e=>"videoinput"===e.kind))}catch(e){return console.error(e),[]}}))}function bn(){return mn(this,void 0,void 0,(function*(){try{return(yield navigator.mediaDevices.enumerateDevices()).filter((e=>"audioinput"===e.kind))}catch(e){return console.error(e),[]}}))}function wn(){return mn(this,void 0,void 0,(function*(){return(yield bn()).length>0}))}function Sn(e){return mn(this,void 0,void 0,(function*(){const t=!!(e=e||{audio:!0,video:!0}).audio&&(yield wn())&&e.audio,n=!!e.video&&(yield wn())&&e.video;let r;e={audio:t,video:n};try{r=yield navigator.mediaDevices.getUserMedia(e)}catch(e){return console.error(e),{audio:null,video:null}}const i=r.getTracks().find((e=>"video"===e.kind));return{audio:r.getTracks().find((e=>"audio"===e.kind))||null,video:i||null}}))}function kn(e){return mn(this,void 0,void 0,(function*(){const t=e||!0,{video:n}=yield Sn({audio:!1,video:t});return n}))}function xn(e){return mn(this,void 0,void 0,(function*(){const t=e||!0,{audio:n}=yield Sn({audio:t,video:!1});return n}))}function En(){return mn(this,void 0,void 0,(function*(){const e={video:{cursor:"always"},audio:!1};let t;try{t=yield navigator.mediaDevices.getDisplayMedia(e)}catch(e){return console.error(e),null}return t.getTracks().find((e=>"video"===e.kind))||null}))}class Cn extends t.Component{constructor(e){super(e),this.state={nickname:"",audioDeviceId:"",videoDeviceId:"",mics:[],cameras:[]},this.videoPreview=t.createRef(),this.onSelectDevice=this.onSelectDevice.bind(this),this.handleChange=this.handleChange.bind(this),this.handleSubmit=this.handleSubmit.bind(this)}render(){return this.props.isVisible?(0,e.jsxs)(e.Fragment,{children:[(0,e.jsx)("div",{className:"modal-overlay"},void 0),(0,e.jsxs)("div",Object.assign({className:"enter-room-modal dialog fade-in"},{children:[(0,e.jsxs)("form",Object.assign({onSubmit:this.handleSubmit},{children:[(0,e.jsxs)("label",{children:["Nickname",(0,e.jsx)("input",{type:"text",name:"nickname",value:this.state.nickname,onChange:this.handleChange,required:!0},void 0)]},void 0),(0,e.jsx)(Pn,{label:"Microphone",devices:this.state.mics,onSelectDevice:this.onSelectDevice},void 0),(0,e.jsx)(Pn,{label:"Camera",devices:this.state.cameras,onSelectDevice:this.onSelectDevice},void 0),(0,e.jsx)("input",{type:"submit",value:"Enter room"},void 0)]}),void 0),(0,e.jsx)("div",Object.assign({className:"video-container"},{children:(0,e.jsx)("video",{ref:this.videoPreview,autoPlay:!0,playsInline:!0},void 0)}),void 0)]}),void 0)]},void 0):null}componentDidMount(){Sn().then((({audio:e,video:t})=>{e&&e.stop(),t&&t.stop()})).then((()=>Promise.all([bn(),yn()]))).then((([e,t])=>{this.setState({mics:e,cameras:t})}))}componentWillUnmount(){this.stopPreviewStream()}onSelectDevice(e,t){"Camera"===e?(this.stopPreviewStream(),t&&this.getMaxCameraResolution(t).then((e=>{this.props.updateVideoDevice({maxResolution:e})})).then((()=>kn({deviceId:t}))).then((e=>{if(e&&this.videoPreview.current){const t=new MediaStream([e]);this.videoPreview.current.srcObject=t}})),this.props.updateVideoDevice({id:t}),this.setState({videoDeviceId:t})):"Microphone"===e&&this.setState({audioDeviceId:t})}handleChange(e){const t=e.target.value;this.setState({nickname:t})}handleSubmit(e){e.preventDefault();const{nickname:t,audioDeviceId:n,videoDeviceId:r}=this.state;r||this.getMaxCameraResolution(r).then((e=>{this.props.updateVideoDevice({maxResolution:e})})),this.props.setUsername(t),this.props.updateVideoDevice({id:r,active:!!r}),this.props.updateAudioDevice({id:n,active:!!n}),this.props.onSubmit()}getMaxCameraResolution(e){return this.stopPreviewStream(),kn({deviceId:e,height:{ideal:2160}}).then((e=>{let t=0;return e&&(t=e.getSettings().height,e.stop()),t}))}stopPreviewStream(){if(this.videoPreview.current){const e=this.videoPreview.current.srcObject;e&&e.getTracks().forEach((e=>e.stop())),this.videoPreview.current.srcObject=null}}}const On=Y(null,{setUsername:vt,updateAudioDevice:dn,updateVideoDevice:fn})(Cn);class Pn extends t.Component{constructor(e){super(e),this.handleChange=this.handleChange.bind(this)}render(){return(0,e.jsxs)("label",{children:[this.props.label,(0,e.jsxs)("select",Object.assign({name:this.props.label,onChange:this.handleChange},{children:[(0,e.jsx)("option",Object.assign({value:""},{children:"None"}),void 0),this.props.devices.map((t=>(0,e.jsx)("option",Object.assign({value:t.deviceId},{children:t.label}),t.deviceId)))]}),void 0)]},void 0)}handleChange(e){const t=e.target.value;this.props.onSelectDevice(this.props.label,t)}}class jn extends t.Component{constructor(e){super(e),this.cancelButton=t.createRef(),this.leaveButton=t.createRef(),this.keyListener=this.keyListener.bind(this),this.handleCancel=this.handleCancel.bind(this),this.handleSubmit=this.handleSubmit.bind(this)}render(){return(0,e.jsxs)(e.Fragment,{children:[(0,e.jsx)("div",{className:"modal-overlay"},void 0),(0,e.jsxs)("div",Object.assign({className:"dialog fade-in exit-dialog",onKeyPress:this.keyListener,role:"dialog","aria-labelledby":"exit-dialog-title","aria-modal":"true"},{children:[(0,e.jsx)("p",Object.assign({id:"exit-dialog-title"},{children:"Do you want to leave the room?"}),void 0),(0,e.jsx)("input",{onClick:this.handleCancel,className:"btn btn-secondary btn-cancel",type:"button",value:"Cancel",ref:this.cancelButton},void 0),(0,e.jsx)("input",{onClick:this.handleSubmit,className:"btn btn-secondary",type:"submit",value:"Leave",ref:this.leaveButton},void 0)]}),void 0)]},void 0)}componentDidMount(){this.cancelButton.current&&this.cancelButton.current.focus()}keyListener(e){"Escape"===e.key&&(e.preventDefault(),this.props.onClose()),"Tab"===e.key&&(e.preventDefault(),document.activeElement===this.cancelButton.current&&this.leaveButton.current?this.leaveButton.current.focus():this.cancelButton.current&&this.cancelButton.current.focus())}handleCancel(){this.props.onClose()}handleSubmit(){window.location.href=window.location.origin}}class Tn extends t.Component{constructor(e){super(e),this.onTrack=this.onTrack.bind(this)}render(){const{videoDevice:t,audioDevice:n,displayDevice:r}=this.props,i=t.resolution,o={deviceId:t.id,height:{ideal:i},width:{ideal:4*i/3}},a={deviceId:n.id};return(0,e.jsxs)("section",Object.assign({className:"media-control-bar","aria-labelledby":"media-controls-title"},{children:[(0,e.jsx)("h1",Object.assign({id:"media-controls-title",className:"sr-only"},{children:"Media controls"}),void 0),(0,e.jsx)(Nn,{kind:"camera",deviceConstraints:o,isOn:t.active,onTrack:this.onTrack,getMedia:kn,icons:{on:"videocam",off:"videocam_off"},ariaLabel:"Toggle enable camera"},void 0),(0,e.jsx)(Nn,{kind:"mic",deviceConstraints:a,isOn:n.active,onTrack:this.onTrack,getMedia:xn,icons:{on:"mic",off:"mic_off"},ariaLabel:"Toggle enable microphone"},void 0),(0,e.jsx)(Nn,{kind:"display",deviceConstraints:null,isOn:r.active,onTrack:this.onTrack,getMedia:En,icons:{on:"screen_share",off:"stop_screen_share"},ariaLabel:"Toggle enable desktop sharing"},void 0),(0,e.jsx)(Rn,{},void 0)]}),void 0)}onTrack(e,t){"camera"===e?(this.props.setLocalVideo(t),t?(this.props.updateVideoDevice({active:!0}),this.props.updateDisplayDevice({active:!1})):this.props.updateVideoDevice({active:!1})):"display"===e?(this.props.setLocalVideo(t),t?(this.props.updateDisplayDevice({active:!0}),this.props.updateVideoDevice({active:!1})):this.props.updateDisplayDevice({active:!1})):"mic"===e&&(this.props.setLocalAudio(t),t?this.props.updateAudioDevice({active:!0}):this.props.updateAudioDevice({active:!1}))}}const _n=Y((e=>({audioDevice:e.devices.audio,videoDevice:e.devices.video,displayDevice:e.devices.display})),{setLocalAudio:At,setLocalVideo:Ft,updateAudioDevice:dn,updateVideoDevice:fn,updateDisplayDevice:pn})(Tn);class Nn extends t.Component{constructor(e){super(e),this.mediaTrack=null,this.onClick=this.onClick.bind(this)}mediaIsOn(){return Boolean(this.mediaTrack&&"live"===this.mediaTrack.readyState)}render(){return(0,e.jsx)("button",Object.assign({onClick:this.onClick,"aria-label":this.props.ariaLabel,"aria-pressed":this.props.isOn},{children:(0,e.jsx)("i",Object.assign({className:"material-icons"},{children:this.props.isOn?this.props.icons.on:this.props.icons.off}),void 0)}),void 0)}componentDidMount(){this.setMedia()}setMedia(){this.props.isOn&&!this.mediaIsOn()?this.mediaOn():!this.props.isOn&&this.mediaIsOn()&&this.mediaOff()}onClick(){this.props.isOn?this.mediaOff():this.mediaOn()}mediaOn(){this.props.getMedia(this.props.deviceConstraints).then((e=>{this.mediaTrack=e,this.props.onTrack(this.props.kind,e)}))}mediaOff(){this.mediaTrack&&this.mediaIsOn()&&(this.mediaTrack.enabled=!1,this.mediaTrack.stop()),this.props.onTrack(this.props.kind,null)}}class Rn extends t.Component{constructor(e){super(e),this.state={showExitDialog:!1},this.onClick=this.onClick.bind(this),this.onCloseExitDialog=this.onCloseExitDialog.bind(this)}render(){return(0,e.jsxs)(e.Fragment,{children:[this.state.showExitDialog&&(0,e.jsx)(jn,{onClose:this.onCloseExitDialog},void 0),(0,e.jsx)("button",Object.assign({onClick:this.onClick,"aria-label":"Hang up"},{children:(0,e.jsx)("i",Object.assign({className:"material-icons",style:{color:"#a00"}},{children:"call_end"}),void 0)}),void 0)]},void 0)}onClick(){this.setState({showExitDialog:!0})}onCloseExitDialog(){this.setState({showExitDialog:!1})}}class Mn extends t.Component{constructor(e){super(e),this.state={currentChild:0,isCollapsed:!0},this.onToggleButtonClick=this.onToggleButtonClick.bind(this),this.hide=this.hide.bind(this)}render(){const{currentChild:t,isCollapsed:n}=this.state,r=this.props.buttonAriaLabels[t];return(0,e.jsxs)("section",Object.assign({className:"sidebar "+(n?"collapsed":""),"aria-labelledby":"sidebar-title"},{children:[(0,e.jsx)("h1",Object.assign({id:"sidebar-title",className:"sr-only"},{children:"Sidebar"}),void 0),n&&this.renderToggleButtons(),!n&&(0,e.jsxs)(e.Fragment,{children:[(0,e.jsx)("button",Object.assign({className:"icon-button",onClick:this.hide,"aria-label":`Close ${r}`},{children:(0,e.jsx)("i",Object.assign({className:"material-icons"},{children:"close"}),void 0)}),void 0),this.props.children[t]]},void 0)]}),void 0)}renderToggleButtons(){const t=this.props.buttonIcons,n=this.props.buttonAriaLabels;return(0,e.jsx)("ul",Object.assign({className:"sidebar-toggle-buttons"},{children:t.map(((t,r)=>(0,e.jsx)("li",{children:(0,e.jsx)(Dn,{icon:t,onClick:this.onToggleButtonClick,ariaLabel:`Open ${n[r]}`},void 0)},t)))}),void 0)}onToggleButtonClick(e){const t=this.props.buttonIcons.indexOf(e);this.setState({currentChild:t,isCollapsed:!1}),this.props.onToggle("open")}hide(){this.setState({isCollapsed:!0}),this.props.onToggle("close")}}class Dn extends t.Component{constructor(e){super(e),this.onClick=this.onClick.bind(this)}render(){return(0,e.jsx)("button",Object.assign({className:"icon-button",onClick:this.onClick,"aria-label":this.props.ariaLabel},{children:(0,e.jsx)("i",Object.assign({className:"material-icons"},{children:this.props.icon}),void 0)}),void 0)}onClick(){this.props.onClick(this.props.icon)}}var Ln={fullscreenEnabled:0,fullscreenElement:1,requestFullscreen:2,exitFullscreen:3,fullscreenchange:4,fullscreenerror:5,fullscreen:6},In=["webkitFullscreenEnabled","webkitFullscreenElement","webkitRequestFullscreen","webkitExitFullscreen","webkitfullscreenchange","webkitfullscreenerror","-webkit-full-screen"],An=["mozFullScreenEnabled","mozFullScreenElement","mozRequestFullScreen","mozCancelFullScreen","mozfullscreenchange","mozfullscreenerror","-moz-full-screen"],Fn=["msFullscreenEnabled","msFullscreenElement","msRequestFullscreen","msExitFullscreen","MSFullscreenChange","MSFullscreenError","-ms-fullscreen"],zn="undefined"!=typeof window&&void 0!==window.document?window.document:{},Un="fullscreenEnabled"in zn&&Object.keys(Ln)||In[0]in zn&&In||An[0]in zn&&An||Fn[0]in zn&&Fn||[];const $n={requestFullscreen:function(e){return e[Un[Ln.requestFullscreen]]()},requestFullscreenFunction:function(e){return e[Un[Ln.requestFullscreen]]},get exitFullscreen(){return zn[Un[Ln.exitFullscreen]].bind(zn)},get fullscreenPseudoClass(){return":"+Un[Ln.fullscreen]},addEventListener:function(e,t,n){return zn.addEventListener(Un[Ln[e]],t,n)},removeEventListener:function(e,t,n){return zn.removeEventListener(Un[Ln[e]],t,n)},get fullscreenEnabled(){return Boolean(zn[Un[Ln.fullscreenEnabled]])},set fullscreenEnabled(e){},get fullscreenElement(){return zn[Un[Ln.fullscreenElement]]},set fullscreenElement(e){},get onfullscreenchange(){return zn[("on"+Un[Ln.fullscreenchange]).toLowerCase()]},set onfullscreenchange(e){return zn[("on"+Un[Ln.fullscreenchange]).toLowerCase()]=e},get onfullscreenerror(){return zn[("on"+Un[Ln.fullscreenerror]).toLowerCase()]},set onfullscreenerror(e){return zn[("on"+Un[Ln.fullscreenerror]).toLowerCase()]=e}};class Vn extends t.Component{constructor(e){super(e),this.state={volume:1,volumeMuted:!1,showSettings:!1},this.toggleAudioMute=this.toggleAudioMute.bind(this),this.handleVolumeChange=this.handleVolumeChange.bind(this),this.toggleSettings=this.toggleSettings.bind(this),this.togglePictureInPicture=this.togglePictureInPicture.bind(this),this.toggleFullscreen=this.toggleFullscreen.bind(this),this.toggleVisibility=this.toggleVisibility.bind(this)}render(){const{volume:t,volumeMuted:n,showSettings:r}=this.state,{videoRef:i,feed:o,showVisibilityControls:a,showAudioControls:l,showResolutionControls:s,videoDevice:u}=this.props,c=n||0==t?"volume_off":t<.6?"volume_down":"volume_up",d=i.current,f="pictureInPictureEnabled"in document||d&&"webkitSetPresentationMode"in d;return(0,e.jsxs)("div",Object.assign({className:"video-control-bar"},{children:[a&&(0,e.jsx)("button",Object.assign({className:"toggle-visibility",onClick:this.toggleVisibility,"aria-label":`Toggle mute video for feed ${o.username}`,"aria-pressed":!o.videoEnabled},{children:(0,e.jsx)("i",Object.assign({className:"material-icons"},{children:o.videoEnabled?"visibility":"visibility_off"}),void 0)}),void 0),l&&(0,e.jsxs)(e.Fragment,{children:[(0,e.jsx)("button",Object.assign({className:"toggle-audio",onClick:this.toggleAudioMute,"aria-label":`Toggle mute audio for feed ${o.username}`,"aria-pressed":this.state.volumeMuted},{children:(0,e.jsx)("i",Object.assign({className:"material-icons"},{children:c}),void 0)}),void 0),(0,e.jsx)("input",{className:"volume-slider",type:"range",min:"0",max:"1",step:"0.1",value:n?0:t,onChange:this.handleVolumeChange,"aria-label":`Audio volume slider for feed ${o.username}`},void 0)]},void 0),s&&u.active&&(0,e.jsx)("button",Object.assign({className:"toggle-settings",onClick:this.toggleSettings,"aria-label":"Toggle video settings menu for your camera"},{children:(0,e.jsx)("i",Object.assign({className:"material-icons"},{children:"settings"}),void 0)}),void 0),s&&u.active&&r&&this.renderSettings(),f&&(0,e.jsx)("button",Object.assign({className:"toggle-pip",onClick:this.togglePictureInPicture,"aria-label":`Toggle picture-in-picture video for feed ${o.username}`},{children:(0,e.jsx)("i",Object.assign({className:"material-icons"},{children:"picture_in_picture"}),void 0)}),void 0),$n.fullscreenEnabled&&(0,e.jsx)("button",Object.assign({className:"toggle-fullscreen",onClick:this.toggleFullscreen,"aria-label":`Toggle fullscreen video for feed ${o.username}`},{children:(0,e.jsx)("i",Object.assign({className:"material-icons"},{children:"fullscreen"}),void 0)}),void 0)]}),void 0)}renderSettings(){const t=this.props.videoDevice,n=`${t.resolution}p`,r=gn.filter((e=>e<=t.maxResolution)).map((e=>`${e}p`));return(0,e.jsxs)("div",Object.assign({className:"video-settings"},{children:[(0,e.jsx)("p",{children:"Video quality"},void 0),r.map((t=>(0,e.jsx)("button",Object.assign({onClick:()=>this.setQuality(t)},{children:(0,e.jsx)("span",Object.assign({className:t===n?"selected":""},{children:t}),void 0)}),t)))]}),void 0)}componentDidUpdate(){const e=this.props.audioRef.current;e&&(e.muted=this.state.volumeMuted,e.volume=this.state.volume)}toggleAudioMute(){this.setState((e=>({volumeMuted:!e.volumeMuted})))}handleVolumeChange(e){const t=Number(e.target.value);this.setState({volume:t,volumeMuted:!1})}toggleSettings(){this.setState((e=>({showSettings:!e.showSettings})))}setQuality(e){const t=Number(e.replace(/p/,""));this.props.setResolution(t),this.setState({showSettings:!1})}togglePictureInPicture(){const e=this.props.videoRef.current;e&&"webkitSetPresentationMode"in e?e.webkitSetPresentationMode("picture-in-picture"===e.webkitPresentationMode?"inline":"picture-in-picture"):document.pictureInPictureElement?document.exitPictureInPicture().catch((e=>{console.error(e)})):e&&e.requestPictureInPicture().catch((e=>{console.error(e)}))}toggleFullscreen(){const e=this.props.videoContainerRef.current;$n.fullscreenElement?$n.exitFullscreen():e&&$n.requestFullscreen(e)}toggleVisibility(){const e=this.props.feed;e.videoEnabled?this.props.disableRemoteVideo(e.id):this.props.enableRemoteVideo(e.id)}}const Bn=Y((e=>({videoDevice:e.devices.video})),{setResolution:hn,disableRemoteVideo:zt,enableRemoteVideo:Ut})(Vn);class Wn extends t.Component{constructor(e){super(e),this.state={videoHeightAspect:3,videoWidthAspect:4,videoScaleFactor:1},this.updateScaleFactor=this.updateScaleFactor.bind(this)}render(){const t=this.props.users,n=this.props.feeds.map((e=>{const n=t.find((t=>t.id===e.id)),r=n?n.username:"Major Tom";return Object.assign({},e,{username:r})})),r={height:`${Math.floor(this.state.videoScaleFactor*this.state.videoHeightAspect)}px`,width:`${Math.floor(this.state.videoScaleFactor*this.state.videoWidthAspect)}px`};return(0,e.jsxs)("ul",Object.assign({id:"video-stage",className:"video-stage","aria-labelledby":"video-stage-title"},{children:[(0,e.jsx)("h1",Object.assign({id:"video-stage-title",className:"sr-only"},{children:"Video feeds"}),void 0),n.map((t=>(0,e.jsx)(Hn,{feed:t,style:r,onDragAndDrop:this.props.swapFeeds},t.id)))]}),void 0)}componentDidMount(){window.addEventListener("resize",(()=>this.updateScaleFactor())),this.updateScaleFactor()}componentDidUpdate(){const e=this.calculateScaleFactor(this.props.feeds.length,this.state.videoHeightAspect,this.state.videoWidthAspect);e!==this.state.videoScaleFactor&&this.updateScaleFactor(e)}updateScaleFactor(e){this.setState(((t,n)=>({videoScaleFactor:e||this.calculateScaleFactor(n.feeds.length,t.videoHeightAspect,t.videoWidthAspect)})))}calculateScaleFactor(e,t,n,r=0){const i=document.querySelector("#video-stage"),o=i.clientHeight/t,a=i.clientWidth/n,l=Math.sqrt(e*(o/a)),s=Math.sqrt(e*(a/o)),u=Math.floor(l),c=Math.ceil(l),d=Math.floor(s),f=Math.ceil(s),p=[[u,d],[c,d],[u,f],[c,f]].filter((([t,n])=>t*n>=e)).map((([e,r])=>{const o=(i.clientWidth-4)/(r*n),a=(i.clientHeight-4)/(e*t);return Math.min(o,a)}));let h=Math.max(...p);return h*n<r&&(h=r/n),h}}const qn=Y((e=>({users:e.users,feeds:e.feeds})),{swapFeeds:It},null,{forwardRef:!0})(Wn);class Hn extends t.Component{constructor(e){super(e),this.video=t.createRef(),this.audio=t.createRef(),this.videoContainer=t.createRef(),this.onDragStart=this.onDragStart.bind(this),this.onDragOver=this.onDragOver.bind(this),this.onDrop=this.onDrop.bind(this),this.setAudio=this.setAudio.bind(this),this.setVideo=this.setVideo.bind(this)}render(){const t=this.props.feed;return(0,e.jsxs)("li",Object.assign({className:"video-feed",style:this.props.style,draggable:"true",onDragStart:this.onDragStart,onDragOver:this.onDragOver,onDrop:this.onDrop,tabIndex:0,"aria-labelledby":`video-feed-${t.id}`},{children:[(0,e.jsx)("h2",Object.assign({id:`video-feed-${t.id}`,className:"sr-only"},{children:`Video feed for user ${t.username}`}),void 0),(0,e.jsx)("p",Object.assign({className:"video-tag"},{children:t.username}),void 0),(0,e.jsx)("div",Object.assign({ref:this.videoContainer,style:{height:"100%"}},{children:(0,e.jsx)("video",{ref:this.video,id:t.id,autoPlay:!0,playsInline:!0,muted:!0},void 0)}),void 0),(0,e.jsx)("audio",{ref:this.audio,autoPlay:!0},void 0),(0,e.jsx)(Bn,{audioRef:this.audio,videoRef:this.video,videoContainerRef:this.videoContainer,feed:t,showVisibilityControls:"local"!==t.id,showAudioControls:!t.audioMuted,showResolutionControls:"local"===t.id},void 0)]}),void 0)}componentDidMount(){const{videoStream:e,audioStream:t,audioMuted:n,videoEnabled:r}=this.props.feed;this.setVideo(r?e:null),this.setAudio(n?null:t)}componentDidUpdate(){const{videoStream:e,audioStream:t,audioMuted:n,videoEnabled:r}=this.props.feed;this.setVideo(r?e:null),this.setAudio(n?null:t)}onDragStart(e){e.dataTransfer.setData("id",this.props.feed.id)}onDragOver(e){e.preventDefault()}onDrop(e){e.preventDefault();const t=e.dataTransfer.getData("id"),n=this.props.feed.id;this.props.onDragAndDrop({id1:t,id2:n})}setAudio(e){this.audio.current&&this.audio.current.srcObject!==e&&(this.audio.current.srcObject=e)}setVideo(e){this.video.current&&this.video.current.srcObject!==e&&(this.video.current.srcObject=e)}}class Qn extends t.Component{constructor(e){super(e),this.manager=this.props.manager,this.state={displayEnterRoomModal:!0},this.videoStage=t.createRef(),this.canUpdateIceServers=void 0!==(new RTCPeerConnection).setConfiguration,this.onSubmitModal=this.onSubmitModal.bind(this),this.onReceiveChatMessage=this.onReceiveChatMessage.bind(this),this.onReceiveIceServers=this.onReceiveIceServers.bind(this),this.onMediaPeer=this.onMediaPeer.bind(this),this.onMediaPeerRemoved=this.onMediaPeerRemoved.bind(this),this.onPeerTrack=this.onPeerTrack.bind(this),this.onPeerConnectionChange=this.onPeerConnectionChange.bind(this),this.onPeerUsernameChange=this.onPeerUsernameChange.bind(this),this.onSidebarToggle=this.onSidebarToggle.bind(this)}componentDidMount(){this.manager.addMessageListener({type:"text"},this.onReceiveChatMessage),this.manager.addMessageListener({type:"ice-servers"},this.onReceiveIceServers),this.manager.on("mediapeer",this.onMediaPeer),this.manager.on("mediapeerremoved",this.onMediaPeerRemoved),window.addEventListener("beforeunload",(()=>{this.manager.shutdown()})),window.addEventListener("load",(()=>function(e,t,n,r){return new(n||(n=Promise))((function(i,o){function a(e){try{s(r.next(e))}catch(e){o(e)}}function l(e){try{s(r.throw(e))}catch(e){o(e)}}function s(e){var t;e.done?i(e.value):(t=e.value,t instanceof n?t:new n((function(e){e(t)}))).then(a,l)}s((r=r.apply(e,t||[])).next())}))}(this,void 0,void 0,(function*(){yield this.manager.start()}))))}componentWillUnmount(){this.manager.shutdown()}render(){return this.state.displayEnterRoomModal?(0,e.jsx)(On,{isVisible:this.state.displayEnterRoomModal,onSubmit:this.onSubmitModal},void 0):(0,e.jsxs)(e.Fragment,{children:[(0,e.jsxs)("main",{children:[(0,e.jsx)(qn,{ref:this.videoStage},void 0),(0,e.jsx)(_n,{},void 0),(0,e.jsx)(ln,{},void 0)]},void 0),(0,e.jsxs)(Mn,Object.assign({buttonIcons:["message","people","settings"],buttonAriaLabels:["chat window","users window","settings window"],onToggle:this.onSidebarToggle},{children:[(0,e.jsx)(Xt,{},void 0),(0,e.jsx)(tn,{},void 0),(0,e.jsx)(on,{allowEditing:this.canUpdateIceServers},void 0)]}),void 0)]},void 0)}onSubmitModal(){this.setState({displayEnterRoomModal:!1})}onReceiveChatMessage(e){const t={from:e.data.from,timestamp:e.data.time,text:e.data.text};this.props.addChatMessage(t)}onReceiveIceServers(e){e.data.forEach((e=>{"string"==typeof e.urls&&(e.urls=[e.urls]);const t=e.urls[0].match(/^(?<kind>stun|turn):/);e.kind=t&&t.groups?t.groups.kind:"",this.props.addIceServer(e)}))}onMediaPeer(e){e.on("track",(t=>{this.onPeerTrack(e,t)})),e.on("connectionstatechange",(t=>{this.onPeerConnectionChange(e,"connectionState",t)})),e.on("iceconnectionstatechange",(t=>{this.onPeerConnectionChange(e,"iceConnectionState",t)})),e.on("icegatheringstatechange",(t=>{this.onPeerConnectionChange(e,"iceGatheringState",t)})),e.on("signalingstatechange",(t=>{this.onPeerConnectionChange(e,"signalingState",t)})),e.on("usernamechange",(t=>{this.onPeerUsernameChange(e,t)}));const t={id:e.id,username:e.username},n={id:e.id,videoStream:null,audioStream:null,videoEnabled:!0,audioMuted:!1},r={id:e.id,connectionState:e.connectionState,iceConnectionState:e.iceConnectionState,iceGatheringState:e.iceGatheringState,signalingState:e.signalingState};this.props.addUser(t),this.props.addFeed(n),this.props.addConnection(r)}onMediaPeerRemoved(e){this.props.removeFeed(e.id),this.props.removeConnection(e.id)}onPeerTrack(e,t){const n=new MediaStream([t]);t.addEventListener("unmute",(()=>{console.log("Track unmuted",t,n);const r="video"==t.kind?"videoStream":"audioStream",i={id:e.id,[r]:n};this.props.updateFeed(i)})),t.addEventListener("mute",(()=>{console.log("Track muted",t);const n="video"==t.kind?"videoStream":"audioStream",r={id:e.id,[n]:null};this.props.updateFeed(r)}))}onPeerConnectionChange(e,t,n){const r={id:e.id,[t]:n};this.props.updateConnection(r)}onPeerUsernameChange(e,t){const n={id:e.id,username:t};this.props.updateUser(n)}onSidebarToggle(){this.videoStage.current&&this.videoStage.current.forceUpdate()}}const Kn=Y(null,{addUser:pt,updateUser:ht,addChatMessage:wt,addConnection:Ot,removeConnection:Pt,updateConnection:jt,addFeed:Mt,removeFeed:Dt,updateFeed:Lt,addIceServer:Ht})(Qn);var Gn=function(e){return"@@redux-saga/"+e},Yn=Gn("CANCEL_PROMISE"),Xn=Gn("CHANNEL_END"),Jn=Gn("IO"),Zn=Gn("MATCH"),er=Gn("MULTICAST"),tr=Gn("SAGA_ACTION"),nr=Gn("SELF_CANCELLATION"),rr=Gn("TASK"),ir=Gn("TASK_CANCEL"),or=Gn("TERMINATE"),ar=Gn("LOCATION");function lr(){return(lr=Object.assign||function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e}).apply(this,arguments)}var sr=function(e){return null==e},ur=function(e){return null!=e},cr=function(e){return"function"==typeof e},dr=function(e){return"string"==typeof e},fr=Array.isArray,pr=function(e){return e&&cr(e.then)},hr=function(e){return e&&cr(e.next)&&cr(e.throw)},vr=function e(t){return t&&(dr(t)||yr(t)||cr(t)||fr(t)&&t.every(e))},mr=function(e){return e&&cr(e.take)&&cr(e.close)},gr=function(e){return cr(e)&&e.hasOwnProperty("toString")},yr=function(e){return Boolean(e)&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype},br=function(e){return function(){return true}}(),wr=function(){},Sr=function(e){return e};"function"==typeof Symbol&&Symbol.asyncIterator&&Symbol.asyncIterator;var kr=function(e,t){lr(e,t),Object.getOwnPropertySymbols&&Object.getOwnPropertySymbols(t).forEach((function(n){e[n]=t[n]}))};function xr(e,t){var n=e.indexOf(t);n>=0&&e.splice(n,1)}var Er=function(e){throw e},Cr=function(e){return{value:e,done:!0}};function Or(e,t,n){void 0===t&&(t=Er),void 0===n&&(n="iterator");var r={meta:{name:n},next:e,throw:t,return:Cr,isSagaIterator:!0};return"undefined"!=typeof Symbol&&(r[Symbol.iterator]=function(){return r}),r}function Pr(e,t){var n=t.sagaStack;console.error(e),console.error(n)}var jr=function(e){return Array.apply(null,new Array(e))},Tr=function(e){return function(t){return e(Object.defineProperty(t,tr,{value:!0}))}},_r=function(e){return e===or},Nr=function(e){return e===ir},Rr=function(e){return _r(e)||Nr(e)};function Mr(e,t){var n,r=Object.keys(e),i=r.length,o=0,a=fr(e)?jr(i):{},l={};return r.forEach((function(e){var r=function(r,l){n||(l||Rr(r)?(t.cancel(),t(r,l)):(a[e]=r,++o===i&&(n=!0,t(a))))};r.cancel=wr,l[e]=r})),t.cancel=function(){n||(n=!0,r.forEach((function(e){return l[e].cancel()})))},l}function Dr(e){return{name:e.name||"anonymous",location:Lr(e)}}function Lr(e){return e[ar]}var Ir=function(e){return function(e,t){void 0===e&&(e=10);var n=new Array(e),r=0,i=0,o=0,a=function(t){n[i]=t,i=(i+1)%e,r++},l=function(){if(0!=r){var t=n[o];return n[o]=null,r--,o=(o+1)%e,t}},s=function(){for(var e=[];r;)e.push(l());return e};return{isEmpty:function(){return 0==r},put:function(l){var u;if(r<e)a(l);else switch(t){case 1:throw new Error("Channel's Buffer overflow!");case 3:n[i]=l,o=i=(i+1)%e;break;case 4:u=2*e,n=s(),r=n.length,i=n.length,o=0,n.length=u,e=u,a(l)}},take:l,flush:s}}(e,4)},Ar="TAKE",Fr="FORK",zr="SELECT",Ur=function(e,t){var n;return(n={})[Jn]=!0,n.combinator=!1,n.type=e,n.payload=t,n};function $r(e,t){return void 0===e&&(e="*"),vr(e)?Ur(Ar,{pattern:e}):mr(n=e)&&n[er]&&ur(t)&&vr(t)?Ur(Ar,{channel:e,pattern:t}):mr(e)?Ur(Ar,{channel:e}):void 0;var n}function Vr(e,t){return sr(t)&&(t=e,e=void 0),Ur("PUT",{channel:e,action:t})}function Br(e,t){var n,r=null;return cr(e)?n=e:(fr(e)?(r=e[0],n=e[1]):(r=e.context,n=e.fn),r&&dr(n)&&cr(r[n])&&(n=r[n])),{context:r,fn:n,args:t}}function Wr(e,t,n){return void 0===n&&(n=[]),Ur("CALL",Br([e,t],n))}function qr(e){for(var t=arguments.length,n=new Array(t>1?t-1:0),r=1;r<t;r++)n[r-1]=arguments[r];return Ur(Fr,Br(e,n))}function Hr(e){return void 0===e&&(e=nr),Ur("CANCEL",e)}function Qr(e){void 0===e&&(e=Sr);for(var t=arguments.length,n=new Array(t>1?t-1:0),r=1;r<t;r++)n[r-1]=arguments[r];return Ur(zr,{selector:e,args:n})}function Kr(e){return Ur("GET_CONTEXT",e)}const Gr=function(){var e={};return e.promise=new Promise((function(t,n){e.resolve=t,e.reject=n})),e};var Yr=[],Xr=0;function Jr(e){try{ti(),e()}finally{ni()}}function Zr(e){Yr.push(e),Xr||(ti(),ri())}function ei(e){try{return ti(),e()}finally{ri()}}function ti(){Xr++}function ni(){Xr--}function ri(){var e;for(ni();!Xr&&void 0!==(e=Yr.shift());)Jr(e)}var ii=function(e){return function(t){return e.some((function(e){return ui(e)(t)}))}},oi=function(e){return function(t){return e(t)}},ai=function(e){return function(t){return t.type===String(e)}},li=function(e){return function(t){return t.type===e}},si=function(){return br};function ui(e){var t="*"===e?si:dr(e)?ai:fr(e)?ii:gr(e)?ai:cr(e)?oi:yr(e)?li:null;if(null===t)throw new Error("invalid pattern: "+e);return t(e)}var ci={type:Xn},di=function(e){return e&&e.type===Xn};function fi(){var e,t,n,r,i,o,a=(t=!1,r=n=[],i=function(){r===n&&(r=n.slice())},o=function(){t=!0;var e=n=r;r=[],e.forEach((function(e){e(ci)}))},(e={})[er]=!0,e.put=function(e){if(!t)if(di(e))o();else for(var i=n=r,a=0,l=i.length;a<l;a++){var s=i[a];s[Zn](e)&&(s.cancel(),s(e))}},e.take=function(e,n){var o,a;void 0===n&&(n=si),t?e(ci):(e[Zn]=n,i(),r.push(e),e.cancel=(o=function(){i(),xr(r,e)},a=!1,function(){a||(a=!0,o())}))},e.close=o,e),l=a.put;return a.put=function(e){e[tr]?l(e):Zr((function(){l(e)}))},a}function pi(e,t){var n=e[Yn];cr(n)&&(t.cancel=n),e.then(t,(function(e){t(e,!0)}))}var hi,vi=0,mi=function(){return++vi};function gi(e){e.isRunning()&&e.cancel()}var yi=((hi={}).TAKE=function(e,t,n){var r=t.channel,i=void 0===r?e.channel:r,o=t.pattern,a=t.maybe,l=function(e){e instanceof Error?n(e,!0):!di(e)||a?n(e):n(or)};try{i.take(l,ur(o)?ui(o):null)}catch(e){return void n(e,!0)}n.cancel=l.cancel},hi.PUT=function(e,t,n){var r=t.channel,i=t.action,o=t.resolve;Zr((function(){var t;try{t=(r?r.put:e.dispatch)(i)}catch(e){return void n(e,!0)}o&&pr(t)?pi(t,n):n(t)}))},hi.ALL=function(e,t,n,r){var i=r.digestEffect,o=vi,a=Object.keys(t);if(0!==a.length){var l=Mr(t,n);a.forEach((function(e){i(t[e],o,l[e],e)}))}else n(fr(t)?[]:{})},hi.RACE=function(e,t,n,r){var i=r.digestEffect,o=vi,a=Object.keys(t),l=fr(t)?jr(a.length):{},s={},u=!1;a.forEach((function(e){var t=function(t,r){u||(r||Rr(t)?(n.cancel(),n(t,r)):(n.cancel(),u=!0,l[e]=t,n(l)))};t.cancel=wr,s[e]=t})),n.cancel=function(){u||(u=!0,a.forEach((function(e){return s[e].cancel()})))},a.forEach((function(e){u||i(t[e],o,s[e],e)}))},hi.CALL=function(e,t,n,r){var i=t.context,o=t.fn,a=t.args,l=r.task;try{var s=o.apply(i,a);if(pr(s))return void pi(s,n);if(hr(s))return void ji(e,s,l.context,vi,Dr(o),!1,n);n(s)}catch(e){n(e,!0)}},hi.CPS=function(e,t,n){var r=t.context,i=t.fn,o=t.args;try{var a=function(e,t){sr(e)?n(t):n(e,!0)};i.apply(r,o.concat(a)),a.cancel&&(n.cancel=a.cancel)}catch(e){n(e,!0)}},hi.FORK=function(e,t,n,r){var i=t.context,o=t.fn,a=t.args,l=t.detached,s=r.task,u=function(e){var t=e.context,n=e.fn,r=e.args;try{var i=n.apply(t,r);if(hr(i))return i;var o=!1;return Or((function(e){return o?{value:e,done:!0}:(o=!0,{value:i,done:!pr(i)})}))}catch(e){return Or((function(){throw e}))}}({context:i,fn:o,args:a}),c=function(e,t){return e.isSagaIterator?{name:e.meta.name}:Dr(t)}(u,o);ei((function(){var t=ji(e,u,s.context,vi,c,l,void 0);l?n(t):t.isRunning()?(s.queue.addTask(t),n(t)):t.isAborted()?s.queue.abort(t.error()):n(t)}))},hi.JOIN=function(e,t,n,r){var i=r.task,o=function(e,t){if(e.isRunning()){var n={task:i,cb:t};t.cancel=function(){e.isRunning()&&xr(e.joiners,n)},e.joiners.push(n)}else e.isAborted()?t(e.error(),!0):t(e.result())};if(fr(t)){if(0===t.length)return void n([]);var a=Mr(t,n);t.forEach((function(e,t){o(e,a[t])}))}else o(t,n)},hi.CANCEL=function(e,t,n,r){var i=r.task;t===nr?gi(i):fr(t)?t.forEach(gi):gi(t),n()},hi.SELECT=function(e,t,n){var r=t.selector,i=t.args;try{n(r.apply(void 0,[e.getState()].concat(i)))}catch(e){n(e,!0)}},hi.ACTION_CHANNEL=function(e,t,n){var r=t.pattern,i=function(e){void 0===e&&(e=Ir());var t=!1,n=[];return{take:function(r){t&&e.isEmpty()?r(ci):e.isEmpty()?(n.push(r),r.cancel=function(){xr(n,r)}):r(e.take())},put:function(r){if(!t){if(0===n.length)return e.put(r);n.shift()(r)}},flush:function(n){t&&e.isEmpty()?n(ci):n(e.flush())},close:function(){if(!t){t=!0;var e=n;n=[];for(var r=0,i=e.length;r<i;r++)(0,e[r])(ci)}}}}(t.buffer),o=ui(r),a=function t(n){di(n)||e.channel.take(t,o),i.put(n)},l=i.close;i.close=function(){a.cancel(),l()},e.channel.take(a,o),n(i)},hi.CANCELLED=function(e,t,n,r){n(r.task.isCancelled())},hi.FLUSH=function(e,t,n){t.flush(n)},hi.GET_CONTEXT=function(e,t,n,r){n(r.task.context[t])},hi.SET_CONTEXT=function(e,t,n,r){var i=r.task;kr(i.context,t),n()},hi);function bi(e,t){return e+"?"+t}function wi(e){var t=e.name,n=e.location;return n?t+"  "+bi(n.fileName,n.lineNumber):t}function Si(e){var t,n,r,i=(t=function(e){return e.cancelledTasks},n=e,(r=[]).concat.apply(r,n.map(t)));return i.length?["Tasks cancelled due to error:"].concat(i).join("\n"):""}var ki=null,xi=[],Ei=function(e){e.crashedEffect=ki,xi.push(e)},Ci=function(){ki=null,xi.length=0},Oi=function(){var e=xi[0],t=xi.slice(1),n=e.crashedEffect?function(e){var t=Lr(e);return t?t.code+"  "+bi(t.fileName,t.lineNumber):""}(e.crashedEffect):null;return["The above error occurred in task "+wi(e.meta)+(n?" \n when executing effect "+n:"")].concat(t.map((function(e){return"    created by "+wi(e.meta)})),[Si(xi)]).join("\n")};function Pi(e,t,n,r,i,o,a){var l;void 0===a&&(a=wr);var s,u,c=0,d=null,f=[],p=Object.create(n),h=function(e,t,n){var r,i=[],o=!1;function a(e){f.push.apply(f,h.getTasks().map((function(e){return e.meta.name}))),s(),n(e,!0)}function l(t){i.push(t),t.cont=function(l,s){o||(xr(i,t),t.cont=wr,s?a(l):(t===e&&(r=l),i.length||(o=!0,n(r))))}}function s(){o||(o=!0,i.forEach((function(e){e.cont=wr,e.cancel()})),i=[])}return l(e),{addTask:l,cancelAll:s,abort:a,getTasks:function(){return i}}}(t,0,v);function v(t,n){if(n){if(c=2,Ei({meta:i,cancelledTasks:f}),m.isRoot){var r=Oi();Ci(),e.onError(t,{sagaStack:r})}u=t,d&&d.reject(t)}else t===ir?c=1:1!==c&&(c=3),s=t,d&&d.resolve(t);m.cont(t,n),m.joiners.forEach((function(e){e.cb(t,n)})),m.joiners=null}var m=((l={})[rr]=!0,l.id=r,l.meta=i,l.isRoot=o,l.context=p,l.joiners=[],l.queue=h,l.cancel=function(){0===c&&(c=1,h.cancelAll(),v(ir,!1))},l.cont=a,l.end=v,l.setContext=function(e){kr(p,e)},l.toPromise=function(){return d||(d=Gr(),2===c?d.reject(u):0!==c&&d.resolve(s)),d.promise},l.isRunning=function(){return 0===c},l.isCancelled=function(){return 1===c||0===c&&1===t.status},l.isAborted=function(){return 2===c},l.result=function(){return s},l.error=function(){return u},l);return m}function ji(e,t,n,r,i,o,a){var l=e.finalizeRunEffect((function(t,n,r){pr(t)?pi(t,r):hr(t)?ji(e,t,u.context,n,i,!1,r):t&&t[Jn]?(0,yi[t.type])(e,t.payload,r,c):r(t)}));d.cancel=wr;var s={meta:i,cancel:function(){0===s.status&&(s.status=1,d(ir))},status:0},u=Pi(e,s,n,r,i,o,a),c={task:u,digestEffect:f};return a&&(a.cancel=u.cancel),d(),u;function d(e,n){try{var i;n?(i=t.throw(e),Ci()):Nr(e)?(s.status=1,d.cancel(),i=cr(t.return)?t.return(ir):{done:!0,value:ir}):i=_r(e)?cr(t.return)?t.return():{done:!0}:t.next(e),i.done?(1!==s.status&&(s.status=3),s.cont(i.value)):f(i.value,r,d)}catch(e){if(1===s.status)throw e;s.status=2,s.cont(e,!0)}}function f(t,n,r,i){void 0===i&&(i="");var o,a=mi();function s(n,i){o||(o=!0,r.cancel=wr,e.sagaMonitor&&(i?e.sagaMonitor.effectRejected(a,n):e.sagaMonitor.effectResolved(a,n)),i&&function(e){ki=e}(t),r(n,i))}e.sagaMonitor&&e.sagaMonitor.effectTriggered({effectId:a,parentEffectId:n,label:i,effect:t}),s.cancel=wr,r.cancel=function(){o||(o=!0,s.cancel(),s.cancel=wr,e.sagaMonitor&&e.sagaMonitor.effectCancelled(a))},l(t,a,s)}}function Ti(e,t){for(var n=e.channel,r=void 0===n?fi():n,i=e.dispatch,o=e.getState,a=e.context,l=void 0===a?{}:a,s=e.sagaMonitor,u=e.effectMiddlewares,c=e.onError,d=void 0===c?Pr:c,f=arguments.length,p=new Array(f>2?f-2:0),h=2;h<f;h++)p[h-2]=arguments[h];var v,m=t.apply(void 0,p),g=mi();if(s&&(s.rootSagaStarted=s.rootSagaStarted||wr,s.effectTriggered=s.effectTriggered||wr,s.effectResolved=s.effectResolved||wr,s.effectRejected=s.effectRejected||wr,s.effectCancelled=s.effectCancelled||wr,s.actionDispatched=s.actionDispatched||wr,s.rootSagaStarted({effectId:g,saga:t,args:p})),u){var y=L.apply(void 0,u);v=function(e){return function(t,n,r){return y((function(t){return e(t,n,r)}))(t)}}}else v=Sr;var b={channel:r,dispatch:Tr(i),getState:o,sagaMonitor:s,onError:d,finalizeRunEffect:v};return ei((function(){var e=ji(b,m,l,g,Dr(t),!0,void 0);return s&&s.effectResolved(g,e),e}))}class _i{constructor(){this.events=new Map}listeners(e){return this.events.get(e)||[]}on(e,t){this.events.has(e)||this.events.set(e,[]),this.events.get(e).push(t)}removeListener(e,t){const n=this.events.get(e);if(n&&n.includes(t)){const e=n.indexOf(t);n.splice(e,1)}}emit(e,...t){if(this.events.has(e)){const n=this.events.get(e);n&&n.forEach((e=>{e(...t)}))}}}var Ni=function(e,t,n,r){return new(n||(n=Promise))((function(i,o){function a(e){try{s(r.next(e))}catch(e){o(e)}}function l(e){try{s(r.throw(e))}catch(e){o(e)}}function s(e){var t;e.done?i(e.value):(t=e.value,t instanceof n?t:new n((function(e){e(t)}))).then(a,l)}s((r=r.apply(e,t||[])).next())}))};class Ri extends _i{constructor(e,t,n,r=[],i=[]){super(),this.id=e.id,this._username=e.username,this.signaler=t,this.polite=n,this.makingOffer=!1,this._iceServers=r,this.connection=this.createPeerConnection(r);for(const e of i)this.addTrack(e)}set username(e){this._username=e,this.emit("usernamechange",e)}get username(){return this._username}set iceServers(e){this._iceServers=e;try{this.connection.setConfiguration({iceServers:e}),console.log(`[${this.id}] Updated connection configuration: `,this.connection.getConfiguration()),this.restartIce()}catch(e){console.error("Updating ICE servers failed: ",e)}}get iceServers(){return this._iceServers}createPeerConnection(e){const t=new RTCPeerConnection({sdpSemantics:"unified-plan",iceServers:e});return t.ontrack=({track:e,streams:t})=>{console.log(`[${this.id}] ${e.kind} track ${e.id} received`),this.emit("track",e,t)},t.onconnectionstatechange=()=>{console.log(`[${this.id}] Connection state: ${t.connectionState}`),this.emit("connectionstatechange",t.connectionState)},t.oniceconnectionstatechange=()=>{console.log(`[${this.id}] Ice connection state: ${t.iceConnectionState}`),"failed"===t.iceConnectionState&&this.restartIce(),this.emit("iceconnectionstatechange",t.iceConnectionState)},t.onsignalingstatechange=()=>{console.log(`[${this.id}] Signaling state: ${t.signalingState}`),this.emit("signalingstatechange",t.signalingState)},t.onicegatheringstatechange=()=>{console.log(`[${this.id}] Ice gathering state: ${t.iceGatheringState}`),this.emit("icegatheringstatechange",t.iceGatheringState)},t.onnegotiationneeded=()=>Ni(this,void 0,void 0,(function*(){console.log(`[${this.id}] onnegotiationneeded`);try{this.makingOffer=!0;const e=yield t.createOffer();if("stable"!==t.signalingState)return;yield t.setLocalDescription(e);const n=t.localDescription.toJSON();"offer"===n.type?(console.log(`[${this.id}] onnegotiationneeded: send offer`),this.signaler.offer(this.id,n)):"answer"===n.type?(console.log(`[${this.id}] onnegotiationneeded: send answer`),this.signaler.answer(this.id,n)):console.error("onnegotiationneeded: unknown description type")}catch(e){console.error(e)}finally{this.makingOffer=!1}})),t.onicecandidate=({candidate:e})=>{e&&this.signaler.icecandidate(this.id,e.toJSON())},t}connect(){this.connection.addTransceiver("video"),this.connection.addTransceiver("audio")}get connectionState(){return this.connection.connectionState}get iceConnectionState(){return this.connection.iceConnectionState}get iceGatheringState(){return this.connection.iceGatheringState}get signalingState(){return this.connection.signalingState}onOffer(e){return Ni(this,void 0,void 0,(function*(){if("offer"!==e.type)throw new Error("type mismatch");try{if(this.makingOffer||"stable"!==this.connection.signalingState){if(!this.polite)return;yield Promise.all([this.connection.setLocalDescription({type:"rollback"}),this.connection.setRemoteDescription(e)])}else yield this.connection.setRemoteDescription(e);const t=yield this.connection.createAnswer();yield this.connection.setLocalDescription(t);const n=this.connection.localDescription.toJSON();this.signaler.answer(this.id,n)}catch(e){console.error(e)}}))}onAnswer(e){return Ni(this,void 0,void 0,(function*(){try{yield this.connection.setRemoteDescription(e)}catch(e){console.error(e)}}))}onIceCandidate(e){return Ni(this,void 0,void 0,(function*(){try{yield this.connection.addIceCandidate(e)}catch(e){console.error(e)}}))}addTrack(e){this.connection.addTrack(e)}getTracks(){return this.connection.getSenders().map((e=>e.track)).filter((e=>null!==e))}replaceTrack(e,t){return Ni(this,void 0,void 0,(function*(){const n=this.connection.getSenders().find((t=>t.track&&t.track.id===e));if(!n)throw new Error(`Track with id "${e}" does not exist.`);console.log("Replacing track on sender ",n),yield n.replaceTrack(t)}))}removeTrack(e){const t=this.connection.getSenders().find((t=>t.track&&t.track.id===e));if(!t)throw new Error(`Track with id "${e}" does not exist.`);console.log("Removing track"),this.connection.removeTrack(t)}disableRemoteTrack(e){const t=this.connection.getTransceivers().find((t=>t.receiver&&t.receiver.track&&t.receiver.track.id===e));if(!t)throw new Error(`Track with id "${e}" does not exist.`);console.log("Disable remote track"),t.direction="sendonly"}enableRemoteTrack(e){const t=this.connection.getTransceivers().find((t=>t.receiver&&t.receiver.track&&t.receiver.track.id===e));if(!t)throw new Error(`Track with id "${e}" does not exist.`);console.log("Enable remote track"),t.direction="sendrecv"}disableRemoteVideo(){this.connection.getTransceivers().filter((e=>e.receiver&&e.receiver.track&&"video"===e.receiver.track.kind)).forEach((e=>e.direction="sendonly"))}enableRemoteVideo(){this.connection.getTransceivers().filter((e=>e.receiver&&e.receiver.track&&"video"===e.receiver.track.kind)).forEach((e=>e.direction="sendrecv"))}restartIce(){"restartIce"in this.connection&&(this.connection.restartIce(),console.log(`[${this.id}] Restarted ICE`))}shutdown(){null!==this.connection&&(this.connection.getReceivers().forEach((e=>{e.track&&e.track.stop()})),this.connection.close()),this.signaler.bye(this.id),this.emit("shutdown"),console.log("Shutdown connection with peer "+this.id)}}var Mi=function(e,t,n,r){return new(n||(n=Promise))((function(i,o){function a(e){try{s(r.next(e))}catch(e){o(e)}}function l(e){try{s(r.throw(e))}catch(e){o(e)}}function s(e){var t;e.done?i(e.value):(t=e.value,t instanceof n?t:new n((function(e){e(t)}))).then(a,l)}s((r=r.apply(e,t||[])).next())}))};class Di{constructor(e,t){this.manager=e,this.signaler=t,this.messageListeners=[],this.handlers={ping:this.ping,pong:this.pong,text:this.text,history:this.history,"get-room-info":this.getRoomInfo,"room-info":this.roomInfo,"get-ice-servers":this.getIceServers,"ice-servers":this.iceServers,profile:this.profile,offer:this.offer,answer:this.answer,icecandidate:this.iceCandidate,greeting:this.greeting,bye:this.bye}}addMessageListener(e,t){this.messageListeners.push([e,t])}handleMessage(e){return Mi(this,void 0,void 0,(function*(){const t=this.handlers[e.type];t&&(yield t.call(this,e)),this.messageListeners.forEach((([t,n])=>{this.match(e,t)&&n(e)}))}))}ping(e){return Mi(this,void 0,void 0,(function*(){if(console.log("<< Received ping: ",e),e.sender){const t=this.emptyMessage();t.receiver=e.sender,t.type="pong",t.data=e.data,this.signaler.send(t)}}))}pong(e){return Mi(this,void 0,void 0,(function*(){console.log("<< Received pong: ",e)}))}text(e){return Mi(this,void 0,void 0,(function*(){console.log("<< Received text: ",e),this.manager.textMessages.push(e.data)}))}history(e){return Mi(this,void 0,void 0,(function*(){if(console.log("<< Received history: ",e),"ground control"===e.sender&&Array.isArray(e.data))for(const t of e.data)yield this.handleMessage(t)}))}getRoomInfo(e){return Mi(this,void 0,void 0,(function*(){console.log("<< Received get-room-info: ",e)}))}roomInfo(e){return Mi(this,void 0,void 0,(function*(){console.log("<< Received room-info: ",e),this.manager.updatePeers(e.data)}))}getIceServers(e){return Mi(this,void 0,void 0,(function*(){console.log("<< Received get-ice-servers: ",e)}))}iceServers(e){return Mi(this,void 0,void 0,(function*(){console.log("<< Received ice-servers: ",e)}))}profile(e){return Mi(this,void 0,void 0,(function*(){console.log("<< Received profile: ",e)}))}offer(e){return Mi(this,void 0,void 0,(function*(){if(e.sender){const t=this.manager.getOrCreateMediaPeer({id:e.sender,username:"Major Tom"});yield t.onOffer(e.data)}}))}answer(e){return Mi(this,void 0,void 0,(function*(){if(e.sender){const t=this.manager.getOrCreateMediaPeer({id:e.sender,username:"Major Tom"});yield t.onAnswer(e.data)}}))}iceCandidate(e){return Mi(this,void 0,void 0,(function*(){if(e.sender){const t=this.manager.getOrCreateMediaPeer({id:e.sender,username:"Major Tom"}),n=new RTCIceCandidate(e.data);yield t.onIceCandidate(n)}}))}greeting(e){return Mi(this,void 0,void 0,(function*(){console.log("<< Received greeting: ",e)}))}bye(e){return Mi(this,void 0,void 0,(function*(){console.log("<< Received bye: ",e),e.sender&&this.manager.removeMediaPeer(e.sender)}))}emptyMessage(){return{sender:"",receiver:"",type:"",data:""}}match(e,t){for(const n in t)if(!(n in e)||e[n]!==t[n])return!1;return!0}}var Li=function(e,t,n,r){return new(n||(n=Promise))((function(i,o){function a(e){try{s(r.next(e))}catch(e){o(e)}}function l(e){try{s(r.throw(e))}catch(e){o(e)}}function s(e){var t;e.done?i(e.value):(t=e.value,t instanceof n?t:new n((function(e){e(t)}))).then(a,l)}s((r=r.apply(e,t||[])).next())}))};class Ii extends _i{constructor(){super(),this.connect=this.connect.bind(this),this.socket=this.connect()}connect(){const e=`${location.protocol.startsWith("https")?"wss":"ws"}://${location.host}${location.pathname}/ws`,t=new WebSocket(e);return t.onopen=()=>{this.emit("open")},t.onclose=()=>{this.emit("close"),setTimeout(this.connect,5e3)},t.onerror=e=>{this.emit("error",e),t.close()},t.onmessage=e=>{this.emit("message",JSON.parse(e.data))},t}get connectionState(){switch(this.socket.readyState){case WebSocket.CONNECTING:return"connecting";case WebSocket.OPEN:return"open";case WebSocket.CLOSING:return"closing";case WebSocket.CLOSED:return"closed";default:return"unknown"}}send(e){this.socket.send(JSON.stringify(e))}sendReceive(e,t){return new Promise((n=>{const r=this;r.on("message",(function e(i){(function(e){for(const n in t)if(!(n in e)||e[n]!==t[n])return!1;return!0})(i)&&(r.removeListener("message",e),n(i))})),this.send(e)}))}ping(){return Li(this,void 0,void 0,(function*(){const e=(new Date).getTime(),t={receiver:"ground control",type:"ping",data:e},n={sender:"ground control",type:"pong",data:e};return yield this.sendReceive(t,n)}))}getRoomInfo(){return Li(this,void 0,void 0,(function*(){return(yield this.sendReceive({receiver:"ground control",type:"get-room-info"},{sender:"ground control",type:"room-info"})).data}))}fetchIceServers(){return Li(this,void 0,void 0,(function*(){return(yield this.sendReceive({receiver:"ground control",type:"get-ice-servers"},{sender:"ground control",type:"ice-servers"})).data}))}text(e,t,n,r){n=n||"room",r=r||(new Date).getTime(),this.send({receiver:n,type:"text",data:{from:t,time:r,text:e}})}profile(e){this.send({receiver:"ground control",type:"profile",data:{username:e}})}offer(e,t){this.send({receiver:e,type:"offer",data:t})}answer(e,t){this.send({receiver:e,type:"answer",data:t})}bye(e){this.send({receiver:e,type:"bye",data:(new Date).getTime()})}icecandidate(e,t){this.send({receiver:e,type:"icecandidate",data:t})}greeting(e,t){e=e||"ground control",t=t||"This is Major Tom to Ground Control: I'm stepping through the door. And the stars look very different today.",this.send({receiver:e,type:"greeting",data:t})}shutdown(){this.socket.readyState===WebSocket.OPEN&&this.bye("ground control"),this.socket.close(1e3,"goodbye"),this.emit("shutdown")}}var Ai=function(e,t,n,r){return new(n||(n=Promise))((function(i,o){function a(e){try{s(r.next(e))}catch(e){o(e)}}function l(e){try{s(r.throw(e))}catch(e){o(e)}}function s(e){var t;e.done?i(e.value):(t=e.value,t instanceof n?t:new n((function(e){e(t)}))).then(a,l)}s((r=r.apply(e,t||[])).next())}))};const Fi=new class extends _i{constructor(){super(),this.username="Major Tom",this.signaler=new Ii,this.mediaPeers=new Map,this.mediaTracks=new Map,this.localVideoStream=new MediaStream,this.textMessages=[],this.messageHandler=new Di(this,this.signaler),this.id="",this._iceServers=[]}setUsername(e){this.username=e,this.signaler.profile(e)}setIceServers(e){this.iceServers=e}set iceServers(e){this._iceServers=e,this.mediaPeers.forEach((t=>{t.iceServers=e}))}get iceServers(){return this._iceServers}addTrack(e,t){if(this.mediaTracks.has(e))throw new Error(`Track with name "${e}" already exists.`);for(const e of this.mediaPeers.values())e.addTrack(t);this.mediaTracks.set(e,t),this.localVideoStream.addTrack(t)}replaceTrack(e,t){return Ai(this,void 0,void 0,(function*(){if(!this.mediaTracks.has(e))throw new Error(`Track with name "${e}" does not exist.`);const n=this.mediaTracks.get(e);for(const e of this.mediaPeers.values())yield e.replaceTrack(n.id,t);this.mediaTracks.set(e,t),this.localVideoStream.removeTrack(n),this.localVideoStream.addTrack(t)}))}setTrack(e,t){return Ai(this,void 0,void 0,(function*(){this.mediaTracks.has(e)?yield this.replaceTrack(e,t):this.addTrack(e,t)}))}removeTrack(e){if(!this.mediaTracks.has(e))throw new Error(`Track with name "${e}" does not exist.`);const t=this.mediaTracks.get(e);for(const e of this.mediaPeers.values())e.removeTrack(t.id);this.mediaTracks.delete(e),this.localVideoStream.removeTrack(t)}stopTrack(e){if(!this.mediaTracks.has(e))throw new Error(`Track with name "${e}" does not exist.`);const t=this.mediaTracks.get(e);t.enabled=!1,t.stop()}createMediaPeer(e){const t=new Ri(e,this.signaler,this.id<e.id,this.iceServers,[...this.mediaTracks.values()]);return this.mediaPeers.set(e.id,t),console.log("Created video peer ",t.id),this.emit("mediapeer",t),t}getOrCreateMediaPeer(e){return this.mediaPeers.get(e.id)||this.createMediaPeer(e)}removeMediaPeer(e){const t=this.mediaPeers.get(e);t&&(t.shutdown(),this.mediaPeers.delete(e),this.emit("mediapeerremoved",t))}findPeers(){return Ai(this,void 0,void 0,(function*(){const e=yield this.signaler.getRoomInfo();this.updatePeers(e)}))}updatePeers(e){const t=e.clients.map((({id:e})=>e));Array.from(this.mediaPeers.keys()).filter((e=>!t.includes(e))).forEach((e=>{this.removeMediaPeer(e)}));for(const t of e.clients)t.id!==this.id&&this.getOrCreateMediaPeer(t);this.mediaPeers.forEach(((t,n)=>{const r=e.clients.find((e=>e.id===n));r&&(t.username=r.username)}))}addMessageListener(e,t){this.messageHandler.addMessageListener(e,t)}shutdownMediaPeers(){this.mediaPeers.forEach((e=>{e.shutdown()})),this.mediaPeers.clear()}getSelfId(){return Ai(this,void 0,void 0,(function*(){return(yield this.signaler.ping()).receiver}))}shutdown(){this.shutdownMediaPeers(),this.signaler.shutdown()}start(){return Ai(this,void 0,void 0,(function*(){for(this.signaler.on("message",(e=>{this.messageHandler.handleMessage(e)}));"open"!=this.signaler.connectionState;)yield new Promise((e=>{setTimeout(e,100)}));this.id=yield this.getSelfId(),this.iceServers=yield this.signaler.fetchIceServers(),yield this.findPeers()}))}},zi=function(e){var t,n=void 0===e?{}:e,r=n.context,i=void 0===r?{}:r,o=n.channel,a=void 0===o?fi():o,l=n.sagaMonitor,s=function(e,t){if(null==e)return{};var n,r,i={},o=Object.keys(e);for(r=0;r<o.length;r++)n=o[r],t.indexOf(n)>=0||(i[n]=e[n]);return i}(n,["context","channel","sagaMonitor"]);function u(e){var n=e.getState,r=e.dispatch;return t=Ti.bind(null,lr({},s,{context:i,channel:a,dispatch:r,getState:n,sagaMonitor:l})),function(e){return function(t){l&&l.actionDispatched&&l.actionDispatched(t);var n=e(t);return a.put(t),n}}}return u.run=function(){return t.apply(void 0,arguments)},u.setContext=function(e){kr(i,e)},u}({context:{manager:Fi}}),Ui=function(e){var t,n=function(e){return function(e){void 0===e&&(e={});var t=e,n=t.thunk,r=void 0===n||n,i=(t.immutableCheck,t.serializableCheck,new at);return r&&(function(e){return"boolean"==typeof e}(r)?i.push(Je):i.push(Je.withExtraArgument(r.extraArgument))),i}(e)},r=e||{},i=r.reducer,o=void 0===i?void 0:i,a=r.middleware,l=void 0===a?n():a,s=r.devTools,u=void 0===s||s,c=r.preloadedState,d=void 0===c?void 0:c,f=r.enhancers,p=void 0===f?void 0:f;if("function"==typeof o)t=o;else{if(!function(e){if("object"!=typeof e||null===e)return!1;for(var t=e;null!==Object.getPrototypeOf(t);)t=Object.getPrototypeOf(t);return Object.getPrototypeOf(e)===t}(o))throw new Error('"reducer" is a required argument, and must be a function or an object of functions that can be passed to combineReducers');t=function(e){for(var t=Object.keys(e),n={},r=0;r<t.length;r++){var i=t[r];"function"==typeof e[i]&&(n[i]=e[i])}var o,a=Object.keys(n);try{!function(e){Object.keys(e).forEach((function(t){var n=e[t];if(void 0===n(void 0,{type:P.INIT}))throw new Error('Reducer "'+t+"\" returned undefined during initialization. If the state passed to the reducer is undefined, you must explicitly return the initial state. The initial state may not be undefined. If you don't want to set a value for this reducer, you can use null instead of undefined.");if(void 0===n(void 0,{type:P.PROBE_UNKNOWN_ACTION()}))throw new Error('Reducer "'+t+"\" returned undefined when probed with a random type. Don't try to handle "+P.INIT+' or other actions in "redux/*" namespace. They are considered private. Instead, you must return the current state for any unknown actions, unless it is undefined, in which case you must return the initial state, regardless of the action type. The initial state may not be undefined, but can be null.')}))}(n)}catch(e){o=e}return function(e,t){if(void 0===e&&(e={}),o)throw o;for(var r=!1,i={},l=0;l<a.length;l++){var s=a[l],u=n[s],c=e[s],d=u(c,t);if(void 0===d){var f=_(s,t);throw new Error(f)}i[s]=d,r=r||d!==c}return(r=r||a.length!==Object.keys(e).length)?i:e}}(o)}var h=I.apply(void 0,"function"==typeof l?l(n):l),v=L;u&&(v=ot(Ze({trace:!1},"object"==typeof u&&u)));var m=[h];return Array.isArray(p)?m=[h].concat(p):"function"==typeof p&&(m=p(m)),T(t,d,v.apply(void 0,m))}({reducer:{devices:vn,users:mt,messages:kt,feeds:$t,iceServers:Gt,connections:Tt},middleware:[zi]});var $i=function(e){return{done:!0,value:e}},Vi={};function Bi(e){return mr(e)?"channel":gr(e)?String(e):cr(e)?e.name:String(e)}function Wi(e,t,n){var r,i,o,a=t;function l(t,n){if(a===Vi)return $i(t);if(n&&!i)throw a=Vi,n;r&&r(t);var l=n?e[i](n):e[a]();return a=l.nextState,o=l.effect,r=l.stateUpdater,i=l.errorState,a===Vi?$i(t):o}return Or(l,(function(e){return l(null,e)}),n)}function qi(e,t){for(var n=arguments.length,r=new Array(n>2?n-2:0),i=2;i<n;i++)r[i-2]=arguments[i];var o,a={done:!1,value:$r(e)},l=function(e){return{done:!1,value:qr.apply(void 0,[t].concat(r,[e]))}},s=function(e){return o=e};return Wi({q1:function(){return{nextState:"q2",effect:a,stateUpdater:s}},q2:function(){return{nextState:"q1",effect:l(o)}}},"q1","takeEvery("+Bi(e)+", "+t.name+")")}function Hi(e,t){for(var n=arguments.length,r=new Array(n>2?n-2:0),i=2;i<n;i++)r[i-2]=arguments[i];var o,a,l={done:!1,value:$r(e)},s=function(e){return{done:!1,value:qr.apply(void 0,[t].concat(r,[e]))}},u=function(e){return{done:!1,value:Hr(e)}},c=function(e){return o=e},d=function(e){return a=e};return Wi({q1:function(){return{nextState:"q2",effect:l,stateUpdater:d}},q2:function(){return o?{nextState:"q3",effect:u(o)}:{nextState:"q1",effect:s(a),stateUpdater:c}},q3:function(){return{nextState:"q1",effect:s(a),stateUpdater:c}}},"q1","takeLatest("+Bi(e)+", "+t.name+")")}function Qi(e,t){for(var n=arguments.length,r=new Array(n>2?n-2:0),i=2;i<n;i++)r[i-2]=arguments[i];return qr.apply(void 0,[qi,e,t].concat(r))}function Ki(e,t){for(var n=arguments.length,r=new Array(n>2?n-2:0),i=2;i<n;i++)r[i-2]=arguments[i];return qr.apply(void 0,[Hi,e,t].concat(r))}function*Gi({payload:e}){const t=yield Kr("manager"),n=e;try{yield Wr(t,t.setUsername,[n]),yield Vr({type:"MANAGER_UPDATED"})}catch(e){yield Vr({type:"MANAGER_ERROR",payload:e})}}function*Yi({payload:e}){const t=yield Kr("manager"),n=e,r=t.username;try{yield Wr(t.signaler,t.signaler.text,[n,r]),yield Vr({type:"MANAGER_UPDATED"})}catch(e){yield Vr({type:"MANAGER_ERROR",payload:e})}}function*Xi({payload:e}){const t=yield Kr("manager"),n=e;try{n?yield Wr(t,t.setTrack,["audio",n]):yield Wr(t,t.stopTrack,["audio"]),yield Vr({type:"MANAGER_UPDATED"})}catch(e){yield Vr({type:"MANAGER_ERROR",payload:e})}}function*Ji({payload:e}){const t=yield Kr("manager"),n=e;try{n?yield Wr(t,t.setTrack,["video",n]):yield Wr(t,t.stopTrack,["video"]),yield Vr({type:"MANAGER_UPDATED"})}catch(e){yield Vr({type:"MANAGER_ERROR",payload:e})}}function*Zi({payload:e}){const t=e;try{const e=yield Qr((e=>e.feeds.find((e=>"local"===e.id))));if(e.videoStream){const n=e.videoStream.getVideoTracks()[0],r={height:{ideal:t},width:{ideal:4*t/3}};yield Wr(n,n.applyConstraints,[r])}yield Vr({type:"RESOLUTION_UPDATED"})}catch(e){console.error(e),yield Vr({type:"ERROR",payload:e})}}function*eo({payload:e}){const t=yield Kr("manager"),n=e;try{const e=t.mediaPeers.get(n);yield Wr(e,e.disableRemoteVideo,[]),yield Vr({type:"PEER_UPDATED"})}catch(e){yield Vr({type:"PEER_ERROR",payload:e})}}function*to({payload:e}){const t=yield Kr("manager"),n=e;try{const e=t.mediaPeers.get(n);yield Wr(e,e.enableRemoteVideo,[]),yield Vr({type:"PEER_UPDATED"})}catch(e){yield Vr({type:"PEER_ERROR",payload:e})}}function*no(){const e=yield Kr("manager"),t=(yield Qr((e=>e.iceServers))).filter((e=>e.enabled)).map((e=>({urls:e.urls,username:e.username,credential:e.credential})));try{yield Wr(e,e.setIceServers,[t]),yield Vr({type:"MANAGER_UPDATED"})}catch(e){console.log(e),yield Vr({type:"MANAGER_ERROR",payload:e})}}window.addEventListener("unhandledrejection",(e=>{console.log("An unhandled error occurred"),console.log(e.promise),console.log(e.reason)})),zi.run((function*(){yield Ki(vt.type,Gi),yield Qi(St.type,Yi),yield Ki(At.type,Xi),yield Ki(Ft.type,Ji),yield Ki(hn.type,Zi),yield Ki(zt.type,eo),yield Ki(Ut.type,to),yield Qi(Ht.type,no),yield Qi(Qt.type,no),yield Qi(Kt.type,no)})),r.render((0,e.jsx)(t.StrictMode,{children:(0,e.jsx)((function(e){var n=e.store,r=e.context,o=e.children,a=(0,t.useMemo)((function(){var e=new s(n);return e.onStateChange=e.notifyNestedSubs,{store:n,subscription:e}}),[n]),l=(0,t.useMemo)((function(){return n.getState()}),[n]);(0,t.useEffect)((function(){var e=a.subscription;return e.trySubscribe(),l!==n.getState()&&e.notifyNestedSubs(),function(){e.tryUnsubscribe(),e.onStateChange=null}}),[a,l]);var u=r||i;return t.createElement(u.Provider,{value:a},o)}),Object.assign({store:Ui},{children:(0,e.jsx)(Kn,{manager:Fi},void 0)}),void 0)},void 0),document.getElementById("react-root"))})()})();
\ No newline at end of file
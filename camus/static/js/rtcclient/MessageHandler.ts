@@ -16,6 +16,7 @@ export default class MessageHandler {
             ping: this.ping,
             pong: this.pong,
             text: this.text,
+            history: this.history,
             'get-room-info': this.getRoomInfo,
             'room-info': this.roomInfo,
             'get-ice-servers': this.getIceServers,
@@ -36,9 +37,8 @@ export default class MessageHandler {
     async handleMessage(message: Message): Promise<void> {
         const handler = this.handlers[message.type];
         if (handler) {
-            handler.call(this, message);
+            await handler.call(this, message);
         }
-        await this.handlers[message.type].call(this, message);
 
         this.messageListeners.forEach(([messageParams, listener]) => {
             if (this.match(message, messageParams)) {
@@ -68,6 +68,21 @@ export default class MessageHandler {
         this.manager.textMessages.push(message.data);
     }
 
+    async history(message: Message): Promise<void> {
+        console.log('<< Received history: ', message);
+
+        // Only the server sends history, and its items are trusted as such
+        if (
+            message.sender !== 'ground control' ||
+            !Array.isArray(message.data)
+        ) {
+            return;
+        }
+        for (const item of message.data) {
+            await this.handleMessage(item);
+        }
+    }
+
     async getRoomInfo(message: Message): Promise<void> {
         console.log('<< Received get-room-info: ', message);
     }
@@ -0,0 +1,257 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy import bindparam, func
+from sqlalchemy.orm import selectinload, sessionmaker
+
+from camus.cache import Cache
+from camus.metrics import metrics, timed
+from camus.models import Client, Room
+
+
+class GuestLimitReached(Exception):
+    """Raised when adding a client to a room which is full."""
+
+
+class Store:
+    """Asynchronous access to the rooms and clients in the database.
+
+    Queries are run in a dedicated pool of threads, each with its own
+    session, so that database round trips do not block the event loop. Each
+    call runs in a separate transaction, which is committed when the call
+    returns. Returned objects are detached from the session; any
+    relationships that are needed must be loaded by the query.
+
+    Rooms looked up by slug and clients looked up by UUID can be served from
+    a short-lived cache, which is invalidated as this process changes them.
+    """
+
+    def __init__(self):
+        self._executor = None
+        self._session_factory = None
+        self.rooms = Cache()
+        self.clients = Cache()
+
+    def init_app(self, app):
+        from camus import db
+
+        engine = db.get_engine(app)
+        threads = app.config['DATABASE_THREADS']
+        if threads is None:
+            # SQLite connections should not be used concurrently
+            threads = 1 if engine.dialect.name == 'sqlite' else 4
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+        self._executor = ThreadPoolExecutor(
+            max_workers=threads, thread_name_prefix='camus-db')
+        self._session_factory = sessionmaker(bind=engine,
+                                             expire_on_commit=False)
+        for cache in (self.rooms, self.clients):
+            cache.ttl = app.config['CACHE_TTL']
+            cache.clear()
+
+    async def run(self, func, *args):
+        """Run `func(session, *args)` in a database thread and commit."""
+        loop = asyncio.get_event_loop()
+        with timed(metrics.store_latency):
+            return await loop.run_in_executor(
+                self._executor, self._run_in_session, func, args)
+
+    def _run_in_session(self, func, args):
+        session = self._session_factory()
+        try:
+            result = func(session, *args)
+            session.commit()
+            return result
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    async def create_room(self, room):
+        """Add a new room.
+
+        Raises sqlalchemy.exc.IntegrityError if the name is not available.
+        """
+        def query(session):
+            session.add(room)
+            return room
+
+        room = await self.run(query)
+        self.rooms.invalidate(room.slug)
+        return room
+
+    async def get_room(self, slug=None, room_id=None, with_clients=False,
+                       cached=False):
+        """Get a room by its slug or ID, or None if it does not exist.
+
+        If `cached` is set, a room looked up by its slug may come from the
+        cache, and must not be changed.
+        """
+        if cached and slug is not None and not with_clients:
+            return await self.rooms.get(slug, lambda: self.get_room(slug))
+
+        def query(session):
+            q = session.query(Room)
+            if with_clients:
+                q = q.options(selectinload(Room.clients))
+            if room_id is not None:
+                return q.filter_by(id=room_id).first()
+            return q.filter_by(slug=slug).first()
+
+        return await self.run(query)
+
+    async def public_rooms(self, limit=None):
+        """Get the public rooms, most recently active first.
+
+        Only the columns needed to list the rooms are loaded: the name,
+        slug, client count, guest limit and active time.
+        """
+        def query(session):
+            return (session.query(Room.name, Room.slug, Room.client_count,
+                                  Room.guest_limit, Room.active)
+                    .filter_by(is_public=True)
+                    .order_by(Room.active.desc())
+                    .limit(limit)
+                    .all())
+
+        return await self.run(query)
+
+    async def rooms_active_before(self, cutoff):
+        """Get all rooms which have not been active since the cutoff time."""
+        def query(session):
+            return session.query(Room).filter(Room.active < cutoff).all()
+
+        return await self.run(query)
+
+    async def delete_rooms(self, room_ids):
+        """Delete a set of rooms, along with any clients in them.
+
+        The clients are deleted by the database's ON DELETE CASCADE.
+        """
+        def query(session):
+            session.query(Room).filter(Room.id.in_(room_ids)) \
+                .delete(synchronize_session=False)
+
+        if room_ids:
+            await self.run(query)
+            room_ids = set(room_ids)
+            self.rooms.invalidate_where(lambda room: room.id in room_ids)
+            self.clients.invalidate_where(
+                lambda client: client.room_id in room_ids)
+
+    async def add_client(self, client):
+        """Add a new client.
+
+        Inserting the client increments its room's client count, which locks
+        the room's row until the transaction ends. The count is then checked
+        against the guest limit, so concurrent joins cannot overshoot it.
+
+        Raises GuestLimitReached if the room is full.
+        """
+        def query(session):
+            session.add(client)
+            session.flush()
+            if client.room_id is not None:
+                count, limit = (session.query(Room.client_count,
+                                              Room.guest_limit)
+                                .filter_by(id=client.room_id).one())
+                if limit and count > limit:
+                    raise GuestLimitReached()
+            return client
+
+        client = await self.run(query)
+        # The client usually opens a websocket next
+        self.clients.set(client.uuid, client)
+        return client
+
+    async def get_client(self, uuid, cached=False):
+        """Get a client by its UUID, or None if it does not exist.
+
+        If `cached` is set, the client may come from the cache, and must not
+        be changed.
+        """
+        if cached:
+            return await self.clients.get(uuid, lambda: self.get_client(uuid))
+
+        def query(session):
+            return session.query(Client).filter_by(uuid=uuid).first()
+
+        return await self.run(query)
+
+    async def rename_client(self, uuid, name):
+        """Change the name of a client."""
+        def query(session):
+            session.query(Client).filter_by(uuid=uuid).update({'name': name})
+
+        await self.run(query)
+        self.clients.invalidate(uuid)
+
+    async def delete_client(self, uuid):
+        """Delete a client.
+
+        Returns the ID of the client's room, or None if the client did not
+        exist.
+        """
+        def query(session):
+            client = session.query(Client).filter_by(uuid=uuid).first()
+            if client is None:
+                return None
+            session.delete(client)
+            return client.room_id
+
+        self.clients.invalidate(uuid)
+        return await self.run(query)
+
+    async def delete_clients(self, uuids):
+        """Delete a set of clients using a single statement."""
+        def query(session):
+            counts = (session.query(Client.room_id, func.count())
+                      .filter(Client.uuid.in_(uuids))
+                      .group_by(Client.room_id).all())
+            session.query(Client).filter(Client.uuid.in_(uuids)) \
+                .delete(synchronize_session=False)
+            rooms = Room.__table__
+            for room_id, count in counts:
+                if room_id is not None:
+                    session.execute(
+                        rooms.update().where(rooms.c.id == room_id)
+                        .values(client_count=rooms.c.client_count - count))
+
+        if uuids:
+            await self.run(query)
+            for uuid in uuids:
+                self.clients.invalidate(uuid)
+
+    async def clients_seen_before(self, cutoff):
+        """Get all clients which have not been seen since the cutoff time."""
+        def query(session):
+            return session.query(Client).filter(Client.seen < cutoff).all()
+
+        return await self.run(query)
+
+    async def update_activity(self, clients, rooms):
+        """Set the seen time of clients and the active time of rooms.
+
+        `clients` maps client UUIDs to seen times and `rooms` maps room IDs to
+        active times.
+        """
+        def query(session):
+            if clients:
+                session.execute(
+                    Client.__table__.update()
+                    .where(Client.uuid == bindparam('_uuid'))
+                    .values(seen=bindparam('_seen')),
+                    [{'_uuid': uuid, '_seen': seen}
+                     for uuid, seen in clients.items()])
+            if rooms:
+                session.execute(
+                    Room.__table__.update()
+                    .where(Room.id == bindparam('_id'))
+                    .values(active=bindparam('_active')),
+                    [{'_id': room_id, '_active': active}
+                     for room_id, active in rooms.items()])
+
+        await self.run(query)
@@ -0,0 +1,260 @@
+import asyncio
+import logging
+import re
+import uuid
+from collections import deque
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+# The form of client IDs, which are the only receivers outside this process
+CLIENT_ID = re.compile(r'[0-9a-f]{32}')
+
+
+def create_transport(url=None):
+    """Create a transport for the given signaling URL.
+
+    With no URL, messages are only delivered within this process. A
+    ``redis://`` or ``unix://`` URL shares messages between processes using
+    Redis pub/sub.
+    """
+    if not url:
+        return LocalTransport()
+
+    scheme = urlparse(url).scheme
+    if scheme in ('redis', 'unix'):
+        return RedisTransport(url)
+
+    raise ValueError('Unsupported signaling URL: {}'.format(url))
+
+
+class LocalTransport:
+    """Deliver messages to clients connected to this process."""
+
+    def start(self, deliver, is_local):
+        self._deliver = deliver
+
+    def stop(self):
+        pass
+
+    def send(self, receiver, data, kind=None):
+        self._deliver(receiver, data, kind)
+
+
+class RedisTransport:
+    """Deliver messages between server processes using Redis pub/sub.
+
+    Messages for clients connected to this process are delivered directly.
+    Other messages are published on a channel shared by all processes, and
+    each process delivers the messages addressed to its own clients. This
+    allows clients in the same room to be served by different workers.
+    """
+
+    def __init__(self, url, channel='camus', max_pending=10000):
+        self._url = urlparse(url)
+        self._channel = channel
+        self._origin = uuid.uuid4().hex.encode()
+        self._pending = deque(maxlen=max_pending)
+        self._ready = None
+        self._tasks = []
+        self.subscribed = None
+
+    def start(self, deliver, is_local):
+        self._deliver = deliver
+        self._is_local = is_local
+        self._ready = asyncio.Event()
+        self.subscribed = asyncio.Event()
+        self._tasks = [
+            asyncio.create_task(self._run_publisher()),
+            asyncio.create_task(self._run_subscriber()),
+        ]
+
+    def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        self._tasks = []
+
+    def send(self, receiver, data, kind=None):
+        """Deliver a message locally, or publish it for other processes.
+
+        Messages for receivers which are not client IDs are discarded.
+        Messages are queued until they can be written to Redis; when more
+        than `max_pending` are waiting, the oldest are discarded.
+        """
+        if self._is_local(receiver):
+            self._deliver(receiver, data, kind)
+            return
+
+        if not isinstance(receiver, str) or not CLIENT_ID.fullmatch(receiver):
+            logger.debug('Not publishing message for receiver %r', receiver)
+            return
+
+        payload = _encode_payload(self._origin, receiver.encode(),
+                                  (kind or '').encode(), data.encode())
+        self._pending.append(_encode_command('PUBLISH', self._channel,
+                                             payload))
+        self._ready.set()
+
+    def _receive(self, payload):
+        try:
+            origin, receiver, kind, data = _decode_payload(payload)
+            receiver = receiver.decode()
+            if origin == self._origin or not self._is_local(receiver):
+                return
+            data = data.decode()
+            kind = kind.decode() or None
+        except ValueError as e:
+            # Including UnicodeDecodeError
+            logger.warning('Invalid message from signaling server: %s', e)
+            return
+
+        self._deliver(receiver, data, kind)
+
+    async def _run_publisher(self):
+        while True:
+            try:
+                reader, writer = await self._connect()
+                tasks = [asyncio.ensure_future(self._write_pending(writer)),
+                         asyncio.ensure_future(_discard_replies(reader))]
+                try:
+                    done, _ = await asyncio.wait(
+                        tasks, return_when=asyncio.FIRST_EXCEPTION)
+                finally:
+                    for task in tasks:
+                        task.cancel()
+                    writer.close()
+                for task in done:
+                    task.result()
+            except (OSError, EOFError, RedisError):
+                logger.exception('Lost connection to signaling server')
+
+            await asyncio.sleep(1)
+
+    async def _write_pending(self, writer):
+        """Write queued commands, waiting for each write to be flushed."""
+        while True:
+            while not self._pending:
+                self._ready.clear()
+                await self._ready.wait()
+
+            commands = b''.join(self._pending)
+            self._pending.clear()
+            writer.write(commands)
+            await writer.drain()
+
+    async def _run_subscriber(self):
+        while True:
+            writer = None
+            try:
+                reader, writer = await self._connect()
+                writer.write(_encode_command('SUBSCRIBE', self._channel))
+
+                while True:
+                    reply = await _read_reply(reader)
+                    if not isinstance(reply, list) or len(reply) != 3:
+                        continue
+                    if reply[0] == b'subscribe':
+                        self.subscribed.set()
+                    elif reply[0] == b'message':
+                        try:
+                            self._receive(reply[2])
+                        except Exception:
+                            logger.exception('Error delivering message from '
+                                             'signaling server')
+            except (OSError, EOFError, RedisError):
+                logger.exception('Lost subscription to signaling server')
+            finally:
+                self.subscribed.clear()
+                if writer is not None:
+                    writer.close()
+
+            await asyncio.sleep(1)
+
+    async def _connect(self):
+        if self._url.scheme == 'unix':
+            reader, writer = await asyncio.open_unix_connection(self._url.path)
+        else:
+            reader, writer = await asyncio.open_connection(
+                self._url.hostname or 'localhost', self._url.port or 6379)
+
+        if self._url.password:
+            try:
+                writer.write(_encode_command('AUTH', self._url.password))
+                await _read_reply(reader)
+            except BaseException:
+                writer.close()
+                raise
+
+        return reader, writer
+
+
+class RedisError(Exception):
+    """An error reply from a Redis server."""
+
+
+def _encode_payload(*fields):
+    """Encode the fields of a published message, each prefixed with its
+    length, so that no field can be mistaken for another.
+    """
+    return b''.join(b'%d:%s' % (len(field), field) for field in fields)
+
+
+def _decode_payload(payload, count=4):
+    """Decode the fields of a published message."""
+    fields = []
+    pos = 0
+    for _ in range(count):
+        colon = payload.find(b':', pos)
+        if colon < 0 or not payload[pos:colon].isdigit():
+            raise ValueError('Expected a field length')
+        end = colon + 1 + int(payload[pos:colon])
+        if end > len(payload):
+            raise ValueError('Truncated field')
+        fields.append(payload[colon + 1:end])
+        pos = end
+
+    if pos != len(payload):
+        raise ValueError('Extra data after fields')
+    return fields
+
+
+def _encode_command(*args):
+    """Encode a command using the Redis serialization protocol (RESP)."""
+    parts = [b'*%d\r\n' % len(args)]
+    for arg in args:
+        if isinstance(arg, str):
+            arg = arg.encode()
+        parts.append(b'$%d\r\n%s\r\n' % (len(arg), arg))
+
+    return b''.join(parts)
+
+
+async def _discard_replies(reader):
+    """Read and discard replies until the connection is lost."""
+    while True:
+        await _read_reply(reader)
+
+
+async def _read_reply(reader):
+    """Read a single RESP reply from a stream."""
+    line = await reader.readuntil(b'\r\n')
+    prefix, value = line[:1], line[1:-2]
+
+    if prefix == b'+':
+        return value
+    if prefix == b'-':
+        raise RedisError(value.decode())
+    if prefix == b':':
+        return int(value)
+    if prefix == b'$':
+        length = int(value)
+        if length < 0:
+            return None
+        return (await reader.readexactly(length + 2))[:-2]
+    if prefix == b'*':
+        length = int(value)
+        if length < 0:
+            return None
+        return [await _read_reply(reader) for _ in range(length)]
+
+    raise RedisError('Invalid reply: {!r}'.format(line))
@@ -4,16 +4,17 @@ import logging
 import hmac
 import traceback
 from base64 import b64encode
+from functools import lru_cache
 from time import time
 
 from twilio.rest import Client as TwilioClient
-from twilio.base.exceptions import TwilioException, TwilioRestException
 
 from quart import current_app
-from sqlalchemy.exc import SQLAlchemyError
 
-from camus import db
-from camus.models import Client, Room
+from camus import store
+from camus.metrics import metrics, timed
+
+logger = logging.getLogger(__name__)
 
 
 class LoopTimer:
@@ -33,9 +34,10 @@ class LoopTimer:
         while True:
             await asyncio.sleep(self._timeout)
             try:
-                await self._callback(**self._kwargs)
+                with timed(metrics.task_duration, self._callback.__name__):
+                    await self._callback(**self._kwargs)
             except Exception as e:
-                logging.exception(
+                logger.exception(
                     "Exception during excecution of LoopTimer callback function"
                 )
 
@@ -44,64 +46,120 @@ class LoopTimer:
         self._task.cancel()
 
 
-def commit_database(log_error=True, rollback=True, reraise=False):
-    try:
-        db.session.commit()
-        return True
-    except SQLAlchemyError:
-        if log_error:
-            logging.exception('Exception during database commit.')
+class Debouncer:
+    """Coalesce repeated calls for the same key.
+
+    `call(key)` schedules the coroutine function `callback(key)` to run once
+    there have been no further calls for the key for `window` seconds, but
+    no later than `max_delay` seconds after the first call. Calls made while
+    one is pending are merged into it, and are counted in `saved`. With a
+    window of 0, the callback is run immediately.
+    """
+
+    def __init__(self, callback, window=0, max_delay=0.5):
+        self._callback = callback
+        self.window = window
+        self.max_delay = max_delay
+        self.saved = 0
+        self._pending = {}
+
+    async def call(self, key):
+        """Request a call of the callback for the given key."""
+        if not self.window:
+            await self._run(key)
+            return
+
+        loop = asyncio.get_event_loop()
+        now = loop.time()
+        pending = self._pending.get(key)
+        if pending is None:
+            first = now
+        else:
+            self.saved += 1
+            first, handle = pending
+            handle.cancel()
+
+        due = min(now + self.window, first + self.max_delay)
+        self._pending[key] = (first, loop.call_at(due, self._fire, key))
+
+    def cancel(self):
+        """Discard all pending calls."""
+        for _, handle in self._pending.values():
+            handle.cancel()
+        self._pending = {}
 
-        if rollback:
-            db.session.rollback()
+    def _fire(self, key):
+        del self._pending[key]
+        asyncio.create_task(self._run(key))
 
-        if reraise:
-            raise
+    async def _run(self, key):
+        try:
+            await self._callback(key)
+        except Exception:
+            logger.exception('Exception in debounced callback')
 
-        return False
 
+async def reap_clients(message_handler):
+    """Remove all clients which have not been seen recently enough.
 
-async def ping_clients(message_handler):
-    """Send a ping message to all clients which have not been seen recently
-    enough.
+    Clients connected to this process are normally removed as soon as they
+    time out by the message handler's liveness monitor. This catches any
+    others, such as clients which never opened a websocket.
     """
 
-    now = datetime.datetime.utcnow()
-    clients = Client.query.filter(Client.seen < now - datetime.timedelta(seconds=30)).all()
-    logging.info('Ping clients: {}'.format(clients))
+    timeout = datetime.timedelta(seconds=current_app.config['CLIENT_TIMEOUT'])
+    clients = await message_handler.presence.stale_clients(
+        datetime.datetime.utcnow() - timeout)
+    logger.info('Reaping %d stale clients', len(clients))
+    logger.debug('Reaping clients: %s', clients)
 
-    for client in clients:
-        message_handler.send_ping(client.uuid)
+    await remove_clients(message_handler,
+                         [(client.uuid, client.room_id) for client in clients])
 
 
-async def reap_clients(message_handler):
-    """Remove all clients which have not been seen recently enough."""
+async def remove_clients(message_handler, clients):
+    """Remove clients, given as (uuid, room ID) pairs.
 
-    now = datetime.datetime.utcnow()
-    clients = Client.query.filter(Client.seen < now - datetime.timedelta(seconds=90)).all()
-    logging.info('Reap clients: {}'.format(clients))
+    Each client is sent a bye, after which its queue is closed, the clients
+    are deleted with a single statement, and the remaining clients in each
+    affected room are sent a single update.
+    """
+
+    rooms = {}
+    for client_uuid, room_id in clients:
+        message_handler.send_bye(client_uuid)
+        message_handler.outbox.pop(client_uuid, discard=False)
+        message_handler.forget_client(client_uuid)
+        rooms.setdefault(room_id, []).append(client_uuid)
 
-    for client in clients:
-        room = client.room
-        message_handler.send_bye(client.uuid)
-        db.session.delete(client)
-        commit_database()
-        message_handler.broadcast_room_info(room)
+    await store.delete_clients([client_uuid for client_uuid, _ in clients])
 
+    rooms.pop(None, None)
+    for room_id, client_uuids in rooms.items():
+        await message_handler.remove_members(room_id, client_uuids)
 
-async def reap_rooms():
+
+async def reap_rooms(message_handler):
     """Remove all rooms that have been inactive for long enough."""
 
     now = datetime.datetime.utcnow()
-    rooms = Room.query.filter(Room.active < now - datetime.timedelta(seconds=300)).all()
-    logging.info('Reap rooms: {}'.format(rooms))
+    rooms = await message_handler.presence.stale_rooms(now - datetime.timedelta(seconds=300))
+    logger.info('Reaping %d inactive rooms', len(rooms))
+    logger.debug('Reaping rooms: %s', rooms)
+
+    room_ids = [room.id for room in rooms]
+    message_handler.presence.forget_rooms(room_ids)
+    message_handler.rosters.forget(room_ids)
+    message_handler.history.forget(room_ids)
+    await store.delete_rooms(room_ids)
 
-    for room in rooms:
-        db.session.delete(room)
-        commit_database()
 
+async def flush_presence(message_handler):
+    """Write recent client and room activity to the database."""
+    await message_handler.presence.flush()
 
-def get_ice_servers(username):
+
+async def get_ice_servers(username):
     """Get a list of configured ICE servers."""
 
     stun_host = current_app.config['STUN_HOST']
@@ -122,30 +180,98 @@ def get_ice_servers(username):
             'credential': password
         })
 
-    servers += get_twilio_ice_servers()
+    servers += await twilio_ice_servers.get(current_app.config)
 
     return servers
 
 
-def get_twilio_ice_servers():
-    """Fetch a list of ICE servers provided by Twilio."""
+class TwilioIceServers:
+    """A cache of the ICE servers provided by Twilio.
+
+    A single Twilio token is shared by all clients. The token is refreshed in
+    the background once most of its lifetime has passed, and requests to
+    Twilio are made in a worker thread so that they do not block the event
+    loop.
+    """
+
+    def __init__(self, retry_interval=30):
+        self._servers = []
+        self._expires = 0
+        self._refresh_at = 0
+        self._retry_interval = retry_interval
+        self._task = None
 
-    account_sid = current_app.config['TWILIO_ACCOUNT_SID']
-    auth_token = current_app.config['TWILIO_AUTH_TOKEN']
-    key_sid = current_app.config['TWILIO_KEY_SID']
+    async def get(self, config):
+        """Get the cached ICE servers, fetching them if necessary."""
 
-    try:
-        twilio = TwilioClient(key_sid, auth_token, account_sid)
-        token = twilio.tokens.create()
-        return token.ice_servers
-    except (TwilioException, TwilioRestException):
-        return []
+        if not (config['TWILIO_ACCOUNT_SID'] and config['TWILIO_AUTH_TOKEN']):
+            return []
+
+        now = time()
+        if now >= self._refresh_at:
+            task = self._refresh(config)
+
+            # Only wait for the refresh if the cached servers have expired
+            if now >= self._expires:
+                await asyncio.shield(task)
+
+        return self._servers if time() < self._expires else []
+
+    def _refresh(self, config):
+        """Start fetching new ICE servers, unless already in progress."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._fetch(
+                config['TWILIO_ACCOUNT_SID'], config['TWILIO_AUTH_TOKEN'],
+                config['TWILIO_KEY_SID'], config['TWILIO_TIMEOUT']))
+        return self._task
+
+    async def _fetch(self, account_sid, auth_token, key_sid, timeout):
+        loop = asyncio.get_event_loop()
+        start = time()
+
+        try:
+            with timed(metrics.ice_fetch_latency):
+                servers, ttl = await asyncio.wait_for(
+                    loop.run_in_executor(None, fetch_twilio_ice_servers,
+                                         account_sid, auth_token, key_sid),
+                    timeout)
+        except Exception:
+            logger.exception('Failed to fetch ICE servers from Twilio')
+            self._refresh_at = time() + self._retry_interval
+            return
+
+        self._servers = servers
+        self._expires = start + ttl
+        self._refresh_at = start + ttl * 3 / 4
+
+
+twilio_ice_servers = TwilioIceServers()
+
+
+def fetch_twilio_ice_servers(account_sid, auth_token, key_sid=None):
+    """Fetch a list of ICE servers provided by Twilio.
+
+    Returns the list of servers and the number of seconds they are valid for.
+    """
+
+    twilio = TwilioClient(key_sid, auth_token, account_sid)
+    token = twilio.tokens.create()
+    return token.ice_servers, int(token.ttl)
 
 
 def generate_turn_creds(key, username):
-    """Generate TURN server credentials for a client."""
+    """Generate TURN server credentials for a client.
+
+    Credentials expire after 6-7 hours. The expiration time is rounded up to
+    the hour so that credentials can be reused for repeated requests.
+    """
+
+    expiration = (int(time()) // 3600 + 7) * 3600
+    return _turn_creds(key, username, expiration)
+
 
-    expiration = int(time()) + 6 * 60 * 60  # creds expire after 6 hrs
+@lru_cache(maxsize=4096)
+def _turn_creds(key, username, expiration):
     username = '{}:{}'.format(expiration, username)
     token = hmac.new(key.encode(), msg=username.encode(), digestmod='SHA1')
     password = b64encode(token.digest()).decode()
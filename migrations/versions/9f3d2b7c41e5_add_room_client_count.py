@@ -0,0 +1,28 @@
+"""add room client count
+
+Revision ID: 9f3d2b7c41e5
+Revises: 6c1cae7198ab
+Create Date: 2026-10-18 09:12:44.318204+00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9f3d2b7c41e5'
+down_revision = '6c1cae7198ab'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('rooms', sa.Column('client_count', sa.Integer(),
+                                     server_default='0', nullable=False))
+    op.execute('UPDATE rooms SET client_count = '
+               '(SELECT count(*) FROM clients WHERE clients.room_id = rooms.id)')
+
+
+def downgrade():
+    with op.batch_alter_table('rooms') as batch_op:
+        batch_op.drop_column('client_count')
@@ -0,0 +1,105 @@
+"""cascade client deletes and add indexes
+
+Revision ID: c27e8d5a90b4
+Revises: 9f3d2b7c41e5
+Create Date: 2026-10-18 11:40:02.518733+00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c27e8d5a90b4'
+down_revision = '9f3d2b7c41e5'
+branch_labels = None
+depends_on = None
+
+# The foreign key was created without a name; this gives it one on SQLite,
+# where the tables are copied to alter them
+NAMING_CONVENTION = {
+    'fk': 'fk_%(table_name)s_%(column_0_name)s_%(referred_table_name)s',
+}
+
+
+def _old_foreign_key():
+    if op.get_bind().dialect.name == 'sqlite':
+        return 'fk_clients_room_id_rooms'
+    return 'clients_room_id_fkey'
+
+
+def _set_foreign_keys(enabled):
+    # Copying the rooms table on SQLite must not cascade to the clients
+    if op.get_bind().dialect.name == 'sqlite':
+        op.execute('PRAGMA foreign_keys={}'.format('ON' if enabled else 'OFF'))
+
+
+def upgrade():
+    _set_foreign_keys(False)
+
+    # Remove rows which violate the new constraints
+    op.execute('DELETE FROM rooms WHERE name IS NULL OR slug IS NULL')
+    op.execute('DELETE FROM clients WHERE uuid IS NULL OR (room_id IS NOT NULL '
+               'AND room_id NOT IN (SELECT id FROM rooms))')
+    op.execute("UPDATE rooms SET is_public = false WHERE is_public IS NULL")
+    op.execute('UPDATE rooms SET active = CURRENT_TIMESTAMP WHERE active IS NULL')
+    op.execute("UPDATE clients SET name = 'Major Tom' WHERE name IS NULL")
+    op.execute('UPDATE clients SET seen = CURRENT_TIMESTAMP WHERE seen IS NULL')
+
+    with op.batch_alter_table('rooms') as batch_op:
+        batch_op.alter_column('name', existing_type=sa.String(length=64),
+                              nullable=False)
+        batch_op.alter_column('slug', existing_type=sa.String(length=64),
+                              nullable=False)
+        batch_op.alter_column('is_public', existing_type=sa.Boolean(),
+                              nullable=False, server_default=sa.false())
+        batch_op.alter_column('active', existing_type=sa.DateTime(),
+                              nullable=False)
+        batch_op.create_index('ix_rooms_is_public_active',
+                              ['is_public', 'active'], unique=False)
+
+    with op.batch_alter_table('clients',
+                              naming_convention=NAMING_CONVENTION) as batch_op:
+        batch_op.drop_constraint(_old_foreign_key(), type_='foreignkey')
+        batch_op.create_foreign_key('fk_clients_room_id_rooms', 'rooms',
+                                    ['room_id'], ['id'], ondelete='CASCADE')
+        batch_op.alter_column('name', existing_type=sa.String(length=64),
+                              nullable=False)
+        batch_op.alter_column('uuid', existing_type=sa.String(length=32),
+                              nullable=False)
+        batch_op.alter_column('seen', existing_type=sa.DateTime(),
+                              nullable=False)
+        batch_op.create_index('ix_clients_room_id_seen', ['room_id', 'seen'],
+                              unique=False)
+
+    _set_foreign_keys(True)
+
+
+def downgrade():
+    _set_foreign_keys(False)
+
+    with op.batch_alter_table('clients') as batch_op:
+        batch_op.drop_index('ix_clients_room_id_seen')
+        batch_op.alter_column('seen', existing_type=sa.DateTime(),
+                              nullable=True)
+        batch_op.alter_column('uuid', existing_type=sa.String(length=32),
+                              nullable=True)
+        batch_op.alter_column('name', existing_type=sa.String(length=64),
+                              nullable=True)
+        batch_op.drop_constraint('fk_clients_room_id_rooms',
+                                 type_='foreignkey')
+        batch_op.create_foreign_key(_old_foreign_key(), 'rooms', ['room_id'],
+                                    ['id'])
+
+    with op.batch_alter_table('rooms') as batch_op:
+        batch_op.drop_index('ix_rooms_is_public_active')
+        batch_op.alter_column('active', existing_type=sa.DateTime(),
+                              nullable=True)
+        batch_op.alter_column('is_public', existing_type=sa.Boolean(),
+                              nullable=True, server_default=None)
+        batch_op.alter_column('slug', existing_type=sa.String(length=64),
+                              nullable=True)
+        batch_op.alter_column('name', existing_type=sa.String(length=64),
+                              nullable=True)
+
+    _set_foreign_keys(True)
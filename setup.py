@@ -29,7 +29,12 @@ setup(
         'SQLAlchemy==1.3.23',
         'twilio==6.45.4',
         'werkzeug==1.0.1',
+        'wsproto==1.0.0',
     ],
+    extras_require={
+        'compact': ['msgpack'],
+        'fast-json': ['orjson'],
+    },
     classifiers=[
         'License :: OSI Approved :: GNU Affero General Public License v3 or later (AGPLv3+)',
         'Environment :: Web Environment',
@@ -39,5 +44,5 @@ setup(
         'Topic :: Multimedia :: Video',
     ],
     python_requires='>=3.7',
-    scripts=['bin/camus'],
+    scripts=['bin/camus', 'bin/camus-bench'],
 )
@@ -0,0 +1,41 @@
+import asyncio
+import socket
+
+import pytest
+from hypercorn.asyncio import serve
+from hypercorn.config import Config as HypercornConfig
+
+from camus.bench import Bench, percentile
+
+
+def test_percentile():
+    samples = list(range(1, 101))
+    assert percentile(samples, 50) == 51
+    assert percentile(samples, 99) == 99
+    assert percentile([], 50) is None
+
+
+@pytest.mark.asyncio
+async def test_bench(app):
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        port = sock.getsockname()[1]
+
+    config = HypercornConfig()
+    config.bind = ['127.0.0.1:{}'.format(port)]
+    shutdown = asyncio.Event()
+    server = asyncio.ensure_future(
+        serve(app, config, shutdown_trigger=shutdown.wait))
+    await asyncio.sleep(0.5)
+
+    try:
+        bench = Bench('http://127.0.0.1:{}'.format(port), rooms=2, clients=3,
+                      duration=1, rate=10, concurrency=10)
+        stats = await bench.run()
+    finally:
+        shutdown.set()
+        await server
+
+    assert not stats.errors
+    assert stats.received['pong'] > 0
+    assert stats.relay_latency
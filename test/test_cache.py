@@ -0,0 +1,78 @@
+import asyncio
+
+import pytest
+
+from camus.cache import Cache
+
+
+@pytest.mark.asyncio
+async def test_cache_single_flight():
+    cache = Cache(ttl=10)
+    loads = []
+
+    async def load():
+        loads.append(1)
+        await asyncio.sleep(0.01)
+        return 'room'
+
+    results = await asyncio.gather(*[cache.get('slug', load)
+                                     for _ in range(5)])
+    assert results == ['room'] * 5
+    assert len(loads) == 1
+    assert (cache.misses, cache.coalesced) == (1, 4)
+
+    assert await cache.get('slug', load) == 'room'
+    assert cache.hits == 1
+    assert len(loads) == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_expiry_and_invalidation(monkeypatch):
+    cache = Cache(ttl=10)
+    values = iter(['a', 'b', 'c'])
+
+    async def load():
+        return next(values)
+
+    now = 100
+    monkeypatch.setattr('camus.cache.time.monotonic', lambda: now)
+    assert await cache.get('key', load) == 'a'
+    assert await cache.get('key', load) == 'a'
+
+    now = 111
+    assert await cache.get('key', load) == 'b'
+
+    cache.invalidate('key')
+    assert await cache.get('key', load) == 'c'
+
+
+@pytest.mark.asyncio
+async def test_cache_none_not_cached():
+    cache = Cache(ttl=10)
+    loads = []
+
+    async def load():
+        loads.append(1)
+
+    assert await cache.get('missing', load) is None
+    assert await cache.get('missing', load) is None
+    assert len(loads) == 2
+
+
+@pytest.mark.asyncio
+async def test_cache_invalidated_while_loading():
+    cache = Cache(ttl=10)
+
+    async def load():
+        cache.invalidate('key')
+        return 'stale'
+
+    assert await cache.get('key', load) == 'stale'
+    assert len(cache) == 0
+
+
+def test_cache_maxsize():
+    cache = Cache(ttl=10, maxsize=2)
+    for key in 'abc':
+        cache.set(key, key)
+    assert len(cache) == 2
@@ -1,3 +1,4 @@
+import datetime
 import json
 
 import pytest
@@ -5,8 +6,12 @@ import pytest
 from quart import session
 from quart.testing.connections import WebsocketResponse
 
-from camus import db, message_handler
+from camus import (db, directory, message_handler, passwords, rate_limits,
+                   store)
+from camus.metrics import metrics
 from camus.models import Client, Room
+from camus.protocol import SERVER_ID, TYPE_CODES
+from camus.util import remove_clients
 
 
 @pytest.mark.asyncio
@@ -27,6 +32,39 @@ async def test_public(client):
     assert b'Public rooms' in data
 
 
+@pytest.mark.asyncio
+async def test_public_pages(app):
+    app.config['PUBLIC_ROOMS_PAGE_SIZE'] = 2
+    directory.init_app(app)
+    client = app.test_client()
+
+    async with app.app_context():
+        for i in range(3):
+            room = Room(is_public=True,
+                        active=datetime.datetime(2021, 1, 1, i))
+            room.set_name('Public room {}'.format(i))
+            db.session.add(room)
+        room = Room(is_public=False)
+        room.set_name('Private room')
+        db.session.add(room)
+        db.session.commit()
+        await store.add_client(Client(uuid='1234', room_id=room.id - 1))
+
+    response = await client.get('/public.json')
+    data = await response.get_json()
+    assert data['total'] == 3
+    assert data['pages'] == 2
+    assert [r['name'] for r in data['rooms']] == ['Public room 2',
+                                                  'Public room 1']
+    assert data['rooms'][0]['clients'] == 1
+
+    response = await client.get('/public?page=2')
+    data = await response.get_data()
+    assert b'Public room 0' in data
+    assert b'Public room 1' not in data
+    assert b'Page 2 of 2' in data
+
+
 @pytest.mark.asyncio
 async def test_enter_room(client):
     async with client.app.app_context():
@@ -68,6 +106,31 @@ async def test_enter_room_with_password(client):
     assert b'react-root' in data
 
 
+@pytest.mark.asyncio
+async def test_reenter_room_with_password(client):
+    async with client.app.app_context():
+        room = Room()
+        room.set_name('My password-protected room')
+        room.set_password('cat')
+        db.session.add(room)
+        db.session.commit()
+
+        # The password is only needed the first time
+        response = await client.get(f'/room/{room.slug}')
+        assert b'react-root' not in await response.get_data()
+
+        await client.post(f'/room/{room.slug}', json={'password': 'cat'})
+        response = await client.get(f'/room/{room.slug}')
+        assert b'react-root' in await response.get_data()
+
+        # Until the password is changed
+        room.set_password('dog')
+        db.session.commit()
+        store.rooms.invalidate(room.slug)
+        response = await client.get(f'/room/{room.slug}')
+        assert b'react-root' not in await response.get_data()
+
+
 @pytest.mark.asyncio
 async def test_enter_room_with_wrong_password(client):
     async with client.app.app_context():
@@ -89,6 +152,119 @@ async def test_enter_room_with_wrong_password(client):
     assert b'react-root' not in data
 
 
+@pytest.mark.asyncio
+async def test_metrics(app):
+    client = app.test_client()
+    response = await client.get('/metrics')
+    assert response.status_code == 404
+
+    app.config['METRICS_ENABLED'] = True
+    metrics.init_app(app)
+    try:
+        await client.get('/room/some-room')
+        response = await client.get('/metrics')
+    finally:
+        metrics.enabled = False
+
+    assert response.status_code == 200
+    data = (await response.get_data()).decode()
+    assert 'camus_store_latency_seconds_count ' in data
+    assert 'camus_websockets 0' in data
+    assert 'camus_rate_limit_allowed_total{limit="room_joins"} 1' in data
+
+
+@pytest.mark.asyncio
+async def test_metrics_websockets(app):
+    app.config['METRICS_ENABLED'] = True
+    metrics.init_app(app)
+    client = app.test_client()
+
+    async def websockets():
+        response = await client.get('/metrics')
+        data = (await response.get_data()).decode()
+        return int(data.split('\ncamus_websockets ')[1].split()[0])
+
+    async with app.app_context():
+        message_handler.start()
+        room = Room()
+        room.set_name('Metered room')
+        db.session.add(room)
+        db.session.commit()
+        room_id, slug = room.id, room.slug
+
+        async with client:
+            await client.get(f'/room/{slug}')
+            client_uuid = session['id']
+
+        ping = json.dumps({'type': 'ping', 'receiver': 'ground control',
+                           'data': 1})
+        try:
+            # The gauge returns to 0 after the websocket is closed
+            async with client.websocket(f'/room/{slug}/ws') as ws:
+                await ws.send(ping)
+                await ws.receive()
+                assert await websockets() == 1
+            assert await websockets() == 0
+
+            # and after the client is reaped
+            async with client.websocket(f'/room/{slug}/ws') as ws:
+                await ws.send(ping)
+                await ws.receive()
+                await remove_clients(message_handler,
+                                     [(client_uuid, room_id)])
+                assert 'bye' in await ws.receive()
+                assert await websockets() == 0
+        finally:
+            metrics.enabled = False
+            message_handler.stop()
+
+
+@pytest.mark.asyncio
+async def test_enter_room_rate_limit(app):
+    app.config['RATE_LIMIT_ROOM_JOINS'] = '1/2'
+    rate_limits.init_app(app)
+    client = app.test_client()
+
+    async with app.app_context():
+        room = Room()
+        room.set_name('My busy room')
+        db.session.add(room)
+        db.session.commit()
+        slug = room.slug
+
+    for _ in range(2):
+        response = await client.get(f'/room/{slug}')
+        assert response.status_code == 200
+
+    response = await client.get(f'/room/{slug}')
+    assert response.status_code == 429
+
+
+@pytest.mark.asyncio
+async def test_enter_room_behind_proxy(app):
+    app.config['RATE_LIMIT_IP_JOINS'] = '1/1'
+    app.config['TRUSTED_PROXIES'] = 1
+    rate_limits.init_app(app)
+    client = app.test_client()
+
+    async with app.app_context():
+        room = Room()
+        room.set_name('My proxied room')
+        db.session.add(room)
+        db.session.commit()
+        slug = room.slug
+
+    # Clients are told apart by the address added by the proxy, not by
+    # addresses they add themselves
+    for forwarded in ('10.0.0.1', '10.0.0.1, 10.0.0.2'):
+        response = await client.get(f'/room/{slug}',
+                                    headers={'X-Forwarded-For': forwarded})
+        assert response.status_code == 200
+    response = await client.get(f'/room/{slug}',
+                                headers={'X-Forwarded-For': '10.0.0.3, 10.0.0.2'})
+    assert response.status_code == 429
+
+
 @pytest.mark.asyncio
 async def test_enter_room_with_guest_limit(client):
     async with client.app.app_context():
@@ -128,6 +304,28 @@ async def test_enter_full_room_with_guest_limit(client):
     assert b'Guest limit already reached' in data
 
 
+@pytest.mark.asyncio
+async def test_enter_full_room_with_password(client, monkeypatch):
+    async def check(password_hash, password):
+        raise AssertionError('The password should not be checked')
+    monkeypatch.setattr(passwords, 'check', check)
+
+    async with client.app.app_context():
+        room = Room(guest_limit=1)
+        room.set_name('My full password room')
+        room.set_password('cat')
+        db.session.add_all([room, Client(uuid='1234', room=room)])
+        db.session.commit()
+
+        # A full room is refused before the password is asked for or checked
+        response = await client.get(f'/room/{room.slug}')
+        assert response.status_code == 418
+        response = await client.post(f'/room/{room.slug}', json={
+            'password': 'cat'
+        })
+        assert response.status_code == 418
+
+
 @pytest.mark.asyncio
 async def test_create_default_room(client):
     data = await _create_room(client, 'Default room')
@@ -178,7 +376,8 @@ async def test_websocket(client):
         # Enter the room to set cookie for websocket auth
         async with client:
             await client.get(f'/room/{room.slug}')
-            assert session.get('id', None) is not None
+            client_uuid = session.get('id', None)
+            assert client_uuid is not None
 
         # Connect to the websocket and send a ping
         async with client.websocket(f'/room/{room.slug}/ws') as ws:
@@ -192,6 +391,37 @@ async def test_websocket(client):
 
             assert ws.accepted
             assert 'pong' in response
+            assert client_uuid in message_handler.outbox
+
+        # The client's queue is removed when the websocket closes
+        assert client_uuid not in message_handler.outbox
+
+        message_handler.stop()
+
+
+@pytest.mark.asyncio
+async def test_websocket_msgpack(client):
+    msgpack = pytest.importorskip('msgpack')
+
+    async with client.app.app_context():
+        message_handler.start()
+
+        room = Room()
+        room.set_name('My room')
+        db.session.add(room)
+        db.session.commit()
+
+        async with client:
+            await client.get(f'/room/{room.slug}')
+
+        # The test client does not pass subprotocols on to the app
+        connection = client.websocket(f'/room/{room.slug}/ws')
+        connection.scope['subprotocols'] = ['camus.msgpack']
+        async with connection as ws:
+            await ws.send(msgpack.packb([TYPE_CODES['ping'], SERVER_ID, 9999]))
+            response = msgpack.unpackb(await ws.receive())
+
+            assert response == [TYPE_CODES['pong'], SERVER_ID, 9999]
 
         message_handler.stop()
 
@@ -0,0 +1,36 @@
+import pytest
+
+from camus import store
+from camus.directory import Directory
+from camus.models import Room
+
+
+async def _add_public_room(name):
+    room = Room(is_public=True)
+    room.set_name(name)
+    await store.create_room(room)
+
+
+@pytest.mark.asyncio
+async def test_directory_rebuilt_in_background(app):
+    directory = Directory(ttl=0)
+    await _add_public_room('First room')
+    assert (await directory.page())['total'] == 1
+
+    # A stale snapshot is served while the new one is built
+    await _add_public_room('Second room')
+    assert (await directory.page())['total'] == 1
+    await directory._task
+    assert (await directory.page())['total'] == 2
+
+
+@pytest.mark.asyncio
+async def test_directory_pages(app):
+    directory = Directory(page_size=2)
+    for i in range(5):
+        await _add_public_room('Room {}'.format(i))
+
+    page = await directory.page(3)
+    assert (page['page'], page['pages'], len(page['rooms'])) == (3, 3, 1)
+    assert (await directory.page(10))['page'] == 3
+    assert (await directory.page(-1))['page'] == 1
@@ -0,0 +1,49 @@
+from camus.history import History
+
+
+def test_history_size():
+    history = History(size=3)
+    for i in range(5):
+        history.append(1, 'message {}'.format(i))
+    history.append(2, 'other room')
+
+    assert history.get(1) == ['message 2', 'message 3', 'message 4']
+    assert history.get(2) == ['other room']
+    assert history.get(3) == []
+    assert history.bytes == 3 * len('message 0') + len('other room')
+
+
+def test_history_max_bytes():
+    history = History(size=10, max_bytes=30)
+    history.append(1, 'a' * 10)
+    history.append(2, 'b' * 10)
+    history.append(1, 'c' * 10)
+
+    # The oldest messages of the quietest room are evicted first
+    history.append(3, 'd' * 10)
+    assert history.get(2) == []
+    history.append(3, 'e' * 10)
+    assert history.get(1) == ['c' * 10]
+    assert history.get(3) == ['d' * 10, 'e' * 10]
+    assert (history.bytes, history.evicted) == (30, 2)
+
+    # Messages larger than the whole history are not kept
+    history.append(1, 'f' * 31)
+    assert len(history) == 3
+
+
+def test_history_forget():
+    history = History()
+    history.append(1, 'hello')
+    history.append(2, 'goodbye')
+
+    history.forget([1, 3])
+    assert history.get(1) == []
+    assert history.get(2) == ['goodbye']
+    assert history.bytes == len('goodbye')
+
+
+def test_history_disabled():
+    history = History(size=0)
+    history.append(1, 'hello')
+    assert history.get(1) == [] and history.bytes == 0
@@ -0,0 +1,54 @@
+import datetime
+import json
+
+import pytest
+
+from camus import db, store
+from camus.message_handler import MessageHandler
+from camus.models import Client, Room
+
+
+@pytest.mark.asyncio
+async def test_liveness_ping_and_reap(app):
+    async with app.app_context():
+        room = Room()
+        room.set_name('Quiet room')
+        db.session.add_all([room, Client(uuid='idle', room=room),
+                            Client(uuid='active', room=room)])
+        db.session.commit()
+
+    message_handler = MessageHandler()
+    message_handler.start(workers=1)
+    try:
+        queues = {uuid: await message_handler.connect(
+                      await store.get_client(uuid))
+                  for uuid in ['idle', 'active']}
+        start = datetime.datetime.utcnow()
+        liveness = message_handler.liveness
+
+        # Nothing happens before the ping deadline
+        await liveness.expire(start + datetime.timedelta(seconds=29))
+        assert message_handler.outbox['idle'].empty()
+
+        # Idle clients are pinged once
+        await liveness.expire(start + datetime.timedelta(seconds=31))
+        await liveness.expire(start + datetime.timedelta(seconds=32))
+        msg = json.loads(message_handler.outbox['idle'].get_nowait())
+        assert msg['type'] == 'ping'
+        assert message_handler.outbox['idle'].empty()
+        message_handler.outbox['active'].get_nowait()
+
+        # A client which responds is not reaped
+        await message_handler.presence.touch(
+            'active', now=start + datetime.timedelta(seconds=80))
+        await liveness.expire(start + datetime.timedelta(seconds=91))
+        assert 'idle' not in message_handler.outbox
+        msg = json.loads(queues['idle'].get_nowait())
+        assert msg['type'] == 'bye'
+        msg = json.loads(message_handler.outbox['active'].get_nowait())
+        assert msg['type'] == 'room-info'
+        assert [c['id'] for c in msg['data']['clients']] == ['active']
+        assert message_handler.outbox['active'].empty()
+        assert await store.get_client('idle') is None
+    finally:
+        message_handler.stop()
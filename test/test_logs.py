@@ -0,0 +1,60 @@
+import json
+import logging
+import queue
+import sys
+
+from camus.logs import (DroppingQueueHandler, JSONFormatter, SamplingFilter,
+                        parse_settings)
+
+
+def _record(name='camus.test', level=logging.INFO, msg='Hello %s',
+            args=('world',), **extra):
+    record = logging.LogRecord(name, level, __file__, 1, msg, args, None)
+    record.__dict__.update(extra)
+    return record
+
+
+def test_parse_settings():
+    assert parse_settings('') == {}
+    assert parse_settings('camus.routes=DEBUG, hypercorn = WARNING') == {
+        'camus.routes': 'DEBUG', 'hypercorn': 'WARNING'}
+
+
+def test_json_formatter():
+    data = json.loads(JSONFormatter().format(_record(client='abc')))
+    assert data['message'] == 'Hello world'
+    assert data['level'] == 'INFO'
+    assert data['logger'] == 'camus.test'
+    assert data['client'] == 'abc'
+    assert 'exception' not in data
+
+
+def test_json_formatter_exception():
+    try:
+        raise ValueError('oops')
+    except ValueError:
+        record = logging.LogRecord('camus', logging.ERROR, __file__, 1,
+                                   'Failed', (), sys.exc_info())
+
+    data = json.loads(JSONFormatter().format(record))
+    assert 'ValueError: oops' in data['exception']
+
+
+def test_sampling_filter():
+    sampler = SamplingFilter({'camus.routes': 0.25})
+    kept = [sampler.filter(_record('camus.routes.ws')) for _ in range(8)]
+    assert kept.count(True) == 2
+
+    assert sampler.filter(_record('camus.routes', level=logging.ERROR))
+    assert all(sampler.filter(_record('camus.util')) for _ in range(8))
+
+
+def test_dropping_queue_handler():
+    handler = DroppingQueueHandler(queue.Queue(2))
+    for _ in range(3):
+        handler.handle(_record())
+    assert handler.dropped == 1
+
+    record = handler.queue.get_nowait()
+    assert record.getMessage() == 'Hello world'
+    assert record.args is None
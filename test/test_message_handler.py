@@ -4,7 +4,10 @@ import json
 import pytest
 
 from camus import db
-from camus.message_handler import Message
+from camus.message_handler import (CODECS, ClientQueue, Inbox, Message,
+                                    Outbox, OutboxClosed, get_codec,
+                                    split_envelope)
+from camus.metrics import LATENCY_BUCKETS, Histogram, metrics
 from camus.models import Client, Room
 
 
@@ -12,6 +15,7 @@ from camus.models import Client, Room
 async def test_inbox_ping(app, message_handler):
     async with app.app_context():
         _, sender_uuid, _ = await _seed_db(app)
+        message_handler.outbox.open(sender_uuid)
 
         # Send ping
         data = json.dumps({
@@ -23,15 +27,35 @@ async def test_inbox_ping(app, message_handler):
         message_handler.inbox.put_nowait((sender_uuid, data))
 
         # Expect pong
-        await asyncio.sleep(0)
-        msg = json.loads(message_handler.outbox[sender_uuid].get_nowait())
+        msg = json.loads(await _receive(message_handler, sender_uuid))
         assert msg['type'] == 'pong'
 
 
+@pytest.mark.asyncio
+async def test_inbox_latency_labels(app, message_handler, monkeypatch):
+    histogram = Histogram('test', 'Test', LATENCY_BUCKETS, label='type')
+    monkeypatch.setattr(metrics, 'inbox_latency', histogram)
+    monkeypatch.setattr(metrics, 'enabled', True)
+
+    async with app.app_context():
+        _, sender_uuid, _ = await _seed_db(app)
+        message_handler.outbox.open(sender_uuid)
+
+        # Types which are not part of the protocol are labelled as other
+        for type in ('ping', 'junk-1', 'junk-2', ['junk']):
+            message_handler.inbox.put_nowait((sender_uuid, json.dumps({
+                'receiver': 'ground control', 'type': type, 'data': 1})))
+            await _receive(message_handler, sender_uuid)
+
+    assert sorted(histogram._series) == ['other', 'ping']
+    assert sum(histogram._series['other'][0]) == 3
+
+
 @pytest.mark.asyncio
 async def test_inbox_profile(app, message_handler):
     async with app.app_context():
         _, sender_uuid, _ = await _seed_db(app)
+        message_handler.outbox.open(sender_uuid)
 
         # Send profile
         data = json.dumps({
@@ -45,15 +69,58 @@ async def test_inbox_profile(app, message_handler):
         message_handler.inbox.put_nowait((sender_uuid, data))
 
         # Expect room-info
-        await asyncio.sleep(0)
-        msg = json.loads(message_handler.outbox[sender_uuid].get_nowait())
+        msg = json.loads(await _receive(message_handler, sender_uuid))
         assert msg['type'] == 'room-info'
 
 
+@pytest.mark.asyncio
+async def test_membership_deltas(app, message_handler):
+    async with app.app_context():
+        _, client1_uuid, client2_uuid = await _seed_db(app)
+        client1 = Client.query.filter_by(uuid=client1_uuid).first()
+        client2 = Client.query.filter_by(uuid=client2_uuid).first()
+
+        # Client 1 receives deltas, client 2 receives snapshots
+        await message_handler.connect(client1, deltas=True)
+        await message_handler.connect(client2)
+
+        client3 = Client(uuid='abcd', room_id=client1.room_id)
+        db.session.add(client3)
+        db.session.commit()
+        await message_handler.connect(client3)
+        msg = json.loads(await _receive(message_handler, client1_uuid))
+        assert msg['type'] == 'member-joined'
+        assert msg['data'] == {'seq': 1, 'id': 'abcd', 'username': 'Major Tom'}
+
+        message_handler.inbox.put_nowait((client2_uuid, json.dumps({
+            'receiver': 'ground control', 'type': 'profile',
+            'data': {'username': 'Coconut'}})))
+        msg = json.loads(await _receive(message_handler, client1_uuid))
+        assert msg['type'] == 'member-updated'
+        assert msg['data'] == {'seq': 2, 'id': client2_uuid,
+                               'username': 'Coconut'}
+        msg = json.loads(await _receive(message_handler, client2_uuid))
+        assert msg['type'] == 'room-info' and msg['data']['seq'] == 2
+
+        message_handler.inbox.put_nowait((client2_uuid, json.dumps({
+            'receiver': 'ground control', 'type': 'bye', 'data': 0})))
+        msg = json.loads(await _receive(message_handler, client1_uuid))
+        assert msg['type'] == 'member-left'
+        assert msg['data'] == {'seq': 3, 'id': client2_uuid}
+
+        # A snapshot can be requested at any time
+        message_handler.inbox.put_nowait((client1_uuid, json.dumps({
+            'receiver': 'ground control', 'type': 'get-room-info'})))
+        msg = json.loads(await _receive(message_handler, client1_uuid))
+        assert msg['data']['seq'] == 3
+        assert [c['id'] for c in msg['data']['clients']] == [client1_uuid, 'abcd']
+
+
 @pytest.mark.asyncio
 async def test_inbox_get_room_info(app, message_handler):
     async with app.app_context():
         _, sender_uuid, _ = await _seed_db(app)
+        message_handler.outbox.open(sender_uuid)
 
         # Send get-room-info
         data = json.dumps({
@@ -64,8 +131,7 @@ async def test_inbox_get_room_info(app, message_handler):
         message_handler.inbox.put_nowait((sender_uuid, data))
 
         # Expect room-info
-        await asyncio.sleep(0)
-        msg = json.loads(message_handler.outbox[sender_uuid].get_nowait())
+        msg = json.loads(await _receive(message_handler, sender_uuid))
         assert msg['type'] == 'room-info'
 
 
@@ -73,6 +139,7 @@ async def test_inbox_get_room_info(app, message_handler):
 async def test_inbox_get_ice_servers(app, message_handler):
     async with app.app_context():
         _, sender_uuid, _ = await _seed_db(app)
+        message_handler.outbox.open(sender_uuid)
 
         # Send get-room-info
         data = json.dumps({
@@ -83,8 +150,7 @@ async def test_inbox_get_ice_servers(app, message_handler):
         message_handler.inbox.put_nowait((sender_uuid, data))
 
         # Expect room-info
-        await asyncio.sleep(0)
-        msg = json.loads(message_handler.outbox[sender_uuid].get_nowait())
+        msg = json.loads(await _receive(message_handler, sender_uuid))
         assert msg['type'] == 'ice-servers'
 
 
@@ -92,6 +158,7 @@ async def test_inbox_get_ice_servers(app, message_handler):
 async def test_inbox_text(app, message_handler):
     async with app.app_context():
         _, sender_uuid, receiver_uuid = await _seed_db(app)
+        message_handler.outbox.open(receiver_uuid)
 
         # Send text
         data = json.dumps({
@@ -107,16 +174,77 @@ async def test_inbox_text(app, message_handler):
         message_handler.inbox.put_nowait((sender_uuid, data))
 
         # Expect text
-        await asyncio.sleep(0)
-        msg = json.loads(message_handler.outbox[receiver_uuid].get_nowait())
+        msg = json.loads(await _receive(message_handler, receiver_uuid))
         assert msg['type'] == 'text'
 
 
+@pytest.mark.asyncio
+async def test_history_sent_on_connect(app, message_handler):
+    async with app.app_context():
+        _, client1_uuid, client2_uuid = await _seed_db(app)
+        client1 = Client.query.filter_by(uuid=client1_uuid).first()
+        client2 = Client.query.filter_by(uuid=client2_uuid).first()
+        await message_handler.connect(client1)
+
+        for i in range(2):
+            message_handler.inbox.put_nowait((client1_uuid, json.dumps({
+                'receiver': 'room', 'type': 'text',
+                'data': {'from': 'Bill', 'time': i, 'text': 'Hi'}})))
+            msg = json.loads(await _receive(message_handler, client1_uuid))
+            assert msg['type'] == 'text'
+
+        # A client which joins later is sent the earlier messages at once
+        await message_handler.connect(client2)
+        msg = json.loads(await _receive(message_handler, client2_uuid))
+        assert msg['type'] == 'history'
+        assert msg['receiver'] == client2_uuid
+        assert [item['data']['time'] for item in msg['data']] == [0, 1]
+        assert all(item['sender'] == client1_uuid for item in msg['data'])
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('type', ['history', 'room-info', 'member-left'])
+async def test_inbox_drops_server_types(app, message_handler, type):
+    async with app.app_context():
+        _, sender_uuid, receiver_uuid = await _seed_db(app)
+        message_handler.outbox.open(receiver_uuid)
+
+        for receiver in (receiver_uuid, 'room'):
+            message_handler.inbox.put_nowait((sender_uuid, json.dumps({
+                'receiver': receiver, 'type': type,
+                'data': [{'sender': 'ground control', 'type': 'bye'}]})))
+        message_handler.inbox.put_nowait((sender_uuid, json.dumps({
+            'receiver': receiver_uuid, 'type': 'text', 'data': 'Hi'})))
+
+        # Only the text is relayed
+        msg = json.loads(await _receive(message_handler, receiver_uuid))
+        assert msg['type'] == 'text'
+        assert message_handler.outbox[receiver_uuid].empty()
+
+
+@pytest.mark.asyncio
+async def test_inbox_relay_data_verbatim(app, message_handler):
+    async with app.app_context():
+        _, sender_uuid, receiver_uuid = await _seed_db(app)
+        message_handler.outbox.open(receiver_uuid)
+
+        # Encoded like the browser client, with a forged sender
+        payload = '{"type":"offer","sdp":"v=0\\r\\n","n":1.50}'
+        data = ('{"receiver":"' + receiver_uuid + '","type":"offer","data":'
+                + payload + ',"sender":"ground control"}')
+        message_handler.inbox.put_nowait((sender_uuid, data))
+
+        encoded = await _receive(message_handler, receiver_uuid)
+        assert encoded.endswith('"data": ' + payload + '}')
+        assert json.loads(encoded)['sender'] == sender_uuid
+
+
 @pytest.mark.asyncio
 async def test_broadcast(app, message_handler):
     async with app.app_context():
-        room_slug, client1_uuid, client2_uuid = await _seed_db(app)
-        room = Room.query.filter_by(slug=room_slug).first()
+        _, client1_uuid, client2_uuid = await _seed_db(app)
+        message_handler.outbox.open(client1_uuid)
+        message_handler.outbox.open(client2_uuid)
 
         # Send text
         message = Message({
@@ -124,7 +252,7 @@ async def test_broadcast(app, message_handler):
             'sender': client1_uuid,
             'receiver': 'room'
         })
-        message_handler.broadcast(room, message)
+        message_handler.broadcast([client1_uuid, client2_uuid], message)
 
         # Each client should receive the message
         await asyncio.sleep(0)
@@ -133,8 +261,97 @@ async def test_broadcast(app, message_handler):
         assert msg1['type'] == 'ping' and msg2['type'] == 'ping'
 
 
+@pytest.mark.asyncio
+async def test_inbox_partitions_by_room():
+    inbox = Inbox(key=lambda item: item[0])
+    for item in [('a', 1), ('a', 2), ('b', 1)]:
+        inbox.put_nowait(item)
+    assert inbox.qsize() == 3
+
+    # Room 'a' is busy until task_done, so the next item comes from room 'b'
+    assert await inbox.get() == ('a', ('a', 1))
+    assert await inbox.get() == ('b', ('b', 1))
+    inbox.task_done('b')
+    inbox.task_done('a')
+
+    # Remaining items for room 'a' are handed out in order
+    assert await inbox.get() == ('a', ('a', 2))
+    inbox.task_done('a')
+    assert inbox.qsize() == 0
+
+
+def test_message_lazy_data():
+    message = Message('{"receiver": "5678", "type": "text", "data": {"a": [1, 2]}}')
+    assert message.receiver == '5678' and message.type == 'text'
+    assert message._raw_data == '{"a": [1, 2]}'
+
+    assert message.data == {'a': [1, 2]}
+    message.data = 'replaced'
+    assert json.loads(message.json())['data'] == 'replaced'
+
+
+@pytest.mark.parametrize('name', list(CODECS))
+def test_codec(name):
+    try:
+        codec = get_codec(name)
+    except ImportError:
+        pytest.skip('{} is not installed'.format(name))
+
+    data = {'sdp': 'v=0\r\n', 'name': 'Zoë', 'sent': 1.5, 'ok': [True, None]}
+    assert codec.loads(codec.dumps(data)) == data
+    assert codec.loads(codec.dumpb(data)) == data
+    assert isinstance(codec.dumps(data), str)
+    assert isinstance(codec.dumpb(data), bytes)
+
+
+def test_get_codec_unknown():
+    with pytest.raises(ValueError):
+        get_codec('yaml')
+
+
+def test_message_bytes():
+    message = Message(b'{"receiver": "5678", "type": "text", "data": "Zo\xc3\xab"}')
+    assert message.data == 'Zoë'
+
+    message.sender = '1234'
+    assert json.loads(message.json()) == {
+        'sender': '1234', 'receiver': '5678', 'type': 'text', 'data': 'Zoë'}
+
+
+@pytest.mark.parametrize('text', [
+    '[]',
+    '{"receiver": "5678"',
+    '{"receiver": "5678",}',
+    '{"receiver": "5678", "type": "text", "data": {"a": 1}, "sender": 1',
+    '{"receiver": "5678", "type": "text", "data": [1}',
+    '{"receiver": "5678", "type": "text", "data": nope}',
+    '{"data": 1} {"data": 2}',
+])
+def test_split_envelope_invalid(text):
+    with pytest.raises(ValueError):
+        split_envelope(text)
+
+
+def test_message_json_for():
+    message = Message({
+        'type': 'text',
+        'sender': '1234',
+        'data': {'text': 'Hello "world"'}
+    })
+
+    encoded = dict(message.json_for(['1234', '5678']))
+    assert json.loads(encoded['5678']) == {
+        'sender': '1234',
+        'receiver': '5678',
+        'type': 'text',
+        'data': {'text': 'Hello "world"'}
+    }
+    assert json.loads(encoded['1234'])['receiver'] == '1234'
+
+
 @pytest.mark.asyncio
 async def test_send_ping(message_handler):
+    message_handler.outbox.open('1234')
     message_handler.send_ping('1234')
     msg = json.loads(message_handler.outbox['1234'].get_nowait())
     assert msg['type'] == 'ping'
@@ -142,11 +359,72 @@ async def test_send_ping(message_handler):
 
 @pytest.mark.asyncio
 async def test_send_bye(message_handler):
+    message_handler.outbox.open('1234')
     message_handler.send_bye('1234')
     msg = json.loads(message_handler.outbox['1234'].get_nowait())
     assert msg['type'] == 'bye'
 
 
+@pytest.mark.asyncio
+async def test_send_to_unknown_receiver(message_handler):
+    message_handler.send_ping('unknown')
+    assert 'unknown' not in message_handler.outbox
+    assert message_handler.outbox.metrics()['undeliverable'] == 1
+
+
+@pytest.mark.asyncio
+async def test_client_queue_drop_oldest():
+    queue = ClientQueue(maxsize=2, policy='drop-oldest')
+    for data in ['1', '2', '3']:
+        queue.put_nowait(data)
+
+    assert queue.dropped == 1
+    assert [queue.get_nowait(), queue.get_nowait()] == ['2', '3']
+
+
+@pytest.mark.asyncio
+async def test_client_queue_coalesce():
+    queue = ClientQueue(maxsize=10, policy='coalesce')
+    queue.put_nowait('info1', 'room-info')
+    queue.put_nowait('text', 'text')
+    queue.put_nowait('info2', 'room-info')
+
+    assert queue.dropped == 1
+    assert [queue.get_nowait(), queue.get_nowait()] == ['text', 'info2']
+
+
+@pytest.mark.asyncio
+async def test_outbox_disconnect_slow_client():
+    outbox = Outbox(maxsize=1, policy='disconnect')
+    queue = outbox.open('1234')
+    assert outbox.put('1234', 'first')
+    assert not outbox.put('1234', 'second')
+
+    assert queue.closed and queue.overflowed and '1234' not in outbox
+    assert outbox.metrics()['evicted'] == 1
+    with pytest.raises(OutboxClosed):
+        await queue.get()
+
+
+@pytest.mark.asyncio
+async def test_outbox_discard():
+    outbox = Outbox()
+    old = outbox.open('1234')
+    outbox.pop('1234')
+    new = outbox.open('1234')
+
+    # A replaced queue is closed without removing the new one
+    outbox.discard('1234', old)
+    assert outbox['1234'] is new
+    outbox.discard('1234', new)
+    assert new.closed and not new.overflowed and '1234' not in outbox
+
+
+async def _receive(message_handler, receiver):
+    """Wait for the next message in a client's outbox."""
+    return await asyncio.wait_for(message_handler.outbox[receiver].get(), 1)
+
+
 async def _seed_db(app):
     """Seed the database with a room and clients."""
     async with app.app_context():
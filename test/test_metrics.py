@@ -0,0 +1,50 @@
+from camus.metrics import Histogram, Metrics, metrics, timed
+
+
+def test_histogram():
+    histogram = Histogram('test_seconds', 'A test', (1, 2), label='type')
+    histogram.observe(0.5, 'ping')
+    histogram.observe(2, 'ping')
+    histogram.observe(3, 'pong')
+
+    lines = histogram.render()
+    assert '# TYPE test_seconds histogram' in lines
+    assert 'test_seconds_bucket{type="ping",le="1"} 1' in lines
+    assert 'test_seconds_bucket{type="ping",le="2"} 2' in lines
+    assert 'test_seconds_bucket{type="ping",le="+Inf"} 2' in lines
+    assert 'test_seconds_sum{type="ping"} 2.5' in lines
+    assert 'test_seconds_count{type="pong"} 1' in lines
+
+
+def test_histogram_max_series():
+    histogram = Histogram('test', 'A test', (1,), label='type', max_series=2)
+    for label_value in ('a', 'b', 'c', 'd'):
+        histogram.observe(0, label_value)
+
+    lines = histogram.render()
+    assert 'test_count{type="a"} 1' in lines
+    assert 'test_count{type="other"} 2' in lines
+
+
+def test_render():
+    text = Metrics().render([
+        ('test_total', 'counter', 'A counter', 3),
+        ('test_limited', 'counter', 'A labelled counter',
+         ('limit', {'ip': 1, 'room': 2})),
+    ])
+    assert 'test_total 3\n' in text
+    assert 'test_limited{limit="room"} 2\n' in text
+
+
+def test_timed(monkeypatch):
+    histogram = Histogram('test', 'A test', (1,))
+
+    monkeypatch.setattr(metrics, 'enabled', False)
+    with timed(histogram):
+        pass
+    assert histogram.render()[2:] == []
+
+    monkeypatch.setattr(metrics, 'enabled', True)
+    with timed(histogram):
+        pass
+    assert 'test_count 1' in histogram.render()
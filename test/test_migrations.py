@@ -0,0 +1,60 @@
+import os
+import subprocess
+import sys
+
+import sqlalchemy as sa
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def alembic(url, *args):
+    # Run in a separate process, since the migration environment configures
+    # logging for the whole process
+    subprocess.run([sys.executable, '-m', 'alembic', *args], cwd=ROOT,
+                   env=dict(os.environ, DATABASE_URL=url), check=True,
+                   capture_output=True)
+
+
+def test_cascade_and_indexes(tmp_path):
+    url = 'sqlite:///' + str(tmp_path / 'camus.db')
+    engine = sa.create_engine(url)
+    alembic(url, 'upgrade', 'c27e8d5a90b4')
+
+    inspector = sa.inspect(engine)
+    assert 'ix_clients_room_id_seen' in _index_names(inspector, 'clients')
+    assert 'ix_rooms_is_public_active' in _index_names(inspector, 'rooms')
+    [foreign_key] = inspector.get_foreign_keys('clients')
+    assert foreign_key['options'].get('ondelete') == 'CASCADE'
+
+    # Deleting a room deletes its clients
+    with engine.connect() as connection:
+        connection.execute('PRAGMA foreign_keys=ON')
+        for room_id in (1, 2):
+            connection.execute(
+                "INSERT INTO rooms (id, name, slug, is_public, active) "
+                "VALUES (?, ?, ?, 0, CURRENT_TIMESTAMP)",
+                room_id, 'Room {}'.format(room_id), 'room-{}'.format(room_id))
+            connection.execute(
+                "INSERT INTO clients (uuid, name, seen, room_id) "
+                "VALUES (?, 'Major Tom', CURRENT_TIMESTAMP, ?)",
+                'client-{}'.format(room_id), room_id)
+
+        connection.execute('DELETE FROM rooms WHERE id = 1')
+        assert connection.execute(
+            'SELECT room_id FROM clients').fetchall() == [(2,)]
+
+    # Downgrading restores the previous schema
+    alembic(url, 'downgrade', '9f3d2b7c41e5')
+
+    inspector = sa.inspect(engine)
+    assert 'ix_clients_room_id_seen' not in _index_names(inspector, 'clients')
+    assert 'ix_rooms_is_public_active' not in _index_names(inspector, 'rooms')
+    [foreign_key] = inspector.get_foreign_keys('clients')
+    assert not foreign_key['options'].get('ondelete')
+    columns = {column['name']: column
+               for column in inspector.get_columns('clients')}
+    assert columns['seen']['nullable']
+
+
+def _index_names(inspector, table):
+    return {index['name'] for index in inspector.get_indexes(table)}
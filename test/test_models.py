@@ -37,3 +37,13 @@ async def test_room_failed_authentication():
     room.set_password('cat')
     assert not room.authenticate()
     assert not room.authenticate('dog')
+
+
+@pytest.mark.asyncio
+async def test_room_is_full():
+    room = Room(guest_limit=2, client_count=1)
+    assert not room.is_full()
+    room.client_count = 2
+    assert room.is_full()
+    room.guest_limit = 0
+    assert not room.is_full()
@@ -0,0 +1,23 @@
+import pytest
+
+from camus.passwords import PasswordHasher, fingerprint
+
+
+@pytest.mark.asyncio
+async def test_generate_and_check():
+    hasher = PasswordHasher(method='pbkdf2:sha256:1000')
+    password_hash = await hasher.generate('cat')
+    assert password_hash.startswith('pbkdf2:sha256:1000$')
+    assert await hasher.check(password_hash, 'cat')
+    assert not await hasher.check(password_hash, 'dog')
+    assert not await hasher.check(password_hash, '')
+    assert not await hasher.check(None, 'cat')
+
+
+@pytest.mark.asyncio
+async def test_fingerprint():
+    hasher = PasswordHasher(method='pbkdf2:sha256:1000')
+    first = await hasher.generate('cat')
+    second = await hasher.generate('cat')
+    assert fingerprint(first) == fingerprint(first)
+    assert fingerprint(first) != fingerprint(second)
@@ -0,0 +1,67 @@
+import datetime
+
+import pytest
+
+from camus import db, store
+from camus.models import Client, Room
+from camus.presence import Presence
+
+
+@pytest.mark.asyncio
+async def test_touch_and_flush(app):
+    async with app.app_context():
+        room_id = await _seed_db(app)
+        presence = Presence()
+        now = datetime.datetime.utcnow() + datetime.timedelta(minutes=5)
+
+        assert await presence.touch('1234', now=now) == room_id
+        assert presence.client_seen('1234') == now
+        assert presence.room_active(room_id) == now
+
+        # Nothing is written until the presence is flushed
+        client = await store.get_client('1234')
+        assert client.seen < now
+
+        assert await presence.flush()
+        client = await store.get_client('1234')
+        room = await store.get_room(room_id=room_id)
+        assert client.seen == now and room.active == now
+
+
+@pytest.mark.asyncio
+async def test_touch_unknown_client(app):
+    async with app.app_context():
+        presence = Presence()
+        assert await presence.touch('unknown') is None
+        assert await presence.flush()
+
+
+@pytest.mark.asyncio
+async def test_stale_clients(app):
+    async with app.app_context():
+        room_id = await _seed_db(app)
+        presence = Presence()
+        cutoff = datetime.datetime.utcnow() + datetime.timedelta(minutes=5)
+
+        # Clients that are active in memory are not stale, even before a flush
+        await presence.touch('1234', now=cutoff + datetime.timedelta(seconds=1))
+        stale = await presence.stale_clients(cutoff)
+        assert [client.uuid for client in stale] == ['5678']
+        assert await presence.stale_rooms(cutoff) == []
+
+        presence.forget_room(room_id)
+        assert presence.client_seen('1234') is None
+        assert len(await presence.stale_rooms(cutoff)) == 1
+
+
+async def _seed_db(app):
+    """Seed the database with a room and clients."""
+    async with app.app_context():
+        room = Room()
+        room.set_name('TestRoom123')
+        client1 = Client(uuid='1234', room=room)
+        client2 = Client(uuid='5678', room=room)
+        db.session.add_all([room, client1, client2])
+        db.session.commit()
+
+        return room.id
@@ -0,0 +1,203 @@
+import json
+import zlib
+
+import pytest
+
+from camus.protocol import (ROOM_ID, SELF_ID, SERVER_ID, TYPE_CODES,
+                            JSONProtocol, MsgpackProtocol, negotiate)
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+requires_msgpack = pytest.mark.skipif(msgpack is None,
+                                      reason='msgpack is not installed')
+
+
+def test_negotiate():
+    protocol = negotiate([], '1234')
+    assert isinstance(protocol, JSONProtocol)
+    assert protocol.subprotocol is None
+
+    protocol = negotiate(['unknown', 'camus.json+unknown'], '1234')
+    assert isinstance(protocol, JSONProtocol)
+    assert protocol.subprotocol is None
+
+    protocol = negotiate(['camus.json+batch+deflate'], '1234')
+    assert protocol.subprotocol == 'camus.json+batch+deflate'
+    assert protocol.batch and protocol.compression_threshold
+
+    # Compression can be disabled by the server
+    protocol = negotiate(['camus.json+deflate', 'camus.json+batch'], '1234',
+                         compression_threshold=0)
+    assert protocol.subprotocol == 'camus.json+batch'
+
+
+@requires_msgpack
+def test_negotiate_msgpack():
+    protocol = negotiate(['unknown', 'camus.msgpack'], '1234')
+    assert isinstance(protocol, MsgpackProtocol)
+    assert protocol.subprotocol == 'camus.msgpack'
+
+
+def test_json_frames():
+    messages = ['{"type": "ping", "data": 1}', '{"type": "pong", "data": 2}']
+
+    protocol = JSONProtocol('1234')
+    assert protocol.frames(messages) == messages
+
+    protocol = JSONProtocol('1234', options=['batch'])
+    assert json.loads(protocol.frames(messages)[0]) == [
+        {'type': 'ping', 'data': 1}, {'type': 'pong', 'data': 2}]
+
+
+def test_json_deflate():
+    protocol = JSONProtocol('1234', options=['deflate'],
+                            compression_threshold=100)
+    small = json.dumps({'type': 'text', 'data': 'hello'})
+    large = json.dumps({'type': 'offer', 'data': 'v=0\r\n' * 100})
+
+    frames = protocol.frames([small, large])
+    assert frames[0] == small
+    assert frames[1][:1] == b'\x00' and len(frames[1]) < len(large)
+    assert zlib.decompress(frames[1][1:], -15).decode() == large
+
+    # Compressed frames can also be received
+    assert protocol.decode(frames[1]) == large.encode()
+
+
+def test_json_inflate_limit():
+    protocol = JSONProtocol('1234', options=['deflate'])
+    protocol.MAX_INFLATED_SIZE = 1000
+    compressor = zlib.compressobj(6, zlib.DEFLATED, -15)
+    frame = b'\x00' + compressor.compress(b' ' * 2000) + compressor.flush()
+
+    with pytest.raises(ValueError):
+        protocol.decode(frame)
+    with pytest.raises(ValueError):
+        protocol.decode(b'\x00not deflate')
+
+
+@requires_msgpack
+def test_msgpack_decode():
+    protocol = MsgpackProtocol('1234')
+
+    message = protocol.decode(msgpack.packb(
+        [TYPE_CODES['ping'], SERVER_ID, 1615918847680]))
+    assert message == {'receiver': 'ground control', 'type': 'ping',
+                       'data': 1615918847680}
+
+    message = protocol.decode(msgpack.packb(['custom', ROOM_ID, None]))
+    assert message['receiver'] == 'room' and message['type'] == 'custom'
+
+
+@requires_msgpack
+@pytest.mark.parametrize('message', [
+    {'type': 1},
+    [1, 0],
+    [999, 0, None],
+    [1, 7, None],
+    [1, -1, None],
+    [1, True, None],
+    [1, 1.0, None],
+])
+def test_msgpack_decode_invalid(message):
+    protocol = MsgpackProtocol('1234')
+    with pytest.raises(ValueError):
+        protocol.decode(msgpack.packb(message))
+    with pytest.raises(ValueError):
+        protocol.decode(json.dumps(message))
+    with pytest.raises(ValueError):
+        protocol.decode(b'\xc1')
+
+
+@requires_msgpack
+def test_msgpack_encode_short_ids():
+    protocol = MsgpackProtocol('1234')
+
+    # Other clients are given IDs as they appear, including in room-info
+    frame = protocol.encode(json.dumps({
+        'sender': 'ground control', 'receiver': '1234', 'type': 'room-info',
+        'data': {'room_id': 'room', 'clients': [
+            {'id': '1234', 'username': 'Bill'},
+            {'id': '5678', 'username': 'Ted'}]}}))
+    type, peer, data = msgpack.unpackb(frame)
+    assert type == TYPE_CODES['room-info'] and peer == SERVER_ID
+    assert [client['id'] for client in data['clients']] == [SELF_ID, 3]
+
+    frame = protocol.encode(json.dumps({
+        'sender': '5678', 'receiver': '1234', 'type': 'text',
+        'data': {'text': 'Hello'}}))
+    assert msgpack.unpackb(frame) == [TYPE_CODES['text'], 3, {'text': 'Hello'}]
+
+    frame = protocol.encode(json.dumps({
+        'sender': 'ground control', 'receiver': '1234', 'type': 'member-left',
+        'data': {'seq': 3, 'id': '5678'}}))
+    assert msgpack.unpackb(frame) == [
+        TYPE_CODES['member-left'], SERVER_ID, {'seq': 3, 'id': 3}]
+
+    # Replies can be addressed using the short ID
+    message = protocol.decode(msgpack.packb([TYPE_CODES['text'], 3, 'Hi']))
+    assert message['receiver'] == '5678'
+
+
+@requires_msgpack
+def test_msgpack_encode_history():
+    protocol = MsgpackProtocol('1234')
+    frame = protocol.encode(json.dumps({
+        'sender': 'ground control', 'receiver': '1234', 'type': 'history',
+        'data': [{'sender': '5678', 'receiver': 'room', 'type': 'text',
+                  'data': {'text': 'Hello'}}]}))
+    assert msgpack.unpackb(frame) == [
+        TYPE_CODES['history'], SERVER_ID,
+        [[TYPE_CODES['text'], 3, {'text': 'Hello'}]]]
+
+
+@requires_msgpack
+def test_msgpack_encode_relayed():
+    protocol = MsgpackProtocol('1234', options=['batch'])
+    messages = [
+        # Messages relayed from clients are not rewritten, whatever their type
+        {'sender': '5678', 'type': 'member-left', 'data': {'id': '1234'}},
+        # Messages with an unexpected shape are not rewritten
+        {'sender': 'ground control', 'type': 'member-left', 'data': None},
+        {'sender': 'ground control', 'type': 'room-info',
+         'data': {'clients': [1]}},
+        {'sender': 'ground control', 'type': 'history', 'data': 5},
+        {'sender': '5678', 'type': ['text'], 'data': None},
+    ]
+
+    frames = protocol.frames([json.dumps(message) for message in messages])
+    assert msgpack.unpackb(frames[0]) == [
+        [TYPE_CODES['member-left'], 3, {'id': '1234'}],
+        [TYPE_CODES['member-left'], SERVER_ID, None],
+        [TYPE_CODES['room-info'], SERVER_ID, {'clients': [1]}],
+        [TYPE_CODES['history'], SERVER_ID, 5],
+        [['text'], 3, None],
+    ]
+
+
+@requires_msgpack
+def test_msgpack_encode_error():
+    protocol = MsgpackProtocol('1234')
+
+    # A message which cannot be encoded is skipped
+    frames = protocol.frames([
+        '{"sender": "5678", "type": "text", "data": ',
+        json.dumps({'sender': '5678', 'type': 'text', 'data': 'Hello'})])
+    assert [msgpack.unpackb(frame) for frame in frames] == [
+        [TYPE_CODES['text'], 3, 'Hello']]
+
+
+@requires_msgpack
+@pytest.mark.parametrize('count', [1, 20, 70000])
+def test_msgpack_batch(count):
+    protocol = MsgpackProtocol('1234', options=['batch'])
+    messages = [json.dumps({'sender': 'ground control', 'type': 'ping',
+                            'data': i}) for i in range(count)]
+
+    frames = protocol.frames(messages)
+    assert len(frames) == 1
+    assert msgpack.unpackb(frames[0]) == [
+        [TYPE_CODES['ping'], SERVER_ID, i] for i in range(count)]
@@ -0,0 +1,50 @@
+import pytest
+
+from camus.ratelimit import RateLimiter, RateLimits, parse_limit
+
+
+def test_parse_limit():
+    assert parse_limit('5/50') == (5, 50)
+    assert parse_limit('0.5/10') == (0.5, 10)
+    assert parse_limit('10') == (10, 10)
+    assert parse_limit('0') is None
+    assert parse_limit(0) is None
+    with pytest.raises(ValueError):
+        parse_limit('1/0.5')
+
+
+def test_rate_limiter():
+    limiter = RateLimiter(rate=2, burst=3)
+    assert all(limiter.allow('a', now=0) for _ in range(3))
+    assert not limiter.allow('a', now=0)
+    assert limiter.allow('b', now=0)
+
+    # Tokens are replenished at the rate, up to the burst
+    assert limiter.allow('a', now=0.5)
+    assert not limiter.allow('a', now=0.5)
+    assert all(limiter.allow('a', now=100) for _ in range(3))
+    assert not limiter.allow('a', now=100)
+
+    assert limiter.allowed == 8
+    assert limiter.limited == 3
+
+
+def test_rate_limiter_prune():
+    limiter = RateLimiter(rate=1, burst=2, max_keys=2)
+    limiter.allow('a', now=0)
+    limiter.allow('b', now=0)
+    limiter.allow('c', now=10)
+    assert len(limiter) == 1
+
+
+def test_rate_limits(app):
+    rate_limits = RateLimits()
+    app.config['RATE_LIMIT_CLIENT_MESSAGES'] = '1/1'
+    app.config['RATE_LIMIT_ROOM_MESSAGES'] = '0'
+    rate_limits.init_app(app)
+
+    assert rate_limits.allow(client_messages='a', room_messages=1)
+    assert not rate_limits.allow(client_messages='a', room_messages=1)
+    assert rate_limits.stats()['client_messages'] == {
+        'allowed': 1, 'limited': 1, 'keys': 1}
+    assert 'room_messages' not in rate_limits.stats()
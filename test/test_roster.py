@@ -0,0 +1,54 @@
+import pytest
+
+from camus import db
+from camus.models import Client, Room
+from camus.roster import Roster, Rosters
+
+
+def test_roster_deltas():
+    roster = Roster('room', [('1234', 'Bill')])
+
+    assert roster.join('5678', 'Ted') == (
+        'member-joined', {'seq': 1, 'id': '5678', 'username': 'Ted'})
+    assert roster.update('5678', 'Ted') is None
+    assert roster.update('5678', 'Theodore') == (
+        'member-updated', {'seq': 2, 'id': '5678', 'username': 'Theodore'})
+    assert roster.leave('1234') == ('member-left', {'seq': 3, 'id': '1234'})
+    assert roster.leave('1234') is None
+
+    assert roster.snapshot() == {
+        'room_id': 'room', 'seq': 3,
+        'clients': [{'id': '5678', 'username': 'Theodore'}]}
+
+
+def test_roster_reload():
+    roster = Roster('room', [('1234', 'Bill')])
+    roster.reload([('1234', 'Bill')])
+    assert roster.seq == 0
+
+    # A change made elsewhere causes a gap in the sequence
+    roster.reload([('1234', 'Bill'), ('5678', 'Ted')])
+    assert roster.seq == 1 and '5678' in roster.members
+
+
+@pytest.mark.asyncio
+async def test_rosters(app):
+    async with app.app_context():
+        room = Room()
+        room.set_name('TestRoom123')
+        db.session.add_all([room, Client(uuid='1234', name='Bill', room=room)])
+        db.session.commit()
+        room_id = room.id
+
+        rosters = Rosters()
+        roster = await rosters.get(room_id)
+        assert roster.members == {'1234': 'Bill'}
+
+        # The roster is kept in memory once loaded
+        roster.join('5678', 'Ted')
+        assert await rosters.get(room_id) is roster
+        assert '5678' in (await rosters.get(room_id)).members
+
+        rosters.forget([room_id])
+        assert len(rosters) == 0
+        assert await rosters.get(12345) is None
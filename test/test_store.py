@@ -0,0 +1,82 @@
+import asyncio
+
+import pytest
+import sqlalchemy
+
+from camus import store
+from camus.models import Client, Room
+from camus.store import GuestLimitReached
+
+
+@pytest.mark.asyncio
+async def test_rooms_and_clients(app):
+    room = Room()
+    room.set_name('My room')
+    room = await store.create_room(room)
+
+    await store.add_client(Client(uuid='1234', room=room))
+    await store.add_client(Client(uuid='5678', room=room))
+    assert (await store.get_room(room_id=room.id)).client_count == 2
+
+    await store.rename_client('1234', 'Coconut')
+    room = await store.get_room(slug='my-room', with_clients=True)
+    assert sorted(c.name for c in room.clients) == ['Coconut', 'Major Tom']
+
+    assert await store.delete_client('1234') == room.id
+    assert await store.delete_client('1234') is None
+    assert await store.get_client('1234') is None
+    assert (await store.get_room(room_id=room.id)).client_count == 1
+
+
+@pytest.mark.asyncio
+async def test_create_room_name_taken(app):
+    room = Room()
+    room.set_name('Taken')
+    await store.create_room(room)
+
+    room = Room()
+    room.set_name('Taken')
+    with pytest.raises(sqlalchemy.exc.IntegrityError):
+        await store.create_room(room)
+
+
+@pytest.mark.asyncio
+async def test_cached_lookups(app):
+    room = Room()
+    room.set_name('Cached room')
+    room = await store.create_room(room)
+    await store.add_client(Client(uuid='1234', room_id=room.id))
+
+    hits = store.clients.hits
+    cached_room = await store.get_room(slug='cached-room', cached=True)
+    assert await store.get_room(slug='cached-room', cached=True) is cached_room
+    assert (await store.get_client('1234', cached=True)).room_id == room.id
+    assert store.clients.hits == hits + 1
+
+    await store.delete_rooms([room.id])
+    assert await store.get_room(slug='cached-room', cached=True) is None
+    assert await store.get_client('1234', cached=True) is None
+
+
+@pytest.mark.asyncio
+async def test_guest_limit(app):
+    room = Room(guest_limit=3)
+    room.set_name('Small room')
+    room = await store.create_room(room)
+
+    async def join(uuid):
+        try:
+            return await store.add_client(Client(uuid=uuid, room_id=room.id))
+        except GuestLimitReached:
+            return None
+
+    # Concurrent joins cannot overshoot the limit
+    joined = await asyncio.gather(*[join(str(i)) for i in range(10)])
+    assert len([client for client in joined if client]) == 3
+    assert (await store.get_room(room_id=room.id)).client_count == 3
+
+    # Places are released when clients leave or are reaped
+    await store.delete_client('0')
+    await store.delete_clients(['1', '2'])
+    assert (await store.get_room(room_id=room.id)).client_count == 0
+    assert await join('3')
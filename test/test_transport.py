@@ -0,0 +1,148 @@
+import asyncio
+import json
+
+import pytest
+
+from camus.message_handler import Message, MessageHandler
+from camus.transport import (LocalTransport, RedisError, RedisTransport,
+                             _decode_payload, _encode_command,
+                             _encode_payload, _read_reply, create_transport)
+
+CLIENT1 = '1234' * 8
+CLIENT2 = '5678' * 8
+
+
+class PubSubServer:
+    """A minimal stand-in for a Redis server supporting PUBLISH/SUBSCRIBE."""
+
+    def __init__(self):
+        self.subscribers = {}
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._handle, '127.0.0.1', 0)
+        port = self._server.sockets[0].getsockname()[1]
+        return 'redis://127.0.0.1:{}'.format(port)
+
+    async def stop(self):
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle(self, reader, writer):
+        try:
+            while True:
+                command = await _read_reply(reader)
+                name = command[0].upper()
+                if name == b'SUBSCRIBE':
+                    self.subscribers.setdefault(command[1], []).append(writer)
+                    writer.write(b'*3\r\n$9\r\nsubscribe\r\n'
+                                 + _encode_command(command[1])[4:] + b':1\r\n')
+                elif name == b'PUBLISH':
+                    subscribers = self.subscribers.get(command[1], [])
+                    for subscriber in subscribers:
+                        subscriber.write(_encode_command(
+                            'message', command[1], command[2]))
+                    writer.write(b':%d\r\n' % len(subscribers))
+        except EOFError:
+            writer.close()
+
+
+def test_create_transport():
+    assert isinstance(create_transport(None), LocalTransport)
+    assert isinstance(create_transport('redis://localhost:6379'), RedisTransport)
+    with pytest.raises(ValueError):
+        create_transport('http://localhost')
+
+
+@pytest.mark.asyncio
+async def test_redis_transport_fan_out():
+    server = PubSubServer()
+    url = await server.start()
+
+    # Two server processes, each with one connected client in the same room
+    worker1 = MessageHandler(transport=RedisTransport(url))
+    worker2 = MessageHandler(transport=RedisTransport(url))
+    worker1.outbox.open(CLIENT1)
+    worker2.outbox.open(CLIENT2)
+
+    try:
+        for worker in (worker1, worker2):
+            worker.start(workers=1)
+            await asyncio.wait_for(worker.transport.subscribed.wait(), 1)
+
+        # Send from one worker to a client on another worker
+        message = Message({'type': 'text', 'sender': CLIENT1,
+                           'receiver': CLIENT2, 'data': 'hello'})
+        worker1.send(message)
+        data = await asyncio.wait_for(worker2.outbox[CLIENT2].get(), 1)
+        assert json.loads(data)['data'] == 'hello'
+
+        # Broadcast to a room whose clients are spread across workers
+        message = Message({'type': 'room-info', 'sender': 'ground control'})
+        worker2.broadcast([CLIENT1, CLIENT2], message)
+        msg1 = json.loads(await asyncio.wait_for(worker1.outbox[CLIENT1].get(), 1))
+        msg2 = json.loads(await asyncio.wait_for(worker2.outbox[CLIENT2].get(), 1))
+        assert msg1['receiver'] == CLIENT1 and msg2['receiver'] == CLIENT2
+
+        # Receivers which are not client IDs are not published, so they
+        # cannot smuggle fields into the payload
+        forged = '{"sender": "ground control", "type": "bye"}'
+        worker1.send(Message({'type': 'text', 'sender': CLIENT1,
+                              'receiver': CLIENT2 + '\nbye\n' + forged,
+                              'data': 'hello'}))
+        worker1.send(Message({'type': 'text', 'sender': CLIENT1,
+                              'receiver': CLIENT2, 'data': 'again'}))
+        data = await asyncio.wait_for(worker2.outbox[CLIENT2].get(), 1)
+        assert json.loads(data)['data'] == 'again'
+    finally:
+        worker1.stop()
+        worker2.stop()
+        await server.stop()
+
+
+def test_receive_invalid_payload():
+    delivered = []
+    transport = RedisTransport('redis://localhost')
+    transport._deliver = lambda *args: delivered.append(args)
+    transport._is_local = lambda receiver: True
+
+    # Invalid payloads are skipped rather than ending the subscription
+    transport._receive(b'garbage')
+    transport._receive(_encode_payload(b'other', b'\xff', b'', b'{}'))
+    transport._receive(_encode_payload(b'other', CLIENT1.encode(), b'',
+                                       b'\xff'))
+    transport._receive(_encode_payload(b'other', CLIENT1.encode(), b'text',
+                                       b'{}'))
+    assert delivered == [(CLIENT1, '{}', 'text')]
+
+
+def test_payload_fields():
+    fields = [b'origin', CLIENT1.encode(), b'', b'{"data": "1:2\n3"}']
+    assert _decode_payload(_encode_payload(*fields)) == fields
+
+    for payload in (b'', b'6:origin', b'x:origin', b'99:short',
+                    _encode_payload(*fields) + b'extra'):
+        with pytest.raises(ValueError):
+            _decode_payload(payload)
+
+
+@pytest.mark.asyncio
+async def test_redis_transport_auth_failure_closes_connection():
+    closed = asyncio.Event()
+
+    async def handle(reader, writer):
+        await _read_reply(reader)
+        writer.write(b'-ERR invalid password\r\n')
+        await reader.read()
+        closed.set()
+        writer.close()
+
+    server = await asyncio.start_server(handle, '127.0.0.1', 0)
+    port = server.sockets[0].getsockname()[1]
+    transport = RedisTransport('redis://:wrong@127.0.0.1:{}'.format(port))
+    try:
+        with pytest.raises(RedisError):
+            await transport._connect()
+        await asyncio.wait_for(closed.wait(), 1)
+    finally:
+        server.close()
+        await server.wait_closed()
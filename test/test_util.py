@@ -0,0 +1,153 @@
+import asyncio
+import datetime
+import json
+
+import pytest
+
+from camus import db, store, util
+from camus.message_handler import MessageHandler, OutboxClosed
+from camus.models import Client, Room
+from camus.util import (Debouncer, TwilioIceServers, generate_turn_creds,
+                        reap_clients, reap_rooms)
+
+TWILIO_CONFIG = {
+    'TWILIO_ACCOUNT_SID': 'sid',
+    'TWILIO_AUTH_TOKEN': 'token',
+    'TWILIO_KEY_SID': None,
+    'TWILIO_TIMEOUT': 1,
+}
+
+
+@pytest.mark.asyncio
+async def test_twilio_ice_servers_cached(monkeypatch):
+    calls = []
+
+    def fetch(account_sid, auth_token, key_sid=None):
+        calls.append(account_sid)
+        return [{'urls': ['turn:twilio']}], 3600
+
+    monkeypatch.setattr(util, 'fetch_twilio_ice_servers', fetch)
+    cache = TwilioIceServers()
+
+    results = await asyncio.gather(*[cache.get(TWILIO_CONFIG) for _ in range(5)])
+    assert all(servers == [{'urls': ['turn:twilio']}] for servers in results)
+    assert await cache.get(TWILIO_CONFIG) == [{'urls': ['turn:twilio']}]
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_twilio_ice_servers_not_configured(monkeypatch):
+    monkeypatch.setattr(util, 'fetch_twilio_ice_servers', None)
+    config = dict(TWILIO_CONFIG, TWILIO_ACCOUNT_SID=None)
+    assert await TwilioIceServers().get(config) == []
+
+
+@pytest.mark.asyncio
+async def test_twilio_ice_servers_failure(monkeypatch):
+    def fetch(account_sid, auth_token, key_sid=None):
+        raise RuntimeError('Twilio is down')
+
+    monkeypatch.setattr(util, 'fetch_twilio_ice_servers', fetch)
+    assert await TwilioIceServers().get(TWILIO_CONFIG) == []
+
+
+def test_generate_turn_creds_reused():
+    username, password = generate_turn_creds('secret', '1234')
+    assert username.endswith(':1234')
+    assert generate_turn_creds('secret', '1234') == (username, password)
+
+
+@pytest.mark.asyncio
+async def test_debouncer():
+    calls = []
+
+    async def callback(key):
+        calls.append(key)
+
+    debouncer = Debouncer(callback, window=0.05, max_delay=0.2)
+    for _ in range(3):
+        await debouncer.call('a')
+    await debouncer.call('b')
+    assert calls == []
+
+    await asyncio.sleep(0.1)
+    assert sorted(calls) == ['a', 'b']
+    assert debouncer.saved == 2
+
+    # Continuous calls are delayed by no more than max_delay
+    calls.clear()
+    for _ in range(10):
+        await debouncer.call('a')
+        await asyncio.sleep(0.03)
+    assert calls
+
+    debouncer.window = 0
+    await debouncer.call('c')
+    assert calls[-1] == 'c'
+
+
+@pytest.mark.asyncio
+async def test_reap_clients(app):
+    async with app.app_context():
+        stale = datetime.datetime.utcnow() - datetime.timedelta(minutes=5)
+        room = Room()
+        room.set_name('Reaped room')
+        clients = [Client(uuid=str(i), room=room, seen=stale) for i in range(3)]
+        active = Client(uuid='active', room=room)
+        db.session.add_all([room, active] + clients)
+        db.session.commit()
+        room_id = room.id
+
+    message_handler = MessageHandler()
+    message_handler.start(workers=1)
+    queues = {uuid: message_handler.outbox.open(uuid)
+              for uuid in ['0', '1', '2', 'active']}
+
+    try:
+        async with app.app_context():
+            # Clients are not reaped before CLIENT_TIMEOUT
+            app.config['CLIENT_TIMEOUT'] = 600
+            await reap_clients(message_handler)
+            assert all(queue.empty() for queue in queues.values())
+
+            app.config['CLIENT_TIMEOUT'] = 90
+            await reap_clients(message_handler)
+    finally:
+        message_handler.stop()
+
+    # Each reaped client gets a bye before its queue is closed, and the room
+    # gets a single update
+    for uuid in ['0', '1', '2']:
+        assert uuid not in message_handler.outbox
+        assert json.loads(await queues[uuid].get())['type'] == 'bye'
+        with pytest.raises(OutboxClosed):
+            await queues[uuid].get()
+    info = json.loads(message_handler.outbox['active'].get_nowait())
+    assert info['type'] == 'room-info'
+    assert [c['id'] for c in info['data']['clients']] == ['active']
+    assert message_handler.outbox['active'].empty()
+    assert (await store.get_room(room_id=room_id)).client_count == 1
+
+
+@pytest.mark.asyncio
+async def test_reap_rooms(app):
+    async with app.app_context():
+        stale = datetime.datetime.utcnow() - datetime.timedelta(minutes=10)
+        rooms = [Room(active=stale), Room(active=stale), Room()]
+        for room, name in zip(rooms, ['Old room 1', 'Old room 2', 'New room']):
+            room.set_name(name)
+        db.session.add_all(rooms + [Client(uuid='1234', room=rooms[0])])
+        db.session.commit()
+        old_id, new_id = rooms[0].id, rooms[2].id
+
+    message_handler = MessageHandler()
+    message_handler.history.append(old_id, '{}')
+    message_handler.history.append(new_id, '{}')
+    await reap_rooms(message_handler)
+
+    assert await store.get_room(slug='old-room-1') is None
+    assert await store.get_room(slug='old-room-2') is None
+    assert await store.get_room(slug='new-room') is not None
+    assert await store.get_client('1234') is None
+    assert message_handler.history.get(old_id) == []
+    assert message_handler.history.get(new_id) == ['{}']